@@ -0,0 +1,130 @@
+# ASSETS.PY
+#
+# In-memory cache of the static frontend files as served under HA ingress, where every file has its absolute paths
+# rewritten to the ingress path of the session (see server.get_ingress_filters). A file is read and rewritten once
+# per (path, ingress path, modification time), compressed once into gzip and brotli variants, and from then on served
+# from memory with a strong ETag. Files are read and compressed in a worker thread, so building the variants of a
+# large bundle does not stall the control loop. The cache is a LRU bounded by the total size of its entries.
+#
+import asyncio
+import gzip
+import hashlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Optional
+
+from aiohttp import web
+
+try:  # brotli is optional: without it only gzip variants are built
+    import brotli
+except ImportError:
+    brotli = None
+
+
+ASSET_CACHE_MAX_BYTES = 32 * 1024 * 1024  # total size of the cached files, including their compressed variants
+ASSET_COMPRESS_MIN_BYTES = 1024  # smaller files are served uncompressed
+ASSET_GZIP_LEVEL = 9  # compressed once per file, so the highest levels are affordable
+ASSET_BROTLI_QUALITY = 11
+
+CONTENT_TYPE_MAP = {
+    '.html': 'text/html',
+    '.css': 'text/css',
+    '.js': 'text/javascript',
+    '.svg': 'image/svg+xml',
+    '.json': 'application/json',
+}
+COMPRESSIBLE_TYPES = set(CONTENT_TYPE_MAP.values())
+
+# the bundled assets have a content hash in their name, so they never change under the same URL
+IMMUTABLE_DIR = 'assets'
+CACHE_CONTROL_IMMUTABLE = 'public, max-age=31536000, immutable'
+CACHE_CONTROL_REVALIDATE = 'no-cache'  # eg. index.html: always revalidated, which is cheap with the ETag
+
+
+class Asset:
+    '''A rewritten static file, with its compressed variants (encoding -> body) and a strong ETag'''
+
+    def __init__(self, body: bytes, content_type: str, cache_control: str) -> None:
+        self.body = body
+        self.content_type = content_type
+        self.cache_control = cache_control
+        self.etag = f'"{hashlib.blake2b(body, digest_size=12).hexdigest()}"'
+
+        self.variants: dict[str, bytes] = {}
+        if content_type in COMPRESSIBLE_TYPES and len(body) >= ASSET_COMPRESS_MIN_BYTES:
+            if brotli is not None:
+                self.variants['br'] = brotli.compress(body, quality=ASSET_BROTLI_QUALITY)
+            self.variants['gzip'] = gzip.compress(body, compresslevel=ASSET_GZIP_LEVEL, mtime=0)
+            self.variants = {enc: b for enc, b in self.variants.items() if len(b) < len(body)}
+
+    @property
+    def size(self) -> int:
+        return len(self.body) + sum(len(b) for b in self.variants.values())
+
+    def response(self, request: web.Request) -> web.Response:
+        headers = {'ETag': self.etag, 'Cache-Control': self.cache_control}
+        if self.variants:
+            headers['Vary'] = 'Accept-Encoding'
+
+        if_none_match = request.headers.get('If-None-Match')
+        if if_none_match is not None and self._matches(if_none_match):
+            return web.Response(status=304, headers=headers)
+
+        accepted = {e.split(';')[0].strip() for e in request.headers.get('Accept-Encoding', '').split(',')}
+        for encoding, body in self.variants.items():  # in order of preference
+            if encoding in accepted:
+                headers['Content-Encoding'] = encoding
+                return web.Response(body=body, content_type=self.content_type, headers=headers)
+        return web.Response(body=self.body, content_type=self.content_type, headers=headers)
+
+    def _matches(self, if_none_match: str) -> bool:
+        '''Comparison of the ETag with the entity tags of an If-None-Match header. Weak tags match as well: the
+        compressed variants share the ETag of the file, which proxies may weaken when re-encoding'''
+        tags = [t.strip() for t in if_none_match.split(',')]
+        return '*' in tags or any(t.removeprefix('W/') == self.etag for t in tags)
+
+
+class AssetCache:
+    '''LRU cache of rewritten static files, keyed by (path, ingress path, modification time)'''
+
+    def __init__(self, static_dir: Path, max_bytes: int = ASSET_CACHE_MAX_BYTES) -> None:
+        self.static_dir = static_dir
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._assets: OrderedDict[tuple[Path, str, int], Asset] = OrderedDict()
+        self._building: dict[tuple[Path, str, int], asyncio.Task] = {}  # concurrent requests share a build
+
+    async def get(self, filepath: Path, ingress_path: str, rewrite: Callable[[bytes], bytes]) -> Optional[Asset]:
+        '''The asset of filepath rewritten with rewrite() for ingress_path, or None when the file does not exist'''
+        try:
+            mtime = filepath.stat().st_mtime_ns
+        except OSError:
+            return None
+
+        key = (filepath, ingress_path, mtime)
+        asset = self._assets.get(key)
+        if asset is not None:
+            self._assets.move_to_end(key)
+            return asset
+
+        task = self._building.get(key)
+        if task is None:
+            task = self._building[key] = asyncio.create_task(asyncio.to_thread(self._build, filepath, rewrite))
+            task.add_done_callback(lambda _: self._building.pop(key, None))
+        asset = await asyncio.shield(task)
+        if asset is not None and key not in self._assets and asset.size <= self.max_bytes:
+            self._assets[key] = asset
+            self.size += asset.size
+            while self.size > self.max_bytes:
+                _, evicted = self._assets.popitem(last=False)
+                self.size -= evicted.size
+        return asset
+
+    def _build(self, filepath: Path, rewrite: Callable[[bytes], bytes]) -> Optional[Asset]:
+        try:
+            body = rewrite(filepath.read_bytes())
+        except OSError:
+            return None
+        immutable = filepath.parent == self.static_dir / IMMUTABLE_DIR
+        return Asset(body, CONTENT_TYPE_MAP.get(filepath.suffix, 'application/octet-stream'),
+                     CACHE_CONTROL_IMMUTABLE if immutable else CACHE_CONTROL_REVALIDATE)
@@ -0,0 +1,403 @@
+# BACKTEST.PY
+#
+# Faster-than-real-time backtest of the dynamic schedule mode (mode 4). Replays a historical price series and
+# optional household load and solar profiles through the mode 4 planning (DynamicScheduler.create_schedule and
+# replan) and the shared control path (get_PBSapp, apply_soc_limits and the calc_PBSsent fuse limits) on virtual
+# time: every control loop tick is one schedule slot, and the batteries, solar inverters and energy meter are
+# modelled at slot granularity instead of being polled, so a year of 15-minute slots runs in minutes.
+#
+# Parameter sweeps run in parallel, one backtest per worker process.
+#
+# Run from the src directory:
+#   python -m backtest PRICES.json [--load LOAD.json] [--solar SOLAR.json] [--sweep efficiency=0.90,0.93 ...]
+#
+# Prices are read in the prices.json format of the PriceManager (or as a plain {timestamp: price} object); load and
+# solar profiles as {timestamp: W} objects, each value holding until the next timestamp.
+#
+import argparse
+import asyncio
+import bisect
+import copy
+import itertools
+import json
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, asdict
+from datetime import datetime as dt, timedelta
+from typing import Any, Optional
+from zoneinfo import ZoneInfo
+
+import numpy as np
+from prettytable import PrettyTable
+
+from config import DoeMaarWattConfig, DYN_CONFIG_DEFAULT
+from common import Logger, LogLevel, Phase, SPCStats, ControlStatus, SINGLE_PHASES, DMWException
+from mode_4 import Mode4Controller
+from subsystems.battery_inverters import BatteryInverterStats
+from subsystems.battery_inverters.base import BatteryStats, BatteryStatus
+from subsystems.solar_inverters import SolarInverterStats
+from subsystems.energy_meters import EnergyMeterStats
+
+
+GRID_VOLTAGE = 230.0  # modelled grid voltage (V) on every phase
+INITIAL_CHARGE_PCT = 50.0  # state of charge of every battery at the start of a backtest
+
+# Installation backtested when no config is given: one simulated 10 kWh battery inverter on L1 and a simulated
+# solar inverter on all phases (only generating when a solar profile is given), behind a 25 A main fuse
+DEFAULT_CONFIG = {
+    **copy.deepcopy(DYN_CONFIG_DEFAULT),
+    'battery_inverters': [{
+        'name': 'battery', 'type': 'sim_battery_inverter', 'enable': True, 'host': 'none', 'port': 502,
+        'battery_capacity': 10_000, 'battery_charge_limit': 5_000, 'battery_discharge_limit': 5_000,
+        'battery_charge_max_pct': 95, 'battery_charge_min_pct': 5, 'connected_phase': Phase.L1,
+    }],
+    'solar_inverters': [{
+        'name': 'solar', 'type': 'sim_solar_inverter', 'enable': True, 'host': 'none', 'port': 502,
+        'modbus_device_id': 3, 'connected_phase': Phase.ALL,
+    }],
+    'energy_meter': {'type': 'sim_energy_meter', 'host': 'none', 'port': 502, 'max_fuse_current': 25},
+}
+DEFAULT_CONFIG['mode_dynamic'] = {**DEFAULT_CONFIG['mode_dynamic'], 'resolution': 15}
+
+# Parameters that can be varied in a sweep, with the config section they are applied to
+SWEEP_PARAMETERS = {
+    'efficiency': float,
+    'resolution': int,
+    'update_interval': int,
+    'battery_charge_min_pct': int,
+    'battery_charge_max_pct': int,
+}
+
+
+@dataclass
+class Profile:
+    '''Step function of values over time: each value holds from its timestamp until the next one'''
+    epochs: np.ndarray
+    values: np.ndarray
+
+    @classmethod
+    def from_dict(cls, values: dict[str, float]) -> 'Profile':
+        items = sorted((dt.fromisoformat(k).timestamp(), float(v)) for k, v in values.items())
+        return cls(np.array([e for e, _ in items]), np.array([v for _, v in items]))
+
+    def mean(self, start: float, end: float) -> float:
+        '''Time-weighted mean over [start, end); 0 before the first timestamp'''
+        if len(self.epochs) == 0:
+            return 0.0
+        edges = np.concatenate(([start], self.epochs[(self.epochs > start) & (self.epochs < end)], [end]))
+        idx = np.searchsorted(self.epochs, edges[:-1], side='right') - 1
+        vals = np.where(idx >= 0, self.values[np.maximum(idx, 0)], 0.0)
+        return float(np.sum(vals * np.diff(edges)) / (end - start))
+
+
+@dataclass
+class BacktestResult:
+    params: dict[str, Any]
+    slots: int = 0
+    cost: float = 0.0  # EUR: net cost of the grid exchange with the batteries (negative = revenue)
+    baseline_cost: float = 0.0  # EUR: net cost of the same load and solar without batteries
+    import_kwh: float = 0.0
+    export_kwh: float = 0.0
+    battery_throughput_kwh: float = 0.0  # AC energy into and out of the batteries
+    planning: dict[str, int] = field(default_factory=dict)  # planning outcome ('solved', 'kept', ...) -> count
+    limited_slots: int = 0  # slots in which the SoC or fuse limits changed the scheduled battery power levels
+    failed_slots: int = 0  # slots without a safe power level (commanded to standby instead)
+    duration_s: float = 0.0
+
+    @property
+    def savings(self) -> float:
+        return self.baseline_cost - self.cost
+
+
+class Backtest:
+    '''
+    Replays prices, load and solar through a Mode4Controller. Every tick the controller plans (a full solve once per
+    update_interval or when the schedule runs out, an incremental replan otherwise), computes the safe power levels
+    for the modelled measurements and the modelled devices follow them for one slot.
+    '''
+
+    def __init__(self,
+        prices: dict[dt, float],
+        dyn_config: dict[str, Any],
+        load: Optional[Profile] = None,
+        solar: Optional[Profile] = None,
+        log: Optional[Logger] = None,
+    ) -> None:
+        self.log = log if log is not None else Logger(loglevel=LogLevel.OFF)
+        self.config = DoeMaarWattConfig(self.log, dyn_config=dyn_config)
+        self.tz = ZoneInfo(self.config.timezone)
+        self.prices = dict(sorted((t.astimezone(self.tz), p) for t, p in prices.items()))
+        self._times = list(self.prices)
+        self.load = load if load is not None else Profile(np.zeros(0), np.zeros(0))
+        self.solar = solar if solar is not None else Profile(np.zeros(0), np.zeros(0))
+
+        dyn_cfg = self.config.get_mode_dynamic_config()
+        self.resolution = timedelta(minutes=int(dyn_cfg['resolution']))
+        self.update_interval = timedelta(seconds=int(dyn_cfg['update_interval']))
+        self.price_update_time = tuple(map(int, dyn_cfg['price_update_time'].split(':')))
+        self.efficiency = float(dyn_cfg['efficiency'])
+
+        self.controller = Mode4Controller(self.config, self.log)
+        self.controller.setup()
+        self.controller.scheduler.solver = None  # solve in this process: parallelism comes from running backtests side by side
+        self.controller.solver = None
+
+        self.charge_wh = {inv.name: inv.capacity_wh * INITIAL_CHARGE_PCT / 100.0 for inv in self.controller.battery_inverters}
+        self.battery_power = {inv.name: 0.0 for inv in self.controller.battery_inverters}  # W, last slot
+        self.solar_power = {inv.name: 0.0 for inv in self.controller.solar_inverters}  # W, last slot
+        self._visible_until: Optional[dt] = None
+
+    async def run(self, start: Optional[dt] = None, end: Optional[dt] = None) -> BacktestResult:
+        '''Backtest the slots from start (default: the first price) until end (default: the end of the last price
+        interval)'''
+        start = self._align(self._localize(start) if start is not None else self._times[0])
+        end = self._localize(end) if end is not None else self._times[-1] + self.resolution
+        result = BacktestResult(params={})
+
+        t0 = time.perf_counter()
+        now = start
+        while now < end:
+            self._update_visible_prices(now)
+            outcome = await self._plan(now)
+            if not self.controller.scheduler.schedule_available_for(now):
+                break  # the planning window ends with the last price interval, which is not planned itself
+            result.planning[outcome] = result.planning.get(outcome, 0) + 1
+            self._simulate_slot(now, result)
+            now = dt.fromtimestamp(now.timestamp() + self.resolution.total_seconds(), self.tz)  # absolute time, across DST
+
+        result.duration_s = time.perf_counter() - t0
+        return result
+
+    def _localize(self, t: dt) -> dt:
+        '''Interpret a naive datetime in the configured timezone'''
+        return t.replace(tzinfo=self.tz) if t.tzinfo is None else t.astimezone(self.tz)
+
+    def _align(self, t: dt) -> dt:
+        step = int(self.resolution.total_seconds())
+        return dt.fromtimestamp(int(t.timestamp()) // step * step, self.tz)
+
+    def _update_visible_prices(self, now: dt) -> None:
+        '''Give the price manager the prices that would have been fetched by now: today's, and from
+        price_update_time on also tomorrow's'''
+        h, m = self.price_update_time
+        day_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        visible_until = day_start + timedelta(days=2 if (now.hour, now.minute) >= (h, m) else 1)
+        if visible_until == self._visible_until:
+            return
+
+        lo, hi = bisect.bisect_left(self._times, day_start), bisect.bisect_left(self._times, visible_until)
+        self.controller.pm.prices = {t: self.prices[t] for t in self._times[lo:hi]}
+        self._visible_until = visible_until
+
+    async def _plan(self, now: dt) -> str:
+        '''Plan like Mode4Controller.start_planning(), but in line: a full solve when no schedule covers now or it
+        is older than update_interval, an incremental replan otherwise'''
+        scheduler = self.controller.scheduler
+        price_range = self.controller.pm.get_price_range(now)
+        if not scheduler.schedule_available_for(now) or now - scheduler.schedule_ts > self.update_interval:
+            await scheduler.create_schedule(price_range[0][0], price_range[-1][0], dict(self.charge_wh))
+            outcome = 'solved'
+        else:
+            outcome = await scheduler.replan(price_range[0][0], price_range[-1][0], dict(self.charge_wh))
+        if outcome == 'solved':
+            scheduler.schedule_ts = now  # virtual time of the solve
+        return outcome
+
+    def _simulate_slot(self, now: dt, result: BacktestResult) -> None:
+        ctrl = self.controller
+        h = self.resolution / timedelta(hours=1)
+        slot_start = now.timestamp()
+        slot_end = slot_start + self.resolution.total_seconds()
+        load_w = self.load.mean(slot_start, slot_end)
+        solar_w = self.solar.mean(slot_start, slot_end)
+        unmanaged_solar_w = solar_w if not ctrl.solar_inverters else 0.0  # generation no solar inverter controls
+
+        # measurements at the start of the slot, with all devices still at their power level of the previous slot
+        self._set_stats(load_w - unmanaged_solar_w)
+
+        PBSapp_phases = ctrl.get_PBSapp(now)
+        ctrl.apply_soc_limits(PBSapp_phases)
+        try:
+            PBSnow_phases = {phi: ctrl._stats.get_PBSnow(phi) for phi in SINGLE_PHASES}
+            PBSsent_phases = ctrl.compute_PBSsent(PBSapp_phases, PBSnow_phases, ctrl.get_export_limit(now))
+        except DMWException:
+            result.failed_slots += 1
+            PBSsent_phases = {phi: PBSapp_phases[phi].copy() for phi in SINGLE_PHASES}
+            for ppm in PBSsent_phases.values():
+                ppm.inv_power = {inv: 0.0 for inv in ppm.inv_power}
+
+        commands, desired = {}, {}
+        for inv in ctrl.battery_inverters + ctrl.solar_inverters:
+            phases = PBSapp_phases.get_inverter_phases(inv.name)
+            commands[inv.name] = PBSsent_phases[phases[0]].inv_power[inv.name] * len(phases)
+            desired[inv.name] = PBSapp_phases[phases[0]].inv_power[inv.name] * len(phases)
+        if any(abs(commands[inv.name] - desired[inv.name]) > 0.5 for inv in ctrl.battery_inverters):
+            result.limited_slots += 1
+
+        # the devices follow their commands for the duration of the slot:
+        for inv in ctrl.battery_inverters:
+            power, charge = commands[inv.name], self.charge_wh[inv.name]
+            if power < 0:  # charging: only efficiency * AC energy is stored
+                power = max(power, -(inv.capacity_wh - charge) / (h * self.efficiency))
+                self.charge_wh[inv.name] = charge - power * h * self.efficiency
+            else:  # discharging: the battery delivers AC energy / efficiency
+                power = min(power, charge * self.efficiency / h)
+                self.charge_wh[inv.name] = charge - power * h / self.efficiency
+            self.battery_power[inv.name] = power
+            result.battery_throughput_kwh += abs(power) * h / 1000.0
+
+        for inv in ctrl.solar_inverters:
+            available = solar_w / len(ctrl.solar_inverters)
+            self.solar_power[inv.name] = max(0.0, min(available, commands[inv.name]))
+
+        price = ctrl.pm.get_price(now)
+        grid_kwh = (sum(self.battery_power.values()) + sum(self.solar_power.values()) + unmanaged_solar_w - load_w) * h / 1000.0
+        result.cost -= grid_kwh * price
+        result.baseline_cost -= (solar_w - load_w) * h / 1000.0 * price
+        result.import_kwh += max(0.0, -grid_kwh)
+        result.export_kwh += max(0.0, grid_kwh)
+        result.slots += 1
+
+    def _set_stats(self, load_w: float) -> None:
+        '''Model the measurements of all devices: inverters at their last power level, the energy meter seeing
+        their sum minus the load (evenly spread over the phases)'''
+        ctrl = self.controller
+        stats = ctrl._stats
+        grid = {phi: -load_w / len(SINGLE_PHASES) for phi in SINGLE_PHASES}
+
+        def ac_side(inv, power: float) -> dict[Phase, SPCStats]:
+            phases = SINGLE_PHASES if inv.connected_phase == Phase.ALL else [inv.connected_phase]
+            for phi in phases:
+                grid[phi] += power / len(phases)
+            return {phi: SPCStats(voltage=GRID_VOLTAGE, current=power / len(phases) / GRID_VOLTAGE, power=power / len(phases))
+                    for phi in phases}
+
+        stats.battery_inverters = {}
+        for inv in ctrl.battery_inverters:
+            power = self.battery_power[inv.name]
+            status = BatteryStatus.CHARGING if power < 0 else BatteryStatus.DISCHARGING if power > 0 else BatteryStatus.STANDBY
+            stats.battery_inverters[inv.name] = BatteryInverterStats(
+                control_status=ControlStatus.NOMINAL,
+                battery=BatteryStats(battery_status=status, battery_charge_pct=self.charge_wh[inv.name] / inv.capacity_wh * 100.0),
+                ac_side=ac_side(inv, power),
+            )
+
+        stats.solar_inverters = {
+            inv.name: SolarInverterStats(control_status=ControlStatus.NOMINAL, total_power_w=self.solar_power[inv.name],
+                                         ac_side=ac_side(inv, self.solar_power[inv.name]))
+            for inv in ctrl.solar_inverters
+        }
+
+        stats.energy_meter = EnergyMeterStats(
+            control_status=ControlStatus.NOMINAL,
+            max_fuse_a=self.config.get_energy_meter_config()['max_fuse_current'],
+            grid={phi: SPCStats(voltage=GRID_VOLTAGE, current=p / GRID_VOLTAGE, power=p) for phi, p in grid.items()},
+        )
+
+
+def apply_params(dyn_config: dict[str, Any], params: dict[str, Any]) -> dict[str, Any]:
+    '''Return a copy of dyn_config with the sweep parameters applied'''
+    cfg = copy.deepcopy(dyn_config)
+    for name, value in params.items():
+        if name not in SWEEP_PARAMETERS:
+            raise ValueError(f'unknown backtest parameter: {name} (expected one of {", ".join(SWEEP_PARAMETERS)})')
+        if name.startswith('battery_'):
+            for inv in cfg['battery_inverters']:
+                inv[name] = SWEEP_PARAMETERS[name](value)
+        else:
+            cfg['mode_dynamic'][name] = SWEEP_PARAMETERS[name](value)
+    return cfg
+
+
+def run_backtest(
+    prices: dict[dt, float],
+    dyn_config: dict[str, Any],
+    params: dict[str, Any],
+    load: Optional[Profile] = None,
+    solar: Optional[Profile] = None,
+    start: Optional[dt] = None,
+    end: Optional[dt] = None,
+) -> BacktestResult:
+    '''Run a single backtest with the given parameters applied to dyn_config'''
+    result = asyncio.run(Backtest(prices, apply_params(dyn_config, params), load, solar).run(start, end))
+    result.params = params
+    return result
+
+
+def sweep(
+    prices: dict[dt, float],
+    dyn_config: dict[str, Any],
+    grid: dict[str, list[Any]],
+    load: Optional[Profile] = None,
+    solar: Optional[Profile] = None,
+    start: Optional[dt] = None,
+    end: Optional[dt] = None,
+    workers: Optional[int] = None,
+) -> list[BacktestResult]:
+    '''Run a backtest for every combination of the parameter values in grid, in parallel worker processes'''
+    combinations = [dict(zip(grid, values)) for values in itertools.product(*grid.values())]
+    # spawn rather than fork, as for the schedule solver: the parent may run an event loop and background threads
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as pool:
+        futures = [pool.submit(run_backtest, prices, dyn_config, params, load, solar, start, end)
+                   for params in combinations]
+        return [f.result() for f in futures]
+
+
+def load_prices(path: str) -> dict[dt, float]:
+    with open(path) as f:
+        parsed = json.load(f)
+    return {dt.fromisoformat(k): float(v) for k, v in parsed.get('prices', parsed).items()}
+
+
+def load_profile(path: Optional[str]) -> Optional[Profile]:
+    if path is None:
+        return None
+    with open(path) as f:
+        return Profile.from_dict(json.load(f))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Backtest the dynamic schedule mode on historical prices')
+    parser.add_argument('prices', help='price history (prices.json format)')
+    parser.add_argument('--config', help='dyn_config.json to backtest (default: a single simulated 10 kWh battery)')
+    parser.add_argument('--load', help='household load profile ({timestamp: W})')
+    parser.add_argument('--solar', help='available solar generation profile ({timestamp: W})')
+    parser.add_argument('--from', dest='start', type=dt.fromisoformat, help='start of the backtest (ISO 8601)')
+    parser.add_argument('--to', dest='end', type=dt.fromisoformat, help='end of the backtest (ISO 8601)')
+    parser.add_argument('--sweep', action='append', default=[], metavar='NAME=V1,V2,...',
+                        help=f'parameter values to sweep, one of: {", ".join(SWEEP_PARAMETERS)}')
+    parser.add_argument('--workers', type=int, help='number of worker processes (default: number of CPUs)')
+    parser.add_argument('--json', action='store_true', help='print the results as JSON')
+    args = parser.parse_args()
+
+    dyn_config = DEFAULT_CONFIG
+    if args.config:
+        with open(args.config) as f:
+            dyn_config = json.load(f)
+    grid = {name: values.split(',') for name, values in (s.split('=', 1) for s in args.sweep)}
+
+    results = sweep(load_prices(args.prices), dyn_config, grid, load_profile(args.load), load_profile(args.solar),
+                    args.start, args.end, args.workers)
+
+    if args.json:
+        print(json.dumps([{**asdict(r), 'savings': r.savings} for r in results], indent=2))
+        return
+
+    table = PrettyTable()
+    table.field_names = ['parameters', 'slots', 'cost (EUR)', 'baseline (EUR)', 'savings (EUR)', 'import (kWh)',
+                         'export (kWh)', 'throughput (kWh)', 'planning', 'limited', 'failed', 'runtime (s)']
+    for r in results:
+        table.add_row([
+            ', '.join(f'{k}={v}' for k, v in r.params.items()) or '-', r.slots, f'{r.cost:.2f}',
+            f'{r.baseline_cost:.2f}', f'{r.savings:.2f}', f'{r.import_kwh:.0f}', f'{r.export_kwh:.0f}',
+            f'{r.battery_throughput_kwh:.0f}', ', '.join(f'{k}: {n}' for k, n in sorted(r.planning.items())),
+            r.limited_slots, r.failed_slots, f'{r.duration_s:.1f}',
+        ])
+    for f in table.field_names[1:]:
+        table.align[f] = 'r'
+    print(table)
+
+
+if __name__ == '__main__':
+    main()
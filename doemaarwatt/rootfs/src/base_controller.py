@@ -3,16 +3,20 @@ import asyncio
 import math
 import time
 from datetime import datetime as dt
-from typing import Optional
+from typing import Any, Optional
 from zoneinfo import ZoneInfo
 import os
 
-from aiohttp import web
 import aiohttp
 
 from config import DoeMaarWattConfig, ControlMode
-from common import Logger, Phase, ProgrammingError, PBSapp, PhasePowerMap, SINGLE_PHASES, BaseInverter, DMWException
+from common import Logger, Phase, ProgrammingError, PBSapp, PhasePowerMap, SINGLE_PHASES, BaseInverter, DMWException, \
+    ControlException, ControlStatus, ModbusConnectionPool, Clock, LogLevel
 from stats import ControllerStats
+from status import StatusSnapshot, encode_status
+from stream import StatusStream
+from telemetry import Telemetry
+from history import HistoryStore
 from subsystems.battery_inverters import BaseBatteryInverter, create_battery_inverter
 from subsystems.solar_inverters import BaseSolarInverter, create_solar_inverter
 from subsystems.energy_meters import BaseEnergyMeter, create_energy_meter, EnergyMeterStats
@@ -20,6 +24,9 @@ from subsystems.energy_meters import BaseEnergyMeter, create_energy_meter, Energ
 
 RECONNECT_DELAY = 10 # seconds before attempting a reconnect
 LOOP_DELAY = 10 # control loop delay
+STATS_READ_TIMEOUT = 4.0 # seconds a single device may take to deliver its stats before it is marked degraded
+DISPATCH_TIMEOUT = 4.0 # seconds a single inverter may take to acknowledge a commanded power level
+PROTECTION_INTERVAL = 1.0 # seconds between grid (fuse) checks in between control loop iterations
 
 # State-of-charge limit handling (issue #7): at a limit the battery trickles a small fixed power to stay
 # awake (instead of idling), and oscillates within a small band on the safe side of the limit so it can hold
@@ -32,13 +39,20 @@ class BaseController(ABC):
     def __init__(self,
         cfg: DoeMaarWattConfig,
         log: Logger,
+        clock: Optional[Clock] = None,
     ) -> None:
         self.config = cfg
         self.log = log
+        self.clock = clock if clock is not None else Clock()  # wall clock, or a VirtualClock for simulations
 
         self.running = False
         self._stats = ControllerStats(cfg)
         self._inv_control = {}
+        self._commanded: dict[str, float] = {}  # inverter name -> last acknowledged power level (W, total)
+        self._unacknowledged: dict[str, int] = {}  # inverter name -> number of its last commands it did not acknowledge
+        self._status: Optional[StatusSnapshot] = None  # encoded /api/ status, None when changed since
+        self._deadline: Optional[float] = None  # clock.monotonic() deadline at which the current control loop tick was due
+        self._tick_start: Optional[float] = None  # clock.monotonic() at which the current control loop tick started
 
         # per-inverter state for the SoC limit oscillation (issue #7):
         self._soc_hold: dict[str, Optional[str]] = {}   # inverter name -> None | 'max' | 'min'
@@ -61,14 +75,60 @@ class BaseController(ABC):
 
     def stop(self) -> None:
         self.running = False
+        self._commanded = {}
+        self._unacknowledged = {}
+        self._deadline = None
+        self._tick_start = None
         self._stats.reset()
+        self._status = None
 
     async def reconnect_delay(self):
         if self.running:
-            await asyncio.sleep(RECONNECT_DELAY)
+            await self.clock.sleep(RECONNECT_DELAY)
 
     async def loop_delay(self):
-        await asyncio.sleep(self.config.get_general_config().get('loop_delay', LOOP_DELAY))
+        '''Wait until the next control loop tick is due. Ticks fire on absolute deadlines, loop_delay seconds
+        apart, so the period does not stretch with the time spent on I/O or solving. A tick that overruns one or
+        more deadlines skips them: the next tick fires on the first deadline still ahead, and the skipped ones are
+        counted. While inverters are being commanded, the wait is spent guarding the main fuse (see protect()).
+        '''
+        self.publish_status()
+
+        period = self.config.get_general_config().get('loop_delay', LOOP_DELAY)
+        now = self.clock.monotonic()
+        if self._deadline is None:  # first tick since (re)connecting: start the schedule here
+            self._deadline = now
+        if self._tick_start is not None:
+            self._stats.tick_duration.observe(now - self._tick_start)
+
+        deadline = self._deadline + period
+        if deadline <= now:
+            skipped = math.floor((now - deadline) / period) + 1
+            deadline += skipped * period
+            self._stats.ticks_skipped += skipped
+            self.log.note(f'control loop tick overran {skipped} deadline(s) of the {period} s period')
+
+        if self._commanded and self.energy_meter is not None:
+            await self.protect(deadline)
+        else:
+            await self.clock.sleep(deadline - self.clock.monotonic())
+
+        self._deadline = deadline
+        self._tick_start = self.clock.monotonic()
+        self._stats.ticks += 1
+        self._stats.tick_lateness.observe(max(0.0, self._tick_start - deadline))
+
+    async def protect(self, deadline: float) -> None:
+        '''Fuse-protection loop: until the (clock.monotonic()) deadline, poll only the energy meter every
+        PROTECTION_INTERVAL and clamp the inverters that push a phase beyond its grid limit.
+        '''
+        next_tick = self.clock.monotonic() + PROTECTION_INTERVAL
+        while self.running and next_tick < deadline:
+            await self.clock.sleep(next_tick - self.clock.monotonic())
+            await self.protection_tick()
+            next_tick = max(next_tick + PROTECTION_INTERVAL, self.clock.monotonic())
+
+        await self.clock.sleep(deadline - self.clock.monotonic())
 
     def setup(self) -> None:
         bat_inv_cfg = self.config.get_battery_inverters_config()
@@ -76,13 +136,13 @@ class BaseController(ABC):
         em_cfg = self.config.get_energy_meter_config()
 
         self.battery_inverters = [
-            create_battery_inverter(cfg, self.log)
+            create_battery_inverter(cfg, self.log, self.clock)
             for cfg in bat_inv_cfg
             if len(cfg) > 0 and cfg.get('enable', True)
         ]
 
         self.solar_inverters = [
-            create_solar_inverter(cfg, self.log)
+            create_solar_inverter(cfg, self.log, self.clock)
             for cfg in sol_inv_cfg
             if len(cfg) > 0 and cfg.get('enable', True)
         ]
@@ -100,17 +160,54 @@ class BaseController(ABC):
             for phase in SINGLE_PHASES
         }
 
-        self.energy_meter = create_energy_meter(em_cfg, self.log) if len(em_cfg) > 0 else None
+        self.energy_meter = create_energy_meter(em_cfg, self.log, self.clock) if len(em_cfg) > 0 else None
 
         self.tz = ZoneInfo(self.config.timezone)
 
     async def connect_subsystems(self):
-        await asyncio.gather(*[inv.connect() for inv in self.battery_inverters + self.solar_inverters])
-
-        if self.energy_meter:
-            await self.energy_meter.connect()
-
-        self.log.info(f'(re)connected to all subsystems')
+        '''Connect to all subsystems. A device that cannot be reached does not hold up the others: it is
+        reconnected when it is next used, and is degraded in the stats until then.
+        '''
+        devices: list[BaseInverter | BaseEnergyMeter] = [*self.battery_inverters, *self.solar_inverters]
+        if self.energy_meter is not None:
+            devices.append(self.energy_meter)
+
+        results = await asyncio.gather(*[device.connect() for device in devices], return_exceptions=True)
+        failed = []
+        for device, result in zip(devices, results):
+            if isinstance(result, BaseException):
+                self._device_failed(device, 'connecting', result)
+                failed.append(device.name)
+        if failed:
+            self.log.info(f'(re)connected to all subsystems but {", ".join(failed)}')
+        else:
+            self.log.info(f'(re)connected to all subsystems')
+
+    def _device_failed(self, device: BaseInverter | BaseEnergyMeter, action: str, error: BaseException) -> None:
+        '''Handle a failure of a single device: only its own connection is dropped (and reconnected on its next use),
+        so the other devices stay under control. Cancellation, errors that require the fallback mode and programming
+        errors are raised instead.
+        '''
+        if not isinstance(error, (DMWException, TimeoutError)) or (isinstance(error, DMWException) and error.requires_fallback):
+            raise error
+        self.log.error(f'{device.name}: {action} failed, reconnecting: {str(error) or type(error).__name__}')
+        device.reconnect()
+
+    async def enable_control(self) -> None:
+        '''Put all inverters under control. An inverter that fails to is reconnected and tried again next tick'''
+        for inverters in (self.battery_inverters, self.solar_inverters):
+            results = await asyncio.gather(*[inv.enable_control() for inv in inverters], return_exceptions=True)
+            for inv, result in zip(inverters, results):
+                if isinstance(result, BaseException):
+                    self._device_failed(inv, 'enabling control', result)
+
+    async def _try_relinquish_control(self):
+        '''Relinquish control of all inverters, logging (rather than raising) the failures'''
+        for inverters in (self.battery_inverters, self.solar_inverters):
+            results = await asyncio.gather(*[inv.relinquish_control() for inv in inverters], return_exceptions=True)
+            for inv, result in zip(inverters, results):
+                if isinstance(result, Exception):
+                    self.log.error(f'error relinquishing control of {inv.name}: {result}')
 
     def close_subsystems(self):
         for inv in self.battery_inverters:
@@ -119,17 +216,24 @@ class BaseController(ABC):
             inv.close()
         if self.energy_meter:
             self.energy_meter.close()
+        self._commanded = {}
+        self._unacknowledged = {}
+        self._deadline = None
+        self._tick_start = None
         self.log.info('disconnected from all subsystems')
 
     async def run(self) -> None:
         '''Run this controller. This entails calling its setup() method and then awaiting its loop() method
         '''
         self.running = True
-        self._stats.start_ts = time.time()
+        self._stats.start_ts = self.clock.time()
 
         self.setup()
 
-        await self.loop()  # must be implemented by the concrete subclass
+        try:
+            await self.loop()  # must be implemented by the concrete subclass
+        finally:  # pooled Modbus connections survive reconnects within this controller, but not the controller itself
+            ModbusConnectionPool(self.log).close()
 
     @abstractmethod
     def get_PBSapp(self, now: dt) -> PBSapp:
@@ -149,17 +253,46 @@ class BaseController(ABC):
         raise NotImplementedError
 
     async def get_stats(self):
-        if self.battery_inverters:
-            bat_inv_stats = await asyncio.gather(*[inv.read_stats() for inv in self.battery_inverters])
-            self._stats.battery_inverters = { inv.name: inv_stats for inv, inv_stats in zip(self.battery_inverters, bat_inv_stats) }
+        '''Read the stats of all subsystems in one concurrent fan-out. Each device read is bounded by
+        STATS_READ_TIMEOUT: a device that fails or does not respond in time is recorded with DEGRADED stats
+        instead of holding up the control loop.
+        '''
+        devices: list[BaseInverter | BaseEnergyMeter] = [*self.battery_inverters, *self.solar_inverters]
+        if self.energy_meter is not None:
+            devices.append(self.energy_meter)
 
-        if self.solar_inverters:
-            sol_inv_stats = await asyncio.gather(*[inv.read_stats() for inv in self.solar_inverters])
-            self._stats.solar_inverters = { inv.name: inv_stats for inv, inv_stats in zip(self.solar_inverters, sol_inv_stats) }
+        start = time.perf_counter()
+        results = await asyncio.gather(*[self._read_device_stats(device) for device in devices])
+        self._stats.stats_ts = time.perf_counter()
+        self._stats.read_duration_s = self._stats.stats_ts - start
 
+        n_bat, n_sol = len(self.battery_inverters), len(self.solar_inverters)
+        self._stats.battery_inverters = { inv.name: s for inv, s in zip(self.battery_inverters, results[:n_bat]) }
+        self._stats.solar_inverters = { inv.name: s for inv, s in zip(self.solar_inverters, results[n_bat:n_bat + n_sol]) }
         if self.energy_meter is not None:
-            em_stats = await self.energy_meter.read_stats()
-            self._stats.energy_meter = em_stats
+            self._stats.energy_meter = results[-1]  # type: ignore
+        Telemetry().record(self._stats, self.clock.time())
+
+        if self.log.enabled(LogLevel.DEBUG):
+            durations = ', '.join(f'{name}: {d * 1e3:.0f} ms' for name, d in self._stats.device_read_durations_s.items())
+            self.log.debug(f'collected stats in {self._stats.read_duration_s * 1e3:.0f} ms ({durations})')
+
+    async def _read_device_stats(self, device: BaseInverter | BaseEnergyMeter):
+        start = time.perf_counter()
+        try:
+            return await asyncio.wait_for(device.read_stats(), timeout=STATS_READ_TIMEOUT)  # type: ignore
+        except TimeoutError:
+            self.log.error(f'{device.name}: no stats within {STATS_READ_TIMEOUT} s, marking as degraded')
+            device.reconnect()  # a late response must not be taken for the answer to the next request
+        except DMWException as e:
+            if e.requires_fallback:
+                raise
+            self.log.error(f'{device.name}: unable to read stats, marking as degraded: {e}')
+            device.reconnect()
+        finally:
+            self._stats.device_read_durations_s[device.name] = time.perf_counter() - start
+
+        return device.degraded_stats()  # type: ignore
 
     def apply_soc_limits(self, PBSapp_phases: PBSapp) -> None:
         '''Keep each battery inverter within its configured state-of-charge limits (issue #7). Runs for every
@@ -248,6 +381,56 @@ class BaseController(ABC):
         self.apply_soc_limits(PBSapp_phases)  # issue #7: never charge above max / discharge below min SoC
         export_limit = self.get_export_limit(now)  # per-phase export ceiling (None = main-fuse limit)
 
+        PBSnow_phases = {phi: self._stats.get_PBSnow(phi) for phi in SINGLE_PHASES}
+        self.hold_unacknowledged(PBSapp_phases, PBSnow_phases)
+        PBSsent_phases = self.compute_PBSsent(PBSapp_phases, PBSnow_phases, export_limit)
+
+        # final iteration: command each inverter exactly once. PBSsent values are per-phase, but set_power
+        # expects the total across all connected phases, so scale by the number of phases the inverter spans
+        # (1 for single-phase battery/solar inverters, 3 for an inverter connected to ALL phases).
+        self.log.info(f'sending charge/discharge amount (PBSsent) to enabled inverters:')
+        commands: dict[str, float] = {}
+        for phi, ppm in PBSsent_phases.items():
+            for inv_name, PBSsent in ppm.inv_power.items():
+                if inv_name in commands:
+                    continue
+
+                n_phases = len(PBSapp_phases.get_inverter_phases(inv_name))
+                PBSsent_total = PBSsent * n_phases
+                commands[inv_name] = PBSsent_total
+
+                if PBSsent_total == 0:
+                    self.log.info(f'{phi}: commanding {inv_name} to standby at {PBSsent_total:.0f} W')
+                elif PBSsent_total < 0:
+                    self.log.info(f'{phi}: commanding {inv_name} to charge at {PBSsent_total:.0f} W')
+                else:
+                    self.log.info(f'{phi}: commanding {inv_name} to discharge/generate at {PBSsent_total:.0f} W')
+
+        await self.dispatch_PBSsent(commands, PBSapp_phases)
+
+    def hold_unacknowledged(self, PBSapp_phases: PBSapp, PBSnow_phases: dict[Phase, PhasePowerMap]) -> None:
+        '''Hold the inverters that did not acknowledge their last command at their measured power level (0 W when
+        unknown). They are sent that level as a retry, while the safe levels of the other inverters are computed as if
+        they keep it: the others are then controlled safely whether or not the retry is acknowledged.
+        '''
+        for inv_name, failed in self._unacknowledged.items():
+            phases = PBSapp_phases.get_inverter_phases(inv_name)
+            for phi in phases:
+                PBSapp_phases[phi].inv_power[inv_name] = PBSnow_phases[phi].inv_power.get(inv_name, 0.0)
+            if phases:
+                self.log.note(f'{inv_name}: {failed} command(s) not acknowledged, holding it at '
+                              f'{PBSapp_phases[phases[0]].inv_power[inv_name] * len(phases):.0f} W')
+
+    def compute_PBSsent(self,
+        PBSapp_phases: PBSapp,
+        PBSnow_phases: dict[Phase, PhasePowerMap],
+        export_limit: Optional[float],
+    ) -> dict[Phase, PhasePowerMap]:
+        '''Compute the safe power level (PBSsent) of each inverter on each phase from the desired levels, the
+        current inverter power levels and the latest energy meter measurements.
+        '''
+        assert isinstance(self._stats.energy_meter, EnergyMeterStats)
+
         # first iteration: compute a safe power level for each inverter across each of the three phases
         PBSsent_phases: dict[Phase, PhasePowerMap] = {}
         for phi in SINGLE_PHASES:
@@ -256,12 +439,14 @@ class BaseController(ABC):
             PGnow = self._stats.energy_meter.grid[phi].power # type: ignore | negative value: drawing power from the grid
             VGnow = self._stats.energy_meter.grid[phi].voltage # type: ignore
             Imax =  self._stats.energy_meter.max_fuse_a # type: ignore | eg. 25A main fuse
+            if (PGnow is None or VGnow is None) and self._stats.energy_meter.control_status == ControlStatus.DEGRADED:
+                raise ControlException(f'missing grid measurements for {phi}, energy meter is degraded',
+                                       source='calc_PBSsent')
             if PGnow is None or VGnow is None or Imax is None:
                 raise ProgrammingError(f'missing grid measurements for {phi}. PGnow: {PGnow}, VGnow: {VGnow}, Imax: {Imax}',
                                        source='calc_PBSsent')
 
-            PBSnow = self._stats.get_PBSnow(phi)
-            PBSsent_phases[phi] = self.calc_PBSsent(phi, PBSapp, PBSnow, PGnow, VGnow, Imax, export_limit)
+            PBSsent_phases[phi] = self.calc_PBSsent(phi, PBSapp, PBSnow_phases[phi], PGnow, VGnow, Imax, export_limit)
 
         # second iteration: ensure inverters that are connected to multiple phases, command the same, safest power level
         for inv_name in PBSapp_phases.get_multiphase_inverters():
@@ -279,27 +464,143 @@ class BaseController(ABC):
             for phi in phases:
                 PBSsent_phases[phi].inv_power[inv_name] = safe_power
 
-        # final iteration: command each inverter exactly once. PBSsent values are per-phase, but set_power
-        # expects the total across all connected phases, so scale by the number of phases the inverter spans
-        # (1 for single-phase battery/solar inverters, 3 for an inverter connected to ALL phases).
-        self.log.info(f'sending charge/discharge amount (PBSsent) to enabled inverters:')
-        commanded: set[str] = set()
-        for phi, ppm in PBSsent_phases.items():
-            for inv_name, PBSsent in ppm.inv_power.items():
-                if inv_name in commanded:
-                    continue
-                commanded.add(inv_name)
+        return PBSsent_phases
 
-                n_phases = len(PBSapp_phases.get_inverter_phases(inv_name))
-                PBSsent_total = PBSsent * n_phases
 
-                if PBSsent_total == 0:
-                    self.log.info(f'{phi}: commanding {inv_name} to standby at {PBSsent_total:.0f} W')
-                elif PBSsent_total < 0:
-                    self.log.info(f'{phi}: commanding {inv_name} to charge at {PBSsent_total:.0f} W')
+    async def protection_tick(self) -> None:
+        '''Read the energy meter and, if a phase exceeds its main-fuse limit, recompute the safe power levels of the
+        currently commanded inverters against the fresh measurements and send only the ones that change. The
+        inverters are assumed to follow their last acknowledged command; everything else (schedules, SoC limits,
+        inverter stats, the economic export limit and what cannot be resolved by clamping) is left to the regular
+        control loop.
+        '''
+        assert self.energy_meter is not None
+        self._stats.energy_meter = await self._read_device_stats(self.energy_meter)  # type: ignore
+        self._stats.protection_ticks += 1
+
+        grid = self._stats.energy_meter.grid
+        Imax = self._stats.energy_meter.max_fuse_a
+        if Imax is None or any(grid[phi].power is None or grid[phi].voltage is None for phi in SINGLE_PHASES):
+            self.log.error('fuse protection: missing grid measurements, keeping current power levels')
+            return
+
+        exceeded = []
+        for phi in SINGLE_PHASES:
+            PGnow, PGmax = grid[phi].power, abs(grid[phi].voltage * Imax)  # type: ignore
+            if abs(PGnow) > PGmax:  # type: ignore
+                exceeded.append(f'{phi.value}: {PGnow:.0f} W')
+        if not exceeded:
+            return
+
+        self.log.error(f'fuse protection: grid limit exceeded ({", ".join(exceeded)}), clamping inverters')
+        commanded = PBSapp(list(self.inverters.values()))
+        for inv_name, power in self._commanded.items():
+            inv = self.inverters[inv_name]
+            n_phases = len(SINGLE_PHASES) if inv.connected_phase == Phase.ALL else 1
+            commanded.set(inv.connected_phase, inv_name, power / n_phases)
+
+        PBSnow_phases = {phi: commanded[phi].copy() for phi in SINGLE_PHASES}
+        try:
+            PBSsent_phases = self.compute_PBSsent(commanded, PBSnow_phases, self.get_export_limit(self.clock.now(self.tz)))
+        except DMWException as e:  # eg. insufficient control authority: not solved by clamping, left to the next tick
+            if isinstance(e, ProgrammingError):
+                raise
+            self.log.error(f'fuse protection: unable to clamp inverters, leaving it to the next control loop tick: {e}')
+            return
+
+        clamps: dict[str, float] = {}
+        for inv_name, power in self._commanded.items():
+            phases = commanded.get_inverter_phases(inv_name)
+            clamped = PBSsent_phases[phases[0]].inv_power[inv_name] * len(phases)
+            if not math.isclose(clamped, power, abs_tol=0.5):
+                clamps[inv_name] = clamped
+                self.log.info(f'fuse protection: clamping {inv_name} from {power:.0f} W to {clamped:.0f} W')
+
+        if clamps:
+            self._stats.protection_clamps += 1
+            await self.dispatch_PBSsent(clamps, commanded)
+
+    async def dispatch_PBSsent(self, commands: dict[str, float], PBSapp_phases: PBSapp) -> None:
+        '''Send the commanded power level (W, total across connected phases) to each inverter. Commands are sent
+        concurrently, in two waves: first the commands that relieve the grid connection (less import on an importing
+        phase, less export on an exporting phase), and only once all of those are acknowledged the commands that add
+        to the load on it. Each command must be acknowledged within DISPATCH_TIMEOUT.
+
+        When a relieving command fails, the load-adding wave is not sent at all: those inverters keep their previous
+        power level, which loads the grid connection no more than it is loaded now. An inverter that failed is marked
+        unacknowledged and reconnected, and held at its measured power level from the next tick on until it
+        acknowledges a command again (see hold_unacknowledged()). The failures of inverters that are already held do not
+        stop the load-adding wave: the other inverters were commanded as if the held ones keep their power level.
+        '''
+        relieving, adding = [], []
+        for inv_name, power in commands.items():
+            (relieving if self._relieves_grid(inv_name, power, PBSapp_phases) else adding).append(inv_name)
+
+        self._stats.dispatch = {}
+        held = set(self._unacknowledged)
+        failures: dict[str, BaseException] = {}
+        for wave, names in (('relieving', relieving), ('adding', adding)):
+            if not names:
+                continue
+            if failures.keys() - held:
+                for inv_name in names:
+                    self._stats.dispatch[inv_name] = {'power': commands[inv_name], 'wave': wave, 'ack': False, 'error': 'not sent'}
+                self.log.error(f'not sending load-adding commands to {", ".join(names)} after failed relieving commands')
+                break
+
+            start = time.perf_counter()
+            results = await asyncio.gather(*[
+                asyncio.wait_for(self.inverters[inv_name].set_power(commands[inv_name]), timeout=DISPATCH_TIMEOUT)
+                for inv_name in names
+            ], return_exceptions=True)
+            if self.log.enabled(LogLevel.DEBUG):
+                self.log.debug(f'dispatched {wave} wave ({", ".join(names)}) in {(time.perf_counter() - start) * 1e3:.0f} ms')
+
+            for inv_name, result in zip(names, results):
+                ack = not isinstance(result, BaseException)
+                self._stats.dispatch[inv_name] = {
+                    'power': commands[inv_name], 'wave': wave, 'ack': ack,
+                    'error': None if ack else (str(result) or type(result).__name__),
+                }
+                if ack:
+                    self._commanded[inv_name] = commands[inv_name]
+                    self._unacknowledged.pop(inv_name, None)
                 else:
-                    self.log.info(f'{phi}: commanding {inv_name} to discharge/generate at {PBSsent_total:.0f} W')
-                await self.inverters[inv_name].set_power(PBSsent_total)
+                    failures[inv_name] = result  # type: ignore
+                    self._unacknowledged[inv_name] = self._unacknowledged.get(inv_name, 0) + 1
+
+        HistoryStore(self.log).record_setpoints(self._stats.dispatch, self.clock.time())
+        if self._stats.stats_ts is not None:
+            self._stats.actuation_delay_s = time.perf_counter() - self._stats.stats_ts
+            if self.log.enabled(LogLevel.DEBUG):
+                self.log.debug(f'last actuation {self._stats.actuation_delay_s * 1e3:.0f} ms after reading stats')
+
+        for inv_name, result in failures.items():
+            self._device_failed(self.inverters[inv_name], 'commanding power', result)
+
+    def _relieves_grid(self, inv_name: str, power: float, PBSapp_phases: PBSapp) -> bool:
+        '''Return True if commanding power (W, total) to the inverter does not increase the magnitude of the power
+        flowing through the grid connection on any of its phases. Unknown measurements count as increasing it.
+        '''
+        inv_stats = self._stats.battery_inverters.get(inv_name) or self._stats.solar_inverters.get(inv_name)
+        if inv_stats is None or self._stats.energy_meter is None:
+            return False
+
+        phases = PBSapp_phases.get_inverter_phases(inv_name)
+        powers_now = [inv_stats.ac_side[phi].power if phi in inv_stats.ac_side else None for phi in phases]
+        if not phases or None in powers_now:
+            return False
+
+        delta = (power - sum(powers_now)) / len(phases)  # type: ignore | change per connected phase
+        for phi in phases:
+            PGnow = self._stats.energy_meter.grid[phi].power
+            if PGnow is None:
+                return False
+            # importing (PGnow < 0): more generation relieves the connection; exporting: less generation does
+            if (PGnow < 0 and delta < 0) or (PGnow > 0 and delta > 0) or (PGnow == 0 and delta != 0):
+                return False
+
+        return True
 
     def calc_PBSsent(self,
         phase: Phase,
@@ -415,8 +716,9 @@ class BaseController(ABC):
 
         raise ProgrammingError(f'should not reach here', source='calc_PBSsent')
 
-    def handle_status(self, request):
-        return web.json_response({
+    def status(self) -> dict[str, Any]:
+        '''The /api/ status of this controller. Values may be pre-encoded JSON (bytes), see encode_status()'''
+        return {
             'status': 'ok',
             'running': self.running,
             'mode': self.mode.value,
@@ -425,7 +727,21 @@ class BaseController(ABC):
             'prices': None,
             'schedule': None,
             'schedule_ts': None,
-        })
+        }
+
+    def publish_status(self) -> None:
+        '''Mark the status as changed: the next poll encodes it into a new snapshot, which is then served until the
+        next change. Called once per control loop tick, and by modes whenever other parts of their status change.
+        Encoding on the first poll rather than here costs nothing while nobody is polling. The changes are pushed
+        to the clients of the live stream, if any (see stream.py).'''
+        self._status = None
+        StatusStream().publish(self.status)
+
+    def handle_status(self, request):
+        snapshot = self._status
+        if snapshot is None:
+            snapshot = self._status = StatusSnapshot(encode_status(self.status()))
+        return snapshot.response(request)
 
     async def send_ha_notification(self, title: str, message: str):
         # prime method: use the SUPERVISOR_TOKEN (only available in production setup)
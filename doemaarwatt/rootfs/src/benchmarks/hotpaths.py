@@ -0,0 +1,261 @@
+# HOTPATHS.PY
+#
+# Benchmark suite for the hot paths of the controllers: the PBSapp -> PBSsent computation (calc_PBSsent of both
+# BaseController and pbsent.py, apply_soc_limits, PBSapp construction and copy), Modbus response decoding, the price
+# lookups, the dynamic schedule solve for a range of inverter counts (M) and schedule lengths (N), and the
+# serialization of the /api/ status.
+#
+# Every benchmark runs on fixed fixtures (simulated subsystems, seeded measurement noise, generated prices and a
+# fixed virtual time), so results are comparable between runs and releases. Results can be written to a JSON file
+# and compared against an earlier one:
+#
+# Run from the src directory:
+#   python -m benchmarks.hotpaths [--only price] [--output results.json] [--compare baseline.json] [--fail-above 20]
+#
+import argparse
+import asyncio
+import copy
+import json
+import platform
+import random
+import statistics
+import sys
+import timeit
+from datetime import datetime as dt, timedelta
+from typing import Any, Callable, Optional
+from zoneinfo import ZoneInfo
+
+from prettytable import PrettyTable
+
+from backtest import DEFAULT_CONFIG
+from common import Logger, LogLevel, Phase, PhasePowerMap, PBSapp, ModbusManager, VirtualClock
+from config import DoeMaarWattConfig
+from dyn_schedule import DynamicScheduler
+from mode_1 import Mode1Controller
+from pbsent import calc_PBSsent
+from price import PriceManager, TIME_FMT
+from simulate import SimulatedMode4Controller, synthetic_prices
+
+
+START = dt(2026, 6, 21, 0, 0, tzinfo=ZoneInfo('Europe/Amsterdam'))  # fixed virtual time of all fixtures
+PRICE_DAYS = 5
+SEED = 42
+REPEATS = 5  # timing repeats of a benchmark; the fastest is reported
+INVERTER_COUNTS = (1, 2, 4, 8)  # battery inverters (M) for the fixtures and schedule solves
+SLOT_COUNTS = (96, 192, 384)  # 1, 2 and 4 days of 15-minute slots (N) for the schedule solves
+SCHEDULE_REPEATS = 3  # schedule solves are slow, so they are timed fewer times
+FIXTURE_INVERTERS = 4  # battery inverters of the installation used by the other benchmarks
+DECODE_CASES = (  # (dtype, SMA format, words) read from real SMA devices
+    ('U32', 'FIX0', [0, 4250]),
+    ('S32', 'FIX0', [0xFFFF, 0xF060]),
+    ('U32', 'FIX2', [0, 23012]),
+    ('U32', {303: 'Off', 308: 'On'}, [0, 308]),
+    ('U64', 'FIX0', [0, 0, 0x0001, 0x86A0]),
+)
+
+
+def make_config(M: int) -> dict[str, Any]:
+    '''Installation of M simulated 10 kWh battery inverters spread over the phases, a simulated three-phase solar
+    inverter and a simulated energy meter behind a 25 A main fuse'''
+    cfg = copy.deepcopy(DEFAULT_CONFIG)
+    template = cfg['battery_inverters'][0]
+    cfg['battery_inverters'] = [
+        {**template, 'name': f'battery{i + 1}', 'connected_phase': (Phase.L1, Phase.L2, Phase.L3)[i % 3]}
+        for i in range(M)
+    ]
+    return cfg
+
+
+class Fixtures:
+    '''The installation, controller state and prices shared by the benchmarks'''
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, M: int = FIXTURE_INVERTERS) -> None:
+        random.seed(SEED)
+        self.loop = loop
+        self.log = Logger(loglevel=LogLevel.OFF)
+        self.clock = VirtualClock(START)
+        self.cfg = DoeMaarWattConfig(self.log, dyn_config=make_config(M))
+        resolution = int(self.cfg.get_mode_dynamic_config()['resolution'])
+        self.prices = synthetic_prices(START, PRICE_DAYS, resolution)
+
+        self.controller = Mode1Controller(self.cfg, self.log, self.clock)
+        self.controller.setup()
+        loop.run_until_complete(self.controller.get_stats())
+        for s in self.controller._stats.battery_inverters.values():  # all batteries full: exercises the SoC hold
+            s.battery.battery_charge_pct = 96.0
+
+        # desired power: every battery charging at its limit and the solar inverter generating
+        self.PBSapp = PBSapp(list(self.controller.inverters.values()))
+        for inv in self.controller.battery_inverters:
+            self.PBSapp.set(inv.connected_phase, inv.name, -5000.0)
+        for inv in self.controller.solar_inverters:
+            self.PBSapp.set(inv.connected_phase, inv.name, 3000.0)
+        self.PBSnow = {phi: PhasePowerMap(phi, {n: 0.0 for n in self.PBSapp[phi].inv_power})
+                       for phi in (Phase.L1, Phase.L2, Phase.L3)}
+
+        self.pm = PriceManager(self.cfg, self.log, self.clock)
+        self.pm.prices = self.prices
+        self.prices_json = self.pm.to_json()
+
+        self.modbus = ModbusManager([], self.log)
+
+        self.status_controller = SimulatedMode4Controller(self.cfg, self.log, self.clock, self.prices)
+        self.status_controller.setup()
+        self.status_controller.running = True
+        self.status_controller._stats = self.controller._stats
+        self.status_controller.pm.prices = self.prices
+        self.loop.run_until_complete(self.status_controller.scheduler.create_schedule(
+            START, START + timedelta(days=1), self.current_charge(self.status_controller.battery_inverters)))
+
+    @staticmethod
+    def current_charge(battery_inverters: list) -> dict[str, float]:
+        return {inv.name: inv.capacity_wh / 2 for inv in battery_inverters}
+
+
+def measure(fn: Callable[[], Any], repeats: int = REPEATS, number: Optional[int] = None) -> dict[str, Any]:
+    '''Time fn: the number of calls per repeat is calibrated to take at least 0.2 s, unless given'''
+    timer = timeit.Timer(fn)
+    if number is None:
+        number, _ = timer.autorange()
+    per_call = [t / number for t in timer.repeat(repeat=repeats, number=number)]
+    return {
+        'us': min(per_call) * 1e6,
+        'median_us': statistics.median(per_call) * 1e6,
+        'calls': number * repeats,
+    }
+
+
+def bench_pbsent(fx: Fixtures) -> dict[str, dict[str, Any]]:
+    c = fx.controller
+    ret = {}
+    # safe: the house exports enough to absorb the charging within the fuse limit; clamped: it already imports
+    # close to the limit, so the charging batteries are cut back
+    for case, PGnow in (('safe', 4000.0), ('clamped', -5500.0)):
+        args = (Phase.L1, fx.PBSapp[Phase.L1], fx.PBSnow[Phase.L1], PGnow, 230.0, 25.0)
+        ret[f'calc_PBSsent.base_controller.{case}'] = measure(lambda: c.calc_PBSsent(*args))
+        ret[f'calc_PBSsent.pbsent.{case}'] = measure(lambda: calc_PBSsent(*args))
+    ret['calc_PBSsent.base_controller.export_limit'] = measure(
+        lambda: c.calc_PBSsent(Phase.L1, fx.PBSapp[Phase.L1], fx.PBSnow[Phase.L1], 2000.0, 230.0, 25.0, 0.0))
+
+    ret['apply_soc_limits'] = measure(lambda: c.apply_soc_limits(fx.PBSapp.copy()))  # includes a PBSapp.copy()
+    inverters = list(c.inverters.values())
+    ret['PBSapp.construct'] = measure(lambda: PBSapp(inverters))
+    ret['PBSapp.copy'] = measure(fx.PBSapp.copy)
+    return ret
+
+
+def bench_modbus(fx: Fixtures) -> dict[str, dict[str, Any]]:
+    ret = {}
+    for dtype, sma_format, words in DECODE_CASES:
+        fmt = 'TAGLIST' if isinstance(sma_format, dict) else sma_format
+        ret[f'ModbusManager._decode_value.{dtype}.{fmt}'] = measure(
+            lambda: fx.modbus._decode_value(30775, dtype, words, sma_format=sma_format))
+    return ret
+
+
+def bench_price(fx: Fixtures) -> dict[str, dict[str, Any]]:
+    pm = fx.pm
+    t = START + timedelta(days=1, hours=13, minutes=7)
+    pm_json = PriceManager(fx.cfg, fx.log, fx.clock)
+    return {
+        'PriceManager.get_price': measure(lambda: pm.get_price(t)),
+        'PriceManager.get_price_range': measure(lambda: pm.get_price_range(t)),
+        'PriceManager.from_json': measure(lambda: pm_json.from_json(fx.prices_json)),
+    }
+
+
+def bench_schedule(fx: Fixtures) -> dict[str, dict[str, Any]]:
+    ret = {}
+    for M in INVERTER_COUNTS:
+        cfg = DoeMaarWattConfig(fx.log, dyn_config=make_config(M))
+        pm = PriceManager(cfg, fx.log, fx.clock)
+        pm.prices = fx.prices
+        scheduler = DynamicScheduler(cfg, pm, clock=fx.clock)
+        charge = {b['name']: b['battery_capacity'] / 2 for b in cfg.get_battery_inverters_config()}
+        for N in SLOT_COUNTS:
+            end = START + timedelta(minutes=15 * N)
+            ret[f'DynamicScheduler.create_schedule.M{M}.N{N}'] = measure(
+                lambda: fx.loop.run_until_complete(scheduler.create_schedule(START, end, charge)),
+                repeats=SCHEDULE_REPEATS, number=1)
+
+    schedule = fx.status_controller.scheduler.schedule
+    ret[f'SchedulePeriod.to_dict.N{len(schedule)}'] = measure(lambda: [p.to_dict() for p in schedule])
+    return ret
+
+
+def bench_status(fx: Fixtures) -> dict[str, dict[str, Any]]:
+    def encode(controller):  # the first poll after a tick encodes a new snapshot, later polls are served from it
+        controller.publish_status()
+        return controller.handle_status(None)
+
+    return {
+        'status.mode_1': measure(lambda: encode(fx.controller)),
+        'status.mode_4': measure(lambda: encode(fx.status_controller)),
+        'status.mode_4.cached': measure(lambda: fx.status_controller.handle_status(None)),
+    }
+
+
+BENCHMARKS = {
+    'pbsent': bench_pbsent,
+    'modbus': bench_modbus,
+    'price': bench_price,
+    'schedule': bench_schedule,
+    'status': bench_status,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the controller hot paths')
+    parser.add_argument('--only', action='append', choices=BENCHMARKS.keys(), help='run only these benchmark groups')
+    parser.add_argument('--output', help='write the results to this JSON file')
+    parser.add_argument('--compare', help='compare against the results in this JSON file')
+    parser.add_argument('--fail-above', type=float, help='exit with code 1 if a benchmark got slower by more than this percentage')
+    args = parser.parse_args()
+
+    loop = asyncio.new_event_loop()
+    fx = Fixtures(loop)
+    results: dict[str, dict[str, Any]] = {}
+    for group in args.only or BENCHMARKS:
+        results.update(BENCHMARKS[group](fx))
+    loop.close()
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['results']
+
+    table = PrettyTable()
+    table.field_names = ['benchmark', 'time (us)', 'median (us)', 'calls'] + (['baseline (us)', 'change'] if baseline else [])
+    regressions = []
+    for name, r in results.items():
+        row = [name, f'{r["us"]:.2f}', f'{r["median_us"]:.2f}', r['calls']]
+        if baseline:
+            base = baseline.get(name)
+            change = (r['us'] / base['us'] - 1) * 100 if base else None
+            row += ['-' if base is None else f'{base["us"]:.2f}', '-' if change is None else f'{change:+.1f}%']
+            if change is not None and args.fail_above is not None and change > args.fail_above:
+                regressions.append(f'{name}: {change:+.1f}%')
+        table.add_row(row)
+    table.align = 'r'
+    table.align['benchmark'] = 'l'
+    print(table)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({
+                'meta': {
+                    'timestamp': dt.now().astimezone().strftime(TIME_FMT),
+                    'python': platform.python_version(),
+                    'platform': platform.platform(),
+                    'machine': platform.machine(),
+                },
+                'results': results,
+            }, f, indent=2)
+
+    if regressions:
+        print(f'slower than {args.compare} by more than {args.fail_above}%: ' + ', '.join(regressions), file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+# SCHEDULE.PY
+#
+# Benchmark for the assembly of the dynamic schedule MILP (see schedule_solver.build_milp_model). Reports the build
+# time and peak memory for a range of inverter counts (M) and schedule lengths (N), and compares the memory of the
+# sparse model with what the equivalent dense constraint matrices would have taken.
+#
+# Run from the src directory:
+#   python -m benchmarks.schedule [--solve]
+#
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+from prettytable import PrettyTable
+from scipy.optimize import milp
+
+from schedule_solver import build_milp_model
+
+
+INVERTER_COUNTS = range(1, 9)
+SLOT_COUNTS = (96, 192, 288, 384)  # 1 to 4 days of 15-minute slots
+REPEATS = 5
+
+
+def make_problem(M: int, N: int, seed: int = 42) -> dict:
+    '''Create a reproducible schedule problem for M batteries of 64 kWh over N 15-minute slots'''
+    rng = np.random.default_rng(seed)
+    h = 0.25
+    capacity = np.full(M, 64000.0)
+    e0 = capacity * rng.uniform(0.2, 0.8, M)
+    return {
+        'prices': rng.uniform(-0.05, 0.40, N),
+        'e0': e0,
+        'e_lo': np.minimum(capacity * 0.05, e0),
+        'e_hi': np.maximum(capacity * 0.95, e0),
+        'charge_max_wh': np.full(M, 6000.0 * h),
+        'discharge_max_wh': np.full(M, 5000.0 * h),
+        'efficiency': 0.93,
+    }
+
+
+def bench_build(M: int, N: int, solve: bool = False) -> dict:
+    problem = make_problem(M, N)
+
+    durations = []
+    for _ in range(REPEATS):
+        t0 = time.perf_counter()
+        model = build_milp_model(**problem)
+        durations.append(time.perf_counter() - t0)
+
+    tracemalloc.start()
+    model = build_milp_model(**problem)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    n_vars = 3 * M * N + N
+    ret = {
+        'M': M,
+        'N': N,
+        'build_ms': min(durations) * 1e3,
+        'peak_kib': peak / 1024,
+        'dense_kib': 3 * M * N * n_vars * 8 / 1024,  # A_eq (MN rows) + A_ineq (2MN rows) as float64
+        'solve_ms': None,
+    }
+
+    if solve:
+        t0 = time.perf_counter()
+        milp(c=model.c, constraints=model.constraints, integrality=model.integrality, bounds=model.bounds)
+        ret['solve_ms'] = (time.perf_counter() - t0) * 1e3
+
+    return ret
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the dynamic schedule MILP assembly')
+    parser.add_argument('--solve', action='store_true', help='also time the MILP solve for each model')
+    args = parser.parse_args()
+
+    table = PrettyTable()
+    table.field_names = ['M', 'N', 'build (ms)', 'peak mem (KiB)', 'dense A (KiB)', 'solve (ms)']
+    for M in INVERTER_COUNTS:
+        for N in SLOT_COUNTS:
+            r = bench_build(M, N, solve=args.solve)
+            table.add_row([
+                r['M'], r['N'], f'{r["build_ms"]:.2f}', f'{r["peak_kib"]:.0f}', f'{r["dense_kib"]:.0f}',
+                '-' if r['solve_ms'] is None else f'{r["solve_ms"]:.0f}',
+            ])
+    for f in table.field_names:
+        table.align[f] = 'r'
+    print(table)
+
+
+if __name__ == '__main__':
+    main()
@@ -4,8 +4,11 @@ from .base_inverter import BaseInverter, ControlException
 from .pbsapp import PhasePowerMap, PBSapp
 from .logger import Logger, LogLevel
 from .singleton import Singleton
-from .modbus import ModbusManager, value_is_nan, to_s32_list, to_u32_list, ModbusException
+from .modbus import ModbusManager, ModbusConnectionPool, value_is_nan, to_s32_list, to_u32_list, ModbusException
+from .modbus_trace import ModbusTrace, ModbusReplay
+from .registers import Register, RegisterMap
 from .time_functions import daterange, datetimerange, timerange
+from .clock import Clock, VirtualClock
 
 __all__ = [
     'Phase',
@@ -23,11 +26,18 @@ __all__ = [
     'LogLevel',
     'Singleton',
     'ModbusManager',
+    'ModbusConnectionPool',
     'value_is_nan',
     'to_s32_list',
     'to_u32_list',
     'ModbusException',
+    'ModbusTrace',
+    'ModbusReplay',
+    'Register',
+    'RegisterMap',
     'daterange',
     'datetimerange',
     'timerange',
+    'Clock',
+    'VirtualClock',
 ]
@@ -29,6 +29,12 @@ class BaseInverter(ABC):
         '''
         raise NotImplementedError
 
+    def reconnect(self) -> None:
+        '''Drop the connection to the inverter after a request failed or was abandoned. It is re-established when
+        next used, without affecting the connections to other devices. Nothing to do for inverters without one.
+        '''
+        pass
+
     @abstractmethod
     async def enable_control(self) -> None:
         '''Put the inverter in a state where it can be directly controlled by this application.
@@ -0,0 +1,102 @@
+# CLOCK.PY
+#
+# Injectable source of time for the controllers, the price manager and the simulated subsystems. The default Clock
+# is the wall clock. A VirtualClock runs simulations faster than real time, either accelerated (virtual time passes
+# a fixed factor faster than real time) or step-driven (discrete-event: whenever every task is waiting on a sleep,
+# virtual time jumps straight to the earliest wake-up).
+#
+import asyncio
+import heapq
+import itertools
+import time
+from datetime import datetime, tzinfo
+from typing import Optional, Union
+
+
+SETTLE_LIMIT = 1_000  # maximum number of event loop iterations a step-driven clock waits for ready tasks to settle
+
+
+class Clock:
+    '''Wall clock: real time, real monotonic time and real asyncio sleeps'''
+
+    def time(self) -> float:
+        '''Current time in epoch seconds'''
+        return time.time()
+
+    def monotonic(self) -> float:
+        '''Monotonic time in seconds, for deadlines and intervals'''
+        return time.monotonic()
+
+    def now(self, tz: Optional[tzinfo] = None) -> datetime:
+        '''Current time as a datetime in timezone tz (naive local time if tz is None)'''
+        return datetime.fromtimestamp(self.time(), tz)
+
+    async def sleep(self, seconds: float) -> None:
+        await asyncio.sleep(max(0.0, seconds))
+
+
+class VirtualClock(Clock):
+    '''
+    Simulated time, starting at start (epoch seconds or a datetime; default: now). With a speed, virtual time runs
+    speed times faster than real time and sleeps are shortened accordingly. Without one, the clock is step-driven:
+    virtual time stands still while tasks are running, and once every task waits on a sleep of this clock it
+    advances to the earliest wake-up. A step-driven clock is deterministic as long as nothing awaits real I/O (a
+    blocking call stalls virtual time; a real await lets it jump ahead).
+    '''
+
+    def __init__(self, start: Union[float, datetime, None] = None, speed: Optional[float] = None) -> None:
+        if speed is not None and speed <= 0:
+            raise ValueError(f'virtual clock speed must be positive: {speed}')
+        self.start = start.timestamp() if isinstance(start, datetime) else time.time() if start is None else start
+        self.speed = speed
+
+        self._real_start = time.monotonic()
+        self._now = self.start  # step-driven virtual time
+        self._sleepers: list[tuple[float, int, asyncio.Future]] = []  # heap of (wake-up time, sequence, future)
+        self._seq = itertools.count()
+        self._stepper: Optional[asyncio.Task] = None
+
+    def time(self) -> float:
+        if self.speed is not None:
+            return self.start + (time.monotonic() - self._real_start) * self.speed
+        return self._now
+
+    def monotonic(self) -> float:
+        return self.time() - self.start
+
+    async def sleep(self, seconds: float) -> None:
+        if self.speed is not None:
+            await asyncio.sleep(max(0.0, seconds) / self.speed)
+            return
+
+        loop = asyncio.get_running_loop()
+        wake_up = loop.create_future()
+        heapq.heappush(self._sleepers, (self._now + max(0.0, seconds), next(self._seq), wake_up))
+        if self._stepper is None or self._stepper.done():
+            self._stepper = loop.create_task(self._step())
+        await wake_up  # a cancelled sleep leaves a cancelled future behind, which _step() skips
+
+    async def _step(self) -> None:
+        '''Wake the sleepers in order of their wake-up time, each once all other tasks have settled'''
+        loop = asyncio.get_running_loop()
+        while self._sleepers:
+            await self._settle(loop)
+            while self._sleepers and self._sleepers[0][2].done():
+                heapq.heappop(self._sleepers)
+            if not self._sleepers:
+                return
+
+            wake_up_ts, _, wake_up = heapq.heappop(self._sleepers)
+            self._now = max(self._now, wake_up_ts)
+            wake_up.set_result(None)
+
+    @staticmethod
+    async def _settle(loop: asyncio.AbstractEventLoop) -> None:
+        '''Yield until no other callbacks are ready to run. This inspects the ready queue of the (selector or
+        proactor) base event loop; other loops fall back to yielding a fixed number of times.'''
+        ready = getattr(loop, '_ready', None)
+        await asyncio.sleep(0)
+        for _ in range(SETTLE_LIMIT if ready is not None else 10):
+            if ready is not None and not ready:
+                return
+            await asyncio.sleep(0)
@@ -1,4 +1,4 @@
-from enum import StrEnum
+from enum import IntEnum, StrEnum
 from dataclasses import dataclass
 from typing import Optional
 
@@ -54,3 +54,12 @@ class ControlStatus(StrEnum):
     UNCONTROLLED = 'UNCONTROLLED' # subsystem is currently not being controlled
     NOMINAL = 'NOMINAL' # subsystem is fully controlled
     DEGRADED = 'DEGRADED' # subsystem is only partially being controlled: only some registers could be read/written and/or a NaN value is returned
+
+
+class LogLevel(IntEnum):
+    DEBUG = 500
+    NOTE = 450
+    INFO = 400
+    ERROR = 200
+    FATAL = 100
+    OFF = 0
@@ -0,0 +1,303 @@
+# LOG_INDEX.PY
+#
+# Sidecar index of the daily log files, and queries that use it. Next to every log file the logger keeps an index
+# (<log file>.idx) of the byte offset of the first line of each level in each minute of the day. A query for a time
+# range and/or a level reads the index, and then only the parts of the log file that can hold matching lines, in
+# chunks: neither its memory use nor the time it takes grows with the size of the whole log file.
+#
+# Index format (little-endian): a sequence of _ENTRY records, in the order of the lines in the log file. Lines are
+# located by their minute of the day in the wall-clock time written in the log, so a query for '10:00' to '10:10'
+# matches what is seen in the log itself.
+#
+# The log files of finished days are compressed (<log file>.gz, see compress_log()). Their index keeps the offsets
+# in the uncompressed log, and queries read them transparently: seeking a compressed file decompresses up to the
+# offset, without holding more than a chunk in memory.
+#
+import gzip
+import os
+import shutil
+import struct
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Iterator, Optional, Union
+
+from .definitions import LogLevel
+
+
+INDEX_SUFFIX = '.idx'
+COMPRESSED_SUFFIX = '.gz'
+COMPRESS_LEVEL = 6
+READ_CHUNK_BYTES = 64 * 1024  # log file bytes read per step of a query
+
+_ENTRY = struct.Struct('<HHQ')  # minute of the day, log level, byte offset of the first line of it in that minute
+
+# layout of a log line: 'YYYY-mm-dd HH:MM:SS.fff | LEVEL | message'
+_TIME = slice(11, 23)
+_LEVEL = slice(26, 31)
+
+
+def index_path(log_path: Path) -> Path:
+    '''Path of the index of a log file; a compressed log file keeps the index it had uncompressed'''
+    return log_path.with_name(log_path.name.removesuffix(COMPRESSED_SUFFIX) + INDEX_SUFFIX)
+
+
+def open_log(log_path: Path) -> BinaryIO:
+    '''Open a log file for reading, compressed or not'''
+    if log_path.name.endswith(COMPRESSED_SUFFIX):
+        return gzip.open(log_path, 'rb')  # type: ignore
+    return open(log_path, 'rb')
+
+
+def compress_log(log_path: Path) -> Path:
+    '''Compress a finished log file, and remove it. A log file that was already compressed (eg. when lines for its
+    day came in after it was) is decompressed and compressed again with the new lines appended, and re-indexed'''
+    target = log_path.with_name(log_path.name + COMPRESSED_SUFFIX)
+    tmp = target.with_name(target.name + '.tmp')
+    appended = target.exists()
+    with gzip.open(tmp, 'wb', compresslevel=COMPRESS_LEVEL) as out:
+        if appended:
+            with gzip.open(target, 'rb') as f:
+                shutil.copyfileobj(f, out)
+        with open(log_path, 'rb') as f:
+            shutil.copyfileobj(f, out)
+    os.replace(tmp, target)
+    log_path.unlink()
+    if appended:
+        build_index(target)
+    return target
+
+
+def line_minute(line: Union[bytes, str]) -> Optional[int]:
+    '''Minute of the day of a log line, or None when it does not start with a timestamp'''
+    try:
+        return int(line[11:13]) * 60 + int(line[14:16])
+    except ValueError:
+        return None
+
+
+def line_level(line: bytes) -> Optional[int]:
+    level = LogLevel.__members__.get(line[_LEVEL].decode('ascii', 'replace').strip())
+    return None if level is None else level.value
+
+
+class LogIndexWriter:
+    '''Appends the index entries of a log file while lines are appended to it. Used by the logger writer thread'''
+
+    def __init__(self, log_path: Path) -> None:
+        path = index_path(log_path)
+        if not path.exists() and log_path.exists() and log_path.stat().st_size > 0:
+            build_index(log_path)  # a log file written before it was indexed
+        self._f = open(path, 'ab')
+        self._minute: Optional[int] = None
+        self._levels: set[int] = set()  # levels seen in the current minute
+
+    def add(self, minute: int, level: int, offset: int) -> None:
+        if minute != self._minute:
+            self._minute, self._levels = minute, set()
+        if level not in self._levels:
+            self._levels.add(level)
+            self._f.write(_ENTRY.pack(minute, level, offset))
+
+    def flush(self) -> None:
+        self._f.flush()
+
+    def close(self) -> None:
+        self._f.close()
+
+
+def build_index(log_path: Path) -> None:
+    '''(Re)build the index of an existing log file. Written to a temporary file first, so readers never see a
+    partial index'''
+    path = index_path(log_path)
+    tmp = path.with_name(path.name + '.tmp')
+    with open_log(log_path) as log, open(tmp, 'wb') as f:
+        seen: tuple[Optional[int], set[int]] = (None, set())
+        offset = 0
+        for line in log:
+            minute, level = line_minute(line), line_level(line)
+            if minute is not None and level is not None:
+                if minute != seen[0]:
+                    seen = (minute, set())
+                if level not in seen[1]:
+                    seen[1].add(level)
+                    f.write(_ENTRY.pack(minute, level, offset))
+            offset += len(line)
+    os.replace(tmp, path)
+
+
+def read_index(log_path: Path, size: int) -> Optional[list[tuple[int, int, int]]]:
+    '''The (minute, level, offset) entries of the index of a log file of size bytes, or None when it has no usable
+    index. An index is built for log files that do not have one yet'''
+    path = index_path(log_path)
+    try:
+        if not path.exists():
+            build_index(log_path)
+        data = path.read_bytes()
+    except OSError:
+        return None
+    data = data[:len(data) - len(data) % _ENTRY.size]  # an entry being written
+    entries = list(_ENTRY.iter_unpack(data))
+    if entries and entries[-1][2] > size:  # the log file was replaced: the index does not belong to it
+        return None
+    return entries
+
+
+@dataclass
+class LogQuery:
+    '''
+    Lines of a log file, filtered on wall-clock time (start inclusive, end exclusive, 'HH:MM' or 'HH:MM:SS'), on level
+    (the most verbose level included, as for the logger) and on a text that must appear in the line. offset is the
+    byte offset to start reading from, for continuing an earlier query: every query reports the offset up to which it
+    read. Lines written after the query was created are left to the next query.
+    '''
+    path: Path
+    start: Optional[str] = None
+    end: Optional[str] = None
+    level: Optional[LogLevel] = None
+    search: Optional[str] = None
+    offset: int = 0
+
+    def __post_init__(self) -> None:
+        self.compressed = self.path.name.endswith(COMPRESSED_SUFFIX)
+        self.size = self._compressed_size() if self.compressed else self._complete_size()
+        self._start = self.start.encode('ascii') if self.start else None
+        self._end = self.end.encode('ascii') if self.end else None
+        self._search = self.search.encode('utf-8') if self.search else None
+
+    def matches(self, line: bytes) -> bool:
+        if self._search is not None and self._search not in line:
+            return False
+        if self._start is not None or self._end is not None:
+            t = line[_TIME]
+            if (self._start is not None and t < self._start) or (self._end is not None and t >= self._end):
+                return False
+        if self.level is not None:
+            level = line_level(line)
+            if level is None or level > self.level:
+                return False
+        return True
+
+    def ranges(self) -> list[tuple[int, int]]:
+        '''The byte ranges of the log file that can hold matching lines, in order'''
+        offset = max(0, min(self.offset, self.size))
+        if self.start is None and self.end is None and self.level is None:
+            return [(offset, self.size)] if offset < self.size else []
+        entries = read_index(self.path, self.size)
+        if entries is None:
+            return [(offset, self.size)] if offset < self.size else []
+
+        start_minute = _minute(self.start) if self.start else 0
+        end_minute = _minute(self.end) if self.end else 24 * 60
+
+        # the lines of a minute run from its first entry up to the first entry of the next minute in the file
+        ranges: list[tuple[int, int]] = []
+        for i, (minute, level, a) in enumerate(entries):
+            if not start_minute <= minute <= end_minute or (self.level is not None and level > self.level):
+                continue
+            j = i + 1
+            while j < len(entries) and entries[j][0] == minute:
+                j += 1
+            b = entries[j][2] if j < len(entries) else self.size
+            a, b = max(a, offset), min(b, self.size)
+            if a >= b:
+                continue
+            if ranges and a <= ranges[-1][1]:
+                ranges[-1] = (ranges[-1][0], max(b, ranges[-1][1]))
+            else:
+                ranges.append((a, b))
+        return ranges
+
+    def read(self) -> Iterator[list[bytes]]:
+        '''The matching lines, a chunk at a time'''
+        with open_log(self.path) as f:
+            for a, b in self.ranges():
+                f.seek(a)
+                rest = b''
+                while a < b:
+                    chunk = f.read(min(READ_CHUNK_BYTES, b - a))
+                    if not chunk:
+                        break
+                    a += len(chunk)
+                    lines = (rest + chunk).split(b'\n')
+                    rest = lines.pop()
+                    matched = [line + b'\n' for line in lines if self.matches(line)]
+                    if matched:
+                        yield matched
+                if rest and self.matches(rest):
+                    yield [rest + b'\n']
+
+    def head(self, limit: int) -> tuple[list[bytes], int]:
+        '''At most limit matching lines, and the offset to continue from'''
+        lines: list[bytes] = []
+        next_offset = self.size
+        with open_log(self.path) as f:
+            for a, b in self.ranges():
+                f.seek(a)
+                pos = a
+                while pos < b:
+                    line = f.readline(b - pos)
+                    if not line:
+                        break
+                    pos += len(line)
+                    if self.matches(line.rstrip(b'\n')):
+                        lines.append(line)
+                        if len(lines) == limit:
+                            return lines, pos
+        return lines, next_offset
+
+    def tail(self, n: int) -> list[bytes]:
+        '''The last n matching lines, read backwards from the end (forwards for a compressed log file, which can
+        only seek backwards by decompressing it again from the start)'''
+        if self.compressed:
+            found: deque[bytes] = deque(maxlen=n)
+            for lines in self.read():
+                found.extend(lines)
+            return list(found)
+
+        found = deque()
+        with open(self.path, 'rb') as f:
+            for a, b in reversed(self.ranges()):
+                rest = b''
+                pos = b
+                while pos > a:
+                    step = min(READ_CHUNK_BYTES, pos - a)
+                    pos -= step
+                    f.seek(pos)
+                    lines = (f.read(step) + rest).split(b'\n')
+                    rest = lines.pop(0) if pos > a else b''  # may be the end of a line that starts before pos
+                    for line in reversed(lines):
+                        if line and self.matches(line):
+                            found.appendleft(line + b'\n')
+                            if len(found) == n:
+                                return list(found)
+                if rest and self.matches(rest):
+                    found.appendleft(rest + b'\n')
+                    if len(found) == n:
+                        return list(found)
+        return list(found)
+
+    def _compressed_size(self) -> int:
+        '''Uncompressed size of a compressed log file, from its gzip trailer (exact for logs under 4 GiB)'''
+        with open(self.path, 'rb') as f:
+            f.seek(-4, os.SEEK_END)
+            return struct.unpack('<I', f.read(4))[0]
+
+    def _complete_size(self) -> int:
+        '''Size of the log file up to its last complete line: a batch of lines may be in the middle of being written'''
+        with open(self.path, 'rb') as f:
+            size = f.seek(0, os.SEEK_END)
+            pos = size
+            while pos > 0:
+                step = min(READ_CHUNK_BYTES, pos)
+                f.seek(pos - step)
+                i = f.read(step).rfind(b'\n')
+                if i >= 0:
+                    return pos - step + i + 1
+                pos -= step
+            return 0
+
+
+def _minute(t: str) -> int:
+    hours, minutes = t.split(':')[:2]
+    return int(hours) * 60 + int(minutes)
@@ -3,30 +3,36 @@
 # Class Logger the is a general logger and currently support logging to screen and file.
 # Supported loglevels: DEBUG, INFO, ERROR, FATAL (and OFF)
 #
-import enum
+# Logging calls only enqueue a record; formatting and writing to screen and file is done in batches by a background
+# writer thread, so logging never blocks the event loop on I/O. Along with each log file the writer keeps an index of
+# byte offsets per minute and level, which lets log queries (see log_index.py) read only the part they need.
+# The log files of finished days are compressed, and old ones removed to stay within an age and a size limit, by a
+# background compaction thread.
+#
+import asyncio
+import atexit
 import os
 import json
+import queue
+import sys
+import threading
+import time
 from datetime import date, datetime as dt, timedelta
 from typing import Optional, Union
 from pathlib import Path
 from zoneinfo import ZoneInfo
 from aiohttp import web
 
+from .definitions import LogLevel
+from .log_index import COMPRESSED_SUFFIX, INDEX_SUFFIX, LogIndexWriter, LogQuery, compress_log, line_minute, open_log
 from .singleton import Singleton
 from .exceptions import ConfigException
 
 
 PREFIX_LENGTH = 22
+LOG_TAIL_MAX_LINES = 100_000  # most lines returned by a tail or limit query, which are collected before responding
 
 
-class LogLevel(enum.IntEnum):
-    DEBUG = 500
-    NOTE = 450
-    INFO = 400
-    ERROR = 200
-    FATAL = 100
-    OFF = 0
-
 _levelToName = {x.value: x.name for x in LogLevel}
 _nameToLevel = {x.name: x.value for x in LogLevel}
 
@@ -43,7 +49,11 @@ def getLevelName(level: Union[str, int]):
 
 
 class Logger(metaclass=Singleton):
-    ROTATE_FRACTION = 1000
+    QUEUE_SIZE = 10_000  # maximum number of records waiting to be written
+    DROP_FRACTION = 0.8  # above this fraction of QUEUE_SIZE, records below ERROR level are dropped
+    BATCH_SIZE = 500  # maximum number of records written in one go
+    FLUSH_INTERVAL = 0.5  # seconds the writer waits for new records before checking for dropped records
+    COMPACT_INTERVAL = 600  # seconds between compactions, besides the one when a new log file is started
 
     def __init__(self,
         message_prefix: Optional[str] = None,
@@ -52,6 +62,7 @@ class Logger(metaclass=Singleton):
         rotate: Optional[int] = None,
         suffix: Optional[str] = None,
         tz_name: Optional[str] = None,
+        max_bytes: Optional[int] = None,
     ):
         self.setup(
             message_prefix=message_prefix,
@@ -60,6 +71,7 @@ class Logger(metaclass=Singleton):
             rotate=rotate,
             suffix=suffix,
             tz_name=tz_name,
+            max_bytes=max_bytes,
         )
 
     def setup(self,
@@ -69,17 +81,23 @@ class Logger(metaclass=Singleton):
         rotate: Optional[int] = None,
         suffix: Optional[str] = None,
         tz_name: Optional[str] = None,
+        max_bytes: Optional[int] = None,
     ):
         """Rules for the logdir:
         - If it starts with ~ expand to the user directory
         - If it starts with / use as full path
         - Otherwise expand cwd
+        Log files older than rotate days are removed, as are the oldest ones once all log files together take more
+        than max_bytes.
         """
         if loglevel is not None and not isinstance(loglevel, LogLevel):
             raise ConfigException(f"invalid screen loglevel {loglevel}", source='logger')
 
         # timezone
         self.tz = ZoneInfo(tz_name) if tz_name is not None else ZoneInfo('UTC')
+        self.filedir: Optional[str] = None
+        self._rotate_delay: Optional[float] = None
+        self._max_bytes: Optional[int] = None
 
         # Loglevels
         self.loglevel = loglevel
@@ -101,6 +119,10 @@ class Logger(metaclass=Singleton):
 
             self._rotate_delay = rotate
 
+            if max_bytes is not None and (not isinstance(max_bytes, int) or max_bytes <= 0):
+                raise ConfigException("max_bytes needs to be a positive int", source='logger')
+            self._max_bytes = max_bytes
+
         # optional suffix to apply to filenames:
         self.suffix = "" if suffix is None else suffix
         if message_prefix is None:
@@ -108,8 +130,20 @@ class Logger(metaclass=Singleton):
         else:
             self._message_prefix = f"{message_prefix:<5}"[:5]
 
-        # Only rotate every now and then so count number of logs
-        self._num_logs = 0
+        # records are handed to the writer thread through a bounded queue: (creation time, loglevel, message parts)
+        self._queue: queue.Queue[Optional[tuple[float, LogLevel, tuple]]] = queue.Queue(maxsize=self.QUEUE_SIZE)
+        self._dropped: dict[LogLevel, int] = {}  # records dropped under pressure, reported by the writer
+        self._dropped_lock = threading.Lock()
+        self._file = None  # log file held open by the writer thread
+        self._file_size = 0
+        self._index: Optional[LogIndexWriter] = None  # index of the open log file
+        self._filename_open: Optional[str] = None
+        self._compactor: Optional[threading.Thread] = None  # compaction thread, while it runs
+        self._compacted = 0.0  # time.monotonic() of the last compaction
+
+        self._writer = threading.Thread(target=self._write_loop, name='logger', daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
 
     def set_timezone(self, tz_name: str):
         self.tz = ZoneInfo(tz_name)
@@ -118,6 +152,10 @@ class Logger(metaclass=Singleton):
     def set_loglevel(self, loglevel: LogLevel):
         self.loglevel = loglevel
 
+    def enabled(self, loglevel: LogLevel) -> bool:
+        '''True when messages of loglevel are logged. Guards messages that are costly to format on the hot paths'''
+        return loglevel <= self.loglevel
+
     def __call__(self, *msg: str):
         return self.info(*msg)
 
@@ -145,40 +183,110 @@ class Logger(metaclass=Singleton):
         if loglevel > self.loglevel:
             return
 
-        # Parse message
-        combined_msg = ""
-        for m in msg:
-            m = str(m)
-            combined_msg += str(m)
-            combined_msg += " "
-        combined_msg = combined_msg[:-1]
-
-        split_msg = combined_msg.split("\n")
-
-        ts = f'{dt.now(self.tz).strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]}'
-        parsed_msg = ""
-        for message in split_msg:
-            parsed_msg += f"{ts} | {loglevel.name:<5} | {self._message_prefix} {message}\n"
-        parsed_msg = parsed_msg[:-1]
+        # under pressure, keep the remaining queue capacity for errors:
+        if loglevel > LogLevel.ERROR and self._queue.qsize() >= self.QUEUE_SIZE * self.DROP_FRACTION:
+            self._drop(loglevel)
+            return
 
-        self._log_to_file(parsed_msg)
-        print(parsed_msg)
+        try:
+            self._queue.put_nowait((time.time(), loglevel, msg))
+        except queue.Full:
+            self._drop(loglevel)
+
+    def _drop(self, loglevel: LogLevel):
+        with self._dropped_lock:
+            self._dropped[loglevel] = self._dropped.get(loglevel, 0) + 1
+
+    def flush(self, timeout: float = 5.0):
+        '''Wait (at most timeout seconds) until all queued records have been written'''
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def close(self):
+        '''Write all queued records and stop the writer thread'''
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join(timeout=5.0)
+
+    def _write_loop(self):
+        while True:
+            try:
+                batch = [self._queue.get(timeout=self.FLUSH_INTERVAL)]
+            except queue.Empty:
+                batch = []
+            while batch and batch[-1] is not None and len(batch) < self.BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = None in batch
+            records = [r for r in batch if r is not None]
+
+            with self._dropped_lock:
+                dropped, self._dropped = self._dropped, {}
+            if dropped:
+                summary = ', '.join(f'{n} {level.name}' for level, n in dropped.items())
+                records.append((time.time(), LogLevel.ERROR, (f'logger: dropped {summary} message(s) under pressure',)))
 
-    def _today_string(self) -> str:
-        """Return a folder based on todays date"""
-        today = dt.now(self.tz).date()
-        return f"{today.year}-{today.month:02d}-{today.day:02d}"
+            try:
+                if records:
+                    self._write_records(records)
+            except Exception as e:
+                print(f'logger: unable to write log records: {e}', file=sys.stderr)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+            if stop:
+                self._close_file()
+                return
+
+            if self._file is not None and time.monotonic() - self._compacted > self.COMPACT_INTERVAL:
+                self._start_compaction()
+
+    def _write_records(self, records: list[tuple[float, LogLevel, tuple]]):
+        lines = []
+        for created, loglevel, msg in records:
+            lines.append(self._format(created, loglevel, msg))
+        text = '\n'.join(lines) + '\n'
+
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
+        if self.filedir is None:
+            return
 
-    def _filename(self) -> str:
-        return self._today_string() + self.suffix + ".log"
+        # group the lines per day, as each day has its own log file (the timestamp starts with the date)
+        start = 0
+        for i in range(1, len(lines) + 1):
+            if i == len(lines) or lines[i][:10] != lines[start][:10]:
+                self._log_to_file(lines[start][:10] + self.suffix + '.log', lines[start:i],
+                                  [loglevel for _, loglevel, _ in records[start:i]])
+                start = i
+
+    def _format(self, created: float, loglevel: LogLevel, msg: tuple) -> str:
+        combined_msg = ' '.join(str(m) for m in msg)
+        ts = dt.fromtimestamp(created, self.tz).strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
+        return '\n'.join(f"{ts} | {loglevel.name:<5} | {self._message_prefix} {message}"
+                         for message in combined_msg.split('\n'))
+
+    def get_log_path(self, ts: Union[dt, date]) -> Optional[Path]:
+        """Path of the log file of a day, which is compressed once the day is finished"""
+        if self.filedir is None:
+            return None
+        filepath = Path(self.filedir) / (f"{ts.year}-{ts.month:02d}-{ts.day:02d}" + self.suffix + '.log')
+        for path in (filepath, filepath.with_name(filepath.name + COMPRESSED_SUFFIX)):
+            if path.exists():
+                return path
+        return None
 
     def get_log(self, ts: Union[dt, date]) -> Optional[str]:
-        if isinstance(ts, dt) or isinstance(ts, date):
-            logfile = f"{ts.year}-{ts.month:02d}-{ts.day:02d}" + self.suffix + '.log'
-        filepath = os.path.join(self.filedir, logfile)
-        if os.path.exists(filepath):
-            with open(filepath, 'r') as f:
-                return f.read()
+        filepath = self.get_log_path(ts)
+        if filepath is not None:
+            with open_log(filepath) as f:
+                return f.read().decode('utf-8')
 
         return None
 
@@ -190,49 +298,178 @@ class Logger(metaclass=Singleton):
             ):
                 raise Exception(f'invalid log request value: {parsed}')
             ts = dt.strptime(parsed['date'], '%Y-%m-%d').astimezone(self.tz)
-            logfile = self.get_log(ts)
-            if logfile is None:
+            filepath = self.get_log_path(ts)
+            if filepath is None:
                 return web.Response(text='logfile not present')
-            else:
-                return web.Response(text=logfile)
+            query = await asyncio.to_thread(LogQuery, filepath)
+        except Exception as e:
+            raise web.HTTPBadRequest(text=json.dumps({'status': 'error', 'msg': str(e)}))
 
+        return await self._stream_log(req, query)
+
+    async def handle_log_query(self, req):
+        """GET /api/log/query: lines of the log of a day (date=YYYY-MM-DD, default today), optionally only those of
+        the last minutes (last=10) or between two times (from=HH:MM[:SS], to=HH:MM[:SS]), up to a level (level=INFO),
+        containing a text (search=...), and starting at a byte offset (offset=...). All matching lines are streamed,
+        or only the first (limit=N) or last (tail=N) N of them. The X-Log-Offset header holds the offset to pass to
+        continue reading after the returned lines, eg. to follow the log of today."""
+        try:
+            q = req.query
+            now = dt.now(self.tz)
+            day = dt.strptime(q['date'], '%Y-%m-%d').date() if 'date' in q else now.date()
+            start, end = q.get('from'), q.get('to')
+            for t in (start, end):
+                if t is not None:
+                    dt.strptime(t, '%H:%M:%S' if t.count(':') == 2 else '%H:%M')
+            if 'last' in q:
+                if day != now.date():
+                    raise Exception('last is only supported for the log of today')
+                since = now - timedelta(minutes=float(q['last']))
+                start = since.strftime('%H:%M:%S') if since.date() == day else None
+            level = LogLevel[q['level'].upper()] if 'level' in q else None
+            offset = int(q.get('offset', 0))
+            limit = int(q['limit']) if 'limit' in q else None
+            tail = int(q['tail']) if 'tail' in q else None
+            for n in (limit, tail):
+                if n is not None and not 0 < n <= LOG_TAIL_MAX_LINES:
+                    raise Exception(f'limit and tail must be between 1 and {LOG_TAIL_MAX_LINES}')
+            if offset < 0:
+                raise Exception(f'invalid offset: {offset}')
         except Exception as e:
             raise web.HTTPBadRequest(text=json.dumps({'status': 'error', 'msg': str(e)}))
 
-    def _log_to_file(self, msg: str):
-        """Save a msg to file"""
-        # Make dir
-        if not os.path.exists(self.filedir):
-            os.makedirs(self.filedir)
-
-        # Write to file
-        filepath = os.path.join(self.filedir, self._filename())
-        with open(filepath, "a") as f:
-            f.write(msg + "\n")
-
-        # Rotate
-        if self._rotate_delay is not None:
-            if self._num_logs % self.ROTATE_FRACTION == 0:
-                self._rotate_files()
-            self._num_logs += 1
-
-    def _rotate_files(self) -> None:
-        """Delete old folders from the log"""
-        assert self._rotate_delay is not None
-
-        log_files = [f for f in os.listdir(self.filedir) if f.endswith(".log")]
-        delta = timedelta(days=self._rotate_delay)
-        now = dt.now(self.tz)
-        today = dt(year=now.year, month=now.month, day=now.day, tzinfo=self.tz)
-
-        for log_file in log_files:
-            try:
-                log_date = dt.strptime(log_file[:10], "%Y-%m-%d").astimezone(self.tz)
-                age = today - log_date
-                if age > delta:
-                    to_delete = os.path.join(self.filedir, log_file)
-                    print(f"deleting old log directory {to_delete}")
-                    os.remove(to_delete)
-
-            except ValueError as e:
-                print(f"cannot parse directory to date: {self.filedir}: {str(e)}")
+        filepath = self.get_log_path(day)
+        if filepath is None:
+            return web.Response(text='', headers={'X-Log-Offset': '0'})
+        query = await asyncio.to_thread(LogQuery, filepath, start, end, level, q.get('search'), offset)
+
+        if tail is not None:
+            lines = await asyncio.to_thread(query.tail, tail)
+            return web.Response(body=b''.join(lines), content_type='text/plain', charset='utf-8',
+                                headers={'X-Log-Offset': str(query.size)})
+        if limit is not None:
+            lines, next_offset = await asyncio.to_thread(query.head, limit)
+            return web.Response(body=b''.join(lines), content_type='text/plain', charset='utf-8',
+                                headers={'X-Log-Offset': str(next_offset)})
+        return await self._stream_log(req, query)
+
+    async def _stream_log(self, req, query: LogQuery) -> web.StreamResponse:
+        """Stream the lines of query as a chunked response, reading the log file in a worker thread"""
+        resp = web.StreamResponse(headers={'X-Log-Offset': str(query.size)})
+        resp.content_type = 'text/plain'
+        resp.charset = 'utf-8'
+        resp.enable_chunked_encoding()
+        await resp.prepare(req)
+
+        chunks = query.read()
+        try:
+            while (lines := await asyncio.to_thread(next, chunks, None)) is not None:
+                await resp.write(b''.join(lines))
+            await resp.write_eof()
+        except ConnectionResetError:  # the client went away
+            pass
+        finally:
+            chunks.close()
+        return resp
+
+    def _log_to_file(self, filename: str, lines: list[str], loglevels: list[LogLevel]):
+        """Append the lines (each of one record, possibly spanning multiple lines) to the given log file, which is held
+        open until the day changes, and add them to its index"""
+        assert self.filedir is not None
+        if filename != self._filename_open or self._file is None:
+            self._close_file()
+
+            # Make dir
+            if not os.path.exists(self.filedir):
+                os.makedirs(self.filedir)
+
+            path = Path(self.filedir) / filename
+            self._index = LogIndexWriter(path)
+            self._file = open(path, "ab")
+            self._file_size = self._file.tell()
+            self._filename_open = filename
+
+            # compact once for every new log file: the previous one is finished
+            self._start_compaction()
+
+        assert self._index is not None
+        chunks = []
+        offset = self._file_size
+        for line, loglevel in zip(lines, loglevels):
+            minute = line_minute(line)
+            if minute is not None:
+                self._index.add(minute, loglevel.value, offset)
+            chunk = (line + '\n').encode('utf-8')
+            chunks.append(chunk)
+            offset += len(chunk)
+
+        # the index is written first: a line is never in the log file before its index entry is
+        self._index.flush()
+        self._file.write(b''.join(chunks))
+        self._file.flush()
+        self._file_size = offset
+
+    def _close_file(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._index is not None:
+            self._index.close()
+            self._index = None
+
+    def _start_compaction(self) -> None:
+        """Compact the log files in a background thread, unless it is still busy with the previous compaction"""
+        self._compacted = time.monotonic()
+        if self._compactor is not None and self._compactor.is_alive():
+            return
+        self._compactor = threading.Thread(target=self._compact_files, args=(self._filename_open,),
+                                           name='logger-compaction', daemon=True)
+        self._compactor.start()
+
+    def _compact_files(self, filename_open: Optional[str]) -> None:
+        """Compress the log files of the days before the log file being written (filename_open), then delete the
+        files of the days that are older than the rotate delay, and of the oldest days as long as all files together
+        take more than max_bytes. The log file being written is never removed."""
+        assert self.filedir is not None
+        try:
+            open_day = filename_open[:10] if filename_open is not None else None
+            days: dict[str, list[Path]] = {}  # 'YYYY-mm-dd' -> log, compressed log and index files of that day
+            for path in Path(self.filedir).iterdir():
+                if not path.name.endswith(('.log', '.log' + COMPRESSED_SUFFIX, '.log' + INDEX_SUFFIX)):
+                    continue
+                try:
+                    dt.strptime(path.name[:10], "%Y-%m-%d")
+                except ValueError:
+                    print(f"cannot parse log file name to date: {path}")
+                    continue
+                days.setdefault(path.name[:10], []).append(path)
+
+            for day, paths in days.items():
+                if open_day is None or day >= open_day:
+                    continue
+                for i, path in enumerate(paths):
+                    if path.name.endswith('.log'):
+                        paths[i] = compress_log(path)
+                days[day] = list(dict.fromkeys(paths))  # a log file may have been added to an existing compressed one
+
+            expired = set()
+            if self._rotate_delay is not None:
+                oldest = (dt.now(self.tz) - timedelta(days=self._rotate_delay)).strftime("%Y-%m-%d")
+                expired = {day for day in days if day < oldest and day != open_day}
+
+            if self._max_bytes is not None:
+                total = sum(path.stat().st_size for paths in days.values() for path in paths)
+                total -= sum(path.stat().st_size for day in expired for path in days[day])
+                for day in sorted(set(days) - expired):
+                    if total <= self._max_bytes or day == open_day:
+                        break
+                    expired.add(day)
+                    total -= sum(path.stat().st_size for path in days[day])
+
+            for day in sorted(expired):
+                for path in days[day]:
+                    print(f"deleting old log file {path}")
+                    path.unlink(missing_ok=True)
+
+        except Exception as e:
+            print(f"logger: unable to compact log files: {e}", file=sys.stderr)
@@ -1,17 +1,30 @@
 import asyncio
 import struct
-from typing import Any, Optional
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
 from pymodbus.client import AsyncModbusTcpClient as MBClient
 from pymodbus import ModbusException as PymodbusException
 from pymodbus.pdu.pdu import ModbusPDU
 
+from .definitions import LogLevel
 from .logger import Logger
+from .singleton import Singleton
 from .exceptions import DMWException, ConfigException, ProgrammingError
+from .registers import Register, RegisterMap, NAN_VALUES, dtype_word_count
+from .modbus_trace import ModbusTraceWriter, ModbusReplay, FC_READ_HOLDING, FC_READ_INPUT, FC_WRITE_MULTIPLE, \
+    STATUS_OK, STATUS_EXCEPTION, STATUS_ERROR
 
 
 class ModbusException(DMWException):
-    def __init__(self, message: str, source: str, requires_fallback: bool = False) -> None:
+    def __init__(self,
+        message: str,
+        source: str,
+        requires_fallback: bool = False,
+        exception_code: Optional[int] = None,  # of the exception response of the device, if it sent one
+    ) -> None:
         super().__init__(message, source, requires_fallback)
+        self.exception_code = exception_code
 
 
 _modbus_exception_codes = {
@@ -26,25 +39,22 @@ _modbus_exception_codes = {
     0x0B: "Gateway Target Failed - Target not responding"
 }
 
-# For each data type, SMA Modbus defines specific NaN values. Taken from 'SMAModbus-ennexOS-TI-en-13.pdf'
-_modbus_nan_values = {
-    'S16': -32768,
-    'S32': -2147483648,
-    'STR32': 0,
-    'U16': 65535,
-    'U32': 4294967295,
-    'U32-status': 16777213,
-    'U64': 18446744073709551615,
-}
-
+# exception codes by which a device refuses a read for the address range itself, rather than for a passing condition
+# (eg. 0x06 Slave Device Busy): only these make a block be read in parts from then on
+REFUSED_READ_CODES = {0x02, 0x03}
 
 def value_is_nan(val: Any, dtype: str) -> bool:
     try:
-        return val == _modbus_nan_values[dtype]
+        return val == NAN_VALUES[dtype]
     except KeyError:
         return False
 
 
+def _words_to_int(words: list[int]) -> int:
+    '''Interpret a list of unsigned 16-bit shorts as a single signed big-endian integer'''
+    return int.from_bytes(struct.pack(f'>{len(words)}H', *words), 'big', signed=True)
+
+
 def to_s32_list(v: int) -> list[int]:
     '''Convert a signed 32-bit integer into a list of two unsigned 16-bit shorts'''
     r = struct.pack('>i', v)
@@ -57,6 +67,156 @@ def to_u32_list(v: int) -> list[int]:
     return list(struct.unpack('>HH', r))
 
 
+MODBUS_TIMEOUT = 5  # seconds before a single Modbus request times out
+BACKOFF_INITIAL = 1.0  # seconds to wait before reconnecting after the first failure of a connection
+BACKOFF_MAX = 60.0  # upper bound for the exponentially growing reconnect backoff
+MAX_CONSECUTIVE_FAILURES = 3  # consecutive failed requests after which a connection is considered unhealthy
+WRITE_KEEPALIVE = 60.0  # seconds after which an unchanged register value is written again anyway
+
+
+class PooledConnection():
+    '''
+    A long-lived Modbus TCP connection to a single host:port, shared by every driver talking to that endpoint.
+    The connection is (re)established lazily when it is used: a connection that dropped, or that failed
+    MAX_CONSECUTIVE_FAILURES requests in a row, is closed and reconnected, with an exponential backoff per
+    connection so an unreachable device is not hammered with connection attempts.
+    '''
+
+    def __init__(self,
+        host: str,
+        port: int,
+        log: Logger,
+        client_factory: Optional[Callable[[str, int], MBClient]] = None,  # creates the client; default: Modbus TCP
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.log = log
+        self._client_factory = client_factory if client_factory is not None else self._create_client
+
+        self._client: Optional[MBClient] = None
+        self._lock = asyncio.Lock()  # serialises (re)connection attempts
+        self.failures = 0  # consecutive failed requests or connection attempts
+        self._retry_ts = 0.0  # monotonic time before which no reconnection is attempted
+        self.generation = 0  # incremented on every (re)connect: the device may have lost state in between
+
+    @property
+    def key(self) -> str:
+        return f'{self.host}:{self.port}'
+
+    @property
+    def healthy(self) -> bool:
+        return self._client is not None and self._client.connected and self.failures < MAX_CONSECUTIVE_FAILURES
+
+    async def acquire(self) -> MBClient:
+        '''Return a connected client, transparently reconnecting an unhealthy connection when its backoff expired'''
+        if self.healthy:
+            return self._client  # type: ignore
+
+        async with self._lock:
+            if self.healthy:  # another user reconnected in the meantime
+                return self._client  # type: ignore
+
+            wait = self._retry_ts - time.monotonic()
+            if wait > 0:
+                raise ModbusException(f'not reconnecting for another {wait:.1f} s after {self.failures} failure(s)',
+                                      source=f'modbus:{self.key}')
+
+            if self._client is not None:
+                self._client.close()
+            else:
+                self._client = self._client_factory(self.host, self.port)
+
+            self.log.debug(f'[modbus:{self.key}]: connecting')
+            await self._client.connect()
+            if not self._client.connected:
+                self.report_failure()
+                raise ModbusException(f'unable to connect', source=f'modbus:{self.key}')
+
+            self.failures = 0
+            self.generation += 1
+            self.log.debug(f'[modbus:{self.key}]: connected')
+            return self._client
+
+    def report_success(self) -> None:
+        self.failures = 0
+
+    def report_failure(self) -> None:
+        '''Record a failed request or connection attempt, and push back the next reconnection attempt'''
+        self.failures += 1
+        if self.failures >= MAX_CONSECUTIVE_FAILURES or self._client is None or not self._client.connected:
+            backoff = min(BACKOFF_MAX, BACKOFF_INITIAL * 2 ** (self.failures - 1))
+            self._retry_ts = time.monotonic() + backoff
+            self.log.debug(f'[modbus:{self.key}]: unhealthy after {self.failures} failure(s), reconnecting in {backoff:.0f} s')
+
+    def drop(self) -> None:
+        '''Close the connection after a request on it failed or was abandoned (eg. timed out), so a late response is
+        never taken for the answer to the next request. The next acquire() reconnects, subject to the backoff'''
+        if self._client is not None and self._client.connected:
+            self._client.close()
+            self.log.debug(f'[modbus:{self.key}]: dropped connection')
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+            self.log.debug(f'[modbus:{self.key}]: closed connection')
+        self.failures = 0
+        self._retry_ts = 0.0
+
+    @staticmethod
+    def _create_client(host: str, port: int) -> MBClient:
+        # reconnect_delay=0: reconnection is handled by acquire() rather than by pymodbus
+        return MBClient(host, port=port, name=f'Modbus[{host}:{port}]', reconnect_delay=0, timeout=MODBUS_TIMEOUT)
+
+
+class ModbusConnectionPool(metaclass=Singleton):
+    '''
+    Long-lived Modbus TCP connections, keyed by host:port and shared across all drivers
+    While a capture is running, every request sent over these connections is recorded to a trace. While a replay is
+    set, the connections talk to the replay instead of to the devices.
+    '''
+
+    def __init__(self, log: Logger) -> None:
+        self.log = log
+        self._connections: dict[str, PooledConnection] = {}
+        self.trace: Optional[ModbusTraceWriter] = None
+        self.replay: Optional[ModbusReplay] = None
+
+    def connection(self, host: str, port: int) -> PooledConnection:
+        key = f'{host}:{port}'
+        if key not in self._connections:
+            self._connections[key] = PooledConnection(host, port, self.log, self._create_client)
+        return self._connections[key]
+
+    def close(self) -> None:
+        for conn in self._connections.values():
+            conn.close()
+
+    def start_capture(self, path: Path, meta: Optional[dict[str, Any]] = None) -> ModbusTraceWriter:
+        '''Record all Modbus traffic to a trace at path (replacing a running capture), with meta stored in its header'''
+        self.stop_capture()
+        self.trace = ModbusTraceWriter(path, meta)
+        self.log.info(f'modbus: capturing traffic to {path}')
+        return self.trace
+
+    def stop_capture(self) -> None:
+        if self.trace is not None:
+            self.trace.close()
+            self.log.info(f'modbus: captured {self.trace.records} requests ({self.trace.size} bytes) to {self.trace.path}'
+                          f'{" (truncated)" if self.trace.truncated else ""}')
+            self.trace = None
+
+    def set_replay(self, replay: Optional[ModbusReplay]) -> None:
+        '''Serve all Modbus requests from replay instead of the devices (or from the devices again, for None)'''
+        self.close()  # the next acquire() of each connection creates a client of the new kind
+        self.replay = replay
+
+    def _create_client(self, host: str, port: int) -> MBClient:
+        if self.replay is not None:
+            return self.replay.client(host, port)  # type: ignore
+        return PooledConnection._create_client(host, port)
+
+
 class ModbusManager():
 
     def __init__(self,
@@ -64,8 +224,18 @@ class ModbusManager():
         log: Logger,
     ):
         self.log = log
+        self._pool = ModbusConnectionPool(log)
+
+        self._clients: dict[str, Optional[PooledConnection]] = {}
+
+        # blocks the device refused to read as a whole, per (client name, device id, block address, block count)
+        self._refused: set[tuple[str, int, int, int]] = set()
 
-        self._clients: dict[str, Optional[MBClient]] = {}
+        # single register maps of the registers read one at a time, per (address, data type, SMA format)
+        self._single: dict[tuple[int, str, Any], RegisterMap] = {}
+
+        # last values written per (client name, device id, address): (values, connection generation, monotonic ts)
+        self._written: dict[tuple[str, int, int], tuple[list[int], int, float]] = {}
 
         for cfg in client_configs:
             if len(cfg) == 0:
@@ -78,48 +248,51 @@ class ModbusManager():
                 self.log.debug(f'modbus[{name}]: creating dummy client')
                 self._clients[name] = None
             else:
-                self.log.debug(f'modbus[{name}]: creating modbus client')
-                self._clients[name] = MBClient(
-                    cfg['host'],
-                    port=int(cfg.get('port', 502)),
-                    name=f'Modbus[{name}]',
-                    reconnect_delay=10.0,  # TODO: make config setting
-                    timeout=5,
-                )
+                self._clients[name] = self._pool.connection(cfg['host'], int(cfg.get('port', 502)))
+                self.log.debug(f'modbus[{name}]: using pooled connection {self._clients[name].key}')  # type: ignore
 
     async def connect(self):
-        for name, client in self._clients.items():
-            if client is None:
+        for name, conn in self._clients.items():
+            if conn is None:
                 continue
-            await client.connect()
-            if not client.connected:
-                raise ModbusException(f'unable to connect', source=f'modbus:{name}')
+            await conn.acquire()
             self.log.debug(f'[modbus:{name}]: connected')
 
     def close(self):
-        for name, client in self._clients.items():
-            if client is None:
+        '''
+        Stop using the pooled connections. The connections themselves are left open for the next (re)connect and
+        for other drivers sharing them; they are only closed by ModbusConnectionPool.close()
+        '''
+        for name, conn in self._clients.items():
+            if conn is None:
+                continue
+            self.log.debug(f'[modbus:{name}]: released connection')
+
+    def reconnect(self) -> None:
+        '''Drop the pooled connections of this manager after a failed request: they are reconnected on their next use,
+        while the connections to other devices stay up'''
+        for name, conn in self._clients.items():
+            if conn is None:
                 continue
-            client.close()
-            self.log.debug(f'[modbus:{name}]: closed connection')
+            conn.drop()  # the values written before are written again after reconnecting (see generation)
+
+    def invalidate(self, client_name: Optional[str] = None) -> None:
+        '''Forget the values written to the registers of client_name (or of all clients), so they are written again'''
+        self._written = {k: v for k, v in self._written.items() if client_name is not None and k[0] != client_name}
 
     async def write_registers_parallel(self,
         address: int,
         values: list[int],
         no_response_expected: bool = False,
+        force: bool = False,
     ):
-        for name, client in self._clients.items():
-            self.log.debug(f'[modbus:{name}]: write register {address} <- {values}')
-
-            if client is None:
+        for name, conn in self._clients.items():
+            if conn is None:
+                self.log.debug(f'[modbus:{name}]: write register {address} <- {values}')
                 continue
 
-            await client.write_registers(
-                address,
-                values,
-                device_id=3,  # related to Unit_id
-                no_response_expected=no_response_expected,
-            )
+            await self._write(name, conn, address, values, device_id=3,  # related to Unit_id
+                              no_response_expected=no_response_expected, force=force)
 
     async def write_register(self,
         client_name: str,
@@ -127,23 +300,112 @@ class ModbusManager():
         values: list[int],
         no_response_expected: bool = False,
         device_id: int = 3,
+        deadband: int = 0,
+        force: bool = False,
     ):
+        '''
+        Write values to a holding register using the client connected to client_name
+        The write is skipped when the register was last written with the same values (or, with a deadband, with a
+        value differing at most deadband from it), unless force is set or WRITE_KEEPALIVE seconds have passed since
+        the last write. The deadband compares values as signed integers, as produced by to_s32_list / to_u32_list.
+        '''
         if not client_name in self._clients:
             raise ConfigException(f'client name {client_name} not configured', source=f'modbus:{client_name}')
 
-        client = self._clients[client_name]
-        if client is None:
+        conn = self._clients[client_name]
+        if conn is None:
             return
 
-        val_str = '[' + ','.join(str(v) for v in values) + ']'
+        await self._write(client_name, conn, address, values, device_id=device_id,
+                          no_response_expected=no_response_expected, deadband=deadband, force=force)
+
+    async def _write(self,
+        client_name: str,
+        conn: PooledConnection,
+        address: int,
+        values: list[int],
+        device_id: int,
+        no_response_expected: bool = False,
+        deadband: int = 0,
+        force: bool = False,
+    ):
+        key = (client_name, device_id, address)
+        if not force and self._is_unchanged(key, conn, values, deadband):
+            if self.log.enabled(LogLevel.DEBUG):
+                self.log.debug(f'[modbus:{client_name}]: register {address} already holds {values}, skipping write')
+            return
 
+        client = await conn.acquire()
+        start = time.perf_counter()
         try:
-            await client.write_registers(address, values, device_id=device_id, no_response_expected=no_response_expected)
-            self.log.debug(f'[modbus:{client_name}]: write register {address} <- {val_str}')
+            resp = await client.write_registers(address, values, device_id=device_id,
+                                                no_response_expected=no_response_expected)
+            conn.report_success()
+            self._record(conn, FC_WRITE_MULTIPLE, device_id, address, len(values), start, resp, values)
         except PymodbusException as e:
-            raise ModbusException(f'exception in Pymodbus library while writing register {address} with {val_str}: {e}',
+            self._record(conn, FC_WRITE_MULTIPLE, device_id, address, len(values), start, None, values, failed=True)
+            self._written.pop(key, None)
+            conn.report_failure()
+            raise ModbusException(f'exception in Pymodbus library while writing register {address} with {values}: {e}',
                                   source=f'modbus:{client_name}')
 
+        if resp is not None and resp.isError():  # not remembered, so the write is retried on the next command
+            self._written.pop(key, None)
+            code = getattr(resp, 'exception_code', None)
+            exc_descr = _modbus_exception_codes.get(code, '<unknown exception>') if code else 'code absent'
+            self.log.error(f'[modbus:{client_name}]: error while writing register {address} with {values}: ({code}) {exc_descr}')
+            return
+
+        self._written[key] = (list(values), conn.generation, time.monotonic())
+        if self.log.enabled(LogLevel.DEBUG):
+            self.log.debug(f'[modbus:{client_name}]: write register {address} <- {values}')
+
+    def _record(self,
+        conn: PooledConnection,
+        fc: int,
+        device_id: int,
+        address: int,
+        count: int,
+        start: float,
+        resp: Optional[ModbusPDU],
+        values: Optional[list[int]] = None,
+        failed: bool = False,
+    ) -> None:
+        '''Record a request started at perf_counter() time start, and its response, to the running capture (if any)'''
+        trace = self._pool.trace
+        if trace is None:
+            return
+
+        latency = time.perf_counter() - start
+        status, code, words = STATUS_OK, 0, values
+        if failed:
+            status = STATUS_ERROR
+        elif resp is not None and resp.isError():
+            status, code = STATUS_EXCEPTION, getattr(resp, 'exception_code', 0) or 0
+        elif resp is not None and values is None:
+            words = resp.registers
+        trace.record(conn.key, fc, device_id, address, count, time.time() - latency, latency, status, code, words)
+
+    @staticmethod
+    def _read_fc(address: int) -> int:
+        return FC_READ_HOLDING if str(address)[0] == '4' else FC_READ_INPUT
+
+    def _is_unchanged(self,
+        key: tuple[str, int, int],
+        conn: PooledConnection,
+        values: list[int],
+        deadband: int,
+    ) -> bool:
+        last = self._written.get(key)
+        if last is None or not conn.healthy:  # a dropped connection bumps the generation only once reconnected
+            return False
+
+        last_values, generation, ts = last
+        if generation != conn.generation or time.monotonic() - ts >= WRITE_KEEPALIVE or len(last_values) != len(values):
+            return False
+
+        return last_values == values or abs(_words_to_int(values) - _words_to_int(last_values)) <= deadband
+
     async def read_register(self,
         client_name: str,
         address: int,
@@ -158,37 +420,15 @@ class ModbusManager():
         3x = Input Register = 30001-39999
         4x = Holding Register = 40001-49999
         '''
-        client = self._clients.get(client_name)
-        if client is None:
+        conn = self._clients.get(client_name)
+        if conn is None:
             return 1.2345  # dummy value
 
-        try:
-            cnt = self._dtype_to_word_count(dtype)
-            self.log.debug(f'[modbus:{client_name}]: trying to read register {address} (count: {cnt})')
-
-            resp: Optional[ModbusPDU] = None
-            if str(address)[0] == '4':
-                resp = await client.read_holding_registers(address, count=cnt, device_id=device_id)
-            elif str(address)[0] == '3':
-                resp = await client.read_input_registers(address, count=cnt, device_id=device_id)
-            else:
-                raise ProgrammingError(f'this method only supports reading input and holding registers',
-                                       source=f'modbus:{client_name}')
-
-            if resp.isError():
-                code = getattr(resp, 'exception_code', None)
-                if code:
-                    exc_descr = _modbus_exception_codes.get(resp.exception_code, '<unknown exception>')
-                    raise ModbusException(f'error while reading register {address}: ({code}) {exc_descr}',
-                                          source=f'modbus:{client_name}')
-
-            value = self._decode_response(client_name, dtype, resp, sma_format=sma_format)
+        words = await self._read_words(client_name, conn, address, self._dtype_to_word_count(dtype), device_id)
+        value = self._decode_value(address, dtype, words, sma_format=sma_format)
+        if self.log.enabled(LogLevel.DEBUG):
             self.log.debug(f'[modbus:{client_name}]: read register {address} -> {value}')
-            return value
-
-        except PymodbusException as e:
-            raise ModbusException(f'exception in Pymodbus library while reading register {address}: {e}',
-                                  source=f'modbus:{client_name}')
+        return value
 
     async def read_register_seq(self,
         client_name: str,
@@ -207,52 +447,98 @@ class ModbusManager():
 
         return ret
 
-    async def _read_registers(self,
+    async def read_block(self,
         client_name: str,
-        address: int,
-        dtype: str,
-        result_dict: dict[str, Any],
+        registers: RegisterMap,
         device_id: int = 3,
-        sma_format: str | dict[int, str] | None = None,
-    ):
+    ) -> dict[str, Any]:
         '''
-        Read a holding or input register using the client connected to client_name
-        The following logic is used to determine whether the register is a holding or input register:
-
-        3x = Input Register = 30001-39999
-        4x = Holding Register = 40001-49999
+        Read a compiled register map using the client connected to client_name with as few requests as possible
+        Every block of the map is fetched with a single read and decoded into its fields in one pass.
+        Should the device refuse a block read (an exception response with one of REFUSED_READ_CODES, eg. because the
+        block spans an unsupported address), the block is read in parts instead (see RegisterMap.split), from then
+        on: the refusal is remembered for this device. Any other error is raised.
         '''
-        result_dict[client_name] = None  # ensure some value is present
-        client = self._clients.get(client_name)
-        if client is None:
-            return
+        conn = self._clients.get(client_name)
+        if conn is None:
+            return {name: 1.2345 for name in registers}  # dummy values
+
+        ret = {}
+        for block in registers.blocks:
+            key = (client_name, device_id, block.address, block.count)
+            if key not in self._refused:
+                try:
+                    words = await self._read_words(client_name, conn, block.address, block.count, device_id)
+                    ret.update(registers.decode(block, words))
+                    continue
+                except ModbusException as e:
+                    if len(block.fields) == 1 or e.exception_code not in REFUSED_READ_CODES:
+                        raise
+                    self._refused.add(key)
+                    self.log.note(f'[modbus:{client_name}]: block read {block.address} (count: {block.count}) refused, '
+                                  f'reading it in parts from now on: {e}')
+
+            for part in registers.split(block):
+                words = await self._read_words(client_name, conn, part.address, part.count, device_id)
+                ret.update(registers.decode(part, words))
+
+        if self.log.enabled(LogLevel.DEBUG):
+            self.log.debug(f'[modbus:{client_name}]: read block -> {ret}')
+        return ret
 
+    async def _read_words(self,
+        client_name: str,
+        conn: PooledConnection,
+        address: int,
+        count: int,
+        device_id: int,
+    ) -> list[int]:
+        '''Read count raw words starting at address, from either the input (3x) or holding (4x) registers'''
+        client = await conn.acquire()
         try:
-            cnt = self._dtype_to_word_count(dtype)
-            self.log.debug(f'[modbus:{client_name}]: trying to read register {address} (count: {cnt})')
+            if self.log.enabled(LogLevel.DEBUG):
+                self.log.debug(f'[modbus:{client_name}]: trying to read register {address} (count: {count})')
 
             reg_digit = str(address)[0]
+            start = time.perf_counter()
             if reg_digit == '4':
-                resp = await client.read_holding_registers(address, count=cnt, device_id=device_id)
+                resp = await client.read_holding_registers(address, count=count, device_id=device_id)
             elif reg_digit == '3':
-                resp = await client.read_input_registers(address, count=cnt, device_id=device_id)
+                resp = await client.read_input_registers(address, count=count, device_id=device_id)
             else:
-                raise ProgrammingError(f'this method only supports reading input and holding registers ({address})', source=f'modbus:{client_name}')
+                raise ProgrammingError(f'this method only supports reading input and holding registers ({address})',
+                                       source=f'modbus:{client_name}')
+            conn.report_success()
+            self._record(conn, self._read_fc(address), device_id, address, count, start, resp)
 
             if resp.isError():
                 code = getattr(resp, 'exception_code', None)
-                if code:
-                    exc_descr = _modbus_exception_codes.get(resp.exception_code, '<unknown exception>')
-                    raise ModbusException(f'error while reading register {address}: ({code}) {exc_descr}', source=f'modbus:{client_name}')
-                else:
-                    raise ModbusException(f'error while reading register {address}: (code absent) {resp}', source=f'modbus:{client_name}')
-
-            value = self._decode_response(client_name, dtype, resp, sma_format=sma_format)
-            result_dict[client_name] = value
-            self.log.debug(f'[modbus:{client_name}]: read register {address} -> {value}')
+                exc_descr = _modbus_exception_codes.get(code, '<unknown exception>') if code else 'code absent'
+                raise ModbusException(f'error while reading register {address} (count: {count}): ({code}) {exc_descr}',
+                                      source=f'modbus:{client_name}', exception_code=code)
+
+            return resp.registers
 
         except PymodbusException as e:
-            raise ModbusException(f'exception in Pymodbus library while reading register {address}: {e}', source=f'modbus:{client_name}')
+            self._record(conn, self._read_fc(address), device_id, address, count, start, None, failed=True)
+            conn.report_failure()
+            raise ModbusException(f'exception in Pymodbus library while reading register {address}: {e}',
+                                  source=f'modbus:{client_name}')
+
+    async def _read_registers(self,
+        client_name: str,
+        address: int,
+        dtype: str,
+        result_dict: dict[str, Any],
+        device_id: int = 3,
+        sma_format: str | dict[int, str] | None = None,
+    ):
+        '''Read a holding or input register using the client connected to client_name into result_dict[client_name]'''
+        result_dict[client_name] = None  # ensure some value is present
+        if self._clients.get(client_name) is None:
+            return
+        result_dict[client_name] = await self.read_register(client_name, address, dtype, device_id=device_id,
+                                                            sma_format=sma_format)
 
     async def read_registers_parallel(self,
         address: int,
@@ -279,7 +565,6 @@ class ModbusManager():
                 await asyncio.gather(*tasks)
             except Exception as e:
                 self.log.error(f'modbus: Modbus parallel read failed: {e}')
-                self.close()
                 if isinstance(e, ModbusException):
                     raise
                 else: # wrap
@@ -297,69 +582,17 @@ class ModbusManager():
         return ret
 
     def _dtype_to_word_count(self, dtype: str) -> int:
-        dtype = dtype.upper()
-        if dtype == 'U16':
-            return 1
-        elif dtype == 'S16':
-            return 1
-        elif dtype == 'U32':
-            return 2
-        elif dtype == 'U32-status':
-            return 2
-        elif dtype == 'S32':
-            return 2
-        elif dtype == 'U64':
-            return 4
-        elif dtype == 'S64':
-            return 4
-        raise ProgrammingError(f'unrecognized Modbus datatype: {dtype}', source='modbus')
-
-    def _decode_response(self,
-        client_name: str,
+        return dtype_word_count(dtype)
+
+    def _decode_value(self,
+        address: int,
         dtype: str,
-        resp,
+        words: list[int],
         sma_format: str | dict[int, str] | None = None,
     ) -> Any:
-        '''
-        Decode a non-error modbus server response according to the datatype, applying proper endianness, etc
-        See https://www.pymodbus.org/docs/reading-registers#working-with-different-data-types
-        '''
-        dtype = dtype.upper()
-        if dtype == 'U16':
-            value = MBClient.convert_from_registers(resp.registers, MBClient.DATATYPE.UINT16, 'big')
-        elif dtype == 'S16':
-            value = MBClient.convert_from_registers(resp.registers, MBClient.DATATYPE.INT16, 'big')
-        elif dtype == 'U32':
-            value = MBClient.convert_from_registers(resp.registers, MBClient.DATATYPE.UINT32, 'big')
-        elif dtype == 'S32':
-            value = MBClient.convert_from_registers(resp.registers, MBClient.DATATYPE.INT32, 'big')
-        elif dtype == 'U64':
-            value = MBClient.convert_from_registers(resp.registers, MBClient.DATATYPE.UINT64, 'big')
-        else:  # TODO expand for STR32 type and variable length strings
-            return resp
-
-        if value_is_nan(value, dtype):
-            self.log.info(f'[modbus:{client_name}]: decoded modbus response {value} into a NaN-value')
-            return None  # we use None as NaN
-
-        if sma_format is not None:
-            if isinstance(sma_format, str):
-                sma_format = sma_format.upper()
-                if sma_format == 'FIX0':
-                    pass  # no decimal place, so no rounding needed
-                elif sma_format == 'FIX1':
-                    value = float(value) / 1e1  # type: ignore
-                elif sma_format == 'FIX2':
-                    value = float(value) / 1e2  # type: ignore
-                elif sma_format == 'FIX3':
-                    value = float(value) / 1e3  # type: ignore
-                elif sma_format == 'TEMP':
-                    value = float(value) / 1e1  # type: ignore
-            elif isinstance(sma_format, dict):  # assuming data format is a tag list mapping
-                try:
-                    value = sma_format[value]  # type: ignore
-                except KeyError:
-                    raise ProgrammingError(f'no taglist mapping for value {value}', source='modbus')
-
-        self.log.debug(f"[modbus:{client_name}]: decoded response '{resp}' into {value}")
-        return value
+        '''Decode the raw words of a single register read on its own, with the same decoder as a compiled register map'''
+        key = (address, dtype, tuple(sma_format.items()) if isinstance(sma_format, dict) else sma_format)
+        registers = self._single.get(key)
+        if registers is None:
+            registers = self._single[key] = RegisterMap({str(address): Register(address, dtype, sma_format)})
+        return registers.decode_field(str(address), words)
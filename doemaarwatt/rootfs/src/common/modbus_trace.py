@@ -0,0 +1,279 @@
+# MODBUS_TRACE.PY
+#
+# Record and replay of Modbus traffic. While capturing, every request the ModbusManager sends over a pooled
+# connection is appended to a compact binary trace together with its response, timestamp and latency. A replay
+# serves such a trace back to the drivers in place of the real devices, at the recorded timing or, on a
+# VirtualClock, accelerated or step-driven, so new controller code can be run deterministically against the
+# traffic of a real installation.
+#
+# Trace format (little-endian): a header of MAGIC, a format version (uint16) and the length (uint32) of a UTF-8
+# JSON metadata object, followed by tagged records:
+#   'E': endpoint id (uint16), name length (uint16), name (host:port, UTF-8)   -- before the first request to it
+#   'R': see _REQUEST, followed by n_words words (uint16): the registers read, or the values written
+#
+import json
+import struct
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, BinaryIO, Optional
+
+from pymodbus.exceptions import ModbusIOException
+from pymodbus.pdu import ExceptionResponse
+from pymodbus.pdu.register_message import ReadHoldingRegistersResponse, ReadInputRegistersResponse, \
+    WriteMultipleRegistersResponse
+
+from .clock import Clock
+
+
+MAGIC = b'DMWT'
+TRACE_VERSION = 1
+TRACE_MAX_BYTES = 256 * 1024 * 1024  # a capture stops recording once its trace reaches this size
+TRACE_BUFFER_BYTES = 64 * 1024  # write buffer of a capture: the records of a few seconds at most are lost on a crash
+
+# function codes of the requests sent by the ModbusManager
+FC_READ_HOLDING = 3
+FC_READ_INPUT = 4
+FC_WRITE_MULTIPLE = 16
+
+# outcome of a recorded request
+STATUS_OK = 0
+STATUS_EXCEPTION = 1  # the device answered with a Modbus exception response (exception_code)
+STATUS_ERROR = 2      # the request failed in the transport (timeout, connection lost)
+
+ILLEGAL_ADDRESS = 0x02  # exception code replayed for requests that were never recorded
+
+_HEADER = struct.Struct('<4sHI')
+_ENDPOINT = struct.Struct('<HH')
+# timestamp (epoch seconds), latency (seconds), endpoint id, function code, device id, address, count, status,
+# exception code, number of words that follow
+_REQUEST = struct.Struct('<dfHBBHHBBH')
+
+
+@dataclass(frozen=True, slots=True)
+class TraceRecord:
+    ts: float
+    latency: float
+    endpoint: str
+    fc: int
+    device_id: int
+    address: int
+    count: int
+    status: int
+    exception_code: int
+    words: tuple[int, ...]
+
+
+class ModbusTraceWriter:
+    '''Appends the requests of a capture to a binary trace file'''
+
+    def __init__(self, path: Path, meta: Optional[dict[str, Any]] = None, max_bytes: int = TRACE_MAX_BYTES) -> None:
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.records = 0
+        self.truncated = False  # set once max_bytes was reached
+
+        header = json.dumps(meta or {}).encode('utf-8')
+        self._f: Optional[BinaryIO] = self.path.open('wb', buffering=TRACE_BUFFER_BYTES)
+        self._f.write(_HEADER.pack(MAGIC, TRACE_VERSION, len(header)) + header)
+        self.size = _HEADER.size + len(header)
+        self._endpoints: dict[str, int] = {}
+
+    def record(self,
+        endpoint: str,
+        fc: int,
+        device_id: int,
+        address: int,
+        count: int,
+        ts: float,
+        latency: float,
+        status: int = STATUS_OK,
+        exception_code: int = 0,
+        words: Optional[list[int]] = None,
+    ) -> None:
+        if self._f is None or self.truncated:
+            return
+
+        buf = b''
+        endpoint_id = self._endpoints.get(endpoint)
+        if endpoint_id is None:
+            name = endpoint.encode('utf-8')
+            endpoint_id = self._endpoints[endpoint] = len(self._endpoints)
+            buf += b'E' + _ENDPOINT.pack(endpoint_id, len(name)) + name
+
+        words = words or []
+        buf += b'R' + _REQUEST.pack(ts, latency, endpoint_id, fc, device_id, address, count, status, exception_code,
+                                    len(words)) + struct.pack(f'<{len(words)}H', *words)
+        if self.size + len(buf) > self.max_bytes:
+            self.truncated = True
+            return
+
+        self._f.write(buf)
+        self.size += len(buf)
+        self.records += 1
+
+    def close(self) -> None:
+        if self._f is not None:
+            self._f.close()
+            self._f = None
+
+
+@dataclass
+class ModbusTrace:
+    '''A trace read back from file: its metadata and its records in the order they were recorded'''
+    meta: dict[str, Any] = field(default_factory=dict)
+    records: list[TraceRecord] = field(default_factory=list)
+
+    @property
+    def start(self) -> Optional[float]:
+        return self.records[0].ts if self.records else None
+
+    @property
+    def duration(self) -> float:
+        return self.records[-1].ts - self.records[0].ts if self.records else 0.0
+
+    @classmethod
+    def load(cls, path: Path) -> 'ModbusTrace':
+        data = Path(path).read_bytes()
+        magic, version, meta_len = _HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError(f'{path} is not a Modbus trace')
+        if version != TRACE_VERSION:
+            raise ValueError(f'unsupported Modbus trace version {version} in {path}')
+
+        pos = _HEADER.size
+        trace = cls(meta=json.loads(data[pos:pos + meta_len]))
+        pos += meta_len
+
+        endpoints: dict[int, str] = {}
+        while pos < len(data):
+            tag = data[pos:pos + 1]
+            pos += 1
+            if tag == b'E':
+                endpoint_id, n = _ENDPOINT.unpack_from(data, pos)
+                pos += _ENDPOINT.size
+                endpoints[endpoint_id] = data[pos:pos + n].decode('utf-8')
+                pos += n
+            elif tag == b'R':
+                ts, latency, endpoint_id, fc, device_id, address, count, status, code, n = _REQUEST.unpack_from(data, pos)
+                pos += _REQUEST.size
+                words = struct.unpack_from(f'<{n}H', data, pos)
+                pos += 2 * n
+                trace.records.append(TraceRecord(ts, latency, endpoints[endpoint_id], fc, device_id, address, count,
+                                                 status, code, words))
+            else:
+                raise ValueError(f'corrupt Modbus trace {path}: unknown record tag {tag!r} at offset {pos - 1}')
+
+        return trace
+
+
+@dataclass
+class ReplayStats:
+    requests: int = 0  # requests served from the trace
+    misses: int = 0    # requests for which the trace holds no recorded request (eg. a register that was never read)
+    writes: int = 0
+    latency_s: float = 0.0  # total replayed latency
+    missed: dict[str, int] = field(default_factory=dict)  # number of misses per request that was never recorded
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'requests': self.requests,
+            'misses': self.misses,
+            'writes': self.writes,
+            'latency_s': round(self.latency_s, 3),
+            'missed': self.missed,
+        }
+
+
+class ModbusReplay:
+    '''
+    Serves a trace to ReplayClients. A request is answered with the recorded response to the same request (endpoint,
+    function code, device id, address and count) that was closest in time to the current time of the clock, after its
+    recorded latency. This keeps the replayed values aligned with time when the controller polls at a different rate
+    or phase than the recorded one. Requests the trace has no record of are answered with an illegal address exception.
+    '''
+
+    def __init__(self, trace: ModbusTrace, clock: Optional[Clock] = None) -> None:
+        self.trace = trace
+        self.clock = clock if clock is not None else Clock()
+        self.stats = ReplayStats()
+
+        self._index: dict[tuple[str, int, int, int, int], tuple[list[float], list[TraceRecord]]] = {}
+        for r in trace.records:
+            ts, records = self._index.setdefault((r.endpoint, r.fc, r.device_id, r.address, r.count), ([], []))
+            ts.append(r.ts)
+            records.append(r)
+
+    def client(self, host: str, port: int) -> 'ReplayClient':
+        return ReplayClient(self, f'{host}:{port}')
+
+    async def serve(self, endpoint: str, fc: int, device_id: int, address: int, count: int) -> Optional[TraceRecord]:
+        key = (endpoint, fc, device_id, address, count)
+        if fc == FC_WRITE_MULTIPLE:
+            self.stats.writes += 1
+
+        recorded = self._index.get(key)
+        if recorded is None:
+            self.stats.misses += 1
+            name = f'{endpoint} fc{fc} device {device_id} register {address} (count: {count})'
+            self.stats.missed[name] = self.stats.missed.get(name, 0) + 1
+            return None
+
+        ts, records = recorded
+        now = self.clock.time()
+        i = bisect_right(ts, now)
+        if i == len(ts) or (i > 0 and now - ts[i - 1] <= ts[i] - now):
+            i -= 1
+        record = records[i]
+        self.stats.requests += 1
+        self.stats.latency_s += record.latency
+        await self.clock.sleep(record.latency)
+        return record
+
+
+class ReplayClient:
+    '''Stand-in for the pymodbus client of one endpoint, answering the requests of the ModbusManager from a replay'''
+
+    def __init__(self, replay: ModbusReplay, endpoint: str) -> None:
+        self.replay = replay
+        self.endpoint = endpoint
+        self.connected = False
+
+    async def connect(self) -> bool:
+        self.connected = True
+        return True
+
+    def close(self) -> None:
+        self.connected = False
+
+    async def read_holding_registers(self, address: int, count: int = 1, device_id: int = 1):
+        return await self._read(FC_READ_HOLDING, ReadHoldingRegistersResponse, address, count, device_id)
+
+    async def read_input_registers(self, address: int, count: int = 1, device_id: int = 1):
+        return await self._read(FC_READ_INPUT, ReadInputRegistersResponse, address, count, device_id)
+
+    async def write_registers(self, address: int, values: list[int], device_id: int = 1,
+                              no_response_expected: bool = False):
+        record = await self.replay.serve(self.endpoint, FC_WRITE_MULTIPLE, device_id, address, len(values))
+        response = self._check(record, FC_WRITE_MULTIPLE, device_id)
+        if response is not None:
+            return response
+        return None if no_response_expected else WriteMultipleRegistersResponse(dev_id=device_id, address=address,
+                                                                                count=len(values))
+
+    async def _read(self, fc: int, response_type: type, address: int, count: int, device_id: int):
+        record = await self.replay.serve(self.endpoint, fc, device_id, address, count)
+        if record is None:
+            return ExceptionResponse(fc, ILLEGAL_ADDRESS, device_id=device_id)
+        response = self._check(record, fc, device_id)
+        if response is not None:
+            return response
+        return response_type(dev_id=device_id, address=address, count=count, registers=list(record.words))
+
+    def _check(self, record: Optional[TraceRecord], fc: int, device_id: int) -> Optional[ExceptionResponse]:
+        '''Replay the failure of a recorded request: raise its transport error or return its exception response'''
+        if record is None or record.status == STATUS_OK:
+            return None
+        if record.status == STATUS_ERROR:
+            raise ModbusIOException(f'replayed failure of request to {self.endpoint} recorded at {record.ts:.3f}')
+        return ExceptionResponse(fc, record.exception_code, device_id=device_id)
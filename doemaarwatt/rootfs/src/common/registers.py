@@ -0,0 +1,224 @@
+# REGISTERS.PY
+#
+# Declarative Modbus register maps. A device driver declares its registers once (address, data type, SMA format)
+# and the map is compiled at startup into read blocks, each with a precompiled struct.Struct decoder that turns the
+# raw words of a block into typed values in a single unpack.
+#
+import struct
+from dataclasses import dataclass
+from typing import Any, Optional, Sequence
+
+from .exceptions import ProgrammingError
+
+
+# Modbus limits a single read request to 125 registers (words)
+MAX_READ_COUNT = 125
+
+# Addresses separated by at most this many unused words are still fetched in a single read request: reading a few
+# extra words is far cheaper than another round trip to the device. SMA devices refuse a read that spans an address
+# they do not support, so only small gaps are bridged, and maps declare the gaps known to be unsupported
+READ_BLOCK_MAX_GAP = 8
+
+# For each data type, SMA Modbus defines specific NaN values. Taken from 'SMAModbus-ennexOS-TI-en-13.pdf'
+NAN_VALUES = {
+    'S16': -32768,
+    'S32': -2147483648,
+    'STR32': 0,
+    'U16': 65535,
+    'U32': 4294967295,
+    'U32-status': 16777213,
+    'U64': 18446744073709551615,
+}
+
+# Big-endian struct format character and word count for each data type
+_DTYPES = {
+    'U16': ('H', 1),
+    'S16': ('h', 1),
+    'U32': ('I', 2),
+    'U32-STATUS': ('I', 2),
+    'S32': ('i', 2),
+    'U64': ('Q', 4),
+    'S64': ('q', 4),
+}
+
+# Divisor for each SMA fixed-point format (FIX0 values are kept as integers)
+_FORMAT_DIVISORS = {
+    'FIX0': None,
+    'FIX1': 1e1,
+    'FIX2': 1e2,
+    'FIX3': 1e3,
+    'TEMP': 1e1,
+}
+
+
+def dtype_word_count(dtype: str) -> int:
+    try:
+        return _DTYPES[dtype.upper()][1]
+    except KeyError:
+        raise ProgrammingError(f'unrecognized Modbus datatype: {dtype}', source='modbus')
+
+
+@dataclass(frozen=True)
+class Register:
+    address: int
+    dtype: str
+    sma_format: str | dict[int, str] | None = None
+
+
+@dataclass(frozen=True)
+class _Field:
+    name: str
+    nan: Optional[int]
+    divisor: Optional[float]
+    taglist: Optional[dict[int, str]]
+    decoder: struct.Struct  # decodes the words of this field on its own
+
+
+@dataclass(frozen=True)
+class RegisterBlock:
+    address: int
+    count: int
+    fields: tuple[_Field, ...]
+    words: struct.Struct    # packs the raw words of the block into bytes
+    decoder: struct.Struct  # unpacks those bytes into the raw value of every field, skipping unused words
+
+
+class RegisterMap:
+    '''
+    A compiled register map. Registers are coalesced into the fewest read blocks: registers are only merged within
+    the same register table (input registers 3x, holding registers 4x), when the gap between them is at most max_gap
+    words, does not overlap an unsupported address range (start inclusive, end exclusive) and the resulting block
+    does not exceed MAX_READ_COUNT words.
+    '''
+
+    def __init__(self,
+        registers: dict[str, Register | tuple],
+        max_gap: int = READ_BLOCK_MAX_GAP,
+        unsupported: Sequence[tuple[int, int]] = (),
+    ) -> None:
+        self.registers = {name: r if isinstance(r, Register) else Register(*r) for name, r in registers.items()}
+        self.unsupported = list(unsupported)
+        self._fields = {name: self._compile_field(name, r) for name, r in self.registers.items()}
+        self.blocks = [self._compile_block(names) for names in self._plan(max_gap)]
+        self._splits: dict[tuple[int, int], list[RegisterBlock]] = {}  # (block address, count) -> its parts
+
+    def __len__(self) -> int:
+        return len(self.registers)
+
+    def decode(self, block: RegisterBlock, words: list[int]) -> dict[str, Any]:
+        '''Decode the raw words read for a block into a {field name: value} record'''
+        raw = block.decoder.unpack(block.words.pack(*words))
+        return {field.name: self._convert(field, value) for field, value in zip(block.fields, raw)}
+
+    def decode_field(self, name: str, words: list[int]) -> Any:
+        '''Decode the raw words of a single field'''
+        field = self._fields[name]
+        return self._convert(field, field.decoder.unpack(struct.pack(f'>{len(words)}H', *words))[0])
+
+    def encode_field(self, name: str, value: Any) -> list[int]:
+        '''Encode a value of a single field into its raw words (the inverse of decode_field; None encodes as NaN)'''
+        field = self._fields[name]
+        if value is None:
+            raw = field.nan
+            if raw is None:
+                raise ProgrammingError(f'register {name} has no NaN value', source='modbus')
+        elif field.taglist is not None:
+            raw = next((k for k, v in field.taglist.items() if v == value), None)
+            if raw is None:
+                raise ProgrammingError(f'no taglist mapping for value {value} of register {name}', source='modbus')
+        elif field.divisor is not None:
+            raw = round(value * field.divisor)
+        else:
+            raw = round(value)
+        data = field.decoder.pack(raw)
+        return list(struct.unpack(f'>{len(data) // 2}H', data))
+
+    def split(self, block: RegisterBlock) -> list[RegisterBlock]:
+        '''The parts to read a block in when the device refused to read it as a whole: its runs of adjacent registers,
+        or its registers one by one when they are all adjacent'''
+        parts = self._splits.get((block.address, block.count))
+        if parts is None:
+            names = [field.name for field in block.fields]
+            runs = self._plan(0, names)
+            if len(runs) == 1:  # all adjacent
+                runs = [[name] for name in names]
+            parts = self._splits[(block.address, block.count)] = [self._compile_block(run) for run in runs]
+        return parts
+
+    def _plan(self, max_gap: int, names: Optional[list[str]] = None) -> list[list[str]]:
+        blocks: list[list[str]] = []
+        start, end = -1, -1
+        registers = self.registers if names is None else {name: self.registers[name] for name in names}
+        for name, r in sorted(registers.items(), key=lambda item: item[1].address):
+            field_end = r.address + dtype_word_count(r.dtype)
+            if (blocks and str(r.address)[0] == str(start)[0] and r.address - end <= max_gap
+                    and field_end - start <= MAX_READ_COUNT and not self._is_unsupported(end, r.address)):
+                if r.address < end:
+                    raise ProgrammingError(f'register {name} ({r.address}) overlaps another register', source='modbus')
+                end = field_end
+                blocks[-1].append(name)
+            else:
+                start, end = r.address, field_end
+                blocks.append([name])
+        return blocks
+
+    def _is_unsupported(self, start: int, end: int) -> bool:
+        '''True when the gap [start, end) overlaps an unsupported address range'''
+        return any(a < end and start < b for a, b in self.unsupported)
+
+    def _compile_block(self, names: list[str]) -> RegisterBlock:
+        start = self.registers[names[0]].address
+        layout = '>'
+        cursor = start
+        for name in names:
+            r = self.registers[name]
+            code, count = _DTYPES[r.dtype.upper()]
+            if r.address > cursor:
+                layout += f'{2 * (r.address - cursor)}x'  # skip unused words
+            layout += code
+            cursor = r.address + count
+
+        count = cursor - start
+        return RegisterBlock(
+            address=start,
+            count=count,
+            fields=tuple(self._fields[name] for name in names),
+            words=struct.Struct(f'>{count}H'),
+            decoder=struct.Struct(layout),
+        )
+
+    @staticmethod
+    def _compile_field(name: str, r: Register) -> _Field:
+        dtype = r.dtype.upper()
+        if dtype not in _DTYPES:
+            raise ProgrammingError(f'unrecognized Modbus datatype for register {name}: {r.dtype}', source='modbus')
+
+        divisor, taglist = None, None
+        if isinstance(r.sma_format, dict):  # assuming data format is a tag list mapping
+            taglist = r.sma_format
+        elif r.sma_format is not None:
+            try:
+                divisor = _FORMAT_DIVISORS[r.sma_format.upper()]
+            except KeyError:
+                raise ProgrammingError(f'unrecognized SMA format for register {name}: {r.sma_format}', source='modbus')
+
+        return _Field(
+            name=name,
+            nan={k.upper(): v for k, v in NAN_VALUES.items()}.get(dtype),
+            divisor=divisor,
+            taglist=taglist,
+            decoder=struct.Struct('>' + _DTYPES[dtype][0]),
+        )
+
+    @staticmethod
+    def _convert(field: _Field, value: int) -> Any:
+        if value == field.nan:
+            return None  # we use None as NaN
+        if field.divisor is not None:
+            return value / field.divisor
+        if field.taglist is not None:
+            try:
+                return field.taglist[value]
+            except KeyError:
+                raise ProgrammingError(f'no taglist mapping for value {value} of register {field.name}', source='modbus')
+        return value
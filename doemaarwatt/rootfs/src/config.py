@@ -116,15 +116,26 @@ MODE_DYNAMIC_CONFIG = {
     'efficiency': float,
     'api_token': str,
 }
+# config fields holding credentials, at any level of the config: blanked in every copy of the config that leaves the
+# add-on (see DoeMaarWattConfig.redacted_dyn_config)
+SECRET_KEYS = {'supervisor_token', 'api_token', 'token', 'password', 'secret'}
 
 
 class DoeMaarWattConfig:
-    def __init__(self, logger: Logger):
+    def __init__(self, logger: Logger, dyn_config: Optional[dict[str, Any]] = None):
+        '''Load the dynamic config from DYN_CONFIG_PATH, or use the given dyn_config dict, which is kept in memory
+        only (never saved) - e.g. for simulations and backtests.
+        '''
         self.log = logger
         self.on_general_config_change: Optional[Callable[[], None]] = None  # called when set_general_config() saves
+        self._in_memory = dyn_config is not None
 
         # read dynamic config (stored at /data/dyn_config.json)
         self._dyn_config = DYN_CONFIG_DEFAULT  # dynamic addon configuration
+        if dyn_config is not None:
+            self._dyn_config = dyn_config
+            self.log.set_timezone(self.timezone)
+            return
         if DYN_CONFIG_PATH.exists():  # check for save dynamic config from an earlier session
             with DYN_CONFIG_PATH.open() as f:
                 self._dyn_config = json.load(f)
@@ -155,6 +166,8 @@ class DoeMaarWattConfig:
         self.log.debug(f'DoeMaarWatt backend server: config stored in {DYN_CONFIG_PATH}')
 
     def save_dyn_config(self):
+        if self._in_memory:
+            return
         with DYN_CONFIG_PATH.open(mode='w') as f:
             json.dump(self._dyn_config, f)
 
@@ -216,6 +229,17 @@ class DoeMaarWattConfig:
     def get_mode_dynamic_config(self) -> dict[str, Any]:
         return self._dyn_config['mode_dynamic']
 
+    def redacted_dyn_config(self) -> dict[str, Any]:
+        '''A copy of the dynamic config with the value of every SECRET_KEYS field blanked, eg. to store it along with
+        a Modbus trace'''
+        def redact(value: Any) -> Any:
+            if isinstance(value, dict):
+                return {k: '' if k in SECRET_KEYS else redact(v) for k, v in value.items()}
+            if isinstance(value, list):
+                return [redact(v) for v in value]
+            return value
+        return redact(self._dyn_config)
+
     def get_inverter_phase_map(self) -> dict[str, Phase]:
         '''
         Return a dict that maps the enabled inverters (by name) to their connected
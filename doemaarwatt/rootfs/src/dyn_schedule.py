@@ -1,15 +1,22 @@
 from datetime import datetime as dt, timedelta, timezone
 from zoneinfo import ZoneInfo
+from dataclasses import dataclass
+from typing import Optional
 import math
 import json
 
 import numpy as np
-from scipy.optimize import milp, LinearConstraint, Bounds
 from prettytable import PrettyTable
 
 from config import DoeMaarWattConfig
-from common import Phase, DMWException
+from common import Phase, DMWException, Clock
 from price import PriceManager
+from schedule_solver import ScheduleProblem, ScheduleSolution, ScheduleSolverService, solve_schedule_problem
+
+
+# Maximum deviation (Wh) of a battery's measured charge from its planned charge before replan() re-optimises the
+# schedule instead of keeping it
+REPLAN_TOLERANCE_WH = 250.0
 
 
 class SchedulerException(DMWException):
@@ -23,16 +30,25 @@ class DynamicScheduler:
     def __init__(self,
         cfg: DoeMaarWattConfig,
         pm: PriceManager,
+        solver: Optional[ScheduleSolverService] = None,
+        clock: Optional[Clock] = None,
     ) -> None:
         self.cfg = cfg
+        self.clock = clock if clock is not None else Clock()
         self.resolution = timedelta(minutes=int(self.cfg.get_mode_dynamic_config()['resolution']))
         self.efficiency = float(self.cfg.get_mode_dynamic_config()['efficiency'])
         self.pm: PriceManager = pm
+        # optional process-pool service to solve the MILP off the event loop; solved in-process when absent
+        self.solver = solver
 
         # The schedule is a sorted list of SchedulePeriods
         self.schedule: list[SchedulePeriod] = []
         self.tz = ZoneInfo(self.cfg.timezone)
-        self.schedule_ts: dt = dt.now(tz=self.tz)
+        self.schedule_ts: dt = self.clock.now(self.tz)
+
+        # charge/discharge pattern (z[t] of the MILP) of the current schedule, one entry per SchedulePeriod. Kept so
+        # that replan() can re-use it as the starting point of an incremental re-plan.
+        self._z: np.ndarray = np.zeros(0)
 
     def schedule_available_for(self, t: dt) -> bool:
         '''Return True if the current schedule covers the given timestamp t.'''
@@ -40,7 +56,26 @@ class DynamicScheduler:
             return False
         return self.schedule[0].start_ts <= t < self.schedule[-1].end_ts
 
-    def create_schedule(self,
+    def _get_price_window(self, start_ts: dt, end_ts: dt) -> list[tuple[dt, dt, float]]:
+        '''Return the price intervals covering [start_ts, end_ts], with start_ts normalised down to the nearest
+        resolution boundary and end_ts normalised up.'''
+        sched_start = dt.fromtimestamp(int(start_ts.timestamp()) // self.resolution.seconds * self.resolution.seconds, start_ts.tzinfo)
+        sched_end = dt.fromtimestamp(math.ceil(end_ts.timestamp() / self.resolution.seconds) * self.resolution.seconds, end_ts.tzinfo)
+        N = round((sched_end - sched_start) / self.resolution)  # number of time slots
+
+        if N == 0:
+            return []
+
+        # Fetch price data covering the schedule window
+        price_range = self.pm.get_price_range(sched_start)[:N]
+        if len(price_range) < N:
+            raise SchedulerException(
+                f'DynamicScheduler: insufficient price data to cover schedule window '
+                f'[{sched_start}, {sched_end}] ({len(price_range)} of {N} slots available)'
+            , source='DynamicScheduler', requires_fallback=True)
+        return price_range
+
+    async def create_schedule(self,
         start_ts: dt,
         end_ts: dt,
         current_charge: dict[str, float],
@@ -53,25 +88,90 @@ class DynamicScheduler:
 
         start_ts is normalised down to the nearest resolution boundary; end_ts is
         normalised up. current_charge maps each inverter name to its current stored
-        energy in Wh.
+        energy in Wh, measured at start_ts (which may lie within the first slot).
         '''
-        sched_start = dt.fromtimestamp(int(start_ts.timestamp()) // self.resolution.seconds * self.resolution.seconds, start_ts.tzinfo)
-        sched_end = dt.fromtimestamp(math.ceil(end_ts.timestamp() / self.resolution.seconds) * self.resolution.seconds, end_ts.tzinfo)
-
-        h = self.resolution.total_seconds() / 3600  # slot duration in hours
-        N = round((sched_end - sched_start) / self.resolution)  # number of time slots
-
-        if N == 0:
+        price_range = self._get_price_window(start_ts, end_ts)
+        if not price_range:
             self.schedule = []
+            self._z = np.zeros(0)
             return
 
-        # Fetch price data covering the schedule window
-        price_range = self.pm.get_price_range(sched_start)[:N]
-        if len(price_range) < N:
-            raise SchedulerException(
-                f'DynamicScheduler: insufficient price data to cover schedule window '
-                f'[{sched_start}, {sched_end}] ({len(price_range)} of {N} slots available)'
-            , source='DynamicScheduler', requires_fallback=True)
+        await self._solve(price_range, current_charge, elapsed=self._elapsed_fraction(start_ts, price_range))
+        self.schedule_ts = self.clock.now(self.tz)
+
+    async def replan(self,
+        start_ts: dt,
+        end_ts: dt,
+        current_charge: dict[str, float],
+        tolerance_wh: float = REPLAN_TOLERANCE_WH,
+    ) -> str:
+        '''Incrementally bring the current schedule in line with the given window and the battery charges measured
+        at start_ts, avoiding a full MILP solve where possible. Returns the path that was taken:
+
+        'kept':    the window is a (shifted) suffix of the current schedule and every battery is within tolerance_wh
+                   of its planned charge at start_ts (interpolated within its slot): the past slots are dropped and the
+                   remaining plan is kept as is.
+        'relaxed': the charges drifted beyond the tolerance: the previous charge/discharge pattern z[t] is fixed,
+                   which turns the MILP into a plain LP that only re-distributes the (dis)charge amounts.
+        'solved':  there is no usable previous solution (new prices, different inverters, or the relaxed LP is
+                   infeasible for the fixed pattern): a full MILP solve is performed via create_schedule().
+        '''
+        price_range = self._get_price_window(start_ts, end_ts)
+
+        k = self._schedule_offset(price_range)
+        if k is None or set(current_charge) != set(self.schedule[0].end_charge):
+            await self.create_schedule(start_ts, end_ts, current_charge)
+            return 'solved'
+
+        # planned charge at start_ts: a slot is planned at a constant power, so it is interpolated within the slot
+        elapsed = self._elapsed_fraction(start_ts, price_range)
+        sp = self.schedule[k]
+        planned = {inv: c + elapsed * (sp.end_charge[inv] - c) for inv, c in sp.start_charge.items()}
+        drift = max((abs(current_charge[inv] - planned[inv]) for inv in planned), default=0.0)
+        if drift <= tolerance_wh:
+            self.schedule = self.schedule[k:]
+            self._z = self._z[k:]
+            return 'kept'
+
+        try:
+            await self._solve(price_range, current_charge, fixed_z=self._z[k:], elapsed=elapsed)
+            return 'relaxed'
+        except SchedulerException:
+            pass  # the previous pattern cannot accommodate the measured charges
+
+        await self.create_schedule(start_ts, end_ts, current_charge)
+        return 'solved'
+
+    def _elapsed_fraction(self, start_ts: dt, price_range: list[tuple[dt, dt, float]]) -> float:
+        '''The part of the first slot of price_range that has passed at start_ts'''
+        slot_start, slot_end, _ = price_range[0]
+        return min(max((start_ts - slot_start) / (slot_end - slot_start), 0.0), 1.0)
+
+    def _schedule_offset(self, price_range: list[tuple[dt, dt, float]]) -> Optional[int]:
+        '''Return the index k such that the given price window equals schedule[k:] (same slots, same prices), or
+        None if the window is not such a suffix of the current schedule.'''
+        if not price_range or not self.schedule or len(self._z) != len(self.schedule):
+            return None
+
+        k = round((price_range[0][0] - self.schedule[0].start_ts) / self.resolution)
+        if k < 0 or len(self.schedule) - k != len(price_range):
+            return None
+        for sp, (iv_start, iv_end, price) in zip(self.schedule[k:], price_range):
+            if sp.start_ts != iv_start or sp.end_ts != iv_end or sp.price != price:
+                return None
+        return k
+
+    async def _solve(self,
+        price_range: list[tuple[dt, dt, float]],
+        current_charge: dict[str, float],
+        fixed_z: Optional[np.ndarray] = None,
+        elapsed: float = 0.0,
+    ) -> None:
+        '''Solve the schedule for the given price intervals and install it as the current schedule. If fixed_z is
+        given the charge/discharge pattern is fixed to it and only the remaining LP is solved. elapsed is the part of
+        the first slot that has passed when current_charge was measured.'''
+        h = self.resolution.total_seconds() / 3600  # slot duration in hours
+        N = len(price_range)
         prices = [pr[2] for pr in price_range]
 
         # Inverter parameters (only enabled inverters)
@@ -87,125 +187,30 @@ class DynamicScheduler:
             self.schedule = []
             for iv_start, iv_end, price in price_range:
                 self.schedule.append(SchedulePeriod(iv_start, iv_end, price, self.efficiency))
+            self._z = np.zeros(N)
             return
 
-        # ------------------------------------------------------------------
-        # MILP variable layout
-        # x[i*N + t]         = e[i][t] = energy in battery i at END of slot t  (continuous)
-        # x[M*N + i*N + t]   = c[i][t] = energy charged INTO battery i in t    (continuous)
-        # x[2*M*N + i*N + t] = d[i][t] = energy discharged FROM battery i in t (continuous)
-        # x[3*M*N + t]        = z[t]   = 1 if charging allowed in slot t        (binary)
-        #
-        # Efficiency mu is applied asymmetrically:
-        #   Charging:    drawing c/mu Wh from grid stores c Wh in battery
-        #   Discharging: releasing d Wh from battery delivers d*mu Wh to grid
-        #
-        # Mutual-exclusion constraint (no inverter charges while another discharges):
-        #   c[i][t] <= charge_limit[i] * h * z[t]          (z=1 → charging allowed)
-        #   d[i][t] <= discharge_limit[i] * h * (1 - z[t]) (z=0 → discharging allowed)
-        # ------------------------------------------------------------------
-        n_vars = M * N * 3 + N
-
-        def e_idx(i, t): return i * N + t
-        def c_idx(i, t): return M * N + i * N + t
-        def d_idx(i, t): return 2 * M * N + i * N + t
-        def z_idx(t):    return 3 * M * N + t
-
-        mu = self.efficiency
-
-        # --- Objective: minimise total grid energy cost (z variables have zero cost) ---
-        # Charging c[i][t] Wh (battery side) draws c/mu from the grid at price[t]
-        # Discharging d[i][t] Wh (battery side) delivers d*mu to the grid at price[t]
-        obj = np.zeros(n_vars)
-        for i in range(M):
-            for t in range(N):
-                obj[c_idx(i, t)] =  prices[t] / (mu * 1000.0)
-                obj[d_idx(i, t)] = -prices[t] * mu / 1000.0
-
-        # --- Bounds ---
-        # Keep each battery's planned energy within its configured state-of-charge window (issue #7),
-        # so the schedule never plans to charge above the max or discharge below the min.
-        e_min = {inv: inv_capacities[inv] * inv_charge_min_pct[inv] / 100.0 for inv in inverters}
-        e_max = {inv: inv_capacities[inv] * inv_charge_max_pct[inv] / 100.0 for inv in inverters}
-        lb = np.zeros(n_vars)
-        ub = np.full(n_vars, np.inf)
-        for i, inv in enumerate(inverters):
-            # If the battery currently sits outside its window (e.g. still full on first run), widen the
-            # bound to include the starting charge so the LP stays feasible; the optimiser then moves it
-            # back into range as prices allow instead of failing the whole schedule.
-            e0 = current_charge[inv]
-            e_lo = min(e_min[inv], e0)
-            e_hi = max(e_max[inv], e0)
-            for t in range(N):
-                lb[e_idx(i, t)] = e_lo
-                ub[e_idx(i, t)] = e_hi
-                ub[c_idx(i, t)] = inv_charge_limits[inv] * h
-                ub[d_idx(i, t)] = inv_discharge_limits[inv] * h
-        for t in range(N):
-            ub[z_idx(t)] = 1.0  # binary: [0, 1]
-
-        # --- Integrality: z[t] are binary (integer within [0, 1]) ---
-        integrality = np.zeros(n_vars)
-        for t in range(N):
-            integrality[z_idx(t)] = 1
-
-        # --- Equality constraints: battery energy balance per slot ---
-        # e[i][t] - e[i][t-1] - c[i][t] + d[i][t] = 0  (t > 0)
-        # e[i][0]              - c[i][0]  + d[i][0] = e0 (t = 0)
-        n_eq = M * N
-        A_eq = np.zeros((n_eq, n_vars))
-        b_eq = np.zeros(n_eq)
-
-        row = 0
-        for i, inv in enumerate(inverters):
-            e0 = current_charge[inv]  # might raise KeyError if no initial charge is provided for inverter inv
-            for t in range(N):
-                A_eq[row, e_idx(i, t)] =  1.0
-                A_eq[row, c_idx(i, t)] = -1.0
-                A_eq[row, d_idx(i, t)] =  1.0
-                if t == 0:
-                    b_eq[row] = e0
-                else:
-                    A_eq[row, e_idx(i, t - 1)] = -1.0
-                    b_eq[row] = 0.0
-                row += 1
-
-        # --- Inequality constraints: mutual exclusion of charge/discharge per slot ---
-        # c[i][t] <= charge_limit[i]*h * z[t]
-        # d[i][t] <= discharge_limit[i]*h * (1 - z[t])  →  d[i][t] + discharge_limit[i]*h * z[t] <= discharge_limit[i]*h
-        n_ineq = 2 * M * N
-        A_ineq = np.zeros((n_ineq, n_vars))
-        b_ineq = np.zeros(n_ineq)
-
-        row = 0
-        for i, inv in enumerate(inverters):
-            for t in range(N):
-                A_ineq[row, c_idx(i, t)] =  1.0
-                A_ineq[row, z_idx(t)]    = -inv_charge_limits[inv] * h
-                b_ineq[row] = 0.0
-                row += 1
-        for i, inv in enumerate(inverters):
-            for t in range(N):
-                A_ineq[row, d_idx(i, t)] = 1.0
-                A_ineq[row, z_idx(t)]    = inv_discharge_limits[inv] * h
-                b_ineq[row] = inv_discharge_limits[inv] * h
-                row += 1
-
-        # --- Solve ---
-        result = milp(
-            c=obj,
-            constraints=[
-                LinearConstraint(A_eq,   b_eq,                      b_eq),    # type: ignore[arg-type]
-                LinearConstraint(A_ineq, -np.inf * np.ones(n_ineq), b_ineq),  # type: ignore[arg-type]
-            ],
-            integrality=integrality,
-            bounds=Bounds(lb, ub),  # type: ignore[arg-type]
-        )
-        if not result.success:
-            raise SchedulerException(f'MILP solve failed: {result.message}',
+        e0 = np.array([current_charge[inv] for inv in inverters], dtype=float)  # KeyError if no initial charge is provided
+        capacities = np.array([inv_capacities[inv] for inv in inverters], dtype=float)
+        # Keep each battery's planned energy within its configured state-of-charge window (issue #7), so the schedule
+        # never plans to charge above the max or discharge below the min. If the battery currently sits outside its
+        # window (e.g. still full on first run), widen the bound to include the starting charge so the LP stays
+        # feasible; the optimiser then moves it back into range as prices allow instead of failing the whole schedule.
+        e_lo = np.minimum(capacities * np.array([inv_charge_min_pct[inv] for inv in inverters], dtype=float) / 100.0, e0)
+        e_hi = np.maximum(capacities * np.array([inv_charge_max_pct[inv] for inv in inverters], dtype=float) / 100.0, e0)
+        charge_max_wh = np.array([inv_charge_limits[inv] for inv in inverters], dtype=float) * h
+        discharge_max_wh = np.array([inv_discharge_limits[inv] for inv in inverters], dtype=float) * h
+
+        problem = ScheduleProblem(np.array(prices, dtype=float), e0, e_lo, e_hi, charge_max_wh, discharge_max_wh,
+                                  self.efficiency, fixed_z=fixed_z, first_slot_fraction=1.0 - elapsed)
+        solution = await self._run_solver(problem)
+        if not solution.success:
+            raise SchedulerException(f'MILP solve failed: {solution.message}',
                                      source='DynamicScheduler', requires_fallback=True)
 
-        x = result.x
+        energy = solution.energy  # e[i][t] = energy in battery i at END of slot t
+        assert energy is not None and solution.z is not None
+        self._z = solution.z
 
         # --- Build SchedulePeriod list ---
         self.schedule = []
@@ -214,12 +219,25 @@ class DynamicScheduler:
             sp.start_charge = {}
             sp.end_charge = {}
             for i, inv in enumerate(inverters):
-                e0 = current_charge[inv]
-                sp.start_charge[inv] = x[e_idx(i, t - 1)] if t > 0 else e0
-                sp.end_charge[inv]   = x[e_idx(i, t)]
+                sp.end_charge[inv] = float(energy[i, t])
+                if t > 0:
+                    sp.start_charge[inv] = float(energy[i, t - 1])
+                else:
+                    # the measured charge is where the first slot stands after elapsed: its start charge is the one
+                    # from which the (constant) slot power reaches the planned end charge in the rest of the slot
+                    sp.start_charge[inv] = sp.end_charge[inv] - (sp.end_charge[inv] - current_charge[inv]) / (1.0 - elapsed)
             self.schedule.append(sp)
 
-        self.schedule_ts = dt.now(tz=self.tz)
+    async def _run_solver(self, problem: ScheduleProblem) -> ScheduleSolution:
+        if self.solver is None:
+            return solve_schedule_problem(problem)
+
+        try:
+            return await self.solver.solve(problem)
+        except TimeoutError:
+            raise SchedulerException(f'MILP solve exceeded the {self.solver.timeout:.0f}s timeout', source='DynamicScheduler')
+        except Exception as e:
+            raise SchedulerException(f'MILP solver process failed: {type(e).__name__}: {e}', source='DynamicScheduler')
 
     def get_PBapp_inverters(self, ts: dt) -> dict[str, float]:
         '''Asserting that a schedule has been created, get the PBapp values for each inverter for the given time ts
@@ -369,7 +387,7 @@ if __name__ == '__main__':
         scheduler = DynamicScheduler(cfg, pm)
 
         print(f'\nSolving LP ...')
-        scheduler.create_schedule(start_ts, end_ts, current_charge)
+        await scheduler.create_schedule(start_ts, end_ts, current_charge)
         print(f'Schedule created: {len(scheduler.schedule)} periods')
 
         print(scheduler.schedule_to_string())
@@ -0,0 +1,196 @@
+# HISTORY.PY
+#
+# Durable, append-only history of measurements (the 1-minute and 15-minute telemetry rollups), commanded setpoints,
+# planned schedules and fetched prices, kept in a local SQLite database in WAL mode.
+#
+# Recording only enqueues rows: a background writer thread inserts them in batches, one transaction per flush, so
+# the control loop never waits on the (SD card) disk. Queries run on their own connection in a worker thread and
+# are served from time-indexed tables.
+#
+import asyncio
+import atexit
+import json
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from datetime import datetime as dt
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+from aiohttp import web
+
+from common import Logger, Singleton
+from telemetry import COLUMNS
+
+
+HISTORY_PATH = Path('/data/history.db')
+HISTORY_PATH = Path('history.db')
+
+QUEUE_SIZE = 10_000  # maximum number of rows waiting to be written; beyond that new rows are dropped
+BATCH_SIZE = 1_000  # maximum number of rows written in one transaction
+FLUSH_INTERVAL = 5.0  # seconds the writer collects rows before committing them: fewer, larger writes to the SD card
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS measurements (
+    res TEXT NOT NULL, ts REAL NOT NULL, data TEXT NOT NULL, PRIMARY KEY (res, ts)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS setpoints (ts REAL NOT NULL, inverter TEXT NOT NULL, power REAL NOT NULL, ack INTEGER NOT NULL);
+CREATE INDEX IF NOT EXISTS setpoints_ts ON setpoints (ts);
+CREATE TABLE IF NOT EXISTS schedules (
+    created_ts REAL NOT NULL, start_ts REAL NOT NULL, end_ts REAL NOT NULL, price REAL NOT NULL, plan TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS schedules_start_ts ON schedules (start_ts);
+CREATE TABLE IF NOT EXISTS prices (ts REAL PRIMARY KEY, price REAL NOT NULL, fetched_ts REAL NOT NULL);
+'''
+
+_INSERTS = {
+    'measurements': 'INSERT OR REPLACE INTO measurements (res, ts, data) VALUES (?, ?, ?)',
+    'setpoints': 'INSERT INTO setpoints (ts, inverter, power, ack) VALUES (?, ?, ?, ?)',
+    'schedules': 'INSERT INTO schedules (created_ts, start_ts, end_ts, price, plan) VALUES (?, ?, ?, ?, ?)',
+    'prices': 'INSERT OR REPLACE INTO prices (ts, price, fetched_ts) VALUES (?, ?, ?)',
+}
+
+# time-range query per table: (time column, columns returned)
+_QUERIES = {
+    'measurements': ('ts', ('ts', 'data')),
+    'setpoints': ('ts', ('ts', 'inverter', 'power', 'ack')),
+    'schedules': ('start_ts', ('created_ts', 'start_ts', 'end_ts', 'price', 'plan')),
+    'prices': ('ts', ('ts', 'price', 'fetched_ts')),
+}
+
+
+class HistoryStore(metaclass=Singleton):
+    def __init__(self, log: Logger, path: Path = HISTORY_PATH) -> None:
+        self.log = log
+        self.path = path
+
+        self._queue: queue.Queue = queue.Queue(maxsize=QUEUE_SIZE)
+        self._dropped = 0
+        with closing(sqlite3.connect(self.path)) as db:
+            db.execute('PRAGMA journal_mode=WAL')  # persistent: readers and the writer no longer block each other
+            db.executescript(_SCHEMA)
+
+        self._writer = threading.Thread(target=self._write_loop, name='history-writer', daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def record_measurements(self, res: str, ts: float, rollup: dict[str, np.ndarray]) -> None:
+        '''Record one telemetry rollup bucket (min/mean/max per column, see Telemetry.on_rollup)'''
+        data = {f: [None if np.isnan(v) else v for v in a.tolist()] for f, a in rollup.items()}
+        self._put('measurements', (res, ts, json.dumps(data)))
+
+    def record_setpoints(self, dispatch: dict[str, dict[str, Any]], ts: Optional[float] = None) -> None:
+        '''Record the dispatched power levels (see ControllerStats.dispatch)'''
+        ts = time.time() if ts is None else ts
+        for inv_name, d in dispatch.items():
+            self._put('setpoints', (ts, inv_name, d['power'], int(d['ack'])))
+
+    def record_schedule(self, schedule: list, ts: Optional[float] = None) -> None:
+        '''Record a newly planned schedule (list of SchedulePeriod)'''
+        ts = time.time() if ts is None else ts
+        for sp in schedule:
+            plan = {'PBapp_inverters': sp.PBapp_inverters, 'end_charge': sp.end_charge}
+            self._put('schedules', (ts, sp.start_ts.timestamp(), sp.end_ts.timestamp(), sp.price, json.dumps(plan)))
+
+    def record_prices(self, prices: dict[dt, float], ts: Optional[float] = None) -> None:
+        '''Record fetched prices (start of the price interval -> price in EUR/kWh)'''
+        ts = time.time() if ts is None else ts
+        for start, price in prices.items():
+            self._put('prices', (start.timestamp(), price, ts))
+
+    def _put(self, table: str, row: tuple) -> None:
+        try:
+            self._queue.put_nowait((table, row))
+        except queue.Full:
+            self._dropped += 1
+
+    async def query(self, table: str, frm: float, to: float, res: Optional[str] = None) -> dict[str, list]:
+        '''Return the rows of table with their time in [frm, to), oldest first, as columns of values'''
+        if table not in _QUERIES:
+            raise ValueError(f'unknown history table: {table} (expected {", ".join(_QUERIES)})')
+        return await asyncio.to_thread(self._query, table, frm, to, res)
+
+    def _query(self, table: str, frm: float, to: float, res: Optional[str]) -> dict[str, list]:
+        ts_column, columns = _QUERIES[table]
+        sql = f'SELECT {", ".join(columns)} FROM {table} WHERE {ts_column} >= ? AND {ts_column} < ?'
+        params: list[Any] = [frm, to]
+        if table == 'measurements':
+            sql += ' AND res = ?'
+            params.append(res or '15m')
+        sql += f' ORDER BY {ts_column}'
+
+        with closing(sqlite3.connect(self.path)) as db:
+            rows = db.execute(sql, params).fetchall()
+        result: dict[str, Any] = {c: [row[i] for row in rows] for i, c in enumerate(columns)}
+
+        if table == 'measurements':  # same columnar layout as Telemetry.query()
+            data = [json.loads(v) for v in result.pop('data')]
+            result['columns'] = {
+                c: {f: [d[f][i] for d in data] for f in ('min', 'mean', 'max')} for i, c in enumerate(COLUMNS)
+            }
+        elif table == 'schedules':
+            result['plan'] = [json.loads(v) for v in result['plan']]
+        return result
+
+    async def handle_history(self, req: web.Request) -> web.Response:
+        try:
+            to = float(req.query.get('to', time.time()))
+            frm = float(req.query.get('from', to - 24 * 3600))
+            return web.json_response(await self.query(req.match_info['table'], frm, to, req.query.get('res')))
+
+        except Exception as e:
+            raise web.HTTPBadRequest(text=json.dumps({'status': 'error', 'msg': str(e)}))
+
+    def flush(self, timeout: float = 10.0):
+        '''Wait (at most timeout seconds) until all queued rows have been written'''
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def close(self):
+        '''Write all queued rows and stop the writer thread'''
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join(timeout=10.0)
+
+    def _write_loop(self):
+        db = sqlite3.connect(self.path)
+        # with WAL, commits do not wait for an fsync: a power loss may lose the last batches, but never corrupts the file
+        db.execute('PRAGMA synchronous=NORMAL')
+        while True:
+            batch = []
+            deadline = time.monotonic() + FLUSH_INTERVAL
+            while len(batch) < BATCH_SIZE and (not batch or batch[-1] is not None):
+                try:
+                    batch.append(self._queue.get(timeout=max(0.0, deadline - time.monotonic())))
+                except queue.Empty:
+                    break
+
+            stop = None in batch
+            rows: dict[str, list[tuple]] = {}
+            for item in batch:
+                if item is not None:
+                    rows.setdefault(item[0], []).append(item[1])
+
+            try:
+                if rows:
+                    with db:  # one transaction per batch
+                        for table, table_rows in rows.items():
+                            db.executemany(_INSERTS[table], table_rows)
+            except Exception as e:
+                self.log.error(f'history: unable to write {sum(len(r) for r in rows.values())} rows: {e}')
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+            if self._dropped:
+                dropped, self._dropped = self._dropped, 0
+                self.log.error(f'history: dropped {dropped} row(s), writer could not keep up')
+
+            if stop:
+                db.close()
+                return
+
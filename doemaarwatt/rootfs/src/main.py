@@ -1,8 +1,10 @@
 import asyncio
-from server import DoeMaarWattServer
 
 
 async def main():
+    # imported here rather than at the top: the schedule solver's spawned worker process re-imports this module, and
+    # must not pull in the rest of the application (see schedule_solver.py)
+    from server import DoeMaarWattServer
     server = DoeMaarWattServer()
     await server.run()
 
@@ -43,8 +43,11 @@ class Mode1Controller(BaseController):
 
             # defensive re-assertion against state drift:
             self.log.info('idle: relinquish control for all inverters')
-            await asyncio.gather(*[inv.relinquish_control() for inv in self.battery_inverters])
-            await asyncio.gather(*[inv.relinquish_control() for inv in self.solar_inverters])
+            for inverters in (self.battery_inverters, self.solar_inverters):
+                results = await asyncio.gather(*[inv.relinquish_control() for inv in inverters], return_exceptions=True)
+                for inv, result in zip(inverters, results):
+                    if isinstance(result, BaseException):
+                        self._device_failed(inv, 'relinquishing control', result)
 
             await self.get_stats()
 
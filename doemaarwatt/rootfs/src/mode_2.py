@@ -1,9 +1,10 @@
 import asyncio
 import traceback
 from datetime import datetime as dt
+from typing import Optional
 
 from config import DoeMaarWattConfig, ControlMode
-from common import Logger, DMWException, PBSapp
+from common import Logger, DMWException, PBSapp, Clock
 from base_controller import BaseController
 
 
@@ -11,8 +12,9 @@ class Mode2Controller(BaseController):
     def __init__(self,
         cfg: DoeMaarWattConfig,
         log: Logger,
+        clock: Optional[Clock] = None,
     ) -> None:
-        super().__init__(cfg, log)
+        super().__init__(cfg, log, clock)
 
         self.bat_charge_amount = 0.0
         self.sol_charge_amount = 0.0
@@ -72,16 +74,7 @@ class Mode2Controller(BaseController):
                 self.stop()
 
             # an error or cancellation occurred: make sure to relinquish control:
-            results = await asyncio.gather(*[inv.relinquish_control() for inv in self.battery_inverters],
-                                           return_exceptions=True)
-            for inv, result in zip(self.battery_inverters, results):
-                if isinstance(result, Exception):
-                    self.log.error(f'error relinquishing control of {inv.name}: {result}')
-            results = await asyncio.gather(*[inv.relinquish_control() for inv in self.solar_inverters],
-                                           return_exceptions=True)
-            for inv, result in zip(self.solar_inverters, results):
-                if isinstance(result, Exception):
-                    self.log.error(f'error relinquishing control of {inv.name}: {result}')
+            await self._try_relinquish_control()
 
             self.close_subsystems()
 
@@ -91,11 +84,10 @@ class Mode2Controller(BaseController):
         # inner, control loop
         while self.running:
             self.log.debug('mode 2 control loop started')
-            await asyncio.gather(*[inv.enable_control() for inv in self.battery_inverters])
-            await asyncio.gather(*[inv.enable_control() for inv in self.solar_inverters])
+            await self.enable_control()
 
             # get necessary stats and determine PBsent for each phase
             await self.get_stats()
-            await self.command_PBSsent(dt.now(tz=self.tz))
+            await self.command_PBSsent(self.clock.now(self.tz))
 
             await self.loop_delay()
@@ -1,10 +1,10 @@
 import asyncio
 import traceback
-from typing import Any
+from typing import Any, Optional
 from datetime import time, datetime as dt
 
 from config import DoeMaarWattConfig, ControlMode
-from common import Logger, DMWException, PBSapp
+from common import Logger, DMWException, PBSapp, Clock
 from base_controller import BaseController
 
 
@@ -12,8 +12,9 @@ class Mode3Controller(BaseController):
     def __init__(self,
         cfg: DoeMaarWattConfig,
         log: Logger,
+        clock: Optional[Clock] = None,
     ) -> None:
-        super().__init__(cfg, log)
+        super().__init__(cfg, log, clock)
 
         self.schedule: list[dict[str, Any]] = []
 
@@ -72,18 +73,6 @@ class Mode3Controller(BaseController):
 
         return pbsapp
 
-    async def _try_relinquish_control(self):
-        results = await asyncio.gather(*[inv.relinquish_control() for inv in self.battery_inverters],
-                                           return_exceptions=True)
-        for inv, result in zip(self.battery_inverters, results):
-            if isinstance(result, Exception):
-                self.log.error(f'error relinquishing control of {inv.name}: {result}')
-        results = await asyncio.gather(*[inv.relinquish_control() for inv in self.solar_inverters],
-                                        return_exceptions=True)
-        for inv, result in zip(self.solar_inverters, results):
-            if isinstance(result, Exception):
-                self.log.error(f'error relinquishing control of {inv.name}: {result}')
-
     async def loop(self):
         self.log.info(f'Mode 3 (static schedule mode) started')
         while self.running:  # outer, reconnect loop:
@@ -112,11 +101,10 @@ class Mode3Controller(BaseController):
         # inner, control loop
         while self.running:
             self.log.debug(f'mode 3 control loop started')
-            await asyncio.gather(*[inv.enable_control() for inv in self.battery_inverters])
-            await asyncio.gather(*[inv.enable_control() for inv in self.solar_inverters])
+            await self.enable_control()
 
             # get necessary stats and determine PBsent for each phase
             await self.get_stats()
-            await self.command_PBSsent(dt.now(tz=self.tz))
+            await self.command_PBSsent(self.clock.now(self.tz))
 
             await self.loop_delay()
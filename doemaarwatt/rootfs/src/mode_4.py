@@ -1,16 +1,18 @@
 import asyncio
 import json
+import time
 import traceback
 from typing import Any, Optional, Union
 from datetime import datetime as dt, timedelta
 
-from aiohttp import web
 
 from config import DoeMaarWattConfig, ControlMode
-from common import Logger, DMWException, PBSapp
+from common import Logger, LogLevel, DMWException, PBSapp, Clock
 from base_controller import BaseController
 from price import PriceManager
 from dyn_schedule import DynamicScheduler, SchedulePeriodEncoder
+from schedule_solver import ScheduleSolverService
+from history import HistoryStore
 
 
 # Price (€/kWh) at or below which solar is fully curtailed: exporting at a negative price costs money,
@@ -22,15 +24,26 @@ class Mode4Controller(BaseController):
     def __init__(self,
         cfg: DoeMaarWattConfig,
         log: Logger,
+        clock: Optional[Clock] = None,
     ) -> None:
-        super().__init__(cfg, log)
+        super().__init__(cfg, log, clock)
 
         self.price_task: Optional[asyncio.Task] = None  # type: ignore
+        self.plan_task: Optional[asyncio.Task] = None  # type: ignore
 
         self.dyn_cfg: dict[str, Any] = cfg.get_mode_dynamic_config()
         self.update_interval = timedelta(seconds=self.dyn_cfg['update_interval'])
         self.pm: PriceManager = None  # type: ignore
         self.scheduler: DynamicScheduler = None  # type: ignore
+        self.solver: Optional[ScheduleSolverService] = None
+
+        # encoded prices and schedule of the status, re-encoded only when they change (see status())
+        self._prices_json: Optional[tuple[dict, Optional[dt], bytes]] = None
+        self._schedule_json: Optional[tuple[list, bytes]] = None
+
+        # last export-limit decision ('limited', 'normal' or 'unknown'): it is logged only when it changes, as it is
+        # made on every control loop and fuse protection tick
+        self._export_decision: Optional[str] = None
 
     @property
     def mode(self) -> ControlMode:
@@ -42,8 +55,9 @@ class Mode4Controller(BaseController):
         # refresh key attributes:
         self.dyn_cfg = self.config.get_mode_dynamic_config()
         self.update_interval = timedelta(seconds=self.dyn_cfg['update_interval'])
-        self.pm = PriceManager(self.config, self.log)
-        self.scheduler = DynamicScheduler(self.config, self.pm)
+        self.pm = PriceManager(self.config, self.log, self.clock)
+        self.solver = ScheduleSolverService()
+        self.scheduler = DynamicScheduler(self.config, self.pm, solver=self.solver, clock=self.clock)
 
         self.bat_capacities = {inv.name: inv.capacity_wh for inv in self.battery_inverters}
         self.battery_present = {inv.name: True for inv in self.battery_inverters}
@@ -53,6 +67,19 @@ class Mode4Controller(BaseController):
             self.price_task.cancel()
             self.price_task = None
 
+    def _stop_plan_task(self):
+        if self.plan_task is not None:
+            self.plan_task.cancel()
+            self.plan_task = None
+
+    async def run(self) -> None:
+        try:
+            await super().run()
+        finally:  # never leave a solver worker process behind
+            self._stop_plan_task()
+            if self.solver is not None:
+                self.solver.close()
+
     def get_PBSapp(self, now: dt) -> PBSapp:
         '''Return the desired power level (PBSapp) for each controlled inverter. Battery inverters follow the
         computed schedule (disconnected batteries are commanded to zero). Each solar inverter is registered at
@@ -80,25 +107,21 @@ class Mode4Controller(BaseController):
         try:
             price = self.pm.get_price(now)
         except Exception as e:
-            self.log.error(f'could not determine price for export-limit decision, allowing normal export: {e}')
+            if self._export_decision != 'unknown':
+                self.log.error(f'could not determine price for export-limit decision, allowing normal export: {e}')
+            self._export_decision = 'unknown'
             return None
 
         if price <= SOLAR_CURTAIL_PRICE:
-            self.log.info(f'price {price:.4f} <= {SOLAR_CURTAIL_PRICE:.4f} EUR/kWh: limiting grid export to 0 W (solar self-consumption only)')
+            if self._export_decision != 'limited':
+                self.log.info(f'price {price:.4f} <= {SOLAR_CURTAIL_PRICE:.4f} EUR/kWh: limiting grid export to 0 W (solar self-consumption only)')
+            self._export_decision = 'limited'
             return 0.0
-        return None
 
-    async def _try_relinquish_control(self):
-        results = await asyncio.gather(*[inv.relinquish_control() for inv in self.battery_inverters],
-                                           return_exceptions=True)
-        for inv, result in zip(self.battery_inverters, results):
-            if isinstance(result, Exception):
-                self.log.error(f'error relinquishing control of {inv.name}: {result}')
-        results = await asyncio.gather(*[inv.relinquish_control() for inv in self.solar_inverters],
-                                        return_exceptions=True)
-        for inv, result in zip(self.solar_inverters, results):
-            if isinstance(result, Exception):
-                self.log.error(f'error relinquishing control of {inv.name}: {result}')
+        if self._export_decision == 'limited':
+            self.log.info(f'price {price:.4f} > {SOLAR_CURTAIL_PRICE:.4f} EUR/kWh: allowing normal grid export again')
+        self._export_decision = 'normal'
+        return None
 
     async def loop(self):
         self.log.info(f'Mode 4 (dynamic schedule mode) started')
@@ -108,6 +131,7 @@ class Mode4Controller(BaseController):
         # price_loop runs independently and must not be cancelled on control_loop errors,
         # otherwise a reconnect after price_update_time would push the next fetch to tomorrow.
         await self.pm.fetch_prices(initial=True)
+        self.publish_status()
         self.price_task = asyncio.create_task(self.price_loop())
         self.log.info('fetched initial prices and started price update loop')
 
@@ -143,6 +167,7 @@ class Mode4Controller(BaseController):
                 self.log.error(f'encountered fatal error: {exception_msg}\n{traceback.format_exc()}')
 
             # if we reach here an error or cancellation occurred: make sure to relinquish control:
+            self._stop_plan_task()
             await self._try_relinquish_control()
             self.close_subsystems()
 
@@ -163,22 +188,40 @@ class Mode4Controller(BaseController):
             self.log.debug('mode 4 (dynamic schedule mode) control loop iteration started')
 
             # fetch current charge
-            await asyncio.gather(*[inv.enable_control() for inv in self.battery_inverters])
-            await asyncio.gather(*[inv.enable_control() for inv in self.solar_inverters])
+            await self.enable_control()
 
             current_charge = await self.get_current_charge()
 
-            # determine if a schedule update is in order, and compute it if necessary based on currently available prices:
-            now = dt.now(self.tz)
-            if not self.scheduler.schedule_available_for(now) or now - self.scheduler.schedule_ts > self.update_interval:
-                self.update_schedule(now, current_charge)
+            # (re)plan in the background: the MILP is solved in a worker process, and until the new plan arrives the
+            # last valid schedule keeps being executed. Only wait for it when there is nothing valid to execute.
+            now = self.clock.now(self.tz)
+            self.start_planning(now, current_charge)
+            if not self.scheduler.schedule_available_for(now):
+                assert self.plan_task is not None
+                await self.plan_task
 
             # schedule in place, so execute it by determing PBsent for each inverter:
             await self.command_PBSsent(now)
 
             await self.loop_delay()
 
-    def update_schedule(self, now: dt, current_charge: dict[str, Union[float, None]]):
+    def start_planning(self, now: dt, current_charge: dict[str, Union[float, None]]):
+        '''Start a background planning task unless one is still running. A full schedule update is planned when no
+        schedule covers now or the schedule is older than update_interval; otherwise the current schedule is
+        incrementally re-planned against the measured battery charges (see DynamicScheduler.replan).'''
+        if self.plan_task is not None:
+            if not self.plan_task.done():
+                self.log.debug('schedule planning still in progress: executing the last valid schedule')
+                return
+            if not self.plan_task.cancelled() and self.plan_task.exception() is not None:
+                self.log.error(f'schedule planning failed, executing the last valid schedule: {self.plan_task.exception()}')
+
+        if not self.scheduler.schedule_available_for(now) or now - self.scheduler.schedule_ts > self.update_interval:
+            self.plan_task = asyncio.create_task(self.update_schedule(now, current_charge))
+        else:
+            self.plan_task = asyncio.create_task(self.replan_schedule(now, current_charge))
+
+    async def update_schedule(self, now: dt, current_charge: dict[str, Union[float, None]]):
         if not self.scheduler.schedule_available_for(now):
             self.log.info(f'schedule update required (no schedule available for {now})')
         else:
@@ -190,9 +233,32 @@ class Mode4Controller(BaseController):
             self.log.error(f'one or more disconnected batteries while updating schedule: setting dummy charge of 0 for ' + ', '.join(i for i, c in current_charge.items() if c is None))
             current_charge = {i: 0 if c is None else c for i, c in current_charge.items() }
 
-        self.scheduler.create_schedule(price_range[0][0], price_range[-1][0], current_charge) # type: ignore
+        t0 = time.perf_counter()
+        await self.scheduler.create_schedule(now, price_range[-1][0], current_charge) # type: ignore
+        HistoryStore(self.log).record_schedule(self.scheduler.schedule, self.clock.time())
+        self.publish_status()
+
+        self.log.debug(f'determined optimal schedule for [{price_range[0][0]} — {price_range[-1][0]}] period '
+                       f'in {time.perf_counter() - t0:.2f} s')
 
-        self.log.debug(f'determined optimal schedule for [{price_range[0][0]} — {price_range[-1][0]}] period')
+    async def replan_schedule(self, now: dt, current_charge: dict[str, Union[float, None]]):
+        '''Incrementally re-plan the current schedule from now on, based on the measured battery charges. A full
+        solve only happens when the existing plan cannot be re-used (see DynamicScheduler.replan). While the charge of
+        a battery is unknown (disconnected, or its read failed) the current plan is kept as is.'''
+        unknown = [i for i, c in current_charge.items() if c is None]
+        if unknown:
+            self.log.note(f'charge of {", ".join(unknown)} unknown: keeping the current schedule instead of re-planning')
+            return
+
+        price_range = self.pm.get_price_range(now)
+
+        t0 = time.perf_counter()
+        outcome = await self.scheduler.replan(now, price_range[-1][0], current_charge) # type: ignore
+        if outcome != 'kept':
+            HistoryStore(self.log).record_schedule(self.scheduler.schedule, self.clock.time())
+        self.publish_status()
+        if self.log.enabled(LogLevel.DEBUG):
+            self.log.debug(f're-planned schedule ({outcome}) in {(time.perf_counter() - t0) * 1e3:.1f} ms')
 
     async def get_current_charge(self) -> dict[str, Union[float, None]]:
         '''Using the modbus connections, retrieve the stats from the inverters and data manager. From those
@@ -201,7 +267,7 @@ class Mode4Controller(BaseController):
         inv_name -> charge_in_Wh
         '''
         await self.get_stats()
-        self.log.debug(f'gathered stats - determining battery charges')
+        self.log.debug('gathered stats - determining battery charges')
 
         ret = {}
         for inv_name, inv_stat in self._stats.battery_inverters.items():
@@ -224,7 +290,8 @@ class Mode4Controller(BaseController):
 
             ret[inv_name] = charge_wh
 
-        self.log.debug(f'battery charge status: ' + ', '.join(f'{i}: {c / 1e3:.1f} kWh' for i, c in ret.items() if c is not None))
+        if self.log.enabled(LogLevel.DEBUG):
+            self.log.debug('battery charge status: ' + ', '.join(f'{i}: {c / 1e3:.1f} kWh' for i, c in ret.items() if c is not None))
         return ret
 
     async def price_loop(self) -> None:
@@ -235,7 +302,7 @@ class Mode4Controller(BaseController):
         while self.running:
             h, m = map(int, self.config.get_mode_dynamic_config()['price_update_time'].split(':'))
 
-            now = dt.now(self.tz)
+            now = self.clock.now(self.tz)
             next_update = now.replace(hour=h, minute=m, second=0, microsecond=0)
             if next_update <= now:  # next_update time already happened - ensure it is set to tomorrow
                 next_update += timedelta(days=1)
@@ -244,12 +311,13 @@ class Mode4Controller(BaseController):
             self.log.info(f'price_loop [{loop_id}]: next price update scheduled at {next_update.strftime("%Y-%m-%d %H:%M %Z")} (in {sleep_seconds:.0f}s)')
 
             try:
-                await asyncio.sleep(sleep_seconds)
+                await self.clock.sleep(sleep_seconds)
                 if not self.running:
                     return
 
                 self.log.info(f'price_loop [{loop_id}]: fetching updated prices')
                 await self.pm.fetch_prices()
+                self.publish_status()
             except asyncio.CancelledError:
                 self.log.info(f'price_loop [{loop_id}]: cancelled')
                 return
@@ -257,17 +325,21 @@ class Mode4Controller(BaseController):
                 self.log.error(f'price_loop [{loop_id}]: {type(e).__name__}: {e}\n{traceback.format_exc()}')
                 await self.send_ha_notification('Mode 4 price error', f'There was an error while fetching prices: {type(e).__name__}: {e}')
 
-    def handle_status(self, request):
-        price_info = self.pm.to_dict()
-        price_info['current_price'] = self.pm.get_price()
-
-        return web.json_response({
-            'status': 'ok',
-            'running': self.running,
-            'mode': self.mode.value,
-            'running_start': self._stats.start_ts,
-            'stats': self._stats.serialize(),
-            'prices': price_info,
-            'schedule': self.scheduler.schedule,
-            'schedule_ts': self.scheduler.schedule_ts,
-        }, dumps=lambda obj: json.dumps(obj, cls=SchedulePeriodEncoder))
+    def status(self) -> dict[str, Any]:
+        ret = super().status()
+        if self.pm is None:  # not set up yet
+            return ret
+
+        # the prices only change once a day and the schedule at most once per tick: their JSON is kept in between
+        prices, prices_ts = self.pm.prices, self.pm.prices_ts
+        if self._prices_json is None or self._prices_json[0] is not prices or self._prices_json[1] != prices_ts:
+            self._prices_json = (prices, prices_ts, self.pm.to_json().encode('utf-8'))
+        schedule = self.scheduler.schedule
+        if self._schedule_json is None or self._schedule_json[0] is not schedule:
+            self._schedule_json = (schedule, json.dumps(schedule, cls=SchedulePeriodEncoder).encode('utf-8'))
+
+        current_price = json.dumps(self.pm.get_price()).encode('utf-8')
+        ret['prices'] = self._prices_json[2][:-1] + b', "current_price": ' + current_price + b'}'
+        ret['schedule'] = self._schedule_json[1]
+        ret['schedule_ts'] = self.scheduler.schedule_ts.isoformat()
+        return ret
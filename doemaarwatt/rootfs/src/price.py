@@ -1,15 +1,16 @@
 from datetime import datetime as dt, timedelta, timezone
 from pathlib import Path
 from zoneinfo import ZoneInfo
-import asyncio
 import json
 from typing import Optional, Union
 
 import aiohttp
+import numpy as np
 
 from config import DoeMaarWattConfig
-from common import Logger, datetimerange
+from common import Logger, Clock, datetimerange
 from predictor import init_night_price_predictor, predict_night_price
+from history import HistoryStore
 
 
 ENEVER_TODAY =      'https://enever.nl/apiv3/stroomprijs_vandaag.php?token={TOKEN}&price=prijs'
@@ -26,8 +27,10 @@ class PriceManager:
     def __init__(self,
         cfg: DoeMaarWattConfig,
         log: Logger,
+        clock: Optional[Clock] = None,
     ) -> None:
         self.log = log
+        self.clock = clock if clock is not None else Clock()
 
         self.enever_token = cfg.get_mode_dynamic_config()['api_token']
 
@@ -38,6 +41,12 @@ class PriceManager:
 
         self._prices_ts: Optional[dt] = None
         self._prices: dict[dt, float] = {}
+
+        # sorted index over the prices, rebuilt whenever prices are assigned:
+        self._times: list[dt] = []  # price timestamps in ascending order
+        self._epochs = np.empty(0, dtype=np.int64)  # the same timestamps in epoch seconds
+        self._values = np.empty(0, dtype=np.float64)  # price starting at each timestamp
+
         if PRICE_PATH.exists():
             self.load_prices()
 
@@ -50,7 +59,11 @@ class PriceManager:
     @prices.setter
     def prices(self, new_prices: dict[dt, float]):
         self._prices = new_prices
-        self._prices_ts = dt.now(self.tz)
+        self._prices_ts = self.clock.now(self.tz)
+
+        self._times = sorted(new_prices)
+        self._epochs = np.array([int(t.timestamp()) for t in self._times], dtype=np.int64)
+        self._values = np.array([new_prices[t] for t in self._times], dtype=np.float64)
 
     @property
     def prices_ts(self) -> Optional[dt]:
@@ -106,7 +119,7 @@ class PriceManager:
         attempt_no = 1
         while attempt_no <= MAX_ATTEMPTS:
             if attempt_no > 1:
-                await asyncio.sleep(10 * 2**attempt_no) # exponential backoff
+                await self.clock.sleep(10 * 2**attempt_no) # exponential backoff
 
             try:
                 new_prices = {}
@@ -125,6 +138,7 @@ class PriceManager:
                     async with session.get(self.enever_tomorrow_url) as resp:
                         parsed = await resp.json()
                         if len(parsed['data']) == 0:  # empty data list indicates data for tomorrow is not available yet
+                            HistoryStore(self.log).record_prices(new_prices, self.clock.time())
                             # no data yet: make the extrapolation and set what we have as the new prices, so we can run
                             # based on that, while we are attempting to grab tomorrow's prices
                             self.extrapolate_prices(new_prices)
@@ -143,6 +157,7 @@ class PriceManager:
                                 new_prices[ts] = float(p['prijs'])
 
                 # happy flow: today's and tomorrow's prices are available so we can extrapolate them:
+                HistoryStore(self.log).record_prices(new_prices, self.clock.time())
                 self.extrapolate_prices(new_prices)
                 self.prices = new_prices
                 self.save_prices()
@@ -194,22 +209,20 @@ class PriceManager:
 
     def get_price(self, st: Optional[dt] = None) -> float:
         if st is None:
-            s_ts = dt.now(self.tz)
+            s_ts = self.clock.now(self.tz)
         else:
             s_ts = st.astimezone(self.tz)
 
-        # check if request time falls within intervals:
-        prices = self.prices
-        times = list(sorted(prices))
-        for t1, t2 in zip(times, times[1:]):
-            if t1 <= s_ts and s_ts < t2:
-                return prices[t1]
+        # find the newest price timestamp at or before the request time:
+        ts = s_ts.timestamp()
+        i = int(np.searchsorted(self._epochs, ts, side='right')) - 1
 
-        # check if it falls within the final interval
-        if times[-1] <= s_ts and s_ts < times[-1] + timedelta(minutes=self.resolution):
-            return prices[times[-1]]
+        # it must either start an interval that is followed by another, or fall within the final interval
+        if 0 <= i < len(self._epochs) - 1 or (i >= 0 and ts < self._epochs[i] + self.resolution * 60):
+            return float(self._values[i])
 
-        raise Exception(f'could not get price for {st} (normalized to {s_ts}) in current prices [{min(prices)} - {max(prices)}]')
+        prices_str = f'[{self._times[0]} - {self._times[-1]}]' if self._times else '[]'
+        raise Exception(f'could not get price for {st} (normalized to {s_ts}) in current prices {prices_str}')
 
     def normalize_to_resolution(self, t: dt) -> dt:
         '''Normalize the given time t to the resolution of this price manager'''
@@ -222,24 +235,20 @@ class PriceManager:
         Return all the prices in a list representation, where each interval (of resolution minutes length) is returned as a 3-tuple
         (start_dt, end_dt, price). If start_from is given, only intervals which contain start_from or are later are returned.
         '''
-        prices = self.prices
-
         if start_from is None:
-            start_from = min(prices)
+            start_from = self._times[0]
         interval_length = timedelta(minutes=self.resolution)
         price_range_start = self.normalize_to_resolution(start_from)
-        price_range_end = self.normalize_to_resolution(max(prices)) + interval_length
+        price_range_end = self.normalize_to_resolution(self._times[-1]) + interval_length
 
-        ret = []
-        times = list(sorted(prices))  # not yet normalized
-        for iv_start in datetimerange(price_range_start, price_range_end, size=interval_length):
-            iv_end = iv_start + interval_length
+        iv_starts = list(datetimerange(price_range_start, price_range_end, size=interval_length))
+        iv_ends = [iv_start + interval_length for iv_start in iv_starts]
 
-            # find the newest price timestamp which is older than iv_end:
-            try:
-                price_key = max(t for t in times if t < iv_end)
-                ret.append((iv_start, iv_end, prices[price_key]))
-            except ValueError as e:  # empty, so likely no starting price
-                raise ValueError(f'cannot determine price for time interval [{iv_start}, {iv_end})')
+        # for each interval, find the newest price timestamp which is older than its end:
+        iv_end_epochs = np.array([t.timestamp() for t in iv_ends], dtype=np.float64)
+        idx = np.searchsorted(self._epochs, iv_end_epochs, side='left') - 1
+        if len(idx) > 0 and idx[0] < 0:  # idx is non-decreasing, so only the first interval can lack a price
+            raise ValueError(f'cannot determine price for time interval [{iv_starts[0]}, {iv_ends[0]})')
 
-        return ret
+        values = self._values[idx].tolist()
+        return list(zip(iv_starts, iv_ends, values))
@@ -0,0 +1,151 @@
+# REPLAY.PY
+#
+# Runs the controller against a captured Modbus trace (see POST /api/modbus/capture) instead of the real devices,
+# to measure the CPU time and Modbus latency per control loop tick of the current code on the traffic of a real
+# installation. Every Modbus request is answered with the recorded response that was current at that point of the
+# trace, after its recorded latency. Step-driven on a VirtualClock (the default) a replay is deterministic and runs
+# as fast as the controller allows; with --speed it runs at a fixed multiple of real time (1 for recorded timing).
+#
+# The configuration and mode stored in the trace are used unless given. The dynamic mode (4) is replayed with
+# replayed prices and in-process schedule solves, as in simulate.py.
+#
+# A change that adds requests shows up as a higher request rate than recorded, and requests for registers the
+# trace never saw are reported as misses. With --max-increase the run fails (exit code 1) when the request rate
+# exceeds the recorded one by more than the given percentage, or when any request missed, for use in CI.
+#
+# Run from the src directory:
+#   python -m replay TRACE [--hours 1] [--speed 1] [--mode 1] [--config dyn_config.json] [--max-increase 0] [--json]
+#
+import argparse
+import asyncio
+import json
+import math
+import sys
+import tempfile
+import time
+from datetime import datetime as dt
+from pathlib import Path
+from typing import Any, Optional
+from zoneinfo import ZoneInfo
+
+from backtest import load_prices
+from common import Logger, LogLevel, ModbusConnectionPool, ModbusTrace, ModbusReplay, VirtualClock
+from config import DoeMaarWattConfig
+from history import HistoryStore
+from mode import ControlMode
+from server import get_controller_class
+from simulate import SimulatedMode4Controller, SYNTHETIC_DAYS, synthetic_prices
+
+
+async def replay(
+    trace: ModbusTrace,
+    hours: Optional[float] = None,
+    speed: Optional[float] = None,
+    mode: Optional[ControlMode] = None,
+    dyn_config: Optional[dict[str, Any]] = None,
+    prices: Optional[dict[dt, float]] = None,
+    log: Optional[Logger] = None,
+) -> dict[str, Any]:
+    '''Run the controller against trace for the given number of hours (default: the whole trace) and return a summary'''
+    if trace.start is None:
+        raise ValueError('the trace holds no requests')
+    log = log if log is not None else Logger(loglevel=LogLevel.OFF)
+    cfg = DoeMaarWattConfig(log, dyn_config=dyn_config if dyn_config is not None else trace.meta['dyn_config'])
+    cfg.set_solar_inverters_config(cfg.get_solar_inverters_config())  # validates, and converts the phases from JSON
+    cfg.set_battery_inverters_config(cfg.get_battery_inverters_config())
+    mode = mode if mode is not None else ControlMode(trace.meta.get('mode', cfg.mode))
+    duration = hours * 3600 if hours is not None else trace.duration
+
+    clock = VirtualClock(trace.start, speed=speed)
+    modbus_replay = ModbusReplay(trace, clock)
+    pool = ModbusConnectionPool(log)
+    pool.set_replay(modbus_replay)
+
+    if mode == ControlMode.DYNAMIC:
+        if prices is None:
+            tz = ZoneInfo(cfg.timezone)
+            day = clock.now(tz).replace(hour=0, minute=0, second=0, microsecond=0)
+            prices = synthetic_prices(day, max(SYNTHETIC_DAYS, math.ceil(duration / 86400) + 1),
+                                      int(cfg.get_mode_dynamic_config()['resolution']))
+        controller = SimulatedMode4Controller(cfg, log, clock, prices)
+    else:
+        controller = get_controller_class(mode)(cfg, log, clock)
+
+    cpu0, t0 = time.process_time(), time.perf_counter()
+    task = asyncio.create_task(controller.run())
+    await clock.sleep(duration)
+    cpu, runtime = time.process_time() - cpu0, time.perf_counter() - t0
+
+    stats = controller._stats  # summarised before stopping, which resets the stats
+    ticks = stats.ticks
+    recorded = sum(1 for r in trace.records if r.ts < trace.start + duration)
+    replayed = modbus_replay.stats.requests + modbus_replay.stats.misses
+    summary = {
+        'mode': mode.value,
+        'virtual_s': round(duration, 1),
+        'runtime_s': round(runtime, 3),
+        'ticks': ticks,
+        'cpu_s': round(cpu, 3),
+        'cpu_ms_per_tick': round(cpu / ticks * 1e3, 3) if ticks else None,
+        'tick_duration_mean_s': stats.tick_duration.to_dict()['mean'],
+        'modbus_latency_ms_per_tick': round(modbus_replay.stats.latency_s / ticks * 1e3, 3) if ticks else None,
+        'requests_recorded': recorded,
+        'requests_replayed': replayed,
+        'request_rate_change_pct': round((replayed / recorded - 1) * 100, 1) if recorded else None,
+        **{f'replay_{k}': v for k, v in modbus_replay.stats.to_dict().items()},
+    }
+
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+    pool.set_replay(None)
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Replay a captured Modbus trace against the controller')
+    parser.add_argument('trace', help='Modbus trace captured by the addon')
+    parser.add_argument('--hours', type=float, help='hours to replay (default: the whole trace)')
+    parser.add_argument('--speed', type=float, help='run at this multiple of real time (1: recorded timing) instead of step-driven')
+    parser.add_argument('--mode', type=int, help='control mode to run (default: the mode during the capture)')
+    parser.add_argument('--config', help='dyn_config.json to run with (default: the configuration during the capture)')
+    parser.add_argument('--prices', help='price history for mode 4 (prices.json format; default: a generated daily curve)')
+    parser.add_argument('--max-increase', type=float, help='fail when the request rate exceeds the recorded one by more than this percentage')
+    parser.add_argument('--verbose', action='store_true', help='log the controller at debug level (to the logs directory)')
+    parser.add_argument('--json', action='store_true', help='print the summary as JSON')
+    args = parser.parse_args()
+
+    trace = ModbusTrace.load(Path(args.trace))
+    dyn_config = None
+    if args.config:
+        with open(args.config) as f:
+            dyn_config = json.load(f)
+    log = Logger(loglevel=LogLevel.DEBUG, filedir='logs') if args.verbose else Logger(loglevel=LogLevel.OFF)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        history = HistoryStore(log, Path(tmp) / 'history.db')  # keep replayed setpoints out of the real history
+        try:
+            summary = asyncio.run(replay(trace, args.hours, args.speed,
+                                         ControlMode(args.mode) if args.mode is not None else None, dyn_config,
+                                         load_prices(args.prices) if args.prices else None, log))
+        finally:
+            history.close()
+
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        for key, value in summary.items():
+            print(f'{key:>26}: {value}')
+
+    if args.max_increase is not None:
+        change = summary['request_rate_change_pct']
+        if summary['replay_misses'] > 0 or (change is not None and change > args.max_increase):
+            print(f'Modbus request regression: {summary["replay_misses"]} misses, request rate {change:+.1f}% '
+                  f'(allowed: +{args.max_increase}%)', file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
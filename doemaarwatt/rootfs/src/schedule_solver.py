@@ -0,0 +1,225 @@
+# SCHEDULE_SOLVER.PY
+#
+# Assembly and solving of the dynamic schedule MILP, and a process-pool service that runs the solver off the
+# asyncio event loop. This module deliberately only depends on numpy and scipy, so that the spawned worker process
+# starts quickly and does not pull in the rest of the application. A spawned process also re-imports the main module
+# of the parent (main.py), which therefore only imports the application within main().
+#
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+import multiprocessing
+from typing import Optional
+
+import numpy as np
+from scipy.optimize import milp, LinearConstraint, Bounds
+from scipy.sparse import coo_array
+
+
+SOLVE_TIMEOUT = 120.0  # seconds before a schedule solve running in the worker process is abandoned
+
+
+@dataclass
+class MilpModel:
+    '''Objective, constraints, integrality and bounds of the schedule MILP, ready to be passed to milp()'''
+    c: np.ndarray
+    constraints: list[LinearConstraint]
+    integrality: np.ndarray
+    bounds: Bounds
+
+
+def build_milp_model(
+    prices: np.ndarray,
+    e0: np.ndarray,
+    e_lo: np.ndarray,
+    e_hi: np.ndarray,
+    charge_max_wh: np.ndarray,
+    discharge_max_wh: np.ndarray,
+    efficiency: float,
+    fixed_z: Optional[np.ndarray] = None,
+    first_slot_fraction: float = 1.0,
+) -> MilpModel:
+    '''Assemble the schedule MILP for M batteries over N slots. prices has shape (N,) and is in €/kWh; all other
+    arrays have shape (M,) and are expressed in Wh: the starting charge, the allowed energy window and the maximum
+    energy that can be charged / discharged within a single slot. If fixed_z (shape (N,)) is given, the charge /
+    discharge pattern is fixed to it, reducing the MILP to an LP over the (dis)charge amounts. When planning from
+    within the first slot, first_slot_fraction is the part of it still ahead: its (dis)charge limits scale with it.
+
+    The constraint matrices are built as sparse (CSR) matrices using vectorized index arithmetic: every row has
+    at most four non-zero entries, so a dense layout would spend nearly all of its time and memory on zeros.
+
+    MILP variable layout (i = battery, t = slot):
+        x[i*N + t]         = e[i][t] = energy in battery i at END of slot t  (continuous)
+        x[M*N + i*N + t]   = c[i][t] = energy charged INTO battery i in t    (continuous)
+        x[2*M*N + i*N + t] = d[i][t] = energy discharged FROM battery i in t (continuous)
+        x[3*M*N + t]        = z[t]   = 1 if charging allowed in slot t        (binary)
+
+    Efficiency mu is applied asymmetrically:
+        Charging:    drawing c/mu Wh from grid stores c Wh in battery
+        Discharging: releasing d Wh from battery delivers d*mu Wh to grid
+
+    Mutual-exclusion constraint (no inverter charges while another discharges):
+        c[i][t] <= charge_limit[i] * h * z[t]          (z=1 → charging allowed)
+        d[i][t] <= discharge_limit[i] * h * (1 - z[t]) (z=0 → discharging allowed)
+    '''
+    N = len(prices)
+    M = len(e0)
+    MN = M * N
+    n_vars = 3 * MN + N
+    mu = efficiency
+
+    # --- Objective: minimise total grid energy cost (z variables have zero cost) ---
+    # Charging c[i][t] Wh (battery side) draws c/mu from the grid at price[t]
+    # Discharging d[i][t] Wh (battery side) delivers d*mu to the grid at price[t]
+    obj = np.concatenate([
+        np.zeros(MN),
+        np.tile(prices / (mu * 1000.0), M),
+        np.tile(-prices * mu / 1000.0, M),
+        np.zeros(N),
+    ])
+
+    # row r = i*N + t addresses battery i in slot t; t_of_row / i_of_row map each row back to its slot / battery
+    rows = np.arange(MN)
+    t_of_row = np.tile(np.arange(N), M)
+    i_of_row = np.repeat(np.arange(M), N)
+    has_prev = t_of_row > 0
+
+    # (dis)charge limit of battery i in slot t
+    slot_share = np.ones(N)
+    slot_share[0] = first_slot_fraction
+    charge_cap = charge_max_wh[i_of_row] * slot_share[t_of_row]
+    discharge_cap = discharge_max_wh[i_of_row] * slot_share[t_of_row]
+
+    # --- Bounds ---
+    lb = np.zeros(n_vars)
+    ub = np.empty(n_vars)
+    lb[:MN] = np.repeat(e_lo, N)
+    ub[:MN] = np.repeat(e_hi, N)
+    ub[MN:2 * MN] = charge_cap
+    ub[2 * MN:3 * MN] = discharge_cap
+    ub[3 * MN:] = 1.0  # binary: [0, 1]
+
+    # --- Integrality: z[t] are binary (integer within [0, 1]) ---
+    integrality = np.zeros(n_vars)
+    if fixed_z is None:
+        integrality[3 * MN:] = 1
+    else:  # pattern given: pin z[t] so no branching is needed
+        lb[3 * MN:] = fixed_z
+        ub[3 * MN:] = fixed_z
+
+    # --- Equality constraints: battery energy balance per slot ---
+    # e[i][t] - e[i][t-1] - c[i][t] + d[i][t] = 0  (t > 0)
+    # e[i][0]              - c[i][0]  + d[i][0] = e0 (t = 0)
+    eq_rows = np.concatenate([rows, rows, rows, rows[has_prev]])
+    eq_cols = np.concatenate([rows, MN + rows, 2 * MN + rows, rows[has_prev] - 1])
+    eq_vals = np.concatenate([np.ones(MN), -np.ones(MN), np.ones(MN), -np.ones(int(has_prev.sum()))])
+    A_eq = coo_array((eq_vals, (eq_rows, eq_cols)), shape=(MN, n_vars)).tocsr()
+    b_eq = np.zeros(MN)
+    b_eq[~has_prev] = e0
+
+    # --- Inequality constraints: mutual exclusion of charge/discharge per slot ---
+    # c[i][t] <= charge_limit[i]*h * z[t]
+    # d[i][t] <= discharge_limit[i]*h * (1 - z[t])  →  d[i][t] + discharge_limit[i]*h * z[t] <= discharge_limit[i]*h
+    z_cols = 3 * MN + t_of_row
+    ineq_rows = np.concatenate([rows, rows, MN + rows, MN + rows])
+    ineq_cols = np.concatenate([MN + rows, z_cols, 2 * MN + rows, z_cols])
+    ineq_vals = np.concatenate([np.ones(MN), -charge_cap, np.ones(MN), discharge_cap])
+    A_ineq = coo_array((ineq_vals, (ineq_rows, ineq_cols)), shape=(2 * MN, n_vars)).tocsr()
+    b_ineq = np.concatenate([np.zeros(MN), discharge_cap])
+
+    return MilpModel(
+        c=obj,
+        constraints=[
+            LinearConstraint(A_eq,   b_eq,                     b_eq),    # type: ignore[arg-type]
+            LinearConstraint(A_ineq, np.full(2 * MN, -np.inf), b_ineq),  # type: ignore[arg-type]
+        ],
+        integrality=integrality,
+        bounds=Bounds(lb, ub),  # type: ignore[arg-type]
+    )
+
+
+@dataclass
+class ScheduleProblem:
+    '''Inputs of the schedule MILP for M batteries over N slots, see build_milp_model()'''
+    prices: np.ndarray
+    e0: np.ndarray
+    e_lo: np.ndarray
+    e_hi: np.ndarray
+    charge_max_wh: np.ndarray
+    discharge_max_wh: np.ndarray
+    efficiency: float
+    fixed_z: Optional[np.ndarray] = None
+    first_slot_fraction: float = 1.0
+
+
+@dataclass
+class ScheduleSolution:
+    '''Outcome of solve_schedule_problem(). On success energy (M, N) holds the energy in each battery at the end
+    of each slot and z (N,) the charge/discharge pattern'''
+    success: bool
+    message: str
+    energy: Optional[np.ndarray] = None
+    z: Optional[np.ndarray] = None
+
+
+def solve_schedule_problem(problem: ScheduleProblem) -> ScheduleSolution:
+    '''Build and solve the schedule MILP. Runs in a worker process when used through ScheduleSolverService, so
+    failures are reported in the returned solution rather than raised.'''
+    M, N = len(problem.e0), len(problem.prices)
+    model = build_milp_model(problem.prices, problem.e0, problem.e_lo, problem.e_hi, problem.charge_max_wh,
+                             problem.discharge_max_wh, problem.efficiency, fixed_z=problem.fixed_z,
+                             first_slot_fraction=problem.first_slot_fraction)
+    result = milp(
+        c=model.c,
+        constraints=model.constraints,
+        integrality=model.integrality,
+        bounds=model.bounds,
+    )
+    if not result.success:
+        return ScheduleSolution(success=False, message=str(result.message))
+
+    return ScheduleSolution(
+        success=True,
+        message=str(result.message),
+        energy=result.x[:M * N].reshape(M, N),
+        z=np.round(result.x[3 * M * N:]),
+    )
+
+
+class ScheduleSolverService:
+    '''Runs solve_schedule_problem() in a separate worker process, so a long MILP solve does not stall the asyncio
+    event loop (web API, Modbus I/O, fuse safety). A solve that exceeds the timeout, or whose awaiting task is
+    cancelled, has its worker terminated; a fresh worker is started for the next solve.
+    '''
+    def __init__(self, timeout: float = SOLVE_TIMEOUT) -> None:
+        self.timeout = timeout
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # spawn rather than fork: the parent runs an event loop and background threads that must not be copied
+            self._pool = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn'))
+        return self._pool
+
+    async def solve(self, problem: ScheduleProblem) -> ScheduleSolution:
+        '''Solve the problem in the worker process. Raises TimeoutError if no solution arrives within the timeout.'''
+        fut = asyncio.get_running_loop().run_in_executor(self._get_pool(), solve_schedule_problem, problem)
+        try:
+            return await asyncio.wait_for(fut, self.timeout)
+        except BaseException:  # timeout, cancellation or a crashed worker: a running solve cannot be interrupted otherwise
+            self.close()
+            raise
+
+    def close(self) -> None:
+        '''Stop the worker process, abandoning any solve in progress'''
+        pool, self._pool = self._pool, None
+        if pool is None:
+            return
+
+        terminate_workers = getattr(pool, 'terminate_workers', None)  # available from Python 3.14
+        if terminate_workers is not None:
+            terminate_workers()
+        else:
+            for p in list((pool._processes or {}).values()):
+                p.terminate()
+            pool.shutdown(wait=False, cancel_futures=True)
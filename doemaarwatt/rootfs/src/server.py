@@ -1,6 +1,5 @@
 import asyncio
 import signal
-import tempfile
 from pathlib import Path
 import json
 import os
@@ -10,8 +9,12 @@ from aiohttp import web
 import aiohttp_cors
 
 from config import DoeMaarWattConfig, ControlMode
-from common import Logger, LogLevel
+from common import Logger, LogLevel, ModbusConnectionPool
 from base_controller import BaseController
+from assets import AssetCache
+from telemetry import Telemetry
+from history import HistoryStore
+from stream import StatusStream
 from mode_1 import Mode1Controller
 from mode_2 import Mode2Controller
 from mode_3 import Mode3Controller
@@ -21,14 +24,13 @@ from mode_4 import Mode4Controller
 API_SERVER_PORT = 8099  # Home Assistant ingress port
 FRONTEND_PATH = (Path(__file__).parent / 'web/dist').resolve()
 # FRONTEND_PATH = Path('/src/web/dist')
-CONTENT_TYPE_MAP = {
-    '.html': 'text/html',
-    '.css': 'text/css',
-    '.js': 'text/javascript',
-}
 
 LOG_PATH = Path('/data/logs/')
 LOG_PATH = Path('logs/')
+LOG_MAX_BYTES = 256 * 1024 * 1024  # all log files together, compressed; the oldest days are removed beyond it
+
+MODBUS_TRACE_PATH = Path('/data/modbus.trace')
+MODBUS_TRACE_PATH = Path('modbus.trace')
 
 
 def get_controller_class(m: ControlMode):
@@ -59,7 +61,7 @@ def get_ingress_filters(ingress_path: str) -> list:
 class DoeMaarWattServer:
     def __init__(self) -> None:
         # control related variables
-        self.log = Logger(loglevel=LogLevel.DEBUG, filedir=LOG_PATH, rotate=10)
+        self.log = Logger(loglevel=LogLevel.DEBUG, filedir=LOG_PATH, rotate=10, max_bytes=LOG_MAX_BYTES)
         self.config = DoeMaarWattConfig(logger=self.log)
         self.config.on_general_config_change = self.stop_sub_task
         self.log.set_loglevel(LogLevel.DEBUG if self.config.debug else LogLevel.INFO)
@@ -67,6 +69,11 @@ class DoeMaarWattServer:
 
         self.controller: Optional[BaseController] = None
 
+        # durable history: completed telemetry rollups are stored along with setpoints, schedules and prices
+        self.history = HistoryStore(self.log)
+        Telemetry().on_rollup = self.history.record_measurements
+        StatusStream().publish(self.idle_status)
+
         # webserver related:
         self.app = web.Application(middlewares=[self.filter_ingress_prefix])
         self.setup_app()
@@ -89,12 +96,19 @@ class DoeMaarWattServer:
         if not directory.is_dir():
             raise ValueError(f"'{directory}' is not a directory")
         self._static_dir = directory
+        self._assets = AssetCache(directory.resolve())
         # self.app.router.register_resource(FilteredStaticResource('/', self._static_dir))
         self.app.router.add_static('/', self._static_dir, show_index=True)
 
         self.app.router.add_get('/api/', self.handle_root)
+        self.app.router.add_get('/api/stream', StatusStream().handle_stream)
         self.app.router.add_post('/api/run', self.handle_run)
         self.app.router.add_post('/api/log', self.log.handle_log)
+        self.app.router.add_get('/api/log/query', self.log.handle_log_query)
+        self.app.router.add_get('/api/history', Telemetry().handle_history)
+        self.app.router.add_get('/api/history/{table}', self.history.handle_history)
+        self.app.router.add_get('/api/modbus/capture', self.handle_get_capture)
+        self.app.router.add_post('/api/modbus/capture', self.handle_post_capture)
         self.config.setup_config_endpoints(self.app.router)
 
         cors = aiohttp_cors.setup(self.app, defaults={
@@ -127,6 +141,7 @@ class DoeMaarWattServer:
             self.sub_task = None
 
         self.controller = None
+        StatusStream().publish(self.idle_status)
 
     async def main_loop(self) -> None:
         runner = web.AppRunner(self.app)
@@ -145,6 +160,7 @@ class DoeMaarWattServer:
                 self.mode = self.config.mode  # use configured startup mode
                 self.controller = get_controller_class(self.mode)(self.config, self.log)
                 self.log.info(f'we are running: determined startup mode {self.mode}')
+                self.controller.publish_status()
                 self.sub_task = asyncio.create_task(self.controller.run())
                 await self.sub_task
 
@@ -152,6 +168,8 @@ class DoeMaarWattServer:
                 self.log.debug('main control loop handling cancel')
                 self.stop_sub_task()
 
+        ModbusConnectionPool(self.log).stop_capture()
+        StatusStream().close()
         await runner.cleanup()
         self.log.info(f'backend webserver stopped')
 
@@ -170,21 +188,61 @@ class DoeMaarWattServer:
             # if sub_running is now false make sure the sub task is stopped
             if not self.sub_running:
                 self.stop_sub_task()
+            elif self.controller is None:
+                StatusStream().publish(self.idle_status)
 
             return web.json_response({'status': 'ok'})
         except Exception as e:
             raise web.HTTPBadRequest(text=json.dumps({'status': 'error', 'msg': str(e)}))
 
+    async def handle_get_capture(self, req):
+        trace = ModbusConnectionPool(self.log).trace
+        if trace is None:
+            return web.json_response({'capturing': False})
+        return web.json_response({
+            'capturing': True,
+            'path': str(trace.path),
+            'records': trace.records,
+            'bytes': trace.size,
+            'truncated': trace.truncated,
+        })
+
+    async def handle_post_capture(self, req):
+        '''Start ({"capture": true}) or stop ({"capture": false}) recording all Modbus traffic to MODBUS_TRACE_PATH'''
+        try:
+            parsed = await req.json()
+            if not isinstance(parsed, dict) or not isinstance(parsed.get('capture'), bool):
+                raise Exception(f'invalid capture value: {parsed}')
+
+            pool = ModbusConnectionPool(self.log)
+            if parsed['capture']:
+                # the configuration (without its credentials) and mode are stored along, so the trace can be replayed
+                # without them
+                pool.start_capture(MODBUS_TRACE_PATH, meta={
+                    'mode': self.config.mode.value,
+                    'dyn_config': self.config.redacted_dyn_config(),
+                })
+            else:
+                pool.stop_capture()
+
+            return await self.handle_get_capture(req)
+        except Exception as e:
+            raise web.HTTPBadRequest(text=json.dumps({'status': 'error', 'msg': str(e)}))
+
+    def idle_status(self) -> dict:
+        '''The /api/ status while no controller is running'''
+        return {
+            'status': 'ok',
+            'running': self.sub_running,  # may be True while controller is still starting up
+            'running_start': None,
+            'mode': self.mode.value,
+            'stats': None,
+            'prices': None,
+        }
+
     async def handle_root(self, request):
         if self.controller is None:
-            return web.json_response({
-                'status': 'ok',
-                'running': self.sub_running,  # may be True while controller is still starting up
-                'running_start': None,
-                'mode': self.mode.value,
-                'stats': None,
-                'prices': None,
-            })
+            return web.json_response(self.idle_status())
         else:
             return self.controller.handle_status(request)
 
@@ -200,28 +258,19 @@ class DoeMaarWattServer:
             return resp
 
         filepath = (self._static_dir / request.path[1:]).resolve()
-        self.log.debug(f'request: {request.path} -> filepath: {filepath}')
-        if not filepath.exists():
-            return web.Response(text='file not found', status=404)
-
         ingress_path = request.headers['X-Ingress-Path']
-        self.log.debug(f'applying filters for ingress path: "{ingress_path}"')
-
-        try:
-            with filepath.open('rb') as f:
-                buf = f.read()
+        self.log.debug(f'request: {request.path} -> filepath: {filepath} (ingress path: "{ingress_path}")')
 
+        def apply_filters(buf: bytes) -> bytes:
             for m in get_ingress_filters(ingress_path):
-                old = m[0].encode('utf-8')
-                new = m[1].encode('utf-8')
-                buf = buf.replace(old, new)
-
-            with tempfile.NamedTemporaryFile(mode='w+b', delete=False) as temp_file:
-                temp_file.write(buf)
+                buf = buf.replace(m[0].encode('utf-8'), m[1].encode('utf-8'))
+            return buf
 
-            modified_resp = web.FileResponse(temp_file.name)
-            # FileResponse by default sets octet-stream as content-type. Apply correct header:
-            modified_resp.headers['Content-Type'] = CONTENT_TYPE_MAP.get(filepath.suffix, 'application/octet-stream')
-            return modified_resp
+        # rewritten once per file and ingress path, then served from memory
+        try:
+            asset = await self._assets.get(filepath, ingress_path, apply_filters)
         except Exception as e:
             raise web.HTTPBadRequest(text=json.dumps({'status': 'error', 'msg': str(e)}))
+        if asset is None:
+            return web.Response(text='file not found', status=404)
+        return asset.response(request)
@@ -0,0 +1,173 @@
+# SIMULATE.PY
+#
+# Runs the dynamic schedule mode (mode 4) end to end against the simulated battery inverter, solar inverter and
+# energy meter on a VirtualClock: the full control loop (stats fan-out, planning, dispatch waves, fuse protection
+# and the daily price update) executes unchanged, but every sleep and simulated I/O delay advances virtual time
+# instead of waiting for it. Step-driven (the default), a simulated day runs in seconds; with --speed the clock
+# runs at a fixed multiple of real time instead.
+#
+# Prices are replayed from a price history (prices.json format) or, by default, generated as a deterministic daily
+# curve; they become visible to the controller as they would have been fetched (today's, and tomorrow's from
+# price_update_time on). Schedules are solved in-process, so a step-driven run is reproducible for a given --seed.
+#
+# Run from the src directory:
+#   python -m simulate [--hours 24] [--prices PRICES.json] [--start 2026-06-21] [--speed 60] [--seed 1] [--json]
+#
+import argparse
+import asyncio
+import json
+import math
+import random
+import tempfile
+import time
+from datetime import datetime as dt, timedelta
+from pathlib import Path
+from typing import Any, Optional
+from zoneinfo import ZoneInfo
+
+from backtest import DEFAULT_CONFIG, load_prices
+from common import Logger, LogLevel, Clock, VirtualClock
+from config import DoeMaarWattConfig
+from dyn_schedule import DynamicScheduler
+from history import HistoryStore
+from mode_4 import Mode4Controller
+from price import PriceManager
+
+
+SYNTHETIC_DAYS = 3  # days of generated prices when no price history is given
+
+
+class ReplayPriceManager(PriceManager):
+    '''Price manager that "fetches" from a given price history: today's prices, and from price_update_time on
+    also tomorrow's, like the day-ahead prices of the real API'''
+
+    def __init__(self, cfg: DoeMaarWattConfig, log: Logger, clock: Clock, history: dict[dt, float]) -> None:
+        super().__init__(cfg, log, clock)
+        self.history = {t.astimezone(self.tz): p for t, p in sorted(history.items())}
+
+    async def fetch_prices(self, initial=False) -> None:
+        now = self.clock.now(self.tz)
+        h, m = map(int, self.price_update_time.split(':'))
+        day_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        visible_until = day_start + timedelta(days=2 if (now.hour, now.minute) >= (h, m) else 1)
+        self.prices = {t: p for t, p in self.history.items() if t < visible_until}
+        self.log.info(f'replayed {len(self.prices)} prices until {visible_until}')
+
+
+class SimulatedMode4Controller(Mode4Controller):
+    '''Mode 4 controller for simulations: replayed prices, in-process schedule solves and no HA notifications'''
+
+    def __init__(self, cfg: DoeMaarWattConfig, log: Logger, clock: Clock, prices: dict[dt, float]) -> None:
+        super().__init__(cfg, log, clock)
+        self.price_history = prices
+
+    def setup(self) -> None:
+        super().setup()
+        self.solver = None  # a solve in a worker process would let a step-driven clock run ahead while it is pending
+        self.pm = ReplayPriceManager(self.config, self.log, self.clock, self.price_history)
+        self.scheduler = DynamicScheduler(self.config, self.pm, clock=self.clock)
+
+    async def send_ha_notification(self, title: str, message: str):
+        self.log.info(f'notification: {title}: {message}')
+
+
+def synthetic_prices(start: dt, days: int, resolution: int) -> dict[dt, float]:
+    '''Deterministic day-ahead prices (EUR/kWh): morning and evening peaks, and a midday solar dip below zero'''
+    prices = {}
+    for i in range(days * 24 * 60 // resolution):
+        t = dt.fromtimestamp(start.timestamp() + i * resolution * 60, start.tzinfo)
+        h = t.hour + t.minute / 60.0
+        prices[t] = round(0.20 + 0.08 * math.cos(2 * math.pi * (h - 19) / 24) + 0.05 * math.cos(2 * math.pi * (h - 8) / 12)
+                          - 0.25 * math.exp(-((h - 13.5) / 2.0) ** 2), 5)
+    return prices
+
+
+async def simulate(
+    hours: float,
+    prices: Optional[dict[dt, float]] = None,
+    start: Optional[dt] = None,
+    speed: Optional[float] = None,
+    dyn_config: Optional[dict[str, Any]] = None,
+    log: Optional[Logger] = None,
+) -> dict[str, Any]:
+    '''Run mode 4 on the simulated subsystems for the given number of virtual hours and return a summary'''
+    log = log if log is not None else Logger(loglevel=LogLevel.OFF)
+    cfg = DoeMaarWattConfig(log, dyn_config=dyn_config if dyn_config is not None else DEFAULT_CONFIG)
+    tz = ZoneInfo(cfg.timezone)
+    if start is not None and start.tzinfo is None:
+        start = start.replace(tzinfo=tz)
+
+    if prices is None:
+        start = start if start is not None else dt.now(tz).replace(hour=0, minute=0, second=0, microsecond=0)
+        prices = synthetic_prices(start, max(SYNTHETIC_DAYS, math.ceil(hours / 24) + 1), int(cfg.get_mode_dynamic_config()['resolution']))
+    start = start if start is not None else min(prices)
+
+    clock = VirtualClock(start, speed=speed)
+    controller = SimulatedMode4Controller(cfg, log, clock, prices)
+
+    t0 = time.perf_counter()
+    task = asyncio.create_task(controller.run())
+    await clock.sleep(hours * 3600)
+    duration = time.perf_counter() - t0
+
+    stats = controller._stats  # summarised before stopping, which resets the stats
+    summary = {
+        'start': start.isoformat(),
+        'end': clock.now(tz).isoformat(),
+        'virtual_hours': hours,
+        'runtime_s': round(duration, 3),
+        'speedup': round(hours * 3600 / duration),
+        'ticks': stats.ticks,
+        'ticks_skipped': stats.ticks_skipped,
+        'protection_ticks': stats.protection_ticks,
+        'protection_clamps': stats.protection_clamps,
+        'battery_charge_pct': {
+            name: round(s.battery.battery_charge_pct, 1) if s.battery.battery_charge_pct is not None else None
+            for name, s in stats.battery_inverters.items()
+        },
+    }
+
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Simulate the dynamic schedule mode faster than real time')
+    parser.add_argument('--hours', type=float, default=24.0, help='virtual hours to simulate')
+    parser.add_argument('--prices', help='price history (prices.json format; default: a generated daily curve)')
+    parser.add_argument('--config', help='dyn_config.json to simulate (default: a single simulated 10 kWh battery)')
+    parser.add_argument('--start', type=dt.fromisoformat, help='virtual start time (default: the first price)')
+    parser.add_argument('--speed', type=float, help='run accelerated at this multiple of real time instead of step-driven')
+    parser.add_argument('--seed', type=int, default=1, help='seed of the simulated measurement noise')
+    parser.add_argument('--verbose', action='store_true', help='log the controller at debug level (to the logs directory)')
+    parser.add_argument('--json', action='store_true', help='print the summary as JSON')
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    dyn_config = None
+    if args.config:
+        with open(args.config) as f:
+            dyn_config = json.load(f)
+    log = Logger(loglevel=LogLevel.DEBUG, filedir='logs') if args.verbose else Logger(loglevel=LogLevel.OFF)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        history = HistoryStore(log, Path(tmp) / 'history.db')  # keep simulated schedules out of the real history
+        try:
+            summary = asyncio.run(simulate(args.hours, load_prices(args.prices) if args.prices else None,
+                                           args.start, args.speed, dyn_config, log))
+        finally:
+            history.close()
+
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        for key, value in summary.items():
+            print(f'{key:>18}: {value}')
+
+
+if __name__ == '__main__':
+    main()
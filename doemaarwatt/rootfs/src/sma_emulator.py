@@ -0,0 +1,453 @@
+# SMA_EMULATOR.PY
+#
+# Local Modbus TCP stand-in for the SMA devices the drivers talk to: Sunny Boy Storage battery inverters, STP X-25
+# solar inverters and the Data Manager M energy meter. Every emulated device listens on its own port and serves the
+# register maps of its driver (unmapped words within a read return NaN), accepts the driver's control writes and
+# follows them: batteries (dis)charge at their setpoint while under external control, solar inverters honour their
+# active-power preset, and the energy meter measures the sum of all devices of the site minus a household load.
+#
+# Faults can be injected per request to exercise the real I/O path: response latency and jitter, dropped requests
+# (no response), connection resets, Modbus exception responses and NaN readings.
+#
+# Run from the src directory:
+#   python -m sma_emulator [--batteries 3] [--solar 1] [--base-port 5020] [--latency 0.02] [--jitter 0.01]
+#                          [--drop 0.001] [--reset 0.001] [--exception 0.001] [--nan 0.001] [--config-out FILE]
+#
+# The battery_inverters, solar_inverters and energy_meter config sections pointing at the emulator are printed (or
+# written to --config-out), ready to be merged into a dyn_config.json.
+#
+import argparse
+import asyncio
+import json
+import random
+import struct
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from common import Clock, Phase, SINGLE_PHASES, Register, RegisterMap
+from common.registers import dtype_word_count
+from config import DEFAULT_BATTERY_CHARGE_MAX_PCT, DEFAULT_BATTERY_CHARGE_MIN_PCT
+from subsystems.battery_inverters.sma_sunny_boy_storage import _AC_REG_MAP, _BATTERY_REGISTERS
+from subsystems.energy_meters.sma_data_manager import _REGISTERS as _METER_REGISTERS, DEVICE_ID as METER_DEVICE_ID
+from subsystems.solar_inverters.sma_solar_inverter import _REGISTERS as _SOLAR_REGISTERS
+from subsystems.solar_inverters.sim_solar_inverter import _solar_power
+
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_BASE_PORT = 5020
+DEVICE_ID = 3  # Modbus device ID of the SMA inverters (the Data Manager uses its own, see sma_data_manager)
+
+GRID_VOLTAGE = 230.0
+BATTERY_VOLTAGE = 400.0
+HOUSEHOLD_LOAD_W = 1500.0  # default site load, spread evenly over the phases
+EMULATED_FUSE_A = 25  # main fuse reported in the energy meter config
+
+# Control register values written by the drivers
+BATTERY_CONTROL_ON = 802  # 40151: external charge/discharge control active
+SOLAR_WMOD_PRESET = 1077  # 40210: manual active-power preset in W
+
+# Modbus function and exception codes served by the emulator
+READ_HOLDING, READ_INPUT, WRITE_SINGLE, WRITE_MULTIPLE = 0x03, 0x04, 0x06, 0x10
+ILLEGAL_FUNCTION, ILLEGAL_ADDRESS, ILLEGAL_VALUE, DEVICE_FAILURE, DEVICE_BUSY, GATEWAY_TARGET_FAILED = \
+    0x01, 0x02, 0x03, 0x04, 0x06, 0x0B
+
+_BATTERY_HOLDING = {
+    'power_setpoint': Register(40149, 'S32', 'FIX0'),
+    'control_mode': Register(40151, 'U32', 'FIX0'),
+}
+
+_SOLAR_HOLDING = {
+    'wmod': Register(40210, 'U32', 'FIX0'),
+    'power_limit': Register(40212, 'U32', 'FIX0'),
+    'ext_com': Register(41383, 'U32', 'FIX0'),
+}
+
+
+@dataclass
+class FaultProfile:
+    '''Faults injected into the responses of an emulated device. Rates are probabilities per request.'''
+    latency: float = 0.0  # seconds before every response
+    jitter: float = 0.0  # the latency varies uniformly by up to this many seconds either way
+    drop_rate: float = 0.0  # request is never answered (the client times out)
+    reset_rate: float = 0.0  # connection is closed instead of answering
+    exception_rate: float = 0.0  # request is answered with a device failure or device busy exception
+    nan_rate: float = 0.0  # read is answered with every mapped value set to its NaN sentinel
+    strict: bool = False  # reads spanning unmapped words are refused (Illegal Data Address) instead of NaN-filled
+
+
+class EmulatedDevice:
+    '''Register image of one SMA device. Subclasses refresh the measured values from their control registers.'''
+
+    def __init__(self, name: str, device_id: int, registers: dict[str, Register], holding: dict[str, Register],
+                 site: 'Site') -> None:
+        self.name = name
+        self.device_id = device_id
+        self.site = site
+        self.map = RegisterMap(registers | holding)
+        self.writable = {r.address + i: name for name, r in holding.items() for i in range(dtype_word_count(r.dtype))}
+        self.words: dict[int, int] = {}  # address -> raw word, for the input (3x) and holding (4x) registers alike
+        self._nan_words: dict[int, int] = {}
+        for name, r in self.map.registers.items():
+            for i, w in enumerate(self.map.encode_field(name, None)):
+                self._nan_words[r.address + i] = w
+            self.set(name, None)
+
+    def set(self, name: str, value: Any) -> None:
+        address = self.map.registers[name].address
+        for i, w in enumerate(self.map.encode_field(name, value)):
+            self.words[address + i] = w
+
+    def get(self, name: str) -> Any:
+        r = self.map.registers[name]
+        return self.map.decode_field(name, [self.words[r.address + i] for i in range(dtype_word_count(r.dtype))])
+
+    @property
+    def phase_power(self) -> dict[Phase, float]:
+        '''AC power (W) per phase fed into the site (negative: drawn from it)'''
+        return {}
+
+    def update(self) -> None:
+        '''Refresh the measured values'''
+
+    def read(self, address: int, count: int, nan: bool = False, strict: bool = False) -> list[int] | int:
+        '''Return count words starting at address, or a Modbus exception code'''
+        if not 1 <= count <= 125:
+            return ILLEGAL_VALUE
+        addresses = range(address, address + count)
+        if (strict and any(a not in self.words for a in addresses)) or all(a not in self.words for a in addresses):
+            return ILLEGAL_ADDRESS
+
+        self.update()
+        source = self._nan_words if nan else self.words
+        return [source.get(a, 0xFFFF) for a in addresses]
+
+    def write(self, address: int, words: list[int]) -> Optional[int]:
+        '''Write words starting at address; returns a Modbus exception code if the write is refused'''
+        names = [self.writable.get(a) for a in range(address, address + len(words))]
+        if not words or None in names:
+            return ILLEGAL_ADDRESS
+
+        self.update()  # settle the state under the old setpoints first: the new ones apply from now on
+        for i, w in enumerate(words):
+            self.words[address + i] = w
+        return None
+
+
+class EmulatedBattery(EmulatedDevice):
+    '''SMA Sunny Boy Storage: follows its charge (< 0) / discharge (> 0) setpoint while under external control'''
+
+    def __init__(self, name: str, phase: Phase, site: 'Site', capacity_wh: float = 10_000, limit_w: float = 5_000,
+                 charge_pct: float = 50.0) -> None:
+        ac = _AC_REG_MAP[phase]
+        super().__init__(name, DEVICE_ID, _BATTERY_REGISTERS | {
+            'ac_pow': Register(ac['p'], 'S32', 'FIX0'),
+            'ac_vol': Register(ac['v'], 'U32', 'FIX2'),
+            'ac_amp': Register(ac['a'], 'S32', 'FIX3'),
+        }, _BATTERY_HOLDING, site)
+        self.phase = phase
+        self.capacity_wh = capacity_wh
+        self.limit_w = limit_w
+        self.charge_wh = capacity_wh * charge_pct / 100.0
+        self.power = 0.0
+        self._ts = site.clock.monotonic()
+
+        self.set('power_setpoint', 0)
+        self.set('control_mode', 803)
+        self.set('temp_h', 21.0)
+        self.set('temp_l', 20.0)
+        self.update()
+
+    @property
+    def phase_power(self) -> dict[Phase, float]:
+        return {self.phase: self.power}
+
+    def update(self) -> None:
+        now = self.site.clock.monotonic()
+        self.charge_wh = min(self.capacity_wh, max(0.0, self.charge_wh - self.power * (now - self._ts) / 3600.0))
+        self._ts = now
+
+        power = self.get('power_setpoint') if self.get('control_mode') == BATTERY_CONTROL_ON else 0.0
+        power = max(-self.limit_w, min(self.limit_w, power or 0.0))
+        if (power < 0 and self.charge_wh >= self.capacity_wh) or (power > 0 and self.charge_wh <= 0):
+            power = 0.0  # full or empty
+        self.power = power
+
+        self.set('ac_pow', power)
+        self.set('ac_vol', GRID_VOLTAGE)
+        self.set('ac_amp', power / GRID_VOLTAGE)
+        self.set('voltage', BATTERY_VOLTAGE)
+        self.set('current', power / BATTERY_VOLTAGE)
+        self.set('charge', self.charge_wh / self.capacity_wh * 10.0)  # the driver scales this register by 10
+
+
+class EmulatedSolarInverter(EmulatedDevice):
+    '''SMA STP X-25: generates along the simulated solar curve, capped by its active-power preset when enabled'''
+
+    def __init__(self, name: str, site: 'Site', peak_w: float = 25_000, device_id: int = DEVICE_ID) -> None:
+        super().__init__(name, device_id, dict(_SOLAR_REGISTERS.registers), _SOLAR_HOLDING, site)
+        self.peak_w = peak_w
+        self.power = 0.0
+        self.set('wmod', 303)
+        self.set('power_limit', peak_w)
+        self.set('ext_com', 303)
+        self.update()
+
+    @property
+    def phase_power(self) -> dict[Phase, float]:
+        return {phi: self.power / len(SINGLE_PHASES) for phi in SINGLE_PHASES}
+
+    def update(self) -> None:
+        natural = len(SINGLE_PHASES) * _solar_power(self.peak_w / len(SINGLE_PHASES), self.site.clock.now())
+        preset = self.get('wmod') == SOLAR_WMOD_PRESET
+        self.power = min(natural, self.get('power_limit')) if preset else natural
+
+        self.set('total_pow', self.power)
+        for phi in SINGLE_PHASES:
+            self.set(f'{phi.value.lower()}_pow', self.power / len(SINGLE_PHASES))
+        self.set('setpoint_limit', self.get('power_limit') if preset else None)
+
+
+class EmulatedDataManager(EmulatedDevice):
+    '''SMA Data Manager M: measures the grid exchange of the site (negative: importing)'''
+
+    def __init__(self, name: str, site: 'Site') -> None:
+        super().__init__(name, METER_DEVICE_ID, dict(_METER_REGISTERS.registers), {}, site)
+        self.update()
+
+    def update(self) -> None:
+        grid = self.site.grid_power()
+        for phi in SINGLE_PHASES:
+            p = phi.value.lower()
+            self.set(f'{p}_power', grid[phi])
+            self.set(f'{p}_voltage', GRID_VOLTAGE)
+            self.set(f'{p}_current', abs(grid[phi]) / GRID_VOLTAGE)
+
+
+class Site:
+    '''The emulated installation: its devices share one grid connection with a household load'''
+
+    def __init__(self, load_w: float = HOUSEHOLD_LOAD_W, clock: Optional[Clock] = None) -> None:
+        self.load_w = load_w
+        self.clock = clock if clock is not None else Clock()
+        self.devices: list[EmulatedDevice] = []
+
+    def grid_power(self) -> dict[Phase, float]:
+        grid = {phi: -self.load_w / len(SINGLE_PHASES) for phi in SINGLE_PHASES}
+        for device in self.devices:
+            if isinstance(device, EmulatedDataManager):
+                continue
+            device.update()
+            for phi, power in device.phase_power.items():
+                grid[phi] += power
+        return grid
+
+
+class EmulatedServer:
+    '''Modbus TCP server for one emulated device, injecting the faults of its profile'''
+
+    def __init__(self, device: EmulatedDevice, host: str, port: int, faults: FaultProfile, rng: random.Random) -> None:
+        self.device = device
+        self.host = host
+        self.port = port
+        self.faults = faults
+        self.rng = rng
+        self.stats = {'connections': 0, 'requests': 0, 'dropped': 0, 'resets': 0, 'exceptions': 0, 'nan': 0}
+        self._server: Optional[asyncio.Server] = None
+        self._writers: set[asyncio.StreamWriter] = set()
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            for writer in self._writers:  # wait_closed() waits for the open client connections
+                writer.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.stats['connections'] += 1
+        self._writers.add(writer)
+        try:
+            while True:
+                tid, _, length, unit = struct.unpack('>HHHB', await reader.readexactly(7))
+                pdu = await reader.readexactly(length - 1)
+                self.stats['requests'] += 1
+
+                f = self.faults
+                delay = f.latency + self.rng.uniform(-f.jitter, f.jitter)
+                if delay > 0:
+                    await self.device.site.clock.sleep(delay)
+                if self.rng.random() < f.drop_rate:
+                    self.stats['dropped'] += 1
+                    continue
+                if self.rng.random() < f.reset_rate:
+                    self.stats['resets'] += 1
+                    return
+
+                response = self._respond(unit, pdu)
+                writer.write(struct.pack('>HHHB', tid, 0, len(response) + 1, unit) + response)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass  # client disconnected
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    def _respond(self, unit: int, pdu: bytes) -> bytes:
+        fc = pdu[0]
+
+        def exception(code: int) -> bytes:
+            return bytes([fc | 0x80, code])
+
+        if unit != self.device.device_id:
+            return exception(GATEWAY_TARGET_FAILED)
+        if self.rng.random() < self.faults.exception_rate:
+            self.stats['exceptions'] += 1
+            return exception(self.rng.choice((DEVICE_FAILURE, DEVICE_BUSY)))
+
+        if fc in (READ_HOLDING, READ_INPUT):
+            address, count = struct.unpack('>HH', pdu[1:5])
+            if str(address)[0] != ('4' if fc == READ_HOLDING else '3'):
+                return exception(ILLEGAL_ADDRESS)
+            nan = self.rng.random() < self.faults.nan_rate
+            self.stats['nan'] += nan
+            words = self.device.read(address, count, nan=nan, strict=self.faults.strict)
+            if isinstance(words, int):
+                return exception(words)
+            return struct.pack(f'>BB{count}H', fc, 2 * count, *words)
+
+        if fc in (WRITE_SINGLE, WRITE_MULTIPLE):
+            if fc == WRITE_SINGLE:
+                address, value = struct.unpack('>HH', pdu[1:5])
+                words = [value]
+            else:
+                address, count = struct.unpack('>HH', pdu[1:5])
+                words = list(struct.unpack(f'>{count}H', pdu[6:6 + 2 * count]))
+            code = self.device.write(address, words)
+            if code is not None:
+                return exception(code)
+            return pdu[:5]  # a write is acknowledged by echoing its address and value (count)
+
+        return exception(ILLEGAL_FUNCTION)
+
+
+class SmaEmulator:
+    '''
+    An emulated site of battery inverters, solar inverters and (optionally) a Data Manager, each served on its own
+    port counting up from base_port. Use as an async context manager, or start() and close() it explicitly.
+    '''
+
+    def __init__(self,
+        batteries: int = 1,
+        solar_inverters: int = 0,
+        energy_meter: bool = True,
+        host: str = DEFAULT_HOST,
+        base_port: int = DEFAULT_BASE_PORT,
+        faults: Optional[FaultProfile] = None,
+        load_w: float = HOUSEHOLD_LOAD_W,
+        clock: Optional[Clock] = None,
+        seed: Optional[int] = None,
+    ) -> None:
+        self.host = host
+        self.site = Site(load_w, clock)
+        self.faults = faults if faults is not None else FaultProfile()
+
+        for i in range(batteries):
+            self.site.devices.append(EmulatedBattery(f'battery{i + 1}', SINGLE_PHASES[i % len(SINGLE_PHASES)], self.site))
+        for i in range(solar_inverters):
+            self.site.devices.append(EmulatedSolarInverter(f'solar{i + 1}', self.site))
+        if energy_meter:
+            self.site.devices.append(EmulatedDataManager('data_manager', self.site))
+
+        rng = random.Random(seed)
+        self.servers = [EmulatedServer(d, host, base_port + i, self.faults, random.Random(rng.random()))
+                        for i, d in enumerate(self.site.devices)]
+
+    async def start(self) -> None:
+        for server in self.servers:
+            await server.start()
+
+    async def close(self) -> None:
+        for server in self.servers:
+            await server.close()
+
+    async def __aenter__(self) -> 'SmaEmulator':
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    @property
+    def stats(self) -> dict[str, dict[str, int]]:
+        return {s.device.name: dict(s.stats) for s in self.servers}
+
+    def config(self) -> dict[str, Any]:
+        '''Device config sections (as in dyn_config.json) for the drivers to connect to this emulator'''
+        cfg: dict[str, Any] = {'battery_inverters': [], 'solar_inverters': [], 'energy_meter': {}}
+        for s in self.servers:
+            d = s.device
+            if isinstance(d, EmulatedBattery):
+                cfg['battery_inverters'].append({
+                    'name': d.name, 'type': 'sma_sunny_boy_storage', 'enable': True, 'host': self.host, 'port': s.port,
+                    'connected_phase': d.phase.value, 'battery_capacity': int(d.capacity_wh),
+                    'battery_charge_limit': int(d.limit_w), 'battery_discharge_limit': int(d.limit_w),
+                    'battery_charge_max_pct': DEFAULT_BATTERY_CHARGE_MAX_PCT,
+                    'battery_charge_min_pct': DEFAULT_BATTERY_CHARGE_MIN_PCT,
+                })
+            elif isinstance(d, EmulatedSolarInverter):
+                cfg['solar_inverters'].append({
+                    'name': d.name, 'type': 'sma_stp_x25', 'enable': True, 'host': self.host, 'port': s.port,
+                    'modbus_device_id': d.device_id, 'connected_phase': Phase.ALL.value,
+                })
+            else:
+                cfg['energy_meter'] = {'type': 'sma_data_manager', 'host': self.host, 'port': s.port,
+                                       'max_fuse_current': EMULATED_FUSE_A}
+        return cfg
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Emulate SMA devices over Modbus TCP')
+    parser.add_argument('--batteries', type=int, default=1, help='number of Sunny Boy Storage battery inverters')
+    parser.add_argument('--solar', type=int, default=0, help='number of STP X-25 solar inverters')
+    parser.add_argument('--no-meter', action='store_true', help='do not emulate a Data Manager')
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--base-port', type=int, default=DEFAULT_BASE_PORT, help='port of the first device')
+    parser.add_argument('--load', type=float, default=HOUSEHOLD_LOAD_W, help='household load (W)')
+    parser.add_argument('--latency', type=float, default=0.0, help='response latency (s)')
+    parser.add_argument('--jitter', type=float, default=0.0, help='uniform latency jitter (s)')
+    parser.add_argument('--drop', type=float, default=0.0, help='probability a request is not answered')
+    parser.add_argument('--reset', type=float, default=0.0, help='probability the connection is reset')
+    parser.add_argument('--exception', type=float, default=0.0, help='probability of an exception response')
+    parser.add_argument('--nan', type=float, default=0.0, help='probability a read returns NaN values')
+    parser.add_argument('--strict', action='store_true', help='refuse reads spanning unmapped registers')
+    parser.add_argument('--seed', type=int, help='seed of the injected faults')
+    parser.add_argument('--config-out', help='write the device config sections to this file')
+    args = parser.parse_args()
+
+    faults = FaultProfile(args.latency, args.jitter, args.drop, args.reset, args.exception, args.nan, args.strict)
+    emulator = SmaEmulator(args.batteries, args.solar, not args.no_meter, args.host, args.base_port, faults,
+                           args.load, seed=args.seed)
+    cfg = json.dumps(emulator.config(), indent=2)
+    if args.config_out:
+        with open(args.config_out, 'w') as f:
+            f.write(cfg)
+    else:
+        print(cfg)
+
+    async def serve():
+        async with emulator:
+            print(f'emulating {len(emulator.servers)} device(s) on {args.host}:{args.base_port}-'
+                  f'{args.base_port + len(emulator.servers) - 1}')
+            await asyncio.Event().wait()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        print(json.dumps(emulator.stats, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,6 @@
+import bisect
 from typing import Optional, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from common import Phase, PhasePowerMap
 from config import DoeMaarWattConfig
@@ -8,6 +9,34 @@ from subsystems.solar_inverters import SolarInverterStats
 from subsystems.energy_meters import EnergyMeterStats
 
 
+# upper bounds (seconds) of the buckets of the control loop tick histograms; the last bucket is unbounded
+TICK_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+@dataclass
+class Histogram:
+    '''Histogram of durations (seconds) over fixed buckets: each bound counts the values above the previous bound up
+    to and including it, and 'inf' the values above the last bound'''
+    bounds: tuple[float, ...] = TICK_BUCKETS
+    counts: list[int] = field(default_factory=lambda: [0] * (len(TICK_BUCKETS) + 1))
+    total: float = 0.0
+    max: Optional[float] = None
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.max = value if self.max is None else max(self.max, value)
+
+    def to_dict(self) -> dict[str, Any]:
+        n = sum(self.counts)
+        return {
+            'buckets': { **{ str(b): c for b, c in zip(self.bounds, self.counts) }, 'inf': self.counts[-1] },
+            'count': n,
+            'mean': self.total / n if n > 0 else None,
+            'max': self.max,
+        }
+
+
 class ControllerStats:
     def __init__(self,
         cfg: DoeMaarWattConfig,
@@ -17,6 +46,25 @@ class ControllerStats:
         self.solar_inverters: dict[str, SolarInverterStats] = {}
         self.energy_meter: Optional[EnergyMeterStats] = None
 
+        # duration (seconds) of the last stats collection phase, and of the read of each device within it
+        self.read_duration_s: Optional[float] = None
+        self.device_read_durations_s: dict[str, float] = {}
+        self.stats_ts: Optional[float] = None  # time.perf_counter() at which the last stats collection completed
+
+        # last dispatch of commanded power levels: per inverter its power, wave and whether it was acknowledged
+        self.dispatch: dict[str, dict[str, Any]] = {}
+        self.actuation_delay_s: Optional[float] = None  # from completing the stats collection to the last actuation
+
+        # fuse protection in between control loop iterations: energy meter checks done and times inverters were clamped
+        self.protection_ticks = 0
+        self.protection_clamps = 0
+
+        # control loop ticks: how late each tick started relative to its deadline and how long its work took
+        self.ticks = 0
+        self.ticks_skipped = 0
+        self.tick_lateness = Histogram()
+        self.tick_duration = Histogram()
+
         self.start_ts: Optional[float] = None
 
     def reset(self):
@@ -24,6 +72,21 @@ class ControllerStats:
         self.solar_inverters = {}
         self.energy_meter = None
 
+        self.read_duration_s = None
+        self.device_read_durations_s = {}
+        self.stats_ts = None
+
+        self.dispatch = {}
+        self.actuation_delay_s = None
+
+        self.protection_ticks = 0
+        self.protection_clamps = 0
+
+        self.ticks = 0
+        self.ticks_skipped = 0
+        self.tick_lateness = Histogram()
+        self.tick_duration = Histogram()
+
         self.start_ts = None
 
     def get_PBSnow(self, phi: Phase) -> PhasePowerMap:
@@ -53,4 +116,14 @@ class ControllerStats:
             'battery_inverters': { n: s.to_dict() for n, s in self.battery_inverters.items() },
             'solar_inverters': { n: s.to_dict() for n, s in self.solar_inverters.items() },
             'energy_meter': None if self.energy_meter is None else self.energy_meter.to_dict(),
+            'read_duration': self.read_duration_s,
+            'device_read_durations': self.device_read_durations_s,
+            'dispatch': self.dispatch,
+            'actuation_delay': self.actuation_delay_s,
+            'protection_ticks': self.protection_ticks,
+            'protection_clamps': self.protection_clamps,
+            'ticks': self.ticks,
+            'ticks_skipped': self.ticks_skipped,
+            'tick_lateness': self.tick_lateness.to_dict(),
+            'tick_duration': self.tick_duration.to_dict(),
         }
@@ -0,0 +1,63 @@
+# STATUS.PY
+#
+# Pre-encoded snapshots of the /api/ status. A controller publishes a new status once per control loop tick and
+# whenever its schedule or prices change, and it is encoded into a snapshot at most once in between: every poll is
+# answered from the same bytes, with a 304 when the client already holds them (If-None-Match) and gzip-compressed
+# when the client accepts it.
+#
+import gzip
+import hashlib
+import json
+from functools import cached_property
+from typing import Any, Optional
+
+from aiohttp import web
+
+
+GZIP_MIN_BYTES = 1024  # smaller bodies are sent uncompressed: gzip would barely shrink them
+GZIP_LEVEL = 6
+
+
+def encode_status(status: dict[str, Any], cls: Optional[type[json.JSONEncoder]] = None) -> bytes:
+    '''
+    Encode a status dict as a JSON object. Values that are bytes are taken to be JSON already, and are spliced in
+    as they are: parts of the status that rarely change (eg. prices) can be encoded once and re-used.
+    '''
+    plain = {k: v for k, v in status.items() if not isinstance(v, bytes)}
+    body = json.dumps(plain, cls=cls).encode('utf-8')
+    fragments = [json.dumps(k).encode('utf-8') + b': ' + v for k, v in status.items() if isinstance(v, bytes)]
+    if not fragments:
+        return body
+    return body[:-1] + (b', ' if plain else b'') + b', '.join(fragments) + b'}'
+
+
+class StatusSnapshot:
+    '''An immutable, encoded status: its JSON body, the gzip-compressed body (compressed once, on first use) and
+    a weak ETag, which is the same for both encodings'''
+
+    def __init__(self, body: bytes) -> None:
+        self.body = body
+        self.etag = f'W/"{hashlib.blake2b(body, digest_size=12).hexdigest()}"'
+
+    @cached_property
+    def gzipped(self) -> bytes:
+        return gzip.compress(self.body, compresslevel=GZIP_LEVEL, mtime=0)
+
+    def response(self, request: Optional[web.Request]) -> web.Response:
+        headers = {'ETag': self.etag, 'Cache-Control': 'no-cache', 'Vary': 'Accept-Encoding'}
+        if request is None:
+            return web.Response(body=self.body, content_type='application/json', headers=headers)
+
+        if_none_match = request.headers.get('If-None-Match')
+        if if_none_match is not None and self._matches(if_none_match):
+            return web.Response(status=304, headers=headers)
+
+        if len(self.body) >= GZIP_MIN_BYTES and 'gzip' in request.headers.get('Accept-Encoding', ''):
+            headers['Content-Encoding'] = 'gzip'
+            return web.Response(body=self.gzipped, content_type='application/json', headers=headers)
+        return web.Response(body=self.body, content_type='application/json', headers=headers)
+
+    def _matches(self, if_none_match: str) -> bool:
+        '''Weak comparison of the ETag with the entity tags of an If-None-Match header'''
+        tags = [t.strip() for t in if_none_match.split(',')]
+        return '*' in tags or any(t.removeprefix('W/') == self.etag.removeprefix('W/') for t in tags)
@@ -0,0 +1,160 @@
+# STREAM.PY
+#
+# Live push of the /api/ status over Server-Sent Events (GET /api/stream), so the web UI no longer has to poll.
+# A client first receives the full status, and from then on only what changed, once per control loop tick:
+#   event: status    the full status (as served by /api/)
+#   event: patch     a JSON merge patch (RFC 7386) of the status without its pre-encoded parts: the measurements,
+#                    the commanded power levels (stats.dispatch) and the other plain values that changed
+#   event: prices    the prices, whenever they (or the current price) changed
+#   event: schedule  the schedule, whenever it changed
+#
+# Every event is encoded once and the same bytes are queued to all clients. A client that cannot keep up (its queue
+# of SSE_QUEUE_EVENTS is full) has its queued events dropped, and is sent the full status instead once it catches up,
+# so a slow client costs a bounded amount of memory and never holds up the others or the control loop.
+#
+import asyncio
+import copy
+import json
+from typing import Any, Callable, Optional
+
+from aiohttp import web
+
+from common import Singleton
+from status import encode_status
+
+
+SSE_QUEUE_EVENTS = 32  # events queued per client; a client that falls further behind is resynced with the full status
+SSE_KEEPALIVE_S = 15.0  # comment sent when there were no events for this long, so proxies keep the connection open
+SSE_RETRY_MS = 3000  # reconnection delay for the browser after the stream was closed
+
+_RESYNC = b''  # queued in place of the dropped events of a client that fell behind
+_CLOSE = None  # queued to end the stream of a client
+
+
+def merge_patch(old: dict[str, Any], new: dict[str, Any]) -> Optional[dict[str, Any]]:
+    '''JSON merge patch (RFC 7386) that turns old into new, or None when they are equal. Keys that were removed are
+    set to None, so a value that became None is indistinguishable from one that was removed'''
+    patch = {}
+    for k, v in new.items():
+        if k not in old:
+            patch[k] = v
+        elif isinstance(v, dict) and isinstance(old[k], dict):
+            p = merge_patch(old[k], v)
+            if p is not None:
+                patch[k] = p
+        elif v != old[k]:
+            patch[k] = v
+    for k in old.keys() - new.keys():
+        patch[k] = None
+    return patch or None
+
+
+def sse_event(event: str, data: bytes) -> bytes:
+    '''Encode a server-sent event. data must be a single line, which holds for JSON encoded without indent'''
+    return b'event: ' + event.encode('utf-8') + b'\ndata: ' + data + b'\n\n'
+
+
+class _Client:
+    def __init__(self) -> None:
+        self.queue: asyncio.Queue[Optional[bytes]] = asyncio.Queue(maxsize=SSE_QUEUE_EVENTS)
+        self.lagging = False  # set while its queued events were dropped, until it is sent the full status
+
+    def put(self, chunk: Optional[bytes]) -> None:
+        if self.lagging and chunk is not _CLOSE:
+            return
+        try:
+            self.queue.put_nowait(chunk)
+        except asyncio.QueueFull:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.lagging = chunk is not _CLOSE
+            self.queue.put_nowait(_RESYNC if self.lagging else _CLOSE)
+
+
+class StatusStream(metaclass=Singleton):
+    '''Fans out the status published by the running controller to the clients of GET /api/stream'''
+
+    def __init__(self) -> None:
+        self._clients: set[_Client] = set()
+        self._source: Optional[Callable[[], dict[str, Any]]] = None  # returns the current status
+
+        # the status last sent to the clients: plain values (a copy) and pre-encoded values apart
+        self._plain: Optional[dict[str, Any]] = None
+        self._encoded: dict[str, bytes] = {}
+        self._full: Optional[bytes] = None  # 'status' event of it, encoded when first needed
+
+    @property
+    def clients(self) -> int:
+        return len(self._clients)
+
+    def publish(self, source: Callable[[], dict[str, Any]]) -> None:
+        '''Publish the status returned by source(): the changes since the last published status are sent to all
+        clients. Without clients, source is only stored (and called once a client connects)'''
+        self._source = source
+        if not self._clients:
+            self._plain, self._encoded, self._full = None, {}, None
+            return
+
+        plain, encoded = self._split(source())
+        old_plain, old_encoded = self._plain, self._encoded
+        self._plain, self._encoded, self._full = plain, encoded, None
+        if old_plain is None:  # nothing was sent yet
+            return
+
+        patch = merge_patch(old_plain, plain)
+        if patch is not None:
+            self._broadcast(sse_event('patch', json.dumps(patch).encode('utf-8')))
+        for k, v in encoded.items():
+            if old_encoded.get(k) != v:
+                self._broadcast(sse_event(k, v))
+
+    def close(self) -> None:
+        '''End the streams of all clients'''
+        for client in self._clients:
+            client.put(_CLOSE)
+
+    async def handle_stream(self, request: web.Request) -> web.StreamResponse:
+        resp = web.StreamResponse(headers={
+            'Content-Type': 'text/event-stream',
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no',  # HA ingress (nginx) must not buffer the stream
+        })
+        await resp.prepare(request)
+
+        client = _Client()
+        self._clients.add(client)
+        try:
+            await resp.write(f'retry: {SSE_RETRY_MS}\n\n'.encode('utf-8') + self._full_event())
+            while True:
+                try:
+                    chunk = await asyncio.wait_for(client.queue.get(), timeout=SSE_KEEPALIVE_S)
+                except asyncio.TimeoutError:
+                    chunk = b': keep-alive\n\n'
+                if chunk is _CLOSE:
+                    break
+                if chunk == _RESYNC:
+                    client.lagging = False
+                    chunk = self._full_event()
+                await resp.write(chunk)
+        except ConnectionResetError:  # the client went away
+            pass
+        finally:
+            self._clients.discard(client)
+        return resp
+
+    def _full_event(self) -> bytes:
+        if self._full is None:
+            if self._plain is None:
+                self._plain, self._encoded = self._split(self._source() if self._source is not None else {})
+            self._full = sse_event('status', encode_status({**self._plain, **self._encoded}))
+        return self._full
+
+    def _broadcast(self, chunk: bytes) -> None:
+        for client in self._clients:
+            client.put(chunk)
+
+    @staticmethod
+    def _split(status: dict[str, Any]) -> tuple[dict[str, Any], dict[str, bytes]]:
+        '''Split a status into a copy of its plain values and its pre-encoded (bytes) values'''
+        plain = copy.deepcopy({k: v for k, v in status.items() if not isinstance(v, bytes)})
+        return plain, {k: v for k, v in status.items() if isinstance(v, bytes)}
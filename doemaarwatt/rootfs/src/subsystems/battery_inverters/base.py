@@ -85,6 +85,13 @@ class BaseBatteryInverter(BaseInverter):
     async def read_charge_wh(self) -> Optional[float]:
         raise NotImplementedError
 
+    def degraded_stats(self) -> BatteryInverterStats:
+        '''Stats to record when the battery inverter could not be read: all metrics unknown'''
+        return BatteryInverterStats(
+            control_status=ControlStatus.DEGRADED,
+            ac_side={ self.connected_phase: SPCStats() },
+        )
+
     @property
     def power_limits_phase(self) -> tuple[float, float]:
         '''Lower (charge power) and upper (discharge power) limits for the battery inverter, expressed in Watts.
@@ -1,6 +1,6 @@
-from typing import Any
+from typing import Any, Optional
 
-from common import Logger, ConfigException
+from common import Logger, ConfigException, Clock
 from .base import BaseBatteryInverter
 from .sma_sunny_boy_storage import SmaSunnyBoyStorage
 from .sim_battery_inverter import SimBatteryInverter
@@ -17,10 +17,10 @@ BATTERY_INVERTER_DESCRIPTIONS = {
 }
 
 
-def create_battery_inverter(cfg: dict[str, Any], log: Logger) -> BaseBatteryInverter:
+def create_battery_inverter(cfg: dict[str, Any], log: Logger, clock: Optional[Clock] = None) -> BaseBatteryInverter:
     inverter_type = cfg.get('type', 'sim_battery_inverter')
     if inverter_type == 'sma_sunny_boy_storage':
         return SmaSunnyBoyStorage.from_config(cfg, log)
     elif inverter_type == 'sim_battery_inverter':
-        return SimBatteryInverter.from_config(cfg, log)
+        return SimBatteryInverter.from_config(cfg, log, clock)
     raise ConfigException(f'unknown battery inverter type: {inverter_type}', source='battery inverter instantiation')
@@ -1,10 +1,8 @@
-import asyncio
 from typing import Any, Optional
 import random
-import time
 
 from .base import BaseBatteryInverter, BatteryInverterStats, BatteryStats, BatteryStatus
-from common import Logger, ControlStatus, Phase, SPCStats, SINGLE_PHASES
+from common import Logger, ControlStatus, Phase, SPCStats, SINGLE_PHASES, Clock
 
 
 IO_LATENCY = 0.1 # simulated IO delay
@@ -22,23 +20,25 @@ class SimBatteryInverter(BaseBatteryInverter):
         log: Logger,
         charge_max_pct: float = 95.0,
         charge_min_pct: float = 10.0,
+        clock: Optional[Clock] = None,
     ) -> None:
         super().__init__(name, connected_phase, capacity_wh, charge_limit_w, discharge_limit_w, log,
                          charge_max_pct=charge_max_pct, charge_min_pct=charge_min_pct)
+        self.clock = clock if clock is not None else Clock()
 
         self.is_connected = False
         self.is_controlled = False
 
         self.charge_power = 0.0
         self.current_charge_wh: Optional[float] = None
-        self.last_read_ts = time.time()
+        self.last_read_ts = self.clock.time()
 
         self.temp = random.uniform(19.0, 21.0)
         self.temp_l = self.temp
         self.temp_h = self.temp
 
     @classmethod
-    def from_config(cls, cfg: dict[str, Any], log: Logger) -> 'SimBatteryInverter':
+    def from_config(cls, cfg: dict[str, Any], log: Logger, clock: Optional[Clock] = None) -> 'SimBatteryInverter':
         return cls(
             name=cfg['name'],
             connected_phase=cfg['connected_phase'],
@@ -48,10 +48,11 @@ class SimBatteryInverter(BaseBatteryInverter):
             log=log,
             charge_max_pct=cfg.get('battery_charge_max_pct', 95.0),
             charge_min_pct=cfg.get('battery_charge_min_pct', 10.0),
+            clock=clock,
         )
 
     async def _io_delay(self):
-        await asyncio.sleep(random.uniform(0.9 * IO_LATENCY, 1.1 * IO_LATENCY))
+        await self.clock.sleep(random.uniform(0.9 * IO_LATENCY, 1.1 * IO_LATENCY))
 
     def _simulate_temperature(self):
         new_temp = random.uniform(19.0, 21.0)
@@ -68,7 +69,7 @@ class SimBatteryInverter(BaseBatteryInverter):
 
         self._simulate_temperature()
 
-        self.last_read_ts = time.time()
+        self.last_read_ts = self.clock.time()
 
     def close(self) -> None:
         self.is_connected = False
@@ -101,7 +102,7 @@ class SimBatteryInverter(BaseBatteryInverter):
         if self.current_charge_wh is None:
             return
 
-        now = time.time()
+        now = self.clock.time()
         lapsed_hours = (now - self.last_read_ts) / 3600.0
         self.last_read_ts = now
 
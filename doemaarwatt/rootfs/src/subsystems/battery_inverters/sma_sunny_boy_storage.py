@@ -1,7 +1,7 @@
 from typing import Any, Optional
 
 from .base import BaseBatteryInverter, BatteryInverterStats, BatteryStatus, BatteryStats
-from common import Logger, ModbusManager, to_s32_list, ControlStatus, Phase, SPCStats, ConfigException
+from common import Logger, LogLevel, ModbusManager, Register, RegisterMap, to_s32_list, ControlStatus, Phase, SPCStats, ConfigException
 
 
 _AC_REG_MAP = {
@@ -10,11 +10,27 @@ _AC_REG_MAP = {
     Phase.L3: {'p': 30781, 'v': 30787, 'a': 30981},
 }
 
+_BATTERY_REGISTERS = {
+    'temp_h': Register(32221, 'S32', 'TEMP'),
+    'temp_l': Register(32227, 'S32', 'TEMP'),
+    'charge': Register(32233, 'U32', 'FIX2'),
+    'voltage': Register(30851, 'U32', 'FIX2'),
+    'current': Register(30843, 'S32', 'FIX3'),
+}
+
+# the storage refuses reads of the addresses in between its battery temperatures and charge
+_UNSUPPORTED = [(32223, 32227), (32229, 32233)]
+
+_CHARGE_REGISTERS = RegisterMap({'charge': Register(32233, 'U32', 'FIX2')})
+
 # Commanding a zero charge/discharge power does not seem to work and relinquishes control of the battery inverter
 # So instead when the schedule / user dictates that the battery inverter should remain standby, we command
 # a very small charging power of 50 W
 STANDBY_CHARGE = -50
 
+# A new charge/discharge setpoint within this many W of the last one written is not sent to the inverter
+SETPOINT_DEADBAND_W = 10
+
 
 class SmaSunnyBoyStorage(BaseBatteryInverter):
 
@@ -42,6 +58,13 @@ class SmaSunnyBoyStorage(BaseBatteryInverter):
             log=log,
         )
 
+        ac_registers = _AC_REG_MAP[connected_phase]
+        self._registers = RegisterMap(_BATTERY_REGISTERS | {
+            'ac_pow': Register(ac_registers['p'], 'S32', 'FIX0'),
+            'ac_vol': Register(ac_registers['v'], 'U32', 'FIX2'),
+            'ac_amp': Register(ac_registers['a'], 'S32', 'FIX3'),
+        }, unsupported=_UNSUPPORTED)
+
     @classmethod
     def from_config(cls, cfg: dict[str, Any], log: Logger) -> 'SmaSunnyBoyStorage':
         return cls(
@@ -63,28 +86,27 @@ class SmaSunnyBoyStorage(BaseBatteryInverter):
     def close(self) -> None:
         self._modbus.close()
 
+    def reconnect(self) -> None:
+        self._modbus.reconnect()
+
     async def enable_control(self) -> None:
         await self._modbus.write_registers_parallel(40151, [0, 802])
 
     async def relinquish_control(self) -> None:
-        await self._modbus.write_registers_parallel(40149, [0, 0])
-        await self._modbus.write_registers_parallel(40151, [0, 803])
+        try:
+            await self._modbus.write_registers_parallel(40149, [0, 0], force=True)
+            await self._modbus.write_registers_parallel(40151, [0, 803], force=True)
+        finally:
+            self._modbus.invalidate()  # regaining control must write every register again
 
     async def read_stats(self) -> BatteryInverterStats:
 
-        temp_h = await self._modbus.read_register(self.name, 32221, 'S32', device_id=3, sma_format='TEMP')
-        temp_l = await self._modbus.read_register(self.name, 32227, 'S32', device_id=3, sma_format='TEMP')
-        charge = await self._modbus.read_register(self.name, 32233, 'U32', device_id=3, sma_format='FIX2')
-        voltage = await self._modbus.read_register(self.name, 30851, 'U32', device_id=3, sma_format='FIX2')
-        current = await self._modbus.read_register(self.name, 30843, 'S32', device_id=3, sma_format='FIX3')
+        r = await self._modbus.read_block(self.name, self._registers, device_id=3)
+        temp_h, temp_l, charge, voltage, current = r['temp_h'], r['temp_l'], r['charge'], r['voltage'], r['current']
+        ac_pow, ac_vol, ac_amp = r['ac_pow'], r['ac_vol'], r['ac_amp']
         if charge is not None:
             charge *= 10  # fix for now
 
-        registers = _AC_REG_MAP[self.connected_phase]
-        ac_pow = await self._modbus.read_register(self.name, registers['p'], 'S32', device_id=3, sma_format='FIX0')
-        ac_vol = await self._modbus.read_register(self.name, registers['v'], 'U32', device_id=3, sma_format='FIX2')
-        ac_amp = await self._modbus.read_register(self.name, registers['a'], 'S32', device_id=3, sma_format='FIX3')
-
         bat_status = BatteryStatus.STANDBY
         if charge is None:
             bat_status = BatteryStatus.DISCONNECTED
@@ -97,11 +119,13 @@ class SmaSunnyBoyStorage(BaseBatteryInverter):
             v is None for v in [temp_h, temp_l, voltage, current, ac_pow, ac_vol, ac_amp]
         ) else ControlStatus.NOMINAL
 
-        self.log.debug(f'{self.name} (connected to {self.connected_phase}):')
-        if current is None or voltage is None or ac_amp is None or ac_vol is None or ac_pow is None:
+        missing = current is None or voltage is None or ac_amp is None or ac_vol is None or ac_pow is None
+        if self.log.enabled(LogLevel.DEBUG):
+            self.log.debug(f'{self.name} (connected to {self.connected_phase}):')
+        if missing:
             self.log.error(f'\tbattery:\t{current} A\t{voltage} V\t{bat_status}\t - \t{temp_l} {chr(176)}C - {temp_h} {chr(176)}C')
             self.log.error(f'\tAC side:\t{ac_amp} A\t{ac_vol} V\t{ac_pow} W')
-        else:
+        elif self.log.enabled(LogLevel.DEBUG):
             if charge is None:
                 self.log.debug(f'\tbattery:\t{current:.2f} A\t{voltage:.1f} V\t{bat_status}\t - \t{temp_l} {chr(176)}C - {temp_h} {chr(176)}C')
             else:
@@ -126,10 +150,10 @@ class SmaSunnyBoyStorage(BaseBatteryInverter):
         if power_w == 0:
             power_w = STANDBY_CHARGE
 
-        await self._modbus.write_register(self.name, 40149, to_s32_list(power_w))
+        await self._modbus.write_register(self.name, 40149, to_s32_list(power_w), deadband=SETPOINT_DEADBAND_W)
 
     async def read_charge_wh(self) -> Optional[float]:
-        charge_pct = await self._modbus.read_register(self.name, 32233, 'U32', device_id=3, sma_format='FIX2')
+        charge_pct = (await self._modbus.read_block(self.name, _CHARGE_REGISTERS, device_id=3))['charge']
         if charge_pct is None:
             return None
         return self.capacity_wh * (charge_pct * 10) / 100.0
@@ -2,7 +2,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Optional, Any
 
-from common import Logger, ControlStatus, Phase, SPCStats
+from common import Logger, ControlStatus, Phase, SPCStats, SINGLE_PHASES
 
 
 def _phase_status(power: Optional[float]) -> str:
@@ -52,6 +52,19 @@ class BaseEnergyMeter(ABC):
     def close(self) -> None:
         raise NotImplementedError
 
+    def reconnect(self) -> None:
+        '''Drop the connection to the energy meter after a request failed or was abandoned; it is re-established
+        when next used. Nothing to do for energy meters without one'''
+        pass
+
     @abstractmethod
     async def read_stats(self) -> EnergyMeterStats:
         raise NotImplementedError
+
+    def degraded_stats(self) -> EnergyMeterStats:
+        '''Stats to record when the energy meter could not be read: all grid measurements unknown'''
+        return EnergyMeterStats(
+            control_status=ControlStatus.DEGRADED,
+            max_fuse_a=self.max_fuse_a,
+            grid={ phi: SPCStats() for phi in SINGLE_PHASES },
+        )
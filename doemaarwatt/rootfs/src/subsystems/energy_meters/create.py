@@ -1,6 +1,6 @@
-from typing import Any
+from typing import Any, Optional
 
-from common import Logger, ConfigException
+from common import Logger, ConfigException, Clock
 from .base import BaseEnergyMeter
 from .sma_data_manager import SmaDataManager
 from .sim_energy_meter import SimEnergyMeter
@@ -17,10 +17,10 @@ ENERGY_METER_DESCRIPTIONS = {
 }
 
 
-def create_energy_meter(cfg: dict[str, Any], log: Logger) -> BaseEnergyMeter:
+def create_energy_meter(cfg: dict[str, Any], log: Logger, clock: Optional[Clock] = None) -> BaseEnergyMeter:
     meter_type = cfg.get('type', 'sma_data_manager')
     if meter_type == 'sma_data_manager':
         return SmaDataManager.from_config(cfg, log)
     elif meter_type == 'sim_energy_meter':
-        return SimEnergyMeter.from_config(cfg, log)
+        return SimEnergyMeter.from_config(cfg, log, clock)
     raise ConfigException(f'unknown energy meter type: {meter_type}', source='energy meter instantiation')
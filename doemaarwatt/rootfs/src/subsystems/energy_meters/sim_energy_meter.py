@@ -1,8 +1,7 @@
-import asyncio
 import random
-from typing import Any
+from typing import Any, Optional
 
-from common import Logger, ControlStatus, Phase, SPCStats
+from common import Logger, ControlStatus, Phase, SPCStats, Clock
 from .base import BaseEnergyMeter, EnergyMeterStats
 
 
@@ -11,20 +10,22 @@ IO_LATENCY = 0.1  # simulated IO delay
 
 class SimEnergyMeter(BaseEnergyMeter):
 
-    def __init__(self, name: str, max_fuse_a: int, log: Logger) -> None:
+    def __init__(self, name: str, max_fuse_a: int, log: Logger, clock: Optional[Clock] = None) -> None:
         super().__init__(name, max_fuse_a, log)
+        self.clock = clock if clock is not None else Clock()
         self.is_connected = False
 
     @classmethod
-    def from_config(cls, cfg: dict[str, Any], log: Logger) -> 'SimEnergyMeter':
+    def from_config(cls, cfg: dict[str, Any], log: Logger, clock: Optional[Clock] = None) -> 'SimEnergyMeter':
         return cls(
             name=cfg.get('name', 'Simulated Energy Meter'),
             max_fuse_a=cfg.get('max_fuse_current', 25),
             log=log,
+            clock=clock,
         )
 
     async def _io_delay(self):
-        await asyncio.sleep(random.uniform(0.9 * IO_LATENCY, 1.1 * IO_LATENCY))
+        await self.clock.sleep(random.uniform(0.9 * IO_LATENCY, 1.1 * IO_LATENCY))
 
     async def connect(self) -> None:
         await self._io_delay()
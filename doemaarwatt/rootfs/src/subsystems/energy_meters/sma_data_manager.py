@@ -2,12 +2,24 @@ from typing import Any
 
 from prettytable import PrettyTable
 
-from common import Logger, ModbusManager, ControlStatus, Phase, SPCStats
+from common import Logger, LogLevel, ModbusManager, Register, RegisterMap, ControlStatus, Phase, SPCStats
 from .base import BaseEnergyMeter, EnergyMeterStats, _phase_status
 
 
 DEVICE_ID = 2  # SMA Data Manager Modbus device ID
 
+_REGISTERS = RegisterMap({
+    'l1_power': Register(31503, 'S32', 'FIX0'),
+    'l2_power': Register(31505, 'S32', 'FIX0'),
+    'l3_power': Register(31507, 'S32', 'FIX0'),
+    'l1_voltage': Register(31529, 'U32', 'FIX2'),
+    'l2_voltage': Register(31531, 'U32', 'FIX2'),
+    'l3_voltage': Register(31533, 'U32', 'FIX2'),
+    'l1_current': Register(31535, 'S32', 'FIX3'),
+    'l2_current': Register(31537, 'S32', 'FIX3'),
+    'l3_current': Register(31539, 'S32', 'FIX3'),
+}, unsupported=[(31509, 31529)])  # the Data Manager refuses reads of the addresses in between power and voltage
+
 
 class SmaDataManager(BaseEnergyMeter):
 
@@ -34,35 +46,32 @@ class SmaDataManager(BaseEnergyMeter):
     def close(self) -> None:
         self._modbus.close()
 
+    def reconnect(self) -> None:
+        self._modbus.reconnect()
+
     async def read_stats(self) -> EnergyMeterStats:
         self.log.debug('reading data manager properties:')
 
-        l1_current = await self._modbus.read_register(self.name, 31535, 'S32', device_id=DEVICE_ID, sma_format='FIX3')
-        l2_current = await self._modbus.read_register(self.name, 31537, 'S32', device_id=DEVICE_ID, sma_format='FIX3')
-        l3_current = await self._modbus.read_register(self.name, 31539, 'S32', device_id=DEVICE_ID, sma_format='FIX3')
-
-        l1_voltage = await self._modbus.read_register(self.name, 31529, 'U32', device_id=DEVICE_ID, sma_format='FIX2')
-        l2_voltage = await self._modbus.read_register(self.name, 31531, 'U32', device_id=DEVICE_ID, sma_format='FIX2')
-        l3_voltage = await self._modbus.read_register(self.name, 31533, 'U32', device_id=DEVICE_ID, sma_format='FIX2')
-
-        l1_power = await self._modbus.read_register(self.name, 31503, 'S32', device_id=DEVICE_ID, sma_format='FIX0')
-        l2_power = await self._modbus.read_register(self.name, 31505, 'S32', device_id=DEVICE_ID, sma_format='FIX0')
-        l3_power = await self._modbus.read_register(self.name, 31507, 'S32', device_id=DEVICE_ID, sma_format='FIX0')
-
-        mf = self.max_fuse_a
-        table = PrettyTable()
-        table.add_column('', ['Current', 'Max Current', 'Voltage', 'Power', 'Status'])
-        for label, current, voltage, power in [
-            ('L1', l1_current, l1_voltage, l1_power),
-            ('L2', l2_current, l2_voltage, l2_power),
-            ('L3', l3_current, l3_voltage, l3_power),
-        ]:
-            if current is None or voltage is None or power is None:
-                table.add_column(label, [str(current), f'{mf} A', str(voltage), str(power), _phase_status(power)])
-            else:
-                table.add_column(label, [f'{current:.2f}', f'{mf} A', f'{voltage:.1f} V', f'{power:.0f} W', _phase_status(power)])
-            table.align[label] = 'r'
-        self.log.debug(str(table))
+        r = await self._modbus.read_block(self.name, _REGISTERS, device_id=DEVICE_ID)
+        l1_current, l2_current, l3_current = r['l1_current'], r['l2_current'], r['l3_current']
+        l1_voltage, l2_voltage, l3_voltage = r['l1_voltage'], r['l2_voltage'], r['l3_voltage']
+        l1_power, l2_power, l3_power = r['l1_power'], r['l2_power'], r['l3_power']
+
+        if self.log.enabled(LogLevel.DEBUG):
+            mf = self.max_fuse_a
+            table = PrettyTable()
+            table.add_column('', ['Current', 'Max Current', 'Voltage', 'Power', 'Status'])
+            for label, current, voltage, power in [
+                ('L1', l1_current, l1_voltage, l1_power),
+                ('L2', l2_current, l2_voltage, l2_power),
+                ('L3', l3_current, l3_voltage, l3_power),
+            ]:
+                if current is None or voltage is None or power is None:
+                    table.add_column(label, [str(current), f'{mf} A', str(voltage), str(power), _phase_status(power)])
+                else:
+                    table.add_column(label, [f'{current:.2f}', f'{mf} A', f'{voltage:.1f} V', f'{power:.0f} W', _phase_status(power)])
+                table.align[label] = 'r'
+            self.log.debug(str(table))
 
         control_status = ControlStatus.DEGRADED if any(v is None for v in [
             l1_current, l2_current, l3_current,
@@ -2,7 +2,7 @@ from abc import abstractmethod
 from dataclasses import dataclass, field
 from typing import Optional
 
-from common import Logger, ControlStatus, Phase, SPCStats, BaseInverter
+from common import Logger, ControlStatus, Phase, SPCStats, SINGLE_PHASES, BaseInverter
 
 
 @dataclass
@@ -32,3 +32,10 @@ class BaseSolarInverter(BaseInverter):
         A connection needs to be present as a precondition.
         '''
         raise NotImplementedError
+
+    def degraded_stats(self) -> SolarInverterStats:
+        '''Stats to record when the solar inverter could not be read: all metrics unknown'''
+        return SolarInverterStats(
+            control_status=ControlStatus.DEGRADED,
+            ac_side={ phi: SPCStats() for phi in (SINGLE_PHASES if self.connected_phase == Phase.ALL else [self.connected_phase]) },
+        )
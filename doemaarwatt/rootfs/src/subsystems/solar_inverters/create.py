@@ -1,6 +1,6 @@
-from typing import Any
+from typing import Any, Optional
 
-from common import Logger, ConfigException
+from common import Logger, ConfigException, Clock
 from .base import BaseSolarInverter
 from .sma_solar_inverter import SmaSolarInverter
 from .sim_solar_inverter import SimSolarInverter
@@ -17,10 +17,10 @@ SOLAR_INVERTER_DESCRIPTIONS = {
 }
 
 
-def create_solar_inverter(cfg: dict[str, Any], log: Logger) -> BaseSolarInverter:
+def create_solar_inverter(cfg: dict[str, Any], log: Logger, clock: Optional[Clock] = None) -> BaseSolarInverter:
     inverter_type = cfg.get('type', 'sma')
     if inverter_type == 'sma_stp_x25':
         return SmaSolarInverter.from_config(cfg, log)
     elif inverter_type == 'sim_solar_inverter':
-        return SimSolarInverter.from_config(cfg, log)
+        return SimSolarInverter.from_config(cfg, log, clock)
     raise ConfigException(f'unknown solar inverter type: {inverter_type}', source='solar inverter instantiation')
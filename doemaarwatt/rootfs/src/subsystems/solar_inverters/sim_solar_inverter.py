@@ -1,10 +1,9 @@
-import asyncio
 import math
 from datetime import datetime
 from typing import Any, Optional
 import random
 
-from common import Logger, ControlStatus, Phase, SPCStats, ProgrammingError, ControlException
+from common import Logger, ControlStatus, Phase, SPCStats, ProgrammingError, ControlException, Clock
 from .base import BaseSolarInverter, SolarInverterStats
 
 
@@ -16,9 +15,8 @@ SUNSET_H  = 20.5          # 20:30 local time
 SOLAR_NOON_H = 13.0       # hour of peak irradiance
 
 
-def _solar_power(peak_w: float) -> float:
-    """Return simulated solar output (W) for the current wall-clock time using a half-sine curve."""
-    now = datetime.now()
+def _solar_power(peak_w: float, now: datetime) -> float:
+    """Return simulated solar output (W) for the given (local) time using a half-sine curve."""
     h = now.hour + now.minute / 60.0 + now.second / 3600.0
 
     if h <= SUNRISE_H or h >= SUNSET_H:
@@ -40,8 +38,10 @@ class SimSolarInverter(BaseSolarInverter):
         name: str,
         connected_phase: Phase,
         log: Logger,
+        clock: Optional[Clock] = None,
     ) -> None:
         super().__init__(name, connected_phase, log)
+        self.clock = clock if clock is not None else Clock()
 
         self.is_connected = False
         self.is_controlled = False
@@ -53,11 +53,12 @@ class SimSolarInverter(BaseSolarInverter):
         self.power_setpoint: Optional[float] = None
 
     @classmethod
-    def from_config(cls, cfg: dict[str, Any], log: Logger) -> 'SimSolarInverter':
+    def from_config(cls, cfg: dict[str, Any], log: Logger, clock: Optional[Clock] = None) -> 'SimSolarInverter':
         return cls(
             name=cfg.get('name', 'Simulated 30kW Solar Inverter'),
             connected_phase=cfg.get('connected_phase', Phase.ALL),
             log=log,
+            clock=clock,
         )
 
     @property
@@ -68,7 +69,7 @@ class SimSolarInverter(BaseSolarInverter):
         )
 
     async def _io_delay(self):
-        await asyncio.sleep(random.uniform(0.9 * IO_LATENCY, 1.1 * IO_LATENCY))
+        await self.clock.sleep(random.uniform(0.9 * IO_LATENCY, 1.1 * IO_LATENCY))
 
     async def connect(self) -> None:
         await self._io_delay()
@@ -96,7 +97,7 @@ class SimSolarInverter(BaseSolarInverter):
         await self._io_delay()
 
         # natural (uncurtailed) output the array could deliver on each connected phase right now
-        natural = _solar_power(PEAK_POWER_W)
+        natural = _solar_power(PEAK_POWER_W, self.clock.now())
 
         if self.connected_phase.is_single_phase:
             # No cap (None) -> run at natural output; otherwise the setpoint caps this phase (0 -> zero output).
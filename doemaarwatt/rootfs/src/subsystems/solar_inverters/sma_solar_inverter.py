@@ -1,9 +1,22 @@
 from typing import Any
 
-from common import Logger, ModbusManager, to_u32_list, ControlStatus, Phase, SPCStats, ProgrammingError, ControlException
+from common import Logger, LogLevel, ModbusManager, Register, RegisterMap, to_u32_list, ControlStatus, Phase, SPCStats, ProgrammingError, ControlException
 from .base import BaseSolarInverter, SolarInverterStats
 
 
+_REGISTERS = RegisterMap({
+    'total_pow': Register(30775, 'S32', 'FIX0'),
+    'l1_pow': Register(30777, 'S32', 'FIX0'),
+    'l2_pow': Register(30779, 'S32', 'FIX0'),
+    'l3_pow': Register(30781, 'S32', 'FIX0'),
+    'setpoint_limit': Register(30837, 'U32', 'FIX0'),
+})
+
+
+# A new active-power limit within this many W of the last one written is not sent to the inverter
+SETPOINT_DEADBAND_W = 25
+
+
 class SmaSolarInverter(BaseSolarInverter):
 
     def __init__(self,
@@ -56,9 +69,12 @@ class SmaSolarInverter(BaseSolarInverter):
 
         self._modbus.close()
 
+    def reconnect(self) -> None:
+        self._modbus.reconnect()
+
     async def enable_control(self) -> None:
-        if not self.is_connected:
-            raise ControlException(f'unable to assert control, not connected', source=self.name)
+        if not self.is_connected:  # connecting failed earlier: try again, control cannot be asserted without it
+            await self.connect()
 
         # Use the "manual active-power preset in Watts" scheme: WMod (40210) = 1077. The setpoint is then a W
         # value written to WCnstCfg.W (40212) and read back from 30837 (all in W). This replaces the previous
@@ -76,17 +92,20 @@ class SmaSolarInverter(BaseSolarInverter):
 
         self.is_controlled = False
 
-        # WMod = 303 (Off): stop the active-power preset so the inverter runs unlimited again
-        await self._modbus.write_register(self.name, 40210, to_u32_list(303), device_id=self._device_id)
+        try:
+            # WMod = 303 (Off): stop the active-power preset so the inverter runs unlimited again
+            await self._modbus.write_register(self.name, 40210, to_u32_list(303), device_id=self._device_id, force=True)
 
-        # keep the external-communication channel off as well (defensive; it is not used in the manual scheme)
-        await self._modbus.write_register(self.name, 41383, to_u32_list(303), device_id=self._device_id)
+            # keep the external-communication channel off as well (defensive; it is not used in the manual scheme)
+            await self._modbus.write_register(self.name, 41383, to_u32_list(303), device_id=self._device_id, force=True)
+        finally:
+            self._modbus.invalidate()  # regaining control must write every register again
 
     async def read_stats(self) -> SolarInverterStats:
         # setpoint is read back from WCnstCfg.W (30837) - the same manual active-power preset set_power() writes
-        total_pow, l1_pow, l2_pow, l3_pow, setpoint_limit = await self._modbus.read_register_seq(self.name, [
-            (30775, 'S32', 'FIX0'), (30777, 'S32', 'FIX0'), (30779, 'S32', 'FIX0'), (30781, 'S32', 'FIX0'), (30837, 'U32', 'FIX0'),
-        ], device_id=self._device_id)
+        r = await self._modbus.read_block(self.name, _REGISTERS, device_id=self._device_id)
+        total_pow, l1_pow, l2_pow, l3_pow = r['total_pow'], r['l1_pow'], r['l2_pow'], r['l3_pow']
+        setpoint_limit = r['setpoint_limit']
 
         control_status = ControlStatus.DEGRADED if any(
             v is None for v in [total_pow, l1_pow, l2_pow, l3_pow]
@@ -94,7 +113,7 @@ class SmaSolarInverter(BaseSolarInverter):
 
         if l1_pow is None or l2_pow is None or l3_pow is None or total_pow is None:
             self.log.error(f'solar inverter: L1={l1_pow} W  L2={l2_pow} W  L3={l3_pow} W  total={total_pow} W')
-        else:
+        elif self.log.enabled(LogLevel.DEBUG):
             self.log.debug(f'solar inverter: L1={l1_pow:.0f} W  L2={l2_pow:.0f} W  L3={l3_pow:.0f} W  total={total_pow:.0f} W')
 
         return SolarInverterStats(
@@ -118,4 +137,5 @@ class SmaSolarInverter(BaseSolarInverter):
         elif power_w > 25_000:
             raise ProgrammingError('exceeds power set point for this solar inverter', source=self.name)
 
-        await self._modbus.write_register(self.name, 40212, to_u32_list(int(power_w)), device_id=self._device_id)
+        await self._modbus.write_register(self.name, 40212, to_u32_list(int(power_w)), device_id=self._device_id,
+                                          deadband=SETPOINT_DEADBAND_W)
@@ -0,0 +1,187 @@
+# TELEMETRY.PY
+#
+# In-memory time series of the measurements taken every control loop tick. Samples are kept in fixed-size NumPy
+# ring buffers: the raw samples, plus 1-minute and 15-minute rollups (min/mean/max) that are built as the samples
+# come in. Memory use is bounded by the ring capacities, and queries return columnar data.
+#
+import json
+import math
+import time
+from datetime import datetime as dt
+from typing import Any, Callable, Optional
+
+import numpy as np
+from aiohttp import web
+
+from common import Singleton, SINGLE_PHASES
+from stats import ControllerStats
+
+
+# Recorded measurements, in column order. Totals are summed over all devices; the SoC is averaged over the batteries
+COLUMNS = (
+    *(f'grid_power_{phi.value}' for phi in SINGLE_PHASES),
+    *(f'grid_voltage_{phi.value}' for phi in SINGLE_PHASES),
+    'battery_power',
+    'battery_charge_pct',
+    'solar_power',
+)
+
+RAW_CAPACITY = 17_280  # 1 day of samples at a 5 s loop delay
+RESOLUTIONS = {  # rollup name -> (resolution in seconds, capacity)
+    '1m': (60, 10_080),  # 1 week
+    '15m': (900, 8_640),  # 90 days
+}
+
+
+class _Ring:
+    '''Fixed-capacity ring buffer of timestamped rows of one or more float64 arrays with len(COLUMNS) columns'''
+
+    def __init__(self, capacity: int, fields: tuple[str, ...]) -> None:
+        self.capacity = capacity
+        self.ts = np.zeros(capacity, dtype=np.float64)
+        self.fields = { f: np.full((capacity, len(COLUMNS)), np.nan, dtype=np.float64) for f in fields }
+        self.head = 0  # index of the next row to write
+        self.size = 0
+
+    def append(self, ts: float, **rows: np.ndarray) -> None:
+        self.ts[self.head] = ts
+        for f, row in rows.items():
+            self.fields[f][self.head] = row
+        self.head = (self.head + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+
+    def select(self, frm: float, to: float) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+        '''Return the timestamps and field arrays of the rows with frm <= ts < to, oldest first'''
+        start = (self.head - self.size) % self.capacity
+        order = (start + np.arange(self.size)) % self.capacity
+        ts = self.ts[order]
+        lo, hi = np.searchsorted(ts, [frm, to], side='left')
+        rows = order[lo:hi]
+        return ts[lo:hi], { f: a[rows] for f, a in self.fields.items() }
+
+
+class _Rollup:
+    '''Downsamples incoming samples into fixed time buckets with the min, mean and max of each column'''
+
+    def __init__(self, resolution: int, capacity: int) -> None:
+        self.resolution = resolution
+        self.ring = _Ring(capacity, ('min', 'mean', 'max'))
+        self._bucket: Optional[int] = None
+        self._reset()
+
+    def _reset(self) -> None:
+        n = len(COLUMNS)
+        self._sum, self._count = np.zeros(n), np.zeros(n)
+        self._min, self._max = np.full(n, np.inf), np.full(n, -np.inf)
+
+    def add(self, ts: float, values: np.ndarray) -> Optional[tuple[float, dict[str, np.ndarray]]]:
+        '''Add a sample. Returns the (start time, aggregates) of the bucket it closed, if any'''
+        closed = None
+        bucket = int(ts // self.resolution)
+        if self._bucket is not None and bucket != self._bucket:
+            closed = self.flush()
+        self._bucket = bucket
+
+        known = ~np.isnan(values)
+        self._sum[known] += values[known]
+        self._count[known] += 1
+        np.fmin(self._min, values, out=self._min)
+        np.fmax(self._max, values, out=self._max)
+        return closed
+
+    def flush(self) -> Optional[tuple[float, dict[str, np.ndarray]]]:
+        '''Close the current bucket, storing its aggregates under the bucket's start time'''
+        if self._bucket is None:
+            return None
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = self._sum / self._count  # NaN for columns without any measurement
+        known = self._count > 0
+        ts, aggregates = self._bucket * self.resolution, {
+            'min': np.where(known, self._min, np.nan), 'mean': mean, 'max': np.where(known, self._max, np.nan),
+        }
+        self.ring.append(ts, **aggregates)
+        self._bucket = None
+        self._reset()
+        return ts, aggregates
+
+
+class Telemetry(metaclass=Singleton):
+    '''
+    Time series of grid, battery and solar measurements, recorded once per control loop tick. Shared by all
+    controllers (a mode change keeps the history) and served at /api/history.
+    '''
+
+    def __init__(self) -> None:
+        self.raw = _Ring(RAW_CAPACITY, ('value',))
+        self.rollups = { name: _Rollup(res, cap) for name, (res, cap) in RESOLUTIONS.items() }
+
+        # called with (resolution name, bucket start time, aggregates) for every completed rollup bucket
+        self.on_rollup: Optional[Callable[[str, float, dict[str, np.ndarray]], None]] = None
+
+    def record(self, stats: ControllerStats, ts: Optional[float] = None) -> None:
+        '''Record the latest stats as one sample (at ts, in epoch seconds; default: now)'''
+        ts = time.time() if ts is None else ts
+        values = self._sample(stats)
+        self.raw.append(ts, value=values)
+        for name, rollup in self.rollups.items():
+            closed = rollup.add(ts, values)
+            if closed is not None and self.on_rollup is not None:
+                self.on_rollup(name, *closed)
+
+    def query(self, frm: float, to: float, res: str = 'raw') -> dict[str, Any]:
+        '''Return the samples in [frm, to) at the given resolution ('raw' or a rollup name) as columns of values'''
+        if res == 'raw':
+            ts, fields = self.raw.select(frm, to)
+            columns = { c: self._to_list(fields['value'][:, i]) for i, c in enumerate(COLUMNS) }
+        elif res in self.rollups:
+            ts, fields = self.rollups[res].ring.select(frm, to)
+            columns = { c: { f: self._to_list(a[:, i]) for f, a in fields.items() } for i, c in enumerate(COLUMNS) }
+        else:
+            raise ValueError(f'unknown resolution: {res} (expected raw, {", ".join(self.rollups)})')
+
+        return {'res': res, 'ts': ts.tolist(), 'columns': columns}
+
+    def finest_resolution(self, frm: float) -> str:
+        '''Return the finest resolution that still holds samples as old as frm'''
+        for res, ring in [('raw', self.raw), *((n, r.ring) for n, r in self.rollups.items())]:
+            if ring.size < ring.capacity or ring.ts[ring.head] <= frm:  # not wrapped yet, or oldest row old enough
+                return res
+        return list(self.rollups)[-1]
+
+    async def handle_history(self, req: web.Request) -> web.Response:
+        try:
+            to = self._parse_time(req.query['to']) if 'to' in req.query else time.time()
+            frm = self._parse_time(req.query['from']) if 'from' in req.query else to - 3600
+            res = req.query.get('res') or self.finest_resolution(frm)
+            return web.json_response(self.query(frm, to, res))
+
+        except Exception as e:
+            raise web.HTTPBadRequest(text=json.dumps({'status': 'error', 'msg': str(e)}))
+
+    @staticmethod
+    def _sample(stats: ControllerStats) -> np.ndarray:
+        def total(powers: list[Optional[float]]) -> float:
+            return math.nan if not powers or None in powers else sum(powers)  # type: ignore
+
+        grid = stats.energy_meter.grid if stats.energy_meter is not None else {}
+        charges = [s.battery.battery_charge_pct for s in stats.battery_inverters.values()]
+        known_charges = [c for c in charges if c is not None]
+        return np.array([
+            *(grid[phi].power if phi in grid and grid[phi].power is not None else math.nan for phi in SINGLE_PHASES),
+            *(grid[phi].voltage if phi in grid and grid[phi].voltage is not None else math.nan for phi in SINGLE_PHASES),
+            total([p.power for s in stats.battery_inverters.values() for p in s.ac_side.values()]),
+            sum(known_charges) / len(known_charges) if known_charges else math.nan,
+            total([p.power for s in stats.solar_inverters.values() for p in s.ac_side.values()]),
+        ], dtype=np.float64)
+
+    @staticmethod
+    def _parse_time(value: str) -> float:
+        '''Parse an epoch timestamp (seconds) or an ISO 8601 date/time'''
+        try:
+            return float(value)
+        except ValueError:
+            return dt.fromisoformat(value).timestamp()
+
+    @staticmethod
+    def _to_list(values: np.ndarray) -> list[Optional[float]]:
+        return np.where(np.isnan(values), None, values).tolist()  # NaN is not valid JSON
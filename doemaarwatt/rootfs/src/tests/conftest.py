@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# the add-on modules are imported flat from the src directory
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
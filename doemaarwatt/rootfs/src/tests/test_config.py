@@ -0,0 +1,19 @@
+import copy
+
+from backtest import DEFAULT_CONFIG
+from common import Logger, LogLevel
+from config import DoeMaarWattConfig
+
+
+def test_redacted_dyn_config_blanks_every_secret():
+    dyn_config = copy.deepcopy(DEFAULT_CONFIG)
+    dyn_config['general']['supervisor_token'] = 'supervisor secret'
+    dyn_config['mode_dynamic']['api_token'] = 'enever secret'
+    dyn_config['battery_inverters'][0]['password'] = 'inverter secret'
+    cfg = DoeMaarWattConfig(Logger(loglevel=LogLevel.OFF), dyn_config=dyn_config)
+
+    redacted = cfg.redacted_dyn_config()
+    assert 'secret' not in repr(redacted)
+    assert redacted['mode_dynamic']['api_token'] == ''
+    assert redacted['battery_inverters'][0]['name'] == dyn_config['battery_inverters'][0]['name']
+    assert cfg.get_mode_dynamic_config()['api_token'] == 'enever secret'  # the config itself is left as is
@@ -0,0 +1,113 @@
+import asyncio
+import copy
+from datetime import datetime as dt
+
+from backtest import DEFAULT_CONFIG
+from base_controller import BaseController
+from common import Logger, LogLevel, ModbusException, PBSapp, Phase, VirtualClock
+from config import DoeMaarWattConfig, ControlMode
+from history import HistoryStore
+
+
+CONFIG = {
+    **copy.deepcopy(DEFAULT_CONFIG),
+    'battery_inverters': [
+        {**DEFAULT_CONFIG['battery_inverters'][0], 'name': 'charging', 'connected_phase': Phase.L1},
+        {**DEFAULT_CONFIG['battery_inverters'][0], 'name': 'discharging', 'connected_phase': Phase.L2},
+    ],
+    'solar_inverters': [],
+}
+DESIRED = {'charging': -1000.0, 'discharging': 1000.0}  # both well within the fuse limit
+
+
+class FixedController(BaseController):
+    '''Commands every battery inverter a fixed power level'''
+
+    @property
+    def mode(self) -> ControlMode:
+        return ControlMode.MANUAL
+
+    def get_PBSapp(self, now: dt) -> PBSapp:
+        pbsapp = PBSapp(list(self.inverters.values()))
+        for inv in self.battery_inverters:
+            pbsapp.set(inv.connected_phase, inv.name, DESIRED[inv.name])
+        return pbsapp
+
+    async def loop(self) -> None:
+        pass
+
+
+def fail_writes(inverter) -> None:
+    async def set_power(power_w: float) -> None:
+        raise ModbusException('no response', source=inverter.name)
+    inverter.set_power = set_power
+
+
+async def run_ticks(tmp_path, failing: str, ticks: int) -> tuple[FixedController, list[dict]]:
+    log = Logger(loglevel=LogLevel.OFF)
+    HistoryStore(log, tmp_path / 'history.db')  # keep the setpoints of the test out of the real history
+    controller = FixedController(DoeMaarWattConfig(log, dyn_config=CONFIG), log, VirtualClock(dt(2026, 6, 21, 12)))
+    controller.running = True
+    controller.setup()
+    await controller.connect_subsystems()
+    await controller.enable_control()
+    for inv in controller.battery_inverters:  # away from the state-of-charge limits, which would clamp the commands
+        inv.current_charge_wh = inv.capacity_wh / 2
+    fail_writes(controller.inverters[failing])
+
+    dispatched = []
+    for _ in range(ticks):
+        await controller.get_stats()
+        await controller.command_PBSsent(controller.clock.now(controller.tz))  # must not raise
+        dispatched.append(copy.deepcopy(controller._stats.dispatch))
+    return controller, dispatched
+
+
+def test_failed_write_keeps_controlling_the_others(tmp_path):
+    controller, dispatched = asyncio.run(run_ticks(tmp_path, 'charging', ticks=3))
+
+    for dispatch in dispatched:
+        assert dispatch['charging']['ack'] is False
+        assert dispatch['discharging']['ack'] is True
+        assert dispatch['discharging']['power'] == DESIRED['discharging']
+    assert controller._unacknowledged == {'charging': 3}
+    assert 'charging' not in controller._commanded
+    assert controller._commanded['discharging'] == DESIRED['discharging']
+
+
+def test_failed_relieving_write_holds_back_load_adding_commands_once(tmp_path):
+    controller, dispatched = asyncio.run(run_ticks(tmp_path, 'discharging', ticks=3))
+
+    # the discharging inverter relieves the importing grid connection: while its command is not acknowledged, the
+    # charging inverter is not sent the command that adds to the import
+    assert dispatched[0]['discharging']['ack'] is False
+    assert dispatched[0]['charging'] == {'power': DESIRED['charging'], 'wave': 'adding', 'ack': False, 'error': 'not sent'}
+
+    # from then on the failing inverter is held at its measured power level and the charging one is controlled again
+    for dispatch in dispatched[1:]:
+        stats = controller._stats.battery_inverters['discharging']
+        assert dispatch['discharging']['ack'] is False
+        assert dispatch['discharging']['power'] == stats.ac_side[Phase.L2].power
+        assert dispatch['charging']['ack'] is True
+    assert controller._unacknowledged == {'discharging': 3}
+    assert controller._commanded['charging'] == DESIRED['charging']
+
+
+def test_inverter_is_released_once_it_acknowledges_again(tmp_path):
+    async def run():
+        controller, _ = await run_ticks(tmp_path, 'charging', ticks=1)
+        del controller.inverters['charging'].set_power  # the inverter responds again
+        dispatched = []
+        for _ in range(2):
+            await controller.get_stats()
+            await controller.command_PBSsent(controller.clock.now(controller.tz))
+            dispatched.append(copy.deepcopy(controller._stats.dispatch))
+        return controller, dispatched
+
+    controller, dispatched = asyncio.run(run())
+    # the retry of the held power level is acknowledged, after which the inverter follows its desired power again
+    assert dispatched[0]['charging']['ack'] is True
+    assert dispatched[0]['charging']['power'] != DESIRED['charging']
+    assert dispatched[1]['charging'] == {'power': DESIRED['charging'], 'wave': 'adding', 'ack': True, 'error': None}
+    assert controller._unacknowledged == {}
+    assert controller._commanded == DESIRED
@@ -0,0 +1,71 @@
+import asyncio
+from datetime import datetime as dt, timedelta
+from zoneinfo import ZoneInfo
+
+from backtest import DEFAULT_CONFIG
+from common import Logger, LogLevel, VirtualClock
+from config import DoeMaarWattConfig
+from dyn_schedule import DynamicScheduler, REPLAN_TOLERANCE_WH
+from history import HistoryStore
+from mode_4 import Mode4Controller
+
+
+SLOT = timedelta(minutes=15)
+
+
+class FixedPrices:
+    '''Price manager with a fixed price per slot: cheap (and cheapest first) for the first two hours, expensive after'''
+
+    def __init__(self, start: dt, slots: int) -> None:
+        self.slots = [(start + t * SLOT, start + (t + 1) * SLOT, 0.01 * (t + 1) if t < 8 else 0.30) for t in range(slots)]
+
+    def get_price_range(self, start_from: dt) -> list[tuple[dt, dt, float]]:
+        return [s for s in self.slots if s[1] > start_from]
+
+
+def scheduler() -> tuple[DynamicScheduler, dt]:
+    cfg = DoeMaarWattConfig(Logger(loglevel=LogLevel.OFF), dyn_config=DEFAULT_CONFIG)
+    start = dt(2026, 6, 21, 0, tzinfo=ZoneInfo(cfg.timezone))
+    return DynamicScheduler(cfg, FixedPrices(start, 96), clock=VirtualClock(start)), start  # type: ignore
+
+
+def test_replan_mid_slot_on_plan_is_kept():
+    ds, start = scheduler()
+    end = start + 95 * SLOT
+    asyncio.run(ds.create_schedule(start, end, {'battery': 2000.0}))
+    sp = ds.schedule[0]
+    assert sp.end_charge['battery'] - sp.start_charge['battery'] > 2 * REPLAN_TOLERANCE_WH  # charging in slot 0
+
+    # halfway the first slot, the battery is halfway its planned charge for the slot
+    now = start + SLOT / 2
+    on_plan = (sp.start_charge['battery'] + sp.end_charge['battery']) / 2
+    assert asyncio.run(ds.replan(now, end, {'battery': on_plan})) == 'kept'
+    assert ds.schedule[0] is sp
+
+
+def test_replan_mid_slot_keeps_slot_start():
+    ds, start = scheduler()
+    end = start + 95 * SLOT
+    asyncio.run(ds.create_schedule(start, end, {'battery': 2000.0}))
+
+    # halfway the first slot the battery has not charged at all: the plan is re-distributed
+    now = start + SLOT / 2
+    assert asyncio.run(ds.replan(now, end, {'battery': 2000.0})) == 'relaxed'
+    sp = ds.schedule[0]
+    assert sp.start_ts == start
+    planned_now = (sp.start_charge['battery'] + sp.end_charge['battery']) / 2
+    assert abs(planned_now - 2000.0) < 1e-6  # the measured charge lies on the plan at now, not at the slot start
+    assert sp.end_charge['battery'] - 2000.0 <= 5000 * 0.125 + 1e-6  # only the rest of the slot can be charged in
+
+
+def test_replan_keeps_the_plan_while_a_charge_is_unknown(tmp_path):
+    ds, start = scheduler()
+    log = Logger(loglevel=LogLevel.OFF)
+    HistoryStore(log, tmp_path / 'history.db')
+    controller = Mode4Controller(ds.cfg, log, ds.clock)
+    controller.pm, controller.scheduler = ds.pm, ds
+    asyncio.run(ds.create_schedule(start, start + 95 * SLOT, {'battery': 2000.0}))
+    schedule = list(ds.schedule)
+
+    asyncio.run(controller.replan_schedule(start + SLOT / 2, {'battery': None}))  # the battery did not read
+    assert ds.schedule == schedule
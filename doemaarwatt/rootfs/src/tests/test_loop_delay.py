@@ -0,0 +1,37 @@
+import asyncio
+import copy
+from datetime import datetime as dt
+
+from backtest import DEFAULT_CONFIG
+from common import Logger, LogLevel, VirtualClock
+from config import DoeMaarWattConfig
+from history import HistoryStore
+from test_dispatch import FixedController
+
+
+LATE_S = 1.0
+
+
+class LateClock(VirtualClock):
+    '''Virtual clock whose sleeps wake up LATE_S too late'''
+
+    async def sleep(self, seconds: float) -> None:
+        await super().sleep(seconds + LATE_S)
+
+
+def test_tick_duration_excludes_the_lateness_of_the_tick(tmp_path):
+    async def run() -> FixedController:
+        log = Logger(loglevel=LogLevel.OFF)
+        HistoryStore(log, tmp_path / 'history.db')
+        cfg = copy.deepcopy(DEFAULT_CONFIG)
+        controller = FixedController(DoeMaarWattConfig(log, dyn_config=cfg), log, LateClock(dt(2026, 6, 21, 12)))
+        controller.running = True
+        controller.setup()
+        for _ in range(3):
+            await controller.loop_delay()  # ticks without work in between
+        return controller
+
+    stats = asyncio.run(run())._stats
+    assert stats.tick_lateness.max == LATE_S
+    assert sum(stats.tick_duration.counts) == 2
+    assert stats.tick_duration.max == 0.0  # the ticks took no time, however late they started
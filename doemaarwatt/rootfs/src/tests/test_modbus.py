@@ -0,0 +1,144 @@
+import asyncio
+from typing import Callable, Optional
+
+import pytest
+from pymodbus import ModbusException as PymodbusException
+from pymodbus.pdu import ExceptionResponse
+from pymodbus.pdu.register_message import ReadInputRegistersResponse, WriteMultipleRegistersResponse
+
+from common import Logger, LogLevel, ModbusException, ModbusManager, Register, RegisterMap, to_s32_list
+from common.modbus import PooledConnection, WRITE_KEEPALIVE
+
+
+REGISTERS = RegisterMap({
+    'a': Register(30775, 'S32', 'FIX0'),
+    'b': Register(30777, 'S32', 'FIX0'),
+    'c': Register(30783, 'U32', 'FIX2'),
+})
+DEVICE_BUSY = 0x06
+ILLEGAL_DATA_ADDRESS = 0x02
+
+
+class FakeClient:
+    '''Modbus client answering every read with zeroes, or with the exception code returned by error(address, count).
+    Writes are acknowledged, unless write_error is set: an exception code to respond with, or an exception to raise'''
+
+    def __init__(self, error: Callable[[int, int], Optional[int]] = lambda address, count: None) -> None:
+        self.connected = False
+        self.error = error
+        self.reads: list[tuple[int, int]] = []
+        self.writes: list[tuple[int, list[int]]] = []
+        self.write_error: Optional[int | Exception] = None
+
+    async def connect(self) -> None:
+        self.connected = True
+
+    def close(self) -> None:
+        self.connected = False
+
+    async def read_input_registers(self, address: int, count: int, device_id: int):
+        self.reads.append((address, count))
+        code = self.error(address, count)
+        if code is not None:
+            return ExceptionResponse(4, code)
+        return ReadInputRegistersResponse(registers=[0] * count)
+
+    async def write_registers(self, address: int, values: list[int], device_id: int, no_response_expected: bool):
+        self.writes.append((address, values))
+        if isinstance(self.write_error, Exception):
+            raise self.write_error
+        if self.write_error is not None:
+            return ExceptionResponse(16, self.write_error)
+        return WriteMultipleRegistersResponse(address=address, count=len(values))
+
+
+def manager(client: FakeClient) -> ModbusManager:
+    log = Logger(loglevel=LogLevel.OFF)
+    modbus = ModbusManager([], log)
+    modbus._clients['device'] = PooledConnection('fake', 502, log, client_factory=lambda host, port: client)  # type: ignore
+    return modbus
+
+
+def test_busy_device_does_not_split_block_reads():
+    busy = True
+    client = FakeClient(lambda address, count: DEVICE_BUSY if busy else None)
+    modbus = manager(client)
+
+    with pytest.raises(ModbusException):
+        asyncio.run(modbus.read_block('device', REGISTERS))
+    assert modbus._refused == set()
+
+    busy = False
+    client.reads.clear()
+    asyncio.run(modbus.read_block('device', REGISTERS))
+    assert client.reads == [(30775, 10)]
+
+
+def test_refused_block_is_read_in_parts_from_then_on():
+    client = FakeClient(lambda address, count: ILLEGAL_DATA_ADDRESS if count == 10 else None)
+    modbus = manager(client)
+
+    assert asyncio.run(modbus.read_block('device', REGISTERS)) == {'a': 0, 'b': 0, 'c': 0.0}
+    assert modbus._refused == {('device', 3, 30775, 10)}
+
+    client.reads.clear()
+    asyncio.run(modbus.read_block('device', REGISTERS))
+    assert client.reads == [(30775, 4), (30783, 2)]
+
+
+def write(modbus: ModbusManager, power: int, deadband: int = 0) -> None:
+    asyncio.run(modbus.write_register('device', 40149, to_s32_list(power), deadband=deadband))
+
+
+def test_write_within_deadband_is_skipped():
+    client = FakeClient()
+    modbus = manager(client)
+    write(modbus, 1000, deadband=10)
+    write(modbus, 1010, deadband=10)
+    assert len(client.writes) == 1
+
+    write(modbus, 1011, deadband=10)  # compared with the value last written: 1000
+    assert len(client.writes) == 2
+
+
+def test_unchanged_write_is_sent_again_after_the_keepalive():
+    client = FakeClient()
+    modbus = manager(client)
+    write(modbus, 1000)
+    write(modbus, 1000)
+    assert len(client.writes) == 1
+
+    key = ('device', 3, 40149)
+    values, generation, ts = modbus._written[key]
+    modbus._written[key] = (values, generation, ts - WRITE_KEEPALIVE)  # as if written WRITE_KEEPALIVE ago
+    write(modbus, 1000)
+    assert len(client.writes) == 2
+
+
+def test_unchanged_write_is_sent_again_after_a_reconnect():
+    client = FakeClient()
+    modbus = manager(client)
+    write(modbus, 1000)
+    modbus.reconnect()  # the device may have lost its setpoint in between
+    write(modbus, 1000)
+    assert len(client.writes) == 2
+    assert modbus._clients['device'].generation == 2  # type: ignore
+
+
+@pytest.mark.parametrize('error', [DEVICE_BUSY, PymodbusException('no response')])
+def test_failed_write_is_not_remembered(error):
+    client = FakeClient()
+    modbus = manager(client)
+    write(modbus, 1000)
+
+    client.write_error = error
+    try:
+        write(modbus, 2000)
+    except ModbusException:
+        assert isinstance(error, Exception)
+    client.write_error = None
+
+    # neither the failed value nor the one before it is known to be in the register
+    write(modbus, 1000)
+    write(modbus, 1000)
+    assert len(client.writes) == 3
@@ -0,0 +1,66 @@
+import asyncio
+import copy
+from datetime import datetime as dt
+
+from common import DMWException, Logger, LogLevel, Phase, SINGLE_PHASES, VirtualClock
+from config import DoeMaarWattConfig
+from history import HistoryStore
+from test_dispatch import CONFIG, FixedController
+
+
+async def controlling(tmp_path) -> FixedController:
+    '''A controller that commanded its inverters once, and reads the given grid power (W per phase) from then on'''
+    log = Logger(loglevel=LogLevel.OFF)
+    HistoryStore(log, tmp_path / 'history.db')
+    controller = FixedController(DoeMaarWattConfig(log, dyn_config=CONFIG), log, VirtualClock(dt(2026, 6, 21, 12)))
+    controller.running = True
+    controller.setup()
+    await controller.connect_subsystems()
+    await controller.enable_control()
+    await controller.get_stats()
+    await controller.command_PBSsent(controller.clock.now(controller.tz))
+    return controller
+
+
+def read_grid(controller: FixedController, power: dict[Phase, float]) -> None:
+    stats = copy.deepcopy(controller._stats.energy_meter)
+    for phi in SINGLE_PHASES:
+        stats.grid[phi].power = power.get(phi, 0.0)  # type: ignore
+
+    async def read_stats():
+        return stats
+    controller.energy_meter.read_stats = read_stats  # type: ignore
+
+
+def fuse_limit(controller: FixedController) -> float:
+    meter = controller._stats.energy_meter
+    return meter.grid[Phase.L1].voltage * meter.max_fuse_a  # type: ignore
+
+
+def test_export_within_the_fuse_limit_does_not_trip(tmp_path):
+    async def run():
+        controller = await controlling(tmp_path)
+        controller.get_export_limit = lambda now: 0.0  # type: ignore  # eg. negative prices
+        read_grid(controller, {Phase.L1: 20.0})  # a few watts of export noise
+        computed = []
+        controller.compute_PBSsent = lambda *args: computed.append(args)  # type: ignore
+        await controller.protection_tick()
+        return computed
+
+    assert asyncio.run(run()) == []  # the export limit is left to the regular control loop
+
+
+def test_unresolvable_overload_is_left_to_the_next_tick(tmp_path):
+    async def run():
+        controller = await controlling(tmp_path)
+        read_grid(controller, {Phase.L1: fuse_limit(controller) + 1000.0})
+
+        def compute_PBSsent(*args):
+            raise DMWException('insufficient control authority for safe PBSsent power', source='calc_PBSsent')
+        controller.compute_PBSsent = compute_PBSsent  # type: ignore
+        await controller.protection_tick()  # must not raise
+        return controller
+
+    controller = asyncio.run(run())
+    assert controller._stats.protection_ticks == 1
+    assert controller._stats.protection_clamps == 0
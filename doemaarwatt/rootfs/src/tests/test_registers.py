@@ -0,0 +1,30 @@
+from common import Register, RegisterMap
+
+
+def layout(blocks) -> list[tuple[int, int]]:
+    return [(block.address, block.count) for block in blocks]
+
+
+def test_blocks_do_not_span_unsupported_addresses():
+    registers = {
+        'temp_h': Register(32221, 'S32', 'TEMP'),
+        'temp_l': Register(32227, 'S32', 'TEMP'),
+        'charge': Register(32233, 'U32', 'FIX2'),
+    }
+    assert layout(RegisterMap(registers).blocks) == [(32221, 14)]
+    assert layout(RegisterMap(registers, unsupported=[(32223, 32227), (32229, 32233)]).blocks) == \
+        [(32221, 2), (32227, 2), (32233, 2)]
+
+
+def test_refused_block_is_split_into_runs_of_adjacent_registers():
+    registers = RegisterMap({
+        'a': Register(30775, 'S32', 'FIX0'),
+        'b': Register(30777, 'S32', 'FIX0'),
+        'c': Register(30783, 'U32', 'FIX2'),
+    })
+    block, = registers.blocks
+    assert layout(registers.split(block)) == [(30775, 4), (30783, 2)]
+    assert layout(registers.split(registers.split(block)[0])) == [(30775, 2), (30777, 2)]
+
+    words = [0, 100, 0xFFFF, 0xFF38]  # 100, and -200
+    assert registers.decode(registers.split(block)[0], words) == {'a': 100, 'b': -200}
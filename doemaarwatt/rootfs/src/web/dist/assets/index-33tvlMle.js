@@ -2094,6 +2094,6 @@ var e=Object.defineProperty,t=(e,t,n)=>()=>{if(n)throw n[0];try{return e&&(t=e(e
  color: var(--n-code-text-color);
  background-color: var(--n-code-color);
  border: var(--n-code-border);
- `)])})),PZ,FZ,IZ=t((()=>{K(),I(),Y(),J(),jK(),NZ(),PZ=Object.assign(Object.assign({},zE.props),{code:Boolean,type:{type:String,default:`default`},delete:Boolean,strong:Boolean,italic:Boolean,underline:Boolean,depth:[String,Number],tag:String,as:{type:String,validator:()=>!0,default:void 0}}),FZ=j({name:`Text`,props:PZ,setup(e){let{mergedClsPrefixRef:t,inlineThemeDisabled:n}=l_(e),r=zE(`Typography`,`-text`,MZ,DK,e,t),i=F(()=>{let{depth:t,type:n}=e,i=n==="default"?t===void 0?`textColor`:`textColor${t}Depth`:L(`textColor`,n),{common:{fontWeightStrong:a,fontFamilyMono:o,cubicBezierEaseInOut:s},self:{codeTextColor:c,codeBorderRadius:l,codeColor:u,codeBorder:d,[i]:f}}=r.value;return{"--n-bezier":s,"--n-text-color":f,"--n-font-weight-strong":a,"--n-font-famliy-mono":o,"--n-code-border-radius":l,"--n-code-text-color":c,"--n-code-color":u,"--n-code-border":d}}),a=n?d_(`text`,F(()=>`${e.type[0]}${e.depth||``}`),i,e):void 0;return{mergedClsPrefix:t,compitableTag:Nf(e,[`as`,`tag`]),cssVars:n?void 0:i,themeClass:a?.themeClass,onRender:a?.onRender}},render(){var e,t;let{mergedClsPrefix:n}=this;(e=this.onRender)==null||e.call(this);let r=[`${n}-text`,this.themeClass,{[`${n}-text--code`]:this.code,[`${n}-text--delete`]:this.delete,[`${n}-text--strong`]:this.strong,[`${n}-text--italic`]:this.italic,[`${n}-text--underline`]:this.underline}],i=(t=this.$slots).default?.call(t);return this.code?N(`code`,{class:r,style:this.cssVars},this.delete?N(`del`,null,i):i):this.delete?N(`del`,{class:r,style:this.cssVars},i):N(this.compitableTag||`span`,{class:r,style:this.cssVars},i)}})})),LZ=t((()=>{I(),Y(),jK(),H(),kZ(),jZ(),IZ()})),RZ=t((()=>{G(),K(),I(),Y(),J(),IK(),RA(),FD(),H(),TA(),$J(),MD(),PM(),IX(),Ag()})),zZ=t((()=>{I(),og(),TA()})),BZ=t((()=>{K(),I(),Y(),J(),zK(),H()})),VZ=t((()=>{VE(),WA(),QA(),Rj(),Wj(),Xj(),nM(),oM(),mM(),PM(),FM(),sce(),ZL(),pce(),yce(),cR(),dR(),TR(),Dce(),MR(),FR(),Mce(),iB(),QV(),oH(),yH(),VH(),$H(),aU(),rB(),dU(),xU(),TU(),Tz(),rk(),EU(),RU(),WK(),GK(),wJ(),DJ(),OJ(),IJ(),HJ(),UJ(),Vz(),YJ(),$J(),eY(),Tj(),mY(),hY(),vY(),yY(),TY(),EY(),CH(),DY(),NY(),PY(),vX(),jH(),BH(),zH(),yX(),bX(),QR(),xX(),zk(),RR(),IX(),BX(),bz(),VX(),HX(),KX(),qR(),XX(),ZX(),_U(),QX(),nZ(),rZ(),iZ(),dZ(),_Z(),vZ(),eA(),yZ(),bZ(),ZV(),xZ(),wz(),SZ(),CZ(),wZ(),LZ(),RZ(),zZ(),BZ()})),HZ=t((()=>{I(),Q(),c_()})),UZ,WZ=t((()=>{UZ=()=>({})})),GZ,KZ=t((()=>{Q(),WZ(),GZ={name:`Equation`,common:Z,self:UZ}})),qZ=t((()=>{KZ(),WZ()})),JZ,YZ=t((()=>{Q(),JZ={name:`FloatButtonGroup`,common:Z,self(e){let{popoverColor:t,dividerColor:n,borderRadius:r}=e;return{color:t,buttonBorderColor:n,borderRadiusSquare:r,boxShadow:`0 2px 8px 0px rgba(0, 0, 0, .12)`}}}})),XZ=t((()=>{YZ(),BK()})),ZZ,QZ=t((()=>{DO(),Q(),NA(),ZA(),Lj(),Yj(),Uj(),tM(),aM(),pM(),VU(),DM(),KL(),XL(),eR(),sR(),iR(),uR(),OR(),gR(),jR(),yz(),yB(),aH(),pH(),qH(),iU(),iz(),uU(),bU(),wU(),dz(),$O(),qZ(),XZ(),UK(),YU(),QU(),VJ(),JJ(),Lz(),QJ(),iW(),uj(),fW(),hW(),wY(),bW(),SH(),CW(),MY(),EW(),NW(),AH(),vH(),RH(),BW(),ZR(),qW(),Ck(),LR(),$W(),zX(),hz(),nG(),lG(),UR(),YX(),mG(),gU(),yG(),tZ(),wG(),jG(),BK(),zG(),qG(),eK(),Gk(),aK(),fB(),uK(),lz(),hK(),CK(),bK(),jK(),IK(),zK(),ZZ={name:`dark`,common:Z,Alert:OA,Anchor:YA,AutoComplete:Fj,Avatar:Vj,AvatarGroup:qj,BackTop:$j,Badge:rM,Breadcrumb:dM,Button:TM,ButtonGroup:zU,Calendar:GL,Card:YL,Carousel:$L,Cascader:oR,Checkbox:rR,Code:lR,Collapse:hR,CollapseTransition:DR,ColorPicker:AR,DataTable:vz,DatePicker:_B,Descriptions:rH,Dialog:dH,Divider:GH,Drawer:nU,Dropdown:rz,DynamicInput:cU,DynamicTags:vU,Element:SU,Empty:QO,Ellipsis:uz,Equation:GZ,Flex:kU,Form:qU,GradientText:XU,Heatmap:zJ,Icon:Iz,IconWrapper:KJ,Image:XJ,Input:aj,InputNumber:$U,InputOtp:sW,LegacyTransfer:SY,Layout:uW,List:vW,LoadingBar:bH,Log:xW,Menu:jW,Mention:wW,Message:OH,Modal:gH,Notification:IH,PageHeader:RW,Pagination:XR,Popconfirm:GW,Popover:Sk,Popselect:IR,Progress:ZW,QrCode:LX,Radio:mz,Rate:eG,Result:sG,Row:pW,Scrollbar:EO,Select:HR,Skeleton:qX,Slider:fG,Space:mU,Spin:_G,Statistic:SG,Steps:kG,Switch:PG,Table:GG,Tabs:QG,Tag:Hk,Thing:rK,TimePicker:uB,Timeline:cK,Tooltip:sz,Transfer:pK,Tree:vK,TreeSelect:xK,Typography:kK,Upload:PK,Watermark:LK,Split:$X,FloatButton:VK,FloatButtonGroup:JZ,Marquee:AY}})),$Z=t((()=>{QZ(),DO(),Q(),NA(),ZA(),Lj(),Yj(),Uj(),tM(),aM(),pM(),VU(),DM(),KL(),XL(),eR(),sR(),iR(),uR(),OR(),gR(),jR(),yz(),yB(),aH(),pH(),qH(),iU(),iz(),uU(),bU(),wU(),dz(),$O(),qZ(),PU(),XZ(),UK(),YU(),QU(),VJ(),JJ(),Lz(),QJ(),iW(),lW(),uj(),fW(),hW(),wY(),bW(),SH(),CW(),MY(),EW(),NW(),AH(),vH(),RH(),BW(),ZR(),qW(),Ck(),LR(),$W(),zX(),hz(),nG(),lG(),UR(),YX(),mG(),gU(),yG(),tZ(),wG(),jG(),zG(),qG(),eK(),Gk(),aK(),fB(),uK(),lz(),hK(),CK(),bK(),jK(),IK(),zK()})),eQ=t((()=>{H(),VZ(),HZ(),SE(),VZ(),BK(),xE(),I(),Y(),J(),PM(),TR(),MR(),FR(),c_(),$H(),TU(),rk(),IJ(),Vz(),Tj(),zk(),_U(),DO(),Q(),NA(),ZA(),Lj(),Yj(),Uj(),tM(),aM(),pM(),VU(),DM(),KL(),XL(),eR(),sR(),iR(),uR(),OR(),gR(),jR(),yz(),yB(),aH(),pH(),qH(),iU(),iz(),uU(),bU(),wU(),dz(),$O(),qZ(),PU(),XZ(),UK(),YU(),QU(),VJ(),JJ(),Lz(),QJ(),iW(),lW(),uj(),fW(),hW(),wY(),bW(),SH(),CW(),MY(),EW(),NW(),AH(),vH(),RH(),BW(),ZR(),qW(),Ck(),LR(),$W(),zX(),hz(),nG(),lG(),UR(),YX(),mG(),gU(),yG(),tZ(),wG(),jG(),zG(),qG(),eK(),Gk(),aK(),fB(),uK(),lz(),hK(),CK(),bK(),jK(),IK(),zK(),$Z(),Mp(),K()}));function tQ(e){let t=h0.get(e);return t===void 0&&(t=new Intl.DateTimeFormat(`en-US`,{hour12:!1,timeZone:e,year:`numeric`,month:`2-digit`,day:`2-digit`,hour:`2-digit`,minute:`2-digit`,second:`2-digit`,era:`short`}),h0.set(e,t)),t}function nQ(e,t){let n=e.format(t).replace(/\u200E/g,``),[,r,i,a,o,s,c,l]=/(\d+)\/(\d+)\/(\d+) (AD|BC),? (\d+):(\d+):(\d+)/.exec(n);return[a,r,i,o,s,c,l]}function rQ(e,t){let n=e.formatToParts(t),r=[];for(let e=0;e<n.length;e++){let{type:t,value:i}=n[e],a=g0[t];t===`era`?r[a]=i:FQ(a)||(r[a]=parseInt(i,10))}return r}function iQ(e,t={}){let n=JSON.stringify([e,t]),r=y0[n];return r||(r=new Intl.ListFormat(e,t),y0[n]=r),r}function aQ(e,t={}){let n=JSON.stringify([e,t]),r=b0.get(n);return r===void 0&&(r=new Intl.DateTimeFormat(e,t),b0.set(n,r)),r}function oQ(e,t={}){let n=JSON.stringify([e,t]),r=x0.get(n);return r===void 0&&(r=new Intl.NumberFormat(e,t),x0.set(n,r)),r}function sQ(e,t={}){let{base:n,...r}=t,i=JSON.stringify([e,r]),a=S0.get(i);return a===void 0&&(a=new Intl.RelativeTimeFormat(e,t),S0.set(i,a)),a}function cQ(){return C0||(C0=new Intl.DateTimeFormat().resolvedOptions().locale,C0)}function lQ(e){let t=w0.get(e);return t===void 0&&(t=new Intl.DateTimeFormat(e).resolvedOptions(),w0.set(e,t)),t}function uQ(e){let t=T0.get(e);if(!t){let n=new Intl.Locale(e);t=`getWeekInfo`in n?n.getWeekInfo():n.weekInfo,`minimalDays`in t||(t={...k0,...t}),T0.set(e,t)}return t}function dQ(e){let t=e.indexOf(`-x-`);t!==-1&&(e=e.substring(0,t));let n=e.indexOf(`-u-`);if(n===-1)return[e];{let t,r;try{t=aQ(e).resolvedOptions(),r=e}catch{let i=e.substring(0,n);t=aQ(i).resolvedOptions(),r=i}let{numberingSystem:i,calendar:a}=t;return[r,i,a]}}function fQ(e,t,n){return n||t?(e.includes(`-u-`)||(e+=`-u`),n&&(e+=`-ca-${n}`),t&&(e+=`-nu-${t}`),e):e}function pQ(e){let t=[];for(let n=1;n<=12;n++){let r=h4.utc(2009,n,1);t.push(e(r))}return t}function mQ(e){let t=[];for(let n=1;n<=7;n++){let r=h4.utc(2016,11,13+n);t.push(e(r))}return t}function hQ(e,t,n,r){let i=e.listingMode();return i===`error`?null:i===`en`?n(t):r(t)}function gQ(e){return e.numberingSystem&&e.numberingSystem!==`latn`?!1:e.numberingSystem===`latn`||!e.locale||e.locale.startsWith(`en`)||lQ(e.locale).numberingSystem===`latn`}function _Q(e,t){if(FQ(e)||e===null)return t;if(e instanceof f0)return e;if(RQ(e)){let n=e.toLowerCase();return n==="default"?t:n===`local`||n===`system`?m0.instance:n===`utc`||n===`gmt`?M0.utcInstance:M0.parseSpecifier(n)||v0.create(e)}else if(IQ(e))return M0.instance(e);else if(typeof e==`object`&&`offset`in e&&typeof e.offset==`function`)return e;else return new N0(e)}function vQ(e){let t=parseInt(e,10);if(isNaN(t)){t=``;for(let n=0;n<e.length;n++){let r=e.charCodeAt(n);if(e[n].search(P0.hanidec)!==-1)t+=I0.indexOf(e[n]);else for(let e in F0){let[n,i]=F0[e];r>=n&&r<=i&&(t+=r-n)}}return parseInt(t,10)}else return t}function yQ(){L0.clear()}function bQ({numberingSystem:e},t=``){let n=e||`latn`,r=L0.get(n);r===void 0&&(r=new Map,L0.set(n,r));let i=r.get(t);return i===void 0&&(i=RegExp(`${P0[n]}${t}`),r.set(t,i)),i}function xQ(e,t){return new q0(`unit out of range`,`you specified ${t} (of type ${typeof t}) as a ${e}, which is invalid`)}function SQ(e,t,n){let r=new Date(Date.UTC(e,t-1,n));e<100&&e>=0&&r.setUTCFullYear(r.getUTCFullYear()-1900);let i=r.getUTCDay();return i===0?7:i}function CQ(e,t,n){return n+(e$(e)?Y0:J0)[t-1]}function wQ(e,t){let n=e$(e)?Y0:J0,r=n.findIndex(e=>e<t),i=t-n[r];return{month:r+1,day:i}}function TQ(e,t){return(e-t+7)%7+1}function EQ(e,t=4,n=1){let{year:r,month:i,day:a}=e,o=CQ(r,i,a),s=TQ(SQ(r,i,a),n),c=Math.floor((o-s+14-t)/7),l;return c<1?(l=r-1,c=a$(l,t,n)):c>a$(r,t,n)?(l=r+1,c=1):l=r,{weekYear:l,weekNumber:c,weekday:s,...f$(e)}}function DQ(e,t=4,n=1){let{weekYear:r,weekNumber:i,weekday:a}=e,o=TQ(SQ(r,1,t),n),s=t$(r),c=i*7+a-o-7+t,l;c<1?(l=r-1,c+=t$(l)):c>s?(l=r+1,c-=t$(r)):l=r;let{month:u,day:d}=wQ(l,c);return{year:l,month:u,day:d,...f$(e)}}function OQ(e){let{year:t,month:n,day:r}=e;return{year:t,ordinal:CQ(t,n,r),...f$(e)}}function kQ(e){let{year:t,ordinal:n}=e,{month:r,day:i}=wQ(t,n);return{year:t,month:r,day:i,...f$(e)}}function AQ(e,t){if(!FQ(e.localWeekday)||!FQ(e.localWeekNumber)||!FQ(e.localWeekYear)){if(!FQ(e.weekday)||!FQ(e.weekNumber)||!FQ(e.weekYear))throw new R1(`Cannot mix locale-based week fields with ISO-based week fields`);return FQ(e.localWeekday)||(e.weekday=e.localWeekday),FQ(e.localWeekNumber)||(e.weekNumber=e.localWeekNumber),FQ(e.localWeekYear)||(e.weekYear=e.localWeekYear),delete e.localWeekday,delete e.localWeekNumber,delete e.localWeekYear,{minDaysInFirstWeek:t.getMinDaysInFirstWeek(),startOfWeek:t.getStartOfWeek()}}else return{minDaysInFirstWeek:4,startOfWeek:1}}function jQ(e,t=4,n=1){let r=LQ(e.weekYear),i=qQ(e.weekNumber,1,a$(e.weekYear,t,n)),a=qQ(e.weekday,1,7);return r?i?!a&&xQ(`weekday`,e.weekday):xQ(`week`,e.weekNumber):xQ(`weekYear`,e.weekYear)}function MQ(e){let t=LQ(e.year),n=qQ(e.ordinal,1,t$(e.year));return t?!n&&xQ(`ordinal`,e.ordinal):xQ(`year`,e.year)}function NQ(e){let t=LQ(e.year),n=qQ(e.month,1,12),r=qQ(e.day,1,n$(e.year,e.month));return t?n?!r&&xQ(`day`,e.day):xQ(`month`,e.month):xQ(`year`,e.year)}function PQ(e){let{hour:t,minute:n,second:r,millisecond:i}=e,a=qQ(t,0,23)||t===24&&n===0&&r===0&&i===0,o=qQ(n,0,59),s=qQ(r,0,59),c=qQ(i,0,999);return a?o?s?!c&&xQ(`millisecond`,i):xQ(`second`,r):xQ(`minute`,n):xQ(`hour`,t)}function FQ(e){return e===void 0}function IQ(e){return typeof e==`number`}function LQ(e){return typeof e==`number`&&e%1==0}function RQ(e){return typeof e==`string`}function zQ(e){return Object.prototype.toString.call(e)===`[object Date]`}function BQ(){try{return typeof Intl<`u`&&!!Intl.RelativeTimeFormat}catch{return!1}}function VQ(){try{return typeof Intl<`u`&&!!Intl.Locale&&(`weekInfo`in Intl.Locale.prototype||`getWeekInfo`in Intl.Locale.prototype)}catch{return!1}}function HQ(e){return Array.isArray(e)?e:[e]}function UQ(e,t,n){if(e.length!==0)return e.reduce((e,r)=>{let i=[t(r),r];return e&&n(e[0],i[0])===e[0]?e:i},null)[1]}function WQ(e,t){return t.reduce((t,n)=>(t[n]=e[n],t),{})}function GQ(e,t){return Object.prototype.hasOwnProperty.call(e,t)}function KQ(e){if(e==null)return null;if(typeof e!=`object`)throw new B1(`Week settings must be an object`);if(!qQ(e.firstDay,1,7)||!qQ(e.minimalDays,1,7)||!Array.isArray(e.weekend)||e.weekend.some(e=>!qQ(e,1,7)))throw new B1(`Invalid week settings`);return{firstDay:e.firstDay,minimalDays:e.minimalDays,weekend:Array.from(e.weekend)}}function qQ(e,t,n){return LQ(e)&&e>=t&&e<=n}function JQ(e,t){return e-t*Math.floor(e/t)}function YQ(e,t=2){let n=e<0,r;return r=n?`-`+(``+-e).padStart(t,`0`):(``+e).padStart(t,`0`),r}function XQ(e){if(!(FQ(e)||e===null||e===``))return parseInt(e,10)}function ZQ(e){if(!(FQ(e)||e===null||e===``))return parseFloat(e)}function QQ(e){if(!(FQ(e)||e===null||e===``)){let t=parseFloat(`0.`+e)*1e3;return Math.floor(t)}}function $Q(e,t,n=`round`){let r=10**t;switch(n){case`expand`:return e>0?Math.ceil(e*r)/r:Math.floor(e*r)/r;case`trunc`:return Math.trunc(e*r)/r;case`round`:return Math.round(e*r)/r;case`floor`:return Math.floor(e*r)/r;case`ceil`:return Math.ceil(e*r)/r;default:throw RangeError(`Value rounding ${n} is out of range`)}}function e$(e){return e%4==0&&(e%100!=0||e%400==0)}function t$(e){return e$(e)?366:365}function n$(e,t){let n=JQ(t-1,12)+1,r=e+(t-n)/12;return n===2?e$(r)?29:28:[31,null,31,30,31,30,31,31,30,31,30,31][n-1]}function r$(e){let t=Date.UTC(e.year,e.month-1,e.day,e.hour,e.minute,e.second,e.millisecond);return e.year<100&&e.year>=0&&(t=new Date(t),t.setUTCFullYear(e.year,e.month-1,e.day)),+t}function i$(e,t,n){return-TQ(SQ(e,1,t),n)+t-1}function a$(e,t=4,n=1){let r=i$(e,t,n),i=i$(e+1,t,n);return(t$(e)-r+i)/7}function o$(e){return e>99?e:e>K0.twoDigitCutoffYear?1900+e:2e3+e}function s$(e,t,n,r=null){let i=new Date(e),a={hourCycle:`h23`,year:`numeric`,month:`2-digit`,day:`2-digit`,hour:`2-digit`,minute:`2-digit`};r&&(a.timeZone=r);let o={timeZoneName:t,...a},s=new Intl.DateTimeFormat(n,o).formatToParts(i).find(e=>e.type.toLowerCase()===`timezonename`);return s?s.value:null}function c$(e,t){let n=parseInt(e,10);Number.isNaN(n)&&(n=0);let r=parseInt(t,10)||0,i=n<0||Object.is(n,-0)?-r:r;return n*60+i}function l$(e){let t=Number(e);if(typeof e==`boolean`||e===``||!Number.isFinite(t))throw new B1(`Invalid unit value ${e}`);return t}function u$(e,t){let n={};for(let r in e)if(GQ(e,r)){let i=e[r];if(i==null)continue;n[t(r)]=l$(i)}return n}function d$(e,t){let n=Math.trunc(Math.abs(e/60)),r=Math.trunc(Math.abs(e%60)),i=e>=0?`+`:`-`;switch(t){case`short`:return`${i}${YQ(n,2)}:${YQ(r,2)}`;case`narrow`:return`${i}${n}${r>0?`:${r}`:``}`;case`techie`:return`${i}${YQ(n,2)}${YQ(r,2)}`;default:throw RangeError(`Value format ${t} is out of range for property format`)}}function f$(e){return WQ(e,[`hour`,`minute`,`second`,`millisecond`])}function p$(e){switch(e){case`narrow`:return[...Q0];case`short`:return[...Z0];case`long`:return[...X0];case`numeric`:return[`1`,`2`,`3`,`4`,`5`,`6`,`7`,`8`,`9`,`10`,`11`,`12`];case`2-digit`:return[`01`,`02`,`03`,`04`,`05`,`06`,`07`,`08`,`09`,`10`,`11`,`12`];default:return null}}function m$(e){switch(e){case`narrow`:return[...t2];case`short`:return[...e2];case`long`:return[...$0];case`numeric`:return[`1`,`2`,`3`,`4`,`5`,`6`,`7`];default:return null}}function h$(e){switch(e){case`narrow`:return[...a2];case`short`:return[...i2];case`long`:return[...r2];default:return null}}function g$(e){return n2[e.hour<12?0:1]}function _$(e,t){return m$(t)[e.weekday-1]}function v$(e,t){return p$(t)[e.month-1]}function y$(e,t){return h$(t)[e.year<0?0:1]}function b$(e,t,n=`always`,r=!1){let i={years:[`year`,`yr.`],quarters:[`quarter`,`qtr.`],months:[`month`,`mo.`],weeks:[`week`,`wk.`],days:[`day`,`day`,`days`],hours:[`hour`,`hr.`],minutes:[`minute`,`min.`],seconds:[`second`,`sec.`]},a=[`hours`,`minutes`,`seconds`].indexOf(e)===-1;if(n===`auto`&&a){let n=e===`days`;switch(t){case 1:return n?`tomorrow`:`next ${i[e][0]}`;case-1:return n?`yesterday`:`last ${i[e][0]}`;case 0:return n?`today`:`this ${i[e][0]}`}}let o=Object.is(t,-0)||t<0,s=Math.abs(t),c=s===1,l=i[e],u=r?c?l[1]:l[2]||l[1]:c?i[e][0]:e;return o?`${s} ${u} ago`:`in ${s} ${u}`}function x$(e,t){let n=``;for(let r of e)r.literal?n+=r.val:n+=t(r.val);return n}function S$(...e){let t=e.reduce((e,t)=>e+t.source,``);return RegExp(`^${t}$`)}function C$(...e){return t=>e.reduce(([e,n,r],i)=>{let[a,o,s]=i(t,r);return[{...e,...a},o||n,s]},[{},null,1]).slice(0,2)}function w$(e,...t){if(e==null)return[null,null];for(let[n,r]of t){let t=n.exec(e);if(t)return r(t)}return[null,null]}function T$(...e){return(t,n)=>{let r={},i;for(i=0;i<e.length;i++)r[e[i]]=XQ(t[n+i]);return[r,null,n+i]}}function E$(e,t,n){let r=e[t];return FQ(r)?n:XQ(r)}function D$(e,t){return[{year:E$(e,t),month:E$(e,t+1,1),day:E$(e,t+2,1)},null,t+3]}function O$(e,t){return[{hours:E$(e,t,0),minutes:E$(e,t+1,0),seconds:E$(e,t+2,0),milliseconds:QQ(e[t+3])},null,t+4]}function k$(e,t){let n=!e[t]&&!e[t+1],r=c$(e[t+1],e[t+2]);return[{},n?null:M0.instance(r),t+3]}function A$(e,t){return[{},e[t]?v0.create(e[t]):null,t+1]}function j$(e){let[t,n,r,i,a,o,s,c,l]=e,u=t[0]===`-`,d=c&&c[0]===`-`,f=(e,t=!1)=>e!==void 0&&(t||e&&u)?-e:e;return[{years:f(ZQ(n)),months:f(ZQ(r)),weeks:f(ZQ(i)),days:f(ZQ(a)),hours:f(ZQ(o)),minutes:f(ZQ(s)),seconds:f(ZQ(c),c===`-0`),milliseconds:f(QQ(l),d)}]}function M$(e,t,n,r,i,a,o){let s={year:t.length===2?o$(XQ(t)):XQ(t),month:Z0.indexOf(n)+1,day:XQ(r),hour:XQ(i),minute:XQ(a)};return o&&(s.second=XQ(o)),e&&(s.weekday=e.length>3?$0.indexOf(e)+1:e2.indexOf(e)+1),s}function N$(e){let[,t,n,r,i,a,o,s,c,l,u,d]=e,f=M$(t,i,r,n,a,o,s),p;return p=c?w2[c]:l?0:c$(u,d),[f,new M0(p)]}function P$(e){return e.replace(/\([^()]*\)|[\n\t]/g,` `).replace(/(\s\s+)/g,` `).trim()}function F$(e){let[,t,n,r,i,a,o,s]=e;return[M$(t,i,r,n,a,o,s),M0.utcInstance]}function I$(e){let[,t,n,r,i,a,o,s]=e;return[M$(t,s,n,r,i,a,o),M0.utcInstance]}function L$(e){return w$(e,[k2,N2],[A2,P2],[j2,F2],[M2,I2])}function R$(e){return w$(P$(e),[T2,N$])}function z$(e){return w$(e,[E2,F$],[D2,F$],[O2,I$])}function B$(e){return w$(e,[C2,j$])}function V$(e){return w$(e,[S2,L2])}function H$(e){return w$(e,[R2,N2],[z2,B2])}function U$(e,t,n=!1){let r={values:n?t.values:{...e.values,...t.values||{}},loc:e.loc.clone(t.loc),conversionAccuracy:t.conversionAccuracy||e.conversionAccuracy,matrix:t.matrix||e.matrix};return new Y2(r)}function W$(e,t){let n=t.milliseconds??0;for(let r of J2.slice(1))t[r]&&(n+=t[r]*e[r].milliseconds);return n}function G$(e,t){let n=W$(e,t)<0?-1:1;q2.reduceRight((r,i)=>{if(FQ(t[i]))return r;if(r){let a=t[r]*n,o=e[i][r],s=Math.floor(a/o);t[i]+=s*n,t[r]-=s*o*n}return i},null),q2.reduce((n,r)=>{if(FQ(t[r]))return n;if(n){let i=t[n]%1;t[n]-=i,t[r]+=i*e[n][r]}return r},null)}function K$(e){let t={};for(let[n,r]of Object.entries(e))r!==0&&(t[n]=r);return t}function q$(e,t){return!e||!e.isValid?Z2.invalid(`missing or invalid start`):!t||!t.isValid?Z2.invalid(`missing or invalid end`):t<e?Z2.invalid(`end before start`,`The end of an interval must be after its start, but you had start=${e.toISO()} and end=${t.toISO()}`):null}function J$(e,t){let n=e=>e.toUTC(0,{keepLocalTime:!0}).startOf(`day`).valueOf(),r=n(t)-n(e);return Math.floor(Y2.fromMillis(r).as(`days`))}function Y$(e,t,n){let r=[[`years`,(e,t)=>t.year-e.year],[`quarters`,(e,t)=>t.quarter-e.quarter+(t.year-e.year)*4],[`months`,(e,t)=>t.month-e.month+(t.year-e.year)*12],[`weeks`,(e,t)=>{let n=J$(e,t);return(n-n%7)/7}],[`days`,J$]],i={},a=e,o,s;for(let[c,l]of r)n.indexOf(c)>=0&&(o=c,i[c]=l(e,t),s=a.plus(i),s>t?(i[c]--,e=a.plus(i),e>t&&(s=e,i[c]--,e=a.plus(i))):e=s);return[e,i,s,o]}function X$(e,t,n,r){let[i,a,o,s]=Y$(e,t,n),c=t-i,l=n.filter(e=>[`hours`,`minutes`,`seconds`,`milliseconds`].indexOf(e)>=0);l.length===0&&(o<t&&(o=i.plus({[s]:1})),o!==i&&(a[s]=(a[s]||0)+c/(o-i)));let u=Y2.fromObject(a,r);return l.length>0?Y2.fromMillis(c,r).shiftTo(...l).plus(u):u}function Z$(e,t=e=>e){return{regex:e,deser:([e])=>t(vQ(e))}}function Q$(e){return e.replace(/\./g,`\\.?`).replace(t4,e4)}function $$(e){return e.replace(/\./g,``).replace(t4,` `).toLowerCase()}function e1(e,t){return e===null?null:{regex:RegExp(e.map(Q$).join(`|`)),deser:([n])=>e.findIndex(e=>$$(n)===$$(e))+t}}function t1(e,t){return{regex:e,deser:([,e,t])=>c$(e,t),groups:t}}function n1(e){return{regex:e,deser:([e])=>e}}function r1(e){return e.replace(/[\-\[\]{}()*+?.,\\\^$|#\s]/g,`\\$&`)}function i1(e,t){let n=bQ(t),r=bQ(t,`{2}`),i=bQ(t,`{3}`),a=bQ(t,`{4}`),o=bQ(t,`{6}`),s=bQ(t,`{1,2}`),c=bQ(t,`{1,3}`),l=bQ(t,`{1,6}`),u=bQ(t,`{1,9}`),d=bQ(t,`{2,4}`),f=bQ(t,`{4,6}`),p=e=>({regex:RegExp(r1(e.val)),deser:([e])=>e,literal:!0}),m=(m=>{if(e.literal)return p(m);switch(m.val){case`G`:return e1(t.eras(`short`),0);case`GG`:return e1(t.eras(`long`),0);case`y`:return Z$(l);case`yy`:return Z$(d,o$);case`yyyy`:return Z$(a);case`yyyyy`:return Z$(f);case`yyyyyy`:return Z$(o);case`M`:return Z$(s);case`MM`:return Z$(r);case`MMM`:return e1(t.months(`short`,!0),1);case`MMMM`:return e1(t.months(`long`,!0),1);case`L`:return Z$(s);case`LL`:return Z$(r);case`LLL`:return e1(t.months(`short`,!1),1);case`LLLL`:return e1(t.months(`long`,!1),1);case`d`:return Z$(s);case`dd`:return Z$(r);case`o`:return Z$(c);case`ooo`:return Z$(i);case`HH`:return Z$(r);case`H`:return Z$(s);case`hh`:return Z$(r);case`h`:return Z$(s);case`mm`:return Z$(r);case`m`:return Z$(s);case`q`:return Z$(s);case`qq`:return Z$(r);case`s`:return Z$(s);case`ss`:return Z$(r);case`S`:return Z$(c);case`SSS`:return Z$(i);case`u`:return n1(u);case`uu`:return n1(s);case`uuu`:return Z$(n);case`a`:return e1(t.meridiems(),0);case`kkkk`:return Z$(a);case`kk`:return Z$(d,o$);case`W`:return Z$(s);case`WW`:return Z$(r);case`E`:case`c`:return Z$(n);case`EEE`:return e1(t.weekdays(`short`,!1),1);case`EEEE`:return e1(t.weekdays(`long`,!1),1);case`ccc`:return e1(t.weekdays(`short`,!0),1);case`cccc`:return e1(t.weekdays(`long`,!0),1);case`Z`:case`ZZ`:return t1(RegExp(`([+-]${s.source})(?::(${r.source}))?`),2);case`ZZZ`:return t1(RegExp(`([+-]${s.source})(${r.source})?`),2);case`z`:return n1(/[a-z_+-/]{1,256}?/i);case` `:return n1(/[^\S\n\r]/);default:return p(m)}})(e)||{invalidReason:$2};return m.token=e,m}function a1(e,t,n){let{type:r,value:i}=e;if(r===`literal`){let e=/^\s+$/.test(i);return{literal:!e,val:e?` `:i}}let a=t[r],o=r;r===`hour`&&(o=t.hour12==null?t.hourCycle==null?n.hour12?`hour12`:`hour24`:t.hourCycle===`h11`||t.hourCycle===`h12`?`hour12`:`hour24`:t.hour12?`hour12`:`hour24`);let s=n4[o];if(typeof s==`object`&&(s=s[a]),s)return{literal:!1,val:s}}function o1(e){return[`^${e.map(e=>e.regex).reduce((e,t)=>`${e}(${t.source})`,``)}$`,e]}function s1(e,t,n){let r=e.match(t);if(r){let e={},t=1;for(let i in n)if(GQ(n,i)){let a=n[i],o=a.groups?a.groups+1:1;!a.literal&&a.token&&(e[a.token.val[0]]=a.deser(r.slice(t,t+o))),t+=o}return[r,e]}else return[r,{}]}function c1(e){let t=e=>{switch(e){case`S`:return`millisecond`;case`s`:return`second`;case`m`:return`minute`;case`h`:case`H`:return`hour`;case`d`:return`day`;case`o`:return`ordinal`;case`L`:case`M`:return`month`;case`y`:return`year`;case`E`:case`c`:return`weekday`;case`W`:return`weekNumber`;case`k`:return`weekYear`;case`q`:return`quarter`;default:return null}},n=null,r;return FQ(e.z)||(n=v0.create(e.z)),FQ(e.Z)||(n||=new M0(e.Z),r=e.Z),FQ(e.q)||(e.M=(e.q-1)*3+1),FQ(e.h)||(e.h<12&&e.a===1?e.h+=12:e.h===12&&e.a===0&&(e.h=0)),e.G===0&&e.y&&(e.y=-e.y),FQ(e.u)||(e.S=QQ(e.u)),[Object.keys(e).reduce((n,r)=>{let i=t(r);return i&&(n[i]=e[r]),n},{}),n,r]}function l1(){return r4||=h4.fromMillis(1555555555555),r4}function u1(e,t){if(e.literal)return e;let n=m1(s2.macroTokenToFormatOpts(e.val),t);return n==null||n.includes(void 0)?e:n}function d1(e,t){return Array.prototype.concat(...e.map(e=>u1(e,t)))}function f1(e,t,n){return new i4(e,n).explainFromTokens(t)}function p1(e,t,n){let{result:r,zone:i,specificOffset:a,invalidReason:o}=f1(e,t,n);return[r,i,a,o]}function m1(e,t){if(!e)return null;let n=s2.create(t,e).dtFormatter(l1()),r=n.formatToParts(),i=n.resolvedOptions();return r.map(t=>a1(t,e,i))}function h1(e){return new q0(`unsupported zone`,`the zone "${e.name}" is not supported`)}function g1(e){return e.weekData===null&&(e.weekData=EQ(e.c)),e.weekData}function _1(e){return e.localWeekData===null&&(e.localWeekData=EQ(e.c,e.loc.getMinDaysInFirstWeek(),e.loc.getStartOfWeek())),e.localWeekData}function v1(e,t){let n={ts:e.ts,zone:e.zone,c:e.c,o:e.o,loc:e.loc,invalid:e.invalid};return new h4({...n,...t,old:n})}function y1(e,t,n){let r=e-t*60*1e3,i=n.offset(r);if(t===i)return[r,t];r-=(i-t)*60*1e3;let a=n.offset(r);return i===a?[r,i]:[e-Math.min(i,a)*60*1e3,Math.max(i,a)]}function b1(e,t){e+=t*60*1e3;let n=new Date(e);return{year:n.getUTCFullYear(),month:n.getUTCMonth()+1,day:n.getUTCDate(),hour:n.getUTCHours(),minute:n.getUTCMinutes(),second:n.getUTCSeconds(),millisecond:n.getUTCMilliseconds()}}function x1(e,t,n){return y1(r$(e),t,n)}function S1(e,t){let n=e.o,r=e.c.year+Math.trunc(t.years),i=e.c.month+Math.trunc(t.months)+Math.trunc(t.quarters)*3,a={...e.c,year:r,month:i,day:Math.min(e.c.day,n$(r,i))+Math.trunc(t.days)+Math.trunc(t.weeks)*7},o=Y2.fromObject({years:t.years-Math.trunc(t.years),quarters:t.quarters-Math.trunc(t.quarters),months:t.months-Math.trunc(t.months),weeks:t.weeks-Math.trunc(t.weeks),days:t.days-Math.trunc(t.days),hours:t.hours,minutes:t.minutes,seconds:t.seconds,milliseconds:t.milliseconds}).as(`milliseconds`),[s,c]=y1(r$(a),n,e.zone);return o!==0&&(s+=o,c=e.zone.offset(s)),{ts:s,o:c}}function C1(e,t,n,r,i,a){let{setZone:o,zone:s}=n;if(e&&Object.keys(e).length!==0||t){let r=t||s,i=h4.fromObject(e,{...n,zone:r,specificOffset:a});return o?i:i.setZone(s)}else return h4.invalid(new q0(`unparsable`,`the input "${i}" can't be parsed as ${r}`))}function w1(e,t,n=!0){return e.isValid?s2.create(A0.create(`en-US`),{allowZ:n,forceSimple:!0}).formatDateTimeFromString(e,t):null}function T1(e,t,n){let r=e.c.year>9999||e.c.year<0,i=``;if(r&&e.c.year>=0&&(i+=`+`),i+=YQ(e.c.year,r?6:4),n===`year`)return i;if(t){if(i+=`-`,i+=YQ(e.c.month),n===`month`)return i;i+=`-`}else if(i+=YQ(e.c.month),n===`month`)return i;return i+=YQ(e.c.day),i}function E1(e,t,n,r,i,a,o){let s=!n||e.c.millisecond!==0||e.c.second!==0,c=``;switch(o){case`day`:case`month`:case`year`:break;default:if(c+=YQ(e.c.hour),o===`hour`)break;if(t){if(c+=`:`,c+=YQ(e.c.minute),o===`minute`)break;s&&(c+=`:`,c+=YQ(e.c.second))}else{if(c+=YQ(e.c.minute),o===`minute`)break;s&&(c+=YQ(e.c.second))}if(o===`second`)break;s&&(!r||e.c.millisecond!==0)&&(c+=`.`,c+=YQ(e.c.millisecond,3))}return i&&(e.isOffsetFixed&&e.offset===0&&!a?c+=`Z`:e.o<0?(c+=`-`,c+=YQ(Math.trunc(-e.o/60)),c+=`:`,c+=YQ(Math.trunc(-e.o%60))):(c+=`+`,c+=YQ(Math.trunc(e.o/60)),c+=`:`,c+=YQ(Math.trunc(e.o%60)))),a&&(c+=`[`+e.zone.ianaName+`]`),c}function D1(e){let t={year:`year`,years:`year`,month:`month`,months:`month`,day:`day`,days:`day`,hour:`hour`,hours:`hour`,minute:`minute`,minutes:`minute`,quarter:`quarter`,quarters:`quarter`,second:`second`,seconds:`second`,millisecond:`millisecond`,milliseconds:`millisecond`,weekday:`weekday`,weekdays:`weekday`,weeknumber:`weekNumber`,weeksnumber:`weekNumber`,weeknumbers:`weekNumber`,weekyear:`weekYear`,weekyears:`weekYear`,ordinal:`ordinal`}[e.toLowerCase()];if(!t)throw new z1(e);return t}function O1(e){switch(e.toLowerCase()){case`localweekday`:case`localweekdays`:return`localWeekday`;case`localweeknumber`:case`localweeknumbers`:return`localWeekNumber`;case`localweekyear`:case`localweekyears`:return`localWeekYear`;default:return D1(e)}}function k1(e){if(p4===void 0&&(p4=K0.now()),e.type!==`iana`)return e.offset(p4);let t=e.name,n=m4.get(t);return n===void 0&&(n=e.offset(p4),m4.set(t,n)),n}function A1(e,t){let n=_Q(t.zone,K0.defaultZone);if(!n.isValid)return h4.invalid(h1(n));let r=A0.fromObject(t),i,a;if(FQ(e.year))i=K0.now();else{for(let t of u4)FQ(e[t])&&(e[t]=s4[t]);let t=NQ(e)||PQ(e);if(t)return h4.invalid(t);let r=k1(n);[i,a]=x1(e,r,n)}return new h4({ts:i,zone:n,loc:r,o:a})}function j1(e,t,n){let r=FQ(n.round)?!0:n.round,i=FQ(n.rounding)?`trunc`:n.rounding,a=(e,a)=>(e=$Q(e,r||n.calendary?0:2,n.calendary?`round`:i),t.loc.clone(n).relFormatter(n).format(e,a)),o=r=>n.calendary?t.hasSame(e,r)?0:t.startOf(r).diff(e.startOf(r),r).get(r):t.diff(e,r).get(r);if(n.unit)return a(o(n.unit),n.unit);for(let e of n.units){let t=o(e);if(Math.abs(t)>=1)return a(t,e)}return a(e>t?-0:0,n.units[n.units.length-1])}function M1(e){let t={},n;return e.length>0&&typeof e[e.length-1]==`object`?(t=e[e.length-1],n=Array.from(e).slice(0,e.length-1)):n=Array.from(e),[t,n]}function N1(e){if(h4.isDateTime(e))return e;if(e&&e.valueOf&&IQ(e.valueOf()))return h4.fromJSDate(e);if(e&&typeof e==`object`)return h4.fromObject(e);throw new B1(`Unknown datetime argument: ${e}, of type ${typeof e}`)}var P1,F1,I1,L1,R1,z1,B1,V1,$,H1,U1,W1,G1,K1,q1,J1,Y1,X1,Z1,Q1,$1,e0,t0,n0,r0,i0,a0,o0,s0,c0,l0,u0,d0,f0,p0,m0,h0,g0,_0,v0,y0,b0,x0,S0,C0,w0,T0,E0,D0,O0,k0,A0,j0,M0,N0,P0,F0,I0,L0,R0,z0,B0,V0,H0,U0,W0,G0,K0,q0,J0,Y0,X0,Z0,Q0,$0,e2,t2,n2,r2,i2,a2,o2,s2,c2,l2,u2,d2,f2,p2,m2,h2,g2,_2,v2,y2,b2,x2,S2,C2,w2,T2,E2,D2,O2,k2,A2,j2,M2,N2,P2,F2,I2,L2,R2,z2,B2,V2,H2,U2,W2,G2,K2,q2,J2,Y2,X2,Z2,Q2,$2,e4,t4,n4,r4,i4,a4,o4,s4,c4,l4,u4,d4,f4,p4,m4,h4,g4=t((()=>{P1=class extends Error{},F1=class extends P1{constructor(e){super(`Invalid DateTime: ${e.toMessage()}`)}},I1=class extends P1{constructor(e){super(`Invalid Interval: ${e.toMessage()}`)}},L1=class extends P1{constructor(e){super(`Invalid Duration: ${e.toMessage()}`)}},R1=class extends P1{},z1=class extends P1{constructor(e){super(`Invalid unit ${e}`)}},B1=class extends P1{},V1=class extends P1{constructor(){super(`Zone is an abstract class`)}},$=`numeric`,H1=`short`,U1=`long`,W1={year:$,month:$,day:$},G1={year:$,month:H1,day:$},K1={year:$,month:H1,day:$,weekday:H1},q1={year:$,month:U1,day:$},J1={year:$,month:U1,day:$,weekday:U1},Y1={hour:$,minute:$},X1={hour:$,minute:$,second:$},Z1={hour:$,minute:$,second:$,timeZoneName:H1},Q1={hour:$,minute:$,second:$,timeZoneName:U1},$1={hour:$,minute:$,hourCycle:`h23`},e0={hour:$,minute:$,second:$,hourCycle:`h23`},t0={hour:$,minute:$,second:$,hourCycle:`h23`,timeZoneName:H1},n0={hour:$,minute:$,second:$,hourCycle:`h23`,timeZoneName:U1},r0={year:$,month:$,day:$,hour:$,minute:$},i0={year:$,month:$,day:$,hour:$,minute:$,second:$},a0={year:$,month:H1,day:$,hour:$,minute:$},o0={year:$,month:H1,day:$,hour:$,minute:$,second:$},s0={year:$,month:H1,day:$,weekday:H1,hour:$,minute:$},c0={year:$,month:U1,day:$,hour:$,minute:$,timeZoneName:H1},l0={year:$,month:U1,day:$,hour:$,minute:$,second:$,timeZoneName:H1},u0={year:$,month:U1,day:$,weekday:U1,hour:$,minute:$,timeZoneName:U1},d0={year:$,month:U1,day:$,weekday:U1,hour:$,minute:$,second:$,timeZoneName:U1},f0=class{get type(){throw new V1}get name(){throw new V1}get ianaName(){return this.name}get isUniversal(){throw new V1}offsetName(e,t){throw new V1}formatOffset(e,t){throw new V1}offset(e){throw new V1}equals(e){throw new V1}get isValid(){throw new V1}},p0=null,m0=class e extends f0{static get instance(){return p0===null&&(p0=new e),p0}get type(){return`system`}get name(){return new Intl.DateTimeFormat().resolvedOptions().timeZone}get isUniversal(){return!1}offsetName(e,{format:t,locale:n}){return s$(e,t,n)}formatOffset(e,t){return d$(this.offset(e),t)}offset(e){return-new Date(e).getTimezoneOffset()}equals(e){return e.type===`system`}get isValid(){return!0}},h0=new Map,g0={year:0,month:1,day:2,era:3,hour:4,minute:5,second:6},_0=new Map,v0=class e extends f0{static create(t){let n=_0.get(t);return n===void 0&&_0.set(t,n=new e(t)),n}static resetCache(){_0.clear(),h0.clear()}static isValidSpecifier(e){return this.isValidZone(e)}static isValidZone(e){if(!e)return!1;try{return new Intl.DateTimeFormat(`en-US`,{timeZone:e}).format(),!0}catch{return!1}}constructor(t){super(),this.zoneName=t,this.valid=e.isValidZone(t)}get type(){return`iana`}get name(){return this.zoneName}get isUniversal(){return!1}offsetName(e,{format:t,locale:n}){return s$(e,t,n,this.name)}formatOffset(e,t){return d$(this.offset(e),t)}offset(e){if(!this.valid)return NaN;let t=new Date(e);if(isNaN(t))return NaN;let n=tQ(this.name),[r,i,a,o,s,c,l]=n.formatToParts?rQ(n,t):nQ(n,t);o===`BC`&&(r=-Math.abs(r)+1);let u=r$({year:r,month:i,day:a,hour:s===24?0:s,minute:c,second:l,millisecond:0}),d=+t,f=d%1e3;return d-=f>=0?f:1e3+f,(u-d)/(60*1e3)}equals(e){return e.type===`iana`&&e.name===this.name}get isValid(){return this.valid}},y0={},b0=new Map,x0=new Map,S0=new Map,C0=null,w0=new Map,T0=new Map,E0=class{constructor(e,t,n){this.padTo=n.padTo||0,this.floor=n.floor||!1;let{padTo:r,floor:i,...a}=n;if(!t||Object.keys(a).length>0){let t={useGrouping:!1,...n};n.padTo>0&&(t.minimumIntegerDigits=n.padTo),this.inf=oQ(e,t)}}format(e){if(this.inf){let t=this.floor?Math.floor(e):e;return this.inf.format(t)}else return YQ(this.floor?Math.floor(e):$Q(e,3),this.padTo)}},D0=class{constructor(e,t,n){this.opts=n,this.originalZone=void 0;let r;if(this.opts.timeZone)this.dt=e;else if(e.zone.type===`fixed`){let t=-1*(e.offset/60),n=t>=0?`Etc/GMT+${t}`:`Etc/GMT${t}`;e.offset!==0&&v0.create(n).valid?(r=n,this.dt=e):(r=`UTC`,this.dt=e.offset===0?e:e.setZone(`UTC`).plus({minutes:e.offset}),this.originalZone=e.zone)}else e.zone.type===`system`?this.dt=e:e.zone.type===`iana`?(this.dt=e,r=e.zone.name):(r=`UTC`,this.dt=e.setZone(`UTC`).plus({minutes:e.offset}),this.originalZone=e.zone);let i={...this.opts};i.timeZone=i.timeZone||r,this.dtf=aQ(t,i)}format(){return this.originalZone?this.formatToParts().map(({value:e})=>e).join(``):this.dtf.format(this.dt.toJSDate())}formatToParts(){let e=this.dtf.formatToParts(this.dt.toJSDate());return this.originalZone?e.map(e=>{if(e.type===`timeZoneName`){let t=this.originalZone.offsetName(this.dt.ts,{locale:this.dt.locale,format:this.opts.timeZoneName});return{...e,value:t}}else return e}):e}resolvedOptions(){return this.dtf.resolvedOptions()}},O0=class{constructor(e,t,n){this.opts={style:`long`,...n},!t&&BQ()&&(this.rtf=sQ(e,n))}format(e,t){return this.rtf?this.rtf.format(e,t):b$(t,e,this.opts.numeric,this.opts.style!==`long`)}formatToParts(e,t){return this.rtf?this.rtf.formatToParts(e,t):[]}},k0={firstDay:1,minimalDays:4,weekend:[6,7]},A0=class e{static fromOpts(t){return e.create(t.locale,t.numberingSystem,t.outputCalendar,t.weekSettings,t.defaultToEN)}static create(t,n,r,i,a=!1){let o=t||K0.defaultLocale,s=o||(a?`en-US`:cQ()),c=n||K0.defaultNumberingSystem,l=r||K0.defaultOutputCalendar,u=KQ(i)||K0.defaultWeekSettings;return new e(s,c,l,u,o)}static resetCache(){C0=null,b0.clear(),x0.clear(),S0.clear(),w0.clear(),T0.clear()}static fromObject({locale:t,numberingSystem:n,outputCalendar:r,weekSettings:i}={}){return e.create(t,n,r,i)}constructor(e,t,n,r,i){let[a,o,s]=dQ(e);this.locale=a,this.numberingSystem=t||o||null,this.outputCalendar=n||s||null,this.weekSettings=r,this.intl=fQ(this.locale,this.numberingSystem,this.outputCalendar),this.weekdaysCache={format:{},standalone:{}},this.monthsCache={format:{},standalone:{}},this.meridiemCache=null,this.eraCache={},this.specifiedLocale=i,this.fastNumbersCached=null}get fastNumbers(){return this.fastNumbersCached??=gQ(this),this.fastNumbersCached}listingMode(){let e=this.isEnglish(),t=(this.numberingSystem===null||this.numberingSystem===`latn`)&&(this.outputCalendar===null||this.outputCalendar===`gregory`);return e&&t?`en`:`intl`}clone(t){return!t||Object.getOwnPropertyNames(t).length===0?this:e.create(t.locale||this.specifiedLocale,t.numberingSystem||this.numberingSystem,t.outputCalendar||this.outputCalendar,KQ(t.weekSettings)||this.weekSettings,t.defaultToEN||!1)}redefaultToEN(e={}){return this.clone({...e,defaultToEN:!0})}redefaultToSystem(e={}){return this.clone({...e,defaultToEN:!1})}months(e,t=!1){return hQ(this,e,p$,()=>{let n=this.intl===`ja`||this.intl.startsWith(`ja-`);t&=!n;let r=t?{month:e,day:`numeric`}:{month:e},i=t?`format`:`standalone`;if(!this.monthsCache[i][e]){let t=n?e=>this.dtFormatter(e,r).format():e=>this.extract(e,r,`month`);this.monthsCache[i][e]=pQ(t)}return this.monthsCache[i][e]})}weekdays(e,t=!1){return hQ(this,e,m$,()=>{let n=t?{weekday:e,year:`numeric`,month:`long`,day:`numeric`}:{weekday:e},r=t?`format`:`standalone`;return this.weekdaysCache[r][e]||(this.weekdaysCache[r][e]=mQ(e=>this.extract(e,n,`weekday`))),this.weekdaysCache[r][e]})}meridiems(){return hQ(this,void 0,()=>n2,()=>{if(!this.meridiemCache){let e={hour:`numeric`,hourCycle:`h12`};this.meridiemCache=[h4.utc(2016,11,13,9),h4.utc(2016,11,13,19)].map(t=>this.extract(t,e,`dayperiod`))}return this.meridiemCache})}eras(e){return hQ(this,e,h$,()=>{let t={era:e};return this.eraCache[e]||(this.eraCache[e]=[h4.utc(-40,1,1),h4.utc(2017,1,1)].map(e=>this.extract(e,t,`era`))),this.eraCache[e]})}extract(e,t,n){let r=this.dtFormatter(e,t).formatToParts().find(e=>e.type.toLowerCase()===n);return r?r.value:null}numberFormatter(e={}){return new E0(this.intl,e.forceSimple||this.fastNumbers,e)}dtFormatter(e,t={}){return new D0(e,this.intl,t)}relFormatter(e={}){return new O0(this.intl,this.isEnglish(),e)}listFormatter(e={}){return iQ(this.intl,e)}isEnglish(){return this.locale===`en`||this.locale.toLowerCase()===`en-us`||lQ(this.intl).locale.startsWith(`en-us`)}getWeekSettings(){return this.weekSettings?this.weekSettings:VQ()?uQ(this.locale):k0}getStartOfWeek(){return this.getWeekSettings().firstDay}getMinDaysInFirstWeek(){return this.getWeekSettings().minimalDays}getWeekendDays(){return this.getWeekSettings().weekend}equals(e){return this.locale===e.locale&&this.numberingSystem===e.numberingSystem&&this.outputCalendar===e.outputCalendar}toString(){return`Locale(${this.locale}, ${this.numberingSystem}, ${this.outputCalendar})`}},j0=null,M0=class e extends f0{static get utcInstance(){return j0===null&&(j0=new e(0)),j0}static instance(t){return t===0?e.utcInstance:new e(t)}static parseSpecifier(t){if(t){let n=t.match(/^utc(?:([+-]\d{1,2})(?::(\d{2}))?)?$/i);if(n)return new e(c$(n[1],n[2]))}return null}constructor(e){super(),this.fixed=e}get type(){return`fixed`}get name(){return this.fixed===0?`UTC`:`UTC${d$(this.fixed,`narrow`)}`}get ianaName(){return this.fixed===0?`Etc/UTC`:`Etc/GMT${d$(-this.fixed,`narrow`)}`}offsetName(){return this.name}formatOffset(e,t){return d$(this.fixed,t)}get isUniversal(){return!0}offset(){return this.fixed}equals(e){return e.type===`fixed`&&e.fixed===this.fixed}get isValid(){return!0}},N0=class extends f0{constructor(e){super(),this.zoneName=e}get type(){return`invalid`}get name(){return this.zoneName}get isUniversal(){return!1}offsetName(){return null}formatOffset(){return``}offset(){return NaN}equals(){return!1}get isValid(){return!1}},P0={arab:`[٠-٩]`,arabext:`[۰-۹]`,bali:`[᭐-᭙]`,beng:`[০-৯]`,deva:`[०-९]`,fullwide:`[０-９]`,gujr:`[૦-૯]`,hanidec:`[〇|一|二|三|四|五|六|七|八|九]`,khmr:`[០-៩]`,knda:`[೦-೯]`,laoo:`[໐-໙]`,limb:`[᥆-᥏]`,mlym:`[൦-൯]`,mong:`[᠐-᠙]`,mymr:`[၀-၉]`,orya:`[୦-୯]`,tamldec:`[௦-௯]`,telu:`[౦-౯]`,thai:`[๐-๙]`,tibt:`[༠-༩]`,latn:`\\d`},F0={arab:[1632,1641],arabext:[1776,1785],bali:[6992,7001],beng:[2534,2543],deva:[2406,2415],fullwide:[65296,65303],gujr:[2790,2799],khmr:[6112,6121],knda:[3302,3311],laoo:[3792,3801],limb:[6470,6479],mlym:[3430,3439],mong:[6160,6169],mymr:[4160,4169],orya:[2918,2927],tamldec:[3046,3055],telu:[3174,3183],thai:[3664,3673],tibt:[3872,3881]},I0=P0.hanidec.replace(/[\[|\]]/g,``).split(``),L0=new Map,R0=()=>Date.now(),z0=`system`,B0=null,V0=null,H0=null,U0=60,G0=null,K0=class{static get now(){return R0}static set now(e){R0=e}static set defaultZone(e){z0=e}static get defaultZone(){return _Q(z0,m0.instance)}static get defaultLocale(){return B0}static set defaultLocale(e){B0=e}static get defaultNumberingSystem(){return V0}static set defaultNumberingSystem(e){V0=e}static get defaultOutputCalendar(){return H0}static set defaultOutputCalendar(e){H0=e}static get defaultWeekSettings(){return G0}static set defaultWeekSettings(e){G0=KQ(e)}static get twoDigitCutoffYear(){return U0}static set twoDigitCutoffYear(e){U0=e%100}static get throwOnInvalid(){return W0}static set throwOnInvalid(e){W0=e}static resetCaches(){A0.resetCache(),v0.resetCache(),h4.resetCache(),yQ()}},q0=class{constructor(e,t){this.reason=e,this.explanation=t}toMessage(){return this.explanation?`${this.reason}: ${this.explanation}`:this.reason}},J0=[0,31,59,90,120,151,181,212,243,273,304,334],Y0=[0,31,60,91,121,152,182,213,244,274,305,335],X0=[`January`,`February`,`March`,`April`,`May`,`June`,`July`,`August`,`September`,`October`,`November`,`December`],Z0=[`Jan`,`Feb`,`Mar`,`Apr`,`May`,`Jun`,`Jul`,`Aug`,`Sep`,`Oct`,`Nov`,`Dec`],Q0=[`J`,`F`,`M`,`A`,`M`,`J`,`J`,`A`,`S`,`O`,`N`,`D`],$0=[`Monday`,`Tuesday`,`Wednesday`,`Thursday`,`Friday`,`Saturday`,`Sunday`],e2=[`Mon`,`Tue`,`Wed`,`Thu`,`Fri`,`Sat`,`Sun`],t2=[`M`,`T`,`W`,`T`,`F`,`S`,`S`],n2=[`AM`,`PM`],r2=[`Before Christ`,`Anno Domini`],i2=[`BC`,`AD`],a2=[`B`,`A`],o2={D:W1,DD:G1,DDD:q1,DDDD:J1,t:Y1,tt:X1,ttt:Z1,tttt:Q1,T:$1,TT:e0,TTT:t0,TTTT:n0,f:r0,ff:a0,fff:c0,ffff:u0,F:i0,FF:o0,FFF:l0,FFFF:d0},s2=class e{static create(t,n={}){return new e(t,n)}static parseFormat(e){let t=null,n=``,r=!1,i=[];for(let a=0;a<e.length;a++){let o=e.charAt(a);o===`'`?((n.length>0||r)&&i.push({literal:r||/^\s+$/.test(n),val:n===``?`'`:n}),t=null,n=``,r=!r):r||o===t?n+=o:(n.length>0&&i.push({literal:/^\s+$/.test(n),val:n}),n=o,t=o)}return n.length>0&&i.push({literal:r||/^\s+$/.test(n),val:n}),i}static macroTokenToFormatOpts(e){return o2[e]}constructor(e,t){this.opts=t,this.loc=e,this.systemLoc=null}formatWithSystemDefault(e,t){return this.systemLoc===null&&(this.systemLoc=this.loc.redefaultToSystem()),this.systemLoc.dtFormatter(e,{...this.opts,...t}).format()}dtFormatter(e,t={}){return this.loc.dtFormatter(e,{...this.opts,...t})}formatDateTime(e,t){return this.dtFormatter(e,t).format()}formatDateTimeParts(e,t){return this.dtFormatter(e,t).formatToParts()}formatInterval(e,t){return this.dtFormatter(e.start,t).dtf.formatRange(e.start.toJSDate(),e.end.toJSDate())}resolvedOptions(e,t){return this.dtFormatter(e,t).resolvedOptions()}num(e,t=0,n=void 0){if(this.opts.forceSimple)return YQ(e,t);let r={...this.opts};return t>0&&(r.padTo=t),n&&(r.signDisplay=n),this.loc.numberFormatter(r).format(e)}formatDateTimeFromString(t,n){let r=this.loc.listingMode()===`en`,i=this.loc.outputCalendar&&this.loc.outputCalendar!==`gregory`,a=(e,n)=>this.loc.extract(t,e,n),o=e=>t.isOffsetFixed&&t.offset===0&&e.allowZ?`Z`:t.isValid?t.zone.formatOffset(t.ts,e.format):``,s=()=>r?g$(t):a({hour:`numeric`,hourCycle:`h12`},`dayperiod`),c=(e,n)=>r?v$(t,e):a(n?{month:e}:{month:e,day:`numeric`},`month`),l=(e,n)=>r?_$(t,e):a(n?{weekday:e}:{weekday:e,month:`long`,day:`numeric`},`weekday`),u=n=>{let r=e.macroTokenToFormatOpts(n);return r?this.formatWithSystemDefault(t,r):n},d=e=>r?y$(t,e):a({era:e},`era`);return x$(e.parseFormat(n),e=>{switch(e){case`S`:return this.num(t.millisecond);case`u`:case`SSS`:return this.num(t.millisecond,3);case`s`:return this.num(t.second);case`ss`:return this.num(t.second,2);case`uu`:return this.num(Math.floor(t.millisecond/10),2);case`uuu`:return this.num(Math.floor(t.millisecond/100));case`m`:return this.num(t.minute);case`mm`:return this.num(t.minute,2);case`h`:return this.num(t.hour%12==0?12:t.hour%12);case`hh`:return this.num(t.hour%12==0?12:t.hour%12,2);case`H`:return this.num(t.hour);case`HH`:return this.num(t.hour,2);case`Z`:return o({format:`narrow`,allowZ:this.opts.allowZ});case`ZZ`:return o({format:`short`,allowZ:this.opts.allowZ});case`ZZZ`:return o({format:`techie`,allowZ:this.opts.allowZ});case`ZZZZ`:return t.zone.offsetName(t.ts,{format:`short`,locale:this.loc.locale});case`ZZZZZ`:return t.zone.offsetName(t.ts,{format:`long`,locale:this.loc.locale});case`z`:return t.zoneName;case`a`:return s();case`d`:return i?a({day:`numeric`},`day`):this.num(t.day);case`dd`:return i?a({day:`2-digit`},`day`):this.num(t.day,2);case`c`:return this.num(t.weekday);case`ccc`:return l(`short`,!0);case`cccc`:return l(`long`,!0);case`ccccc`:return l(`narrow`,!0);case`E`:return this.num(t.weekday);case`EEE`:return l(`short`,!1);case`EEEE`:return l(`long`,!1);case`EEEEE`:return l(`narrow`,!1);case`L`:return i?a({month:`numeric`,day:`numeric`},`month`):this.num(t.month);case`LL`:return i?a({month:`2-digit`,day:`numeric`},`month`):this.num(t.month,2);case`LLL`:return c(`short`,!0);case`LLLL`:return c(`long`,!0);case`LLLLL`:return c(`narrow`,!0);case`M`:return i?a({month:`numeric`},`month`):this.num(t.month);case`MM`:return i?a({month:`2-digit`},`month`):this.num(t.month,2);case`MMM`:return c(`short`,!1);case`MMMM`:return c(`long`,!1);case`MMMMM`:return c(`narrow`,!1);case`y`:return i?a({year:`numeric`},`year`):this.num(t.year);case`yy`:return i?a({year:`2-digit`},`year`):this.num(t.year.toString().slice(-2),2);case`yyyy`:return i?a({year:`numeric`},`year`):this.num(t.year,4);case`yyyyyy`:return i?a({year:`numeric`},`year`):this.num(t.year,6);case`G`:return d(`short`);case`GG`:return d(`long`);case`GGGGG`:return d(`narrow`);case`kk`:return this.num(t.weekYear.toString().slice(-2),2);case`kkkk`:return this.num(t.weekYear,4);case`W`:return this.num(t.weekNumber);case`WW`:return this.num(t.weekNumber,2);case`n`:return this.num(t.localWeekNumber);case`nn`:return this.num(t.localWeekNumber,2);case`ii`:return this.num(t.localWeekYear.toString().slice(-2),2);case`iiii`:return this.num(t.localWeekYear,4);case`o`:return this.num(t.ordinal);case`ooo`:return this.num(t.ordinal,3);case`q`:return this.num(t.quarter);case`qq`:return this.num(t.quarter,2);case`X`:return this.num(Math.floor(t.ts/1e3));case`x`:return this.num(t.ts);default:return u(e)}})}formatDurationFromString(t,n){let r=this.opts.signMode===`negativeLargestOnly`?-1:1,i=e=>{switch(e[0]){case`S`:return`milliseconds`;case`s`:return`seconds`;case`m`:return`minutes`;case`h`:return`hours`;case`d`:return`days`;case`w`:return`weeks`;case`M`:return`months`;case`y`:return`years`;default:return null}},a=(e,t)=>n=>{let a=i(n);if(a){let i=t.isNegativeDuration&&a!==t.largestUnit?r:1,o;return o=this.opts.signMode===`negativeLargestOnly`&&a!==t.largestUnit?`never`:this.opts.signMode===`all`?`always`:`auto`,this.num(e.get(a)*i,n.length,o)}else return n},o=e.parseFormat(n),s=o.reduce((e,{literal:t,val:n})=>t?e:e.concat(n),[]),c=t.shiftTo(...s.map(i).filter(e=>e));return x$(o,a(c,{isNegativeDuration:c<0,largestUnit:Object.keys(c.values)[0]}))}},c2=/[A-Za-z_+-]{1,256}(?::?\/[A-Za-z0-9_+-]{1,256}(?:\/[A-Za-z0-9_+-]{1,256})?)?/,l2=/(?:([Zz])|([+-]\d\d)(?::?(\d\d))?)/,u2=`(?:${l2.source}?(?:\\[(${c2.source})\\])?)?`,d2=/(\d\d)(?::?(\d\d)(?::?(\d\d)(?:[.,](\d{1,30}))?)?)?/,f2=RegExp(`${d2.source}${u2}`),p2=RegExp(`(?:[Tt]${f2.source})?`),m2=/([+-]\d{6}|\d{4})(?:-?(\d\d)(?:-?(\d\d))?)?/,h2=/(\d{4})-?W(\d\d)(?:-?(\d))?/,g2=/(\d{4})-?(\d{3})/,_2=T$(`weekYear`,`weekNumber`,`weekDay`),v2=T$(`year`,`ordinal`),y2=/(\d{4})-(\d\d)-(\d\d)/,b2=RegExp(`${d2.source} ?(?:${l2.source}|(${c2.source}))?`),x2=RegExp(`(?: ${b2.source})?`),S2=RegExp(`^T?${d2.source}$`),C2=/^-?P(?:(?:(-?\d{1,20}(?:\.\d{1,20})?)Y)?(?:(-?\d{1,20}(?:\.\d{1,20})?)M)?(?:(-?\d{1,20}(?:\.\d{1,20})?)W)?(?:(-?\d{1,20}(?:\.\d{1,20})?)D)?(?:T(?:(-?\d{1,20}(?:\.\d{1,20})?)H)?(?:(-?\d{1,20}(?:\.\d{1,20})?)M)?(?:(-?\d{1,20})(?:[.,](-?\d{1,20}))?S)?)?)$/,w2={GMT:0,EDT:-240,EST:-300,CDT:-300,CST:-360,MDT:-360,MST:-420,PDT:-420,PST:-480},T2=/^(?:(Mon|Tue|Wed|Thu|Fri|Sat|Sun),\s)?(\d{1,2})\s(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s(\d{2,4})\s(\d\d):(\d\d)(?::(\d\d))?\s(?:(UT|GMT|[ECMP][SD]T)|([Zz])|(?:([+-]\d\d)(\d\d)))$/,E2=/^(Mon|Tue|Wed|Thu|Fri|Sat|Sun), (\d\d) (Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec) (\d{4}) (\d\d):(\d\d):(\d\d) GMT$/,D2=/^(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday), (\d\d)-(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)-(\d\d) (\d\d):(\d\d):(\d\d) GMT$/,O2=/^(Mon|Tue|Wed|Thu|Fri|Sat|Sun) (Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec) ( \d|\d\d) (\d\d):(\d\d):(\d\d) (\d{4})$/,k2=S$(m2,p2),A2=S$(h2,p2),j2=S$(g2,p2),M2=S$(f2),N2=C$(D$,O$,k$,A$),P2=C$(_2,O$,k$,A$),F2=C$(v2,O$,k$,A$),I2=C$(O$,k$,A$),L2=C$(O$),R2=S$(y2,x2),z2=S$(b2),B2=C$(O$,k$,A$),V2=`Invalid Duration`,H2={weeks:{days:7,hours:168,minutes:10080,seconds:10080*60,milliseconds:10080*60*1e3},days:{hours:24,minutes:1440,seconds:1440*60,milliseconds:1440*60*1e3},hours:{minutes:60,seconds:3600,milliseconds:3600*1e3},minutes:{seconds:60,milliseconds:60*1e3},seconds:{milliseconds:1e3}},U2={years:{quarters:4,months:12,weeks:52,days:365,hours:365*24,minutes:365*24*60,seconds:365*24*60*60,milliseconds:365*24*60*60*1e3},quarters:{months:3,weeks:13,days:91,hours:2184,minutes:2184*60,seconds:2184*60*60,milliseconds:2184*60*60*1e3},months:{weeks:4,days:30,hours:720,minutes:720*60,seconds:720*60*60,milliseconds:720*60*60*1e3},...H2},W2=146097/400,G2=146097/4800,K2={years:{quarters:4,months:12,weeks:W2/7,days:W2,hours:W2*24,minutes:W2*24*60,seconds:W2*24*60*60,milliseconds:W2*24*60*60*1e3},quarters:{months:3,weeks:W2/28,days:W2/4,hours:W2*24/4,minutes:W2*24*60/4,seconds:W2*24*60*60/4,milliseconds:W2*24*60*60*1e3/4},months:{weeks:G2/7,days:G2,hours:G2*24,minutes:G2*24*60,seconds:G2*24*60*60,milliseconds:G2*24*60*60*1e3},...H2},q2=[`years`,`quarters`,`months`,`weeks`,`days`,`hours`,`minutes`,`seconds`,`milliseconds`],J2=q2.slice(0).reverse(),Y2=class e{constructor(e){let t=e.conversionAccuracy===`longterm`||!1,n=t?K2:U2;e.matrix&&(n=e.matrix),this.values=e.values,this.loc=e.loc||A0.create(),this.conversionAccuracy=t?`longterm`:`casual`,this.invalid=e.invalid||null,this.matrix=n,this.isLuxonDuration=!0}static fromMillis(t,n){return e.fromObject({milliseconds:t},n)}static fromObject(t,n={}){if(typeof t!=`object`||!t)throw new B1(`Duration.fromObject: argument expected to be an object, got ${t===null?`null`:typeof t}`);return new e({values:u$(t,e.normalizeUnit),loc:A0.fromObject(n),conversionAccuracy:n.conversionAccuracy,matrix:n.matrix})}static fromDurationLike(t){if(IQ(t))return e.fromMillis(t);if(e.isDuration(t))return t;if(typeof t==`object`)return e.fromObject(t);throw new B1(`Unknown duration argument ${t} of type ${typeof t}`)}static fromISO(t,n){let[r]=B$(t);return r?e.fromObject(r,n):e.invalid(`unparsable`,`the input "${t}" can't be parsed as ISO 8601`)}static fromISOTime(t,n){let[r]=V$(t);return r?e.fromObject(r,n):e.invalid(`unparsable`,`the input "${t}" can't be parsed as ISO 8601`)}static invalid(t,n=null){if(!t)throw new B1(`need to specify a reason the Duration is invalid`);let r=t instanceof q0?t:new q0(t,n);if(K0.throwOnInvalid)throw new L1(r);return new e({invalid:r})}static normalizeUnit(e){let t={year:`years`,years:`years`,quarter:`quarters`,quarters:`quarters`,month:`months`,months:`months`,week:`weeks`,weeks:`weeks`,day:`days`,days:`days`,hour:`hours`,hours:`hours`,minute:`minutes`,minutes:`minutes`,second:`seconds`,seconds:`seconds`,millisecond:`milliseconds`,milliseconds:`milliseconds`}[e&&e.toLowerCase()];if(!t)throw new z1(e);return t}static isDuration(e){return e&&e.isLuxonDuration||!1}get locale(){return this.isValid?this.loc.locale:null}get numberingSystem(){return this.isValid?this.loc.numberingSystem:null}toFormat(e,t={}){let n={...t,floor:t.round!==!1&&t.floor!==!1};return this.isValid?s2.create(this.loc,n).formatDurationFromString(this,e):V2}toHuman(e={}){if(!this.isValid)return V2;let t=e.showZeros!==!1,n=q2.map(n=>{let r=this.values[n];return FQ(r)||r===0&&!t?null:this.loc.numberFormatter({style:`unit`,unitDisplay:`long`,...e,unit:n.slice(0,-1)}).format(r)}).filter(e=>e);return this.loc.listFormatter({type:`conjunction`,style:e.listStyle||`narrow`,...e}).format(n)}toObject(){return this.isValid?{...this.values}:{}}toISO(){if(!this.isValid)return null;let e=`P`;return this.years!==0&&(e+=this.years+`Y`),(this.months!==0||this.quarters!==0)&&(e+=this.months+this.quarters*3+`M`),this.weeks!==0&&(e+=this.weeks+`W`),this.days!==0&&(e+=this.days+`D`),(this.hours!==0||this.minutes!==0||this.seconds!==0||this.milliseconds!==0)&&(e+=`T`),this.hours!==0&&(e+=this.hours+`H`),this.minutes!==0&&(e+=this.minutes+`M`),(this.seconds!==0||this.milliseconds!==0)&&(e+=$Q(this.seconds+this.milliseconds/1e3,3)+`S`),e===`P`&&(e+=`T0S`),e}toISOTime(e={}){if(!this.isValid)return null;let t=this.toMillis();return t<0||t>=864e5?null:(e={suppressMilliseconds:!1,suppressSeconds:!1,includePrefix:!1,format:`extended`,...e,includeOffset:!1},h4.fromMillis(t,{zone:`UTC`}).toISOTime(e))}toJSON(){return this.toISO()}toString(){return this.toISO()}[Symbol.for(`nodejs.util.inspect.custom`)](){return this.isValid?`Duration { values: ${JSON.stringify(this.values)} }`:`Duration { Invalid, reason: ${this.invalidReason} }`}toMillis(){return this.isValid?W$(this.matrix,this.values):NaN}valueOf(){return this.toMillis()}plus(t){if(!this.isValid)return this;let n=e.fromDurationLike(t),r={};for(let e of q2)(GQ(n.values,e)||GQ(this.values,e))&&(r[e]=n.get(e)+this.get(e));return U$(this,{values:r},!0)}minus(t){if(!this.isValid)return this;let n=e.fromDurationLike(t);return this.plus(n.negate())}mapUnits(e){if(!this.isValid)return this;let t={};for(let n of Object.keys(this.values))t[n]=l$(e(this.values[n],n));return U$(this,{values:t},!0)}get(t){return this[e.normalizeUnit(t)]}set(t){if(!this.isValid)return this;let n={...this.values,...u$(t,e.normalizeUnit)};return U$(this,{values:n})}reconfigure({locale:e,numberingSystem:t,conversionAccuracy:n,matrix:r}={}){let i={loc:this.loc.clone({locale:e,numberingSystem:t}),matrix:r,conversionAccuracy:n};return U$(this,i)}as(e){return this.isValid?this.shiftTo(e).get(e):NaN}normalize(){if(!this.isValid)return this;let e=this.toObject();return G$(this.matrix,e),U$(this,{values:e},!0)}rescale(){if(!this.isValid)return this;let e=K$(this.normalize().shiftToAll().toObject());return U$(this,{values:e},!0)}shiftTo(...t){if(!this.isValid||t.length===0)return this;t=t.map(t=>e.normalizeUnit(t));let n={},r={},i=this.toObject(),a;for(let e of q2)if(t.indexOf(e)>=0){a=e;let t=0;for(let n in r)t+=this.matrix[n][e]*r[n],r[n]=0;IQ(i[e])&&(t+=i[e]);let o=Math.trunc(t);n[e]=o,r[e]=(t*1e3-o*1e3)/1e3}else IQ(i[e])&&(r[e]=i[e]);for(let e in r)r[e]!==0&&(n[a]+=e===a?r[e]:r[e]/this.matrix[a][e]);return G$(this.matrix,n),U$(this,{values:n},!0)}shiftToAll(){return this.isValid?this.shiftTo(`years`,`months`,`weeks`,`days`,`hours`,`minutes`,`seconds`,`milliseconds`):this}negate(){if(!this.isValid)return this;let e={};for(let t of Object.keys(this.values))e[t]=this.values[t]===0?0:-this.values[t];return U$(this,{values:e},!0)}removeZeros(){if(!this.isValid)return this;let e=K$(this.values);return U$(this,{values:e},!0)}get years(){return this.isValid?this.values.years||0:NaN}get quarters(){return this.isValid?this.values.quarters||0:NaN}get months(){return this.isValid?this.values.months||0:NaN}get weeks(){return this.isValid?this.values.weeks||0:NaN}get days(){return this.isValid?this.values.days||0:NaN}get hours(){return this.isValid?this.values.hours||0:NaN}get minutes(){return this.isValid?this.values.minutes||0:NaN}get seconds(){return this.isValid?this.values.seconds||0:NaN}get milliseconds(){return this.isValid?this.values.milliseconds||0:NaN}get isValid(){return this.invalid===null}get invalidReason(){return this.invalid?this.invalid.reason:null}get invalidExplanation(){return this.invalid?this.invalid.explanation:null}equals(e){if(!this.isValid||!e.isValid||!this.loc.equals(e.loc))return!1;function t(e,t){return e===void 0||e===0?t===void 0||t===0:e===t}for(let n of q2)if(!t(this.values[n],e.values[n]))return!1;return!0}},X2=`Invalid Interval`,Z2=class e{constructor(e){this.s=e.start,this.e=e.end,this.invalid=e.invalid||null,this.isLuxonInterval=!0}static invalid(t,n=null){if(!t)throw new B1(`need to specify a reason the Interval is invalid`);let r=t instanceof q0?t:new q0(t,n);if(K0.throwOnInvalid)throw new I1(r);return new e({invalid:r})}static fromDateTimes(t,n){let r=N1(t),i=N1(n);return q$(r,i)??new e({start:r,end:i})}static after(t,n){let r=Y2.fromDurationLike(n),i=N1(t);return e.fromDateTimes(i,i.plus(r))}static before(t,n){let r=Y2.fromDurationLike(n),i=N1(t);return e.fromDateTimes(i.minus(r),i)}static fromISO(t,n){let[r,i]=(t||``).split(`/`,2);if(r&&i){let t,a;try{t=h4.fromISO(r,n),a=t.isValid}catch{a=!1}let o,s;try{o=h4.fromISO(i,n),s=o.isValid}catch{s=!1}if(a&&s)return e.fromDateTimes(t,o);if(a){let r=Y2.fromISO(i,n);if(r.isValid)return e.after(t,r)}else if(s){let t=Y2.fromISO(r,n);if(t.isValid)return e.before(o,t)}}return e.invalid(`unparsable`,`the input "${t}" can't be parsed as ISO 8601`)}static isInterval(e){return e&&e.isLuxonInterval||!1}get start(){return this.isValid?this.s:null}get end(){return this.isValid?this.e:null}get lastDateTime(){return this.isValid&&this.e?this.e.minus(1):null}get isValid(){return this.invalidReason===null}get invalidReason(){return this.invalid?this.invalid.reason:null}get invalidExplanation(){return this.invalid?this.invalid.explanation:null}length(e=`milliseconds`){return this.isValid?this.toDuration(e).get(e):NaN}count(e=`milliseconds`,t){if(!this.isValid)return NaN;let n=this.start.startOf(e,t),r;return r=t?.useLocaleWeeks?this.end.reconfigure({locale:n.locale}):this.end,r=r.startOf(e,t),Math.floor(r.diff(n,e).get(e))+(r.valueOf()!==this.end.valueOf())}hasSame(e){return this.isValid?this.isEmpty()||this.e.minus(1).hasSame(this.s,e):!1}isEmpty(){return this.s.valueOf()===this.e.valueOf()}isAfter(e){return this.isValid?this.s>e:!1}isBefore(e){return this.isValid?this.e<=e:!1}contains(e){return this.isValid?this.s<=e&&this.e>e:!1}set({start:t,end:n}={}){return this.isValid?e.fromDateTimes(t||this.s,n||this.e):this}splitAt(...t){if(!this.isValid)return[];let n=t.map(N1).filter(e=>this.contains(e)).sort((e,t)=>e.toMillis()-t.toMillis()),r=[],{s:i}=this,a=0;for(;i<this.e;){let t=n[a]||this.e,o=+t>+this.e?this.e:t;r.push(e.fromDateTimes(i,o)),i=o,a+=1}return r}splitBy(t){let n=Y2.fromDurationLike(t);if(!this.isValid||!n.isValid||n.as(`milliseconds`)===0)return[];let{s:r}=this,i=1,a,o=[];for(;r<this.e;){let t=this.start.plus(n.mapUnits(e=>e*i));a=+t>+this.e?this.e:t,o.push(e.fromDateTimes(r,a)),r=a,i+=1}return o}divideEqually(e){return this.isValid?this.splitBy(this.length()/e).slice(0,e):[]}overlaps(e){return this.e>e.s&&this.s<e.e}abutsStart(e){return this.isValid?+this.e==+e.s:!1}abutsEnd(e){return this.isValid?+e.e==+this.s:!1}engulfs(e){return this.isValid?this.s<=e.s&&this.e>=e.e:!1}equals(e){return!this.isValid||!e.isValid?!1:this.s.equals(e.s)&&this.e.equals(e.e)}intersection(t){if(!this.isValid)return this;let n=this.s>t.s?this.s:t.s,r=this.e<t.e?this.e:t.e;return n>=r?null:e.fromDateTimes(n,r)}union(t){if(!this.isValid)return this;let n=this.s<t.s?this.s:t.s,r=this.e>t.e?this.e:t.e;return e.fromDateTimes(n,r)}static merge(e){let[t,n]=e.sort((e,t)=>e.s-t.s).reduce(([e,t],n)=>t?t.overlaps(n)||t.abutsStart(n)?[e,t.union(n)]:[e.concat([t]),n]:[e,n],[[],null]);return n&&t.push(n),t}static xor(t){let n=null,r=0,i=[],a=t.map(e=>[{time:e.s,type:`s`},{time:e.e,type:`e`}]),o=Array.prototype.concat(...a).sort((e,t)=>e.time-t.time);for(let t of o)r+=t.type===`s`?1:-1,r===1?n=t.time:(n&&+n!=+t.time&&i.push(e.fromDateTimes(n,t.time)),n=null);return e.merge(i)}difference(...t){return e.xor([this].concat(t)).map(e=>this.intersection(e)).filter(e=>e&&!e.isEmpty())}toString(){return this.isValid?`[${this.s.toISO()} – ${this.e.toISO()})`:X2}[Symbol.for(`nodejs.util.inspect.custom`)](){return this.isValid?`Interval { start: ${this.s.toISO()}, end: ${this.e.toISO()} }`:`Interval { Invalid, reason: ${this.invalidReason} }`}toLocaleString(e=W1,t={}){return this.isValid?s2.create(this.s.loc.clone(t),e).formatInterval(this):X2}toISO(e){return this.isValid?`${this.s.toISO(e)}/${this.e.toISO(e)}`:X2}toISODate(){return this.isValid?`${this.s.toISODate()}/${this.e.toISODate()}`:X2}toISOTime(e){return this.isValid?`${this.s.toISOTime(e)}/${this.e.toISOTime(e)}`:X2}toFormat(e,{separator:t=` – `}={}){return this.isValid?`${this.s.toFormat(e)}${t}${this.e.toFormat(e)}`:X2}toDuration(e,t){return this.isValid?this.e.diff(this.s,e,t):Y2.invalid(this.invalidReason)}mapEndpoints(t){return e.fromDateTimes(t(this.s),t(this.e))}},Q2=class{static hasDST(e=K0.defaultZone){let t=h4.now().setZone(e).set({month:12});return!e.isUniversal&&t.offset!==t.set({month:6}).offset}static isValidIANAZone(e){return v0.isValidZone(e)}static normalizeZone(e){return _Q(e,K0.defaultZone)}static getStartOfWeek({locale:e=null,locObj:t=null}={}){return(t||A0.create(e)).getStartOfWeek()}static getMinimumDaysInFirstWeek({locale:e=null,locObj:t=null}={}){return(t||A0.create(e)).getMinDaysInFirstWeek()}static getWeekendWeekdays({locale:e=null,locObj:t=null}={}){return(t||A0.create(e)).getWeekendDays().slice()}static months(e=`long`,{locale:t=null,numberingSystem:n=null,locObj:r=null,outputCalendar:i=`gregory`}={}){return(r||A0.create(t,n,i)).months(e)}static monthsFormat(e=`long`,{locale:t=null,numberingSystem:n=null,locObj:r=null,outputCalendar:i=`gregory`}={}){return(r||A0.create(t,n,i)).months(e,!0)}static weekdays(e=`long`,{locale:t=null,numberingSystem:n=null,locObj:r=null}={}){return(r||A0.create(t,n,null)).weekdays(e)}static weekdaysFormat(e=`long`,{locale:t=null,numberingSystem:n=null,locObj:r=null}={}){return(r||A0.create(t,n,null)).weekdays(e,!0)}static meridiems({locale:e=null}={}){return A0.create(e).meridiems()}static eras(e=`short`,{locale:t=null}={}){return A0.create(t,null,`gregory`).eras(e)}static features(){return{relative:BQ(),localeWeek:VQ()}}},$2=`missing Intl.DateTimeFormat.formatToParts support`,e4=`[ \xA0]`,t4=new RegExp(e4,`g`),n4={year:{"2-digit":`yy`,numeric:`yyyyy`},month:{numeric:`M`,"2-digit":`MM`,short:`MMM`,long:`MMMM`},day:{numeric:`d`,"2-digit":`dd`},weekday:{short:`EEE`,long:`EEEE`},dayperiod:`a`,dayPeriod:`a`,hour12:{numeric:`h`,"2-digit":`hh`},hour24:{numeric:`H`,"2-digit":`HH`},minute:{numeric:`m`,"2-digit":`mm`},second:{numeric:`s`,"2-digit":`ss`},timeZoneName:{long:`ZZZZZ`,short:`ZZZ`}},r4=null,i4=class{constructor(e,t){if(this.locale=e,this.format=t,this.tokens=d1(s2.parseFormat(t),e),this.units=this.tokens.map(t=>i1(t,e)),this.disqualifyingUnit=this.units.find(e=>e.invalidReason),!this.disqualifyingUnit){let[e,t]=o1(this.units);this.regex=RegExp(e,`i`),this.handlers=t}}explainFromTokens(e){if(this.isValid){let[t,n]=s1(e,this.regex,this.handlers),[r,i,a]=n?c1(n):[null,null,void 0];if(GQ(n,`a`)&&GQ(n,`H`))throw new R1(`Can't include meridiem when specifying 24-hour format`);return{input:e,tokens:this.tokens,regex:this.regex,rawMatches:t,matches:n,result:r,zone:i,specificOffset:a}}else return{input:e,tokens:this.tokens,invalidReason:this.invalidReason}}get isValid(){return!this.disqualifyingUnit}get invalidReason(){return this.disqualifyingUnit?this.disqualifyingUnit.invalidReason:null}},a4=`Invalid DateTime`,o4=864e13,s4={month:1,day:1,hour:0,minute:0,second:0,millisecond:0},c4={weekNumber:1,weekday:1,hour:0,minute:0,second:0,millisecond:0},l4={ordinal:1,hour:0,minute:0,second:0,millisecond:0},u4=[`year`,`month`,`day`,`hour`,`minute`,`second`,`millisecond`],d4=[`weekYear`,`weekNumber`,`weekday`,`hour`,`minute`,`second`,`millisecond`],f4=[`year`,`ordinal`,`hour`,`minute`,`second`,`millisecond`],m4=new Map,h4=class e{constructor(e){let t=e.zone||K0.defaultZone,n=e.invalid||(Number.isNaN(e.ts)?new q0(`invalid input`):null)||(t.isValid?null:h1(t));this.ts=FQ(e.ts)?K0.now():e.ts;let r=null,i=null;if(!n)if(e.old&&e.old.ts===this.ts&&e.old.zone.equals(t))[r,i]=[e.old.c,e.old.o];else{let a=IQ(e.o)&&!e.old?e.o:t.offset(this.ts);r=b1(this.ts,a),n=Number.isNaN(r.year)?new q0(`invalid input`):null,r=n?null:r,i=n?null:a}this._zone=t,this.loc=e.loc||A0.create(),this.invalid=n,this.weekData=null,this.localWeekData=null,this.c=r,this.o=i,this.isLuxonDateTime=!0}static now(){return new e({})}static local(){let[e,t]=M1(arguments),[n,r,i,a,o,s,c]=t;return A1({year:n,month:r,day:i,hour:a,minute:o,second:s,millisecond:c},e)}static utc(){let[e,t]=M1(arguments),[n,r,i,a,o,s,c]=t;return e.zone=M0.utcInstance,A1({year:n,month:r,day:i,hour:a,minute:o,second:s,millisecond:c},e)}static fromJSDate(t,n={}){let r=zQ(t)?t.valueOf():NaN;if(Number.isNaN(r))return e.invalid(`invalid input`);let i=_Q(n.zone,K0.defaultZone);return i.isValid?new e({ts:r,zone:i,loc:A0.fromObject(n)}):e.invalid(h1(i))}static fromMillis(t,n={}){if(!IQ(t))throw new B1(`fromMillis requires a numerical input, but received a ${typeof t} with value ${t}`);return t<-864e13||t>o4?e.invalid(`Timestamp out of range`):new e({ts:t,zone:_Q(n.zone,K0.defaultZone),loc:A0.fromObject(n)})}static fromSeconds(t,n={}){if(IQ(t))return new e({ts:t*1e3,zone:_Q(n.zone,K0.defaultZone),loc:A0.fromObject(n)});throw new B1(`fromSeconds requires a numerical input`)}static fromObject(t,n={}){t||={};let r=_Q(n.zone,K0.defaultZone);if(!r.isValid)return e.invalid(h1(r));let i=A0.fromObject(n),a=u$(t,O1),{minDaysInFirstWeek:o,startOfWeek:s}=AQ(a,i),c=K0.now(),l=FQ(n.specificOffset)?r.offset(c):n.specificOffset,u=!FQ(a.ordinal),d=!FQ(a.year),f=!FQ(a.month)||!FQ(a.day),p=d||f,m=a.weekYear||a.weekNumber;if((p||u)&&m)throw new R1(`Can't mix weekYear/weekNumber units with year/month/day or ordinals`);if(f&&u)throw new R1(`Can't mix ordinal dates with month/day`);let h=m||a.weekday&&!p,g,_,v=b1(c,l);h?(g=d4,_=c4,v=EQ(v,o,s)):u?(g=f4,_=l4,v=OQ(v)):(g=u4,_=s4);let y=!1;for(let e of g){let t=a[e];FQ(t)?y?a[e]=_[e]:a[e]=v[e]:y=!0}let b=(h?jQ(a,o,s):u?MQ(a):NQ(a))||PQ(a);if(b)return e.invalid(b);let[x,S]=x1(h?DQ(a,o,s):u?kQ(a):a,l,r),C=new e({ts:x,zone:r,o:S,loc:i});return a.weekday&&p&&t.weekday!==C.weekday?e.invalid(`mismatched weekday`,`you can't specify both a weekday of ${a.weekday} and a date of ${C.toISO()}`):C.isValid?C:e.invalid(C.invalid)}static fromISO(e,t={}){let[n,r]=L$(e);return C1(n,r,t,`ISO 8601`,e)}static fromRFC2822(e,t={}){let[n,r]=R$(e);return C1(n,r,t,`RFC 2822`,e)}static fromHTTP(e,t={}){let[n,r]=z$(e);return C1(n,r,t,`HTTP`,t)}static fromFormat(t,n,r={}){if(FQ(t)||FQ(n))throw new B1(`fromFormat requires an input string and a format`);let{locale:i=null,numberingSystem:a=null}=r,[o,s,c,l]=p1(A0.fromOpts({locale:i,numberingSystem:a,defaultToEN:!0}),t,n);return l?e.invalid(l):C1(o,s,r,`format ${n}`,t,c)}static fromString(t,n,r={}){return e.fromFormat(t,n,r)}static fromSQL(e,t={}){let[n,r]=H$(e);return C1(n,r,t,`SQL`,e)}static invalid(t,n=null){if(!t)throw new B1(`need to specify a reason the DateTime is invalid`);let r=t instanceof q0?t:new q0(t,n);if(K0.throwOnInvalid)throw new F1(r);return new e({invalid:r})}static isDateTime(e){return e&&e.isLuxonDateTime||!1}static parseFormatForOpts(e,t={}){let n=m1(e,A0.fromObject(t));return n?n.map(e=>e?e.val:null).join(``):null}static expandFormat(e,t={}){return d1(s2.parseFormat(e),A0.fromObject(t)).map(e=>e.val).join(``)}static resetCache(){p4=void 0,m4.clear()}get(e){return this[e]}get isValid(){return this.invalid===null}get invalidReason(){return this.invalid?this.invalid.reason:null}get invalidExplanation(){return this.invalid?this.invalid.explanation:null}get locale(){return this.isValid?this.loc.locale:null}get numberingSystem(){return this.isValid?this.loc.numberingSystem:null}get outputCalendar(){return this.isValid?this.loc.outputCalendar:null}get zone(){return this._zone}get zoneName(){return this.isValid?this.zone.name:null}get year(){return this.isValid?this.c.year:NaN}get quarter(){return this.isValid?Math.ceil(this.c.month/3):NaN}get month(){return this.isValid?this.c.month:NaN}get day(){return this.isValid?this.c.day:NaN}get hour(){return this.isValid?this.c.hour:NaN}get minute(){return this.isValid?this.c.minute:NaN}get second(){return this.isValid?this.c.second:NaN}get millisecond(){return this.isValid?this.c.millisecond:NaN}get weekYear(){return this.isValid?g1(this).weekYear:NaN}get weekNumber(){return this.isValid?g1(this).weekNumber:NaN}get weekday(){return this.isValid?g1(this).weekday:NaN}get isWeekend(){return this.isValid&&this.loc.getWeekendDays().includes(this.weekday)}get localWeekday(){return this.isValid?_1(this).weekday:NaN}get localWeekNumber(){return this.isValid?_1(this).weekNumber:NaN}get localWeekYear(){return this.isValid?_1(this).weekYear:NaN}get ordinal(){return this.isValid?OQ(this.c).ordinal:NaN}get monthShort(){return this.isValid?Q2.months(`short`,{locObj:this.loc})[this.month-1]:null}get monthLong(){return this.isValid?Q2.months(`long`,{locObj:this.loc})[this.month-1]:null}get weekdayShort(){return this.isValid?Q2.weekdays(`short`,{locObj:this.loc})[this.weekday-1]:null}get weekdayLong(){return this.isValid?Q2.weekdays(`long`,{locObj:this.loc})[this.weekday-1]:null}get offset(){return this.isValid?+this.o:NaN}get offsetNameShort(){return this.isValid?this.zone.offsetName(this.ts,{format:`short`,locale:this.locale}):null}get offsetNameLong(){return this.isValid?this.zone.offsetName(this.ts,{format:`long`,locale:this.locale}):null}get isOffsetFixed(){return this.isValid?this.zone.isUniversal:null}get isInDST(){return this.isOffsetFixed?!1:this.offset>this.set({month:1,day:1}).offset||this.offset>this.set({month:5}).offset}getPossibleOffsets(){if(!this.isValid||this.isOffsetFixed)return[this];let e=864e5,t=6e4,n=r$(this.c),r=this.zone.offset(n-e),i=this.zone.offset(n+e),a=this.zone.offset(n-r*t),o=this.zone.offset(n-i*t);if(a===o)return[this];let s=n-a*t,c=n-o*t,l=b1(s,a),u=b1(c,o);return l.hour===u.hour&&l.minute===u.minute&&l.second===u.second&&l.millisecond===u.millisecond?[v1(this,{ts:s}),v1(this,{ts:c})]:[this]}get isInLeapYear(){return e$(this.year)}get daysInMonth(){return n$(this.year,this.month)}get daysInYear(){return this.isValid?t$(this.year):NaN}get weeksInWeekYear(){return this.isValid?a$(this.weekYear):NaN}get weeksInLocalWeekYear(){return this.isValid?a$(this.localWeekYear,this.loc.getMinDaysInFirstWeek(),this.loc.getStartOfWeek()):NaN}resolvedLocaleOptions(e={}){let{locale:t,numberingSystem:n,calendar:r}=s2.create(this.loc.clone(e),e).resolvedOptions(this);return{locale:t,numberingSystem:n,outputCalendar:r}}toUTC(e=0,t={}){return this.setZone(M0.instance(e),t)}toLocal(){return this.setZone(K0.defaultZone)}setZone(t,{keepLocalTime:n=!1,keepCalendarTime:r=!1}={}){if(t=_Q(t,K0.defaultZone),t.equals(this.zone))return this;if(t.isValid){let e=this.ts;if(n||r){let n=t.offset(this.ts),r=this.toObject();[e]=x1(r,n,t)}return v1(this,{ts:e,zone:t})}else return e.invalid(h1(t))}reconfigure({locale:e,numberingSystem:t,outputCalendar:n}={}){let r=this.loc.clone({locale:e,numberingSystem:t,outputCalendar:n});return v1(this,{loc:r})}setLocale(e){return this.reconfigure({locale:e})}set(e){if(!this.isValid)return this;let t=u$(e,O1),{minDaysInFirstWeek:n,startOfWeek:r}=AQ(t,this.loc),i=!FQ(t.weekYear)||!FQ(t.weekNumber)||!FQ(t.weekday),a=!FQ(t.ordinal),o=!FQ(t.year),s=!FQ(t.month)||!FQ(t.day),c=o||s,l=t.weekYear||t.weekNumber;if((c||a)&&l)throw new R1(`Can't mix weekYear/weekNumber units with year/month/day or ordinals`);if(s&&a)throw new R1(`Can't mix ordinal dates with month/day`);let u;i?u=DQ({...EQ(this.c,n,r),...t},n,r):FQ(t.ordinal)?(u={...this.toObject(),...t},FQ(t.day)&&(u.day=Math.min(n$(u.year,u.month),u.day))):u=kQ({...OQ(this.c),...t});let[d,f]=x1(u,this.o,this.zone);return v1(this,{ts:d,o:f})}plus(e){if(!this.isValid)return this;let t=Y2.fromDurationLike(e);return v1(this,S1(this,t))}minus(e){if(!this.isValid)return this;let t=Y2.fromDurationLike(e).negate();return v1(this,S1(this,t))}startOf(e,{useLocaleWeeks:t=!1}={}){if(!this.isValid)return this;let n={},r=Y2.normalizeUnit(e);switch(r){case`years`:n.month=1;case`quarters`:case`months`:n.day=1;case`weeks`:case`days`:n.hour=0;case`hours`:n.minute=0;case`minutes`:n.second=0;case`seconds`:n.millisecond=0;break}if(r===`weeks`)if(t){let e=this.loc.getStartOfWeek(),{weekday:t}=this;t<e&&(n.weekNumber=this.weekNumber-1),n.weekday=e}else n.weekday=1;return r===`quarters`&&(n.month=(Math.ceil(this.month/3)-1)*3+1),this.set(n)}endOf(e,t){return this.isValid?this.plus({[e]:1}).startOf(e,t).minus(1):this}toFormat(e,t={}){return this.isValid?s2.create(this.loc.redefaultToEN(t)).formatDateTimeFromString(this,e):a4}toLocaleString(e=W1,t={}){return this.isValid?s2.create(this.loc.clone(t),e).formatDateTime(this):a4}toLocaleParts(e={}){return this.isValid?s2.create(this.loc.clone(e),e).formatDateTimeParts(this):[]}toISO({format:e=`extended`,suppressSeconds:t=!1,suppressMilliseconds:n=!1,includeOffset:r=!0,extendedZone:i=!1,precision:a=`milliseconds`}={}){if(!this.isValid)return null;a=D1(a);let o=e===`extended`,s=T1(this,o,a);return u4.indexOf(a)>=3&&(s+=`T`),s+=E1(this,o,t,n,r,i,a),s}toISODate({format:e=`extended`,precision:t=`day`}={}){return this.isValid?T1(this,e===`extended`,D1(t)):null}toISOWeekDate(){return w1(this,`kkkk-'W'WW-c`)}toISOTime({suppressMilliseconds:e=!1,suppressSeconds:t=!1,includeOffset:n=!0,includePrefix:r=!1,extendedZone:i=!1,format:a=`extended`,precision:o=`milliseconds`}={}){return this.isValid?(o=D1(o),(r&&u4.indexOf(o)>=3?`T`:``)+E1(this,a===`extended`,t,e,n,i,o)):null}toRFC2822(){return w1(this,`EEE, dd LLL yyyy HH:mm:ss ZZZ`,!1)}toHTTP(){return w1(this.toUTC(),`EEE, dd LLL yyyy HH:mm:ss 'GMT'`)}toSQLDate(){return this.isValid?T1(this,!0):null}toSQLTime({includeOffset:e=!0,includeZone:t=!1,includeOffsetSpace:n=!0}={}){let r=`HH:mm:ss.SSS`;return(t||e)&&(n&&(r+=` `),t?r+=`z`:e&&(r+=`ZZ`)),w1(this,r,!0)}toSQL(e={}){return this.isValid?`${this.toSQLDate()} ${this.toSQLTime(e)}`:null}toString(){return this.isValid?this.toISO():a4}[Symbol.for(`nodejs.util.inspect.custom`)](){return this.isValid?`DateTime { ts: ${this.toISO()}, zone: ${this.zone.name}, locale: ${this.locale} }`:`DateTime { Invalid, reason: ${this.invalidReason} }`}valueOf(){return this.toMillis()}toMillis(){return this.isValid?this.ts:NaN}toSeconds(){return this.isValid?this.ts/1e3:NaN}toUnixInteger(){return this.isValid?Math.floor(this.ts/1e3):NaN}toJSON(){return this.toISO()}toBSON(){return this.toJSDate()}toObject(e={}){if(!this.isValid)return{};let t={...this.c};return e.includeConfig&&(t.outputCalendar=this.outputCalendar,t.numberingSystem=this.loc.numberingSystem,t.locale=this.loc.locale),t}toJSDate(){return new Date(this.isValid?this.ts:NaN)}diff(e,t=`milliseconds`,n={}){if(!this.isValid||!e.isValid)return Y2.invalid(`created by diffing an invalid DateTime`);let r={locale:this.locale,numberingSystem:this.numberingSystem,...n},i=HQ(t).map(Y2.normalizeUnit),a=e.valueOf()>this.valueOf(),o=X$(a?this:e,a?e:this,i,r);return a?o.negate():o}diffNow(t=`milliseconds`,n={}){return this.diff(e.now(),t,n)}until(e){return this.isValid?Z2.fromDateTimes(this,e):this}hasSame(e,t,n){if(!this.isValid)return!1;let r=e.valueOf(),i=this.setZone(e.zone,{keepLocalTime:!0});return i.startOf(t,n)<=r&&r<=i.endOf(t,n)}equals(e){return this.isValid&&e.isValid&&this.valueOf()===e.valueOf()&&this.zone.equals(e.zone)&&this.loc.equals(e.loc)}toRelative(t={}){if(!this.isValid)return null;let n=t.base||e.fromObject({},{zone:this.zone}),r=t.padding?this<n?-t.padding:t.padding:0,i=[`years`,`months`,`days`,`hours`,`minutes`,`seconds`],a=t.unit;return Array.isArray(t.unit)&&(i=t.unit,a=void 0),j1(n,this.plus(r),{...t,numeric:`always`,units:i,unit:a})}toRelativeCalendar(t={}){return this.isValid?j1(t.base||e.fromObject({},{zone:this.zone}),this,{...t,numeric:`auto`,units:[`years`,`months`,`days`],calendary:!0}):null}static min(...t){if(!t.every(e.isDateTime))throw new B1(`min requires all arguments be DateTimes`);return UQ(t,e=>e.valueOf(),Math.min)}static max(...t){if(!t.every(e.isDateTime))throw new B1(`max requires all arguments be DateTimes`);return UQ(t,e=>e.valueOf(),Math.max)}static fromFormatExplain(e,t,n={}){let{locale:r=null,numberingSystem:i=null}=n;return f1(A0.fromOpts({locale:r,numberingSystem:i,defaultToEN:!0}),e,t)}static fromStringExplain(t,n,r={}){return e.fromFormatExplain(t,n,r)}static buildFormatParser(e,t={}){let{locale:n=null,numberingSystem:r=null}=t,i=A0.fromOpts({locale:n,numberingSystem:r,defaultToEN:!0});return new i4(i,e)}static fromFormatParser(t,n,r={}){if(FQ(t)||FQ(n))throw new B1(`fromFormatParser requires an input string and a format parser`);let{locale:i=null,numberingSystem:a=null}=r,o=A0.fromOpts({locale:i,numberingSystem:a,defaultToEN:!0});if(!o.equals(n.locale))throw new B1(`fromFormatParser called with a locale of ${o}, but the format parser was created for ${n.locale}`);let{result:s,zone:c,specificOffset:l,invalidReason:u}=n.explainFromTokens(t);return u?e.invalid(u):C1(s,c,r,`format ${n.format}`,t,l)}static get DATE_SHORT(){return W1}static get DATE_MED(){return G1}static get DATE_MED_WITH_WEEKDAY(){return K1}static get DATE_FULL(){return q1}static get DATE_HUGE(){return J1}static get TIME_SIMPLE(){return Y1}static get TIME_WITH_SECONDS(){return X1}static get TIME_WITH_SHORT_OFFSET(){return Z1}static get TIME_WITH_LONG_OFFSET(){return Q1}static get TIME_24_SIMPLE(){return $1}static get TIME_24_WITH_SECONDS(){return e0}static get TIME_24_WITH_SHORT_OFFSET(){return t0}static get TIME_24_WITH_LONG_OFFSET(){return n0}static get DATETIME_SHORT(){return r0}static get DATETIME_SHORT_WITH_SECONDS(){return i0}static get DATETIME_MED(){return a0}static get DATETIME_MED_WITH_SECONDS(){return o0}static get DATETIME_MED_WITH_WEEKDAY(){return s0}static get DATETIME_FULL(){return c0}static get DATETIME_FULL_WITH_SECONDS(){return l0}static get DATETIME_HUGE(){return u0}static get DATETIME_HUGE_WITH_SECONDS(){return d0}}}));function cle(){try{let{pathname:e}=new URL(import.meta.url),t=e.lastIndexOf(`/assets/`);return`${t>=0?e.slice(0,t):``}/api`}catch{return`/api`}}var _4,v4=t((()=>{console.log(`API.js pathname: '${new URL(import.meta.url)}'`),_4=cle()})),y4,b4=t((()=>{Bl(),g4(),v4(),y4=Cl(`control`,{state:()=>({running:!1,running_start:null,mode:1,error_status:``,stats:null,prices:null,schedule:null,schedule_ts:null,update_time:h4.now()}),getters:{battery_rows:e=>Object.entries(e.stats?.battery_inverters??{}).map(([e,t])=>{let n=Object.keys(t.ac_side??{})[0]??null;return{name:e,phase:n,control_status:t.control_status,battery:t.battery,ac:n?t.ac_side[n]:null}}),solar_rows:e=>Object.entries(e.stats?.solar_inverters??{}).map(([e,t])=>({name:e,...t})),energy_meter:e=>e.stats?.energy_meter??null,mode_name:e=>{if(e.mode===1)return`idle`;if(e.mode===2)return`manual`;if(e.mode===3)return`static schedule`;if(e.mode===4)return`dynamic schedule`}},actions:{async _make_fetch(e,t=`GET`,n=null){this.error_status=``;let r={method:t};t===`POST`&&n!==null&&(r.headers={"Content-Type":`application/json`},r.body=JSON.stringify(n));let i=await fetch(`${_4}${e}`,r);if(!i.ok)throw Error(`response status: ${i.status}`);return await i.json()},async fetch_log(e){this.error_status=``;let t={method:`POST`,headers:{"Content-Type":`application/json`},body:JSON.stringify(e)};try{let e=await fetch(`${_4}/log`,t);if(!e.ok)throw Error(`response status: ${e.status}`);return await e.text()}catch(e){return this.error_status=`config store: error while fetching log: ${e.msg}`,``}},async fetch_status(){try{let e=await this._make_fetch(`/`);this.running=e.running,this.running_start=e.running_start,this.mode=e.mode,this.stats=e.stats,this.prices=e.prices,this.schedule=e.schedule??null,this.schedule_ts=e.schedule_ts??null,this.update_time=h4.now()}catch(e){this.running=!1,this.running_start=null,this.mode=1,this.stats=null,this.prices=null,this.schedule=null,this.schedule_ts=null,this.error_status=`control store: error while fetching status: ${e.msg}`}},async set_running(e){try{await this._make_fetch(`/run`,`POST`,{running:e})}catch(e){this.config=null,this.error_status=`config store: error while updating general config: ${e.msg}`}console.log(`set_running(${e}): /run POSTed`),await new Promise(e=>setTimeout(e,3e3)),await this.fetch_status()}}})}));I(),Cu(),eQ(),b4();var lle={__name:`Menu`,setup(e){let t=y4(),n=O(!1),r=e=>()=>N(Bz,null,{default:()=>N(e)}),i=O([{label:()=>N(cl,{to:{name:`home`}},{default:()=>`Home`}),key:`go-home`,icon:r(uu)},{label:()=>N(cl,{to:{name:`general_config`}},{default:()=>`General Configuration`}),key:`go-general-config`,icon:r(gu)},{label:`Subsystem Configuration`,key:`go-config`,icon:r(Gl),children:[{label:()=>N(cl,{to:{name:`energy_meter_config`}},{default:()=>`Energy Meter`}),key:`go-energy-meter`,icon:r(yu)},{label:()=>N(cl,{to:{name:`battery_inverters_config`}},{default:()=>`Battery Inverters`}),key:`go-battery-inverters`,icon:r(Zl)},{label:()=>N(cl,{to:{name:`solar_inverters_config`}},{default:()=>`Solar Inverters`}),key:`go-solar-inverters`,icon:r(Su)}]},{label:`Mode Specific Configuration`,key:`go-config`,icon:r(pu),children:[{label:()=>N(cl,{to:{name:`manual_config`}},{default:()=>`Manual Mode`}),key:`go-manual`,icon:r(su)},{label:()=>N(cl,{to:{name:`static_schedule_config`}},{default:()=>`Static Schedule Mode`}),key:`go-static-schedule`,icon:r($l)},{label:()=>N(cl,{to:{name:`dynamic_schedule_config`}},{default:()=>`Dynamic Schedule Mode`}),key:`go-dynamic-schedule`,icon:r(Jl)}]},{label:()=>N(cl,{to:{name:`logfiles`}},{default:()=>`Log Files`}),key:`go-logfiles`,icon:r(iu)}]),a=async()=>{n.value=!0,await t.set_running(!t.running),n.value=!1};return(e,r)=>(Zr(),ni(k(PJ),{cols:`6`},{default:A(()=>[P(k(yJ),{span:`5`},{default:A(()=>[P(k(gX),{options:i.value,mode:`horizontal`,responsive:``},null,8,[`options`])]),_:1}),P(k(yJ),null,{default:A(()=>[P(k(jM),{loading:n.value,disabled:n.value,type:`primary`,onClick:a,style:{float:`right`}},{default:A(()=>[k(t).running?(Zr(),ti(Va,{key:0},[oi(`Stop`)],64)):(Zr(),ti(Va,{key:1},[oi(`Start`)],64))]),_:1},8,[`loading`,`disabled`])]),_:1})]),_:1}))}};I(),eQ();var ule={style:{"margin-left":`20px`,"margin-right":`20px`,"margin-top":`5px`}},dle={__name:`App`,setup(e){return(e,t)=>{let n=uee(`RouterView`);return Zr(),ni(k(PR),{theme:k(ZZ)},{default:A(()=>[M(`div`,ule,[P(lle),P(n)]),P(k(TJ))]),_:1},8,[`theme`])}}},x4,S4,C4,w4,T4=t((()=>{x4=`modulepreload`,S4=function(e){return`/`+e},C4={},w4=function(e,t,n){let r=Promise.resolve();if(t&&t.length>0){let e=document.getElementsByTagName(`link`),i=document.querySelector(`meta[property=csp-nonce]`),a=i?.nonce||i?.getAttribute(`nonce`);function o(e){return Promise.all(e.map(e=>Promise.resolve(e).then(e=>({status:`fulfilled`,value:e}),e=>({status:`rejected`,reason:e}))))}function s(e){return import.meta.resolve?import.meta.resolve(e):new URL(e,import.meta.url).href}r=o(t.map(t=>{if(t=S4(t,n),t=s(t),t in C4)return;C4[t]=!0;let r=t.endsWith(`.css`);for(let n=e.length-1;n>=0;n--){let i=e[n];if(i.href===t&&(!r||i.rel===`stylesheet`))return}let i=document.createElement(`link`);if(i.rel=r?`stylesheet`:x4,r||(i.as=`script`),i.crossOrigin=``,i.href=t,a&&i.setAttribute(`nonce`,a),document.head.appendChild(i),r)return new Promise((e,n)=>{i.addEventListener(`load`,e),i.addEventListener(`error`,()=>n(Error(`Unable to preload CSS for ${t}`)))})}))}function i(e){let t=new Event(`vite:preloadError`,{cancelable:!0});if(t.payload=e,window.dispatchEvent(t),!t.defaultPrevented)throw e}return r.then(t=>{for(let e of t||[])e.status===`rejected`&&i(e.reason);return e().catch(i)})}})),E4,D4=t((()=>{Bl(),v4(),E4=Cl(`configuration`,{state:()=>({config:null,subsystem_types:null,error_status:``}),getters:{loaded:e=>e.config!==null,general:e=>e.config===null?[]:e.config.general,battery_inverters:e=>e.config===null?[]:e.config.battery_inverters,solar_inverters:e=>e.config===null?[]:e.config.solar_inverters,energy_meter:e=>e.config===null?-1:e.config.energy_meter,mode_manual:e=>e.config===null?-1:e.config.mode_manual,mode_static:e=>e.config===null?[]:e.config.mode_static,mode_dynamic:e=>e.config===null?-1:e.config.mode_dynamic,timezone:e=>e.config?.general?.timezone??`UTC`,error:e=>e.error_status!==``,status:e=>e.error_status===``?e.error_status:``},actions:{async _make_fetch(e,t=`GET`,n=null){this.error_status=``;let r={method:t};t===`POST`&&n!==null&&(r.headers={"Content-Type":`application/json`},r.body=JSON.stringify(n));let i=await fetch(`${_4}${e}`,r);if(!i.ok)throw Error(`response status: ${i.status}`);return await i.json()},async fetch_config(){try{this.config=await this._make_fetch(`/config`)}catch(e){this.config=null,this.error_status=`config store: error while fetching config: ${e.msg}`}},async sync_general_config(e){try{await this._make_fetch(`/config/general`,`POST`,e)}catch(e){this.config=null,this.error_status=`config store: error while updating general config: ${e.msg}`}},async sync_battery_inverters_config(e){try{await this._make_fetch(`/config/battery_inverters`,`POST`,e)}catch(e){this.config=null,this.error_status=`config store: error while updating inverter config: ${e.msg}`}},async sync_solar_inverters_config(e){try{await this._make_fetch(`/config/solar_inverters`,`POST`,e)}catch(e){this.config=null,this.error_status=`config store: error while updating solar inverter config: ${e.msg}`}},async sync_energy_meter_config(e){try{await this._make_fetch(`/config/energy_meter`,`POST`,e)}catch(e){this.config=null,this.error_status=`config store: error while updating energy meter config: ${e.msg}`}},async sync_mode_manual_config(e){try{await this._make_fetch(`/config/mode/manual`,`POST`,e)}catch(e){this.config=null,this.error_status=`config store: error while updating manual mode config: ${e.msg}`}},async sync_mode_static_config(e){try{await this._make_fetch(`/config/mode/static`,`POST`,e)}catch(e){this.config=null,this.error_status=`config store: error while updating static mode config: ${e.msg}`}},async sync_mode_dynamic_config(e){try{await this._make_fetch(`/config/mode/dynamic`,`POST`,e)}catch(e){this.config=null,this.error_status=`config store: error while updating dynamic mode config: ${e.msg}`}},async apply_bart_home_setup(e){try{await this._make_fetch(`/config/bart_setup`,`POST`)}catch(e){this.config=null,this.error_status=`config store: error while applying Bart home setup: ${e.msg}`}},async fetch_subsystem_types(e){if(!this.subsystem_types)try{this.subsystem_types=await this._make_fetch(`/config/subsystem_types`)}catch(e){this.subsystem_types=null,this.error_status=`config store: error while fetching subsystem types: ${e.msg}`}}}})})),O4,k4,A4,j4,fle=t((()=>{I(),eQ(),b4(),O4={rowspan:`2`},k4={rowspan:`2`},A4={colspan:`4`},j4={__name:`StatusTables`,setup(e){let t=y4();function n(e){return e==null?`—`:`${Math.round(e/100)/10} kW`}function r(e){return e==null?`—`:Math.round(e)}return(e,i)=>(Zr(),ti(Va,null,[k(t).battery_rows.length?(Zr(),ni(k(bR),{key:0,"arrow-placement":`right`},{default:A(()=>[P(k(wR),null,{header:A(()=>[P(k(AZ),{prefix:`bar`},{default:A(()=>[...i[0]||=[oi(` Battery Inverters `,-1)]]),_:1})]),default:A(()=>[P(k(hZ),{bordered:!1,"single-line":!1},{default:A(()=>[i[5]||=M(`thead`,null,[M(`tr`,null,[M(`th`,null,`Inverter`),M(`th`,null,`Phase`),M(`th`,null,`\xA0`),M(`th`,null,`Current`),M(`th`,null,`Voltage`),M(`th`,null,`Power`),M(`th`,null,`Status`),M(`th`,null,`Charge`),M(`th`,null,`Temperature`)])],-1),M(`tbody`,null,[(Zr(!0),ti(Va,null,mr(k(t).battery_rows,e=>(Zr(),ti(Va,{key:e.name},[M(`tr`,null,[M(`td`,O4,De(e.name),1),M(`td`,k4,De(e.phase),1),i[1]||=M(`td`,null,`Battery`,-1),M(`td`,null,De(r(e.battery.A))+` A`,1),M(`td`,null,De(r(e.battery.V))+` V`,1),i[2]||=M(`td`,null,null,-1),M(`td`,null,De(e.battery.status),1),M(`td`,null,[P(k(PX),{type:`line`,percentage:Math.round(e.battery.charge??0)},null,8,[`percentage`])]),M(`td`,null,De(r(e.battery.temp_l))+` ℃ - `+De(r(e.battery.temp_h))+` ℃ `,1)]),M(`tr`,null,[i[3]||=M(`td`,null,`AC side`,-1),M(`td`,null,De(r(e.ac?.A))+` A`,1),M(`td`,null,De(r(e.ac?.V))+` V`,1),M(`td`,null,De(r(e.ac?.P))+` W`,1),i[4]||=M(`td`,{colspan:`3`},null,-1)])],64))),128))])]),_:1})]),_:1})]),_:1})):ci(``,!0),k(t).solar_rows.length?(Zr(),ni(k(bR),{key:1,"arrow-placement":`right`},{default:A(()=>[P(k(wR),null,{header:A(()=>[P(k(AZ),{prefix:`bar`},{default:A(()=>[...i[6]||=[oi(` Solar Inverters `,-1)]]),_:1})]),default:A(()=>[(Zr(!0),ti(Va,null,mr(k(t).solar_rows,e=>(Zr(),ni(k(hZ),{key:e.name,bordered:!1,"single-line":!1},{default:A(()=>[M(`thead`,null,[M(`tr`,null,[M(`th`,null,De(e.name),1),i[7]||=M(`th`,null,`L1`,-1),i[8]||=M(`th`,null,`L2`,-1),i[9]||=M(`th`,null,`L3`,-1),i[10]||=M(`th`,null,`Total`,-1)])]),M(`tbody`,null,[M(`tr`,null,[i[11]||=M(`td`,null,`Power`,-1),M(`td`,null,De(n(e.ac_side?.L1?.P)),1),M(`td`,null,De(n(e.ac_side?.L2?.P)),1),M(`td`,null,De(n(e.ac_side?.L3?.P)),1),M(`td`,null,De(n(e.total_power)),1)]),M(`tr`,null,[i[12]||=M(`td`,null,`Setpoint Limit`,-1),M(`td`,A4,De(e.setpoint_limit===null||e.setpoint_limit===void 0?`not set`:n(e.setpoint_limit)),1)])])]),_:2},1024))),128))]),_:1})]),_:1})):ci(``,!0),k(t).energy_meter?(Zr(),ni(k(bR),{key:2,"arrow-placement":`right`},{default:A(()=>[P(k(wR),null,{header:A(()=>[P(k(AZ),{prefix:`bar`},{default:A(()=>[...i[13]||=[oi(` Energy Meter `,-1)]]),_:1})]),default:A(()=>[P(k(hZ),{bordered:!1,"single-line":!1},{default:A(()=>[i[19]||=M(`thead`,null,[M(`tr`,null,[M(`th`),M(`th`,null,`L1`),M(`th`,null,`L2`),M(`th`,null,`L3`)])],-1),M(`tbody`,null,[M(`tr`,null,[i[14]||=M(`td`,null,`Current`,-1),M(`td`,null,De(r(k(t).energy_meter.L1.A))+` A`,1),M(`td`,null,De(r(k(t).energy_meter.L2.A))+` A`,1),M(`td`,null,De(r(k(t).energy_meter.L3.A))+` A`,1)]),M(`tr`,null,[i[15]||=M(`td`,null,`Max Current`,-1),M(`td`,null,De(r(k(t).energy_meter.L1.Amax))+` A`,1),M(`td`,null,De(r(k(t).energy_meter.L2.Amax))+` A`,1),M(`td`,null,De(r(k(t).energy_meter.L3.Amax))+` A`,1)]),M(`tr`,null,[i[16]||=M(`td`,null,`Voltage`,-1),M(`td`,null,De(r(k(t).energy_meter.L1.V))+` V`,1),M(`td`,null,De(r(k(t).energy_meter.L2.V))+` V`,1),M(`td`,null,De(r(k(t).energy_meter.L3.V))+` V`,1)]),M(`tr`,null,[i[17]||=M(`td`,null,`Power`,-1),M(`td`,null,De(r(k(t).energy_meter.L1.P))+` W`,1),M(`td`,null,De(r(k(t).energy_meter.L2.P))+` W`,1),M(`td`,null,De(r(k(t).energy_meter.L3.P))+` W`,1)]),M(`tr`,null,[i[18]||=M(`td`,null,`Status`,-1),M(`td`,null,De(k(t).energy_meter.L1.status),1),M(`td`,null,De(k(t).energy_meter.L2.status),1),M(`td`,null,De(k(t).energy_meter.L3.status),1)])])]),_:1})]),_:1})]),_:1})):ci(``,!0)],64))}}}));function M4(){let e=E4(),t=F(()=>e.timezone);return{tz:t,now:()=>h4.now().setZone(t.value)}}var N4=t((()=>{I(),g4(),D4()}));function P4(e){return e+.5|0}function F4(e){return q4(P4(e*2.55),0,255)}function I4(e){return q4(P4(e*255),0,255)}function L4(e){return q4(P4(e/2.55)/100,0,1)}function R4(e){return q4(P4(e*100),0,100)}function ple(e){var t=e.length,n;return e[0]===`#`&&(t===4||t===5?n={r:255&J4[e[1]]*17,g:255&J4[e[2]]*17,b:255&J4[e[3]]*17,a:t===5?J4[e[4]]*17:255}:(t===7||t===9)&&(n={r:J4[e[1]]<<4|J4[e[2]],g:J4[e[3]]<<4|J4[e[4]],b:J4[e[5]]<<4|J4[e[6]],a:t===9?J4[e[7]]<<4|J4[e[8]]:255})),n}function mle(e){var t=$4(e)?X4:Z4;return e?`#`+t(e.r)+t(e.g)+t(e.b)+e3(e.a,t):void 0}function z4(e,t,n){let r=t*Math.min(n,1-n),i=(t,i=(t+e/30)%12)=>n-r*Math.max(Math.min(i-3,9-i,1),-1);return[i(0),i(8),i(4)]}function hle(e,t,n){let r=(r,i=(r+e/60)%6)=>n-n*t*Math.max(Math.min(i,4-i,1),0);return[r(5),r(3),r(1)]}function gle(e,t,n){let r=z4(e,1,.5),i;for(t+n>1&&(i=1/(t+n),t*=i,n*=i),i=0;i<3;i++)r[i]*=1-t-n,r[i]+=t;return r}function _le(e,t,n,r,i){return e===i?(t-n)/r+(t<n?6:0):t===i?(n-e)/r+2:(e-t)/r+4}function B4(e){let t=e.r/255,n=e.g/255,r=e.b/255,i=Math.max(t,n,r),a=Math.min(t,n,r),o=(i+a)/2,s,c,l;return i!==a&&(l=i-a,c=o>.5?l/(2-i-a):l/(i+a),s=_le(t,n,r,l,i),s=s*60+.5),[s|0,c||0,o]}function V4(e,t,n,r){return(Array.isArray(t)?e(t[0],t[1],t[2]):e(t,n,r)).map(I4)}function H4(e,t,n){return V4(z4,e,t,n)}function vle(e,t,n){return V4(gle,e,t,n)}function yle(e,t,n){return V4(hle,e,t,n)}function U4(e){return(e%360+360)%360}function ble(e){let t=t3.exec(e),n=255,r;if(!t)return;t[5]!==r&&(n=t[6]?F4(+t[5]):I4(+t[5]));let i=U4(+t[2]),a=t[3]/100,o=t[4]/100;return r=t[1]===`hwb`?vle(i,a,o):t[1]===`hsv`?yle(i,a,o):H4(i,a,o),{r:r[0],g:r[1],b:r[2],a:n}}function xle(e,t){var n=B4(e);n[0]=U4(n[0]+t),n=H4(n),e.r=n[0],e.g=n[1],e.b=n[2]}function Sle(e){if(!e)return;let t=B4(e),n=t[0],r=R4(t[1]),i=R4(t[2]);return e.a<255?`hsla(${n}, ${r}%, ${i}%, ${L4(e.a)})`:`hsl(${n}, ${r}%, ${i}%)`}function Cle(){let e={},t=Object.keys(r3),n=Object.keys(n3),r,i,a,o,s;for(r=0;r<t.length;r++){for(o=s=t[r],i=0;i<n.length;i++)a=n[i],s=s.replace(a,n3[a]);a=parseInt(r3[o],16),e[s]=[a>>16&255,a>>8&255,a&255]}return e}function wle(e){i3||(i3=Cle(),i3.transparent=[0,0,0,0]);let t=i3[e.toLowerCase()];return t&&{r:t[0],g:t[1],b:t[2],a:t.length===4?t[3]:255}}function Tle(e){let t=a3.exec(e),n=255,r,i,a;if(t){if(t[7]!==r){let e=+t[7];n=t[8]?F4(e):q4(e*255,0,255)}return r=+t[1],i=+t[3],a=+t[5],r=255&(t[2]?F4(r):q4(r,0,255)),i=255&(t[4]?F4(i):q4(i,0,255)),a=255&(t[6]?F4(a):q4(a,0,255)),{r,g:i,b:a,a:n}}}function Ele(e){return e&&(e.a<255?`rgba(${e.r}, ${e.g}, ${e.b}, ${L4(e.a)})`:`rgb(${e.r}, ${e.g}, ${e.b})`)}function Dle(e,t,n){let r=s3(L4(e.r)),i=s3(L4(e.g)),a=s3(L4(e.b));return{r:I4(o3(r+n*(s3(L4(t.r))-r))),g:I4(o3(i+n*(s3(L4(t.g))-i))),b:I4(o3(a+n*(s3(L4(t.b))-a))),a:e.a+n*(t.a-e.a)}}function W4(e,t,n){if(e){let r=B4(e);r[t]=Math.max(0,Math.min(r[t]+r[t]*n,t===0?360:1)),r=H4(r),e.r=r[0],e.g=r[1],e.b=r[2]}}function G4(e,t){return e&&Object.assign(t||{},e)}function K4(e){var t={r:0,g:0,b:0,a:255};return Array.isArray(e)?e.length>=3&&(t={r:e[0],g:e[1],b:e[2],a:255},e.length>3&&(t.a=I4(e[3]))):(t=G4(e,{r:0,g:0,b:0,a:1}),t.a=I4(t.a)),t}function Ole(e){return e.charAt(0)===`r`?Tle(e):ble(e)}var q4,J4,Y4,X4,Z4,Q4,$4,e3,t3,n3,r3,i3,a3,o3,s3,c3,kle=t((()=>{q4=(e,t,n)=>Math.max(Math.min(e,n),t),J4={0:0,1:1,2:2,3:3,4:4,5:5,6:6,7:7,8:8,9:9,A:10,B:11,C:12,D:13,E:14,F:15,a:10,b:11,c:12,d:13,e:14,f:15},Y4=[...`0123456789ABCDEF`],X4=e=>Y4[e&15],Z4=e=>Y4[(e&240)>>4]+Y4[e&15],Q4=e=>(e&240)>>4==(e&15),$4=e=>Q4(e.r)&&Q4(e.g)&&Q4(e.b)&&Q4(e.a),e3=(e,t)=>e<255?t(e):``,t3=/^(hsla?|hwb|hsv)\(\s*([-+.e\d]+)(?:deg)?[\s,]+([-+.e\d]+)%[\s,]+([-+.e\d]+)%(?:[\s,]+([-+.e\d]+)(%)?)?\s*\)$/,n3={x:`dark`,Z:`light`,Y:`re`,X:`blu`,W:`gr`,V:`medium`,U:`slate`,A:`ee`,T:`ol`,S:`or`,B:`ra`,C:`lateg`,D:`ights`,R:`in`,Q:`turquois`,E:`hi`,P:`ro`,O:`al`,N:`le`,M:`de`,L:`yello`,F:`en`,K:`ch`,G:`arks`,H:`ea`,I:`ightg`,J:`wh`},r3={OiceXe:`f0f8ff`,antiquewEte:`faebd7`,aqua:`ffff`,aquamarRe:`7fffd4`,azuY:`f0ffff`,beige:`f5f5dc`,bisque:`ffe4c4`,black:`0`,blanKedOmond:`ffebcd`,Xe:`ff`,XeviTet:`8a2be2`,bPwn:`a52a2a`,burlywood:`deb887`,caMtXe:`5f9ea0`,KartYuse:`7fff00`,KocTate:`d2691e`,cSO:`ff7f50`,cSnflowerXe:`6495ed`,cSnsilk:`fff8dc`,crimson:`dc143c`,cyan:`ffff`,xXe:`8b`,xcyan:`8b8b`,xgTMnPd:`b8860b`,xWay:`a9a9a9`,xgYF:`6400`,xgYy:`a9a9a9`,xkhaki:`bdb76b`,xmagFta:`8b008b`,xTivegYF:`556b2f`,xSange:`ff8c00`,xScEd:`9932cc`,xYd:`8b0000`,xsOmon:`e9967a`,xsHgYF:`8fbc8f`,xUXe:`483d8b`,xUWay:`2f4f4f`,xUgYy:`2f4f4f`,xQe:`ced1`,xviTet:`9400d3`,dAppRk:`ff1493`,dApskyXe:`bfff`,dimWay:`696969`,dimgYy:`696969`,dodgerXe:`1e90ff`,fiYbrick:`b22222`,flSOwEte:`fffaf0`,foYstWAn:`228b22`,fuKsia:`ff00ff`,gaRsbSo:`dcdcdc`,ghostwEte:`f8f8ff`,gTd:`ffd700`,gTMnPd:`daa520`,Way:`808080`,gYF:`8000`,gYFLw:`adff2f`,gYy:`808080`,honeyMw:`f0fff0`,hotpRk:`ff69b4`,RdianYd:`cd5c5c`,Rdigo:`4b0082`,ivSy:`fffff0`,khaki:`f0e68c`,lavFMr:`e6e6fa`,lavFMrXsh:`fff0f5`,lawngYF:`7cfc00`,NmoncEffon:`fffacd`,ZXe:`add8e6`,ZcSO:`f08080`,Zcyan:`e0ffff`,ZgTMnPdLw:`fafad2`,ZWay:`d3d3d3`,ZgYF:`90ee90`,ZgYy:`d3d3d3`,ZpRk:`ffb6c1`,ZsOmon:`ffa07a`,ZsHgYF:`20b2aa`,ZskyXe:`87cefa`,ZUWay:`778899`,ZUgYy:`778899`,ZstAlXe:`b0c4de`,ZLw:`ffffe0`,lime:`ff00`,limegYF:`32cd32`,lRF:`faf0e6`,magFta:`ff00ff`,maPon:`800000`,VaquamarRe:`66cdaa`,VXe:`cd`,VScEd:`ba55d3`,VpurpN:`9370db`,VsHgYF:`3cb371`,VUXe:`7b68ee`,VsprRggYF:`fa9a`,VQe:`48d1cc`,VviTetYd:`c71585`,midnightXe:`191970`,mRtcYam:`f5fffa`,mistyPse:`ffe4e1`,moccasR:`ffe4b5`,navajowEte:`ffdead`,navy:`80`,Tdlace:`fdf5e6`,Tive:`808000`,TivedBb:`6b8e23`,Sange:`ffa500`,SangeYd:`ff4500`,ScEd:`da70d6`,pOegTMnPd:`eee8aa`,pOegYF:`98fb98`,pOeQe:`afeeee`,pOeviTetYd:`db7093`,papayawEp:`ffefd5`,pHKpuff:`ffdab9`,peru:`cd853f`,pRk:`ffc0cb`,plum:`dda0dd`,powMrXe:`b0e0e6`,purpN:`800080`,YbeccapurpN:`663399`,Yd:`ff0000`,Psybrown:`bc8f8f`,PyOXe:`4169e1`,saddNbPwn:`8b4513`,sOmon:`fa8072`,sandybPwn:`f4a460`,sHgYF:`2e8b57`,sHshell:`fff5ee`,siFna:`a0522d`,silver:`c0c0c0`,skyXe:`87ceeb`,UXe:`6a5acd`,UWay:`708090`,UgYy:`708090`,snow:`fffafa`,sprRggYF:`ff7f`,stAlXe:`4682b4`,tan:`d2b48c`,teO:`8080`,tEstN:`d8bfd8`,tomato:`ff6347`,Qe:`40e0d0`,viTet:`ee82ee`,JHt:`f5deb3`,wEte:`ffffff`,wEtesmoke:`f5f5f5`,Lw:`ffff00`,LwgYF:`9acd32`},a3=/^rgba?\(\s*([-+.\d]+)(%)?[\s,]+([-+.e\d]+)(%)?[\s,]+([-+.e\d]+)(%)?(?:[\s,/]+([-+.e\d]+)(%)?)?\s*\)$/,o3=e=>e<=.0031308?e*12.92:e**(1/2.4)*1.055-.055,s3=e=>e<=.04045?e/12.92:((e+.055)/1.055)**2.4,c3=class e{constructor(t){if(t instanceof e)return t;let n=typeof t,r;n===`object`?r=K4(t):n===`string`&&(r=ple(t)||wle(t)||Ole(t)),this._rgb=r,this._valid=!!r}get valid(){return this._valid}get rgb(){var e=G4(this._rgb);return e&&(e.a=L4(e.a)),e}set rgb(e){this._rgb=K4(e)}rgbString(){return this._valid?Ele(this._rgb):void 0}hexString(){return this._valid?mle(this._rgb):void 0}hslString(){return this._valid?Sle(this._rgb):void 0}mix(e,t){if(e){let n=this.rgb,r=e.rgb,i,a=t===i?.5:t,o=2*a-1,s=n.a-r.a,c=((o*s===-1?o:(o+s)/(1+o*s))+1)/2;i=1-c,n.r=255&c*n.r+i*r.r+.5,n.g=255&c*n.g+i*r.g+.5,n.b=255&c*n.b+i*r.b+.5,n.a=a*n.a+(1-a)*r.a,this.rgb=n}return this}interpolate(e,t){return e&&(this._rgb=Dle(this._rgb,e._rgb,t)),this}clone(){return new e(this.rgb)}alpha(e){return this._rgb.a=I4(e),this}clearer(e){let t=this._rgb;return t.a*=1-e,this}greyscale(){let e=this._rgb;return e.r=e.g=e.b=P4(e.r*.3+e.g*.59+e.b*.11),this}opaquer(e){let t=this._rgb;return t.a*=1+e,this}negate(){let e=this._rgb;return e.r=255-e.r,e.g=255-e.g,e.b=255-e.b,this}lighten(e){return W4(this._rgb,2,e),this}darken(e){return W4(this._rgb,2,-e),this}saturate(e){return W4(this._rgb,1,e),this}desaturate(e){return W4(this._rgb,1,-e),this}rotate(e){return xle(this._rgb,e),this}}}));function l3(){}function u3(e){return e==null}function d3(e){if(Array.isArray&&Array.isArray(e))return!0;let t=Object.prototype.toString.call(e);return t.slice(0,7)===`[object`&&t.slice(-6)===`Array]`}function f3(e){return e!==null&&Object.prototype.toString.call(e)===`[object Object]`}function p3(e){return(typeof e==`number`||e instanceof Number)&&isFinite(+e)}function m3(e,t){return p3(e)?e:t}function h3(e,t){return e===void 0?t:e}function g3(e,t,n){if(e&&typeof e.call==`function`)return e.apply(n,t)}function _3(e,t,n,r){let i,a,o;if(d3(e))if(a=e.length,r)for(i=a-1;i>=0;i--)t.call(n,e[i],i);else for(i=0;i<a;i++)t.call(n,e[i],i);else if(f3(e))for(o=Object.keys(e),a=o.length,i=0;i<a;i++)t.call(n,e[o[i]],o[i])}function v3(e,t){let n,r,i,a;if(!e||!t||e.length!==t.length)return!1;for(n=0,r=e.length;n<r;++n)if(i=e[n],a=t[n],i.datasetIndex!==a.datasetIndex||i.index!==a.index)return!1;return!0}function y3(e){if(d3(e))return e.map(y3);if(f3(e)){let t=Object.create(null),n=Object.keys(e),r=n.length,i=0;for(;i<r;++i)t[n[i]]=y3(e[n[i]]);return t}return e}function b3(e){return[`__proto__`,`prototype`,`constructor`].indexOf(e)===-1}function Ale(e,t,n,r){if(!b3(e))return;let i=t[e],a=n[e];f3(i)&&f3(a)?x3(i,a,r):t[e]=y3(a)}function x3(e,t,n){let r=d3(t)?t:[t],i=r.length;if(!f3(e))return e;n||={};let a=n.merger||Ale,o;for(let t=0;t<i;++t){if(o=r[t],!f3(o))continue;let i=Object.keys(o);for(let t=0,r=i.length;t<r;++t)a(i[t],e,o,n)}return e}function S3(e,t){return x3(e,t,{merger:jle})}function jle(e,t,n){if(!b3(e))return;let r=t[e],i=n[e];f3(r)&&f3(i)?S3(r,i):Object.prototype.hasOwnProperty.call(t,e)||(t[e]=y3(i))}function Mle(e){let t=e.split(`.`),n=[],r=``;for(let e of t)r+=e,r.endsWith(`\\`)?r=r.slice(0,-1)+`.`:(n.push(r),r=``);return n}function Nle(e){let t=Mle(e);return e=>{for(let n of t){if(n===``)break;e&&=e[n]}return e}}function C3(e,t){return(z6[t]||(z6[t]=Nle(t)))(e)}function w3(e){return e.charAt(0).toUpperCase()+e.slice(1)}function Ple(e){return e.type===`mouseup`||e.type===`click`||e.type===`contextmenu`}function T3(e,t,n){return Math.abs(e-t)<n}function E3(e){let t=Math.round(e);e=T3(e,t,e/1e3)?t:e;let n=10**Math.floor(Z6(e)),r=e/n;return(r<=1?1:r<=2?2:r<=5?5:10)*n}function Fle(e){let t=[],n=Math.sqrt(e),r;for(r=1;r<n;r++)e%r===0&&(t.push(r),t.push(e/r));return n===(n|0)&&t.push(n),t.sort((e,t)=>e-t).pop(),t}function Ile(e){return typeof e==`symbol`||typeof e==`object`&&!!e&&!(Symbol.toPrimitive in e||`toString`in e||`valueOf`in e)}function D3(e){return!Ile(e)&&!isNaN(parseFloat(e))&&isFinite(e)}function Lle(e,t){let n=Math.round(e);return n-t<=e&&n+t>=e}function O3(e,t,n){let r,i,a;for(r=0,i=e.length;r<i;r++)a=e[r][n],isNaN(a)||(t.min=Math.min(t.min,a),t.max=Math.max(t.max,a))}function k3(e){return U6/180*e}function A3(e){return 180/U6*e}function j3(e){if(!p3(e))return;let t=1,n=0;for(;Math.round(e*t)/t!==e;)t*=10,n++;return n}function Rle(e,t){let n=t.x-e.x,r=t.y-e.y,i=Math.sqrt(n*n+r*r),a=Math.atan2(r,n);return a<-.5*U6&&(a+=W6),{angle:a,distance:i}}function M3(e,t){return Math.sqrt((t.x-e.x)**2+(t.y-e.y)**2)}function zle(e,t){return(e-t+G6)%W6-U6}function N3(e){return(e%W6+W6)%W6}function P3(e,t,n,r){let i=N3(e),a=N3(t),o=N3(n),s=N3(a-i),c=N3(o-i),l=N3(i-a),u=N3(i-o);return i===a||i===o||r&&a===o||s>c&&l<u}function F3(e,t,n){return Math.max(t,Math.min(n,e))}function Ble(e){return F3(e,-32768,32767)}function I3(e,t,n,r=1e-6){return e>=Math.min(t,n)-r&&e<=Math.max(t,n)+r}function L3(e,t,n){n||=(n=>e[n]<t);let r=e.length-1,i=0,a;for(;r-i>1;)a=i+r>>1,n(a)?i=a:r=a;return{lo:i,hi:r}}function Vle(e,t,n){let r=0,i=e.length;for(;r<i&&e[r]<t;)r++;for(;i>r&&e[i-1]>n;)i--;return r>0||i<e.length?e.slice(r,i):e}function Hle(e,t){if(e._chartjs){e._chartjs.listeners.push(t);return}Object.defineProperty(e,"_chartjs",{configurable:!0,enumerable:!1,value:{listeners:[t]}}),t8.forEach(t=>{let n=`_onData`+w3(t),r=e[t];Object.defineProperty(e,t,{configurable:!0,enumerable:!1,value(...t){let i=r.apply(this,t);return e._chartjs.listeners.forEach(e=>{typeof e[n]==`function`&&e[n](...t)}),i}})})}function R3(e,t){let n=e._chartjs;if(!n)return;let r=n.listeners,i=r.indexOf(t);i!==-1&&r.splice(i,1),!(r.length>0)&&(t8.forEach(t=>{delete e[t]}),delete e._chartjs)}function Ule(e){let t=new Set(e);return t.size===e.length?e:Array.from(t)}function z3(e,t){let n=[],r=!1;return function(...i){n=i,r||(r=!0,n8.call(window,()=>{r=!1,e.apply(t,n)}))}}function Wle(e,t){let n;return function(...r){return t?(clearTimeout(n),n=setTimeout(e,t,r)):e.apply(this,r),t}}function Gle(e,t,n){let r=t.length,i=0,a=r;if(e._sorted){let{iScale:o,vScale:s,_parsed:c}=e,l=e.dataset&&e.dataset.options?e.dataset.options.spanGaps:null,u=o.axis,{min:d,max:f,minDefined:p,maxDefined:m}=o.getUserBounds();if(p){if(i=Math.min($6(c,u,d).lo,n?r:$6(t,u,o.getPixelForValue(d)).lo),l){let e=c.slice(0,i+1).reverse().findIndex(e=>!u3(e[s.axis]));i-=Math.max(0,e)}i=F3(i,0,r-1)}if(m){let e=Math.max($6(c,o.axis,f,!0).hi+1,n?0:$6(t,u,o.getPixelForValue(f),!0).hi+1);if(l){let t=c.slice(e-1).findIndex(e=>!u3(e[s.axis]));e+=Math.max(0,t)}a=F3(e,i,r)-i}else a=r-i}return{start:i,count:a}}function Kle(e){let{xScale:t,yScale:n,_scaleRanges:r}=e,i={xmin:t.min,xmax:t.max,ymin:n.min,ymax:n.max};if(!r)return e._scaleRanges=i,!0;let a=r.xmin!==t.min||r.xmax!==t.max||r.ymin!==n.min||r.ymax!==n.max;return Object.assign(r,i),a}function B3(e){if(e&&typeof e==`object`){let t=e.toString();return t===`[object CanvasPattern]`||t===`[object CanvasGradient]`}return!1}function V3(e){return B3(e)?e:new c3(e)}function H3(e){return B3(e)?e:new c3(e).saturate(.5).darken(.1).hexString()}function qle(e){e.set(`animation`,{delay:void 0,duration:1e3,easing:`easeOutQuart`,fn:void 0,from:void 0,loop:void 0,to:void 0,type:void 0}),e.describe(`animation`,{_fallback:!1,_indexable:!1,_scriptable:e=>e!==`onProgress`&&e!==`onComplete`&&e!==`fn`}),e.set(`animations`,{colors:{type:`color`,properties:d8},numbers:{type:`number`,properties:u8}}),e.describe(`animations`,{_fallback:`animation`}),e.set(`transitions`,{active:{animation:{duration:400}},resize:{animation:{duration:0}},show:{animations:{colors:{from:`transparent`},visible:{type:`boolean`,duration:0}}},hide:{animations:{colors:{to:`transparent`},visible:{type:`boolean`,easing:`linear`,fn:e=>e|0}}}})}function Jle(e){e.set(`layout`,{autoPadding:!0,padding:{top:0,right:0,bottom:0,left:0}})}function Yle(e,t){t||={};let n=e+JSON.stringify(t),r=f8.get(n);return r||(r=new Intl.NumberFormat(e,t),f8.set(n,r)),r}function U3(e,t,n){return Yle(t,n).format(e)}function Xle(e,t){let n=t.length>3?t[2].value-t[1].value:t[1].value-t[0].value;return Math.abs(n)>=1&&e!==Math.floor(e)&&(n=e-Math.floor(e)),n}function Zle(e){e.set(`scale`,{display:!0,offset:!1,reverse:!1,beginAtZero:!1,bounds:`ticks`,clip:!0,grace:0,grid:{display:!0,lineWidth:1,drawOnChartArea:!0,drawTicks:!0,tickLength:8,tickWidth:(e,t)=>t.lineWidth,tickColor:(e,t)=>t.color,offset:!1},border:{display:!0,dash:[],dashOffset:0,width:1},title:{display:!1,text:``,padding:{top:4,bottom:4}},ticks:{minRotation:0,maxRotation:50,mirror:!1,textStrokeWidth:0,textStrokeColor:``,padding:3,display:!0,autoSkip:!0,autoSkipPadding:3,labelOffset:0,callback:m8.formatters.values,minor:{},major:{},align:`center`,crossAlign:`near`,showLabelBackdrop:!1,backdropColor:`rgba(255, 255, 255, 0.75)`,backdropPadding:2}}),e.route(`scale.ticks`,`color`,``,`color`),e.route(`scale.grid`,`color`,``,`borderColor`),e.route(`scale.border`,`color`,``,`borderColor`),e.route(`scale.title`,`color`,``,`color`),e.describe(`scale`,{_fallback:!1,_scriptable:e=>!e.startsWith(`before`)&&!e.startsWith(`after`)&&e!==`callback`&&e!==`parser`,_indexable:e=>e!==`borderDash`&&e!==`tickBorderDash`&&e!==`dash`}),e.describe(`scales`,{_fallback:`scale`}),e.describe(`scale.ticks`,{_scriptable:e=>e!==`backdropPadding`&&e!==`callback`,_indexable:e=>e!==`backdropPadding`})}function W3(e,t){if(!t)return e;let n=t.split(`.`);for(let t=0,r=n.length;t<r;++t){let r=n[t];e=e[r]||(e[r]=Object.create(null))}return e}function G3(e,t,n){return typeof t==`string`?x3(W3(e,t),n):x3(W3(e,``),t)}function Qle(e){return!e||u3(e.size)||u3(e.family)?null:(e.style?e.style+` `:``)+(e.weight?e.weight+` `:``)+e.size+`px `+e.family}function K3(e,t,n,r,i){let a=t[i];return a||(a=t[i]=e.measureText(i).width,n.push(i)),a>r&&(r=a),r}function $le(e,t,n,r){r||={};let i=r.data=r.data||{},a=r.garbageCollect=r.garbageCollect||[];r.font!==t&&(i=r.data={},a=r.garbageCollect=[],r.font=t),e.save(),e.font=t;let o=0,s=n.length,c,l,u,d,f;for(c=0;c<s;c++)if(d=n[c],d!=null&&!d3(d))o=K3(e,i,a,o,d);else if(d3(d))for(l=0,u=d.length;l<u;l++)f=d[l],f!=null&&!d3(f)&&(o=K3(e,i,a,o,f));e.restore();let p=a.length/2;if(p>n.length){for(c=0;c<p;c++)delete i[a[c]];a.splice(0,p)}return o}function q3(e,t,n){let r=e.currentDevicePixelRatio,i=n===0?0:Math.max(n/2,.5);return Math.round((t-i)*r)/r+i}function J3(e,t){!t&&!e||(t||=e.getContext(`2d`),t.save(),t.resetTransform(),t.clearRect(0,0,e.width,e.height),t.restore())}function Y3(e,t,n,r){X3(e,t,n,r,null)}function X3(e,t,n,r,i){let a,o,s,c,l,u,d,f,p=t.pointStyle,m=t.rotation,h=t.radius,g=(m||0)*q6;if(p&&typeof p==`object`&&(a=p.toString(),a===`[object HTMLImageElement]`||a===`[object HTMLCanvasElement]`)){e.save(),e.translate(n,r),e.rotate(g),e.drawImage(p,-p.width/2,-p.height/2,p.width,p.height),e.restore();return}if(!(isNaN(h)||h<=0)){switch(e.beginPath(),p){default:i?e.ellipse(n,r,i/2,h,0,0,W6):e.arc(n,r,h,0,W6),e.closePath();break;case`triangle`:u=i?i/2:h,e.moveTo(n+Math.sin(g)*u,r-Math.cos(g)*h),g+=X6,e.lineTo(n+Math.sin(g)*u,r-Math.cos(g)*h),g+=X6,e.lineTo(n+Math.sin(g)*u,r-Math.cos(g)*h),e.closePath();break;case`rectRounded`:l=h*.516,c=h-l,o=Math.cos(g+Y6)*c,d=Math.cos(g+Y6)*(i?i/2-l:c),s=Math.sin(g+Y6)*c,f=Math.sin(g+Y6)*(i?i/2-l:c),e.arc(n-d,r-s,l,g-U6,g-J6),e.arc(n+f,r-o,l,g-J6,g),e.arc(n+d,r+s,l,g,g+J6),e.arc(n-f,r+o,l,g+J6,g+U6),e.closePath();break;case`rect`:if(!m){c=Math.SQRT1_2*h,u=i?i/2:c,e.rect(n-u,r-c,2*u,2*c);break}g+=Y6;case`rectRot`:d=Math.cos(g)*(i?i/2:h),o=Math.cos(g)*h,s=Math.sin(g)*h,f=Math.sin(g)*(i?i/2:h),e.moveTo(n-d,r-s),e.lineTo(n+f,r-o),e.lineTo(n+d,r+s),e.lineTo(n-f,r+o),e.closePath();break;case`crossRot`:g+=Y6;case`cross`:d=Math.cos(g)*(i?i/2:h),o=Math.cos(g)*h,s=Math.sin(g)*h,f=Math.sin(g)*(i?i/2:h),e.moveTo(n-d,r-s),e.lineTo(n+d,r+s),e.moveTo(n+f,r-o),e.lineTo(n-f,r+o);break;case`star`:d=Math.cos(g)*(i?i/2:h),o=Math.cos(g)*h,s=Math.sin(g)*h,f=Math.sin(g)*(i?i/2:h),e.moveTo(n-d,r-s),e.lineTo(n+d,r+s),e.moveTo(n+f,r-o),e.lineTo(n-f,r+o),g+=Y6,d=Math.cos(g)*(i?i/2:h),o=Math.cos(g)*h,s=Math.sin(g)*h,f=Math.sin(g)*(i?i/2:h),e.moveTo(n-d,r-s),e.lineTo(n+d,r+s),e.moveTo(n+f,r-o),e.lineTo(n-f,r+o);break;case`line`:o=i?i/2:Math.cos(g)*h,s=Math.sin(g)*h,e.moveTo(n-o,r-s),e.lineTo(n+o,r+s);break;case`dash`:e.moveTo(n,r),e.lineTo(n+Math.cos(g)*(i?i/2:h),r+Math.sin(g)*h);break;case!1:e.closePath();break}e.fill(),t.borderWidth>0&&e.stroke()}}function Z3(e,t,n){return n||=.5,!t||e&&e.x>t.left-n&&e.x<t.right+n&&e.y>t.top-n&&e.y<t.bottom+n}function Q3(e,t){e.save(),e.beginPath(),e.rect(t.left,t.top,t.right-t.left,t.bottom-t.top),e.clip()}function $3(e){e.restore()}function eue(e,t,n,r,i){if(!t)return e.lineTo(n.x,n.y);if(i===`middle`){let r=(t.x+n.x)/2;e.lineTo(r,t.y),e.lineTo(r,n.y)}else i===`after`==!!r?e.lineTo(n.x,t.y):e.lineTo(t.x,n.y);e.lineTo(n.x,n.y)}function tue(e,t,n,r){if(!t)return e.lineTo(n.x,n.y);e.bezierCurveTo(r?t.cp1x:t.cp2x,r?t.cp1y:t.cp2y,r?n.cp2x:n.cp1x,r?n.cp2y:n.cp1y,n.x,n.y)}function nue(e,t){t.translation&&e.translate(t.translation[0],t.translation[1]),u3(t.rotation)||e.rotate(t.rotation),t.color&&(e.fillStyle=t.color),t.textAlign&&(e.textAlign=t.textAlign),t.textBaseline&&(e.textBaseline=t.textBaseline)}function rue(e,t,n,r,i){if(i.strikethrough||i.underline){let a=e.measureText(r),o=t-a.actualBoundingBoxLeft,s=t+a.actualBoundingBoxRight,c=n-a.actualBoundingBoxAscent,l=n+a.actualBoundingBoxDescent,u=i.strikethrough?(c+l)/2:l;e.strokeStyle=e.fillStyle,e.beginPath(),e.lineWidth=i.decorationWidth||2,e.moveTo(o,u),e.lineTo(s,u),e.stroke()}}function iue(e,t){let n=e.fillStyle;e.fillStyle=t.color,e.fillRect(t.left,t.top,t.width,t.height),e.fillStyle=n}function e6(e,t,n,r,i,a={}){let o=d3(t)?t:[t],s=a.strokeWidth>0&&a.strokeColor!==``,c,l;for(e.save(),e.font=i.string,nue(e,a),c=0;c<o.length;++c)l=o[c],a.backdrop&&iue(e,a.backdrop),s&&(a.strokeColor&&(e.strokeStyle=a.strokeColor),u3(a.strokeWidth)||(e.lineWidth=a.strokeWidth),e.strokeText(l,n,r,a.maxWidth)),e.fillText(l,n,r,a.maxWidth),rue(e,n,r,l,a),r+=Number(i.lineHeight);e.restore()}function t6(e,t){let{x:n,y:r,w:i,h:a,radius:o}=t;e.arc(n+o.topLeft,r+o.topLeft,o.topLeft,1.5*U6,U6,!0),e.lineTo(n,r+a-o.bottomLeft),e.arc(n+o.bottomLeft,r+a-o.bottomLeft,o.bottomLeft,U6,J6,!0),e.lineTo(n+i-o.bottomRight,r+a),e.arc(n+i-o.bottomRight,r+a-o.bottomRight,o.bottomRight,J6,0,!0),e.lineTo(n+i,r+o.topRight),e.arc(n+i-o.topRight,r+o.topRight,o.topRight,0,-J6,!0),e.lineTo(n+o.topLeft,r)}function aue(e,t){let n=(``+e).match(y8);if(!n||n[1]===`normal`)return t*1.2;switch(e=+n[2],n[3]){case`px`:return e;case`%`:e/=100;break}return t*e}function n6(e,t){let n={},r=f3(t),i=r?Object.keys(t):t,a=f3(e)?r?n=>h3(e[n],e[t[n]]):t=>e[t]:()=>e;for(let e of i)n[e]=x8(a(e));return n}function oue(e){return n6(e,{top:`y`,right:`x`,bottom:`y`,left:`x`})}function r6(e){return n6(e,[`topLeft`,`topRight`,`bottomLeft`,`bottomRight`])}function i6(e){let t=oue(e);return t.width=t.left+t.right,t.height=t.top+t.bottom,t}function a6(e,t){e||={},t||=v8.font;let n=h3(e.size,t.size);typeof n==`string`&&(n=parseInt(n,10));let r=h3(e.style,t.style);r&&!(``+r).match(b8)&&(console.warn(`Invalid font style specified: "`+r+`"`),r=void 0);let i={family:h3(e.family,t.family),lineHeight:aue(h3(e.lineHeight,t.lineHeight),n),size:n,style:r,weight:h3(e.weight,t.weight),string:``};return i.string=Qle(i),i}function o6(e,t,n,r){let i=!0,a,o,s;for(a=0,o=e.length;a<o;++a)if(s=e[a],s!==void 0&&(t!==void 0&&typeof s==`function`&&(s=s(t),i=!1),n!==void 0&&d3(s)&&(s=s[n%s.length],i=!1),s!==void 0))return r&&!i&&(r.cacheable=!1),s}function sue(e,t,n){let{min:r,max:i}=e,a=R6(t,(i-r)/2),o=(e,t)=>n&&e===0?0:e+t;return{min:o(r,-Math.abs(a)),max:o(i,a)}}function s6(e,t){return Object.assign(Object.create(e),t)}function c6(e,t=[``],n,r,i=()=>e[0]){let a=n||e;return r===void 0&&(r=h6(`_fallback`,e)),new Proxy({[Symbol.toStringTag]:`Object`,_cacheable:!0,_scopes:e,_rootScopes:a,_fallback:r,_getTarget:i,override:n=>c6([n,...e],t,a,r)},{deleteProperty(t,n){return delete t[n],delete t._keys,delete e[0][n],!0},get(n,r){return d6(n,r,()=>pue(r,t,e,n))},getOwnPropertyDescriptor(e,t){return Reflect.getOwnPropertyDescriptor(e._scopes[0],t)},getPrototypeOf(){return Reflect.getPrototypeOf(e[0])},has(e,t){return g6(e).includes(t)},ownKeys(e){return g6(e)},set(e,t,n){let r=e._storage||=i();return e[t]=r[t]=n,delete e._keys,!0}})}function l6(e,t,n,r){let i={_cacheable:!1,_proxy:e,_context:t,_subProxy:n,_stack:new Set,_descriptors:u6(e,r),setContext:t=>l6(e,t,n,r),override:i=>l6(e.override(i),t,n,r)};return new Proxy(i,{deleteProperty(t,n){return delete t[n],delete e[n],!0},get(e,t,n){return d6(e,t,()=>cue(e,t,n))},getOwnPropertyDescriptor(t,n){return t._descriptors.allKeys?Reflect.has(e,n)?{enumerable:!0,configurable:!0}:void 0:Reflect.getOwnPropertyDescriptor(e,n)},getPrototypeOf(){return Reflect.getPrototypeOf(e)},has(t,n){return Reflect.has(e,n)},ownKeys(){return Reflect.ownKeys(e)},set(t,n,r){return e[n]=r,delete t[n],!0}})}function u6(e,t={scriptable:!0,indexable:!0}){let{_scriptable:n=t.scriptable,_indexable:r=t.indexable,_allKeys:i=t.allKeys}=e;return{allKeys:i,scriptable:n,indexable:r,isScriptable:V6(n)?n:()=>n,isIndexable:V6(r)?r:()=>r}}function d6(e,t,n){if(Object.prototype.hasOwnProperty.call(e,t)||t===`constructor`)return e[t];let r=n();return e[t]=r,r}function cue(e,t,n){let{_proxy:r,_context:i,_subProxy:a,_descriptors:o}=e,s=r[t];return V6(s)&&o.isScriptable(t)&&(s=lue(t,s,e,n)),d3(s)&&s.length&&(s=uue(t,s,e,o.isIndexable)),C8(t,s)&&(s=l6(s,i,a&&a[t],o)),s}function lue(e,t,n,r){let{_proxy:i,_context:a,_subProxy:o,_stack:s}=n;if(s.has(e))throw Error(`Recursion detected: `+Array.from(s).join(`->`)+`->`+e);s.add(e);let c=t(a,o||r);return s.delete(e),C8(e,c)&&(c=p6(i._scopes,i,e,c)),c}function uue(e,t,n,r){let{_proxy:i,_context:a,_subProxy:o,_descriptors:s}=n;if(a.index!==void 0&&r(e))return t[a.index%t.length];if(f3(t[0])){let n=t,r=i._scopes.filter(e=>e!==n);t=[];for(let c of n){let n=p6(r,i,e,c);t.push(l6(n,a,o&&o[e],s))}}return t}function f6(e,t,n){return V6(e)?e(t,n):e}function due(e,t,n,r,i){for(let a of t){let t=w8(n,a);if(t){e.add(t);let a=f6(t._fallback,n,i);if(a!==void 0&&a!==n&&a!==r)return a}else if(t===!1&&r!==void 0&&n!==r)return null}return!1}function p6(e,t,n,r){let i=t._rootScopes,a=f6(t._fallback,n,r),o=[...e,...i],s=new Set;s.add(r);let c=m6(s,o,n,a||n,r);return c===null||a!==void 0&&a!==n&&(c=m6(s,o,a,c,r),c===null)?!1:c6(Array.from(s),[``],i,a,()=>fue(t,n,r))}function m6(e,t,n,r,i){for(;n;)n=due(e,t,n,r,i);return n}function fue(e,t,n){let r=e._getTarget();t in r||(r[t]={});let i=r[t];return d3(i)&&f3(n)?n:i||{}}function pue(e,t,n,r){let i;for(let a of t)if(i=h6(S8(a,e),n),i!==void 0)return C8(e,i)?p6(n,r,e,i):i}function h6(e,t){for(let n of t){if(!n)continue;let t=n[e];if(t!==void 0)return t}}function g6(e){let t=e._keys;return t||=e._keys=mue(e._scopes),t}function mue(e){let t=new Set;for(let n of e)for(let e of Object.keys(n).filter(e=>!e.startsWith(`_`)))t.add(e);return Array.from(t)}function hue(e,t,n,r){let i=e.skip?t:e,a=t,o=n.skip?t:n,s=M3(a,i),c=M3(o,a),l=s/(s+c),u=c/(s+c);l=isNaN(l)?0:l,u=isNaN(u)?0:u;let d=r*l,f=r*u;return{previous:{x:a.x-d*(o.x-i.x),y:a.y-d*(o.y-i.y)},next:{x:a.x+f*(o.x-i.x),y:a.y+f*(o.y-i.y)}}}function gue(e,t,n){let r=e.length,i,a,o,s,c,l=E8(e,0);for(let u=0;u<r-1;++u)if(c=l,l=E8(e,u+1),!(!c||!l)){if(T3(t[u],0,T8)){n[u]=n[u+1]=0;continue}i=n[u]/t[u],a=n[u+1]/t[u],s=i**2+a**2,!(s<=9)&&(o=3/Math.sqrt(s),n[u]=i*o*t[u],n[u+1]=a*o*t[u])}}function _ue(e,t,n=`x`){let r=D8(n),i=e.length,a,o,s,c=E8(e,0);for(let l=0;l<i;++l){if(o=s,s=c,c=E8(e,l+1),!s)continue;let i=s[n],u=s[r];o&&(a=(i-o[n])/3,s[`cp1${n}`]=i-a,s[`cp1${r}`]=u-a*t[l]),c&&(a=(c[n]-i)/3,s[`cp2${n}`]=i+a,s[`cp2${r}`]=u+a*t[l])}}function vue(e,t=`x`){let n=D8(t),r=e.length,i=Array(r).fill(0),a=Array(r),o,s,c,l=E8(e,0);for(o=0;o<r;++o)if(s=c,c=l,l=E8(e,o+1),c){if(l){let e=l[t]-c[t];i[o]=e===0?0:(l[n]-c[n])/e}a[o]=s?l?Q6(i[o-1])===Q6(i[o])?(i[o-1]+i[o])/2:0:i[o-1]:i[o]}gue(e,i,a),_ue(e,a,t)}function _6(e,t,n){return Math.max(Math.min(e,n),t)}function yue(e,t){let n,r,i,a,o,s=Z3(e[0],t);for(n=0,r=e.length;n<r;++n)o=a,a=s,s=n<r-1&&Z3(e[n+1],t),a&&(i=e[n],o&&(i.cp1x=_6(i.cp1x,t.left,t.right),i.cp1y=_6(i.cp1y,t.top,t.bottom)),s&&(i.cp2x=_6(i.cp2x,t.left,t.right),i.cp2y=_6(i.cp2y,t.top,t.bottom)))}function bue(e,t,n,r,i){let a,o,s,c;if(t.spanGaps&&(e=e.filter(e=>!e.skip)),t.cubicInterpolationMode===`monotone`)vue(e,i);else{let n=r?e[e.length-1]:e[0];for(a=0,o=e.length;a<o;++a)s=e[a],c=hue(n,s,e[Math.min(a+1,o-+!r)%o],t.tension),s.cp1x=c.previous.x,s.cp1y=c.previous.y,s.cp2x=c.next.x,s.cp2y=c.next.y,n=s}t.capBezierPoints&&yue(e,n)}function v6(){return typeof window<`u`&&typeof document<`u`}function y6(e){let t=e.parentNode;return t&&t.toString()===`[object ShadowRoot]`&&(t=t.host),t}function b6(e,t,n){let r;return typeof e==`string`?(r=parseInt(e,10),e.indexOf(`%`)!==-1&&(r=r/100*t.parentNode[n])):r=e,r}function xue(e,t){return O8(e).getPropertyValue(t)}function x6(e,t,n){let r={};n=n?`-`+n:``;for(let i=0;i<4;i++){let a=k8[i];r[a]=parseFloat(e[t+`-`+a+n])||0}return r.width=r.left+r.right,r.height=r.top+r.bottom,r}function Sue(e,t){let n=e.touches,r=n&&n.length?n[0]:e,{offsetX:i,offsetY:a}=r,o=!1,s,c;if(A8(i,a,e.target))s=i,c=a;else{let e=t.getBoundingClientRect();s=r.clientX-e.left,c=r.clientY-e.top,o=!0}return{x:s,y:c,box:o}}function S6(e,t){if(`native`in e)return e;let{canvas:n,currentDevicePixelRatio:r}=t,i=O8(n),a=i.boxSizing===`border-box`,o=x6(i,`padding`),s=x6(i,`border`,`width`),{x:c,y:l,box:u}=Sue(e,n),d=o.left+(u&&s.left),f=o.top+(u&&s.top),{width:p,height:m}=t;return a&&(p-=o.width+s.width,m-=o.height+s.height),{x:Math.round((c-d)/p*n.width/r),y:Math.round((l-f)/m*n.height/r)}}function Cue(e,t,n){let r,i;if(t===void 0||n===void 0){let a=e&&y6(e);if(!a)t=e.clientWidth,n=e.clientHeight;else{let e=a.getBoundingClientRect(),o=O8(a),s=x6(o,`border`,`width`),c=x6(o,`padding`);t=e.width-c.width-s.width,n=e.height-c.height-s.height,r=b6(o.maxWidth,a,`clientWidth`),i=b6(o.maxHeight,a,`clientHeight`)}}return{width:t,height:n,maxWidth:r||K6,maxHeight:i||K6}}function wue(e,t,n,r){let i=O8(e),a=x6(i,`margin`),o=b6(i.maxWidth,e,`clientWidth`)||K6,s=b6(i.maxHeight,e,`clientHeight`)||K6,c=Cue(e,t,n),{width:l,height:u}=c;if(i.boxSizing===`content-box`){let e=x6(i,`border`,`width`),t=x6(i,`padding`);l-=t.width+e.width,u-=t.height+e.height}return l=Math.max(0,l-a.width),u=Math.max(0,r?l/r:u-a.height),l=j8(Math.min(l,o,c.maxWidth)),u=j8(Math.min(u,s,c.maxHeight)),l&&!u&&(u=j8(l/2)),(t!==void 0||n!==void 0)&&r&&c.height&&u>c.height&&(u=c.height,l=j8(Math.floor(u*r))),{width:l,height:u}}function C6(e,t,n){let r=t||1,i=j8(e.height*r),a=j8(e.width*r);e.height=j8(e.height),e.width=j8(e.width);let o=e.canvas;return o.style&&(n||!o.style.height&&!o.style.width)&&(o.style.height=`${e.height}px`,o.style.width=`${e.width}px`),e.currentDevicePixelRatio!==r||o.height!==i||o.width!==a?(e.currentDevicePixelRatio=r,o.height=i,o.width=a,e.ctx.setTransform(r,0,0,r,0,0),!0):!1}function w6(e,t){let n=xue(e,t),r=n&&n.match(/^(\d+)(\.\d+)?px$/);return r?+r[1]:void 0}function T6(e,t,n,r){return{x:e.x+n*(t.x-e.x),y:e.y+n*(t.y-e.y)}}function Tue(e,t,n,r){return{x:e.x+n*(t.x-e.x),y:r===`middle`?n<.5?e.y:t.y:r===`after`?n<1?e.y:t.y:n>0?t.y:e.y}}function Eue(e,t,n,r){let i={x:e.cp2x,y:e.cp2y},a={x:t.cp1x,y:t.cp1y},o=T6(e,i,n),s=T6(i,a,n),c=T6(a,t,n);return T6(T6(o,s,n),T6(s,c,n),n)}function E6(e,t,n){return e?N8(t,n):P8()}function D6(e,t){let n,r;(t===`ltr`||t===`rtl`)&&(n=e.canvas.style,r=[n.getPropertyValue(`direction`),n.getPropertyPriority(`direction`)],n.setProperty(`direction`,t,`important`),e.prevTextDirection=r)}function O6(e,t){t!==void 0&&(delete e.prevTextDirection,e.canvas.style.setProperty(`direction`,t[0],t[1]))}function k6(e){return e===`angle`?{between:P3,compare:zle,normalize:N3}:{between:I3,compare:(e,t)=>e-t,normalize:e=>e}}function A6({start:e,end:t,count:n,loop:r,style:i}){return{start:e%n,end:t%n,loop:r&&(t-e+1)%n===0,style:i}}function Due(e,t,n){let{property:r,start:i,end:a}=n,{between:o,normalize:s}=k6(r),c=t.length,{start:l,end:u,loop:d}=e,f,p;if(d){for(l+=c,u+=c,f=0,p=c;f<p&&o(s(t[l%c][r]),i,a);++f)l--,u--;l%=c,u%=c}return u<l&&(u+=c),{start:l,end:u,loop:d,style:e.style}}function j6(e,t,n){if(!n)return[e];let{property:r,start:i,end:a}=n,o=t.length,{compare:s,between:c,normalize:l}=k6(r),{start:u,end:d,loop:f,style:p}=Due(e,t,n),m=[],h=!1,g=null,_,v,y,b=()=>c(i,y,_)&&s(i,y)!==0,x=()=>s(a,_)===0||c(a,y,_),S=()=>h||b(),C=()=>!h||x();for(let e=u,n=u;e<=d;++e)v=t[e%o],!v.skip&&(_=l(v[r]),_!==y&&(h=c(_,i,a),g===null&&S()&&(g=s(_,i)===0?e:n),g!==null&&C()&&(m.push(A6({start:g,end:e,loop:f,count:o,style:p})),g=null),n=e,y=_));return g!==null&&m.push(A6({start:g,end:d,loop:f,count:o,style:p})),m}function M6(e,t){let n=[],r=e.segments;for(let i=0;i<r.length;i++){let a=j6(r[i],e.points,t);a.length&&n.push(...a)}return n}function Oue(e,t,n,r){let i=0,a=t-1;if(n&&!r)for(;i<t&&!e[i].skip;)i++;for(;i<t&&e[i].skip;)i++;for(i%=t,n&&(a+=i);a>i&&e[a%t].skip;)a--;return a%=t,{start:i,end:a}}function kue(e,t,n,r){let i=e.length,a=[],o=t,s=e[t],c;for(c=t+1;c<=n;++c){let n=e[c%i];n.skip||n.stop?s.skip||(r=!1,a.push({start:t%i,end:(c-1)%i,loop:r}),t=o=n.stop?c:null):(o=c,s.skip&&(t=c)),s=n}return o!==null&&a.push({start:t%i,end:o%i,loop:r}),a}function Aue(e,t){let n=e.points,r=e.options.spanGaps,i=n.length;if(!i)return[];let a=!!e._loop,{start:o,end:s}=Oue(n,i,a,r);return r===!0?N6(e,[{start:o,end:s,loop:a}],n,t):N6(e,kue(n,o,s<o?s+i:s,!!e._fullLoop&&o===0&&s===i-1),n,t)}function N6(e,t,n,r){return!r||!r.setContext||!n?t:jue(e,t,n,r)}function jue(e,t,n,r){let i=e._chart.getContext(),a=P6(e.options),{_datasetIndex:o,options:{spanGaps:s}}=e,c=n.length,l=[],u=a,d=t[0].start,f=d;function p(e,t,r,i){let a=s?-1:1;if(e!==t){for(e+=c;n[e%c].skip;)e-=a;for(;n[t%c].skip;)t+=a;e%c!==t%c&&(l.push({start:e%c,end:t%c,loop:r,style:i}),u=i,d=t%c)}}for(let e of t){d=s?d:e.start;let t=n[d%c],a;for(f=d+1;f<=e.end;f++){let s=n[f%c];a=P6(r.setContext(s6(i,{type:`segment`,p0:t,p1:s,p0DataIndex:(f-1)%c,p1DataIndex:f%c,datasetIndex:o}))),Mue(a,u)&&p(d,f-1,e.loop,u),t=s,u=a}d<f-1&&p(d,f-1,e.loop,u)}return l}function P6(e){return{backgroundColor:e.backgroundColor,borderCapStyle:e.borderCapStyle,borderDash:e.borderDash,borderDashOffset:e.borderDashOffset,borderJoinStyle:e.borderJoinStyle,borderWidth:e.borderWidth,borderColor:e.borderColor}}function Mue(e,t){if(!t)return!1;let n=[],r=function(e,t){return B3(t)?(n.includes(t)||n.push(t),n.indexOf(t)):t};return JSON.stringify(e,r)!==JSON.stringify(t,r)}function F6(e,t,n){return e.options.clip?e[n]:t[n]}function Nue(e,t){let{xScale:n,yScale:r}=e;return n&&r?{left:F6(n,t,`left`),right:F6(n,t,`right`),top:F6(r,t,`top`),bottom:F6(r,t,`bottom`)}:t}function I6(e,t){let n=t._clip;if(n.disabled)return!1;let r=Nue(t,e.chartArea);return{left:n.left===!1?0:r.left-(n.left===!0?0:n.left),right:n.right===!1?e.width:r.right+(n.right===!0?0:n.right),top:n.top===!1?0:r.top-(n.top===!0?0:n.top),bottom:n.bottom===!1?e.height:r.bottom+(n.bottom===!0?0:n.bottom)}}var L6,R6,z6,B6,V6,H6,U6,W6,G6,K6,q6,J6,Y6,X6,Z6,Q6,$6,e8,t8,n8,r8,i8,a8,o8,s8,c8,l8,u8,d8,f8,p8,m8,h8,g8,_8,v8,y8,b8,x8,S8,C8,w8,T8,E8,D8,O8,k8,A8,j8,M8,N8,P8,Pue=t((()=>{kle(),L6=(()=>{let e=0;return()=>e++})(),R6=(e,t)=>typeof e==`string`&&e.endsWith(`%`)?parseFloat(e)/100*t:+e,z6={"":e=>e,x:e=>e.x,y:e=>e.y},B6=e=>e!==void 0,V6=e=>typeof e==`function`,H6=(e,t)=>{if(e.size!==t.size)return!1;for(let n of e)if(!t.has(n))return!1;return!0},U6=Math.PI,W6=2*U6,G6=W6+U6,K6=1/0,q6=U6/180,J6=U6/2,Y6=U6/4,X6=U6*2/3,Z6=Math.log10,Q6=Math.sign,$6=(e,t,n,r)=>L3(e,n,r?r=>{let i=e[r][t];return i<n||i===n&&e[r+1][t]===n}:r=>e[r][t]<n),e8=(e,t,n)=>L3(e,n,r=>e[r][t]>=n),t8=[`push`,`pop`,`shift`,`splice`,`unshift`],n8=function(){return typeof window>`u`?function(e){return e()}:window.requestAnimationFrame}(),r8=e=>e===`start`?`left`:e===`end`?`right`:`center`,i8=(e,t,n)=>e===`start`?t:e===`end`?n:(t+n)/2,a8=(e,t,n,r)=>e===(r?`left`:`right`)?n:e===`center`?(t+n)/2:t,o8=e=>e===0||e===1,s8=(e,t,n)=>-(2**(10*--e)*Math.sin((e-t)*W6/n)),c8=(e,t,n)=>2**(-10*e)*Math.sin((e-t)*W6/n)+1,l8={linear:e=>e,easeInQuad:e=>e*e,easeOutQuad:e=>-e*(e-2),easeInOutQuad:e=>(e/=.5)<1?.5*e*e:-.5*(--e*(e-2)-1),easeInCubic:e=>e*e*e,easeOutCubic:e=>--e*e*e+1,easeInOutCubic:e=>(e/=.5)<1?.5*e*e*e:.5*((e-=2)*e*e+2),easeInQuart:e=>e*e*e*e,easeOutQuart:e=>-(--e*e*e*e-1),easeInOutQuart:e=>(e/=.5)<1?.5*e*e*e*e:-.5*((e-=2)*e*e*e-2),easeInQuint:e=>e*e*e*e*e,easeOutQuint:e=>--e*e*e*e*e+1,easeInOutQuint:e=>(e/=.5)<1?.5*e*e*e*e*e:.5*((e-=2)*e*e*e*e+2),easeInSine:e=>-Math.cos(e*J6)+1,easeOutSine:e=>Math.sin(e*J6),easeInOutSine:e=>-.5*(Math.cos(U6*e)-1),easeInExpo:e=>e===0?0:2**(10*(e-1)),easeOutExpo:e=>e===1?1:-(2**(-10*e))+1,easeInOutExpo:e=>o8(e)?e:e<.5?.5*2**(10*(e*2-1)):.5*(-(2**(-10*(e*2-1)))+2),easeInCirc:e=>e>=1?e:-(Math.sqrt(1-e*e)-1),easeOutCirc:e=>Math.sqrt(1- --e*e),easeInOutCirc:e=>(e/=.5)<1?-.5*(Math.sqrt(1-e*e)-1):.5*(Math.sqrt(1-(e-=2)*e)+1),easeInElastic:e=>o8(e)?e:s8(e,.075,.3),easeOutElastic:e=>o8(e)?e:c8(e,.075,.3),easeInOutElastic(e){let t=.1125,n=.45;return o8(e)?e:e<.5?.5*s8(e*2,t,n):.5+.5*c8(e*2-1,t,n)},easeInBack(e){return e*e*(2.70158*e-1.70158)},easeOutBack(e){return--e*e*(2.70158*e+1.70158)+1},easeInOutBack(e){let t=1.70158;return(e/=.5)<1?.5*(e*e*(((t*=1.525)+1)*e-t)):.5*((e-=2)*e*(((t*=1.525)+1)*e+t)+2)},easeInBounce:e=>1-l8.easeOutBounce(1-e),easeOutBounce(e){let t=7.5625,n=2.75;return e<1/n?t*e*e:e<2/n?t*(e-=1.5/n)*e+.75:e<2.5/n?t*(e-=2.25/n)*e+.9375:t*(e-=2.625/n)*e+.984375},easeInOutBounce:e=>e<.5?l8.easeInBounce(e*2)*.5:l8.easeOutBounce(e*2-1)*.5+.5},u8=[`x`,`y`,`borderWidth`,`radius`,`tension`],d8=[`color`,`borderColor`,`backgroundColor`],f8=new Map,p8={values(e){return d3(e)?e:``+e},numeric(e,t,n){if(e===0)return`0`;let r=this.chart.options.locale,i,a=e;if(n.length>1){let t=Math.max(Math.abs(n[0].value),Math.abs(n[n.length-1].value));(t<1e-4||t>0x38d7ea4c68000)&&(i=`scientific`),a=Xle(e,n)}let o=Z6(Math.abs(a)),s=isNaN(o)?1:Math.max(Math.min(-1*Math.floor(o),20),0),c={notation:i,minimumFractionDigits:s,maximumFractionDigits:s};return Object.assign(c,this.options.ticks.format),U3(e,r,c)},logarithmic(e,t,n){if(e===0)return`0`;let r=n[t].significand||e/10**Math.floor(Z6(e));return[1,2,3,5,10,15].includes(r)||t>.8*n.length?p8.numeric.call(this,e,t,n):``}},m8={formatters:p8},h8=Object.create(null),g8=Object.create(null),_8=class{constructor(e,t){this.animation=void 0,this.backgroundColor=`rgba(0,0,0,0.1)`,this.borderColor=`rgba(0,0,0,0.1)`,this.color=`#666`,this.datasets={},this.devicePixelRatio=e=>e.chart.platform.getDevicePixelRatio(),this.elements={},this.events=[`mousemove`,`mouseout`,`click`,`touchstart`,`touchmove`],this.font={family:`'Helvetica Neue', 'Helvetica', 'Arial', sans-serif`,size:12,style:`normal`,lineHeight:1.2,weight:null},this.hover={},this.hoverBackgroundColor=(e,t)=>H3(t.backgroundColor),this.hoverBorderColor=(e,t)=>H3(t.borderColor),this.hoverColor=(e,t)=>H3(t.color),this.indexAxis=`x`,this.interaction={mode:`nearest`,intersect:!0,includeInvisible:!1},this.maintainAspectRatio=!0,this.onHover=null,this.onClick=null,this.parsing=!0,this.plugins={},this.responsive=!0,this.scale=void 0,this.scales={},this.showLine=!0,this.drawActiveElementsOnTop=!0,this.describe(e),this.apply(t)}set(e,t){return G3(this,e,t)}get(e){return W3(this,e)}describe(e,t){return G3(g8,e,t)}override(e,t){return G3(h8,e,t)}route(e,t,n,r){let i=W3(this,e),a=W3(this,n),o=`_`+t;Object.defineProperties(i,{[o]:{value:i[t],writable:!0},[t]:{enumerable:!0,get(){let e=this[o],t=a[r];return f3(e)?Object.assign({},t,e):h3(e,t)},set(e){this[o]=e}}})}apply(e){e.forEach(e=>e(this))}},v8=new _8({_scriptable:e=>!e.startsWith(`on`),_indexable:e=>e!==`events`,hover:{_fallback:`interaction`},interaction:{_scriptable:!1,_indexable:!1}},[qle,Jle,Zle]),y8=/^(normal|(\d+(?:\.\d+)?)(px|em|%)?)$/,b8=/^(normal|italic|initial|inherit|unset|(oblique( -?[0-9]?[0-9]deg)?))$/,x8=e=>+e||0,S8=(e,t)=>e?e+w3(t):t,C8=(e,t)=>f3(t)&&e!==`adapters`&&(Object.getPrototypeOf(t)===null||t.constructor===Object),w8=(e,t)=>e===!0?t:typeof e==`string`?C3(t,e):void 0,T8=2**-52||1e-14,E8=(e,t)=>t<e.length&&!e[t].skip&&e[t],D8=e=>e===`x`?`y`:`x`,O8=e=>e.ownerDocument.defaultView.getComputedStyle(e,null),k8=[`top`,`right`,`bottom`,`left`],A8=(e,t,n)=>(e>0||t>0)&&(!n||!n.shadowRoot),j8=e=>Math.round(e*10)/10,M8=function(){let e=!1;try{let t={get passive(){return e=!0,!1}};v6()&&(window.addEventListener(`test`,null,t),window.removeEventListener(`test`,null,t))}catch{}return e}(),N8=function(e,t){return{x(n){return e+e+t-n},setWidth(e){t=e},textAlign(e){return e===`center`?e:e===`right`?`left`:`right`},xPlus(e,t){return e-t},leftForLtr(e,t){return e-t}}},P8=function(){return{x(e){return e},setWidth(e){},textAlign(e){return e},xPlus(e,t){return e+t},leftForLtr(e,t){return e}}}}));function Fue(e,t){let n=[],r=Object.keys(t);for(let t=0;t<r.length;t++){let i=e[r[t]];i&&i.active()&&n.push(i.wait())}return Promise.all(n)}function Iue(e,t){if(!t)return;let n=e.options;if(!n){e.options=t;return}return n.$shared&&(e.options=n=Object.assign({},n,{$shared:!1,$animations:{}})),n}function F8(e,t){let n=e&&e.options||{},r=n.reverse,i=n.min===void 0?t:0,a=n.max===void 0?t:0;return{start:r?a:i,end:r?i:a}}function Lue(e,t,n){if(n===!1)return!1;let r=F8(e,n),i=F8(t,n);return{top:i.end,right:r.end,bottom:i.start,left:r.start}}function Rue(e){let t,n,r,i;return f3(e)?(t=e.top,n=e.right,r=e.bottom,i=e.left):t=n=r=i=e,{top:t,right:n,bottom:r,left:i,disabled:e===!1}}function I8(e,t){let n=[],r=e._getSortedDatasetMetas(t),i,a;for(i=0,a=r.length;i<a;++i)n.push(r[i].index);return n}function L8(e,t,n,r={}){let i=e.keys,a=r.mode===`single`,o,s,c,l;if(t===null)return;let u=!1;for(o=0,s=i.length;o<s;++o){if(c=+i[o],c===n){if(u=!0,r.all)continue;break}l=e.values[c],p3(l)&&(a||t===0||Q6(t)===Q6(l))&&(t+=l)}return!u&&!r.all?0:t}function zue(e,t){let{iScale:n,vScale:r}=t,i=n.axis===`x`?`x`:`y`,a=r.axis===`x`?`x`:`y`,o=Object.keys(e),s=Array(o.length),c,l,u;for(c=0,l=o.length;c<l;++c)u=o[c],s[c]={[i]:u,[a]:e[u]};return s}function R8(e,t){let n=e&&e.options.stacked;return n||n===void 0&&t.stack!==void 0}function Bue(e,t,n){return`${e.id}.${t.id}.${n.stack||n.type}`}function Vue(e){let{min:t,max:n,minDefined:r,maxDefined:i}=e.getUserBounds();return{min:r?t:-1/0,max:i?n:1/0}}function Hue(e,t,n){let r=e[t]||(e[t]={});return r[n]||(r[n]={})}function z8(e,t,n,r){for(let i of t.getMatchingVisibleMetas(r).reverse()){let t=e[i.index];if(n&&t>0||!n&&t<0)return i.index}return null}function B8(e,t){let{chart:n,_cachedMeta:r}=e,i=n._stacks||={},{iScale:a,vScale:o,index:s}=r,c=a.axis,l=o.axis,u=Bue(a,o,r),d=t.length,f;for(let e=0;e<d;++e){let n=t[e],{[c]:a,[l]:d}=n,p=n._stacks||={};f=p[l]=Hue(i,u,a),f[s]=d,f._top=z8(f,o,!0,r.type),f._bottom=z8(f,o,!1,r.type);let m=f._visualValues||={};m[s]=d}}function V8(e,t){let n=e.scales;return Object.keys(n).filter(e=>n[e].axis===t).shift()}function Uue(e,t){return s6(e,{active:!1,dataset:void 0,datasetIndex:t,index:t,mode:`default`,type:`dataset`})}function Wue(e,t,n){return s6(e,{active:!1,dataIndex:t,parsed:void 0,raw:void 0,element:n,index:t,mode:`default`,type:`data`})}function H8(e,t){let n=e.controller.index,r=e.vScale&&e.vScale.axis;if(r){t||=e._parsed;for(let e of t){let t=e._stacks;if(!t||t[r]===void 0||t[r][n]===void 0)return;delete t[r][n],t[r]._visualValues!==void 0&&t[r]._visualValues[n]!==void 0&&delete t[r]._visualValues[n]}}}function U8(){throw Error(`This method is not implemented: Check that a complete date adapter is provided.`)}function Gue(e,t,n,r){let{controller:i,data:a,_sorted:o}=e,s=i._cachedMeta.iScale,c=e.dataset&&e.dataset.options?e.dataset.options.spanGaps:null;if(s&&t===s.axis&&t!==`r`&&o&&a.length){let o=s._reversePixels?e8:$6;if(!r){let r=o(a,t,n);if(c){let{vScale:t}=i._cachedMeta,{_parsed:n}=e,a=n.slice(0,r.lo+1).reverse().findIndex(e=>!u3(e[t.axis]));r.lo-=Math.max(0,a);let o=n.slice(r.hi).findIndex(e=>!u3(e[t.axis]));r.hi+=Math.max(0,o)}return r}else if(i._sharedOptions){let e=a[0],r=typeof e.getRange==`function`&&e.getRange(t);if(r){let e=o(a,t,n-r),i=o(a,t,n+r);return{lo:e.lo,hi:i.hi}}}}return{lo:0,hi:a.length-1}}function W8(e,t,n,r,i){let a=e.getSortedVisibleDatasetMetas(),o=n[t];for(let e=0,n=a.length;e<n;++e){let{index:n,data:s}=a[e],{lo:c,hi:l}=Gue(a[e],t,o,i);for(let e=c;e<=l;++e){let t=s[e];t.skip||r(t,n,e)}}}function Kue(e){let t=e.indexOf(`x`)!==-1,n=e.indexOf(`y`)!==-1;return function(e,r){let i=t?Math.abs(e.x-r.x):0,a=n?Math.abs(e.y-r.y):0;return Math.sqrt(i**2+a**2)}}function G8(e,t,n,r,i){let a=[];return!i&&!e.isPointInArea(t)||W8(e,n,t,function(n,o,s){!i&&!Z3(n,e.chartArea,0)||n.inRange(t.x,t.y,r)&&a.push({element:n,datasetIndex:o,index:s})},!0),a}function que(e,t,n,r){let i=[];function a(e,n,a){let{startAngle:o,endAngle:s}=e.getProps([`startAngle`,`endAngle`],r),{angle:c}=Rle(e,{x:t.x,y:t.y});P3(c,o,s)&&i.push({element:e,datasetIndex:n,index:a})}return W8(e,n,t,a),i}function Jue(e,t,n,r,i,a){let o=[],s=Kue(n),c=1/0;function l(n,l,u){let d=n.inRange(t.x,t.y,i);if(r&&!d)return;let f=n.getCenterPoint(i);if(!(a||e.isPointInArea(f))&&!d)return;let p=s(t,f);p<c?(o=[{element:n,datasetIndex:l,index:u}],c=p):p===c&&o.push({element:n,datasetIndex:l,index:u})}return W8(e,n,t,l),o}function K8(e,t,n,r,i,a){return!a&&!e.isPointInArea(t)?[]:n===`r`&&!r?que(e,t,n,i):Jue(e,t,n,r,i,a)}function q8(e,t,n,r,i){let a=[],o=n===`x`?`inXRange`:`inYRange`,s=!1;return W8(e,n,t,(e,r,c)=>{e[o]&&e[o](t[n],i)&&(a.push({element:e,datasetIndex:r,index:c}),s||=e.inRange(t.x,t.y,i))}),r&&!s?[]:a}function J8(e,t){return e.filter(e=>e.pos===t)}function Y8(e,t){return e.filter(e=>y7.indexOf(e.pos)===-1&&e.box.axis===t)}function X8(e,t){return e.sort((e,n)=>{let r=t?n:e,i=t?e:n;return r.weight===i.weight?r.index-i.index:r.weight-i.weight})}function Yue(e){let t=[],n,r,i,a,o,s;for(n=0,r=(e||[]).length;n<r;++n)i=e[n],{position:a,options:{stack:o,stackWeight:s=1}}=i,t.push({index:n,box:i,pos:a,horizontal:i.isHorizontal(),weight:i.weight,stack:o&&a+o,stackWeight:s});return t}function Xue(e){let t={};for(let n of e){let{stack:e,pos:r,stackWeight:i}=n;if(!e||!y7.includes(r))continue;let a=t[e]||(t[e]={count:0,placed:0,weight:0,size:0});a.count++,a.weight+=i}return t}function Zue(e,t){let n=Xue(e),{vBoxMaxWidth:r,hBoxMaxHeight:i}=t,a,o,s;for(a=0,o=e.length;a<o;++a){s=e[a];let{fullSize:o}=s.box,c=n[s.stack],l=c&&s.stackWeight/c.weight;s.horizontal?(s.width=l?l*r:o&&t.availableWidth,s.height=i):(s.width=r,s.height=l?l*i:o&&t.availableHeight)}return n}function Que(e){let t=Yue(e),n=X8(t.filter(e=>e.box.fullSize),!0),r=X8(J8(t,`left`),!0),i=X8(J8(t,`right`)),a=X8(J8(t,`top`),!0),o=X8(J8(t,`bottom`)),s=Y8(t,`x`),c=Y8(t,`y`);return{fullSize:n,leftAndTop:r.concat(a),rightAndBottom:i.concat(c).concat(o).concat(s),chartArea:J8(t,`chartArea`),vertical:r.concat(i).concat(c),horizontal:a.concat(o).concat(s)}}function Z8(e,t,n,r){return Math.max(e[n],t[n])+Math.max(e[r],t[r])}function Q8(e,t){e.top=Math.max(e.top,t.top),e.left=Math.max(e.left,t.left),e.bottom=Math.max(e.bottom,t.bottom),e.right=Math.max(e.right,t.right)}function $ue(e,t,n,r){let{pos:i,box:a}=n,o=e.maxPadding;if(!f3(i)){n.size&&(e[i]-=n.size);let t=r[n.stack]||{size:0,count:1};t.size=Math.max(t.size,n.horizontal?a.height:a.width),n.size=t.size/t.count,e[i]+=n.size}a.getPadding&&Q8(o,a.getPadding());let s=Math.max(0,t.outerWidth-Z8(o,e,`left`,`right`)),c=Math.max(0,t.outerHeight-Z8(o,e,`top`,`bottom`)),l=s!==e.w,u=c!==e.h;return e.w=s,e.h=c,n.horizontal?{same:l,other:u}:{same:u,other:l}}function ede(e){let t=e.maxPadding;function n(n){let r=Math.max(t[n]-e[n],0);return e[n]+=r,r}e.y+=n(`top`),e.x+=n(`left`),n(`right`),n(`bottom`)}function tde(e,t){let n=t.maxPadding;function r(e){let r={left:0,top:0,right:0,bottom:0};return e.forEach(e=>{r[e]=Math.max(t[e],n[e])}),r}return r(e?[`left`,`right`]:[`top`,`bottom`])}function $8(e,t,n,r){let i=[],a,o,s,c,l,u;for(a=0,o=e.length,l=0;a<o;++a){s=e[a],c=s.box,c.update(s.width||t.w,s.height||t.h,tde(s.horizontal,t));let{same:o,other:d}=$ue(t,n,s,r);l|=o&&i.length,u||=d,c.fullSize||i.push(s)}return l&&$8(i,t,n,r)||u}function e5(e,t,n,r,i){e.top=n,e.left=t,e.right=t+r,e.bottom=n+i,e.width=r,e.height=i}function t5(e,t,n,r){let i=n.padding,{x:a,y:o}=t;for(let s of e){let e=s.box,c=r[s.stack]||{count:1,placed:0,weight:1},l=s.stackWeight/c.weight||1;if(s.horizontal){let r=t.w*l,a=c.size||e.height;B6(c.start)&&(o=c.start),e.fullSize?e5(e,i.left,o,n.outerWidth-i.right-i.left,a):e5(e,t.left+c.placed,o,r,a),c.start=o,c.placed+=r,o=e.bottom}else{let r=t.h*l,o=c.size||e.width;B6(c.start)&&(a=c.start),e.fullSize?e5(e,a,i.top,o,n.outerHeight-i.bottom-i.top):e5(e,a,t.top+c.placed,o,r),c.start=a,c.placed+=r,a=e.right}}t.x=a,t.y=o}function nde(e,t){let n=e.style,r=e.getAttribute(`height`),i=e.getAttribute(`width`);if(e[C7]={initial:{height:r,width:i,style:{display:n.display,height:n.height,width:n.width}}},n.display=n.display||`block`,n.boxSizing=n.boxSizing||`border-box`,T7(i)){let t=w6(e,`width`);t!==void 0&&(e.width=t)}if(T7(r))if(e.style.height===``)e.height=e.width/(t||2);else{let t=w6(e,`height`);t!==void 0&&(e.height=t)}return e}function rde(e,t,n){e&&e.addEventListener(t,n,E7)}function ide(e,t,n){e&&e.canvas&&e.canvas.removeEventListener(t,n,E7)}function ade(e,t){let n=w7[e.type]||e.type,{x:r,y:i}=S6(e,t);return{type:n,chart:t,native:e,x:r===void 0?null:r,y:i===void 0?null:i}}function n5(e,t){for(let n of e)if(n===t||n.contains(t))return!0}function ode(e,t,n){let r=e.canvas,i=new MutationObserver(e=>{let t=!1;for(let n of e)t||=n5(n.addedNodes,r),t&&=!n5(n.removedNodes,r);t&&n()});return i.observe(document,{childList:!0,subtree:!0}),i}function sde(e,t,n){let r=e.canvas,i=new MutationObserver(e=>{let t=!1;for(let n of e)t||=n5(n.removedNodes,r),t&&=!n5(n.addedNodes,r);t&&n()});return i.observe(document,{childList:!0,subtree:!0}),i}function r5(){let e=window.devicePixelRatio;e!==O7&&(O7=e,D7.forEach((t,n)=>{n.currentDevicePixelRatio!==e&&t()}))}function cde(e,t){D7.size||window.addEventListener(`resize`,r5),D7.set(e,t)}function lde(e){D7.delete(e),D7.size||window.removeEventListener(`resize`,r5)}function ude(e,t,n){let r=e.canvas,i=r&&y6(r);if(!i)return;let a=z3((e,t)=>{let r=i.clientWidth;n(e,t),r<i.clientWidth&&n()},window),o=new ResizeObserver(e=>{let t=e[0],n=t.contentRect.width,r=t.contentRect.height;n===0&&r===0||a(n,r)});return o.observe(i),cde(e,a),o}function i5(e,t,n){n&&n.disconnect(),t===`resize`&&lde(e)}function dde(e,t,n){let r=e.canvas,i=z3(t=>{e.ctx!==null&&n(ade(t,e))},e);return rde(r,t,i),i}function fde(e){return!v6()||typeof OffscreenCanvas<`u`&&e instanceof OffscreenCanvas?S7:k7}function pde(e,t){let n=e.options.ticks,r=mde(e),i=Math.min(n.maxTicksLimit||r,r),a=n.major.enabled?gde(t):[],o=a.length,s=a[0],c=a[o-1],l=[];if(o>i)return _de(t,l,a,o/i),l;let u=hde(a,t,i);if(o>0){let e,n,r=o>1?Math.round((c-s)/(o-1)):null;for(a5(t,l,u,u3(r)?0:s-r,s),e=0,n=o-1;e<n;e++)a5(t,l,u,a[e],a[e+1]);return a5(t,l,u,c,u3(r)?t.length:c+r),l}return a5(t,l,u),l}function mde(e){let t=e.options.offset,n=e._tickSize(),r=e._length/n+ +!t,i=e._maxLength/n;return Math.floor(Math.min(r,i))}function hde(e,t,n){let r=vde(e),i=t.length/n;if(!r)return Math.max(i,1);let a=Fle(r);for(let e=0,t=a.length-1;e<t;e++){let t=a[e];if(t>i)return t}return Math.max(i,1)}function gde(e){let t=[],n,r;for(n=0,r=e.length;n<r;n++)e[n].major&&t.push(n);return t}function _de(e,t,n,r){let i=0,a=n[0],o;for(r=Math.ceil(r),o=0;o<e.length;o++)o===a&&(t.push(e[o]),i++,a=n[i*r])}function a5(e,t,n,r,i){let a=h3(r,0),o=Math.min(h3(i,e.length),e.length),s=0,c,l,u;for(n=Math.ceil(n),i&&(c=i-r,n=c/Math.floor(c/n)),u=a;u<0;)s++,u=Math.round(a+s*n);for(l=Math.max(a,0);l<o;l++)l===u&&(t.push(e[l]),s++,u=Math.round(a+s*n))}function vde(e){let t=e.length,n,r;if(t<2)return!1;for(r=e[0],n=1;n<t;++n)if(e[n]-e[n-1]!==r)return!1;return r}function o5(e,t){let n=[],r=e.length/t,i=e.length,a=0;for(;a<i;a+=r)n.push(e[Math.floor(a)]);return n}function yde(e,t,n){let r=e.ticks.length,i=Math.min(t,r-1),a=e._startPixel,o=e._endPixel,s=1e-6,c=e.getPixelForTick(i),l;if(!(n&&(l=r===1?Math.max(c-a,o-c):t===0?(e.getPixelForTick(1)-c)/2:(c-e.getPixelForTick(i-1))/2,c+=i<t?l:-l,c<a-s||c>o+s)))return c}function bde(e,t){_3(e,e=>{let n=e.gc,r=n.length/2,i;if(r>t){for(i=0;i<r;++i)delete e.data[n[i]];n.splice(0,r)}})}function s5(e){return e.drawTicks?e.tickLength:0}function c5(e,t){if(!e.display)return 0;let n=a6(e.font,t),r=i6(e.padding);return(d3(e.text)?e.text.length:1)*n.lineHeight+r.height}function xde(e,t){return s6(e,{scale:t,type:`scale`})}function Sde(e,t,n){return s6(e,{tick:n,index:t,type:`tick`})}function Cde(e,t,n){let r=r8(e);return(n&&t!==`right`||!n&&t===`right`)&&(r=j7(r)),r}function wde(e,t,n,r){let{top:i,left:a,bottom:o,right:s,chart:c}=e,{chartArea:l,scales:u}=c,d=0,f,p,m,h=o-i,g=s-a;if(e.isHorizontal()){if(p=i8(r,a,s),f3(n)){let e=Object.keys(n)[0],r=n[e];m=u[e].getPixelForValue(r)+h-t}else m=n===`center`?(l.bottom+l.top)/2+h-t:M7(e,n,t);f=s-a}else{if(f3(n)){let e=Object.keys(n)[0],r=n[e];p=u[e].getPixelForValue(r)-g+t}else p=n===`center`?(l.left+l.right)/2-g+t:M7(e,n,t);m=i8(r,o,i),d=n===`left`?-J6:J6}return{titleX:p,titleY:m,maxWidth:f,rotation:d}}function Tde(e,t,n){let r=x3(Object.create(null),[n?v8.get(n):{},v8.get(t),e.defaults]);v8.set(t,r),e.defaultRoutes&&Ede(t,e.defaultRoutes),e.descriptors&&v8.describe(t,e.descriptors)}function Ede(e,t){Object.keys(t).forEach(n=>{let r=n.split(`.`),i=r.pop(),a=[e].concat(r).join(`.`),o=t[n].split(`.`),s=o.pop(),c=o.join(`.`);v8.route(a,i,c,s)})}function Dde(e){return`id`in e&&`defaults`in e}function Ode(e){let t={},n=[],r=Object.keys(L7.plugins.items);for(let e=0;e<r.length;e++)n.push(L7.getPlugin(r[e]));let i=e.plugins||[];for(let e=0;e<i.length;e++){let r=i[e];n.indexOf(r)===-1&&(n.push(r),t[r.id]=!0)}return{plugins:n,localIds:t}}function kde(e,t){return!t&&e===!1?null:e===!0?{}:e}function Ade(e,{plugins:t,localIds:n},r,i){let a=[],o=e.getContext();for(let s of t){let t=s.id,c=kde(r[t],i);c!==null&&a.push({plugin:s,options:jde(e.config,{plugin:s,local:n[t]},c,o)})}return a}function jde(e,{plugin:t,local:n},r,i){let a=e.pluginScopeKeys(t),o=e.getOptionScopes(r,a);return n&&t.defaults&&o.push(t.defaults),e.createResolver(o,i,[``],{scriptable:!1,indexable:!1,allKeys:!0})}function l5(e,t){let n=v8.datasets[e]||{};return((t.datasets||{})[e]||{}).indexAxis||t.indexAxis||n.indexAxis||`x`}function Mde(e,t){let n=e;return e===`_index_`?n=t:e===`_value_`&&(n=t===`x`?`y`:`x`),n}function Nde(e,t){return e===t?`_index_`:`_value_`}function u5(e){if(e===`x`||e===`y`||e===`r`)return e}function Pde(e){if(e===`top`||e===`bottom`)return`x`;if(e===`left`||e===`right`)return`y`}function d5(e,...t){if(u5(e))return e;for(let n of t){let t=n.axis||Pde(n.position)||e.length>1&&u5(e[0].toLowerCase());if(t)return t}throw Error(`Cannot determine type of '${e}' axis. Please provide 'axis' or 'position' option.`)}function f5(e,t,n){if(n[t+`AxisID`]===e)return{axis:t}}function Fde(e,t){if(t.data&&t.data.datasets){let n=t.data.datasets.filter(t=>t.xAxisID===e||t.yAxisID===e);if(n.length)return f5(e,`x`,n[0])||f5(e,`y`,n[0])}return{}}function Ide(e,t){let n=h8[e.type]||{scales:{}},r=t.scales||{},i=l5(e.type,t),a=Object.create(null);return Object.keys(r).forEach(t=>{let o=r[t];if(!f3(o))return console.error(`Invalid scale configuration for scale: ${t}`);if(o._proxy)return console.warn(`Ignoring resolver passed as options for scale: ${t}`);let s=d5(t,o,Fde(t,e),v8.scales[o.type]),c=Nde(s,i),l=n.scales||{};a[t]=S3(Object.create(null),[{axis:s},o,l[s],l[c]])}),e.data.datasets.forEach(n=>{let i=n.type||e.type,o=n.indexAxis||l5(i,t),s=(h8[i]||{}).scales||{};Object.keys(s).forEach(e=>{let t=Mde(e,o),i=n[t+`AxisID`]||t;a[i]=a[i]||Object.create(null),S3(a[i],[{axis:t},r[i],s[e]])})}),Object.keys(a).forEach(e=>{let t=a[e];S3(t,[v8.scales[t.type],v8.scale])}),a}function p5(e){let t=e.options||={};t.plugins=h3(t.plugins,{}),t.scales=Ide(e,t)}function m5(e){return e||={},e.datasets=e.datasets||[],e.labels=e.labels||[],e}function Lde(e){return e||={},e.data=m5(e.data),p5(e),e}function h5(e,t){let n=z7.get(e);return n||(n=t(),z7.set(e,n),B7.add(n)),n}function g5(e,t,n){let r=e.get(t);r||(r=new Map,e.set(t,r));let i=n.join(),a=r.get(i);return a||(a={resolver:c6(t,n),subPrefixes:n.filter(e=>!e.toLowerCase().includes(`hover`))},r.set(i,a)),a}function Rde(e,t){let{isScriptable:n,isIndexable:r}=u6(e);for(let i of t){let t=n(i),a=r(i),o=(a||t)&&e[i];if(t&&(V6(o)||U7(o))||a&&d3(o))return!0}return!1}function _5(e,t){return e===`top`||e===`bottom`||G7.indexOf(e)===-1&&t===`x`}function v5(e,t){return function(n,r){return n[e]===r[e]?n[t]-r[t]:n[e]-r[e]}}function y5(e){let t=e.chart,n=t.options.animation;t.notifyPlugins(`afterRender`),g3(n&&n.onComplete,[e],t)}function zde(e){let t=e.chart,n=t.options.animation;g3(n&&n.onProgress,[e],t)}function b5(e){return v6()&&typeof e==`string`?e=document.getElementById(e):e&&e.length&&(e=e[0]),e&&e.canvas&&(e=e.canvas),e}function Bde(e,t,n){let r=Object.keys(e);for(let i of r){let r=+i;if(r>=t){let a=e[i];delete e[i],(n>0||r>t)&&(e[r+n]=a)}}}function Vde(e,t,n,r){return!n||e.type===`mouseout`?null:r?t:e}function x5(){return _3(J7.instances,e=>e._plugins.invalidate())}function S5(e,t,n=t){e.lineCap=h3(n.borderCapStyle,t.borderCapStyle),e.setLineDash(h3(n.borderDash,t.borderDash)),e.lineDashOffset=h3(n.borderDashOffset,t.borderDashOffset),e.lineJoin=h3(n.borderJoinStyle,t.borderJoinStyle),e.lineWidth=h3(n.borderWidth,t.borderWidth),e.strokeStyle=h3(n.borderColor,t.borderColor)}function Hde(e,t,n){e.lineTo(n.x,n.y)}function Ude(e){return e.stepped?eue:e.tension||e.cubicInterpolationMode===`monotone`?tue:Hde}function C5(e,t,n={}){let r=e.length,{start:i=0,end:a=r-1}=n,{start:o,end:s}=t,c=Math.max(i,o),l=Math.min(a,s),u=i<o&&a<o||i>s&&a>s;return{count:r,start:c,loop:t.loop,ilen:l<c&&!u?r+l-c:l-c}}function Wde(e,t,n,r){let{points:i,options:a}=t,{count:o,start:s,loop:c,ilen:l}=C5(i,n,r),u=Ude(a),{move:d=!0,reverse:f}=r||{},p,m,h;for(p=0;p<=l;++p)m=i[(s+(f?l-p:p))%o],!m.skip&&(d?(e.moveTo(m.x,m.y),d=!1):u(e,h,m,f,a.stepped),h=m);return c&&(m=i[(s+(f?l:0))%o],u(e,h,m,f,a.stepped)),!!c}function Gde(e,t,n,r){let i=t.points,{count:a,start:o,ilen:s}=C5(i,n,r),{move:c=!0,reverse:l}=r||{},u=0,d=0,f,p,m,h,g,_,v=e=>(o+(l?s-e:e))%a,y=()=>{h!==g&&(e.lineTo(u,g),e.lineTo(u,h),e.lineTo(u,_))};for(c&&(p=i[v(0)],e.moveTo(p.x,p.y)),f=0;f<=s;++f){if(p=i[v(f)],p.skip)continue;let t=p.x,n=p.y,r=t|0;r===m?(n<h?h=n:n>g&&(g=n),u=(d*u+t)/++d):(y(),e.lineTo(t,n),m=r,d=0,h=g=n),_=n}y()}function w5(e){let t=e.options,n=t.borderDash&&t.borderDash.length;return!e._decimated&&!e._loop&&!t.tension&&t.cubicInterpolationMode!==`monotone`&&!t.stepped&&!n?Gde:Wde}function Kde(e){return e.stepped?Tue:e.tension||e.cubicInterpolationMode===`monotone`?Eue:T6}function qde(e,t,n,r){let i=t._path;i||(i=t._path=new Path2D,t.path(i,n,r)&&i.closePath()),S5(e,t.options),e.stroke(i)}function Jde(e,t,n,r){let{segments:i,options:a}=t,o=w5(t);for(let s of i)S5(e,a,s.style),e.beginPath(),o(e,t,s,{start:n,end:n+r-1})&&e.closePath(),e.stroke()}function Yde(e,t,n,r){Y7&&!t.options.segment?qde(e,t,n,r):Jde(e,t,n,r)}function T5(e,t,n,r){let i=e.options,{[n]:a}=e.getProps([n],r);return Math.abs(t-a)<i.radius+i.hitRadius}function Xde(e,t,n){let r=e.segments,i=e.points,a=t.points,o=[];for(let e of r){let{start:r,end:s}=e;s=D5(r,s,i);let c=E5(n,i[r],i[s],e.loop);if(!t.segments){o.push({source:e,target:c,start:i[r],end:i[s]});continue}let l=M6(t,c);for(let t of l){let r=E5(n,a[t.start],a[t.end],t.loop),s=j6(e,i,r);for(let e of s)o.push({source:e,target:t,start:{[n]:O5(c,r,`start`,Math.max)},end:{[n]:O5(c,r,`end`,Math.min)}})}}return o}function E5(e,t,n,r){if(r)return;let i=t[e],a=n[e];return e===`angle`&&(i=N3(i),a=N3(a)),{property:e,start:i,end:a}}function Zde(e,t){let{x:n=null,y:r=null}=e||{},i=t.points,a=[];return t.segments.forEach(({start:e,end:t})=>{t=D5(e,t,i);let o=i[e],s=i[t];r===null?n!==null&&(a.push({x:n,y:o.y}),a.push({x:n,y:s.y})):(a.push({x:o.x,y:r}),a.push({x:s.x,y:r}))}),a}function D5(e,t,n){for(;t>e;t--){let e=n[t];if(!isNaN(e.x)&&!isNaN(e.y))break}return t}function O5(e,t,n,r){return e&&t?r(e[n],t[n]):e?e[n]:t?t[n]:0}function k5(e,t){let n=[],r=!1;return d3(e)?(r=!0,n=e):n=Zde(e,t),n.length?new X7({points:n,options:{tension:0},_loop:r,_fullLoop:r}):null}function A5(e){return e&&e.fill!==!1}function Qde(e,t,n){let r=e[t].fill,i=[t],a;if(!n)return r;for(;r!==!1&&i.indexOf(r)===-1;){if(!p3(r))return r;if(a=e[r],!a)return!1;if(a.visible)return r;i.push(r),r=a.fill}return!1}function $de(e,t,n){let r=rfe(e);if(f3(r))return!isNaN(r.value)&&r;let i=parseFloat(r);return p3(i)&&Math.floor(i)===i?efe(r[0],t,i,n):[`origin`,`start`,`end`,`stack`,`shape`].indexOf(r)>=0&&r}function efe(e,t,n,r){return(e===`-`||e===`+`)&&(n=t+n),n===t||n<0||n>=r?!1:n}function tfe(e,t){let n=null;return e===`start`?n=t.bottom:e===`end`?n=t.top:f3(e)?n=t.getPixelForValue(e.value):t.getBasePixel&&(n=t.getBasePixel()),n}function nfe(e,t,n){let r;return r=e===`start`?n:e===`end`?t.options.reverse?t.min:t.max:f3(e)?e.value:t.getBaseValue(),r}function rfe(e){let t=e.options,n=t.fill,r=h3(n&&n.target,n);return r===void 0&&(r=!!t.backgroundColor),r===!1||r===null?!1:r===!0?`origin`:r}function ife(e){let{scale:t,index:n,line:r}=e,i=[],a=r.segments,o=r.points,s=afe(t,n);s.push(k5({x:null,y:t.bottom},r));for(let e=0;e<a.length;e++){let t=a[e];for(let e=t.start;e<=t.end;e++)ofe(i,o[e],s)}return new X7({points:i,options:{}})}function afe(e,t){let n=[],r=e.getMatchingVisibleMetas(`line`);for(let e=0;e<r.length;e++){let i=r[e];if(i.index===t)break;i.hidden||n.unshift(i.dataset)}return n}function ofe(e,t,n){let r=[];for(let i=0;i<n.length;i++){let a=n[i],{first:o,last:s,point:c}=sfe(a,t,`x`);if(!(!c||o&&s)){if(o)r.unshift(c);else if(e.push(c),!s)break}}e.push(...r)}function sfe(e,t,n){let r=e.interpolate(t,n);if(!r)return{};let i=r[n],a=e.segments,o=e.points,s=!1,c=!1;for(let e=0;e<a.length;e++){let t=a[e],r=o[t.start][n],l=o[t.end][n];if(I3(i,r,l)){s=i===r,c=i===l;break}}return{first:s,last:c,point:r}}function cfe(e){let{chart:t,fill:n,line:r}=e;if(p3(n))return lfe(t,n);if(n===`stack`)return ife(e);if(n===`shape`)return!0;let i=ufe(e);return i instanceof Q7?i:k5(i,r)}function lfe(e,t){let n=e.getDatasetMeta(t);return n&&e.isDatasetVisible(t)?n.dataset:null}function ufe(e){return(e.scale||{}).getPointPositionForValue?ffe(e):dfe(e)}function dfe(e){let{scale:t={},fill:n}=e,r=tfe(n,t);if(p3(r)){let e=t.isHorizontal();return{x:e?r:null,y:e?null:r}}return null}function ffe(e){let{scale:t,fill:n}=e,r=t.options,i=t.getLabels().length,a=r.reverse?t.max:t.min,o=nfe(n,t,a),s=[];if(r.grid.circular){let e=t.getPointPositionForValue(0,a);return new Q7({x:e.x,y:e.y,radius:t.getDistanceFromCenterForValue(o)})}for(let e=0;e<i;++e)s.push(t.getPointPositionForValue(e,o));return s}function j5(e,t,n){let r=cfe(t),{chart:i,index:a,line:o,scale:s,axis:c}=t,l=o.options,u=l.fill,d=l.backgroundColor,{above:f=d,below:p=d}=u||{},m=I6(i,i.getDatasetMeta(a));r&&o.points.length&&(Q3(e,n),pfe(e,{line:o,target:r,above:f,below:p,area:n,scale:s,axis:c,clip:m}),$3(e))}function pfe(e,t){let{line:n,target:r,above:i,below:a,area:o,scale:s,clip:c}=t,l=n._loop?`angle`:t.axis;e.save();let u=a;a!==i&&(l===`x`?(M5(e,r,o.top),P5(e,{line:n,target:r,color:i,scale:s,property:l,clip:c}),e.restore(),e.save(),M5(e,r,o.bottom)):l===`y`&&(N5(e,r,o.left),P5(e,{line:n,target:r,color:a,scale:s,property:l,clip:c}),e.restore(),e.save(),N5(e,r,o.right),u=i)),P5(e,{line:n,target:r,color:u,scale:s,property:l,clip:c}),e.restore()}function M5(e,t,n){let{segments:r,points:i}=t,a=!0,o=!1;e.beginPath();for(let s of r){let{start:r,end:c}=s,l=i[r],u=i[D5(r,c,i)];a?(e.moveTo(l.x,l.y),a=!1):(e.lineTo(l.x,n),e.lineTo(l.x,l.y)),o=!!t.pathSegment(e,s,{move:o}),o?e.closePath():e.lineTo(u.x,n)}e.lineTo(t.first().x,n),e.closePath(),e.clip()}function N5(e,t,n){let{segments:r,points:i}=t,a=!0,o=!1;e.beginPath();for(let s of r){let{start:r,end:c}=s,l=i[r],u=i[D5(r,c,i)];a?(e.moveTo(l.x,l.y),a=!1):(e.lineTo(n,l.y),e.lineTo(l.x,l.y)),o=!!t.pathSegment(e,s,{move:o}),o?e.closePath():e.lineTo(n,u.y)}e.lineTo(n,t.first().y),e.closePath(),e.clip()}function P5(e,t){let{line:n,target:r,property:i,color:a,scale:o,clip:s}=t,c=Xde(n,r,i);for(let{source:t,target:l,start:u,end:d}of c){let{style:{backgroundColor:c=a}={}}=t,f=r!==!0;e.save(),e.fillStyle=c,mfe(e,o,s,f&&E5(i,u,d)),e.beginPath();let p=!!n.pathSegment(e,t),m;if(f){p?e.closePath():F5(e,r,d,i);let t=!!r.pathSegment(e,l,{move:p,reverse:!0});m=p&&t,m||F5(e,r,u,i)}e.closePath(),e.fill(m?`evenodd`:`nonzero`),e.restore()}}function mfe(e,t,n,r){let i=t.chart.chartArea,{property:a,start:o,end:s}=r||{};if(a===`x`||a===`y`){let t,r,c,l;a===`x`?(t=o,r=i.top,c=s,l=i.bottom):(t=i.left,r=o,c=i.right,l=s),e.beginPath(),n&&(t=Math.max(t,n.left),c=Math.min(c,n.right),r=Math.max(r,n.top),l=Math.min(l,n.bottom)),e.rect(t,r,c-t,l-r),e.clip()}}function F5(e,t,n,r){let i=t.interpolate(n,r);i&&e.lineTo(i.x,i.y)}function hfe(e,t,n,r,i){return{itemWidth:gfe(r,e,t,n),itemHeight:_fe(i,r,t.lineHeight)}}function gfe(e,t,n,r){let i=e.text;return i&&typeof i!=`string`&&(i=i.reduce((e,t)=>e.length>t.length?e:t)),t+n.size/2+r.measureText(i).width}function _fe(e,t,n){let r=e;return typeof t.text!=`string`&&(r=I5(t,n)),r}function I5(e,t){return t*(e.text?e.text.length:0)}function vfe(e,t){return!!((e===`mousemove`||e===`mouseout`)&&(t.onHover||t.onLeave)||t.onClick&&(e===`click`||e===`mouseup`))}function yfe(e,t){let n=new i9({ctx:e.ctx,options:t,chart:e});b7.configure(e,n,t),b7.addBox(e,n),e.titleBlock=n}function L5(e,t){return t&&(d3(t)?Array.prototype.push.apply(e,t):e.push(t)),e}function R5(e){return(typeof e==`string`||e instanceof String)&&e.indexOf(`
+ `)])})),PZ,FZ,IZ=t((()=>{K(),I(),Y(),J(),jK(),NZ(),PZ=Object.assign(Object.assign({},zE.props),{code:Boolean,type:{type:String,default:`default`},delete:Boolean,strong:Boolean,italic:Boolean,underline:Boolean,depth:[String,Number],tag:String,as:{type:String,validator:()=>!0,default:void 0}}),FZ=j({name:`Text`,props:PZ,setup(e){let{mergedClsPrefixRef:t,inlineThemeDisabled:n}=l_(e),r=zE(`Typography`,`-text`,MZ,DK,e,t),i=F(()=>{let{depth:t,type:n}=e,i=n==="default"?t===void 0?`textColor`:`textColor${t}Depth`:L(`textColor`,n),{common:{fontWeightStrong:a,fontFamilyMono:o,cubicBezierEaseInOut:s},self:{codeTextColor:c,codeBorderRadius:l,codeColor:u,codeBorder:d,[i]:f}}=r.value;return{"--n-bezier":s,"--n-text-color":f,"--n-font-weight-strong":a,"--n-font-famliy-mono":o,"--n-code-border-radius":l,"--n-code-text-color":c,"--n-code-color":u,"--n-code-border":d}}),a=n?d_(`text`,F(()=>`${e.type[0]}${e.depth||``}`),i,e):void 0;return{mergedClsPrefix:t,compitableTag:Nf(e,[`as`,`tag`]),cssVars:n?void 0:i,themeClass:a?.themeClass,onRender:a?.onRender}},render(){var e,t;let{mergedClsPrefix:n}=this;(e=this.onRender)==null||e.call(this);let r=[`${n}-text`,this.themeClass,{[`${n}-text--code`]:this.code,[`${n}-text--delete`]:this.delete,[`${n}-text--strong`]:this.strong,[`${n}-text--italic`]:this.italic,[`${n}-text--underline`]:this.underline}],i=(t=this.$slots).default?.call(t);return this.code?N(`code`,{class:r,style:this.cssVars},this.delete?N(`del`,null,i):i):this.delete?N(`del`,{class:r,style:this.cssVars},i):N(this.compitableTag||`span`,{class:r,style:this.cssVars},i)}})})),LZ=t((()=>{I(),Y(),jK(),H(),kZ(),jZ(),IZ()})),RZ=t((()=>{G(),K(),I(),Y(),J(),IK(),RA(),FD(),H(),TA(),$J(),MD(),PM(),IX(),Ag()})),zZ=t((()=>{I(),og(),TA()})),BZ=t((()=>{K(),I(),Y(),J(),zK(),H()})),VZ=t((()=>{VE(),WA(),QA(),Rj(),Wj(),Xj(),nM(),oM(),mM(),PM(),FM(),sce(),ZL(),pce(),yce(),cR(),dR(),TR(),Dce(),MR(),FR(),Mce(),iB(),QV(),oH(),yH(),VH(),$H(),aU(),rB(),dU(),xU(),TU(),Tz(),rk(),EU(),RU(),WK(),GK(),wJ(),DJ(),OJ(),IJ(),HJ(),UJ(),Vz(),YJ(),$J(),eY(),Tj(),mY(),hY(),vY(),yY(),TY(),EY(),CH(),DY(),NY(),PY(),vX(),jH(),BH(),zH(),yX(),bX(),QR(),xX(),zk(),RR(),IX(),BX(),bz(),VX(),HX(),KX(),qR(),XX(),ZX(),_U(),QX(),nZ(),rZ(),iZ(),dZ(),_Z(),vZ(),eA(),yZ(),bZ(),ZV(),xZ(),wz(),SZ(),CZ(),wZ(),LZ(),RZ(),zZ(),BZ()})),HZ=t((()=>{I(),Q(),c_()})),UZ,WZ=t((()=>{UZ=()=>({})})),GZ,KZ=t((()=>{Q(),WZ(),GZ={name:`Equation`,common:Z,self:UZ}})),qZ=t((()=>{KZ(),WZ()})),JZ,YZ=t((()=>{Q(),JZ={name:`FloatButtonGroup`,common:Z,self(e){let{popoverColor:t,dividerColor:n,borderRadius:r}=e;return{color:t,buttonBorderColor:n,borderRadiusSquare:r,boxShadow:`0 2px 8px 0px rgba(0, 0, 0, .12)`}}}})),XZ=t((()=>{YZ(),BK()})),ZZ,QZ=t((()=>{DO(),Q(),NA(),ZA(),Lj(),Yj(),Uj(),tM(),aM(),pM(),VU(),DM(),KL(),XL(),eR(),sR(),iR(),uR(),OR(),gR(),jR(),yz(),yB(),aH(),pH(),qH(),iU(),iz(),uU(),bU(),wU(),dz(),$O(),qZ(),XZ(),UK(),YU(),QU(),VJ(),JJ(),Lz(),QJ(),iW(),uj(),fW(),hW(),wY(),bW(),SH(),CW(),MY(),EW(),NW(),AH(),vH(),RH(),BW(),ZR(),qW(),Ck(),LR(),$W(),zX(),hz(),nG(),lG(),UR(),YX(),mG(),gU(),yG(),tZ(),wG(),jG(),BK(),zG(),qG(),eK(),Gk(),aK(),fB(),uK(),lz(),hK(),CK(),bK(),jK(),IK(),zK(),ZZ={name:`dark`,common:Z,Alert:OA,Anchor:YA,AutoComplete:Fj,Avatar:Vj,AvatarGroup:qj,BackTop:$j,Badge:rM,Breadcrumb:dM,Button:TM,ButtonGroup:zU,Calendar:GL,Card:YL,Carousel:$L,Cascader:oR,Checkbox:rR,Code:lR,Collapse:hR,CollapseTransition:DR,ColorPicker:AR,DataTable:vz,DatePicker:_B,Descriptions:rH,Dialog:dH,Divider:GH,Drawer:nU,Dropdown:rz,DynamicInput:cU,DynamicTags:vU,Element:SU,Empty:QO,Ellipsis:uz,Equation:GZ,Flex:kU,Form:qU,GradientText:XU,Heatmap:zJ,Icon:Iz,IconWrapper:KJ,Image:XJ,Input:aj,InputNumber:$U,InputOtp:sW,LegacyTransfer:SY,Layout:uW,List:vW,LoadingBar:bH,Log:xW,Menu:jW,Mention:wW,Message:OH,Modal:gH,Notification:IH,PageHeader:RW,Pagination:XR,Popconfirm:GW,Popover:Sk,Popselect:IR,Progress:ZW,QrCode:LX,Radio:mz,Rate:eG,Result:sG,Row:pW,Scrollbar:EO,Select:HR,Skeleton:qX,Slider:fG,Space:mU,Spin:_G,Statistic:SG,Steps:kG,Switch:PG,Table:GG,Tabs:QG,Tag:Hk,Thing:rK,TimePicker:uB,Timeline:cK,Tooltip:sz,Transfer:pK,Tree:vK,TreeSelect:xK,Typography:kK,Upload:PK,Watermark:LK,Split:$X,FloatButton:VK,FloatButtonGroup:JZ,Marquee:AY}})),$Z=t((()=>{QZ(),DO(),Q(),NA(),ZA(),Lj(),Yj(),Uj(),tM(),aM(),pM(),VU(),DM(),KL(),XL(),eR(),sR(),iR(),uR(),OR(),gR(),jR(),yz(),yB(),aH(),pH(),qH(),iU(),iz(),uU(),bU(),wU(),dz(),$O(),qZ(),PU(),XZ(),UK(),YU(),QU(),VJ(),JJ(),Lz(),QJ(),iW(),lW(),uj(),fW(),hW(),wY(),bW(),SH(),CW(),MY(),EW(),NW(),AH(),vH(),RH(),BW(),ZR(),qW(),Ck(),LR(),$W(),zX(),hz(),nG(),lG(),UR(),YX(),mG(),gU(),yG(),tZ(),wG(),jG(),zG(),qG(),eK(),Gk(),aK(),fB(),uK(),lz(),hK(),CK(),bK(),jK(),IK(),zK()})),eQ=t((()=>{H(),VZ(),HZ(),SE(),VZ(),BK(),xE(),I(),Y(),J(),PM(),TR(),MR(),FR(),c_(),$H(),TU(),rk(),IJ(),Vz(),Tj(),zk(),_U(),DO(),Q(),NA(),ZA(),Lj(),Yj(),Uj(),tM(),aM(),pM(),VU(),DM(),KL(),XL(),eR(),sR(),iR(),uR(),OR(),gR(),jR(),yz(),yB(),aH(),pH(),qH(),iU(),iz(),uU(),bU(),wU(),dz(),$O(),qZ(),PU(),XZ(),UK(),YU(),QU(),VJ(),JJ(),Lz(),QJ(),iW(),lW(),uj(),fW(),hW(),wY(),bW(),SH(),CW(),MY(),EW(),NW(),AH(),vH(),RH(),BW(),ZR(),qW(),Ck(),LR(),$W(),zX(),hz(),nG(),lG(),UR(),YX(),mG(),gU(),yG(),tZ(),wG(),jG(),zG(),qG(),eK(),Gk(),aK(),fB(),uK(),lz(),hK(),CK(),bK(),jK(),IK(),zK(),$Z(),Mp(),K()}));function tQ(e){let t=h0.get(e);return t===void 0&&(t=new Intl.DateTimeFormat(`en-US`,{hour12:!1,timeZone:e,year:`numeric`,month:`2-digit`,day:`2-digit`,hour:`2-digit`,minute:`2-digit`,second:`2-digit`,era:`short`}),h0.set(e,t)),t}function nQ(e,t){let n=e.format(t).replace(/\u200E/g,``),[,r,i,a,o,s,c,l]=/(\d+)\/(\d+)\/(\d+) (AD|BC),? (\d+):(\d+):(\d+)/.exec(n);return[a,r,i,o,s,c,l]}function rQ(e,t){let n=e.formatToParts(t),r=[];for(let e=0;e<n.length;e++){let{type:t,value:i}=n[e],a=g0[t];t===`era`?r[a]=i:FQ(a)||(r[a]=parseInt(i,10))}return r}function iQ(e,t={}){let n=JSON.stringify([e,t]),r=y0[n];return r||(r=new Intl.ListFormat(e,t),y0[n]=r),r}function aQ(e,t={}){let n=JSON.stringify([e,t]),r=b0.get(n);return r===void 0&&(r=new Intl.DateTimeFormat(e,t),b0.set(n,r)),r}function oQ(e,t={}){let n=JSON.stringify([e,t]),r=x0.get(n);return r===void 0&&(r=new Intl.NumberFormat(e,t),x0.set(n,r)),r}function sQ(e,t={}){let{base:n,...r}=t,i=JSON.stringify([e,r]),a=S0.get(i);return a===void 0&&(a=new Intl.RelativeTimeFormat(e,t),S0.set(i,a)),a}function cQ(){return C0||(C0=new Intl.DateTimeFormat().resolvedOptions().locale,C0)}function lQ(e){let t=w0.get(e);return t===void 0&&(t=new Intl.DateTimeFormat(e).resolvedOptions(),w0.set(e,t)),t}function uQ(e){let t=T0.get(e);if(!t){let n=new Intl.Locale(e);t=`getWeekInfo`in n?n.getWeekInfo():n.weekInfo,`minimalDays`in t||(t={...k0,...t}),T0.set(e,t)}return t}function dQ(e){let t=e.indexOf(`-x-`);t!==-1&&(e=e.substring(0,t));let n=e.indexOf(`-u-`);if(n===-1)return[e];{let t,r;try{t=aQ(e).resolvedOptions(),r=e}catch{let i=e.substring(0,n);t=aQ(i).resolvedOptions(),r=i}let{numberingSystem:i,calendar:a}=t;return[r,i,a]}}function fQ(e,t,n){return n||t?(e.includes(`-u-`)||(e+=`-u`),n&&(e+=`-ca-${n}`),t&&(e+=`-nu-${t}`),e):e}function pQ(e){let t=[];for(let n=1;n<=12;n++){let r=h4.utc(2009,n,1);t.push(e(r))}return t}function mQ(e){let t=[];for(let n=1;n<=7;n++){let r=h4.utc(2016,11,13+n);t.push(e(r))}return t}function hQ(e,t,n,r){let i=e.listingMode();return i===`error`?null:i===`en`?n(t):r(t)}function gQ(e){return e.numberingSystem&&e.numberingSystem!==`latn`?!1:e.numberingSystem===`latn`||!e.locale||e.locale.startsWith(`en`)||lQ(e.locale).numberingSystem===`latn`}function _Q(e,t){if(FQ(e)||e===null)return t;if(e instanceof f0)return e;if(RQ(e)){let n=e.toLowerCase();return n==="default"?t:n===`local`||n===`system`?m0.instance:n===`utc`||n===`gmt`?M0.utcInstance:M0.parseSpecifier(n)||v0.create(e)}else if(IQ(e))return M0.instance(e);else if(typeof e==`object`&&`offset`in e&&typeof e.offset==`function`)return e;else return new N0(e)}function vQ(e){let t=parseInt(e,10);if(isNaN(t)){t=``;for(let n=0;n<e.length;n++){let r=e.charCodeAt(n);if(e[n].search(P0.hanidec)!==-1)t+=I0.indexOf(e[n]);else for(let e in F0){let[n,i]=F0[e];r>=n&&r<=i&&(t+=r-n)}}return parseInt(t,10)}else return t}function yQ(){L0.clear()}function bQ({numberingSystem:e},t=``){let n=e||`latn`,r=L0.get(n);r===void 0&&(r=new Map,L0.set(n,r));let i=r.get(t);return i===void 0&&(i=RegExp(`${P0[n]}${t}`),r.set(t,i)),i}function xQ(e,t){return new q0(`unit out of range`,`you specified ${t} (of type ${typeof t}) as a ${e}, which is invalid`)}function SQ(e,t,n){let r=new Date(Date.UTC(e,t-1,n));e<100&&e>=0&&r.setUTCFullYear(r.getUTCFullYear()-1900);let i=r.getUTCDay();return i===0?7:i}function CQ(e,t,n){return n+(e$(e)?Y0:J0)[t-1]}function wQ(e,t){let n=e$(e)?Y0:J0,r=n.findIndex(e=>e<t),i=t-n[r];return{month:r+1,day:i}}function TQ(e,t){return(e-t+7)%7+1}function EQ(e,t=4,n=1){let{year:r,month:i,day:a}=e,o=CQ(r,i,a),s=TQ(SQ(r,i,a),n),c=Math.floor((o-s+14-t)/7),l;return c<1?(l=r-1,c=a$(l,t,n)):c>a$(r,t,n)?(l=r+1,c=1):l=r,{weekYear:l,weekNumber:c,weekday:s,...f$(e)}}function DQ(e,t=4,n=1){let{weekYear:r,weekNumber:i,weekday:a}=e,o=TQ(SQ(r,1,t),n),s=t$(r),c=i*7+a-o-7+t,l;c<1?(l=r-1,c+=t$(l)):c>s?(l=r+1,c-=t$(r)):l=r;let{month:u,day:d}=wQ(l,c);return{year:l,month:u,day:d,...f$(e)}}function OQ(e){let{year:t,month:n,day:r}=e;return{year:t,ordinal:CQ(t,n,r),...f$(e)}}function kQ(e){let{year:t,ordinal:n}=e,{month:r,day:i}=wQ(t,n);return{year:t,month:r,day:i,...f$(e)}}function AQ(e,t){if(!FQ(e.localWeekday)||!FQ(e.localWeekNumber)||!FQ(e.localWeekYear)){if(!FQ(e.weekday)||!FQ(e.weekNumber)||!FQ(e.weekYear))throw new R1(`Cannot mix locale-based week fields with ISO-based week fields`);return FQ(e.localWeekday)||(e.weekday=e.localWeekday),FQ(e.localWeekNumber)||(e.weekNumber=e.localWeekNumber),FQ(e.localWeekYear)||(e.weekYear=e.localWeekYear),delete e.localWeekday,delete e.localWeekNumber,delete e.localWeekYear,{minDaysInFirstWeek:t.getMinDaysInFirstWeek(),startOfWeek:t.getStartOfWeek()}}else return{minDaysInFirstWeek:4,startOfWeek:1}}function jQ(e,t=4,n=1){let r=LQ(e.weekYear),i=qQ(e.weekNumber,1,a$(e.weekYear,t,n)),a=qQ(e.weekday,1,7);return r?i?!a&&xQ(`weekday`,e.weekday):xQ(`week`,e.weekNumber):xQ(`weekYear`,e.weekYear)}function MQ(e){let t=LQ(e.year),n=qQ(e.ordinal,1,t$(e.year));return t?!n&&xQ(`ordinal`,e.ordinal):xQ(`year`,e.year)}function NQ(e){let t=LQ(e.year),n=qQ(e.month,1,12),r=qQ(e.day,1,n$(e.year,e.month));return t?n?!r&&xQ(`day`,e.day):xQ(`month`,e.month):xQ(`year`,e.year)}function PQ(e){let{hour:t,minute:n,second:r,millisecond:i}=e,a=qQ(t,0,23)||t===24&&n===0&&r===0&&i===0,o=qQ(n,0,59),s=qQ(r,0,59),c=qQ(i,0,999);return a?o?s?!c&&xQ(`millisecond`,i):xQ(`second`,r):xQ(`minute`,n):xQ(`hour`,t)}function FQ(e){return e===void 0}function IQ(e){return typeof e==`number`}function LQ(e){return typeof e==`number`&&e%1==0}function RQ(e){return typeof e==`string`}function zQ(e){return Object.prototype.toString.call(e)===`[object Date]`}function BQ(){try{return typeof Intl<`u`&&!!Intl.RelativeTimeFormat}catch{return!1}}function VQ(){try{return typeof Intl<`u`&&!!Intl.Locale&&(`weekInfo`in Intl.Locale.prototype||`getWeekInfo`in Intl.Locale.prototype)}catch{return!1}}function HQ(e){return Array.isArray(e)?e:[e]}function UQ(e,t,n){if(e.length!==0)return e.reduce((e,r)=>{let i=[t(r),r];return e&&n(e[0],i[0])===e[0]?e:i},null)[1]}function WQ(e,t){return t.reduce((t,n)=>(t[n]=e[n],t),{})}function GQ(e,t){return Object.prototype.hasOwnProperty.call(e,t)}function KQ(e){if(e==null)return null;if(typeof e!=`object`)throw new B1(`Week settings must be an object`);if(!qQ(e.firstDay,1,7)||!qQ(e.minimalDays,1,7)||!Array.isArray(e.weekend)||e.weekend.some(e=>!qQ(e,1,7)))throw new B1(`Invalid week settings`);return{firstDay:e.firstDay,minimalDays:e.minimalDays,weekend:Array.from(e.weekend)}}function qQ(e,t,n){return LQ(e)&&e>=t&&e<=n}function JQ(e,t){return e-t*Math.floor(e/t)}function YQ(e,t=2){let n=e<0,r;return r=n?`-`+(``+-e).padStart(t,`0`):(``+e).padStart(t,`0`),r}function XQ(e){if(!(FQ(e)||e===null||e===``))return parseInt(e,10)}function ZQ(e){if(!(FQ(e)||e===null||e===``))return parseFloat(e)}function QQ(e){if(!(FQ(e)||e===null||e===``)){let t=parseFloat(`0.`+e)*1e3;return Math.floor(t)}}function $Q(e,t,n=`round`){let r=10**t;switch(n){case`expand`:return e>0?Math.ceil(e*r)/r:Math.floor(e*r)/r;case`trunc`:return Math.trunc(e*r)/r;case`round`:return Math.round(e*r)/r;case`floor`:return Math.floor(e*r)/r;case`ceil`:return Math.ceil(e*r)/r;default:throw RangeError(`Value rounding ${n} is out of range`)}}function e$(e){return e%4==0&&(e%100!=0||e%400==0)}function t$(e){return e$(e)?366:365}function n$(e,t){let n=JQ(t-1,12)+1,r=e+(t-n)/12;return n===2?e$(r)?29:28:[31,null,31,30,31,30,31,31,30,31,30,31][n-1]}function r$(e){let t=Date.UTC(e.year,e.month-1,e.day,e.hour,e.minute,e.second,e.millisecond);return e.year<100&&e.year>=0&&(t=new Date(t),t.setUTCFullYear(e.year,e.month-1,e.day)),+t}function i$(e,t,n){return-TQ(SQ(e,1,t),n)+t-1}function a$(e,t=4,n=1){let r=i$(e,t,n),i=i$(e+1,t,n);return(t$(e)-r+i)/7}function o$(e){return e>99?e:e>K0.twoDigitCutoffYear?1900+e:2e3+e}function s$(e,t,n,r=null){let i=new Date(e),a={hourCycle:`h23`,year:`numeric`,month:`2-digit`,day:`2-digit`,hour:`2-digit`,minute:`2-digit`};r&&(a.timeZone=r);let o={timeZoneName:t,...a},s=new Intl.DateTimeFormat(n,o).formatToParts(i).find(e=>e.type.toLowerCase()===`timezonename`);return s?s.value:null}function c$(e,t){let n=parseInt(e,10);Number.isNaN(n)&&(n=0);let r=parseInt(t,10)||0,i=n<0||Object.is(n,-0)?-r:r;return n*60+i}function l$(e){let t=Number(e);if(typeof e==`boolean`||e===``||!Number.isFinite(t))throw new B1(`Invalid unit value ${e}`);return t}function u$(e,t){let n={};for(let r in e)if(GQ(e,r)){let i=e[r];if(i==null)continue;n[t(r)]=l$(i)}return n}function d$(e,t){let n=Math.trunc(Math.abs(e/60)),r=Math.trunc(Math.abs(e%60)),i=e>=0?`+`:`-`;switch(t){case`short`:return`${i}${YQ(n,2)}:${YQ(r,2)}`;case`narrow`:return`${i}${n}${r>0?`:${r}`:``}`;case`techie`:return`${i}${YQ(n,2)}${YQ(r,2)}`;default:throw RangeError(`Value format ${t} is out of range for property format`)}}function f$(e){return WQ(e,[`hour`,`minute`,`second`,`millisecond`])}function p$(e){switch(e){case`narrow`:return[...Q0];case`short`:return[...Z0];case`long`:return[...X0];case`numeric`:return[`1`,`2`,`3`,`4`,`5`,`6`,`7`,`8`,`9`,`10`,`11`,`12`];case`2-digit`:return[`01`,`02`,`03`,`04`,`05`,`06`,`07`,`08`,`09`,`10`,`11`,`12`];default:return null}}function m$(e){switch(e){case`narrow`:return[...t2];case`short`:return[...e2];case`long`:return[...$0];case`numeric`:return[`1`,`2`,`3`,`4`,`5`,`6`,`7`];default:return null}}function h$(e){switch(e){case`narrow`:return[...a2];case`short`:return[...i2];case`long`:return[...r2];default:return null}}function g$(e){return n2[e.hour<12?0:1]}function _$(e,t){return m$(t)[e.weekday-1]}function v$(e,t){return p$(t)[e.month-1]}function y$(e,t){return h$(t)[e.year<0?0:1]}function b$(e,t,n=`always`,r=!1){let i={years:[`year`,`yr.`],quarters:[`quarter`,`qtr.`],months:[`month`,`mo.`],weeks:[`week`,`wk.`],days:[`day`,`day`,`days`],hours:[`hour`,`hr.`],minutes:[`minute`,`min.`],seconds:[`second`,`sec.`]},a=[`hours`,`minutes`,`seconds`].indexOf(e)===-1;if(n===`auto`&&a){let n=e===`days`;switch(t){case 1:return n?`tomorrow`:`next ${i[e][0]}`;case-1:return n?`yesterday`:`last ${i[e][0]}`;case 0:return n?`today`:`this ${i[e][0]}`}}let o=Object.is(t,-0)||t<0,s=Math.abs(t),c=s===1,l=i[e],u=r?c?l[1]:l[2]||l[1]:c?i[e][0]:e;return o?`${s} ${u} ago`:`in ${s} ${u}`}function x$(e,t){let n=``;for(let r of e)r.literal?n+=r.val:n+=t(r.val);return n}function S$(...e){let t=e.reduce((e,t)=>e+t.source,``);return RegExp(`^${t}$`)}function C$(...e){return t=>e.reduce(([e,n,r],i)=>{let[a,o,s]=i(t,r);return[{...e,...a},o||n,s]},[{},null,1]).slice(0,2)}function w$(e,...t){if(e==null)return[null,null];for(let[n,r]of t){let t=n.exec(e);if(t)return r(t)}return[null,null]}function T$(...e){return(t,n)=>{let r={},i;for(i=0;i<e.length;i++)r[e[i]]=XQ(t[n+i]);return[r,null,n+i]}}function E$(e,t,n){let r=e[t];return FQ(r)?n:XQ(r)}function D$(e,t){return[{year:E$(e,t),month:E$(e,t+1,1),day:E$(e,t+2,1)},null,t+3]}function O$(e,t){return[{hours:E$(e,t,0),minutes:E$(e,t+1,0),seconds:E$(e,t+2,0),milliseconds:QQ(e[t+3])},null,t+4]}function k$(e,t){let n=!e[t]&&!e[t+1],r=c$(e[t+1],e[t+2]);return[{},n?null:M0.instance(r),t+3]}function A$(e,t){return[{},e[t]?v0.create(e[t]):null,t+1]}function j$(e){let[t,n,r,i,a,o,s,c,l]=e,u=t[0]===`-`,d=c&&c[0]===`-`,f=(e,t=!1)=>e!==void 0&&(t||e&&u)?-e:e;return[{years:f(ZQ(n)),months:f(ZQ(r)),weeks:f(ZQ(i)),days:f(ZQ(a)),hours:f(ZQ(o)),minutes:f(ZQ(s)),seconds:f(ZQ(c),c===`-0`),milliseconds:f(QQ(l),d)}]}function M$(e,t,n,r,i,a,o){let s={year:t.length===2?o$(XQ(t)):XQ(t),month:Z0.indexOf(n)+1,day:XQ(r),hour:XQ(i),minute:XQ(a)};return o&&(s.second=XQ(o)),e&&(s.weekday=e.length>3?$0.indexOf(e)+1:e2.indexOf(e)+1),s}function N$(e){let[,t,n,r,i,a,o,s,c,l,u,d]=e,f=M$(t,i,r,n,a,o,s),p;return p=c?w2[c]:l?0:c$(u,d),[f,new M0(p)]}function P$(e){return e.replace(/\([^()]*\)|[\n\t]/g,` `).replace(/(\s\s+)/g,` `).trim()}function F$(e){let[,t,n,r,i,a,o,s]=e;return[M$(t,i,r,n,a,o,s),M0.utcInstance]}function I$(e){let[,t,n,r,i,a,o,s]=e;return[M$(t,s,n,r,i,a,o),M0.utcInstance]}function L$(e){return w$(e,[k2,N2],[A2,P2],[j2,F2],[M2,I2])}function R$(e){return w$(P$(e),[T2,N$])}function z$(e){return w$(e,[E2,F$],[D2,F$],[O2,I$])}function B$(e){return w$(e,[C2,j$])}function V$(e){return w$(e,[S2,L2])}function H$(e){return w$(e,[R2,N2],[z2,B2])}function U$(e,t,n=!1){let r={values:n?t.values:{...e.values,...t.values||{}},loc:e.loc.clone(t.loc),conversionAccuracy:t.conversionAccuracy||e.conversionAccuracy,matrix:t.matrix||e.matrix};return new Y2(r)}function W$(e,t){let n=t.milliseconds??0;for(let r of J2.slice(1))t[r]&&(n+=t[r]*e[r].milliseconds);return n}function G$(e,t){let n=W$(e,t)<0?-1:1;q2.reduceRight((r,i)=>{if(FQ(t[i]))return r;if(r){let a=t[r]*n,o=e[i][r],s=Math.floor(a/o);t[i]+=s*n,t[r]-=s*o*n}return i},null),q2.reduce((n,r)=>{if(FQ(t[r]))return n;if(n){let i=t[n]%1;t[n]-=i,t[r]+=i*e[n][r]}return r},null)}function K$(e){let t={};for(let[n,r]of Object.entries(e))r!==0&&(t[n]=r);return t}function q$(e,t){return!e||!e.isValid?Z2.invalid(`missing or invalid start`):!t||!t.isValid?Z2.invalid(`missing or invalid end`):t<e?Z2.invalid(`end before start`,`The end of an interval must be after its start, but you had start=${e.toISO()} and end=${t.toISO()}`):null}function J$(e,t){let n=e=>e.toUTC(0,{keepLocalTime:!0}).startOf(`day`).valueOf(),r=n(t)-n(e);return Math.floor(Y2.fromMillis(r).as(`days`))}function Y$(e,t,n){let r=[[`years`,(e,t)=>t.year-e.year],[`quarters`,(e,t)=>t.quarter-e.quarter+(t.year-e.year)*4],[`months`,(e,t)=>t.month-e.month+(t.year-e.year)*12],[`weeks`,(e,t)=>{let n=J$(e,t);return(n-n%7)/7}],[`days`,J$]],i={},a=e,o,s;for(let[c,l]of r)n.indexOf(c)>=0&&(o=c,i[c]=l(e,t),s=a.plus(i),s>t?(i[c]--,e=a.plus(i),e>t&&(s=e,i[c]--,e=a.plus(i))):e=s);return[e,i,s,o]}function X$(e,t,n,r){let[i,a,o,s]=Y$(e,t,n),c=t-i,l=n.filter(e=>[`hours`,`minutes`,`seconds`,`milliseconds`].indexOf(e)>=0);l.length===0&&(o<t&&(o=i.plus({[s]:1})),o!==i&&(a[s]=(a[s]||0)+c/(o-i)));let u=Y2.fromObject(a,r);return l.length>0?Y2.fromMillis(c,r).shiftTo(...l).plus(u):u}function Z$(e,t=e=>e){return{regex:e,deser:([e])=>t(vQ(e))}}function Q$(e){return e.replace(/\./g,`\\.?`).replace(t4,e4)}function $$(e){return e.replace(/\./g,``).replace(t4,` `).toLowerCase()}function e1(e,t){return e===null?null:{regex:RegExp(e.map(Q$).join(`|`)),deser:([n])=>e.findIndex(e=>$$(n)===$$(e))+t}}function t1(e,t){return{regex:e,deser:([,e,t])=>c$(e,t),groups:t}}function n1(e){return{regex:e,deser:([e])=>e}}function r1(e){return e.replace(/[\-\[\]{}()*+?.,\\\^$|#\s]/g,`\\$&`)}function i1(e,t){let n=bQ(t),r=bQ(t,`{2}`),i=bQ(t,`{3}`),a=bQ(t,`{4}`),o=bQ(t,`{6}`),s=bQ(t,`{1,2}`),c=bQ(t,`{1,3}`),l=bQ(t,`{1,6}`),u=bQ(t,`{1,9}`),d=bQ(t,`{2,4}`),f=bQ(t,`{4,6}`),p=e=>({regex:RegExp(r1(e.val)),deser:([e])=>e,literal:!0}),m=(m=>{if(e.literal)return p(m);switch(m.val){case`G`:return e1(t.eras(`short`),0);case`GG`:return e1(t.eras(`long`),0);case`y`:return Z$(l);case`yy`:return Z$(d,o$);case`yyyy`:return Z$(a);case`yyyyy`:return Z$(f);case`yyyyyy`:return Z$(o);case`M`:return Z$(s);case`MM`:return Z$(r);case`MMM`:return e1(t.months(`short`,!0),1);case`MMMM`:return e1(t.months(`long`,!0),1);case`L`:return Z$(s);case`LL`:return Z$(r);case`LLL`:return e1(t.months(`short`,!1),1);case`LLLL`:return e1(t.months(`long`,!1),1);case`d`:return Z$(s);case`dd`:return Z$(r);case`o`:return Z$(c);case`ooo`:return Z$(i);case`HH`:return Z$(r);case`H`:return Z$(s);case`hh`:return Z$(r);case`h`:return Z$(s);case`mm`:return Z$(r);case`m`:return Z$(s);case`q`:return Z$(s);case`qq`:return Z$(r);case`s`:return Z$(s);case`ss`:return Z$(r);case`S`:return Z$(c);case`SSS`:return Z$(i);case`u`:return n1(u);case`uu`:return n1(s);case`uuu`:return Z$(n);case`a`:return e1(t.meridiems(),0);case`kkkk`:return Z$(a);case`kk`:return Z$(d,o$);case`W`:return Z$(s);case`WW`:return Z$(r);case`E`:case`c`:return Z$(n);case`EEE`:return e1(t.weekdays(`short`,!1),1);case`EEEE`:return e1(t.weekdays(`long`,!1),1);case`ccc`:return e1(t.weekdays(`short`,!0),1);case`cccc`:return e1(t.weekdays(`long`,!0),1);case`Z`:case`ZZ`:return t1(RegExp(`([+-]${s.source})(?::(${r.source}))?`),2);case`ZZZ`:return t1(RegExp(`([+-]${s.source})(${r.source})?`),2);case`z`:return n1(/[a-z_+-/]{1,256}?/i);case` `:return n1(/[^\S\n\r]/);default:return p(m)}})(e)||{invalidReason:$2};return m.token=e,m}function a1(e,t,n){let{type:r,value:i}=e;if(r===`literal`){let e=/^\s+$/.test(i);return{literal:!e,val:e?` `:i}}let a=t[r],o=r;r===`hour`&&(o=t.hour12==null?t.hourCycle==null?n.hour12?`hour12`:`hour24`:t.hourCycle===`h11`||t.hourCycle===`h12`?`hour12`:`hour24`:t.hour12?`hour12`:`hour24`);let s=n4[o];if(typeof s==`object`&&(s=s[a]),s)return{literal:!1,val:s}}function o1(e){return[`^${e.map(e=>e.regex).reduce((e,t)=>`${e}(${t.source})`,``)}$`,e]}function s1(e,t,n){let r=e.match(t);if(r){let e={},t=1;for(let i in n)if(GQ(n,i)){let a=n[i],o=a.groups?a.groups+1:1;!a.literal&&a.token&&(e[a.token.val[0]]=a.deser(r.slice(t,t+o))),t+=o}return[r,e]}else return[r,{}]}function c1(e){let t=e=>{switch(e){case`S`:return`millisecond`;case`s`:return`second`;case`m`:return`minute`;case`h`:case`H`:return`hour`;case`d`:return`day`;case`o`:return`ordinal`;case`L`:case`M`:return`month`;case`y`:return`year`;case`E`:case`c`:return`weekday`;case`W`:return`weekNumber`;case`k`:return`weekYear`;case`q`:return`quarter`;default:return null}},n=null,r;return FQ(e.z)||(n=v0.create(e.z)),FQ(e.Z)||(n||=new M0(e.Z),r=e.Z),FQ(e.q)||(e.M=(e.q-1)*3+1),FQ(e.h)||(e.h<12&&e.a===1?e.h+=12:e.h===12&&e.a===0&&(e.h=0)),e.G===0&&e.y&&(e.y=-e.y),FQ(e.u)||(e.S=QQ(e.u)),[Object.keys(e).reduce((n,r)=>{let i=t(r);return i&&(n[i]=e[r]),n},{}),n,r]}function l1(){return r4||=h4.fromMillis(1555555555555),r4}function u1(e,t){if(e.literal)return e;let n=m1(s2.macroTokenToFormatOpts(e.val),t);return n==null||n.includes(void 0)?e:n}function d1(e,t){return Array.prototype.concat(...e.map(e=>u1(e,t)))}function f1(e,t,n){return new i4(e,n).explainFromTokens(t)}function p1(e,t,n){let{result:r,zone:i,specificOffset:a,invalidReason:o}=f1(e,t,n);return[r,i,a,o]}function m1(e,t){if(!e)return null;let n=s2.create(t,e).dtFormatter(l1()),r=n.formatToParts(),i=n.resolvedOptions();return r.map(t=>a1(t,e,i))}function h1(e){return new q0(`unsupported zone`,`the zone "${e.name}" is not supported`)}function g1(e){return e.weekData===null&&(e.weekData=EQ(e.c)),e.weekData}function _1(e){return e.localWeekData===null&&(e.localWeekData=EQ(e.c,e.loc.getMinDaysInFirstWeek(),e.loc.getStartOfWeek())),e.localWeekData}function v1(e,t){let n={ts:e.ts,zone:e.zone,c:e.c,o:e.o,loc:e.loc,invalid:e.invalid};return new h4({...n,...t,old:n})}function y1(e,t,n){let r=e-t*60*1e3,i=n.offset(r);if(t===i)return[r,t];r-=(i-t)*60*1e3;let a=n.offset(r);return i===a?[r,i]:[e-Math.min(i,a)*60*1e3,Math.max(i,a)]}function b1(e,t){e+=t*60*1e3;let n=new Date(e);return{year:n.getUTCFullYear(),month:n.getUTCMonth()+1,day:n.getUTCDate(),hour:n.getUTCHours(),minute:n.getUTCMinutes(),second:n.getUTCSeconds(),millisecond:n.getUTCMilliseconds()}}function x1(e,t,n){return y1(r$(e),t,n)}function S1(e,t){let n=e.o,r=e.c.year+Math.trunc(t.years),i=e.c.month+Math.trunc(t.months)+Math.trunc(t.quarters)*3,a={...e.c,year:r,month:i,day:Math.min(e.c.day,n$(r,i))+Math.trunc(t.days)+Math.trunc(t.weeks)*7},o=Y2.fromObject({years:t.years-Math.trunc(t.years),quarters:t.quarters-Math.trunc(t.quarters),months:t.months-Math.trunc(t.months),weeks:t.weeks-Math.trunc(t.weeks),days:t.days-Math.trunc(t.days),hours:t.hours,minutes:t.minutes,seconds:t.seconds,milliseconds:t.milliseconds}).as(`milliseconds`),[s,c]=y1(r$(a),n,e.zone);return o!==0&&(s+=o,c=e.zone.offset(s)),{ts:s,o:c}}function C1(e,t,n,r,i,a){let{setZone:o,zone:s}=n;if(e&&Object.keys(e).length!==0||t){let r=t||s,i=h4.fromObject(e,{...n,zone:r,specificOffset:a});return o?i:i.setZone(s)}else return h4.invalid(new q0(`unparsable`,`the input "${i}" can't be parsed as ${r}`))}function w1(e,t,n=!0){return e.isValid?s2.create(A0.create(`en-US`),{allowZ:n,forceSimple:!0}).formatDateTimeFromString(e,t):null}function T1(e,t,n){let r=e.c.year>9999||e.c.year<0,i=``;if(r&&e.c.year>=0&&(i+=`+`),i+=YQ(e.c.year,r?6:4),n===`year`)return i;if(t){if(i+=`-`,i+=YQ(e.c.month),n===`month`)return i;i+=`-`}else if(i+=YQ(e.c.month),n===`month`)return i;return i+=YQ(e.c.day),i}function E1(e,t,n,r,i,a,o){let s=!n||e.c.millisecond!==0||e.c.second!==0,c=``;switch(o){case`day`:case`month`:case`year`:break;default:if(c+=YQ(e.c.hour),o===`hour`)break;if(t){if(c+=`:`,c+=YQ(e.c.minute),o===`minute`)break;s&&(c+=`:`,c+=YQ(e.c.second))}else{if(c+=YQ(e.c.minute),o===`minute`)break;s&&(c+=YQ(e.c.second))}if(o===`second`)break;s&&(!r||e.c.millisecond!==0)&&(c+=`.`,c+=YQ(e.c.millisecond,3))}return i&&(e.isOffsetFixed&&e.offset===0&&!a?c+=`Z`:e.o<0?(c+=`-`,c+=YQ(Math.trunc(-e.o/60)),c+=`:`,c+=YQ(Math.trunc(-e.o%60))):(c+=`+`,c+=YQ(Math.trunc(e.o/60)),c+=`:`,c+=YQ(Math.trunc(e.o%60)))),a&&(c+=`[`+e.zone.ianaName+`]`),c}function D1(e){let t={year:`year`,years:`year`,month:`month`,months:`month`,day:`day`,days:`day`,hour:`hour`,hours:`hour`,minute:`minute`,minutes:`minute`,quarter:`quarter`,quarters:`quarter`,second:`second`,seconds:`second`,millisecond:`millisecond`,milliseconds:`millisecond`,weekday:`weekday`,weekdays:`weekday`,weeknumber:`weekNumber`,weeksnumber:`weekNumber`,weeknumbers:`weekNumber`,weekyear:`weekYear`,weekyears:`weekYear`,ordinal:`ordinal`}[e.toLowerCase()];if(!t)throw new z1(e);return t}function O1(e){switch(e.toLowerCase()){case`localweekday`:case`localweekdays`:return`localWeekday`;case`localweeknumber`:case`localweeknumbers`:return`localWeekNumber`;case`localweekyear`:case`localweekyears`:return`localWeekYear`;default:return D1(e)}}function k1(e){if(p4===void 0&&(p4=K0.now()),e.type!==`iana`)return e.offset(p4);let t=e.name,n=m4.get(t);return n===void 0&&(n=e.offset(p4),m4.set(t,n)),n}function A1(e,t){let n=_Q(t.zone,K0.defaultZone);if(!n.isValid)return h4.invalid(h1(n));let r=A0.fromObject(t),i,a;if(FQ(e.year))i=K0.now();else{for(let t of u4)FQ(e[t])&&(e[t]=s4[t]);let t=NQ(e)||PQ(e);if(t)return h4.invalid(t);let r=k1(n);[i,a]=x1(e,r,n)}return new h4({ts:i,zone:n,loc:r,o:a})}function j1(e,t,n){let r=FQ(n.round)?!0:n.round,i=FQ(n.rounding)?`trunc`:n.rounding,a=(e,a)=>(e=$Q(e,r||n.calendary?0:2,n.calendary?`round`:i),t.loc.clone(n).relFormatter(n).format(e,a)),o=r=>n.calendary?t.hasSame(e,r)?0:t.startOf(r).diff(e.startOf(r),r).get(r):t.diff(e,r).get(r);if(n.unit)return a(o(n.unit),n.unit);for(let e of n.units){let t=o(e);if(Math.abs(t)>=1)return a(t,e)}return a(e>t?-0:0,n.units[n.units.length-1])}function M1(e){let t={},n;return e.length>0&&typeof e[e.length-1]==`object`?(t=e[e.length-1],n=Array.from(e).slice(0,e.length-1)):n=Array.from(e),[t,n]}function N1(e){if(h4.isDateTime(e))return e;if(e&&e.valueOf&&IQ(e.valueOf()))return h4.fromJSDate(e);if(e&&typeof e==`object`)return h4.fromObject(e);throw new B1(`Unknown datetime argument: ${e}, of type ${typeof e}`)}var P1,F1,I1,L1,R1,z1,B1,V1,$,H1,U1,W1,G1,K1,q1,J1,Y1,X1,Z1,Q1,$1,e0,t0,n0,r0,i0,a0,o0,s0,c0,l0,u0,d0,f0,p0,m0,h0,g0,_0,v0,y0,b0,x0,S0,C0,w0,T0,E0,D0,O0,k0,A0,j0,M0,N0,P0,F0,I0,L0,R0,z0,B0,V0,H0,U0,W0,G0,K0,q0,J0,Y0,X0,Z0,Q0,$0,e2,t2,n2,r2,i2,a2,o2,s2,c2,l2,u2,d2,f2,p2,m2,h2,g2,_2,v2,y2,b2,x2,S2,C2,w2,T2,E2,D2,O2,k2,A2,j2,M2,N2,P2,F2,I2,L2,R2,z2,B2,V2,H2,U2,W2,G2,K2,q2,J2,Y2,X2,Z2,Q2,$2,e4,t4,n4,r4,i4,a4,o4,s4,c4,l4,u4,d4,f4,p4,m4,h4,g4=t((()=>{P1=class extends Error{},F1=class extends P1{constructor(e){super(`Invalid DateTime: ${e.toMessage()}`)}},I1=class extends P1{constructor(e){super(`Invalid Interval: ${e.toMessage()}`)}},L1=class extends P1{constructor(e){super(`Invalid Duration: ${e.toMessage()}`)}},R1=class extends P1{},z1=class extends P1{constructor(e){super(`Invalid unit ${e}`)}},B1=class extends P1{},V1=class extends P1{constructor(){super(`Zone is an abstract class`)}},$=`numeric`,H1=`short`,U1=`long`,W1={year:$,month:$,day:$},G1={year:$,month:H1,day:$},K1={year:$,month:H1,day:$,weekday:H1},q1={year:$,month:U1,day:$},J1={year:$,month:U1,day:$,weekday:U1},Y1={hour:$,minute:$},X1={hour:$,minute:$,second:$},Z1={hour:$,minute:$,second:$,timeZoneName:H1},Q1={hour:$,minute:$,second:$,timeZoneName:U1},$1={hour:$,minute:$,hourCycle:`h23`},e0={hour:$,minute:$,second:$,hourCycle:`h23`},t0={hour:$,minute:$,second:$,hourCycle:`h23`,timeZoneName:H1},n0={hour:$,minute:$,second:$,hourCycle:`h23`,timeZoneName:U1},r0={year:$,month:$,day:$,hour:$,minute:$},i0={year:$,month:$,day:$,hour:$,minute:$,second:$},a0={year:$,month:H1,day:$,hour:$,minute:$},o0={year:$,month:H1,day:$,hour:$,minute:$,second:$},s0={year:$,month:H1,day:$,weekday:H1,hour:$,minute:$},c0={year:$,month:U1,day:$,hour:$,minute:$,timeZoneName:H1},l0={year:$,month:U1,day:$,hour:$,minute:$,second:$,timeZoneName:H1},u0={year:$,month:U1,day:$,weekday:U1,hour:$,minute:$,timeZoneName:U1},d0={year:$,month:U1,day:$,weekday:U1,hour:$,minute:$,second:$,timeZoneName:U1},f0=class{get type(){throw new V1}get name(){throw new V1}get ianaName(){return this.name}get isUniversal(){throw new V1}offsetName(e,t){throw new V1}formatOffset(e,t){throw new V1}offset(e){throw new V1}equals(e){throw new V1}get isValid(){throw new V1}},p0=null,m0=class e extends f0{static get instance(){return p0===null&&(p0=new e),p0}get type(){return`system`}get name(){return new Intl.DateTimeFormat().resolvedOptions().timeZone}get isUniversal(){return!1}offsetName(e,{format:t,locale:n}){return s$(e,t,n)}formatOffset(e,t){return d$(this.offset(e),t)}offset(e){return-new Date(e).getTimezoneOffset()}equals(e){return e.type===`system`}get isValid(){return!0}},h0=new Map,g0={year:0,month:1,day:2,era:3,hour:4,minute:5,second:6},_0=new Map,v0=class e extends f0{static create(t){let n=_0.get(t);return n===void 0&&_0.set(t,n=new e(t)),n}static resetCache(){_0.clear(),h0.clear()}static isValidSpecifier(e){return this.isValidZone(e)}static isValidZone(e){if(!e)return!1;try{return new Intl.DateTimeFormat(`en-US`,{timeZone:e}).format(),!0}catch{return!1}}constructor(t){super(),this.zoneName=t,this.valid=e.isValidZone(t)}get type(){return`iana`}get name(){return this.zoneName}get isUniversal(){return!1}offsetName(e,{format:t,locale:n}){return s$(e,t,n,this.name)}formatOffset(e,t){return d$(this.offset(e),t)}offset(e){if(!this.valid)return NaN;let t=new Date(e);if(isNaN(t))return NaN;let n=tQ(this.name),[r,i,a,o,s,c,l]=n.formatToParts?rQ(n,t):nQ(n,t);o===`BC`&&(r=-Math.abs(r)+1);let u=r$({year:r,month:i,day:a,hour:s===24?0:s,minute:c,second:l,millisecond:0}),d=+t,f=d%1e3;return d-=f>=0?f:1e3+f,(u-d)/(60*1e3)}equals(e){return e.type===`iana`&&e.name===this.name}get isValid(){return this.valid}},y0={},b0=new Map,x0=new Map,S0=new Map,C0=null,w0=new Map,T0=new Map,E0=class{constructor(e,t,n){this.padTo=n.padTo||0,this.floor=n.floor||!1;let{padTo:r,floor:i,...a}=n;if(!t||Object.keys(a).length>0){let t={useGrouping:!1,...n};n.padTo>0&&(t.minimumIntegerDigits=n.padTo),this.inf=oQ(e,t)}}format(e){if(this.inf){let t=this.floor?Math.floor(e):e;return this.inf.format(t)}else return YQ(this.floor?Math.floor(e):$Q(e,3),this.padTo)}},D0=class{constructor(e,t,n){this.opts=n,this.originalZone=void 0;let r;if(this.opts.timeZone)this.dt=e;else if(e.zone.type===`fixed`){let t=-1*(e.offset/60),n=t>=0?`Etc/GMT+${t}`:`Etc/GMT${t}`;e.offset!==0&&v0.create(n).valid?(r=n,this.dt=e):(r=`UTC`,this.dt=e.offset===0?e:e.setZone(`UTC`).plus({minutes:e.offset}),this.originalZone=e.zone)}else e.zone.type===`system`?this.dt=e:e.zone.type===`iana`?(this.dt=e,r=e.zone.name):(r=`UTC`,this.dt=e.setZone(`UTC`).plus({minutes:e.offset}),this.originalZone=e.zone);let i={...this.opts};i.timeZone=i.timeZone||r,this.dtf=aQ(t,i)}format(){return this.originalZone?this.formatToParts().map(({value:e})=>e).join(``):this.dtf.format(this.dt.toJSDate())}formatToParts(){let e=this.dtf.formatToParts(this.dt.toJSDate());return this.originalZone?e.map(e=>{if(e.type===`timeZoneName`){let t=this.originalZone.offsetName(this.dt.ts,{locale:this.dt.locale,format:this.opts.timeZoneName});return{...e,value:t}}else return e}):e}resolvedOptions(){return this.dtf.resolvedOptions()}},O0=class{constructor(e,t,n){this.opts={style:`long`,...n},!t&&BQ()&&(this.rtf=sQ(e,n))}format(e,t){return this.rtf?this.rtf.format(e,t):b$(t,e,this.opts.numeric,this.opts.style!==`long`)}formatToParts(e,t){return this.rtf?this.rtf.formatToParts(e,t):[]}},k0={firstDay:1,minimalDays:4,weekend:[6,7]},A0=class e{static fromOpts(t){return e.create(t.locale,t.numberingSystem,t.outputCalendar,t.weekSettings,t.defaultToEN)}static create(t,n,r,i,a=!1){let o=t||K0.defaultLocale,s=o||(a?`en-US`:cQ()),c=n||K0.defaultNumberingSystem,l=r||K0.defaultOutputCalendar,u=KQ(i)||K0.defaultWeekSettings;return new e(s,c,l,u,o)}static resetCache(){C0=null,b0.clear(),x0.clear(),S0.clear(),w0.clear(),T0.clear()}static fromObject({locale:t,numberingSystem:n,outputCalendar:r,weekSettings:i}={}){return e.create(t,n,r,i)}constructor(e,t,n,r,i){let[a,o,s]=dQ(e);this.locale=a,this.numberingSystem=t||o||null,this.outputCalendar=n||s||null,this.weekSettings=r,this.intl=fQ(this.locale,this.numberingSystem,this.outputCalendar),this.weekdaysCache={format:{},standalone:{}},this.monthsCache={format:{},standalone:{}},this.meridiemCache=null,this.eraCache={},this.specifiedLocale=i,this.fastNumbersCached=null}get fastNumbers(){return this.fastNumbersCached??=gQ(this),this.fastNumbersCached}listingMode(){let e=this.isEnglish(),t=(this.numberingSystem===null||this.numberingSystem===`latn`)&&(this.outputCalendar===null||this.outputCalendar===`gregory`);return e&&t?`en`:`intl`}clone(t){return!t||Object.getOwnPropertyNames(t).length===0?this:e.create(t.locale||this.specifiedLocale,t.numberingSystem||this.numberingSystem,t.outputCalendar||this.outputCalendar,KQ(t.weekSettings)||this.weekSettings,t.defaultToEN||!1)}redefaultToEN(e={}){return this.clone({...e,defaultToEN:!0})}redefaultToSystem(e={}){return this.clone({...e,defaultToEN:!1})}months(e,t=!1){return hQ(this,e,p$,()=>{let n=this.intl===`ja`||this.intl.startsWith(`ja-`);t&=!n;let r=t?{month:e,day:`numeric`}:{month:e},i=t?`format`:`standalone`;if(!this.monthsCache[i][e]){let t=n?e=>this.dtFormatter(e,r).format():e=>this.extract(e,r,`month`);this.monthsCache[i][e]=pQ(t)}return this.monthsCache[i][e]})}weekdays(e,t=!1){return hQ(this,e,m$,()=>{let n=t?{weekday:e,year:`numeric`,month:`long`,day:`numeric`}:{weekday:e},r=t?`format`:`standalone`;return this.weekdaysCache[r][e]||(this.weekdaysCache[r][e]=mQ(e=>this.extract(e,n,`weekday`))),this.weekdaysCache[r][e]})}meridiems(){return hQ(this,void 0,()=>n2,()=>{if(!this.meridiemCache){let e={hour:`numeric`,hourCycle:`h12`};this.meridiemCache=[h4.utc(2016,11,13,9),h4.utc(2016,11,13,19)].map(t=>this.extract(t,e,`dayperiod`))}return this.meridiemCache})}eras(e){return hQ(this,e,h$,()=>{let t={era:e};return this.eraCache[e]||(this.eraCache[e]=[h4.utc(-40,1,1),h4.utc(2017,1,1)].map(e=>this.extract(e,t,`era`))),this.eraCache[e]})}extract(e,t,n){let r=this.dtFormatter(e,t).formatToParts().find(e=>e.type.toLowerCase()===n);return r?r.value:null}numberFormatter(e={}){return new E0(this.intl,e.forceSimple||this.fastNumbers,e)}dtFormatter(e,t={}){return new D0(e,this.intl,t)}relFormatter(e={}){return new O0(this.intl,this.isEnglish(),e)}listFormatter(e={}){return iQ(this.intl,e)}isEnglish(){return this.locale===`en`||this.locale.toLowerCase()===`en-us`||lQ(this.intl).locale.startsWith(`en-us`)}getWeekSettings(){return this.weekSettings?this.weekSettings:VQ()?uQ(this.locale):k0}getStartOfWeek(){return this.getWeekSettings().firstDay}getMinDaysInFirstWeek(){return this.getWeekSettings().minimalDays}getWeekendDays(){return this.getWeekSettings().weekend}equals(e){return this.locale===e.locale&&this.numberingSystem===e.numberingSystem&&this.outputCalendar===e.outputCalendar}toString(){return`Locale(${this.locale}, ${this.numberingSystem}, ${this.outputCalendar})`}},j0=null,M0=class e extends f0{static get utcInstance(){return j0===null&&(j0=new e(0)),j0}static instance(t){return t===0?e.utcInstance:new e(t)}static parseSpecifier(t){if(t){let n=t.match(/^utc(?:([+-]\d{1,2})(?::(\d{2}))?)?$/i);if(n)return new e(c$(n[1],n[2]))}return null}constructor(e){super(),this.fixed=e}get type(){return`fixed`}get name(){return this.fixed===0?`UTC`:`UTC${d$(this.fixed,`narrow`)}`}get ianaName(){return this.fixed===0?`Etc/UTC`:`Etc/GMT${d$(-this.fixed,`narrow`)}`}offsetName(){return this.name}formatOffset(e,t){return d$(this.fixed,t)}get isUniversal(){return!0}offset(){return this.fixed}equals(e){return e.type===`fixed`&&e.fixed===this.fixed}get isValid(){return!0}},N0=class extends f0{constructor(e){super(),this.zoneName=e}get type(){return`invalid`}get name(){return this.zoneName}get isUniversal(){return!1}offsetName(){return null}formatOffset(){return``}offset(){return NaN}equals(){return!1}get isValid(){return!1}},P0={arab:`[٠-٩]`,arabext:`[۰-۹]`,bali:`[᭐-᭙]`,beng:`[০-৯]`,deva:`[०-९]`,fullwide:`[０-９]`,gujr:`[૦-૯]`,hanidec:`[〇|一|二|三|四|五|六|七|八|九]`,khmr:`[០-៩]`,knda:`[೦-೯]`,laoo:`[໐-໙]`,limb:`[᥆-᥏]`,mlym:`[൦-൯]`,mong:`[᠐-᠙]`,mymr:`[၀-၉]`,orya:`[୦-୯]`,tamldec:`[௦-௯]`,telu:`[౦-౯]`,thai:`[๐-๙]`,tibt:`[༠-༩]`,latn:`\\d`},F0={arab:[1632,1641],arabext:[1776,1785],bali:[6992,7001],beng:[2534,2543],deva:[2406,2415],fullwide:[65296,65303],gujr:[2790,2799],khmr:[6112,6121],knda:[3302,3311],laoo:[3792,3801],limb:[6470,6479],mlym:[3430,3439],mong:[6160,6169],mymr:[4160,4169],orya:[2918,2927],tamldec:[3046,3055],telu:[3174,3183],thai:[3664,3673],tibt:[3872,3881]},I0=P0.hanidec.replace(/[\[|\]]/g,``).split(``),L0=new Map,R0=()=>Date.now(),z0=`system`,B0=null,V0=null,H0=null,U0=60,G0=null,K0=class{static get now(){return R0}static set now(e){R0=e}static set defaultZone(e){z0=e}static get defaultZone(){return _Q(z0,m0.instance)}static get defaultLocale(){return B0}static set defaultLocale(e){B0=e}static get defaultNumberingSystem(){return V0}static set defaultNumberingSystem(e){V0=e}static get defaultOutputCalendar(){return H0}static set defaultOutputCalendar(e){H0=e}static get defaultWeekSettings(){return G0}static set defaultWeekSettings(e){G0=KQ(e)}static get twoDigitCutoffYear(){return U0}static set twoDigitCutoffYear(e){U0=e%100}static get throwOnInvalid(){return W0}static set throwOnInvalid(e){W0=e}static resetCaches(){A0.resetCache(),v0.resetCache(),h4.resetCache(),yQ()}},q0=class{constructor(e,t){this.reason=e,this.explanation=t}toMessage(){return this.explanation?`${this.reason}: ${this.explanation}`:this.reason}},J0=[0,31,59,90,120,151,181,212,243,273,304,334],Y0=[0,31,60,91,121,152,182,213,244,274,305,335],X0=[`January`,`February`,`March`,`April`,`May`,`June`,`July`,`August`,`September`,`October`,`November`,`December`],Z0=[`Jan`,`Feb`,`Mar`,`Apr`,`May`,`Jun`,`Jul`,`Aug`,`Sep`,`Oct`,`Nov`,`Dec`],Q0=[`J`,`F`,`M`,`A`,`M`,`J`,`J`,`A`,`S`,`O`,`N`,`D`],$0=[`Monday`,`Tuesday`,`Wednesday`,`Thursday`,`Friday`,`Saturday`,`Sunday`],e2=[`Mon`,`Tue`,`Wed`,`Thu`,`Fri`,`Sat`,`Sun`],t2=[`M`,`T`,`W`,`T`,`F`,`S`,`S`],n2=[`AM`,`PM`],r2=[`Before Christ`,`Anno Domini`],i2=[`BC`,`AD`],a2=[`B`,`A`],o2={D:W1,DD:G1,DDD:q1,DDDD:J1,t:Y1,tt:X1,ttt:Z1,tttt:Q1,T:$1,TT:e0,TTT:t0,TTTT:n0,f:r0,ff:a0,fff:c0,ffff:u0,F:i0,FF:o0,FFF:l0,FFFF:d0},s2=class e{static create(t,n={}){return new e(t,n)}static parseFormat(e){let t=null,n=``,r=!1,i=[];for(let a=0;a<e.length;a++){let o=e.charAt(a);o===`'`?((n.length>0||r)&&i.push({literal:r||/^\s+$/.test(n),val:n===``?`'`:n}),t=null,n=``,r=!r):r||o===t?n+=o:(n.length>0&&i.push({literal:/^\s+$/.test(n),val:n}),n=o,t=o)}return n.length>0&&i.push({literal:r||/^\s+$/.test(n),val:n}),i}static macroTokenToFormatOpts(e){return o2[e]}constructor(e,t){this.opts=t,this.loc=e,this.systemLoc=null}formatWithSystemDefault(e,t){return this.systemLoc===null&&(this.systemLoc=this.loc.redefaultToSystem()),this.systemLoc.dtFormatter(e,{...this.opts,...t}).format()}dtFormatter(e,t={}){return this.loc.dtFormatter(e,{...this.opts,...t})}formatDateTime(e,t){return this.dtFormatter(e,t).format()}formatDateTimeParts(e,t){return this.dtFormatter(e,t).formatToParts()}formatInterval(e,t){return this.dtFormatter(e.start,t).dtf.formatRange(e.start.toJSDate(),e.end.toJSDate())}resolvedOptions(e,t){return this.dtFormatter(e,t).resolvedOptions()}num(e,t=0,n=void 0){if(this.opts.forceSimple)return YQ(e,t);let r={...this.opts};return t>0&&(r.padTo=t),n&&(r.signDisplay=n),this.loc.numberFormatter(r).format(e)}formatDateTimeFromString(t,n){let r=this.loc.listingMode()===`en`,i=this.loc.outputCalendar&&this.loc.outputCalendar!==`gregory`,a=(e,n)=>this.loc.extract(t,e,n),o=e=>t.isOffsetFixed&&t.offset===0&&e.allowZ?`Z`:t.isValid?t.zone.formatOffset(t.ts,e.format):``,s=()=>r?g$(t):a({hour:`numeric`,hourCycle:`h12`},`dayperiod`),c=(e,n)=>r?v$(t,e):a(n?{month:e}:{month:e,day:`numeric`},`month`),l=(e,n)=>r?_$(t,e):a(n?{weekday:e}:{weekday:e,month:`long`,day:`numeric`},`weekday`),u=n=>{let r=e.macroTokenToFormatOpts(n);return r?this.formatWithSystemDefault(t,r):n},d=e=>r?y$(t,e):a({era:e},`era`);return x$(e.parseFormat(n),e=>{switch(e){case`S`:return this.num(t.millisecond);case`u`:case`SSS`:return this.num(t.millisecond,3);case`s`:return this.num(t.second);case`ss`:return this.num(t.second,2);case`uu`:return this.num(Math.floor(t.millisecond/10),2);case`uuu`:return this.num(Math.floor(t.millisecond/100));case`m`:return this.num(t.minute);case`mm`:return this.num(t.minute,2);case`h`:return this.num(t.hour%12==0?12:t.hour%12);case`hh`:return this.num(t.hour%12==0?12:t.hour%12,2);case`H`:return this.num(t.hour);case`HH`:return this.num(t.hour,2);case`Z`:return o({format:`narrow`,allowZ:this.opts.allowZ});case`ZZ`:return o({format:`short`,allowZ:this.opts.allowZ});case`ZZZ`:return o({format:`techie`,allowZ:this.opts.allowZ});case`ZZZZ`:return t.zone.offsetName(t.ts,{format:`short`,locale:this.loc.locale});case`ZZZZZ`:return t.zone.offsetName(t.ts,{format:`long`,locale:this.loc.locale});case`z`:return t.zoneName;case`a`:return s();case`d`:return i?a({day:`numeric`},`day`):this.num(t.day);case`dd`:return i?a({day:`2-digit`},`day`):this.num(t.day,2);case`c`:return this.num(t.weekday);case`ccc`:return l(`short`,!0);case`cccc`:return l(`long`,!0);case`ccccc`:return l(`narrow`,!0);case`E`:return this.num(t.weekday);case`EEE`:return l(`short`,!1);case`EEEE`:return l(`long`,!1);case`EEEEE`:return l(`narrow`,!1);case`L`:return i?a({month:`numeric`,day:`numeric`},`month`):this.num(t.month);case`LL`:return i?a({month:`2-digit`,day:`numeric`},`month`):this.num(t.month,2);case`LLL`:return c(`short`,!0);case`LLLL`:return c(`long`,!0);case`LLLLL`:return c(`narrow`,!0);case`M`:return i?a({month:`numeric`},`month`):this.num(t.month);case`MM`:return i?a({month:`2-digit`},`month`):this.num(t.month,2);case`MMM`:return c(`short`,!1);case`MMMM`:return c(`long`,!1);case`MMMMM`:return c(`narrow`,!1);case`y`:return i?a({year:`numeric`},`year`):this.num(t.year);case`yy`:return i?a({year:`2-digit`},`year`):this.num(t.year.toString().slice(-2),2);case`yyyy`:return i?a({year:`numeric`},`year`):this.num(t.year,4);case`yyyyyy`:return i?a({year:`numeric`},`year`):this.num(t.year,6);case`G`:return d(`short`);case`GG`:return d(`long`);case`GGGGG`:return d(`narrow`);case`kk`:return this.num(t.weekYear.toString().slice(-2),2);case`kkkk`:return this.num(t.weekYear,4);case`W`:return this.num(t.weekNumber);case`WW`:return this.num(t.weekNumber,2);case`n`:return this.num(t.localWeekNumber);case`nn`:return this.num(t.localWeekNumber,2);case`ii`:return this.num(t.localWeekYear.toString().slice(-2),2);case`iiii`:return this.num(t.localWeekYear,4);case`o`:return this.num(t.ordinal);case`ooo`:return this.num(t.ordinal,3);case`q`:return this.num(t.quarter);case`qq`:return this.num(t.quarter,2);case`X`:return this.num(Math.floor(t.ts/1e3));case`x`:return this.num(t.ts);default:return u(e)}})}formatDurationFromString(t,n){let r=this.opts.signMode===`negativeLargestOnly`?-1:1,i=e=>{switch(e[0]){case`S`:return`milliseconds`;case`s`:return`seconds`;case`m`:return`minutes`;case`h`:return`hours`;case`d`:return`days`;case`w`:return`weeks`;case`M`:return`months`;case`y`:return`years`;default:return null}},a=(e,t)=>n=>{let a=i(n);if(a){let i=t.isNegativeDuration&&a!==t.largestUnit?r:1,o;return o=this.opts.signMode===`negativeLargestOnly`&&a!==t.largestUnit?`never`:this.opts.signMode===`all`?`always`:`auto`,this.num(e.get(a)*i,n.length,o)}else return n},o=e.parseFormat(n),s=o.reduce((e,{literal:t,val:n})=>t?e:e.concat(n),[]),c=t.shiftTo(...s.map(i).filter(e=>e));return x$(o,a(c,{isNegativeDuration:c<0,largestUnit:Object.keys(c.values)[0]}))}},c2=/[A-Za-z_+-]{1,256}(?::?\/[A-Za-z0-9_+-]{1,256}(?:\/[A-Za-z0-9_+-]{1,256})?)?/,l2=/(?:([Zz])|([+-]\d\d)(?::?(\d\d))?)/,u2=`(?:${l2.source}?(?:\\[(${c2.source})\\])?)?`,d2=/(\d\d)(?::?(\d\d)(?::?(\d\d)(?:[.,](\d{1,30}))?)?)?/,f2=RegExp(`${d2.source}${u2}`),p2=RegExp(`(?:[Tt]${f2.source})?`),m2=/([+-]\d{6}|\d{4})(?:-?(\d\d)(?:-?(\d\d))?)?/,h2=/(\d{4})-?W(\d\d)(?:-?(\d))?/,g2=/(\d{4})-?(\d{3})/,_2=T$(`weekYear`,`weekNumber`,`weekDay`),v2=T$(`year`,`ordinal`),y2=/(\d{4})-(\d\d)-(\d\d)/,b2=RegExp(`${d2.source} ?(?:${l2.source}|(${c2.source}))?`),x2=RegExp(`(?: ${b2.source})?`),S2=RegExp(`^T?${d2.source}$`),C2=/^-?P(?:(?:(-?\d{1,20}(?:\.\d{1,20})?)Y)?(?:(-?\d{1,20}(?:\.\d{1,20})?)M)?(?:(-?\d{1,20}(?:\.\d{1,20})?)W)?(?:(-?\d{1,20}(?:\.\d{1,20})?)D)?(?:T(?:(-?\d{1,20}(?:\.\d{1,20})?)H)?(?:(-?\d{1,20}(?:\.\d{1,20})?)M)?(?:(-?\d{1,20})(?:[.,](-?\d{1,20}))?S)?)?)$/,w2={GMT:0,EDT:-240,EST:-300,CDT:-300,CST:-360,MDT:-360,MST:-420,PDT:-420,PST:-480},T2=/^(?:(Mon|Tue|Wed|Thu|Fri|Sat|Sun),\s)?(\d{1,2})\s(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s(\d{2,4})\s(\d\d):(\d\d)(?::(\d\d))?\s(?:(UT|GMT|[ECMP][SD]T)|([Zz])|(?:([+-]\d\d)(\d\d)))$/,E2=/^(Mon|Tue|Wed|Thu|Fri|Sat|Sun), (\d\d) (Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec) (\d{4}) (\d\d):(\d\d):(\d\d) GMT$/,D2=/^(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday), (\d\d)-(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)-(\d\d) (\d\d):(\d\d):(\d\d) GMT$/,O2=/^(Mon|Tue|Wed|Thu|Fri|Sat|Sun) (Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec) ( \d|\d\d) (\d\d):(\d\d):(\d\d) (\d{4})$/,k2=S$(m2,p2),A2=S$(h2,p2),j2=S$(g2,p2),M2=S$(f2),N2=C$(D$,O$,k$,A$),P2=C$(_2,O$,k$,A$),F2=C$(v2,O$,k$,A$),I2=C$(O$,k$,A$),L2=C$(O$),R2=S$(y2,x2),z2=S$(b2),B2=C$(O$,k$,A$),V2=`Invalid Duration`,H2={weeks:{days:7,hours:168,minutes:10080,seconds:10080*60,milliseconds:10080*60*1e3},days:{hours:24,minutes:1440,seconds:1440*60,milliseconds:1440*60*1e3},hours:{minutes:60,seconds:3600,milliseconds:3600*1e3},minutes:{seconds:60,milliseconds:60*1e3},seconds:{milliseconds:1e3}},U2={years:{quarters:4,months:12,weeks:52,days:365,hours:365*24,minutes:365*24*60,seconds:365*24*60*60,milliseconds:365*24*60*60*1e3},quarters:{months:3,weeks:13,days:91,hours:2184,minutes:2184*60,seconds:2184*60*60,milliseconds:2184*60*60*1e3},months:{weeks:4,days:30,hours:720,minutes:720*60,seconds:720*60*60,milliseconds:720*60*60*1e3},...H2},W2=146097/400,G2=146097/4800,K2={years:{quarters:4,months:12,weeks:W2/7,days:W2,hours:W2*24,minutes:W2*24*60,seconds:W2*24*60*60,milliseconds:W2*24*60*60*1e3},quarters:{months:3,weeks:W2/28,days:W2/4,hours:W2*24/4,minutes:W2*24*60/4,seconds:W2*24*60*60/4,milliseconds:W2*24*60*60*1e3/4},months:{weeks:G2/7,days:G2,hours:G2*24,minutes:G2*24*60,seconds:G2*24*60*60,milliseconds:G2*24*60*60*1e3},...H2},q2=[`years`,`quarters`,`months`,`weeks`,`days`,`hours`,`minutes`,`seconds`,`milliseconds`],J2=q2.slice(0).reverse(),Y2=class e{constructor(e){let t=e.conversionAccuracy===`longterm`||!1,n=t?K2:U2;e.matrix&&(n=e.matrix),this.values=e.values,this.loc=e.loc||A0.create(),this.conversionAccuracy=t?`longterm`:`casual`,this.invalid=e.invalid||null,this.matrix=n,this.isLuxonDuration=!0}static fromMillis(t,n){return e.fromObject({milliseconds:t},n)}static fromObject(t,n={}){if(typeof t!=`object`||!t)throw new B1(`Duration.fromObject: argument expected to be an object, got ${t===null?`null`:typeof t}`);return new e({values:u$(t,e.normalizeUnit),loc:A0.fromObject(n),conversionAccuracy:n.conversionAccuracy,matrix:n.matrix})}static fromDurationLike(t){if(IQ(t))return e.fromMillis(t);if(e.isDuration(t))return t;if(typeof t==`object`)return e.fromObject(t);throw new B1(`Unknown duration argument ${t} of type ${typeof t}`)}static fromISO(t,n){let[r]=B$(t);return r?e.fromObject(r,n):e.invalid(`unparsable`,`the input "${t}" can't be parsed as ISO 8601`)}static fromISOTime(t,n){let[r]=V$(t);return r?e.fromObject(r,n):e.invalid(`unparsable`,`the input "${t}" can't be parsed as ISO 8601`)}static invalid(t,n=null){if(!t)throw new B1(`need to specify a reason the Duration is invalid`);let r=t instanceof q0?t:new q0(t,n);if(K0.throwOnInvalid)throw new L1(r);return new e({invalid:r})}static normalizeUnit(e){let t={year:`years`,years:`years`,quarter:`quarters`,quarters:`quarters`,month:`months`,months:`months`,week:`weeks`,weeks:`weeks`,day:`days`,days:`days`,hour:`hours`,hours:`hours`,minute:`minutes`,minutes:`minutes`,second:`seconds`,seconds:`seconds`,millisecond:`milliseconds`,milliseconds:`milliseconds`}[e&&e.toLowerCase()];if(!t)throw new z1(e);return t}static isDuration(e){return e&&e.isLuxonDuration||!1}get locale(){return this.isValid?this.loc.locale:null}get numberingSystem(){return this.isValid?this.loc.numberingSystem:null}toFormat(e,t={}){let n={...t,floor:t.round!==!1&&t.floor!==!1};return this.isValid?s2.create(this.loc,n).formatDurationFromString(this,e):V2}toHuman(e={}){if(!this.isValid)return V2;let t=e.showZeros!==!1,n=q2.map(n=>{let r=this.values[n];return FQ(r)||r===0&&!t?null:this.loc.numberFormatter({style:`unit`,unitDisplay:`long`,...e,unit:n.slice(0,-1)}).format(r)}).filter(e=>e);return this.loc.listFormatter({type:`conjunction`,style:e.listStyle||`narrow`,...e}).format(n)}toObject(){return this.isValid?{...this.values}:{}}toISO(){if(!this.isValid)return null;let e=`P`;return this.years!==0&&(e+=this.years+`Y`),(this.months!==0||this.quarters!==0)&&(e+=this.months+this.quarters*3+`M`),this.weeks!==0&&(e+=this.weeks+`W`),this.days!==0&&(e+=this.days+`D`),(this.hours!==0||this.minutes!==0||this.seconds!==0||this.milliseconds!==0)&&(e+=`T`),this.hours!==0&&(e+=this.hours+`H`),this.minutes!==0&&(e+=this.minutes+`M`),(this.seconds!==0||this.milliseconds!==0)&&(e+=$Q(this.seconds+this.milliseconds/1e3,3)+`S`),e===`P`&&(e+=`T0S`),e}toISOTime(e={}){if(!this.isValid)return null;let t=this.toMillis();return t<0||t>=864e5?null:(e={suppressMilliseconds:!1,suppressSeconds:!1,includePrefix:!1,format:`extended`,...e,includeOffset:!1},h4.fromMillis(t,{zone:`UTC`}).toISOTime(e))}toJSON(){return this.toISO()}toString(){return this.toISO()}[Symbol.for(`nodejs.util.inspect.custom`)](){return this.isValid?`Duration { values: ${JSON.stringify(this.values)} }`:`Duration { Invalid, reason: ${this.invalidReason} }`}toMillis(){return this.isValid?W$(this.matrix,this.values):NaN}valueOf(){return this.toMillis()}plus(t){if(!this.isValid)return this;let n=e.fromDurationLike(t),r={};for(let e of q2)(GQ(n.values,e)||GQ(this.values,e))&&(r[e]=n.get(e)+this.get(e));return U$(this,{values:r},!0)}minus(t){if(!this.isValid)return this;let n=e.fromDurationLike(t);return this.plus(n.negate())}mapUnits(e){if(!this.isValid)return this;let t={};for(let n of Object.keys(this.values))t[n]=l$(e(this.values[n],n));return U$(this,{values:t},!0)}get(t){return this[e.normalizeUnit(t)]}set(t){if(!this.isValid)return this;let n={...this.values,...u$(t,e.normalizeUnit)};return U$(this,{values:n})}reconfigure({locale:e,numberingSystem:t,conversionAccuracy:n,matrix:r}={}){let i={loc:this.loc.clone({locale:e,numberingSystem:t}),matrix:r,conversionAccuracy:n};return U$(this,i)}as(e){return this.isValid?this.shiftTo(e).get(e):NaN}normalize(){if(!this.isValid)return this;let e=this.toObject();return G$(this.matrix,e),U$(this,{values:e},!0)}rescale(){if(!this.isValid)return this;let e=K$(this.normalize().shiftToAll().toObject());return U$(this,{values:e},!0)}shiftTo(...t){if(!this.isValid||t.length===0)return this;t=t.map(t=>e.normalizeUnit(t));let n={},r={},i=this.toObject(),a;for(let e of q2)if(t.indexOf(e)>=0){a=e;let t=0;for(let n in r)t+=this.matrix[n][e]*r[n],r[n]=0;IQ(i[e])&&(t+=i[e]);let o=Math.trunc(t);n[e]=o,r[e]=(t*1e3-o*1e3)/1e3}else IQ(i[e])&&(r[e]=i[e]);for(let e in r)r[e]!==0&&(n[a]+=e===a?r[e]:r[e]/this.matrix[a][e]);return G$(this.matrix,n),U$(this,{values:n},!0)}shiftToAll(){return this.isValid?this.shiftTo(`years`,`months`,`weeks`,`days`,`hours`,`minutes`,`seconds`,`milliseconds`):this}negate(){if(!this.isValid)return this;let e={};for(let t of Object.keys(this.values))e[t]=this.values[t]===0?0:-this.values[t];return U$(this,{values:e},!0)}removeZeros(){if(!this.isValid)return this;let e=K$(this.values);return U$(this,{values:e},!0)}get years(){return this.isValid?this.values.years||0:NaN}get quarters(){return this.isValid?this.values.quarters||0:NaN}get months(){return this.isValid?this.values.months||0:NaN}get weeks(){return this.isValid?this.values.weeks||0:NaN}get days(){return this.isValid?this.values.days||0:NaN}get hours(){return this.isValid?this.values.hours||0:NaN}get minutes(){return this.isValid?this.values.minutes||0:NaN}get seconds(){return this.isValid?this.values.seconds||0:NaN}get milliseconds(){return this.isValid?this.values.milliseconds||0:NaN}get isValid(){return this.invalid===null}get invalidReason(){return this.invalid?this.invalid.reason:null}get invalidExplanation(){return this.invalid?this.invalid.explanation:null}equals(e){if(!this.isValid||!e.isValid||!this.loc.equals(e.loc))return!1;function t(e,t){return e===void 0||e===0?t===void 0||t===0:e===t}for(let n of q2)if(!t(this.values[n],e.values[n]))return!1;return!0}},X2=`Invalid Interval`,Z2=class e{constructor(e){this.s=e.start,this.e=e.end,this.invalid=e.invalid||null,this.isLuxonInterval=!0}static invalid(t,n=null){if(!t)throw new B1(`need to specify a reason the Interval is invalid`);let r=t instanceof q0?t:new q0(t,n);if(K0.throwOnInvalid)throw new I1(r);return new e({invalid:r})}static fromDateTimes(t,n){let r=N1(t),i=N1(n);return q$(r,i)??new e({start:r,end:i})}static after(t,n){let r=Y2.fromDurationLike(n),i=N1(t);return e.fromDateTimes(i,i.plus(r))}static before(t,n){let r=Y2.fromDurationLike(n),i=N1(t);return e.fromDateTimes(i.minus(r),i)}static fromISO(t,n){let[r,i]=(t||``).split(`/`,2);if(r&&i){let t,a;try{t=h4.fromISO(r,n),a=t.isValid}catch{a=!1}let o,s;try{o=h4.fromISO(i,n),s=o.isValid}catch{s=!1}if(a&&s)return e.fromDateTimes(t,o);if(a){let r=Y2.fromISO(i,n);if(r.isValid)return e.after(t,r)}else if(s){let t=Y2.fromISO(r,n);if(t.isValid)return e.before(o,t)}}return e.invalid(`unparsable`,`the input "${t}" can't be parsed as ISO 8601`)}static isInterval(e){return e&&e.isLuxonInterval||!1}get start(){return this.isValid?this.s:null}get end(){return this.isValid?this.e:null}get lastDateTime(){return this.isValid&&this.e?this.e.minus(1):null}get isValid(){return this.invalidReason===null}get invalidReason(){return this.invalid?this.invalid.reason:null}get invalidExplanation(){return this.invalid?this.invalid.explanation:null}length(e=`milliseconds`){return this.isValid?this.toDuration(e).get(e):NaN}count(e=`milliseconds`,t){if(!this.isValid)return NaN;let n=this.start.startOf(e,t),r;return r=t?.useLocaleWeeks?this.end.reconfigure({locale:n.locale}):this.end,r=r.startOf(e,t),Math.floor(r.diff(n,e).get(e))+(r.valueOf()!==this.end.valueOf())}hasSame(e){return this.isValid?this.isEmpty()||this.e.minus(1).hasSame(this.s,e):!1}isEmpty(){return this.s.valueOf()===this.e.valueOf()}isAfter(e){return this.isValid?this.s>e:!1}isBefore(e){return this.isValid?this.e<=e:!1}contains(e){return this.isValid?this.s<=e&&this.e>e:!1}set({start:t,end:n}={}){return this.isValid?e.fromDateTimes(t||this.s,n||this.e):this}splitAt(...t){if(!this.isValid)return[];let n=t.map(N1).filter(e=>this.contains(e)).sort((e,t)=>e.toMillis()-t.toMillis()),r=[],{s:i}=this,a=0;for(;i<this.e;){let t=n[a]||this.e,o=+t>+this.e?this.e:t;r.push(e.fromDateTimes(i,o)),i=o,a+=1}return r}splitBy(t){let n=Y2.fromDurationLike(t);if(!this.isValid||!n.isValid||n.as(`milliseconds`)===0)return[];let{s:r}=this,i=1,a,o=[];for(;r<this.e;){let t=this.start.plus(n.mapUnits(e=>e*i));a=+t>+this.e?this.e:t,o.push(e.fromDateTimes(r,a)),r=a,i+=1}return o}divideEqually(e){return this.isValid?this.splitBy(this.length()/e).slice(0,e):[]}overlaps(e){return this.e>e.s&&this.s<e.e}abutsStart(e){return this.isValid?+this.e==+e.s:!1}abutsEnd(e){return this.isValid?+e.e==+this.s:!1}engulfs(e){return this.isValid?this.s<=e.s&&this.e>=e.e:!1}equals(e){return!this.isValid||!e.isValid?!1:this.s.equals(e.s)&&this.e.equals(e.e)}intersection(t){if(!this.isValid)return this;let n=this.s>t.s?this.s:t.s,r=this.e<t.e?this.e:t.e;return n>=r?null:e.fromDateTimes(n,r)}union(t){if(!this.isValid)return this;let n=this.s<t.s?this.s:t.s,r=this.e>t.e?this.e:t.e;return e.fromDateTimes(n,r)}static merge(e){let[t,n]=e.sort((e,t)=>e.s-t.s).reduce(([e,t],n)=>t?t.overlaps(n)||t.abutsStart(n)?[e,t.union(n)]:[e.concat([t]),n]:[e,n],[[],null]);return n&&t.push(n),t}static xor(t){let n=null,r=0,i=[],a=t.map(e=>[{time:e.s,type:`s`},{time:e.e,type:`e`}]),o=Array.prototype.concat(...a).sort((e,t)=>e.time-t.time);for(let t of o)r+=t.type===`s`?1:-1,r===1?n=t.time:(n&&+n!=+t.time&&i.push(e.fromDateTimes(n,t.time)),n=null);return e.merge(i)}difference(...t){return e.xor([this].concat(t)).map(e=>this.intersection(e)).filter(e=>e&&!e.isEmpty())}toString(){return this.isValid?`[${this.s.toISO()} – ${this.e.toISO()})`:X2}[Symbol.for(`nodejs.util.inspect.custom`)](){return this.isValid?`Interval { start: ${this.s.toISO()}, end: ${this.e.toISO()} }`:`Interval { Invalid, reason: ${this.invalidReason} }`}toLocaleString(e=W1,t={}){return this.isValid?s2.create(this.s.loc.clone(t),e).formatInterval(this):X2}toISO(e){return this.isValid?`${this.s.toISO(e)}/${this.e.toISO(e)}`:X2}toISODate(){return this.isValid?`${this.s.toISODate()}/${this.e.toISODate()}`:X2}toISOTime(e){return this.isValid?`${this.s.toISOTime(e)}/${this.e.toISOTime(e)}`:X2}toFormat(e,{separator:t=` – `}={}){return this.isValid?`${this.s.toFormat(e)}${t}${this.e.toFormat(e)}`:X2}toDuration(e,t){return this.isValid?this.e.diff(this.s,e,t):Y2.invalid(this.invalidReason)}mapEndpoints(t){return e.fromDateTimes(t(this.s),t(this.e))}},Q2=class{static hasDST(e=K0.defaultZone){let t=h4.now().setZone(e).set({month:12});return!e.isUniversal&&t.offset!==t.set({month:6}).offset}static isValidIANAZone(e){return v0.isValidZone(e)}static normalizeZone(e){return _Q(e,K0.defaultZone)}static getStartOfWeek({locale:e=null,locObj:t=null}={}){return(t||A0.create(e)).getStartOfWeek()}static getMinimumDaysInFirstWeek({locale:e=null,locObj:t=null}={}){return(t||A0.create(e)).getMinDaysInFirstWeek()}static getWeekendWeekdays({locale:e=null,locObj:t=null}={}){return(t||A0.create(e)).getWeekendDays().slice()}static months(e=`long`,{locale:t=null,numberingSystem:n=null,locObj:r=null,outputCalendar:i=`gregory`}={}){return(r||A0.create(t,n,i)).months(e)}static monthsFormat(e=`long`,{locale:t=null,numberingSystem:n=null,locObj:r=null,outputCalendar:i=`gregory`}={}){return(r||A0.create(t,n,i)).months(e,!0)}static weekdays(e=`long`,{locale:t=null,numberingSystem:n=null,locObj:r=null}={}){return(r||A0.create(t,n,null)).weekdays(e)}static weekdaysFormat(e=`long`,{locale:t=null,numberingSystem:n=null,locObj:r=null}={}){return(r||A0.create(t,n,null)).weekdays(e,!0)}static meridiems({locale:e=null}={}){return A0.create(e).meridiems()}static eras(e=`short`,{locale:t=null}={}){return A0.create(t,null,`gregory`).eras(e)}static features(){return{relative:BQ(),localeWeek:VQ()}}},$2=`missing Intl.DateTimeFormat.formatToParts support`,e4=`[ \xA0]`,t4=new RegExp(e4,`g`),n4={year:{"2-digit":`yy`,numeric:`yyyyy`},month:{numeric:`M`,"2-digit":`MM`,short:`MMM`,long:`MMMM`},day:{numeric:`d`,"2-digit":`dd`},weekday:{short:`EEE`,long:`EEEE`},dayperiod:`a`,dayPeriod:`a`,hour12:{numeric:`h`,"2-digit":`hh`},hour24:{numeric:`H`,"2-digit":`HH`},minute:{numeric:`m`,"2-digit":`mm`},second:{numeric:`s`,"2-digit":`ss`},timeZoneName:{long:`ZZZZZ`,short:`ZZZ`}},r4=null,i4=class{constructor(e,t){if(this.locale=e,this.format=t,this.tokens=d1(s2.parseFormat(t),e),this.units=this.tokens.map(t=>i1(t,e)),this.disqualifyingUnit=this.units.find(e=>e.invalidReason),!this.disqualifyingUnit){let[e,t]=o1(this.units);this.regex=RegExp(e,`i`),this.handlers=t}}explainFromTokens(e){if(this.isValid){let[t,n]=s1(e,this.regex,this.handlers),[r,i,a]=n?c1(n):[null,null,void 0];if(GQ(n,`a`)&&GQ(n,`H`))throw new R1(`Can't include meridiem when specifying 24-hour format`);return{input:e,tokens:this.tokens,regex:this.regex,rawMatches:t,matches:n,result:r,zone:i,specificOffset:a}}else return{input:e,tokens:this.tokens,invalidReason:this.invalidReason}}get isValid(){return!this.disqualifyingUnit}get invalidReason(){return this.disqualifyingUnit?this.disqualifyingUnit.invalidReason:null}},a4=`Invalid DateTime`,o4=864e13,s4={month:1,day:1,hour:0,minute:0,second:0,millisecond:0},c4={weekNumber:1,weekday:1,hour:0,minute:0,second:0,millisecond:0},l4={ordinal:1,hour:0,minute:0,second:0,millisecond:0},u4=[`year`,`month`,`day`,`hour`,`minute`,`second`,`millisecond`],d4=[`weekYear`,`weekNumber`,`weekday`,`hour`,`minute`,`second`,`millisecond`],f4=[`year`,`ordinal`,`hour`,`minute`,`second`,`millisecond`],m4=new Map,h4=class e{constructor(e){let t=e.zone||K0.defaultZone,n=e.invalid||(Number.isNaN(e.ts)?new q0(`invalid input`):null)||(t.isValid?null:h1(t));this.ts=FQ(e.ts)?K0.now():e.ts;let r=null,i=null;if(!n)if(e.old&&e.old.ts===this.ts&&e.old.zone.equals(t))[r,i]=[e.old.c,e.old.o];else{let a=IQ(e.o)&&!e.old?e.o:t.offset(this.ts);r=b1(this.ts,a),n=Number.isNaN(r.year)?new q0(`invalid input`):null,r=n?null:r,i=n?null:a}this._zone=t,this.loc=e.loc||A0.create(),this.invalid=n,this.weekData=null,this.localWeekData=null,this.c=r,this.o=i,this.isLuxonDateTime=!0}static now(){return new e({})}static local(){let[e,t]=M1(arguments),[n,r,i,a,o,s,c]=t;return A1({year:n,month:r,day:i,hour:a,minute:o,second:s,millisecond:c},e)}static utc(){let[e,t]=M1(arguments),[n,r,i,a,o,s,c]=t;return e.zone=M0.utcInstance,A1({year:n,month:r,day:i,hour:a,minute:o,second:s,millisecond:c},e)}static fromJSDate(t,n={}){let r=zQ(t)?t.valueOf():NaN;if(Number.isNaN(r))return e.invalid(`invalid input`);let i=_Q(n.zone,K0.defaultZone);return i.isValid?new e({ts:r,zone:i,loc:A0.fromObject(n)}):e.invalid(h1(i))}static fromMillis(t,n={}){if(!IQ(t))throw new B1(`fromMillis requires a numerical input, but received a ${typeof t} with value ${t}`);return t<-864e13||t>o4?e.invalid(`Timestamp out of range`):new e({ts:t,zone:_Q(n.zone,K0.defaultZone),loc:A0.fromObject(n)})}static fromSeconds(t,n={}){if(IQ(t))return new e({ts:t*1e3,zone:_Q(n.zone,K0.defaultZone),loc:A0.fromObject(n)});throw new B1(`fromSeconds requires a numerical input`)}static fromObject(t,n={}){t||={};let r=_Q(n.zone,K0.defaultZone);if(!r.isValid)return e.invalid(h1(r));let i=A0.fromObject(n),a=u$(t,O1),{minDaysInFirstWeek:o,startOfWeek:s}=AQ(a,i),c=K0.now(),l=FQ(n.specificOffset)?r.offset(c):n.specificOffset,u=!FQ(a.ordinal),d=!FQ(a.year),f=!FQ(a.month)||!FQ(a.day),p=d||f,m=a.weekYear||a.weekNumber;if((p||u)&&m)throw new R1(`Can't mix weekYear/weekNumber units with year/month/day or ordinals`);if(f&&u)throw new R1(`Can't mix ordinal dates with month/day`);let h=m||a.weekday&&!p,g,_,v=b1(c,l);h?(g=d4,_=c4,v=EQ(v,o,s)):u?(g=f4,_=l4,v=OQ(v)):(g=u4,_=s4);let y=!1;for(let e of g){let t=a[e];FQ(t)?y?a[e]=_[e]:a[e]=v[e]:y=!0}let b=(h?jQ(a,o,s):u?MQ(a):NQ(a))||PQ(a);if(b)return e.invalid(b);let[x,S]=x1(h?DQ(a,o,s):u?kQ(a):a,l,r),C=new e({ts:x,zone:r,o:S,loc:i});return a.weekday&&p&&t.weekday!==C.weekday?e.invalid(`mismatched weekday`,`you can't specify both a weekday of ${a.weekday} and a date of ${C.toISO()}`):C.isValid?C:e.invalid(C.invalid)}static fromISO(e,t={}){let[n,r]=L$(e);return C1(n,r,t,`ISO 8601`,e)}static fromRFC2822(e,t={}){let[n,r]=R$(e);return C1(n,r,t,`RFC 2822`,e)}static fromHTTP(e,t={}){let[n,r]=z$(e);return C1(n,r,t,`HTTP`,t)}static fromFormat(t,n,r={}){if(FQ(t)||FQ(n))throw new B1(`fromFormat requires an input string and a format`);let{locale:i=null,numberingSystem:a=null}=r,[o,s,c,l]=p1(A0.fromOpts({locale:i,numberingSystem:a,defaultToEN:!0}),t,n);return l?e.invalid(l):C1(o,s,r,`format ${n}`,t,c)}static fromString(t,n,r={}){return e.fromFormat(t,n,r)}static fromSQL(e,t={}){let[n,r]=H$(e);return C1(n,r,t,`SQL`,e)}static invalid(t,n=null){if(!t)throw new B1(`need to specify a reason the DateTime is invalid`);let r=t instanceof q0?t:new q0(t,n);if(K0.throwOnInvalid)throw new F1(r);return new e({invalid:r})}static isDateTime(e){return e&&e.isLuxonDateTime||!1}static parseFormatForOpts(e,t={}){let n=m1(e,A0.fromObject(t));return n?n.map(e=>e?e.val:null).join(``):null}static expandFormat(e,t={}){return d1(s2.parseFormat(e),A0.fromObject(t)).map(e=>e.val).join(``)}static resetCache(){p4=void 0,m4.clear()}get(e){return this[e]}get isValid(){return this.invalid===null}get invalidReason(){return this.invalid?this.invalid.reason:null}get invalidExplanation(){return this.invalid?this.invalid.explanation:null}get locale(){return this.isValid?this.loc.locale:null}get numberingSystem(){return this.isValid?this.loc.numberingSystem:null}get outputCalendar(){return this.isValid?this.loc.outputCalendar:null}get zone(){return this._zone}get zoneName(){return this.isValid?this.zone.name:null}get year(){return this.isValid?this.c.year:NaN}get quarter(){return this.isValid?Math.ceil(this.c.month/3):NaN}get month(){return this.isValid?this.c.month:NaN}get day(){return this.isValid?this.c.day:NaN}get hour(){return this.isValid?this.c.hour:NaN}get minute(){return this.isValid?this.c.minute:NaN}get second(){return this.isValid?this.c.second:NaN}get millisecond(){return this.isValid?this.c.millisecond:NaN}get weekYear(){return this.isValid?g1(this).weekYear:NaN}get weekNumber(){return this.isValid?g1(this).weekNumber:NaN}get weekday(){return this.isValid?g1(this).weekday:NaN}get isWeekend(){return this.isValid&&this.loc.getWeekendDays().includes(this.weekday)}get localWeekday(){return this.isValid?_1(this).weekday:NaN}get localWeekNumber(){return this.isValid?_1(this).weekNumber:NaN}get localWeekYear(){return this.isValid?_1(this).weekYear:NaN}get ordinal(){return this.isValid?OQ(this.c).ordinal:NaN}get monthShort(){return this.isValid?Q2.months(`short`,{locObj:this.loc})[this.month-1]:null}get monthLong(){return this.isValid?Q2.months(`long`,{locObj:this.loc})[this.month-1]:null}get weekdayShort(){return this.isValid?Q2.weekdays(`short`,{locObj:this.loc})[this.weekday-1]:null}get weekdayLong(){return this.isValid?Q2.weekdays(`long`,{locObj:this.loc})[this.weekday-1]:null}get offset(){return this.isValid?+this.o:NaN}get offsetNameShort(){return this.isValid?this.zone.offsetName(this.ts,{format:`short`,locale:this.locale}):null}get offsetNameLong(){return this.isValid?this.zone.offsetName(this.ts,{format:`long`,locale:this.locale}):null}get isOffsetFixed(){return this.isValid?this.zone.isUniversal:null}get isInDST(){return this.isOffsetFixed?!1:this.offset>this.set({month:1,day:1}).offset||this.offset>this.set({month:5}).offset}getPossibleOffsets(){if(!this.isValid||this.isOffsetFixed)return[this];let e=864e5,t=6e4,n=r$(this.c),r=this.zone.offset(n-e),i=this.zone.offset(n+e),a=this.zone.offset(n-r*t),o=this.zone.offset(n-i*t);if(a===o)return[this];let s=n-a*t,c=n-o*t,l=b1(s,a),u=b1(c,o);return l.hour===u.hour&&l.minute===u.minute&&l.second===u.second&&l.millisecond===u.millisecond?[v1(this,{ts:s}),v1(this,{ts:c})]:[this]}get isInLeapYear(){return e$(this.year)}get daysInMonth(){return n$(this.year,this.month)}get daysInYear(){return this.isValid?t$(this.year):NaN}get weeksInWeekYear(){return this.isValid?a$(this.weekYear):NaN}get weeksInLocalWeekYear(){return this.isValid?a$(this.localWeekYear,this.loc.getMinDaysInFirstWeek(),this.loc.getStartOfWeek()):NaN}resolvedLocaleOptions(e={}){let{locale:t,numberingSystem:n,calendar:r}=s2.create(this.loc.clone(e),e).resolvedOptions(this);return{locale:t,numberingSystem:n,outputCalendar:r}}toUTC(e=0,t={}){return this.setZone(M0.instance(e),t)}toLocal(){return this.setZone(K0.defaultZone)}setZone(t,{keepLocalTime:n=!1,keepCalendarTime:r=!1}={}){if(t=_Q(t,K0.defaultZone),t.equals(this.zone))return this;if(t.isValid){let e=this.ts;if(n||r){let n=t.offset(this.ts),r=this.toObject();[e]=x1(r,n,t)}return v1(this,{ts:e,zone:t})}else return e.invalid(h1(t))}reconfigure({locale:e,numberingSystem:t,outputCalendar:n}={}){let r=this.loc.clone({locale:e,numberingSystem:t,outputCalendar:n});return v1(this,{loc:r})}setLocale(e){return this.reconfigure({locale:e})}set(e){if(!this.isValid)return this;let t=u$(e,O1),{minDaysInFirstWeek:n,startOfWeek:r}=AQ(t,this.loc),i=!FQ(t.weekYear)||!FQ(t.weekNumber)||!FQ(t.weekday),a=!FQ(t.ordinal),o=!FQ(t.year),s=!FQ(t.month)||!FQ(t.day),c=o||s,l=t.weekYear||t.weekNumber;if((c||a)&&l)throw new R1(`Can't mix weekYear/weekNumber units with year/month/day or ordinals`);if(s&&a)throw new R1(`Can't mix ordinal dates with month/day`);let u;i?u=DQ({...EQ(this.c,n,r),...t},n,r):FQ(t.ordinal)?(u={...this.toObject(),...t},FQ(t.day)&&(u.day=Math.min(n$(u.year,u.month),u.day))):u=kQ({...OQ(this.c),...t});let[d,f]=x1(u,this.o,this.zone);return v1(this,{ts:d,o:f})}plus(e){if(!this.isValid)return this;let t=Y2.fromDurationLike(e);return v1(this,S1(this,t))}minus(e){if(!this.isValid)return this;let t=Y2.fromDurationLike(e).negate();return v1(this,S1(this,t))}startOf(e,{useLocaleWeeks:t=!1}={}){if(!this.isValid)return this;let n={},r=Y2.normalizeUnit(e);switch(r){case`years`:n.month=1;case`quarters`:case`months`:n.day=1;case`weeks`:case`days`:n.hour=0;case`hours`:n.minute=0;case`minutes`:n.second=0;case`seconds`:n.millisecond=0;break}if(r===`weeks`)if(t){let e=this.loc.getStartOfWeek(),{weekday:t}=this;t<e&&(n.weekNumber=this.weekNumber-1),n.weekday=e}else n.weekday=1;return r===`quarters`&&(n.month=(Math.ceil(this.month/3)-1)*3+1),this.set(n)}endOf(e,t){return this.isValid?this.plus({[e]:1}).startOf(e,t).minus(1):this}toFormat(e,t={}){return this.isValid?s2.create(this.loc.redefaultToEN(t)).formatDateTimeFromString(this,e):a4}toLocaleString(e=W1,t={}){return this.isValid?s2.create(this.loc.clone(t),e).formatDateTime(this):a4}toLocaleParts(e={}){return this.isValid?s2.create(this.loc.clone(e),e).formatDateTimeParts(this):[]}toISO({format:e=`extended`,suppressSeconds:t=!1,suppressMilliseconds:n=!1,includeOffset:r=!0,extendedZone:i=!1,precision:a=`milliseconds`}={}){if(!this.isValid)return null;a=D1(a);let o=e===`extended`,s=T1(this,o,a);return u4.indexOf(a)>=3&&(s+=`T`),s+=E1(this,o,t,n,r,i,a),s}toISODate({format:e=`extended`,precision:t=`day`}={}){return this.isValid?T1(this,e===`extended`,D1(t)):null}toISOWeekDate(){return w1(this,`kkkk-'W'WW-c`)}toISOTime({suppressMilliseconds:e=!1,suppressSeconds:t=!1,includeOffset:n=!0,includePrefix:r=!1,extendedZone:i=!1,format:a=`extended`,precision:o=`milliseconds`}={}){return this.isValid?(o=D1(o),(r&&u4.indexOf(o)>=3?`T`:``)+E1(this,a===`extended`,t,e,n,i,o)):null}toRFC2822(){return w1(this,`EEE, dd LLL yyyy HH:mm:ss ZZZ`,!1)}toHTTP(){return w1(this.toUTC(),`EEE, dd LLL yyyy HH:mm:ss 'GMT'`)}toSQLDate(){return this.isValid?T1(this,!0):null}toSQLTime({includeOffset:e=!0,includeZone:t=!1,includeOffsetSpace:n=!0}={}){let r=`HH:mm:ss.SSS`;return(t||e)&&(n&&(r+=` `),t?r+=`z`:e&&(r+=`ZZ`)),w1(this,r,!0)}toSQL(e={}){return this.isValid?`${this.toSQLDate()} ${this.toSQLTime(e)}`:null}toString(){return this.isValid?this.toISO():a4}[Symbol.for(`nodejs.util.inspect.custom`)](){return this.isValid?`DateTime { ts: ${this.toISO()}, zone: ${this.zone.name}, locale: ${this.locale} }`:`DateTime { Invalid, reason: ${this.invalidReason} }`}valueOf(){return this.toMillis()}toMillis(){return this.isValid?this.ts:NaN}toSeconds(){return this.isValid?this.ts/1e3:NaN}toUnixInteger(){return this.isValid?Math.floor(this.ts/1e3):NaN}toJSON(){return this.toISO()}toBSON(){return this.toJSDate()}toObject(e={}){if(!this.isValid)return{};let t={...this.c};return e.includeConfig&&(t.outputCalendar=this.outputCalendar,t.numberingSystem=this.loc.numberingSystem,t.locale=this.loc.locale),t}toJSDate(){return new Date(this.isValid?this.ts:NaN)}diff(e,t=`milliseconds`,n={}){if(!this.isValid||!e.isValid)return Y2.invalid(`created by diffing an invalid DateTime`);let r={locale:this.locale,numberingSystem:this.numberingSystem,...n},i=HQ(t).map(Y2.normalizeUnit),a=e.valueOf()>this.valueOf(),o=X$(a?this:e,a?e:this,i,r);return a?o.negate():o}diffNow(t=`milliseconds`,n={}){return this.diff(e.now(),t,n)}until(e){return this.isValid?Z2.fromDateTimes(this,e):this}hasSame(e,t,n){if(!this.isValid)return!1;let r=e.valueOf(),i=this.setZone(e.zone,{keepLocalTime:!0});return i.startOf(t,n)<=r&&r<=i.endOf(t,n)}equals(e){return this.isValid&&e.isValid&&this.valueOf()===e.valueOf()&&this.zone.equals(e.zone)&&this.loc.equals(e.loc)}toRelative(t={}){if(!this.isValid)return null;let n=t.base||e.fromObject({},{zone:this.zone}),r=t.padding?this<n?-t.padding:t.padding:0,i=[`years`,`months`,`days`,`hours`,`minutes`,`seconds`],a=t.unit;return Array.isArray(t.unit)&&(i=t.unit,a=void 0),j1(n,this.plus(r),{...t,numeric:`always`,units:i,unit:a})}toRelativeCalendar(t={}){return this.isValid?j1(t.base||e.fromObject({},{zone:this.zone}),this,{...t,numeric:`auto`,units:[`years`,`months`,`days`],calendary:!0}):null}static min(...t){if(!t.every(e.isDateTime))throw new B1(`min requires all arguments be DateTimes`);return UQ(t,e=>e.valueOf(),Math.min)}static max(...t){if(!t.every(e.isDateTime))throw new B1(`max requires all arguments be DateTimes`);return UQ(t,e=>e.valueOf(),Math.max)}static fromFormatExplain(e,t,n={}){let{locale:r=null,numberingSystem:i=null}=n;return f1(A0.fromOpts({locale:r,numberingSystem:i,defaultToEN:!0}),e,t)}static fromStringExplain(t,n,r={}){return e.fromFormatExplain(t,n,r)}static buildFormatParser(e,t={}){let{locale:n=null,numberingSystem:r=null}=t,i=A0.fromOpts({locale:n,numberingSystem:r,defaultToEN:!0});return new i4(i,e)}static fromFormatParser(t,n,r={}){if(FQ(t)||FQ(n))throw new B1(`fromFormatParser requires an input string and a format parser`);let{locale:i=null,numberingSystem:a=null}=r,o=A0.fromOpts({locale:i,numberingSystem:a,defaultToEN:!0});if(!o.equals(n.locale))throw new B1(`fromFormatParser called with a locale of ${o}, but the format parser was created for ${n.locale}`);let{result:s,zone:c,specificOffset:l,invalidReason:u}=n.explainFromTokens(t);return u?e.invalid(u):C1(s,c,r,`format ${n.format}`,t,l)}static get DATE_SHORT(){return W1}static get DATE_MED(){return G1}static get DATE_MED_WITH_WEEKDAY(){return K1}static get DATE_FULL(){return q1}static get DATE_HUGE(){return J1}static get TIME_SIMPLE(){return Y1}static get TIME_WITH_SECONDS(){return X1}static get TIME_WITH_SHORT_OFFSET(){return Z1}static get TIME_WITH_LONG_OFFSET(){return Q1}static get TIME_24_SIMPLE(){return $1}static get TIME_24_WITH_SECONDS(){return e0}static get TIME_24_WITH_SHORT_OFFSET(){return t0}static get TIME_24_WITH_LONG_OFFSET(){return n0}static get DATETIME_SHORT(){return r0}static get DATETIME_SHORT_WITH_SECONDS(){return i0}static get DATETIME_MED(){return a0}static get DATETIME_MED_WITH_SECONDS(){return o0}static get DATETIME_MED_WITH_WEEKDAY(){return s0}static get DATETIME_FULL(){return c0}static get DATETIME_FULL_WITH_SECONDS(){return l0}static get DATETIME_HUGE(){return u0}static get DATETIME_HUGE_WITH_SECONDS(){return d0}}}));function cle(){try{let{pathname:e}=new URL(import.meta.url),t=e.lastIndexOf(`/assets/`);return`${t>=0?e.slice(0,t):``}/api`}catch{return`/api`}}function mP4(e,t){if(t===null||typeof t!=`object`||Array.isArray(t))return t;let n=e!==null&&typeof e==`object`&&!Array.isArray(e)?{...e}:{};for(let[e,r]of Object.entries(t))r===null?delete n[e]:n[e]=mP4(n[e],r);return n}var _4,v4=t((()=>{console.log(`API.js pathname: '${new URL(import.meta.url)}'`),_4=cle()})),y4,b4=t((()=>{Bl(),g4(),v4(),y4=Cl(`control`,{state:()=>({running:!1,running_start:null,mode:1,error_status:``,stats:null,prices:null,schedule:null,schedule_ts:null,update_time:h4.now(),stream:null}),getters:{battery_rows:e=>Object.entries(e.stats?.battery_inverters??{}).map(([e,t])=>{let n=Object.keys(t.ac_side??{})[0]??null;return{name:e,phase:n,control_status:t.control_status,battery:t.battery,ac:n?t.ac_side[n]:null}}),solar_rows:e=>Object.entries(e.stats?.solar_inverters??{}).map(([e,t])=>({name:e,...t})),energy_meter:e=>e.stats?.energy_meter??null,mode_name:e=>{if(e.mode===1)return`idle`;if(e.mode===2)return`manual`;if(e.mode===3)return`static schedule`;if(e.mode===4)return`dynamic schedule`}},actions:{async _make_fetch(e,t=`GET`,n=null){this.error_status=``;let r={method:t};t===`POST`&&n!==null&&(r.headers={"Content-Type":`application/json`},r.body=JSON.stringify(n));let i=await fetch(`${_4}${e}`,r);if(!i.ok)throw Error(`response status: ${i.status}`);return await i.json()},async fetch_log(e){this.error_status=``;let t={method:`POST`,headers:{"Content-Type":`application/json`},body:JSON.stringify(e)};try{let e=await fetch(`${_4}/log`,t);if(!e.ok)throw Error(`response status: ${e.status}`);return await e.text()}catch(e){return this.error_status=`config store: error while fetching log: ${e.msg}`,``}},async query_log(e){this.error_status=``;try{let t=await fetch(`${_4}/log/query?${new URLSearchParams(e)}`);if(!t.ok)throw Error(`response status: ${t.status}`);return{text:await t.text(),offset:Number(t.headers.get(`X-Log-Offset`)??0)}}catch(e){return this.error_status=`control store: error while querying log: ${e.msg}`,null}},_set_status(e){this.running=e.running,this.running_start=e.running_start,this.mode=e.mode,this.stats=e.stats,this.prices=e.prices,this.schedule=e.schedule??null,this.schedule_ts=e.schedule_ts??null,this.update_time=h4.now()},async fetch_status(){try{this._set_status(await this._make_fetch(`/`))}catch(e){this.running=!1,this.running_start=null,this.mode=1,this.stats=null,this.prices=null,this.schedule=null,this.schedule_ts=null,this.error_status=`control store: error while fetching status: ${e.msg}`}},subscribe(){if(typeof EventSource>`u`)return!1;if(this.stream!==null)return!0;let e=new EventSource(`${_4}/stream`);return e.addEventListener(`status`,e=>this._set_status(JSON.parse(e.data))),e.addEventListener(`patch`,e=>{let t=mP4({running:this.running,running_start:this.running_start,mode:this.mode,stats:this.stats,schedule_ts:this.schedule_ts},JSON.parse(e.data));this.running=t.running??!1,this.running_start=t.running_start??null,this.mode=t.mode??1,this.stats=t.stats??null,this.schedule_ts=t.schedule_ts??null,this.update_time=h4.now()}),e.addEventListener(`prices`,e=>{this.prices=JSON.parse(e.data)}),e.addEventListener(`schedule`,e=>{this.schedule=JSON.parse(e.data)}),e.onerror=()=>{this.error_status=`control store: live status stream interrupted, reconnecting`},e.onopen=()=>{this.error_status=``},this.stream=e,!0},unsubscribe(){this.stream!==null&&(this.stream.close(),this.stream=null)},async set_running(e){try{await this._make_fetch(`/run`,`POST`,{running:e})}catch(e){this.config=null,this.error_status=`config store: error while updating general config: ${e.msg}`}console.log(`set_running(${e}): /run POSTed`),await new Promise(e=>setTimeout(e,3e3)),await this.fetch_status()}}})}));I(),Cu(),eQ(),b4();var lle={__name:`Menu`,setup(e){let t=y4(),n=O(!1),r=e=>()=>N(Bz,null,{default:()=>N(e)}),i=O([{label:()=>N(cl,{to:{name:`home`}},{default:()=>`Home`}),key:`go-home`,icon:r(uu)},{label:()=>N(cl,{to:{name:`general_config`}},{default:()=>`General Configuration`}),key:`go-general-config`,icon:r(gu)},{label:`Subsystem Configuration`,key:`go-config`,icon:r(Gl),children:[{label:()=>N(cl,{to:{name:`energy_meter_config`}},{default:()=>`Energy Meter`}),key:`go-energy-meter`,icon:r(yu)},{label:()=>N(cl,{to:{name:`battery_inverters_config`}},{default:()=>`Battery Inverters`}),key:`go-battery-inverters`,icon:r(Zl)},{label:()=>N(cl,{to:{name:`solar_inverters_config`}},{default:()=>`Solar Inverters`}),key:`go-solar-inverters`,icon:r(Su)}]},{label:`Mode Specific Configuration`,key:`go-config`,icon:r(pu),children:[{label:()=>N(cl,{to:{name:`manual_config`}},{default:()=>`Manual Mode`}),key:`go-manual`,icon:r(su)},{label:()=>N(cl,{to:{name:`static_schedule_config`}},{default:()=>`Static Schedule Mode`}),key:`go-static-schedule`,icon:r($l)},{label:()=>N(cl,{to:{name:`dynamic_schedule_config`}},{default:()=>`Dynamic Schedule Mode`}),key:`go-dynamic-schedule`,icon:r(Jl)}]},{label:()=>N(cl,{to:{name:`logfiles`}},{default:()=>`Log Files`}),key:`go-logfiles`,icon:r(iu)}]),a=async()=>{n.value=!0,await t.set_running(!t.running),n.value=!1};return(e,r)=>(Zr(),ni(k(PJ),{cols:`6`},{default:A(()=>[P(k(yJ),{span:`5`},{default:A(()=>[P(k(gX),{options:i.value,mode:`horizontal`,responsive:``},null,8,[`options`])]),_:1}),P(k(yJ),null,{default:A(()=>[P(k(jM),{loading:n.value,disabled:n.value,type:`primary`,onClick:a,style:{float:`right`}},{default:A(()=>[k(t).running?(Zr(),ti(Va,{key:0},[oi(`Stop`)],64)):(Zr(),ti(Va,{key:1},[oi(`Start`)],64))]),_:1},8,[`loading`,`disabled`])]),_:1})]),_:1}))}};I(),eQ();var ule={style:{"margin-left":`20px`,"margin-right":`20px`,"margin-top":`5px`}},dle={__name:`App`,setup(e){return(e,t)=>{let n=uee(`RouterView`);return Zr(),ni(k(PR),{theme:k(ZZ)},{default:A(()=>[M(`div`,ule,[P(lle),P(n)]),P(k(TJ))]),_:1},8,[`theme`])}}},x4,S4,C4,w4,T4=t((()=>{x4=`modulepreload`,S4=function(e){return`/`+e},C4={},w4=function(e,t,n){let r=Promise.resolve();if(t&&t.length>0){let e=document.getElementsByTagName(`link`),i=document.querySelector(`meta[property=csp-nonce]`),a=i?.nonce||i?.getAttribute(`nonce`);function o(e){return Promise.all(e.map(e=>Promise.resolve(e).then(e=>({status:`fulfilled`,value:e}),e=>({status:`rejected`,reason:e}))))}function s(e){return import.meta.resolve?import.meta.resolve(e):new URL(e,import.meta.url).href}r=o(t.map(t=>{if(t=S4(t,n),t=s(t),t in C4)return;C4[t]=!0;let r=t.endsWith(`.css`);for(let n=e.length-1;n>=0;n--){let i=e[n];if(i.href===t&&(!r||i.rel===`stylesheet`))return}let i=document.createElement(`link`);if(i.rel=r?`stylesheet`:x4,r||(i.as=`script`),i.crossOrigin=``,i.href=t,a&&i.setAttribute(`nonce`,a),document.head.appendChild(i),r)return new Promise((e,n)=>{i.addEventListener(`load`,e),i.addEventListener(`error`,()=>n(Error(`Unable to preload CSS for ${t}`)))})}))}function i(e){let t=new Event(`vite:preloadError`,{cancelable:!0});if(t.payload=e,window.dispatchEvent(t),!t.defaultPrevented)throw e}return r.then(t=>{for(let e of t||[])e.status===`rejected`&&i(e.reason);return e().catch(i)})}})),E4,D4=t((()=>{Bl(),v4(),E4=Cl(`configuration`,{state:()=>({config:null,subsystem_types:null,error_status:``}),getters:{loaded:e=>e.config!==null,general:e=>e.config===null?[]:e.config.general,battery_inverters:e=>e.config===null?[]:e.config.battery_inverters,solar_inverters:e=>e.config===null?[]:e.config.solar_inverters,energy_meter:e=>e.config===null?-1:e.config.energy_meter,mode_manual:e=>e.config===null?-1:e.config.mode_manual,mode_static:e=>e.config===null?[]:e.config.mode_static,mode_dynamic:e=>e.config===null?-1:e.config.mode_dynamic,timezone:e=>e.config?.general?.timezone??`UTC`,error:e=>e.error_status!==``,status:e=>e.error_status===``?e.error_status:``},actions:{async _make_fetch(e,t=`GET`,n=null){this.error_status=``;let r={method:t};t===`POST`&&n!==null&&(r.headers={"Content-Type":`application/json`},r.body=JSON.stringify(n));let i=await fetch(`${_4}${e}`,r);if(!i.ok)throw Error(`response status: ${i.status}`);return await i.json()},async fetch_config(){try{this.config=await this._make_fetch(`/config`)}catch(e){this.config=null,this.error_status=`config store: error while fetching config: ${e.msg}`}},async sync_general_config(e){try{await this._make_fetch(`/config/general`,`POST`,e)}catch(e){this.config=null,this.error_status=`config store: error while updating general config: ${e.msg}`}},async sync_battery_inverters_config(e){try{await this._make_fetch(`/config/battery_inverters`,`POST`,e)}catch(e){this.config=null,this.error_status=`config store: error while updating inverter config: ${e.msg}`}},async sync_solar_inverters_config(e){try{await this._make_fetch(`/config/solar_inverters`,`POST`,e)}catch(e){this.config=null,this.error_status=`config store: error while updating solar inverter config: ${e.msg}`}},async sync_energy_meter_config(e){try{await this._make_fetch(`/config/energy_meter`,`POST`,e)}catch(e){this.config=null,this.error_status=`config store: error while updating energy meter config: ${e.msg}`}},async sync_mode_manual_config(e){try{await this._make_fetch(`/config/mode/manual`,`POST`,e)}catch(e){this.config=null,this.error_status=`config store: error while updating manual mode config: ${e.msg}`}},async sync_mode_static_config(e){try{await this._make_fetch(`/config/mode/static`,`POST`,e)}catch(e){this.config=null,this.error_status=`config store: error while updating static mode config: ${e.msg}`}},async sync_mode_dynamic_config(e){try{await this._make_fetch(`/config/mode/dynamic`,`POST`,e)}catch(e){this.config=null,this.error_status=`config store: error while updating dynamic mode config: ${e.msg}`}},async apply_bart_home_setup(e){try{await this._make_fetch(`/config/bart_setup`,`POST`)}catch(e){this.config=null,this.error_status=`config store: error while applying Bart home setup: ${e.msg}`}},async fetch_subsystem_types(e){if(!this.subsystem_types)try{this.subsystem_types=await this._make_fetch(`/config/subsystem_types`)}catch(e){this.subsystem_types=null,this.error_status=`config store: error while fetching subsystem types: ${e.msg}`}}}})})),O4,k4,A4,j4,fle=t((()=>{I(),eQ(),b4(),O4={rowspan:`2`},k4={rowspan:`2`},A4={colspan:`4`},j4={__name:`StatusTables`,setup(e){let t=y4();function n(e){return e==null?`—`:`${Math.round(e/100)/10} kW`}function r(e){return e==null?`—`:Math.round(e)}return(e,i)=>(Zr(),ti(Va,null,[k(t).battery_rows.length?(Zr(),ni(k(bR),{key:0,"arrow-placement":`right`},{default:A(()=>[P(k(wR),null,{header:A(()=>[P(k(AZ),{prefix:`bar`},{default:A(()=>[...i[0]||=[oi(` Battery Inverters `,-1)]]),_:1})]),default:A(()=>[P(k(hZ),{bordered:!1,"single-line":!1},{default:A(()=>[i[5]||=M(`thead`,null,[M(`tr`,null,[M(`th`,null,`Inverter`),M(`th`,null,`Phase`),M(`th`,null,`\xA0`),M(`th`,null,`Current`),M(`th`,null,`Voltage`),M(`th`,null,`Power`),M(`th`,null,`Status`),M(`th`,null,`Charge`),M(`th`,null,`Temperature`)])],-1),M(`tbody`,null,[(Zr(!0),ti(Va,null,mr(k(t).battery_rows,e=>(Zr(),ti(Va,{key:e.name},[M(`tr`,null,[M(`td`,O4,De(e.name),1),M(`td`,k4,De(e.phase),1),i[1]||=M(`td`,null,`Battery`,-1),M(`td`,null,De(r(e.battery.A))+` A`,1),M(`td`,null,De(r(e.battery.V))+` V`,1),i[2]||=M(`td`,null,null,-1),M(`td`,null,De(e.battery.status),1),M(`td`,null,[P(k(PX),{type:`line`,percentage:Math.round(e.battery.charge??0)},null,8,[`percentage`])]),M(`td`,null,De(r(e.battery.temp_l))+` ℃ - `+De(r(e.battery.temp_h))+` ℃ `,1)]),M(`tr`,null,[i[3]||=M(`td`,null,`AC side`,-1),M(`td`,null,De(r(e.ac?.A))+` A`,1),M(`td`,null,De(r(e.ac?.V))+` V`,1),M(`td`,null,De(r(e.ac?.P))+` W`,1),i[4]||=M(`td`,{colspan:`3`},null,-1)])],64))),128))])]),_:1})]),_:1})]),_:1})):ci(``,!0),k(t).solar_rows.length?(Zr(),ni(k(bR),{key:1,"arrow-placement":`right`},{default:A(()=>[P(k(wR),null,{header:A(()=>[P(k(AZ),{prefix:`bar`},{default:A(()=>[...i[6]||=[oi(` Solar Inverters `,-1)]]),_:1})]),default:A(()=>[(Zr(!0),ti(Va,null,mr(k(t).solar_rows,e=>(Zr(),ni(k(hZ),{key:e.name,bordered:!1,"single-line":!1},{default:A(()=>[M(`thead`,null,[M(`tr`,null,[M(`th`,null,De(e.name),1),i[7]||=M(`th`,null,`L1`,-1),i[8]||=M(`th`,null,`L2`,-1),i[9]||=M(`th`,null,`L3`,-1),i[10]||=M(`th`,null,`Total`,-1)])]),M(`tbody`,null,[M(`tr`,null,[i[11]||=M(`td`,null,`Power`,-1),M(`td`,null,De(n(e.ac_side?.L1?.P)),1),M(`td`,null,De(n(e.ac_side?.L2?.P)),1),M(`td`,null,De(n(e.ac_side?.L3?.P)),1),M(`td`,null,De(n(e.total_power)),1)]),M(`tr`,null,[i[12]||=M(`td`,null,`Setpoint Limit`,-1),M(`td`,A4,De(e.setpoint_limit===null||e.setpoint_limit===void 0?`not set`:n(e.setpoint_limit)),1)])])]),_:2},1024))),128))]),_:1})]),_:1})):ci(``,!0),k(t).energy_meter?(Zr(),ni(k(bR),{key:2,"arrow-placement":`right`},{default:A(()=>[P(k(wR),null,{header:A(()=>[P(k(AZ),{prefix:`bar`},{default:A(()=>[...i[13]||=[oi(` Energy Meter `,-1)]]),_:1})]),default:A(()=>[P(k(hZ),{bordered:!1,"single-line":!1},{default:A(()=>[i[19]||=M(`thead`,null,[M(`tr`,null,[M(`th`),M(`th`,null,`L1`),M(`th`,null,`L2`),M(`th`,null,`L3`)])],-1),M(`tbody`,null,[M(`tr`,null,[i[14]||=M(`td`,null,`Current`,-1),M(`td`,null,De(r(k(t).energy_meter.L1.A))+` A`,1),M(`td`,null,De(r(k(t).energy_meter.L2.A))+` A`,1),M(`td`,null,De(r(k(t).energy_meter.L3.A))+` A`,1)]),M(`tr`,null,[i[15]||=M(`td`,null,`Max Current`,-1),M(`td`,null,De(r(k(t).energy_meter.L1.Amax))+` A`,1),M(`td`,null,De(r(k(t).energy_meter.L2.Amax))+` A`,1),M(`td`,null,De(r(k(t).energy_meter.L3.Amax))+` A`,1)]),M(`tr`,null,[i[16]||=M(`td`,null,`Voltage`,-1),M(`td`,null,De(r(k(t).energy_meter.L1.V))+` V`,1),M(`td`,null,De(r(k(t).energy_meter.L2.V))+` V`,1),M(`td`,null,De(r(k(t).energy_meter.L3.V))+` V`,1)]),M(`tr`,null,[i[17]||=M(`td`,null,`Power`,-1),M(`td`,null,De(r(k(t).energy_meter.L1.P))+` W`,1),M(`td`,null,De(r(k(t).energy_meter.L2.P))+` W`,1),M(`td`,null,De(r(k(t).energy_meter.L3.P))+` W`,1)]),M(`tr`,null,[i[18]||=M(`td`,null,`Status`,-1),M(`td`,null,De(k(t).energy_meter.L1.status),1),M(`td`,null,De(k(t).energy_meter.L2.status),1),M(`td`,null,De(k(t).energy_meter.L3.status),1)])])]),_:1})]),_:1})]),_:1})):ci(``,!0)],64))}}}));function M4(){let e=E4(),t=F(()=>e.timezone);return{tz:t,now:()=>h4.now().setZone(t.value)}}var N4=t((()=>{I(),g4(),D4()}));function P4(e){return e+.5|0}function F4(e){return q4(P4(e*2.55),0,255)}function I4(e){return q4(P4(e*255),0,255)}function L4(e){return q4(P4(e/2.55)/100,0,1)}function R4(e){return q4(P4(e*100),0,100)}function ple(e){var t=e.length,n;return e[0]===`#`&&(t===4||t===5?n={r:255&J4[e[1]]*17,g:255&J4[e[2]]*17,b:255&J4[e[3]]*17,a:t===5?J4[e[4]]*17:255}:(t===7||t===9)&&(n={r:J4[e[1]]<<4|J4[e[2]],g:J4[e[3]]<<4|J4[e[4]],b:J4[e[5]]<<4|J4[e[6]],a:t===9?J4[e[7]]<<4|J4[e[8]]:255})),n}function mle(e){var t=$4(e)?X4:Z4;return e?`#`+t(e.r)+t(e.g)+t(e.b)+e3(e.a,t):void 0}function z4(e,t,n){let r=t*Math.min(n,1-n),i=(t,i=(t+e/30)%12)=>n-r*Math.max(Math.min(i-3,9-i,1),-1);return[i(0),i(8),i(4)]}function hle(e,t,n){let r=(r,i=(r+e/60)%6)=>n-n*t*Math.max(Math.min(i,4-i,1),0);return[r(5),r(3),r(1)]}function gle(e,t,n){let r=z4(e,1,.5),i;for(t+n>1&&(i=1/(t+n),t*=i,n*=i),i=0;i<3;i++)r[i]*=1-t-n,r[i]+=t;return r}function _le(e,t,n,r,i){return e===i?(t-n)/r+(t<n?6:0):t===i?(n-e)/r+2:(e-t)/r+4}function B4(e){let t=e.r/255,n=e.g/255,r=e.b/255,i=Math.max(t,n,r),a=Math.min(t,n,r),o=(i+a)/2,s,c,l;return i!==a&&(l=i-a,c=o>.5?l/(2-i-a):l/(i+a),s=_le(t,n,r,l,i),s=s*60+.5),[s|0,c||0,o]}function V4(e,t,n,r){return(Array.isArray(t)?e(t[0],t[1],t[2]):e(t,n,r)).map(I4)}function H4(e,t,n){return V4(z4,e,t,n)}function vle(e,t,n){return V4(gle,e,t,n)}function yle(e,t,n){return V4(hle,e,t,n)}function U4(e){return(e%360+360)%360}function ble(e){let t=t3.exec(e),n=255,r;if(!t)return;t[5]!==r&&(n=t[6]?F4(+t[5]):I4(+t[5]));let i=U4(+t[2]),a=t[3]/100,o=t[4]/100;return r=t[1]===`hwb`?vle(i,a,o):t[1]===`hsv`?yle(i,a,o):H4(i,a,o),{r:r[0],g:r[1],b:r[2],a:n}}function xle(e,t){var n=B4(e);n[0]=U4(n[0]+t),n=H4(n),e.r=n[0],e.g=n[1],e.b=n[2]}function Sle(e){if(!e)return;let t=B4(e),n=t[0],r=R4(t[1]),i=R4(t[2]);return e.a<255?`hsla(${n}, ${r}%, ${i}%, ${L4(e.a)})`:`hsl(${n}, ${r}%, ${i}%)`}function Cle(){let e={},t=Object.keys(r3),n=Object.keys(n3),r,i,a,o,s;for(r=0;r<t.length;r++){for(o=s=t[r],i=0;i<n.length;i++)a=n[i],s=s.replace(a,n3[a]);a=parseInt(r3[o],16),e[s]=[a>>16&255,a>>8&255,a&255]}return e}function wle(e){i3||(i3=Cle(),i3.transparent=[0,0,0,0]);let t=i3[e.toLowerCase()];return t&&{r:t[0],g:t[1],b:t[2],a:t.length===4?t[3]:255}}function Tle(e){let t=a3.exec(e),n=255,r,i,a;if(t){if(t[7]!==r){let e=+t[7];n=t[8]?F4(e):q4(e*255,0,255)}return r=+t[1],i=+t[3],a=+t[5],r=255&(t[2]?F4(r):q4(r,0,255)),i=255&(t[4]?F4(i):q4(i,0,255)),a=255&(t[6]?F4(a):q4(a,0,255)),{r,g:i,b:a,a:n}}}function Ele(e){return e&&(e.a<255?`rgba(${e.r}, ${e.g}, ${e.b}, ${L4(e.a)})`:`rgb(${e.r}, ${e.g}, ${e.b})`)}function Dle(e,t,n){let r=s3(L4(e.r)),i=s3(L4(e.g)),a=s3(L4(e.b));return{r:I4(o3(r+n*(s3(L4(t.r))-r))),g:I4(o3(i+n*(s3(L4(t.g))-i))),b:I4(o3(a+n*(s3(L4(t.b))-a))),a:e.a+n*(t.a-e.a)}}function W4(e,t,n){if(e){let r=B4(e);r[t]=Math.max(0,Math.min(r[t]+r[t]*n,t===0?360:1)),r=H4(r),e.r=r[0],e.g=r[1],e.b=r[2]}}function G4(e,t){return e&&Object.assign(t||{},e)}function K4(e){var t={r:0,g:0,b:0,a:255};return Array.isArray(e)?e.length>=3&&(t={r:e[0],g:e[1],b:e[2],a:255},e.length>3&&(t.a=I4(e[3]))):(t=G4(e,{r:0,g:0,b:0,a:1}),t.a=I4(t.a)),t}function Ole(e){return e.charAt(0)===`r`?Tle(e):ble(e)}var q4,J4,Y4,X4,Z4,Q4,$4,e3,t3,n3,r3,i3,a3,o3,s3,c3,kle=t((()=>{q4=(e,t,n)=>Math.max(Math.min(e,n),t),J4={0:0,1:1,2:2,3:3,4:4,5:5,6:6,7:7,8:8,9:9,A:10,B:11,C:12,D:13,E:14,F:15,a:10,b:11,c:12,d:13,e:14,f:15},Y4=[...`0123456789ABCDEF`],X4=e=>Y4[e&15],Z4=e=>Y4[(e&240)>>4]+Y4[e&15],Q4=e=>(e&240)>>4==(e&15),$4=e=>Q4(e.r)&&Q4(e.g)&&Q4(e.b)&&Q4(e.a),e3=(e,t)=>e<255?t(e):``,t3=/^(hsla?|hwb|hsv)\(\s*([-+.e\d]+)(?:deg)?[\s,]+([-+.e\d]+)%[\s,]+([-+.e\d]+)%(?:[\s,]+([-+.e\d]+)(%)?)?\s*\)$/,n3={x:`dark`,Z:`light`,Y:`re`,X:`blu`,W:`gr`,V:`medium`,U:`slate`,A:`ee`,T:`ol`,S:`or`,B:`ra`,C:`lateg`,D:`ights`,R:`in`,Q:`turquois`,E:`hi`,P:`ro`,O:`al`,N:`le`,M:`de`,L:`yello`,F:`en`,K:`ch`,G:`arks`,H:`ea`,I:`ightg`,J:`wh`},r3={OiceXe:`f0f8ff`,antiquewEte:`faebd7`,aqua:`ffff`,aquamarRe:`7fffd4`,azuY:`f0ffff`,beige:`f5f5dc`,bisque:`ffe4c4`,black:`0`,blanKedOmond:`ffebcd`,Xe:`ff`,XeviTet:`8a2be2`,bPwn:`a52a2a`,burlywood:`deb887`,caMtXe:`5f9ea0`,KartYuse:`7fff00`,KocTate:`d2691e`,cSO:`ff7f50`,cSnflowerXe:`6495ed`,cSnsilk:`fff8dc`,crimson:`dc143c`,cyan:`ffff`,xXe:`8b`,xcyan:`8b8b`,xgTMnPd:`b8860b`,xWay:`a9a9a9`,xgYF:`6400`,xgYy:`a9a9a9`,xkhaki:`bdb76b`,xmagFta:`8b008b`,xTivegYF:`556b2f`,xSange:`ff8c00`,xScEd:`9932cc`,xYd:`8b0000`,xsOmon:`e9967a`,xsHgYF:`8fbc8f`,xUXe:`483d8b`,xUWay:`2f4f4f`,xUgYy:`2f4f4f`,xQe:`ced1`,xviTet:`9400d3`,dAppRk:`ff1493`,dApskyXe:`bfff`,dimWay:`696969`,dimgYy:`696969`,dodgerXe:`1e90ff`,fiYbrick:`b22222`,flSOwEte:`fffaf0`,foYstWAn:`228b22`,fuKsia:`ff00ff`,gaRsbSo:`dcdcdc`,ghostwEte:`f8f8ff`,gTd:`ffd700`,gTMnPd:`daa520`,Way:`808080`,gYF:`8000`,gYFLw:`adff2f`,gYy:`808080`,honeyMw:`f0fff0`,hotpRk:`ff69b4`,RdianYd:`cd5c5c`,Rdigo:`4b0082`,ivSy:`fffff0`,khaki:`f0e68c`,lavFMr:`e6e6fa`,lavFMrXsh:`fff0f5`,lawngYF:`7cfc00`,NmoncEffon:`fffacd`,ZXe:`add8e6`,ZcSO:`f08080`,Zcyan:`e0ffff`,ZgTMnPdLw:`fafad2`,ZWay:`d3d3d3`,ZgYF:`90ee90`,ZgYy:`d3d3d3`,ZpRk:`ffb6c1`,ZsOmon:`ffa07a`,ZsHgYF:`20b2aa`,ZskyXe:`87cefa`,ZUWay:`778899`,ZUgYy:`778899`,ZstAlXe:`b0c4de`,ZLw:`ffffe0`,lime:`ff00`,limegYF:`32cd32`,lRF:`faf0e6`,magFta:`ff00ff`,maPon:`800000`,VaquamarRe:`66cdaa`,VXe:`cd`,VScEd:`ba55d3`,VpurpN:`9370db`,VsHgYF:`3cb371`,VUXe:`7b68ee`,VsprRggYF:`fa9a`,VQe:`48d1cc`,VviTetYd:`c71585`,midnightXe:`191970`,mRtcYam:`f5fffa`,mistyPse:`ffe4e1`,moccasR:`ffe4b5`,navajowEte:`ffdead`,navy:`80`,Tdlace:`fdf5e6`,Tive:`808000`,TivedBb:`6b8e23`,Sange:`ffa500`,SangeYd:`ff4500`,ScEd:`da70d6`,pOegTMnPd:`eee8aa`,pOegYF:`98fb98`,pOeQe:`afeeee`,pOeviTetYd:`db7093`,papayawEp:`ffefd5`,pHKpuff:`ffdab9`,peru:`cd853f`,pRk:`ffc0cb`,plum:`dda0dd`,powMrXe:`b0e0e6`,purpN:`800080`,YbeccapurpN:`663399`,Yd:`ff0000`,Psybrown:`bc8f8f`,PyOXe:`4169e1`,saddNbPwn:`8b4513`,sOmon:`fa8072`,sandybPwn:`f4a460`,sHgYF:`2e8b57`,sHshell:`fff5ee`,siFna:`a0522d`,silver:`c0c0c0`,skyXe:`87ceeb`,UXe:`6a5acd`,UWay:`708090`,UgYy:`708090`,snow:`fffafa`,sprRggYF:`ff7f`,stAlXe:`4682b4`,tan:`d2b48c`,teO:`8080`,tEstN:`d8bfd8`,tomato:`ff6347`,Qe:`40e0d0`,viTet:`ee82ee`,JHt:`f5deb3`,wEte:`ffffff`,wEtesmoke:`f5f5f5`,Lw:`ffff00`,LwgYF:`9acd32`},a3=/^rgba?\(\s*([-+.\d]+)(%)?[\s,]+([-+.e\d]+)(%)?[\s,]+([-+.e\d]+)(%)?(?:[\s,/]+([-+.e\d]+)(%)?)?\s*\)$/,o3=e=>e<=.0031308?e*12.92:e**(1/2.4)*1.055-.055,s3=e=>e<=.04045?e/12.92:((e+.055)/1.055)**2.4,c3=class e{constructor(t){if(t instanceof e)return t;let n=typeof t,r;n===`object`?r=K4(t):n===`string`&&(r=ple(t)||wle(t)||Ole(t)),this._rgb=r,this._valid=!!r}get valid(){return this._valid}get rgb(){var e=G4(this._rgb);return e&&(e.a=L4(e.a)),e}set rgb(e){this._rgb=K4(e)}rgbString(){return this._valid?Ele(this._rgb):void 0}hexString(){return this._valid?mle(this._rgb):void 0}hslString(){return this._valid?Sle(this._rgb):void 0}mix(e,t){if(e){let n=this.rgb,r=e.rgb,i,a=t===i?.5:t,o=2*a-1,s=n.a-r.a,c=((o*s===-1?o:(o+s)/(1+o*s))+1)/2;i=1-c,n.r=255&c*n.r+i*r.r+.5,n.g=255&c*n.g+i*r.g+.5,n.b=255&c*n.b+i*r.b+.5,n.a=a*n.a+(1-a)*r.a,this.rgb=n}return this}interpolate(e,t){return e&&(this._rgb=Dle(this._rgb,e._rgb,t)),this}clone(){return new e(this.rgb)}alpha(e){return this._rgb.a=I4(e),this}clearer(e){let t=this._rgb;return t.a*=1-e,this}greyscale(){let e=this._rgb;return e.r=e.g=e.b=P4(e.r*.3+e.g*.59+e.b*.11),this}opaquer(e){let t=this._rgb;return t.a*=1+e,this}negate(){let e=this._rgb;return e.r=255-e.r,e.g=255-e.g,e.b=255-e.b,this}lighten(e){return W4(this._rgb,2,e),this}darken(e){return W4(this._rgb,2,-e),this}saturate(e){return W4(this._rgb,1,e),this}desaturate(e){return W4(this._rgb,1,-e),this}rotate(e){return xle(this._rgb,e),this}}}));function l3(){}function u3(e){return e==null}function d3(e){if(Array.isArray&&Array.isArray(e))return!0;let t=Object.prototype.toString.call(e);return t.slice(0,7)===`[object`&&t.slice(-6)===`Array]`}function f3(e){return e!==null&&Object.prototype.toString.call(e)===`[object Object]`}function p3(e){return(typeof e==`number`||e instanceof Number)&&isFinite(+e)}function m3(e,t){return p3(e)?e:t}function h3(e,t){return e===void 0?t:e}function g3(e,t,n){if(e&&typeof e.call==`function`)return e.apply(n,t)}function _3(e,t,n,r){let i,a,o;if(d3(e))if(a=e.length,r)for(i=a-1;i>=0;i--)t.call(n,e[i],i);else for(i=0;i<a;i++)t.call(n,e[i],i);else if(f3(e))for(o=Object.keys(e),a=o.length,i=0;i<a;i++)t.call(n,e[o[i]],o[i])}function v3(e,t){let n,r,i,a;if(!e||!t||e.length!==t.length)return!1;for(n=0,r=e.length;n<r;++n)if(i=e[n],a=t[n],i.datasetIndex!==a.datasetIndex||i.index!==a.index)return!1;return!0}function y3(e){if(d3(e))return e.map(y3);if(f3(e)){let t=Object.create(null),n=Object.keys(e),r=n.length,i=0;for(;i<r;++i)t[n[i]]=y3(e[n[i]]);return t}return e}function b3(e){return[`__proto__`,`prototype`,`constructor`].indexOf(e)===-1}function Ale(e,t,n,r){if(!b3(e))return;let i=t[e],a=n[e];f3(i)&&f3(a)?x3(i,a,r):t[e]=y3(a)}function x3(e,t,n){let r=d3(t)?t:[t],i=r.length;if(!f3(e))return e;n||={};let a=n.merger||Ale,o;for(let t=0;t<i;++t){if(o=r[t],!f3(o))continue;let i=Object.keys(o);for(let t=0,r=i.length;t<r;++t)a(i[t],e,o,n)}return e}function S3(e,t){return x3(e,t,{merger:jle})}function jle(e,t,n){if(!b3(e))return;let r=t[e],i=n[e];f3(r)&&f3(i)?S3(r,i):Object.prototype.hasOwnProperty.call(t,e)||(t[e]=y3(i))}function Mle(e){let t=e.split(`.`),n=[],r=``;for(let e of t)r+=e,r.endsWith(`\\`)?r=r.slice(0,-1)+`.`:(n.push(r),r=``);return n}function Nle(e){let t=Mle(e);return e=>{for(let n of t){if(n===``)break;e&&=e[n]}return e}}function C3(e,t){return(z6[t]||(z6[t]=Nle(t)))(e)}function w3(e){return e.charAt(0).toUpperCase()+e.slice(1)}function Ple(e){return e.type===`mouseup`||e.type===`click`||e.type===`contextmenu`}function T3(e,t,n){return Math.abs(e-t)<n}function E3(e){let t=Math.round(e);e=T3(e,t,e/1e3)?t:e;let n=10**Math.floor(Z6(e)),r=e/n;return(r<=1?1:r<=2?2:r<=5?5:10)*n}function Fle(e){let t=[],n=Math.sqrt(e),r;for(r=1;r<n;r++)e%r===0&&(t.push(r),t.push(e/r));return n===(n|0)&&t.push(n),t.sort((e,t)=>e-t).pop(),t}function Ile(e){return typeof e==`symbol`||typeof e==`object`&&!!e&&!(Symbol.toPrimitive in e||`toString`in e||`valueOf`in e)}function D3(e){return!Ile(e)&&!isNaN(parseFloat(e))&&isFinite(e)}function Lle(e,t){let n=Math.round(e);return n-t<=e&&n+t>=e}function O3(e,t,n){let r,i,a;for(r=0,i=e.length;r<i;r++)a=e[r][n],isNaN(a)||(t.min=Math.min(t.min,a),t.max=Math.max(t.max,a))}function k3(e){return U6/180*e}function A3(e){return 180/U6*e}function j3(e){if(!p3(e))return;let t=1,n=0;for(;Math.round(e*t)/t!==e;)t*=10,n++;return n}function Rle(e,t){let n=t.x-e.x,r=t.y-e.y,i=Math.sqrt(n*n+r*r),a=Math.atan2(r,n);return a<-.5*U6&&(a+=W6),{angle:a,distance:i}}function M3(e,t){return Math.sqrt((t.x-e.x)**2+(t.y-e.y)**2)}function zle(e,t){return(e-t+G6)%W6-U6}function N3(e){return(e%W6+W6)%W6}function P3(e,t,n,r){let i=N3(e),a=N3(t),o=N3(n),s=N3(a-i),c=N3(o-i),l=N3(i-a),u=N3(i-o);return i===a||i===o||r&&a===o||s>c&&l<u}function F3(e,t,n){return Math.max(t,Math.min(n,e))}function Ble(e){return F3(e,-32768,32767)}function I3(e,t,n,r=1e-6){return e>=Math.min(t,n)-r&&e<=Math.max(t,n)+r}function L3(e,t,n){n||=(n=>e[n]<t);let r=e.length-1,i=0,a;for(;r-i>1;)a=i+r>>1,n(a)?i=a:r=a;return{lo:i,hi:r}}function Vle(e,t,n){let r=0,i=e.length;for(;r<i&&e[r]<t;)r++;for(;i>r&&e[i-1]>n;)i--;return r>0||i<e.length?e.slice(r,i):e}function Hle(e,t){if(e._chartjs){e._chartjs.listeners.push(t);return}Object.defineProperty(e,"_chartjs",{configurable:!0,enumerable:!1,value:{listeners:[t]}}),t8.forEach(t=>{let n=`_onData`+w3(t),r=e[t];Object.defineProperty(e,t,{configurable:!0,enumerable:!1,value(...t){let i=r.apply(this,t);return e._chartjs.listeners.forEach(e=>{typeof e[n]==`function`&&e[n](...t)}),i}})})}function R3(e,t){let n=e._chartjs;if(!n)return;let r=n.listeners,i=r.indexOf(t);i!==-1&&r.splice(i,1),!(r.length>0)&&(t8.forEach(t=>{delete e[t]}),delete e._chartjs)}function Ule(e){let t=new Set(e);return t.size===e.length?e:Array.from(t)}function z3(e,t){let n=[],r=!1;return function(...i){n=i,r||(r=!0,n8.call(window,()=>{r=!1,e.apply(t,n)}))}}function Wle(e,t){let n;return function(...r){return t?(clearTimeout(n),n=setTimeout(e,t,r)):e.apply(this,r),t}}function Gle(e,t,n){let r=t.length,i=0,a=r;if(e._sorted){let{iScale:o,vScale:s,_parsed:c}=e,l=e.dataset&&e.dataset.options?e.dataset.options.spanGaps:null,u=o.axis,{min:d,max:f,minDefined:p,maxDefined:m}=o.getUserBounds();if(p){if(i=Math.min($6(c,u,d).lo,n?r:$6(t,u,o.getPixelForValue(d)).lo),l){let e=c.slice(0,i+1).reverse().findIndex(e=>!u3(e[s.axis]));i-=Math.max(0,e)}i=F3(i,0,r-1)}if(m){let e=Math.max($6(c,o.axis,f,!0).hi+1,n?0:$6(t,u,o.getPixelForValue(f),!0).hi+1);if(l){let t=c.slice(e-1).findIndex(e=>!u3(e[s.axis]));e+=Math.max(0,t)}a=F3(e,i,r)-i}else a=r-i}return{start:i,count:a}}function Kle(e){let{xScale:t,yScale:n,_scaleRanges:r}=e,i={xmin:t.min,xmax:t.max,ymin:n.min,ymax:n.max};if(!r)return e._scaleRanges=i,!0;let a=r.xmin!==t.min||r.xmax!==t.max||r.ymin!==n.min||r.ymax!==n.max;return Object.assign(r,i),a}function B3(e){if(e&&typeof e==`object`){let t=e.toString();return t===`[object CanvasPattern]`||t===`[object CanvasGradient]`}return!1}function V3(e){return B3(e)?e:new c3(e)}function H3(e){return B3(e)?e:new c3(e).saturate(.5).darken(.1).hexString()}function qle(e){e.set(`animation`,{delay:void 0,duration:1e3,easing:`easeOutQuart`,fn:void 0,from:void 0,loop:void 0,to:void 0,type:void 0}),e.describe(`animation`,{_fallback:!1,_indexable:!1,_scriptable:e=>e!==`onProgress`&&e!==`onComplete`&&e!==`fn`}),e.set(`animations`,{colors:{type:`color`,properties:d8},numbers:{type:`number`,properties:u8}}),e.describe(`animations`,{_fallback:`animation`}),e.set(`transitions`,{active:{animation:{duration:400}},resize:{animation:{duration:0}},show:{animations:{colors:{from:`transparent`},visible:{type:`boolean`,duration:0}}},hide:{animations:{colors:{to:`transparent`},visible:{type:`boolean`,easing:`linear`,fn:e=>e|0}}}})}function Jle(e){e.set(`layout`,{autoPadding:!0,padding:{top:0,right:0,bottom:0,left:0}})}function Yle(e,t){t||={};let n=e+JSON.stringify(t),r=f8.get(n);return r||(r=new Intl.NumberFormat(e,t),f8.set(n,r)),r}function U3(e,t,n){return Yle(t,n).format(e)}function Xle(e,t){let n=t.length>3?t[2].value-t[1].value:t[1].value-t[0].value;return Math.abs(n)>=1&&e!==Math.floor(e)&&(n=e-Math.floor(e)),n}function Zle(e){e.set(`scale`,{display:!0,offset:!1,reverse:!1,beginAtZero:!1,bounds:`ticks`,clip:!0,grace:0,grid:{display:!0,lineWidth:1,drawOnChartArea:!0,drawTicks:!0,tickLength:8,tickWidth:(e,t)=>t.lineWidth,tickColor:(e,t)=>t.color,offset:!1},border:{display:!0,dash:[],dashOffset:0,width:1},title:{display:!1,text:``,padding:{top:4,bottom:4}},ticks:{minRotation:0,maxRotation:50,mirror:!1,textStrokeWidth:0,textStrokeColor:``,padding:3,display:!0,autoSkip:!0,autoSkipPadding:3,labelOffset:0,callback:m8.formatters.values,minor:{},major:{},align:`center`,crossAlign:`near`,showLabelBackdrop:!1,backdropColor:`rgba(255, 255, 255, 0.75)`,backdropPadding:2}}),e.route(`scale.ticks`,`color`,``,`color`),e.route(`scale.grid`,`color`,``,`borderColor`),e.route(`scale.border`,`color`,``,`borderColor`),e.route(`scale.title`,`color`,``,`color`),e.describe(`scale`,{_fallback:!1,_scriptable:e=>!e.startsWith(`before`)&&!e.startsWith(`after`)&&e!==`callback`&&e!==`parser`,_indexable:e=>e!==`borderDash`&&e!==`tickBorderDash`&&e!==`dash`}),e.describe(`scales`,{_fallback:`scale`}),e.describe(`scale.ticks`,{_scriptable:e=>e!==`backdropPadding`&&e!==`callback`,_indexable:e=>e!==`backdropPadding`})}function W3(e,t){if(!t)return e;let n=t.split(`.`);for(let t=0,r=n.length;t<r;++t){let r=n[t];e=e[r]||(e[r]=Object.create(null))}return e}function G3(e,t,n){return typeof t==`string`?x3(W3(e,t),n):x3(W3(e,``),t)}function Qle(e){return!e||u3(e.size)||u3(e.family)?null:(e.style?e.style+` `:``)+(e.weight?e.weight+` `:``)+e.size+`px `+e.family}function K3(e,t,n,r,i){let a=t[i];return a||(a=t[i]=e.measureText(i).width,n.push(i)),a>r&&(r=a),r}function $le(e,t,n,r){r||={};let i=r.data=r.data||{},a=r.garbageCollect=r.garbageCollect||[];r.font!==t&&(i=r.data={},a=r.garbageCollect=[],r.font=t),e.save(),e.font=t;let o=0,s=n.length,c,l,u,d,f;for(c=0;c<s;c++)if(d=n[c],d!=null&&!d3(d))o=K3(e,i,a,o,d);else if(d3(d))for(l=0,u=d.length;l<u;l++)f=d[l],f!=null&&!d3(f)&&(o=K3(e,i,a,o,f));e.restore();let p=a.length/2;if(p>n.length){for(c=0;c<p;c++)delete i[a[c]];a.splice(0,p)}return o}function q3(e,t,n){let r=e.currentDevicePixelRatio,i=n===0?0:Math.max(n/2,.5);return Math.round((t-i)*r)/r+i}function J3(e,t){!t&&!e||(t||=e.getContext(`2d`),t.save(),t.resetTransform(),t.clearRect(0,0,e.width,e.height),t.restore())}function Y3(e,t,n,r){X3(e,t,n,r,null)}function X3(e,t,n,r,i){let a,o,s,c,l,u,d,f,p=t.pointStyle,m=t.rotation,h=t.radius,g=(m||0)*q6;if(p&&typeof p==`object`&&(a=p.toString(),a===`[object HTMLImageElement]`||a===`[object HTMLCanvasElement]`)){e.save(),e.translate(n,r),e.rotate(g),e.drawImage(p,-p.width/2,-p.height/2,p.width,p.height),e.restore();return}if(!(isNaN(h)||h<=0)){switch(e.beginPath(),p){default:i?e.ellipse(n,r,i/2,h,0,0,W6):e.arc(n,r,h,0,W6),e.closePath();break;case`triangle`:u=i?i/2:h,e.moveTo(n+Math.sin(g)*u,r-Math.cos(g)*h),g+=X6,e.lineTo(n+Math.sin(g)*u,r-Math.cos(g)*h),g+=X6,e.lineTo(n+Math.sin(g)*u,r-Math.cos(g)*h),e.closePath();break;case`rectRounded`:l=h*.516,c=h-l,o=Math.cos(g+Y6)*c,d=Math.cos(g+Y6)*(i?i/2-l:c),s=Math.sin(g+Y6)*c,f=Math.sin(g+Y6)*(i?i/2-l:c),e.arc(n-d,r-s,l,g-U6,g-J6),e.arc(n+f,r-o,l,g-J6,g),e.arc(n+d,r+s,l,g,g+J6),e.arc(n-f,r+o,l,g+J6,g+U6),e.closePath();break;case`rect`:if(!m){c=Math.SQRT1_2*h,u=i?i/2:c,e.rect(n-u,r-c,2*u,2*c);break}g+=Y6;case`rectRot`:d=Math.cos(g)*(i?i/2:h),o=Math.cos(g)*h,s=Math.sin(g)*h,f=Math.sin(g)*(i?i/2:h),e.moveTo(n-d,r-s),e.lineTo(n+f,r-o),e.lineTo(n+d,r+s),e.lineTo(n-f,r+o),e.closePath();break;case`crossRot`:g+=Y6;case`cross`:d=Math.cos(g)*(i?i/2:h),o=Math.cos(g)*h,s=Math.sin(g)*h,f=Math.sin(g)*(i?i/2:h),e.moveTo(n-d,r-s),e.lineTo(n+d,r+s),e.moveTo(n+f,r-o),e.lineTo(n-f,r+o);break;case`star`:d=Math.cos(g)*(i?i/2:h),o=Math.cos(g)*h,s=Math.sin(g)*h,f=Math.sin(g)*(i?i/2:h),e.moveTo(n-d,r-s),e.lineTo(n+d,r+s),e.moveTo(n+f,r-o),e.lineTo(n-f,r+o),g+=Y6,d=Math.cos(g)*(i?i/2:h),o=Math.cos(g)*h,s=Math.sin(g)*h,f=Math.sin(g)*(i?i/2:h),e.moveTo(n-d,r-s),e.lineTo(n+d,r+s),e.moveTo(n+f,r-o),e.lineTo(n-f,r+o);break;case`line`:o=i?i/2:Math.cos(g)*h,s=Math.sin(g)*h,e.moveTo(n-o,r-s),e.lineTo(n+o,r+s);break;case`dash`:e.moveTo(n,r),e.lineTo(n+Math.cos(g)*(i?i/2:h),r+Math.sin(g)*h);break;case!1:e.closePath();break}e.fill(),t.borderWidth>0&&e.stroke()}}function Z3(e,t,n){return n||=.5,!t||e&&e.x>t.left-n&&e.x<t.right+n&&e.y>t.top-n&&e.y<t.bottom+n}function Q3(e,t){e.save(),e.beginPath(),e.rect(t.left,t.top,t.right-t.left,t.bottom-t.top),e.clip()}function $3(e){e.restore()}function eue(e,t,n,r,i){if(!t)return e.lineTo(n.x,n.y);if(i===`middle`){let r=(t.x+n.x)/2;e.lineTo(r,t.y),e.lineTo(r,n.y)}else i===`after`==!!r?e.lineTo(n.x,t.y):e.lineTo(t.x,n.y);e.lineTo(n.x,n.y)}function tue(e,t,n,r){if(!t)return e.lineTo(n.x,n.y);e.bezierCurveTo(r?t.cp1x:t.cp2x,r?t.cp1y:t.cp2y,r?n.cp2x:n.cp1x,r?n.cp2y:n.cp1y,n.x,n.y)}function nue(e,t){t.translation&&e.translate(t.translation[0],t.translation[1]),u3(t.rotation)||e.rotate(t.rotation),t.color&&(e.fillStyle=t.color),t.textAlign&&(e.textAlign=t.textAlign),t.textBaseline&&(e.textBaseline=t.textBaseline)}function rue(e,t,n,r,i){if(i.strikethrough||i.underline){let a=e.measureText(r),o=t-a.actualBoundingBoxLeft,s=t+a.actualBoundingBoxRight,c=n-a.actualBoundingBoxAscent,l=n+a.actualBoundingBoxDescent,u=i.strikethrough?(c+l)/2:l;e.strokeStyle=e.fillStyle,e.beginPath(),e.lineWidth=i.decorationWidth||2,e.moveTo(o,u),e.lineTo(s,u),e.stroke()}}function iue(e,t){let n=e.fillStyle;e.fillStyle=t.color,e.fillRect(t.left,t.top,t.width,t.height),e.fillStyle=n}function e6(e,t,n,r,i,a={}){let o=d3(t)?t:[t],s=a.strokeWidth>0&&a.strokeColor!==``,c,l;for(e.save(),e.font=i.string,nue(e,a),c=0;c<o.length;++c)l=o[c],a.backdrop&&iue(e,a.backdrop),s&&(a.strokeColor&&(e.strokeStyle=a.strokeColor),u3(a.strokeWidth)||(e.lineWidth=a.strokeWidth),e.strokeText(l,n,r,a.maxWidth)),e.fillText(l,n,r,a.maxWidth),rue(e,n,r,l,a),r+=Number(i.lineHeight);e.restore()}function t6(e,t){let{x:n,y:r,w:i,h:a,radius:o}=t;e.arc(n+o.topLeft,r+o.topLeft,o.topLeft,1.5*U6,U6,!0),e.lineTo(n,r+a-o.bottomLeft),e.arc(n+o.bottomLeft,r+a-o.bottomLeft,o.bottomLeft,U6,J6,!0),e.lineTo(n+i-o.bottomRight,r+a),e.arc(n+i-o.bottomRight,r+a-o.bottomRight,o.bottomRight,J6,0,!0),e.lineTo(n+i,r+o.topRight),e.arc(n+i-o.topRight,r+o.topRight,o.topRight,0,-J6,!0),e.lineTo(n+o.topLeft,r)}function aue(e,t){let n=(``+e).match(y8);if(!n||n[1]===`normal`)return t*1.2;switch(e=+n[2],n[3]){case`px`:return e;case`%`:e/=100;break}return t*e}function n6(e,t){let n={},r=f3(t),i=r?Object.keys(t):t,a=f3(e)?r?n=>h3(e[n],e[t[n]]):t=>e[t]:()=>e;for(let e of i)n[e]=x8(a(e));return n}function oue(e){return n6(e,{top:`y`,right:`x`,bottom:`y`,left:`x`})}function r6(e){return n6(e,[`topLeft`,`topRight`,`bottomLeft`,`bottomRight`])}function i6(e){let t=oue(e);return t.width=t.left+t.right,t.height=t.top+t.bottom,t}function a6(e,t){e||={},t||=v8.font;let n=h3(e.size,t.size);typeof n==`string`&&(n=parseInt(n,10));let r=h3(e.style,t.style);r&&!(``+r).match(b8)&&(console.warn(`Invalid font style specified: "`+r+`"`),r=void 0);let i={family:h3(e.family,t.family),lineHeight:aue(h3(e.lineHeight,t.lineHeight),n),size:n,style:r,weight:h3(e.weight,t.weight),string:``};return i.string=Qle(i),i}function o6(e,t,n,r){let i=!0,a,o,s;for(a=0,o=e.length;a<o;++a)if(s=e[a],s!==void 0&&(t!==void 0&&typeof s==`function`&&(s=s(t),i=!1),n!==void 0&&d3(s)&&(s=s[n%s.length],i=!1),s!==void 0))return r&&!i&&(r.cacheable=!1),s}function sue(e,t,n){let{min:r,max:i}=e,a=R6(t,(i-r)/2),o=(e,t)=>n&&e===0?0:e+t;return{min:o(r,-Math.abs(a)),max:o(i,a)}}function s6(e,t){return Object.assign(Object.create(e),t)}function c6(e,t=[``],n,r,i=()=>e[0]){let a=n||e;return r===void 0&&(r=h6(`_fallback`,e)),new Proxy({[Symbol.toStringTag]:`Object`,_cacheable:!0,_scopes:e,_rootScopes:a,_fallback:r,_getTarget:i,override:n=>c6([n,...e],t,a,r)},{deleteProperty(t,n){return delete t[n],delete t._keys,delete e[0][n],!0},get(n,r){return d6(n,r,()=>pue(r,t,e,n))},getOwnPropertyDescriptor(e,t){return Reflect.getOwnPropertyDescriptor(e._scopes[0],t)},getPrototypeOf(){return Reflect.getPrototypeOf(e[0])},has(e,t){return g6(e).includes(t)},ownKeys(e){return g6(e)},set(e,t,n){let r=e._storage||=i();return e[t]=r[t]=n,delete e._keys,!0}})}function l6(e,t,n,r){let i={_cacheable:!1,_proxy:e,_context:t,_subProxy:n,_stack:new Set,_descriptors:u6(e,r),setContext:t=>l6(e,t,n,r),override:i=>l6(e.override(i),t,n,r)};return new Proxy(i,{deleteProperty(t,n){return delete t[n],delete e[n],!0},get(e,t,n){return d6(e,t,()=>cue(e,t,n))},getOwnPropertyDescriptor(t,n){return t._descriptors.allKeys?Reflect.has(e,n)?{enumerable:!0,configurable:!0}:void 0:Reflect.getOwnPropertyDescriptor(e,n)},getPrototypeOf(){return Reflect.getPrototypeOf(e)},has(t,n){return Reflect.has(e,n)},ownKeys(){return Reflect.ownKeys(e)},set(t,n,r){return e[n]=r,delete t[n],!0}})}function u6(e,t={scriptable:!0,indexable:!0}){let{_scriptable:n=t.scriptable,_indexable:r=t.indexable,_allKeys:i=t.allKeys}=e;return{allKeys:i,scriptable:n,indexable:r,isScriptable:V6(n)?n:()=>n,isIndexable:V6(r)?r:()=>r}}function d6(e,t,n){if(Object.prototype.hasOwnProperty.call(e,t)||t===`constructor`)return e[t];let r=n();return e[t]=r,r}function cue(e,t,n){let{_proxy:r,_context:i,_subProxy:a,_descriptors:o}=e,s=r[t];return V6(s)&&o.isScriptable(t)&&(s=lue(t,s,e,n)),d3(s)&&s.length&&(s=uue(t,s,e,o.isIndexable)),C8(t,s)&&(s=l6(s,i,a&&a[t],o)),s}function lue(e,t,n,r){let{_proxy:i,_context:a,_subProxy:o,_stack:s}=n;if(s.has(e))throw Error(`Recursion detected: `+Array.from(s).join(`->`)+`->`+e);s.add(e);let c=t(a,o||r);return s.delete(e),C8(e,c)&&(c=p6(i._scopes,i,e,c)),c}function uue(e,t,n,r){let{_proxy:i,_context:a,_subProxy:o,_descriptors:s}=n;if(a.index!==void 0&&r(e))return t[a.index%t.length];if(f3(t[0])){let n=t,r=i._scopes.filter(e=>e!==n);t=[];for(let c of n){let n=p6(r,i,e,c);t.push(l6(n,a,o&&o[e],s))}}return t}function f6(e,t,n){return V6(e)?e(t,n):e}function due(e,t,n,r,i){for(let a of t){let t=w8(n,a);if(t){e.add(t);let a=f6(t._fallback,n,i);if(a!==void 0&&a!==n&&a!==r)return a}else if(t===!1&&r!==void 0&&n!==r)return null}return!1}function p6(e,t,n,r){let i=t._rootScopes,a=f6(t._fallback,n,r),o=[...e,...i],s=new Set;s.add(r);let c=m6(s,o,n,a||n,r);return c===null||a!==void 0&&a!==n&&(c=m6(s,o,a,c,r),c===null)?!1:c6(Array.from(s),[``],i,a,()=>fue(t,n,r))}function m6(e,t,n,r,i){for(;n;)n=due(e,t,n,r,i);return n}function fue(e,t,n){let r=e._getTarget();t in r||(r[t]={});let i=r[t];return d3(i)&&f3(n)?n:i||{}}function pue(e,t,n,r){let i;for(let a of t)if(i=h6(S8(a,e),n),i!==void 0)return C8(e,i)?p6(n,r,e,i):i}function h6(e,t){for(let n of t){if(!n)continue;let t=n[e];if(t!==void 0)return t}}function g6(e){let t=e._keys;return t||=e._keys=mue(e._scopes),t}function mue(e){let t=new Set;for(let n of e)for(let e of Object.keys(n).filter(e=>!e.startsWith(`_`)))t.add(e);return Array.from(t)}function hue(e,t,n,r){let i=e.skip?t:e,a=t,o=n.skip?t:n,s=M3(a,i),c=M3(o,a),l=s/(s+c),u=c/(s+c);l=isNaN(l)?0:l,u=isNaN(u)?0:u;let d=r*l,f=r*u;return{previous:{x:a.x-d*(o.x-i.x),y:a.y-d*(o.y-i.y)},next:{x:a.x+f*(o.x-i.x),y:a.y+f*(o.y-i.y)}}}function gue(e,t,n){let r=e.length,i,a,o,s,c,l=E8(e,0);for(let u=0;u<r-1;++u)if(c=l,l=E8(e,u+1),!(!c||!l)){if(T3(t[u],0,T8)){n[u]=n[u+1]=0;continue}i=n[u]/t[u],a=n[u+1]/t[u],s=i**2+a**2,!(s<=9)&&(o=3/Math.sqrt(s),n[u]=i*o*t[u],n[u+1]=a*o*t[u])}}function _ue(e,t,n=`x`){let r=D8(n),i=e.length,a,o,s,c=E8(e,0);for(let l=0;l<i;++l){if(o=s,s=c,c=E8(e,l+1),!s)continue;let i=s[n],u=s[r];o&&(a=(i-o[n])/3,s[`cp1${n}`]=i-a,s[`cp1${r}`]=u-a*t[l]),c&&(a=(c[n]-i)/3,s[`cp2${n}`]=i+a,s[`cp2${r}`]=u+a*t[l])}}function vue(e,t=`x`){let n=D8(t),r=e.length,i=Array(r).fill(0),a=Array(r),o,s,c,l=E8(e,0);for(o=0;o<r;++o)if(s=c,c=l,l=E8(e,o+1),c){if(l){let e=l[t]-c[t];i[o]=e===0?0:(l[n]-c[n])/e}a[o]=s?l?Q6(i[o-1])===Q6(i[o])?(i[o-1]+i[o])/2:0:i[o-1]:i[o]}gue(e,i,a),_ue(e,a,t)}function _6(e,t,n){return Math.max(Math.min(e,n),t)}function yue(e,t){let n,r,i,a,o,s=Z3(e[0],t);for(n=0,r=e.length;n<r;++n)o=a,a=s,s=n<r-1&&Z3(e[n+1],t),a&&(i=e[n],o&&(i.cp1x=_6(i.cp1x,t.left,t.right),i.cp1y=_6(i.cp1y,t.top,t.bottom)),s&&(i.cp2x=_6(i.cp2x,t.left,t.right),i.cp2y=_6(i.cp2y,t.top,t.bottom)))}function bue(e,t,n,r,i){let a,o,s,c;if(t.spanGaps&&(e=e.filter(e=>!e.skip)),t.cubicInterpolationMode===`monotone`)vue(e,i);else{let n=r?e[e.length-1]:e[0];for(a=0,o=e.length;a<o;++a)s=e[a],c=hue(n,s,e[Math.min(a+1,o-+!r)%o],t.tension),s.cp1x=c.previous.x,s.cp1y=c.previous.y,s.cp2x=c.next.x,s.cp2y=c.next.y,n=s}t.capBezierPoints&&yue(e,n)}function v6(){return typeof window<`u`&&typeof document<`u`}function y6(e){let t=e.parentNode;return t&&t.toString()===`[object ShadowRoot]`&&(t=t.host),t}function b6(e,t,n){let r;return typeof e==`string`?(r=parseInt(e,10),e.indexOf(`%`)!==-1&&(r=r/100*t.parentNode[n])):r=e,r}function xue(e,t){return O8(e).getPropertyValue(t)}function x6(e,t,n){let r={};n=n?`-`+n:``;for(let i=0;i<4;i++){let a=k8[i];r[a]=parseFloat(e[t+`-`+a+n])||0}return r.width=r.left+r.right,r.height=r.top+r.bottom,r}function Sue(e,t){let n=e.touches,r=n&&n.length?n[0]:e,{offsetX:i,offsetY:a}=r,o=!1,s,c;if(A8(i,a,e.target))s=i,c=a;else{let e=t.getBoundingClientRect();s=r.clientX-e.left,c=r.clientY-e.top,o=!0}return{x:s,y:c,box:o}}function S6(e,t){if(`native`in e)return e;let{canvas:n,currentDevicePixelRatio:r}=t,i=O8(n),a=i.boxSizing===`border-box`,o=x6(i,`padding`),s=x6(i,`border`,`width`),{x:c,y:l,box:u}=Sue(e,n),d=o.left+(u&&s.left),f=o.top+(u&&s.top),{width:p,height:m}=t;return a&&(p-=o.width+s.width,m-=o.height+s.height),{x:Math.round((c-d)/p*n.width/r),y:Math.round((l-f)/m*n.height/r)}}function Cue(e,t,n){let r,i;if(t===void 0||n===void 0){let a=e&&y6(e);if(!a)t=e.clientWidth,n=e.clientHeight;else{let e=a.getBoundingClientRect(),o=O8(a),s=x6(o,`border`,`width`),c=x6(o,`padding`);t=e.width-c.width-s.width,n=e.height-c.height-s.height,r=b6(o.maxWidth,a,`clientWidth`),i=b6(o.maxHeight,a,`clientHeight`)}}return{width:t,height:n,maxWidth:r||K6,maxHeight:i||K6}}function wue(e,t,n,r){let i=O8(e),a=x6(i,`margin`),o=b6(i.maxWidth,e,`clientWidth`)||K6,s=b6(i.maxHeight,e,`clientHeight`)||K6,c=Cue(e,t,n),{width:l,height:u}=c;if(i.boxSizing===`content-box`){let e=x6(i,`border`,`width`),t=x6(i,`padding`);l-=t.width+e.width,u-=t.height+e.height}return l=Math.max(0,l-a.width),u=Math.max(0,r?l/r:u-a.height),l=j8(Math.min(l,o,c.maxWidth)),u=j8(Math.min(u,s,c.maxHeight)),l&&!u&&(u=j8(l/2)),(t!==void 0||n!==void 0)&&r&&c.height&&u>c.height&&(u=c.height,l=j8(Math.floor(u*r))),{width:l,height:u}}function C6(e,t,n){let r=t||1,i=j8(e.height*r),a=j8(e.width*r);e.height=j8(e.height),e.width=j8(e.width);let o=e.canvas;return o.style&&(n||!o.style.height&&!o.style.width)&&(o.style.height=`${e.height}px`,o.style.width=`${e.width}px`),e.currentDevicePixelRatio!==r||o.height!==i||o.width!==a?(e.currentDevicePixelRatio=r,o.height=i,o.width=a,e.ctx.setTransform(r,0,0,r,0,0),!0):!1}function w6(e,t){let n=xue(e,t),r=n&&n.match(/^(\d+)(\.\d+)?px$/);return r?+r[1]:void 0}function T6(e,t,n,r){return{x:e.x+n*(t.x-e.x),y:e.y+n*(t.y-e.y)}}function Tue(e,t,n,r){return{x:e.x+n*(t.x-e.x),y:r===`middle`?n<.5?e.y:t.y:r===`after`?n<1?e.y:t.y:n>0?t.y:e.y}}function Eue(e,t,n,r){let i={x:e.cp2x,y:e.cp2y},a={x:t.cp1x,y:t.cp1y},o=T6(e,i,n),s=T6(i,a,n),c=T6(a,t,n);return T6(T6(o,s,n),T6(s,c,n),n)}function E6(e,t,n){return e?N8(t,n):P8()}function D6(e,t){let n,r;(t===`ltr`||t===`rtl`)&&(n=e.canvas.style,r=[n.getPropertyValue(`direction`),n.getPropertyPriority(`direction`)],n.setProperty(`direction`,t,`important`),e.prevTextDirection=r)}function O6(e,t){t!==void 0&&(delete e.prevTextDirection,e.canvas.style.setProperty(`direction`,t[0],t[1]))}function k6(e){return e===`angle`?{between:P3,compare:zle,normalize:N3}:{between:I3,compare:(e,t)=>e-t,normalize:e=>e}}function A6({start:e,end:t,count:n,loop:r,style:i}){return{start:e%n,end:t%n,loop:r&&(t-e+1)%n===0,style:i}}function Due(e,t,n){let{property:r,start:i,end:a}=n,{between:o,normalize:s}=k6(r),c=t.length,{start:l,end:u,loop:d}=e,f,p;if(d){for(l+=c,u+=c,f=0,p=c;f<p&&o(s(t[l%c][r]),i,a);++f)l--,u--;l%=c,u%=c}return u<l&&(u+=c),{start:l,end:u,loop:d,style:e.style}}function j6(e,t,n){if(!n)return[e];let{property:r,start:i,end:a}=n,o=t.length,{compare:s,between:c,normalize:l}=k6(r),{start:u,end:d,loop:f,style:p}=Due(e,t,n),m=[],h=!1,g=null,_,v,y,b=()=>c(i,y,_)&&s(i,y)!==0,x=()=>s(a,_)===0||c(a,y,_),S=()=>h||b(),C=()=>!h||x();for(let e=u,n=u;e<=d;++e)v=t[e%o],!v.skip&&(_=l(v[r]),_!==y&&(h=c(_,i,a),g===null&&S()&&(g=s(_,i)===0?e:n),g!==null&&C()&&(m.push(A6({start:g,end:e,loop:f,count:o,style:p})),g=null),n=e,y=_));return g!==null&&m.push(A6({start:g,end:d,loop:f,count:o,style:p})),m}function M6(e,t){let n=[],r=e.segments;for(let i=0;i<r.length;i++){let a=j6(r[i],e.points,t);a.length&&n.push(...a)}return n}function Oue(e,t,n,r){let i=0,a=t-1;if(n&&!r)for(;i<t&&!e[i].skip;)i++;for(;i<t&&e[i].skip;)i++;for(i%=t,n&&(a+=i);a>i&&e[a%t].skip;)a--;return a%=t,{start:i,end:a}}function kue(e,t,n,r){let i=e.length,a=[],o=t,s=e[t],c;for(c=t+1;c<=n;++c){let n=e[c%i];n.skip||n.stop?s.skip||(r=!1,a.push({start:t%i,end:(c-1)%i,loop:r}),t=o=n.stop?c:null):(o=c,s.skip&&(t=c)),s=n}return o!==null&&a.push({start:t%i,end:o%i,loop:r}),a}function Aue(e,t){let n=e.points,r=e.options.spanGaps,i=n.length;if(!i)return[];let a=!!e._loop,{start:o,end:s}=Oue(n,i,a,r);return r===!0?N6(e,[{start:o,end:s,loop:a}],n,t):N6(e,kue(n,o,s<o?s+i:s,!!e._fullLoop&&o===0&&s===i-1),n,t)}function N6(e,t,n,r){return!r||!r.setContext||!n?t:jue(e,t,n,r)}function jue(e,t,n,r){let i=e._chart.getContext(),a=P6(e.options),{_datasetIndex:o,options:{spanGaps:s}}=e,c=n.length,l=[],u=a,d=t[0].start,f=d;function p(e,t,r,i){let a=s?-1:1;if(e!==t){for(e+=c;n[e%c].skip;)e-=a;for(;n[t%c].skip;)t+=a;e%c!==t%c&&(l.push({start:e%c,end:t%c,loop:r,style:i}),u=i,d=t%c)}}for(let e of t){d=s?d:e.start;let t=n[d%c],a;for(f=d+1;f<=e.end;f++){let s=n[f%c];a=P6(r.setContext(s6(i,{type:`segment`,p0:t,p1:s,p0DataIndex:(f-1)%c,p1DataIndex:f%c,datasetIndex:o}))),Mue(a,u)&&p(d,f-1,e.loop,u),t=s,u=a}d<f-1&&p(d,f-1,e.loop,u)}return l}function P6(e){return{backgroundColor:e.backgroundColor,borderCapStyle:e.borderCapStyle,borderDash:e.borderDash,borderDashOffset:e.borderDashOffset,borderJoinStyle:e.borderJoinStyle,borderWidth:e.borderWidth,borderColor:e.borderColor}}function Mue(e,t){if(!t)return!1;let n=[],r=function(e,t){return B3(t)?(n.includes(t)||n.push(t),n.indexOf(t)):t};return JSON.stringify(e,r)!==JSON.stringify(t,r)}function F6(e,t,n){return e.options.clip?e[n]:t[n]}function Nue(e,t){let{xScale:n,yScale:r}=e;return n&&r?{left:F6(n,t,`left`),right:F6(n,t,`right`),top:F6(r,t,`top`),bottom:F6(r,t,`bottom`)}:t}function I6(e,t){let n=t._clip;if(n.disabled)return!1;let r=Nue(t,e.chartArea);return{left:n.left===!1?0:r.left-(n.left===!0?0:n.left),right:n.right===!1?e.width:r.right+(n.right===!0?0:n.right),top:n.top===!1?0:r.top-(n.top===!0?0:n.top),bottom:n.bottom===!1?e.height:r.bottom+(n.bottom===!0?0:n.bottom)}}var L6,R6,z6,B6,V6,H6,U6,W6,G6,K6,q6,J6,Y6,X6,Z6,Q6,$6,e8,t8,n8,r8,i8,a8,o8,s8,c8,l8,u8,d8,f8,p8,m8,h8,g8,_8,v8,y8,b8,x8,S8,C8,w8,T8,E8,D8,O8,k8,A8,j8,M8,N8,P8,Pue=t((()=>{kle(),L6=(()=>{let e=0;return()=>e++})(),R6=(e,t)=>typeof e==`string`&&e.endsWith(`%`)?parseFloat(e)/100*t:+e,z6={"":e=>e,x:e=>e.x,y:e=>e.y},B6=e=>e!==void 0,V6=e=>typeof e==`function`,H6=(e,t)=>{if(e.size!==t.size)return!1;for(let n of e)if(!t.has(n))return!1;return!0},U6=Math.PI,W6=2*U6,G6=W6+U6,K6=1/0,q6=U6/180,J6=U6/2,Y6=U6/4,X6=U6*2/3,Z6=Math.log10,Q6=Math.sign,$6=(e,t,n,r)=>L3(e,n,r?r=>{let i=e[r][t];return i<n||i===n&&e[r+1][t]===n}:r=>e[r][t]<n),e8=(e,t,n)=>L3(e,n,r=>e[r][t]>=n),t8=[`push`,`pop`,`shift`,`splice`,`unshift`],n8=function(){return typeof window>`u`?function(e){return e()}:window.requestAnimationFrame}(),r8=e=>e===`start`?`left`:e===`end`?`right`:`center`,i8=(e,t,n)=>e===`start`?t:e===`end`?n:(t+n)/2,a8=(e,t,n,r)=>e===(r?`left`:`right`)?n:e===`center`?(t+n)/2:t,o8=e=>e===0||e===1,s8=(e,t,n)=>-(2**(10*--e)*Math.sin((e-t)*W6/n)),c8=(e,t,n)=>2**(-10*e)*Math.sin((e-t)*W6/n)+1,l8={linear:e=>e,easeInQuad:e=>e*e,easeOutQuad:e=>-e*(e-2),easeInOutQuad:e=>(e/=.5)<1?.5*e*e:-.5*(--e*(e-2)-1),easeInCubic:e=>e*e*e,easeOutCubic:e=>--e*e*e+1,easeInOutCubic:e=>(e/=.5)<1?.5*e*e*e:.5*((e-=2)*e*e+2),easeInQuart:e=>e*e*e*e,easeOutQuart:e=>-(--e*e*e*e-1),easeInOutQuart:e=>(e/=.5)<1?.5*e*e*e*e:-.5*((e-=2)*e*e*e-2),easeInQuint:e=>e*e*e*e*e,easeOutQuint:e=>--e*e*e*e*e+1,easeInOutQuint:e=>(e/=.5)<1?.5*e*e*e*e*e:.5*((e-=2)*e*e*e*e+2),easeInSine:e=>-Math.cos(e*J6)+1,easeOutSine:e=>Math.sin(e*J6),easeInOutSine:e=>-.5*(Math.cos(U6*e)-1),easeInExpo:e=>e===0?0:2**(10*(e-1)),easeOutExpo:e=>e===1?1:-(2**(-10*e))+1,easeInOutExpo:e=>o8(e)?e:e<.5?.5*2**(10*(e*2-1)):.5*(-(2**(-10*(e*2-1)))+2),easeInCirc:e=>e>=1?e:-(Math.sqrt(1-e*e)-1),easeOutCirc:e=>Math.sqrt(1- --e*e),easeInOutCirc:e=>(e/=.5)<1?-.5*(Math.sqrt(1-e*e)-1):.5*(Math.sqrt(1-(e-=2)*e)+1),easeInElastic:e=>o8(e)?e:s8(e,.075,.3),easeOutElastic:e=>o8(e)?e:c8(e,.075,.3),easeInOutElastic(e){let t=.1125,n=.45;return o8(e)?e:e<.5?.5*s8(e*2,t,n):.5+.5*c8(e*2-1,t,n)},easeInBack(e){return e*e*(2.70158*e-1.70158)},easeOutBack(e){return--e*e*(2.70158*e+1.70158)+1},easeInOutBack(e){let t=1.70158;return(e/=.5)<1?.5*(e*e*(((t*=1.525)+1)*e-t)):.5*((e-=2)*e*(((t*=1.525)+1)*e+t)+2)},easeInBounce:e=>1-l8.easeOutBounce(1-e),easeOutBounce(e){let t=7.5625,n=2.75;return e<1/n?t*e*e:e<2/n?t*(e-=1.5/n)*e+.75:e<2.5/n?t*(e-=2.25/n)*e+.9375:t*(e-=2.625/n)*e+.984375},easeInOutBounce:e=>e<.5?l8.easeInBounce(e*2)*.5:l8.easeOutBounce(e*2-1)*.5+.5},u8=[`x`,`y`,`borderWidth`,`radius`,`tension`],d8=[`color`,`borderColor`,`backgroundColor`],f8=new Map,p8={values(e){return d3(e)?e:``+e},numeric(e,t,n){if(e===0)return`0`;let r=this.chart.options.locale,i,a=e;if(n.length>1){let t=Math.max(Math.abs(n[0].value),Math.abs(n[n.length-1].value));(t<1e-4||t>0x38d7ea4c68000)&&(i=`scientific`),a=Xle(e,n)}let o=Z6(Math.abs(a)),s=isNaN(o)?1:Math.max(Math.min(-1*Math.floor(o),20),0),c={notation:i,minimumFractionDigits:s,maximumFractionDigits:s};return Object.assign(c,this.options.ticks.format),U3(e,r,c)},logarithmic(e,t,n){if(e===0)return`0`;let r=n[t].significand||e/10**Math.floor(Z6(e));return[1,2,3,5,10,15].includes(r)||t>.8*n.length?p8.numeric.call(this,e,t,n):``}},m8={formatters:p8},h8=Object.create(null),g8=Object.create(null),_8=class{constructor(e,t){this.animation=void 0,this.backgroundColor=`rgba(0,0,0,0.1)`,this.borderColor=`rgba(0,0,0,0.1)`,this.color=`#666`,this.datasets={},this.devicePixelRatio=e=>e.chart.platform.getDevicePixelRatio(),this.elements={},this.events=[`mousemove`,`mouseout`,`click`,`touchstart`,`touchmove`],this.font={family:`'Helvetica Neue', 'Helvetica', 'Arial', sans-serif`,size:12,style:`normal`,lineHeight:1.2,weight:null},this.hover={},this.hoverBackgroundColor=(e,t)=>H3(t.backgroundColor),this.hoverBorderColor=(e,t)=>H3(t.borderColor),this.hoverColor=(e,t)=>H3(t.color),this.indexAxis=`x`,this.interaction={mode:`nearest`,intersect:!0,includeInvisible:!1},this.maintainAspectRatio=!0,this.onHover=null,this.onClick=null,this.parsing=!0,this.plugins={},this.responsive=!0,this.scale=void 0,this.scales={},this.showLine=!0,this.drawActiveElementsOnTop=!0,this.describe(e),this.apply(t)}set(e,t){return G3(this,e,t)}get(e){return W3(this,e)}describe(e,t){return G3(g8,e,t)}override(e,t){return G3(h8,e,t)}route(e,t,n,r){let i=W3(this,e),a=W3(this,n),o=`_`+t;Object.defineProperties(i,{[o]:{value:i[t],writable:!0},[t]:{enumerable:!0,get(){let e=this[o],t=a[r];return f3(e)?Object.assign({},t,e):h3(e,t)},set(e){this[o]=e}}})}apply(e){e.forEach(e=>e(this))}},v8=new _8({_scriptable:e=>!e.startsWith(`on`),_indexable:e=>e!==`events`,hover:{_fallback:`interaction`},interaction:{_scriptable:!1,_indexable:!1}},[qle,Jle,Zle]),y8=/^(normal|(\d+(?:\.\d+)?)(px|em|%)?)$/,b8=/^(normal|italic|initial|inherit|unset|(oblique( -?[0-9]?[0-9]deg)?))$/,x8=e=>+e||0,S8=(e,t)=>e?e+w3(t):t,C8=(e,t)=>f3(t)&&e!==`adapters`&&(Object.getPrototypeOf(t)===null||t.constructor===Object),w8=(e,t)=>e===!0?t:typeof e==`string`?C3(t,e):void 0,T8=2**-52||1e-14,E8=(e,t)=>t<e.length&&!e[t].skip&&e[t],D8=e=>e===`x`?`y`:`x`,O8=e=>e.ownerDocument.defaultView.getComputedStyle(e,null),k8=[`top`,`right`,`bottom`,`left`],A8=(e,t,n)=>(e>0||t>0)&&(!n||!n.shadowRoot),j8=e=>Math.round(e*10)/10,M8=function(){let e=!1;try{let t={get passive(){return e=!0,!1}};v6()&&(window.addEventListener(`test`,null,t),window.removeEventListener(`test`,null,t))}catch{}return e}(),N8=function(e,t){return{x(n){return e+e+t-n},setWidth(e){t=e},textAlign(e){return e===`center`?e:e===`right`?`left`:`right`},xPlus(e,t){return e-t},leftForLtr(e,t){return e-t}}},P8=function(){return{x(e){return e},setWidth(e){},textAlign(e){return e},xPlus(e,t){return e+t},leftForLtr(e,t){return e}}}}));function Fue(e,t){let n=[],r=Object.keys(t);for(let t=0;t<r.length;t++){let i=e[r[t]];i&&i.active()&&n.push(i.wait())}return Promise.all(n)}function Iue(e,t){if(!t)return;let n=e.options;if(!n){e.options=t;return}return n.$shared&&(e.options=n=Object.assign({},n,{$shared:!1,$animations:{}})),n}function F8(e,t){let n=e&&e.options||{},r=n.reverse,i=n.min===void 0?t:0,a=n.max===void 0?t:0;return{start:r?a:i,end:r?i:a}}function Lue(e,t,n){if(n===!1)return!1;let r=F8(e,n),i=F8(t,n);return{top:i.end,right:r.end,bottom:i.start,left:r.start}}function Rue(e){let t,n,r,i;return f3(e)?(t=e.top,n=e.right,r=e.bottom,i=e.left):t=n=r=i=e,{top:t,right:n,bottom:r,left:i,disabled:e===!1}}function I8(e,t){let n=[],r=e._getSortedDatasetMetas(t),i,a;for(i=0,a=r.length;i<a;++i)n.push(r[i].index);return n}function L8(e,t,n,r={}){let i=e.keys,a=r.mode===`single`,o,s,c,l;if(t===null)return;let u=!1;for(o=0,s=i.length;o<s;++o){if(c=+i[o],c===n){if(u=!0,r.all)continue;break}l=e.values[c],p3(l)&&(a||t===0||Q6(t)===Q6(l))&&(t+=l)}return!u&&!r.all?0:t}function zue(e,t){let{iScale:n,vScale:r}=t,i=n.axis===`x`?`x`:`y`,a=r.axis===`x`?`x`:`y`,o=Object.keys(e),s=Array(o.length),c,l,u;for(c=0,l=o.length;c<l;++c)u=o[c],s[c]={[i]:u,[a]:e[u]};return s}function R8(e,t){let n=e&&e.options.stacked;return n||n===void 0&&t.stack!==void 0}function Bue(e,t,n){return`${e.id}.${t.id}.${n.stack||n.type}`}function Vue(e){let{min:t,max:n,minDefined:r,maxDefined:i}=e.getUserBounds();return{min:r?t:-1/0,max:i?n:1/0}}function Hue(e,t,n){let r=e[t]||(e[t]={});return r[n]||(r[n]={})}function z8(e,t,n,r){for(let i of t.getMatchingVisibleMetas(r).reverse()){let t=e[i.index];if(n&&t>0||!n&&t<0)return i.index}return null}function B8(e,t){let{chart:n,_cachedMeta:r}=e,i=n._stacks||={},{iScale:a,vScale:o,index:s}=r,c=a.axis,l=o.axis,u=Bue(a,o,r),d=t.length,f;for(let e=0;e<d;++e){let n=t[e],{[c]:a,[l]:d}=n,p=n._stacks||={};f=p[l]=Hue(i,u,a),f[s]=d,f._top=z8(f,o,!0,r.type),f._bottom=z8(f,o,!1,r.type);let m=f._visualValues||={};m[s]=d}}function V8(e,t){let n=e.scales;return Object.keys(n).filter(e=>n[e].axis===t).shift()}function Uue(e,t){return s6(e,{active:!1,dataset:void 0,datasetIndex:t,index:t,mode:`default`,type:`dataset`})}function Wue(e,t,n){return s6(e,{active:!1,dataIndex:t,parsed:void 0,raw:void 0,element:n,index:t,mode:`default`,type:`data`})}function H8(e,t){let n=e.controller.index,r=e.vScale&&e.vScale.axis;if(r){t||=e._parsed;for(let e of t){let t=e._stacks;if(!t||t[r]===void 0||t[r][n]===void 0)return;delete t[r][n],t[r]._visualValues!==void 0&&t[r]._visualValues[n]!==void 0&&delete t[r]._visualValues[n]}}}function U8(){throw Error(`This method is not implemented: Check that a complete date adapter is provided.`)}function Gue(e,t,n,r){let{controller:i,data:a,_sorted:o}=e,s=i._cachedMeta.iScale,c=e.dataset&&e.dataset.options?e.dataset.options.spanGaps:null;if(s&&t===s.axis&&t!==`r`&&o&&a.length){let o=s._reversePixels?e8:$6;if(!r){let r=o(a,t,n);if(c){let{vScale:t}=i._cachedMeta,{_parsed:n}=e,a=n.slice(0,r.lo+1).reverse().findIndex(e=>!u3(e[t.axis]));r.lo-=Math.max(0,a);let o=n.slice(r.hi).findIndex(e=>!u3(e[t.axis]));r.hi+=Math.max(0,o)}return r}else if(i._sharedOptions){let e=a[0],r=typeof e.getRange==`function`&&e.getRange(t);if(r){let e=o(a,t,n-r),i=o(a,t,n+r);return{lo:e.lo,hi:i.hi}}}}return{lo:0,hi:a.length-1}}function W8(e,t,n,r,i){let a=e.getSortedVisibleDatasetMetas(),o=n[t];for(let e=0,n=a.length;e<n;++e){let{index:n,data:s}=a[e],{lo:c,hi:l}=Gue(a[e],t,o,i);for(let e=c;e<=l;++e){let t=s[e];t.skip||r(t,n,e)}}}function Kue(e){let t=e.indexOf(`x`)!==-1,n=e.indexOf(`y`)!==-1;return function(e,r){let i=t?Math.abs(e.x-r.x):0,a=n?Math.abs(e.y-r.y):0;return Math.sqrt(i**2+a**2)}}function G8(e,t,n,r,i){let a=[];return!i&&!e.isPointInArea(t)||W8(e,n,t,function(n,o,s){!i&&!Z3(n,e.chartArea,0)||n.inRange(t.x,t.y,r)&&a.push({element:n,datasetIndex:o,index:s})},!0),a}function que(e,t,n,r){let i=[];function a(e,n,a){let{startAngle:o,endAngle:s}=e.getProps([`startAngle`,`endAngle`],r),{angle:c}=Rle(e,{x:t.x,y:t.y});P3(c,o,s)&&i.push({element:e,datasetIndex:n,index:a})}return W8(e,n,t,a),i}function Jue(e,t,n,r,i,a){let o=[],s=Kue(n),c=1/0;function l(n,l,u){let d=n.inRange(t.x,t.y,i);if(r&&!d)return;let f=n.getCenterPoint(i);if(!(a||e.isPointInArea(f))&&!d)return;let p=s(t,f);p<c?(o=[{element:n,datasetIndex:l,index:u}],c=p):p===c&&o.push({element:n,datasetIndex:l,index:u})}return W8(e,n,t,l),o}function K8(e,t,n,r,i,a){return!a&&!e.isPointInArea(t)?[]:n===`r`&&!r?que(e,t,n,i):Jue(e,t,n,r,i,a)}function q8(e,t,n,r,i){let a=[],o=n===`x`?`inXRange`:`inYRange`,s=!1;return W8(e,n,t,(e,r,c)=>{e[o]&&e[o](t[n],i)&&(a.push({element:e,datasetIndex:r,index:c}),s||=e.inRange(t.x,t.y,i))}),r&&!s?[]:a}function J8(e,t){return e.filter(e=>e.pos===t)}function Y8(e,t){return e.filter(e=>y7.indexOf(e.pos)===-1&&e.box.axis===t)}function X8(e,t){return e.sort((e,n)=>{let r=t?n:e,i=t?e:n;return r.weight===i.weight?r.index-i.index:r.weight-i.weight})}function Yue(e){let t=[],n,r,i,a,o,s;for(n=0,r=(e||[]).length;n<r;++n)i=e[n],{position:a,options:{stack:o,stackWeight:s=1}}=i,t.push({index:n,box:i,pos:a,horizontal:i.isHorizontal(),weight:i.weight,stack:o&&a+o,stackWeight:s});return t}function Xue(e){let t={};for(let n of e){let{stack:e,pos:r,stackWeight:i}=n;if(!e||!y7.includes(r))continue;let a=t[e]||(t[e]={count:0,placed:0,weight:0,size:0});a.count++,a.weight+=i}return t}function Zue(e,t){let n=Xue(e),{vBoxMaxWidth:r,hBoxMaxHeight:i}=t,a,o,s;for(a=0,o=e.length;a<o;++a){s=e[a];let{fullSize:o}=s.box,c=n[s.stack],l=c&&s.stackWeight/c.weight;s.horizontal?(s.width=l?l*r:o&&t.availableWidth,s.height=i):(s.width=r,s.height=l?l*i:o&&t.availableHeight)}return n}function Que(e){let t=Yue(e),n=X8(t.filter(e=>e.box.fullSize),!0),r=X8(J8(t,`left`),!0),i=X8(J8(t,`right`)),a=X8(J8(t,`top`),!0),o=X8(J8(t,`bottom`)),s=Y8(t,`x`),c=Y8(t,`y`);return{fullSize:n,leftAndTop:r.concat(a),rightAndBottom:i.concat(c).concat(o).concat(s),chartArea:J8(t,`chartArea`),vertical:r.concat(i).concat(c),horizontal:a.concat(o).concat(s)}}function Z8(e,t,n,r){return Math.max(e[n],t[n])+Math.max(e[r],t[r])}function Q8(e,t){e.top=Math.max(e.top,t.top),e.left=Math.max(e.left,t.left),e.bottom=Math.max(e.bottom,t.bottom),e.right=Math.max(e.right,t.right)}function $ue(e,t,n,r){let{pos:i,box:a}=n,o=e.maxPadding;if(!f3(i)){n.size&&(e[i]-=n.size);let t=r[n.stack]||{size:0,count:1};t.size=Math.max(t.size,n.horizontal?a.height:a.width),n.size=t.size/t.count,e[i]+=n.size}a.getPadding&&Q8(o,a.getPadding());let s=Math.max(0,t.outerWidth-Z8(o,e,`left`,`right`)),c=Math.max(0,t.outerHeight-Z8(o,e,`top`,`bottom`)),l=s!==e.w,u=c!==e.h;return e.w=s,e.h=c,n.horizontal?{same:l,other:u}:{same:u,other:l}}function ede(e){let t=e.maxPadding;function n(n){let r=Math.max(t[n]-e[n],0);return e[n]+=r,r}e.y+=n(`top`),e.x+=n(`left`),n(`right`),n(`bottom`)}function tde(e,t){let n=t.maxPadding;function r(e){let r={left:0,top:0,right:0,bottom:0};return e.forEach(e=>{r[e]=Math.max(t[e],n[e])}),r}return r(e?[`left`,`right`]:[`top`,`bottom`])}function $8(e,t,n,r){let i=[],a,o,s,c,l,u;for(a=0,o=e.length,l=0;a<o;++a){s=e[a],c=s.box,c.update(s.width||t.w,s.height||t.h,tde(s.horizontal,t));let{same:o,other:d}=$ue(t,n,s,r);l|=o&&i.length,u||=d,c.fullSize||i.push(s)}return l&&$8(i,t,n,r)||u}function e5(e,t,n,r,i){e.top=n,e.left=t,e.right=t+r,e.bottom=n+i,e.width=r,e.height=i}function t5(e,t,n,r){let i=n.padding,{x:a,y:o}=t;for(let s of e){let e=s.box,c=r[s.stack]||{count:1,placed:0,weight:1},l=s.stackWeight/c.weight||1;if(s.horizontal){let r=t.w*l,a=c.size||e.height;B6(c.start)&&(o=c.start),e.fullSize?e5(e,i.left,o,n.outerWidth-i.right-i.left,a):e5(e,t.left+c.placed,o,r,a),c.start=o,c.placed+=r,o=e.bottom}else{let r=t.h*l,o=c.size||e.width;B6(c.start)&&(a=c.start),e.fullSize?e5(e,a,i.top,o,n.outerHeight-i.bottom-i.top):e5(e,a,t.top+c.placed,o,r),c.start=a,c.placed+=r,a=e.right}}t.x=a,t.y=o}function nde(e,t){let n=e.style,r=e.getAttribute(`height`),i=e.getAttribute(`width`);if(e[C7]={initial:{height:r,width:i,style:{display:n.display,height:n.height,width:n.width}}},n.display=n.display||`block`,n.boxSizing=n.boxSizing||`border-box`,T7(i)){let t=w6(e,`width`);t!==void 0&&(e.width=t)}if(T7(r))if(e.style.height===``)e.height=e.width/(t||2);else{let t=w6(e,`height`);t!==void 0&&(e.height=t)}return e}function rde(e,t,n){e&&e.addEventListener(t,n,E7)}function ide(e,t,n){e&&e.canvas&&e.canvas.removeEventListener(t,n,E7)}function ade(e,t){let n=w7[e.type]||e.type,{x:r,y:i}=S6(e,t);return{type:n,chart:t,native:e,x:r===void 0?null:r,y:i===void 0?null:i}}function n5(e,t){for(let n of e)if(n===t||n.contains(t))return!0}function ode(e,t,n){let r=e.canvas,i=new MutationObserver(e=>{let t=!1;for(let n of e)t||=n5(n.addedNodes,r),t&&=!n5(n.removedNodes,r);t&&n()});return i.observe(document,{childList:!0,subtree:!0}),i}function sde(e,t,n){let r=e.canvas,i=new MutationObserver(e=>{let t=!1;for(let n of e)t||=n5(n.removedNodes,r),t&&=!n5(n.addedNodes,r);t&&n()});return i.observe(document,{childList:!0,subtree:!0}),i}function r5(){let e=window.devicePixelRatio;e!==O7&&(O7=e,D7.forEach((t,n)=>{n.currentDevicePixelRatio!==e&&t()}))}function cde(e,t){D7.size||window.addEventListener(`resize`,r5),D7.set(e,t)}function lde(e){D7.delete(e),D7.size||window.removeEventListener(`resize`,r5)}function ude(e,t,n){let r=e.canvas,i=r&&y6(r);if(!i)return;let a=z3((e,t)=>{let r=i.clientWidth;n(e,t),r<i.clientWidth&&n()},window),o=new ResizeObserver(e=>{let t=e[0],n=t.contentRect.width,r=t.contentRect.height;n===0&&r===0||a(n,r)});return o.observe(i),cde(e,a),o}function i5(e,t,n){n&&n.disconnect(),t===`resize`&&lde(e)}function dde(e,t,n){let r=e.canvas,i=z3(t=>{e.ctx!==null&&n(ade(t,e))},e);return rde(r,t,i),i}function fde(e){return!v6()||typeof OffscreenCanvas<`u`&&e instanceof OffscreenCanvas?S7:k7}function pde(e,t){let n=e.options.ticks,r=mde(e),i=Math.min(n.maxTicksLimit||r,r),a=n.major.enabled?gde(t):[],o=a.length,s=a[0],c=a[o-1],l=[];if(o>i)return _de(t,l,a,o/i),l;let u=hde(a,t,i);if(o>0){let e,n,r=o>1?Math.round((c-s)/(o-1)):null;for(a5(t,l,u,u3(r)?0:s-r,s),e=0,n=o-1;e<n;e++)a5(t,l,u,a[e],a[e+1]);return a5(t,l,u,c,u3(r)?t.length:c+r),l}return a5(t,l,u),l}function mde(e){let t=e.options.offset,n=e._tickSize(),r=e._length/n+ +!t,i=e._maxLength/n;return Math.floor(Math.min(r,i))}function hde(e,t,n){let r=vde(e),i=t.length/n;if(!r)return Math.max(i,1);let a=Fle(r);for(let e=0,t=a.length-1;e<t;e++){let t=a[e];if(t>i)return t}return Math.max(i,1)}function gde(e){let t=[],n,r;for(n=0,r=e.length;n<r;n++)e[n].major&&t.push(n);return t}function _de(e,t,n,r){let i=0,a=n[0],o;for(r=Math.ceil(r),o=0;o<e.length;o++)o===a&&(t.push(e[o]),i++,a=n[i*r])}function a5(e,t,n,r,i){let a=h3(r,0),o=Math.min(h3(i,e.length),e.length),s=0,c,l,u;for(n=Math.ceil(n),i&&(c=i-r,n=c/Math.floor(c/n)),u=a;u<0;)s++,u=Math.round(a+s*n);for(l=Math.max(a,0);l<o;l++)l===u&&(t.push(e[l]),s++,u=Math.round(a+s*n))}function vde(e){let t=e.length,n,r;if(t<2)return!1;for(r=e[0],n=1;n<t;++n)if(e[n]-e[n-1]!==r)return!1;return r}function o5(e,t){let n=[],r=e.length/t,i=e.length,a=0;for(;a<i;a+=r)n.push(e[Math.floor(a)]);return n}function yde(e,t,n){let r=e.ticks.length,i=Math.min(t,r-1),a=e._startPixel,o=e._endPixel,s=1e-6,c=e.getPixelForTick(i),l;if(!(n&&(l=r===1?Math.max(c-a,o-c):t===0?(e.getPixelForTick(1)-c)/2:(c-e.getPixelForTick(i-1))/2,c+=i<t?l:-l,c<a-s||c>o+s)))return c}function bde(e,t){_3(e,e=>{let n=e.gc,r=n.length/2,i;if(r>t){for(i=0;i<r;++i)delete e.data[n[i]];n.splice(0,r)}})}function s5(e){return e.drawTicks?e.tickLength:0}function c5(e,t){if(!e.display)return 0;let n=a6(e.font,t),r=i6(e.padding);return(d3(e.text)?e.text.length:1)*n.lineHeight+r.height}function xde(e,t){return s6(e,{scale:t,type:`scale`})}function Sde(e,t,n){return s6(e,{tick:n,index:t,type:`tick`})}function Cde(e,t,n){let r=r8(e);return(n&&t!==`right`||!n&&t===`right`)&&(r=j7(r)),r}function wde(e,t,n,r){let{top:i,left:a,bottom:o,right:s,chart:c}=e,{chartArea:l,scales:u}=c,d=0,f,p,m,h=o-i,g=s-a;if(e.isHorizontal()){if(p=i8(r,a,s),f3(n)){let e=Object.keys(n)[0],r=n[e];m=u[e].getPixelForValue(r)+h-t}else m=n===`center`?(l.bottom+l.top)/2+h-t:M7(e,n,t);f=s-a}else{if(f3(n)){let e=Object.keys(n)[0],r=n[e];p=u[e].getPixelForValue(r)-g+t}else p=n===`center`?(l.left+l.right)/2-g+t:M7(e,n,t);m=i8(r,o,i),d=n===`left`?-J6:J6}return{titleX:p,titleY:m,maxWidth:f,rotation:d}}function Tde(e,t,n){let r=x3(Object.create(null),[n?v8.get(n):{},v8.get(t),e.defaults]);v8.set(t,r),e.defaultRoutes&&Ede(t,e.defaultRoutes),e.descriptors&&v8.describe(t,e.descriptors)}function Ede(e,t){Object.keys(t).forEach(n=>{let r=n.split(`.`),i=r.pop(),a=[e].concat(r).join(`.`),o=t[n].split(`.`),s=o.pop(),c=o.join(`.`);v8.route(a,i,c,s)})}function Dde(e){return`id`in e&&`defaults`in e}function Ode(e){let t={},n=[],r=Object.keys(L7.plugins.items);for(let e=0;e<r.length;e++)n.push(L7.getPlugin(r[e]));let i=e.plugins||[];for(let e=0;e<i.length;e++){let r=i[e];n.indexOf(r)===-1&&(n.push(r),t[r.id]=!0)}return{plugins:n,localIds:t}}function kde(e,t){return!t&&e===!1?null:e===!0?{}:e}function Ade(e,{plugins:t,localIds:n},r,i){let a=[],o=e.getContext();for(let s of t){let t=s.id,c=kde(r[t],i);c!==null&&a.push({plugin:s,options:jde(e.config,{plugin:s,local:n[t]},c,o)})}return a}function jde(e,{plugin:t,local:n},r,i){let a=e.pluginScopeKeys(t),o=e.getOptionScopes(r,a);return n&&t.defaults&&o.push(t.defaults),e.createResolver(o,i,[``],{scriptable:!1,indexable:!1,allKeys:!0})}function l5(e,t){let n=v8.datasets[e]||{};return((t.datasets||{})[e]||{}).indexAxis||t.indexAxis||n.indexAxis||`x`}function Mde(e,t){let n=e;return e===`_index_`?n=t:e===`_value_`&&(n=t===`x`?`y`:`x`),n}function Nde(e,t){return e===t?`_index_`:`_value_`}function u5(e){if(e===`x`||e===`y`||e===`r`)return e}function Pde(e){if(e===`top`||e===`bottom`)return`x`;if(e===`left`||e===`right`)return`y`}function d5(e,...t){if(u5(e))return e;for(let n of t){let t=n.axis||Pde(n.position)||e.length>1&&u5(e[0].toLowerCase());if(t)return t}throw Error(`Cannot determine type of '${e}' axis. Please provide 'axis' or 'position' option.`)}function f5(e,t,n){if(n[t+`AxisID`]===e)return{axis:t}}function Fde(e,t){if(t.data&&t.data.datasets){let n=t.data.datasets.filter(t=>t.xAxisID===e||t.yAxisID===e);if(n.length)return f5(e,`x`,n[0])||f5(e,`y`,n[0])}return{}}function Ide(e,t){let n=h8[e.type]||{scales:{}},r=t.scales||{},i=l5(e.type,t),a=Object.create(null);return Object.keys(r).forEach(t=>{let o=r[t];if(!f3(o))return console.error(`Invalid scale configuration for scale: ${t}`);if(o._proxy)return console.warn(`Ignoring resolver passed as options for scale: ${t}`);let s=d5(t,o,Fde(t,e),v8.scales[o.type]),c=Nde(s,i),l=n.scales||{};a[t]=S3(Object.create(null),[{axis:s},o,l[s],l[c]])}),e.data.datasets.forEach(n=>{let i=n.type||e.type,o=n.indexAxis||l5(i,t),s=(h8[i]||{}).scales||{};Object.keys(s).forEach(e=>{let t=Mde(e,o),i=n[t+`AxisID`]||t;a[i]=a[i]||Object.create(null),S3(a[i],[{axis:t},r[i],s[e]])})}),Object.keys(a).forEach(e=>{let t=a[e];S3(t,[v8.scales[t.type],v8.scale])}),a}function p5(e){let t=e.options||={};t.plugins=h3(t.plugins,{}),t.scales=Ide(e,t)}function m5(e){return e||={},e.datasets=e.datasets||[],e.labels=e.labels||[],e}function Lde(e){return e||={},e.data=m5(e.data),p5(e),e}function h5(e,t){let n=z7.get(e);return n||(n=t(),z7.set(e,n),B7.add(n)),n}function g5(e,t,n){let r=e.get(t);r||(r=new Map,e.set(t,r));let i=n.join(),a=r.get(i);return a||(a={resolver:c6(t,n),subPrefixes:n.filter(e=>!e.toLowerCase().includes(`hover`))},r.set(i,a)),a}function Rde(e,t){let{isScriptable:n,isIndexable:r}=u6(e);for(let i of t){let t=n(i),a=r(i),o=(a||t)&&e[i];if(t&&(V6(o)||U7(o))||a&&d3(o))return!0}return!1}function _5(e,t){return e===`top`||e===`bottom`||G7.indexOf(e)===-1&&t===`x`}function v5(e,t){return function(n,r){return n[e]===r[e]?n[t]-r[t]:n[e]-r[e]}}function y5(e){let t=e.chart,n=t.options.animation;t.notifyPlugins(`afterRender`),g3(n&&n.onComplete,[e],t)}function zde(e){let t=e.chart,n=t.options.animation;g3(n&&n.onProgress,[e],t)}function b5(e){return v6()&&typeof e==`string`?e=document.getElementById(e):e&&e.length&&(e=e[0]),e&&e.canvas&&(e=e.canvas),e}function Bde(e,t,n){let r=Object.keys(e);for(let i of r){let r=+i;if(r>=t){let a=e[i];delete e[i],(n>0||r>t)&&(e[r+n]=a)}}}function Vde(e,t,n,r){return!n||e.type===`mouseout`?null:r?t:e}function x5(){return _3(J7.instances,e=>e._plugins.invalidate())}function S5(e,t,n=t){e.lineCap=h3(n.borderCapStyle,t.borderCapStyle),e.setLineDash(h3(n.borderDash,t.borderDash)),e.lineDashOffset=h3(n.borderDashOffset,t.borderDashOffset),e.lineJoin=h3(n.borderJoinStyle,t.borderJoinStyle),e.lineWidth=h3(n.borderWidth,t.borderWidth),e.strokeStyle=h3(n.borderColor,t.borderColor)}function Hde(e,t,n){e.lineTo(n.x,n.y)}function Ude(e){return e.stepped?eue:e.tension||e.cubicInterpolationMode===`monotone`?tue:Hde}function C5(e,t,n={}){let r=e.length,{start:i=0,end:a=r-1}=n,{start:o,end:s}=t,c=Math.max(i,o),l=Math.min(a,s),u=i<o&&a<o||i>s&&a>s;return{count:r,start:c,loop:t.loop,ilen:l<c&&!u?r+l-c:l-c}}function Wde(e,t,n,r){let{points:i,options:a}=t,{count:o,start:s,loop:c,ilen:l}=C5(i,n,r),u=Ude(a),{move:d=!0,reverse:f}=r||{},p,m,h;for(p=0;p<=l;++p)m=i[(s+(f?l-p:p))%o],!m.skip&&(d?(e.moveTo(m.x,m.y),d=!1):u(e,h,m,f,a.stepped),h=m);return c&&(m=i[(s+(f?l:0))%o],u(e,h,m,f,a.stepped)),!!c}function Gde(e,t,n,r){let i=t.points,{count:a,start:o,ilen:s}=C5(i,n,r),{move:c=!0,reverse:l}=r||{},u=0,d=0,f,p,m,h,g,_,v=e=>(o+(l?s-e:e))%a,y=()=>{h!==g&&(e.lineTo(u,g),e.lineTo(u,h),e.lineTo(u,_))};for(c&&(p=i[v(0)],e.moveTo(p.x,p.y)),f=0;f<=s;++f){if(p=i[v(f)],p.skip)continue;let t=p.x,n=p.y,r=t|0;r===m?(n<h?h=n:n>g&&(g=n),u=(d*u+t)/++d):(y(),e.lineTo(t,n),m=r,d=0,h=g=n),_=n}y()}function w5(e){let t=e.options,n=t.borderDash&&t.borderDash.length;return!e._decimated&&!e._loop&&!t.tension&&t.cubicInterpolationMode!==`monotone`&&!t.stepped&&!n?Gde:Wde}function Kde(e){return e.stepped?Tue:e.tension||e.cubicInterpolationMode===`monotone`?Eue:T6}function qde(e,t,n,r){let i=t._path;i||(i=t._path=new Path2D,t.path(i,n,r)&&i.closePath()),S5(e,t.options),e.stroke(i)}function Jde(e,t,n,r){let{segments:i,options:a}=t,o=w5(t);for(let s of i)S5(e,a,s.style),e.beginPath(),o(e,t,s,{start:n,end:n+r-1})&&e.closePath(),e.stroke()}function Yde(e,t,n,r){Y7&&!t.options.segment?qde(e,t,n,r):Jde(e,t,n,r)}function T5(e,t,n,r){let i=e.options,{[n]:a}=e.getProps([n],r);return Math.abs(t-a)<i.radius+i.hitRadius}function Xde(e,t,n){let r=e.segments,i=e.points,a=t.points,o=[];for(let e of r){let{start:r,end:s}=e;s=D5(r,s,i);let c=E5(n,i[r],i[s],e.loop);if(!t.segments){o.push({source:e,target:c,start:i[r],end:i[s]});continue}let l=M6(t,c);for(let t of l){let r=E5(n,a[t.start],a[t.end],t.loop),s=j6(e,i,r);for(let e of s)o.push({source:e,target:t,start:{[n]:O5(c,r,`start`,Math.max)},end:{[n]:O5(c,r,`end`,Math.min)}})}}return o}function E5(e,t,n,r){if(r)return;let i=t[e],a=n[e];return e===`angle`&&(i=N3(i),a=N3(a)),{property:e,start:i,end:a}}function Zde(e,t){let{x:n=null,y:r=null}=e||{},i=t.points,a=[];return t.segments.forEach(({start:e,end:t})=>{t=D5(e,t,i);let o=i[e],s=i[t];r===null?n!==null&&(a.push({x:n,y:o.y}),a.push({x:n,y:s.y})):(a.push({x:o.x,y:r}),a.push({x:s.x,y:r}))}),a}function D5(e,t,n){for(;t>e;t--){let e=n[t];if(!isNaN(e.x)&&!isNaN(e.y))break}return t}function O5(e,t,n,r){return e&&t?r(e[n],t[n]):e?e[n]:t?t[n]:0}function k5(e,t){let n=[],r=!1;return d3(e)?(r=!0,n=e):n=Zde(e,t),n.length?new X7({points:n,options:{tension:0},_loop:r,_fullLoop:r}):null}function A5(e){return e&&e.fill!==!1}function Qde(e,t,n){let r=e[t].fill,i=[t],a;if(!n)return r;for(;r!==!1&&i.indexOf(r)===-1;){if(!p3(r))return r;if(a=e[r],!a)return!1;if(a.visible)return r;i.push(r),r=a.fill}return!1}function $de(e,t,n){let r=rfe(e);if(f3(r))return!isNaN(r.value)&&r;let i=parseFloat(r);return p3(i)&&Math.floor(i)===i?efe(r[0],t,i,n):[`origin`,`start`,`end`,`stack`,`shape`].indexOf(r)>=0&&r}function efe(e,t,n,r){return(e===`-`||e===`+`)&&(n=t+n),n===t||n<0||n>=r?!1:n}function tfe(e,t){let n=null;return e===`start`?n=t.bottom:e===`end`?n=t.top:f3(e)?n=t.getPixelForValue(e.value):t.getBasePixel&&(n=t.getBasePixel()),n}function nfe(e,t,n){let r;return r=e===`start`?n:e===`end`?t.options.reverse?t.min:t.max:f3(e)?e.value:t.getBaseValue(),r}function rfe(e){let t=e.options,n=t.fill,r=h3(n&&n.target,n);return r===void 0&&(r=!!t.backgroundColor),r===!1||r===null?!1:r===!0?`origin`:r}function ife(e){let{scale:t,index:n,line:r}=e,i=[],a=r.segments,o=r.points,s=afe(t,n);s.push(k5({x:null,y:t.bottom},r));for(let e=0;e<a.length;e++){let t=a[e];for(let e=t.start;e<=t.end;e++)ofe(i,o[e],s)}return new X7({points:i,options:{}})}function afe(e,t){let n=[],r=e.getMatchingVisibleMetas(`line`);for(let e=0;e<r.length;e++){let i=r[e];if(i.index===t)break;i.hidden||n.unshift(i.dataset)}return n}function ofe(e,t,n){let r=[];for(let i=0;i<n.length;i++){let a=n[i],{first:o,last:s,point:c}=sfe(a,t,`x`);if(!(!c||o&&s)){if(o)r.unshift(c);else if(e.push(c),!s)break}}e.push(...r)}function sfe(e,t,n){let r=e.interpolate(t,n);if(!r)return{};let i=r[n],a=e.segments,o=e.points,s=!1,c=!1;for(let e=0;e<a.length;e++){let t=a[e],r=o[t.start][n],l=o[t.end][n];if(I3(i,r,l)){s=i===r,c=i===l;break}}return{first:s,last:c,point:r}}function cfe(e){let{chart:t,fill:n,line:r}=e;if(p3(n))return lfe(t,n);if(n===`stack`)return ife(e);if(n===`shape`)return!0;let i=ufe(e);return i instanceof Q7?i:k5(i,r)}function lfe(e,t){let n=e.getDatasetMeta(t);return n&&e.isDatasetVisible(t)?n.dataset:null}function ufe(e){return(e.scale||{}).getPointPositionForValue?ffe(e):dfe(e)}function dfe(e){let{scale:t={},fill:n}=e,r=tfe(n,t);if(p3(r)){let e=t.isHorizontal();return{x:e?r:null,y:e?null:r}}return null}function ffe(e){let{scale:t,fill:n}=e,r=t.options,i=t.getLabels().length,a=r.reverse?t.max:t.min,o=nfe(n,t,a),s=[];if(r.grid.circular){let e=t.getPointPositionForValue(0,a);return new Q7({x:e.x,y:e.y,radius:t.getDistanceFromCenterForValue(o)})}for(let e=0;e<i;++e)s.push(t.getPointPositionForValue(e,o));return s}function j5(e,t,n){let r=cfe(t),{chart:i,index:a,line:o,scale:s,axis:c}=t,l=o.options,u=l.fill,d=l.backgroundColor,{above:f=d,below:p=d}=u||{},m=I6(i,i.getDatasetMeta(a));r&&o.points.length&&(Q3(e,n),pfe(e,{line:o,target:r,above:f,below:p,area:n,scale:s,axis:c,clip:m}),$3(e))}function pfe(e,t){let{line:n,target:r,above:i,below:a,area:o,scale:s,clip:c}=t,l=n._loop?`angle`:t.axis;e.save();let u=a;a!==i&&(l===`x`?(M5(e,r,o.top),P5(e,{line:n,target:r,color:i,scale:s,property:l,clip:c}),e.restore(),e.save(),M5(e,r,o.bottom)):l===`y`&&(N5(e,r,o.left),P5(e,{line:n,target:r,color:a,scale:s,property:l,clip:c}),e.restore(),e.save(),N5(e,r,o.right),u=i)),P5(e,{line:n,target:r,color:u,scale:s,property:l,clip:c}),e.restore()}function M5(e,t,n){let{segments:r,points:i}=t,a=!0,o=!1;e.beginPath();for(let s of r){let{start:r,end:c}=s,l=i[r],u=i[D5(r,c,i)];a?(e.moveTo(l.x,l.y),a=!1):(e.lineTo(l.x,n),e.lineTo(l.x,l.y)),o=!!t.pathSegment(e,s,{move:o}),o?e.closePath():e.lineTo(u.x,n)}e.lineTo(t.first().x,n),e.closePath(),e.clip()}function N5(e,t,n){let{segments:r,points:i}=t,a=!0,o=!1;e.beginPath();for(let s of r){let{start:r,end:c}=s,l=i[r],u=i[D5(r,c,i)];a?(e.moveTo(l.x,l.y),a=!1):(e.lineTo(n,l.y),e.lineTo(l.x,l.y)),o=!!t.pathSegment(e,s,{move:o}),o?e.closePath():e.lineTo(n,u.y)}e.lineTo(n,t.first().y),e.closePath(),e.clip()}function P5(e,t){let{line:n,target:r,property:i,color:a,scale:o,clip:s}=t,c=Xde(n,r,i);for(let{source:t,target:l,start:u,end:d}of c){let{style:{backgroundColor:c=a}={}}=t,f=r!==!0;e.save(),e.fillStyle=c,mfe(e,o,s,f&&E5(i,u,d)),e.beginPath();let p=!!n.pathSegment(e,t),m;if(f){p?e.closePath():F5(e,r,d,i);let t=!!r.pathSegment(e,l,{move:p,reverse:!0});m=p&&t,m||F5(e,r,u,i)}e.closePath(),e.fill(m?`evenodd`:`nonzero`),e.restore()}}function mfe(e,t,n,r){let i=t.chart.chartArea,{property:a,start:o,end:s}=r||{};if(a===`x`||a===`y`){let t,r,c,l;a===`x`?(t=o,r=i.top,c=s,l=i.bottom):(t=i.left,r=o,c=i.right,l=s),e.beginPath(),n&&(t=Math.max(t,n.left),c=Math.min(c,n.right),r=Math.max(r,n.top),l=Math.min(l,n.bottom)),e.rect(t,r,c-t,l-r),e.clip()}}function F5(e,t,n,r){let i=t.interpolate(n,r);i&&e.lineTo(i.x,i.y)}function hfe(e,t,n,r,i){return{itemWidth:gfe(r,e,t,n),itemHeight:_fe(i,r,t.lineHeight)}}function gfe(e,t,n,r){let i=e.text;return i&&typeof i!=`string`&&(i=i.reduce((e,t)=>e.length>t.length?e:t)),t+n.size/2+r.measureText(i).width}function _fe(e,t,n){let r=e;return typeof t.text!=`string`&&(r=I5(t,n)),r}function I5(e,t){return t*(e.text?e.text.length:0)}function vfe(e,t){return!!((e===`mousemove`||e===`mouseout`)&&(t.onHover||t.onLeave)||t.onClick&&(e===`click`||e===`mouseup`))}function yfe(e,t){let n=new i9({ctx:e.ctx,options:t,chart:e});b7.configure(e,n,t),b7.addBox(e,n),e.titleBlock=n}function L5(e,t){return t&&(d3(t)?Array.prototype.push.apply(e,t):e.push(t)),e}function R5(e){return(typeof e==`string`||e instanceof String)&&e.indexOf(`
 `)>-1?e.split(`
-`):e}function bfe(e,t){let{element:n,datasetIndex:r,index:i}=t,a=e.getDatasetMeta(r).controller,{label:o,value:s}=a.getLabelAndValue(i);return{chart:e,label:o,parsed:a.getParsed(i),raw:e.data.datasets[r].data[i],formattedValue:s,dataset:a.getDataset(),dataIndex:i,datasetIndex:r,element:n}}function z5(e,t){let n=e.chart.ctx,{body:r,footer:i,title:a}=e,{boxWidth:o,boxHeight:s}=t,c=a6(t.bodyFont),l=a6(t.titleFont),u=a6(t.footerFont),d=a.length,f=i.length,p=r.length,m=i6(t.padding),h=m.height,g=0,_=r.reduce((e,t)=>e+t.before.length+t.lines.length+t.after.length,0);if(_+=e.beforeBody.length+e.afterBody.length,d&&(h+=d*l.lineHeight+(d-1)*t.titleSpacing+t.titleMarginBottom),_){let e=t.displayColors?Math.max(s,c.lineHeight):c.lineHeight;h+=p*e+(_-p)*c.lineHeight+(_-1)*t.bodySpacing}f&&(h+=t.footerMarginTop+f*u.lineHeight+(f-1)*t.footerSpacing);let v=0,y=function(e){g=Math.max(g,n.measureText(e).width+v)};return n.save(),n.font=l.string,_3(e.title,y),n.font=c.string,_3(e.beforeBody.concat(e.afterBody),y),v=t.displayColors?o+2+t.boxPadding:0,_3(r,e=>{_3(e.before,y),_3(e.lines,y),_3(e.after,y)}),v=0,n.font=u.string,_3(e.footer,y),n.restore(),g+=m.width,{width:g,height:h}}function xfe(e,t){let{y:n,height:r}=t;return n<r/2?`top`:n>e.height-r/2?`bottom`:`center`}function Sfe(e,t,n,r){let{x:i,width:a}=r,o=n.caretSize+n.caretPadding;if(e===`left`&&i+a+o>t.width||e===`right`&&i-a-o<0)return!0}function Cfe(e,t,n,r){let{x:i,width:a}=n,{width:o,chartArea:{left:s,right:c}}=e,l=`center`;return r===`center`?l=i<=(s+c)/2?`left`:`right`:i<=a/2?l=`left`:i>=o-a/2&&(l=`right`),Sfe(l,e,t,n)&&(l=`center`),l}function B5(e,t,n){let r=n.yAlign||t.yAlign||xfe(e,n);return{xAlign:n.xAlign||t.xAlign||Cfe(e,t,n,r),yAlign:r}}function wfe(e,t){let{x:n,width:r}=e;return t===`right`?n-=r:t===`center`&&(n-=r/2),n}function Tfe(e,t,n){let{y:r,height:i}=e;return t===`top`?r+=n:t===`bottom`?r-=i+n:r-=i/2,r}function V5(e,t,n,r){let{caretSize:i,caretPadding:a,cornerRadius:o}=e,{xAlign:s,yAlign:c}=n,l=i+a,{topLeft:u,topRight:d,bottomLeft:f,bottomRight:p}=r6(o),m=wfe(t,s),h=Tfe(t,c,l);return c===`center`?s===`left`?m+=l:s===`right`&&(m-=l):s===`left`?m-=Math.max(u,f)+i:s===`right`&&(m+=Math.max(d,p)+i),{x:F3(m,0,r.width-t.width),y:F3(h,0,r.height-t.height)}}function H5(e,t,n){let r=i6(n.padding);return t===`center`?e.x+e.width/2:t===`right`?e.x+e.width-r.right:e.x+r.left}function U5(e){return L5([],R5(e))}function Efe(e,t,n){return s6(e,{tooltip:t,tooltipItems:n,type:`tooltip`})}function W5(e,t){let n=t&&t.dataset&&t.dataset.tooltip&&t.dataset.tooltip.callbacks;return n?e.override(n):e}function G5(e,t,n,r){let i=e[t].call(n,r);return i===void 0?s9[t].call(n,r):i}function Dfe(e,t,n,r){let i=e.indexOf(t);return i===-1?u9(e,t,n,r):i===e.lastIndexOf(t)?i:n}function K5(e){let t=this.getLabels();return e>=0&&e<t.length?t[e]:e}function Ofe(e,t){let n=[],{bounds:r,step:i,min:a,max:o,precision:s,count:c,maxTicks:l,maxDigits:u,includeBounds:d}=e,f=i||1,p=l-1,{min:m,max:h}=t,g=!u3(a),_=!u3(o),v=!u3(c),y=(h-m)/(u+1),b=E3((h-m)/p/f)*f,x,S,C,w;if(b<1e-14&&!g&&!_)return[{value:m},{value:h}];w=Math.ceil(h/b)-Math.floor(m/b),w>p&&(b=E3(w*b/p/f)*f),u3(s)||(x=10**s,b=Math.ceil(b*x)/x),r===`ticks`?(S=Math.floor(m/b)*b,C=Math.ceil(h/b)*b):(S=m,C=h),g&&_&&i&&Lle((o-a)/i,b/1e3)?(w=Math.round(Math.min((o-a)/b,l)),b=(o-a)/w,S=a,C=o):v?(S=g?a:S,C=_?o:C,w=c-1,b=(C-S)/w):(w=(C-S)/b,w=T3(w,Math.round(w),b/1e3)?Math.round(w):Math.ceil(w));let T=Math.max(j3(b),j3(S));x=10**(u3(s)?T:s),S=Math.round(S*x)/x,C=Math.round(C*x)/x;let E=0;for(g&&(d&&S!==a?(n.push({value:a}),S<a&&E++,T3(Math.round((S+E*b)*x)/x,a,q5(a,y,e))&&E++):S<a&&E++);E<w;++E){let e=Math.round((S+E*b)*x)/x;if(_&&e>o)break;n.push({value:e})}return _&&d&&C!==o?n.length&&T3(n[n.length-1].value,o,q5(o,y,e))?n[n.length-1].value=o:n.push({value:o}):(!_||C===o)&&n.push({value:C}),n}function q5(e,t,{horizontal:n,minRotation:r}){let i=k3(r),a=(n?Math.sin(i):Math.cos(i))||.001,o=.75*t*(``+e).length;return Math.min(t/a,o)}function J5(e){return e/10**h9(e)==1}function Y5(e,t,n){let r=10**n,i=Math.floor(e/r);return Math.ceil(t/r)-i}function kfe(e,t){let n=t-e,r=h9(n);for(;Y5(e,t,r)>10;)r++;for(;Y5(e,t,r)<10;)r--;return Math.min(r,h9(e))}function Afe(e,{min:t,max:n}){t=m3(e.min,t);let r=[],i=h9(t),a=kfe(t,n),o=a<0?10**Math.abs(a):1,s=10**a,c=i>a?10**i:0,l=Math.round((t-c)*o)/o,u=Math.floor((t-c)/s/10)*s*10,d=Math.floor((l-u)/10**a),f=m3(e.min,Math.round((c+u+d*10**a)*o)/o);for(;f<n;)r.push({value:f,major:J5(f),significand:d}),d>=10?d=d<15?15:20:d++,d>=20&&(a++,d=2,o=a>=0?1:o),f=Math.round((c+u+d*10**a)*o)/o;let p=m3(e.max,f);return r.push({value:p,major:J5(p),significand:d}),r}function X5(e){let t=e.ticks;if(t.display&&e.display){let e=i6(t.backdropPadding);return h3(t.font&&t.font.size,v8.font.size)+e.height}return 0}function jfe(e,t,n){return n=d3(n)?n:[n],{w:$le(e,t.string,n),h:n.length*t.lineHeight}}function Z5(e,t,n,r,i){return e===r||e===i?{start:t-n/2,end:t+n/2}:e<r||e>i?{start:t-n,end:t}:{start:t,end:t+n}}function Mfe(e){let t={l:e.left+e._padding.left,r:e.right-e._padding.right,t:e.top+e._padding.top,b:e.bottom-e._padding.bottom},n=Object.assign({},t),r=[],i=[],a=e._pointLabels.length,o=e.options.pointLabels,s=o.centerPointLabels?U6/a:0;for(let c=0;c<a;c++){let a=o.setContext(e.getPointLabelContext(c));i[c]=a.padding;let l=e.getPointPosition(c,e.drawingArea+i[c],s),u=a6(a.font),d=jfe(e.ctx,u,e._pointLabels[c]);r[c]=d;let f=N3(e.getIndexAngle(c)+s),p=Math.round(A3(f));Nfe(n,t,f,Z5(p,l.x,d.w,0,180),Z5(p,l.y,d.h,90,270))}e.setCenterPoint(t.l-n.l,n.r-t.r,t.t-n.t,n.b-t.b),e._pointLabelItems=Ife(e,r,i)}function Nfe(e,t,n,r,i){let a=Math.abs(Math.sin(n)),o=Math.abs(Math.cos(n)),s=0,c=0;r.start<t.l?(s=(t.l-r.start)/a,e.l=Math.min(e.l,t.l-s)):r.end>t.r&&(s=(r.end-t.r)/a,e.r=Math.max(e.r,t.r+s)),i.start<t.t?(c=(t.t-i.start)/o,e.t=Math.min(e.t,t.t-c)):i.end>t.b&&(c=(i.end-t.b)/o,e.b=Math.max(e.b,t.b+c))}function Pfe(e,t,n){let r=e.drawingArea,{extra:i,additionalAngle:a,padding:o,size:s}=n,c=e.getPointPosition(t,r+i+o,a),l=Math.round(A3(N3(c.angle+J6))),u=zfe(c.y,s.h,l),d=Lfe(l),f=Rfe(c.x,s.w,d);return{visible:!0,x:c.x,y:u,textAlign:d,left:f,top:u,right:f+s.w,bottom:u+s.h}}function Ffe(e,t){if(!t)return!0;let{left:n,top:r,right:i,bottom:a}=e;return!(Z3({x:n,y:r},t)||Z3({x:n,y:a},t)||Z3({x:i,y:r},t)||Z3({x:i,y:a},t))}function Ife(e,t,n){let r=[],i=e._pointLabels.length,a=e.options,{centerPointLabels:o,display:s}=a.pointLabels,c={extra:X5(a)/2,additionalAngle:o?U6/i:0},l;for(let a=0;a<i;a++){c.padding=n[a],c.size=t[a];let i=Pfe(e,a,c);r.push(i),s===`auto`&&(i.visible=Ffe(i,l),i.visible&&(l=i))}return r}function Lfe(e){return e===0||e===180?`center`:e<180?`left`:`right`}function Rfe(e,t,n){return n===`right`?e-=t:n===`center`&&(e-=t/2),e}function zfe(e,t,n){return n===90||n===270?e-=t/2:(n>270||n<90)&&(e-=t),e}function Bfe(e,t,n){let{left:r,top:i,right:a,bottom:o}=n,{backdropColor:s}=t;if(!u3(s)){let n=r6(t.borderRadius),c=i6(t.backdropPadding);e.fillStyle=s;let l=r-c.left,u=i-c.top,d=a-r+c.width,f=o-i+c.height;Object.values(n).some(e=>e!==0)?(e.beginPath(),t6(e,{x:l,y:u,w:d,h:f,radius:n}),e.fill()):e.fillRect(l,u,d,f)}}function Vfe(e,t){let{ctx:n,options:{pointLabels:r}}=e;for(let i=t-1;i>=0;i--){let t=e._pointLabelItems[i];if(!t.visible)continue;let a=r.setContext(e.getPointLabelContext(i));Bfe(n,a,t);let o=a6(a.font),{x:s,y:c,textAlign:l}=t;e6(n,e._pointLabels[i],s,c+o.lineHeight/2,o,{color:a.color,textAlign:l,textBaseline:`middle`})}}function Q5(e,t,n,r){let{ctx:i}=e;if(n)i.arc(e.xCenter,e.yCenter,t,0,W6);else{let n=e.getPointPosition(0,t);i.moveTo(n.x,n.y);for(let a=1;a<r;a++)n=e.getPointPosition(a,t),i.lineTo(n.x,n.y)}}function Hfe(e,t,n,r,i){let a=e.ctx,o=t.circular,{color:s,lineWidth:c}=t;!o&&!r||!s||!c||n<0||(a.save(),a.strokeStyle=s,a.lineWidth=c,a.setLineDash(i.dash||[]),a.lineDashOffset=i.dashOffset,a.beginPath(),Q5(e,n,o,r),a.closePath(),a.stroke(),a.restore())}function Ufe(e,t,n){return s6(e,{label:n,index:t,type:`pointLabel`})}function $5(e,t){return e-t}function e7(e,t){if(u3(t))return null;let n=e._adapter,{parser:r,round:i,isoWeekday:a}=e._parseOpts,o=t;return typeof r==`function`&&(o=r(o)),p3(o)||(o=typeof r==`string`?n.parse(o,r):n.parse(o)),o===null?null:(i&&(o=i===`week`&&(D3(a)||a===!0)?n.startOf(o,`isoWeek`,a):n.startOf(o,i)),+o)}function t7(e,t,n,r){let i=v9.length;for(let a=v9.indexOf(e);a<i-1;++a){let e=_9[v9[a]],i=e.steps?e.steps:2**53-1;if(e.common&&Math.ceil((n-t)/(i*e.size))<=r)return v9[a]}return v9[i-1]}function Wfe(e,t,n,r,i){for(let a=v9.length-1;a>=v9.indexOf(n);a--){let n=v9[a];if(_9[n].common&&e._adapter.diff(i,r,n)>=t-1)return n}return v9[n?v9.indexOf(n):0]}function Gfe(e){for(let t=v9.indexOf(e)+1,n=v9.length;t<n;++t)if(_9[v9[t]].common)return v9[t]}function n7(e,t,n){if(!n)e[t]=!0;else if(n.length){let{lo:r,hi:i}=L3(n,t),a=n[r]>=t?n[r]:n[i];e[a]=!0}}function Kfe(e,t,n,r){let i=e._adapter,a=+i.startOf(t[0].value,r),o=t[t.length-1].value,s,c;for(s=a;s<=o;s=+i.add(s,1,r))c=n[s],c>=0&&(t[c].major=!0);return t}function r7(e,t,n){let r=[],i={},a=t.length,o,s;for(o=0;o<a;++o)s=t[o],i[s]=o,r.push({value:s,major:!1});return a===0||!n?r:Kfe(e,r,i,n)}function i7(e,t,n){let r=0,i=e.length-1,a,o,s,c;n?(t>=e[r].pos&&t<=e[i].pos&&({lo:r,hi:i}=$6(e,`pos`,t)),{pos:a,time:s}=e[r],{pos:o,time:c}=e[i]):(t>=e[r].time&&t<=e[i].time&&({lo:r,hi:i}=$6(e,`time`,t)),{time:a,pos:s}=e[r],{time:o,pos:c}=e[i]);let l=o-a;return l?s+(c-s)*(t-a)/l:s}var a7,o7,s7,c7,l7,u7,d7,f7,p7,m7,h7,g7,_7,v7,y7,b7,x7,S7,C7,w7,T7,E7,D7,O7,k7,A7,j7,M7,N7,P7,F7,I7,L7,R7,z7,B7,V7,H7,U7,W7,G7,K7,q7,J7,Y7,X7,Z7,Q7,$7,e9,t9,n9,r9,i9,a9,o9,s9,c9,l9,u9,d9,f9,p9,m9,h9,g9,_9,v9,y9,b9=t((()=>{Pue(),a7=class{constructor(){this._request=null,this._charts=new Map,this._running=!1,this._lastDate=void 0}_notify(e,t,n,r){let i=t.listeners[r],a=t.duration;i.forEach(r=>r({chart:e,initial:t.initial,numSteps:a,currentStep:Math.min(n-t.start,a)}))}_refresh(){this._request||=(this._running=!0,n8.call(window,()=>{this._update(),this._request=null,this._running&&this._refresh()}))}_update(e=Date.now()){let t=0;this._charts.forEach((n,r)=>{if(!n.running||!n.items.length)return;let i=n.items,a=i.length-1,o=!1,s;for(;a>=0;--a)s=i[a],s._active?(s._total>n.duration&&(n.duration=s._total),s.tick(e),o=!0):(i[a]=i[i.length-1],i.pop());o&&(r.draw(),this._notify(r,n,e,`progress`)),i.length||(n.running=!1,this._notify(r,n,e,`complete`),n.initial=!1),t+=i.length}),this._lastDate=e,t===0&&(this._running=!1)}_getAnims(e){let t=this._charts,n=t.get(e);return n||(n={running:!1,initial:!0,items:[],listeners:{complete:[],progress:[]}},t.set(e,n)),n}listen(e,t,n){this._getAnims(e).listeners[t].push(n)}add(e,t){!t||!t.length||this._getAnims(e).items.push(...t)}has(e){return this._getAnims(e).items.length>0}start(e){let t=this._charts.get(e);t&&(t.running=!0,t.start=Date.now(),t.duration=t.items.reduce((e,t)=>Math.max(e,t._duration),0),this._refresh())}running(e){if(!this._running)return!1;let t=this._charts.get(e);return!(!t||!t.running||!t.items.length)}stop(e){let t=this._charts.get(e);if(!t||!t.items.length)return;let n=t.items,r=n.length-1;for(;r>=0;--r)n[r].cancel();t.items=[],this._notify(e,t,Date.now(),`complete`)}remove(e){return this._charts.delete(e)}},o7=new a7,s7=`transparent`,c7={boolean(e,t,n){return n>.5?t:e},color(e,t,n){let r=V3(e||s7),i=r.valid&&V3(t||s7);return i&&i.valid?i.mix(r,n).hexString():t},number(e,t,n){return e+(t-e)*n}},l7=class{constructor(e,t,n,r){let i=t[n];r=o6([e.to,r,i,e.from]);let a=o6([e.from,i,r]);this._active=!0,this._fn=e.fn||c7[e.type||typeof a],this._easing=l8[e.easing]||l8.linear,this._start=Math.floor(Date.now()+(e.delay||0)),this._duration=this._total=Math.floor(e.duration),this._loop=!!e.loop,this._target=t,this._prop=n,this._from=a,this._to=r,this._promises=void 0}active(){return this._active}update(e,t,n){if(this._active){this._notify(!1);let r=this._target[this._prop],i=n-this._start,a=this._duration-i;this._start=n,this._duration=Math.floor(Math.max(a,e.duration)),this._total+=i,this._loop=!!e.loop,this._to=o6([e.to,t,r,e.from]),this._from=o6([e.from,r,t])}}cancel(){this._active&&(this.tick(Date.now()),this._active=!1,this._notify(!1))}tick(e){let t=e-this._start,n=this._duration,r=this._prop,i=this._from,a=this._loop,o=this._to,s;if(this._active=i!==o&&(a||t<n),!this._active){this._target[r]=o,this._notify(!0);return}if(t<0){this._target[r]=i;return}s=t/n%2,s=a&&s>1?2-s:s,s=this._easing(Math.min(1,Math.max(0,s))),this._target[r]=this._fn(i,o,s)}wait(){let e=this._promises||=[];return new Promise((t,n)=>{e.push({res:t,rej:n})})}_notify(e){let t=e?`res`:`rej`,n=this._promises||[];for(let e=0;e<n.length;e++)n[e][t]()}},u7=class{constructor(e,t){this._chart=e,this._properties=new Map,this.configure(t)}configure(e){if(!f3(e))return;let t=Object.keys(v8.animation),n=this._properties;Object.getOwnPropertyNames(e).forEach(r=>{let i=e[r];if(!f3(i))return;let a={};for(let e of t)a[e]=i[e];(d3(i.properties)&&i.properties||[r]).forEach(e=>{(e===r||!n.has(e))&&n.set(e,a)})})}_animateOptions(e,t){let n=t.options,r=Iue(e,n);if(!r)return[];let i=this._createAnimations(r,n);return n.$shared&&Fue(e.options.$animations,n).then(()=>{e.options=n},()=>{}),i}_createAnimations(e,t){let n=this._properties,r=[],i=e.$animations||={},a=Object.keys(t),o=Date.now(),s;for(s=a.length-1;s>=0;--s){let c=a[s];if(c.charAt(0)===`$`)continue;if(c===`options`){r.push(...this._animateOptions(e,t));continue}let l=t[c],u=i[c],d=n.get(c);if(u)if(d&&u.active()){u.update(d,l,o);continue}else u.cancel();if(!d||!d.duration){e[c]=l;continue}i[c]=u=new l7(d,e,c,l),r.push(u)}return r}update(e,t){if(this._properties.size===0){Object.assign(e,t);return}let n=this._createAnimations(e,t);if(n.length)return o7.add(this._chart,n),!0}},d7=e=>e===`reset`||e===`none`,f7=(e,t)=>t?e:Object.assign({},e),p7=(e,t,n)=>e&&!t.hidden&&t._stacked&&{keys:I8(n,!0),values:null},m7=class{static defaults={};static datasetElementType=null;static dataElementType=null;constructor(e,t){this.chart=e,this._ctx=e.ctx,this.index=t,this._cachedDataOpts={},this._cachedMeta=this.getMeta(),this._type=this._cachedMeta.type,this.options=void 0,this._parsing=!1,this._data=void 0,this._objectData=void 0,this._sharedOptions=void 0,this._drawStart=void 0,this._drawCount=void 0,this.enableOptionSharing=!1,this.supportsDecimation=!1,this.$context=void 0,this._syncList=[],this.datasetElementType=new.target.datasetElementType,this.dataElementType=new.target.dataElementType,this.initialize()}initialize(){let e=this._cachedMeta;this.configure(),this.linkScales(),e._stacked=R8(e.vScale,e),this.addElements(),this.options.fill&&!this.chart.isPluginEnabled(`filler`)&&console.warn(`Tried to use the 'fill' option without the 'Filler' plugin enabled. Please import and register the 'Filler' plugin and make sure it is not disabled in the options`)}updateIndex(e){this.index!==e&&H8(this._cachedMeta),this.index=e}linkScales(){let e=this.chart,t=this._cachedMeta,n=this.getDataset(),r=(e,t,n,r)=>e===`x`?t:e===`r`?r:n,i=t.xAxisID=h3(n.xAxisID,V8(e,`x`)),a=t.yAxisID=h3(n.yAxisID,V8(e,`y`)),o=t.rAxisID=h3(n.rAxisID,V8(e,`r`)),s=t.indexAxis,c=t.iAxisID=r(s,i,a,o),l=t.vAxisID=r(s,a,i,o);t.xScale=this.getScaleForId(i),t.yScale=this.getScaleForId(a),t.rScale=this.getScaleForId(o),t.iScale=this.getScaleForId(c),t.vScale=this.getScaleForId(l)}getDataset(){return this.chart.data.datasets[this.index]}getMeta(){return this.chart.getDatasetMeta(this.index)}getScaleForId(e){return this.chart.scales[e]}_getOtherScale(e){let t=this._cachedMeta;return e===t.iScale?t.vScale:t.iScale}reset(){this._update(`reset`)}_destroy(){let e=this._cachedMeta;this._data&&R3(this._data,this),e._stacked&&H8(e)}_dataCheck(){let e=this.getDataset(),t=e.data||=[],n=this._data;if(f3(t)){let e=this._cachedMeta;this._data=zue(t,e)}else if(n!==t){if(n){R3(n,this);let e=this._cachedMeta;H8(e),e._parsed=[]}t&&Object.isExtensible(t)&&Hle(t,this),this._syncList=[],this._data=t}}addElements(){let e=this._cachedMeta;this._dataCheck(),this.datasetElementType&&(e.dataset=new this.datasetElementType)}buildOrUpdateElements(e){let t=this._cachedMeta,n=this.getDataset(),r=!1;this._dataCheck();let i=t._stacked;t._stacked=R8(t.vScale,t),t.stack!==n.stack&&(r=!0,H8(t),t.stack=n.stack),this._resyncElements(e),(r||i!==t._stacked)&&(B8(this,t._parsed),t._stacked=R8(t.vScale,t))}configure(){let e=this.chart.config,t=e.datasetScopeKeys(this._type),n=e.getOptionScopes(this.getDataset(),t,!0);this.options=e.createResolver(n,this.getContext()),this._parsing=this.options.parsing,this._cachedDataOpts={}}parse(e,t){let{_cachedMeta:n,_data:r}=this,{iScale:i,_stacked:a}=n,o=i.axis,s=e===0&&t===r.length||n._sorted,c=e>0&&n._parsed[e-1],l,u,d;if(this._parsing===!1)n._parsed=r,n._sorted=!0,d=r;else{d=d3(r[e])?this.parseArrayData(n,r,e,t):f3(r[e])?this.parseObjectData(n,r,e,t):this.parsePrimitiveData(n,r,e,t);let i=()=>u[o]===null||c&&u[o]<c[o];for(l=0;l<t;++l)n._parsed[l+e]=u=d[l],s&&(i()&&(s=!1),c=u);n._sorted=s}a&&B8(this,d)}parsePrimitiveData(e,t,n,r){let{iScale:i,vScale:a}=e,o=i.axis,s=a.axis,c=i.getLabels(),l=i===a,u=Array(r),d,f,p;for(d=0,f=r;d<f;++d)p=d+n,u[d]={[o]:l||i.parse(c[p],p),[s]:a.parse(t[p],p)};return u}parseArrayData(e,t,n,r){let{xScale:i,yScale:a}=e,o=Array(r),s,c,l,u;for(s=0,c=r;s<c;++s)l=s+n,u=t[l],o[s]={x:i.parse(u[0],l),y:a.parse(u[1],l)};return o}parseObjectData(e,t,n,r){let{xScale:i,yScale:a}=e,{xAxisKey:o=`x`,yAxisKey:s=`y`}=this._parsing,c=Array(r),l,u,d,f;for(l=0,u=r;l<u;++l)d=l+n,f=t[d],c[l]={x:i.parse(C3(f,o),d),y:a.parse(C3(f,s),d)};return c}getParsed(e){return this._cachedMeta._parsed[e]}getDataElement(e){return this._cachedMeta.data[e]}applyStack(e,t,n){let r=this.chart,i=this._cachedMeta,a=t[e.axis];return L8({keys:I8(r,!0),values:t._stacks[e.axis]._visualValues},a,i.index,{mode:n})}updateRangeFromParsed(e,t,n,r){let i=n[t.axis],a=i===null?NaN:i,o=r&&n._stacks[t.axis];r&&o&&(r.values=o,a=L8(r,i,this._cachedMeta.index)),e.min=Math.min(e.min,a),e.max=Math.max(e.max,a)}getMinMax(e,t){let n=this._cachedMeta,r=n._parsed,i=n._sorted&&e===n.iScale,a=r.length,o=this._getOtherScale(e),s=p7(t,n,this.chart),c={min:1/0,max:-1/0},{min:l,max:u}=Vue(o),d,f;function p(){f=r[d];let t=f[o.axis];return!p3(f[e.axis])||l>t||u<t}for(d=0;d<a&&!(!p()&&(this.updateRangeFromParsed(c,e,f,s),i));++d);if(i){for(d=a-1;d>=0;--d)if(!p()){this.updateRangeFromParsed(c,e,f,s);break}}return c}getAllParsedValues(e){let t=this._cachedMeta._parsed,n=[],r,i,a;for(r=0,i=t.length;r<i;++r)a=t[r][e.axis],p3(a)&&n.push(a);return n}getMaxOverflow(){return!1}getLabelAndValue(e){let t=this._cachedMeta,n=t.iScale,r=t.vScale,i=this.getParsed(e);return{label:n?``+n.getLabelForValue(i[n.axis]):``,value:r?``+r.getLabelForValue(i[r.axis]):``}}_update(e){let t=this._cachedMeta;this.update(e||`default`),t._clip=Rue(h3(this.options.clip,Lue(t.xScale,t.yScale,this.getMaxOverflow())))}update(e){}draw(){let e=this._ctx,t=this.chart,n=this._cachedMeta,r=n.data||[],i=t.chartArea,a=[],o=this._drawStart||0,s=this._drawCount||r.length-o,c=this.options.drawActiveElementsOnTop,l;for(n.dataset&&n.dataset.draw(e,i,o,s),l=o;l<o+s;++l){let t=r[l];t.hidden||(t.active&&c?a.push(t):t.draw(e,i))}for(l=0;l<a.length;++l)a[l].draw(e,i)}getStyle(e,t){let n=t?`active`:`default`;return e===void 0&&this._cachedMeta.dataset?this.resolveDatasetElementOptions(n):this.resolveDataElementOptions(e||0,n)}getContext(e,t,n){let r=this.getDataset(),i;if(e>=0&&e<this._cachedMeta.data.length){let t=this._cachedMeta.data[e];i=t.$context||=Wue(this.getContext(),e,t),i.parsed=this.getParsed(e),i.raw=r.data[e],i.index=i.dataIndex=e}else i=this.$context||=Uue(this.chart.getContext(),this.index),i.dataset=r,i.index=i.datasetIndex=this.index;return i.active=!!t,i.mode=n,i}resolveDatasetElementOptions(e){return this._resolveElementOptions(this.datasetElementType.id,e)}resolveDataElementOptions(e,t){return this._resolveElementOptions(this.dataElementType.id,t,e)}_resolveElementOptions(e,t=`default`,n){let r=t===`active`,i=this._cachedDataOpts,a=e+`-`+t,o=i[a],s=this.enableOptionSharing&&B6(n);if(o)return f7(o,s);let c=this.chart.config,l=c.datasetElementScopeKeys(this._type,e),u=r?[`${e}Hover`,`hover`,e,``]:[e,``],d=c.getOptionScopes(this.getDataset(),l),f=Object.keys(v8.elements[e]),p=c.resolveNamedOptions(d,f,()=>this.getContext(n,r,t),u);return p.$shared&&(p.$shared=s,i[a]=Object.freeze(f7(p,s))),p}_resolveAnimations(e,t,n){let r=this.chart,i=this._cachedDataOpts,a=`animation-${t}`,o=i[a];if(o)return o;let s;if(r.options.animation!==!1){let r=this.chart.config,i=r.datasetAnimationScopeKeys(this._type,t),a=r.getOptionScopes(this.getDataset(),i);s=r.createResolver(a,this.getContext(e,n,t))}let c=new u7(r,s&&s.animations);return s&&s._cacheable&&(i[a]=Object.freeze(c)),c}getSharedOptions(e){if(e.$shared)return this._sharedOptions||=Object.assign({},e)}includeOptions(e,t){return!t||d7(e)||this.chart._animationsDisabled}_getSharedOptions(e,t){let n=this.resolveDataElementOptions(e,t),r=this._sharedOptions,i=this.getSharedOptions(n),a=this.includeOptions(t,i)||i!==r;return this.updateSharedOptions(i,t,n),{sharedOptions:i,includeOptions:a}}updateElement(e,t,n,r){d7(r)?Object.assign(e,n):this._resolveAnimations(t,r).update(e,n)}updateSharedOptions(e,t,n){e&&!d7(t)&&this._resolveAnimations(void 0,t).update(e,n)}_setStyle(e,t,n,r){e.active=r;let i=this.getStyle(t,r);this._resolveAnimations(t,n,r).update(e,{options:!r&&this.getSharedOptions(i)||i})}removeHoverStyle(e,t,n){this._setStyle(e,n,`active`,!1)}setHoverStyle(e,t,n){this._setStyle(e,n,`active`,!0)}_removeDatasetHoverStyle(){let e=this._cachedMeta.dataset;e&&this._setStyle(e,void 0,`active`,!1)}_setDatasetHoverStyle(){let e=this._cachedMeta.dataset;e&&this._setStyle(e,void 0,`active`,!0)}_resyncElements(e){let t=this._data,n=this._cachedMeta.data;for(let[e,t,n]of this._syncList)this[e](t,n);this._syncList=[];let r=n.length,i=t.length,a=Math.min(i,r);a&&this.parse(0,a),i>r?this._insertElements(r,i-r,e):i<r&&this._removeElements(i,r-i)}_insertElements(e,t,n=!0){let r=this._cachedMeta,i=r.data,a=e+t,o,s=e=>{for(e.length+=t,o=e.length-1;o>=a;o--)e[o]=e[o-t]};for(s(i),o=e;o<a;++o)i[o]=new this.dataElementType;this._parsing&&s(r._parsed),this.parse(e,t),n&&this.updateElements(i,e,t,`reset`)}updateElements(e,t,n,r){}_removeElements(e,t){let n=this._cachedMeta;if(this._parsing){let r=n._parsed.splice(e,t);n._stacked&&H8(n,r)}n.data.splice(e,t)}_sync(e){if(this._parsing)this._syncList.push(e);else{let[t,n,r]=e;this[t](n,r)}this.chart._dataChanges.push([this.index,...e])}_onDataPush(){let e=arguments.length;this._sync([`_insertElements`,this.getDataset().data.length-e,e])}_onDataPop(){this._sync([`_removeElements`,this._cachedMeta.data.length-1,1])}_onDataShift(){this._sync([`_removeElements`,0,1])}_onDataSplice(e,t){t&&this._sync([`_removeElements`,e,t]);let n=arguments.length-2;n&&this._sync([`_insertElements`,e,n])}_onDataUnshift(){this._sync([`_insertElements`,0,arguments.length])}},h7=class extends m7{static id=`line`;static defaults={datasetElementType:`line`,dataElementType:`point`,showLine:!0,spanGaps:!1};static overrides={scales:{_index_:{type:`category`},_value_:{type:`linear`}}};initialize(){this.enableOptionSharing=!0,this.supportsDecimation=!0,super.initialize()}update(e){let t=this._cachedMeta,{dataset:n,data:r=[],_dataset:i}=t,a=this.chart._animationsDisabled,{start:o,count:s}=Gle(t,r,a);this._drawStart=o,this._drawCount=s,Kle(t)&&(o=0,s=r.length),n._chart=this.chart,n._datasetIndex=this.index,n._decimated=!!i._decimated,n.points=r;let c=this.resolveDatasetElementOptions(e);this.options.showLine||(c.borderWidth=0),c.segment=this.options.segment,this.updateElement(n,void 0,{animated:!a,options:c},e),this.updateElements(r,o,s,e)}updateElements(e,t,n,r){let i=r===`reset`,{iScale:a,vScale:o,_stacked:s,_dataset:c}=this._cachedMeta,{sharedOptions:l,includeOptions:u}=this._getSharedOptions(t,r),d=a.axis,f=o.axis,{spanGaps:p,segment:m}=this.options,h=D3(p)?p:1/0,g=this.chart._animationsDisabled||i||r===`none`,_=t+n,v=e.length,y=t>0&&this.getParsed(t-1);for(let n=0;n<v;++n){let p=e[n],v=g?p:{};if(n<t||n>=_){v.skip=!0;continue}let b=this.getParsed(n),x=u3(b[f]),S=v[d]=a.getPixelForValue(b[d],n),C=v[f]=i||x?o.getBasePixel():o.getPixelForValue(s?this.applyStack(o,b,s):b[f],n);v.skip=isNaN(S)||isNaN(C)||x,v.stop=n>0&&Math.abs(b[d]-y[d])>h,m&&(v.parsed=b,v.raw=c.data[n]),u&&(v.options=l||this.resolveDataElementOptions(n,p.active?`active`:r)),g||this.updateElement(p,n,v,r),y=b}}getMaxOverflow(){let e=this._cachedMeta,t=e.dataset,n=t.options&&t.options.borderWidth||0,r=e.data||[];if(!r.length)return n;let i=r[0].size(this.resolveDataElementOptions(0)),a=r[r.length-1].size(this.resolveDataElementOptions(r.length-1));return Math.max(n,i,a)/2}draw(){let e=this._cachedMeta;e.dataset.updateControlPoints(this.chart.chartArea,e.iScale.axis),super.draw()}},g7=class e{static override(t){Object.assign(e.prototype,t)}options;constructor(e){this.options=e||{}}init(){}formats(){return U8()}parse(){return U8()}format(){return U8()}add(){return U8()}diff(){return U8()}startOf(){return U8()}endOf(){return U8()}},_7={_date:g7},v7={evaluateInteractionItems:W8,modes:{index(e,t,n,r){let i=S6(t,e),a=n.axis||`x`,o=n.includeInvisible||!1,s=n.intersect?G8(e,i,a,r,o):K8(e,i,a,!1,r,o),c=[];return s.length?(e.getSortedVisibleDatasetMetas().forEach(e=>{let t=s[0].index,n=e.data[t];n&&!n.skip&&c.push({element:n,datasetIndex:e.index,index:t})}),c):[]},dataset(e,t,n,r){let i=S6(t,e),a=n.axis||`xy`,o=n.includeInvisible||!1,s=n.intersect?G8(e,i,a,r,o):K8(e,i,a,!1,r,o);if(s.length>0){let t=s[0].datasetIndex,n=e.getDatasetMeta(t).data;s=[];for(let e=0;e<n.length;++e)s.push({element:n[e],datasetIndex:t,index:e})}return s},point(e,t,n,r){return G8(e,S6(t,e),n.axis||`xy`,r,n.includeInvisible||!1)},nearest(e,t,n,r){let i=S6(t,e),a=n.axis||`xy`,o=n.includeInvisible||!1;return K8(e,i,a,n.intersect,r,o)},x(e,t,n,r){return q8(e,S6(t,e),`x`,n.intersect,r)},y(e,t,n,r){return q8(e,S6(t,e),`y`,n.intersect,r)}}},y7=[`left`,`top`,`right`,`bottom`],b7={addBox(e,t){e.boxes||=[],t.fullSize=t.fullSize||!1,t.position=t.position||`top`,t.weight=t.weight||0,t._layers=t._layers||function(){return[{z:0,draw(e){t.draw(e)}}]},e.boxes.push(t)},removeBox(e,t){let n=e.boxes?e.boxes.indexOf(t):-1;n!==-1&&e.boxes.splice(n,1)},configure(e,t,n){t.fullSize=n.fullSize,t.position=n.position,t.weight=n.weight},update(e,t,n,r){if(!e)return;let i=i6(e.options.layout.padding),a=Math.max(t-i.width,0),o=Math.max(n-i.height,0),s=Que(e.boxes),c=s.vertical,l=s.horizontal;_3(e.boxes,e=>{typeof e.beforeLayout==`function`&&e.beforeLayout()});let u=c.reduce((e,t)=>t.box.options&&t.box.options.display===!1?e:e+1,0)||1,d=Object.freeze({outerWidth:t,outerHeight:n,padding:i,availableWidth:a,availableHeight:o,vBoxMaxWidth:a/2/u,hBoxMaxHeight:o/2}),f=Object.assign({},i);Q8(f,i6(r));let p=Object.assign({maxPadding:f,w:a,h:o,x:i.left,y:i.top},i),m=Zue(c.concat(l),d);$8(s.fullSize,p,d,m),$8(c,p,d,m),$8(l,p,d,m)&&$8(c,p,d,m),ede(p),t5(s.leftAndTop,p,d,m),p.x+=p.w,p.y+=p.h,t5(s.rightAndBottom,p,d,m),e.chartArea={left:p.left,top:p.top,right:p.left+p.w,bottom:p.top+p.h,height:p.h,width:p.w},_3(s.chartArea,t=>{let n=t.box;Object.assign(n,e.chartArea),n.update(p.w,p.h,{left:0,top:0,right:0,bottom:0})})}},x7=class{acquireContext(e,t){}releaseContext(e){return!1}addEventListener(e,t,n){}removeEventListener(e,t,n){}getDevicePixelRatio(){return 1}getMaximumSize(e,t,n,r){return t=Math.max(0,t||e.width),n||=e.height,{width:t,height:Math.max(0,r?Math.floor(t/r):n)}}isAttached(e){return!0}updateConfig(e){}},S7=class extends x7{acquireContext(e){return e&&e.getContext&&e.getContext(`2d`)||null}updateConfig(e){e.options.animation=!1}},C7=`$chartjs`,w7={touchstart:`mousedown`,touchmove:`mousemove`,touchend:`mouseup`,pointerenter:`mouseenter`,pointerdown:`mousedown`,pointermove:`mousemove`,pointerup:`mouseup`,pointerleave:`mouseout`,pointerout:`mouseout`},T7=e=>e===null||e===``,E7=M8?{passive:!0}:!1,D7=new Map,O7=0,k7=class extends x7{acquireContext(e,t){let n=e&&e.getContext&&e.getContext(`2d`);return n&&n.canvas===e?(nde(e,t),n):null}releaseContext(e){let t=e.canvas;if(!t[C7])return!1;let n=t[C7].initial;[`height`,`width`].forEach(e=>{let r=n[e];u3(r)?t.removeAttribute(e):t.setAttribute(e,r)});let r=n.style||{};return Object.keys(r).forEach(e=>{t.style[e]=r[e]}),t.width=t.width,delete t[C7],!0}addEventListener(e,t,n){this.removeEventListener(e,t);let r=e.$proxies||={};r[t]=({attach:ode,detach:sde,resize:ude}[t]||dde)(e,t,n)}removeEventListener(e,t){let n=e.$proxies||={},r=n[t];r&&(({attach:i5,detach:i5,resize:i5}[t]||ide)(e,t,r),n[t]=void 0)}getDevicePixelRatio(){return window.devicePixelRatio}getMaximumSize(e,t,n,r){return wue(e,t,n,r)}isAttached(e){let t=e&&y6(e);return!!(t&&t.isConnected)}},A7=class{static defaults={};static defaultRoutes=void 0;x;y;active=!1;options;$animations;tooltipPosition(e){let{x:t,y:n}=this.getProps([`x`,`y`],e);return{x:t,y:n}}hasValue(){return D3(this.x)&&D3(this.y)}getProps(e,t){let n=this.$animations;if(!t||!n)return this;let r={};return e.forEach(e=>{r[e]=n[e]&&n[e].active()?n[e]._to:this[e]}),r}},j7=e=>e===`left`?`right`:e===`right`?`left`:e,M7=(e,t,n)=>t===`top`||t===`left`?e[t]+n:e[t]-n,N7=(e,t)=>Math.min(t||e,e),P7=class e extends A7{constructor(e){super(),this.id=e.id,this.type=e.type,this.options=void 0,this.ctx=e.ctx,this.chart=e.chart,this.top=void 0,this.bottom=void 0,this.left=void 0,this.right=void 0,this.width=void 0,this.height=void 0,this._margins={left:0,right:0,top:0,bottom:0},this.maxWidth=void 0,this.maxHeight=void 0,this.paddingTop=void 0,this.paddingBottom=void 0,this.paddingLeft=void 0,this.paddingRight=void 0,this.axis=void 0,this.labelRotation=void 0,this.min=void 0,this.max=void 0,this._range=void 0,this.ticks=[],this._gridLineItems=null,this._labelItems=null,this._labelSizes=null,this._length=0,this._maxLength=0,this._longestTextCache={},this._startPixel=void 0,this._endPixel=void 0,this._reversePixels=!1,this._userMax=void 0,this._userMin=void 0,this._suggestedMax=void 0,this._suggestedMin=void 0,this._ticksLength=0,this._borderValue=0,this._cache={},this._dataLimitsCached=!1,this.$context=void 0}init(e){this.options=e.setContext(this.getContext()),this.axis=e.axis,this._userMin=this.parse(e.min),this._userMax=this.parse(e.max),this._suggestedMin=this.parse(e.suggestedMin),this._suggestedMax=this.parse(e.suggestedMax)}parse(e,t){return e}getUserBounds(){let{_userMin:e,_userMax:t,_suggestedMin:n,_suggestedMax:r}=this;return e=m3(e,1/0),t=m3(t,-1/0),n=m3(n,1/0),r=m3(r,-1/0),{min:m3(e,n),max:m3(t,r),minDefined:p3(e),maxDefined:p3(t)}}getMinMax(e){let{min:t,max:n,minDefined:r,maxDefined:i}=this.getUserBounds(),a;if(r&&i)return{min:t,max:n};let o=this.getMatchingVisibleMetas();for(let s=0,c=o.length;s<c;++s)a=o[s].controller.getMinMax(this,e),r||(t=Math.min(t,a.min)),i||(n=Math.max(n,a.max));return t=i&&t>n?n:t,n=r&&t>n?t:n,{min:m3(t,m3(n,t)),max:m3(n,m3(t,n))}}getPadding(){return{left:this.paddingLeft||0,top:this.paddingTop||0,right:this.paddingRight||0,bottom:this.paddingBottom||0}}getTicks(){return this.ticks}getLabels(){let e=this.chart.data;return this.options.labels||(this.isHorizontal()?e.xLabels:e.yLabels)||e.labels||[]}getLabelItems(e=this.chart.chartArea){return this._labelItems||=this._computeLabelItems(e)}beforeLayout(){this._cache={},this._dataLimitsCached=!1}beforeUpdate(){g3(this.options.beforeUpdate,[this])}update(e,t,n){let{beginAtZero:r,grace:i,ticks:a}=this.options,o=a.sampleSize;this.beforeUpdate(),this.maxWidth=e,this.maxHeight=t,this._margins=n=Object.assign({left:0,right:0,top:0,bottom:0},n),this.ticks=null,this._labelSizes=null,this._gridLineItems=null,this._labelItems=null,this.beforeSetDimensions(),this.setDimensions(),this.afterSetDimensions(),this._maxLength=this.isHorizontal()?this.width+n.left+n.right:this.height+n.top+n.bottom,this._dataLimitsCached||=(this.beforeDataLimits(),this.determineDataLimits(),this.afterDataLimits(),this._range=sue(this,i,r),!0),this.beforeBuildTicks(),this.ticks=this.buildTicks()||[],this.afterBuildTicks();let s=o<this.ticks.length;this._convertTicksToLabels(s?o5(this.ticks,o):this.ticks),this.configure(),this.beforeCalculateLabelRotation(),this.calculateLabelRotation(),this.afterCalculateLabelRotation(),a.display&&(a.autoSkip||a.source===`auto`)&&(this.ticks=pde(this,this.ticks),this._labelSizes=null,this.afterAutoSkip()),s&&this._convertTicksToLabels(this.ticks),this.beforeFit(),this.fit(),this.afterFit(),this.afterUpdate()}configure(){let e=this.options.reverse,t,n;this.isHorizontal()?(t=this.left,n=this.right):(t=this.top,n=this.bottom,e=!e),this._startPixel=t,this._endPixel=n,this._reversePixels=e,this._length=n-t,this._alignToPixels=this.options.alignToPixels}afterUpdate(){g3(this.options.afterUpdate,[this])}beforeSetDimensions(){g3(this.options.beforeSetDimensions,[this])}setDimensions(){this.isHorizontal()?(this.width=this.maxWidth,this.left=0,this.right=this.width):(this.height=this.maxHeight,this.top=0,this.bottom=this.height),this.paddingLeft=0,this.paddingTop=0,this.paddingRight=0,this.paddingBottom=0}afterSetDimensions(){g3(this.options.afterSetDimensions,[this])}_callHooks(e){this.chart.notifyPlugins(e,this.getContext()),g3(this.options[e],[this])}beforeDataLimits(){this._callHooks(`beforeDataLimits`)}determineDataLimits(){}afterDataLimits(){this._callHooks(`afterDataLimits`)}beforeBuildTicks(){this._callHooks(`beforeBuildTicks`)}buildTicks(){return[]}afterBuildTicks(){this._callHooks(`afterBuildTicks`)}beforeTickToLabelConversion(){g3(this.options.beforeTickToLabelConversion,[this])}generateTickLabels(e){let t=this.options.ticks,n,r,i;for(n=0,r=e.length;n<r;n++)i=e[n],i.label=g3(t.callback,[i.value,n,e],this)}afterTickToLabelConversion(){g3(this.options.afterTickToLabelConversion,[this])}beforeCalculateLabelRotation(){g3(this.options.beforeCalculateLabelRotation,[this])}calculateLabelRotation(){let e=this.options,t=e.ticks,n=N7(this.ticks.length,e.ticks.maxTicksLimit),r=t.minRotation||0,i=t.maxRotation,a=r,o,s,c;if(!this._isVisible()||!t.display||r>=i||n<=1||!this.isHorizontal()){this.labelRotation=r;return}let l=this._getLabelSizes(),u=l.widest.width,d=l.highest.height,f=F3(this.chart.width-u,0,this.maxWidth);o=e.offset?this.maxWidth/n:f/(n-1),u+6>o&&(o=f/(n-(e.offset?.5:1)),s=this.maxHeight-s5(e.grid)-t.padding-c5(e.title,this.chart.options.font),c=Math.sqrt(u*u+d*d),a=A3(Math.min(Math.asin(F3((l.highest.height+6)/o,-1,1)),Math.asin(F3(s/c,-1,1))-Math.asin(F3(d/c,-1,1)))),a=Math.max(r,Math.min(i,a))),this.labelRotation=a}afterCalculateLabelRotation(){g3(this.options.afterCalculateLabelRotation,[this])}afterAutoSkip(){}beforeFit(){g3(this.options.beforeFit,[this])}fit(){let e={width:0,height:0},{chart:t,options:{ticks:n,title:r,grid:i}}=this,a=this._isVisible(),o=this.isHorizontal();if(a){let a=c5(r,t.options.font);if(o?(e.width=this.maxWidth,e.height=s5(i)+a):(e.height=this.maxHeight,e.width=s5(i)+a),n.display&&this.ticks.length){let{first:t,last:r,widest:i,highest:a}=this._getLabelSizes(),s=n.padding*2,c=k3(this.labelRotation),l=Math.cos(c),u=Math.sin(c);if(o){let t=n.mirror?0:u*i.width+l*a.height;e.height=Math.min(this.maxHeight,e.height+t+s)}else{let t=n.mirror?0:l*i.width+u*a.height;e.width=Math.min(this.maxWidth,e.width+t+s)}this._calculatePadding(t,r,u,l)}}this._handleMargins(),o?(this.width=this._length=t.width-this._margins.left-this._margins.right,this.height=e.height):(this.width=e.width,this.height=this._length=t.height-this._margins.top-this._margins.bottom)}_calculatePadding(e,t,n,r){let{ticks:{align:i,padding:a},position:o}=this.options,s=this.labelRotation!==0,c=o!==`top`&&this.axis===`x`;if(this.isHorizontal()){let o=this.getPixelForTick(0)-this.left,l=this.right-this.getPixelForTick(this.ticks.length-1),u=0,d=0;s?c?(u=r*e.width,d=n*t.height):(u=n*e.height,d=r*t.width):i===`start`?d=t.width:i===`end`?u=e.width:i!==`inner`&&(u=e.width/2,d=t.width/2),this.paddingLeft=Math.max((u-o+a)*this.width/(this.width-o),0),this.paddingRight=Math.max((d-l+a)*this.width/(this.width-l),0)}else{let n=t.height/2,r=e.height/2;i===`start`?(n=0,r=e.height):i===`end`&&(n=t.height,r=0),this.paddingTop=n+a,this.paddingBottom=r+a}}_handleMargins(){this._margins&&(this._margins.left=Math.max(this.paddingLeft,this._margins.left),this._margins.top=Math.max(this.paddingTop,this._margins.top),this._margins.right=Math.max(this.paddingRight,this._margins.right),this._margins.bottom=Math.max(this.paddingBottom,this._margins.bottom))}afterFit(){g3(this.options.afterFit,[this])}isHorizontal(){let{axis:e,position:t}=this.options;return t===`top`||t===`bottom`||e===`x`}isFullSize(){return this.options.fullSize}_convertTicksToLabels(e){this.beforeTickToLabelConversion(),this.generateTickLabels(e);let t,n;for(t=0,n=e.length;t<n;t++)u3(e[t].label)&&(e.splice(t,1),n--,t--);this.afterTickToLabelConversion()}_getLabelSizes(){let e=this._labelSizes;if(!e){let t=this.options.ticks.sampleSize,n=this.ticks;t<n.length&&(n=o5(n,t)),this._labelSizes=e=this._computeLabelSizes(n,n.length,this.options.ticks.maxTicksLimit)}return e}_computeLabelSizes(e,t,n){let{ctx:r,_longestTextCache:i}=this,a=[],o=[],s=Math.floor(t/N7(t,n)),c=0,l=0,u,d,f,p,m,h,g,_,v,y,b;for(u=0;u<t;u+=s){if(p=e[u].label,m=this._resolveTickFontOptions(u),r.font=h=m.string,g=i[h]=i[h]||{data:{},gc:[]},_=m.lineHeight,v=y=0,!u3(p)&&!d3(p))v=K3(r,g.data,g.gc,v,p),y=_;else if(d3(p))for(d=0,f=p.length;d<f;++d)b=p[d],!u3(b)&&!d3(b)&&(v=K3(r,g.data,g.gc,v,b),y+=_);a.push(v),o.push(y),c=Math.max(v,c),l=Math.max(y,l)}bde(i,t);let x=a.indexOf(c),S=o.indexOf(l),C=e=>({width:a[e]||0,height:o[e]||0});return{first:C(0),last:C(t-1),widest:C(x),highest:C(S),widths:a,heights:o}}getLabelForValue(e){return e}getPixelForValue(e,t){return NaN}getValueForPixel(e){}getPixelForTick(e){let t=this.ticks;return e<0||e>t.length-1?null:this.getPixelForValue(t[e].value)}getPixelForDecimal(e){this._reversePixels&&(e=1-e);let t=this._startPixel+e*this._length;return Ble(this._alignToPixels?q3(this.chart,t,0):t)}getDecimalForPixel(e){let t=(e-this._startPixel)/this._length;return this._reversePixels?1-t:t}getBasePixel(){return this.getPixelForValue(this.getBaseValue())}getBaseValue(){let{min:e,max:t}=this;return e<0&&t<0?t:e>0&&t>0?e:0}getContext(e){let t=this.ticks||[];if(e>=0&&e<t.length){let n=t[e];return n.$context||=Sde(this.getContext(),e,n)}return this.$context||=xde(this.chart.getContext(),this)}_tickSize(){let e=this.options.ticks,t=k3(this.labelRotation),n=Math.abs(Math.cos(t)),r=Math.abs(Math.sin(t)),i=this._getLabelSizes(),a=e.autoSkipPadding||0,o=i?i.widest.width+a:0,s=i?i.highest.height+a:0;return this.isHorizontal()?s*n>o*r?o/n:s/r:s*r<o*n?s/n:o/r}_isVisible(){let e=this.options.display;return e===`auto`?this.getMatchingVisibleMetas().length>0:!!e}_computeGridLineItems(e){let t=this.axis,n=this.chart,r=this.options,{grid:i,position:a,border:o}=r,s=i.offset,c=this.isHorizontal(),l=this.ticks.length+ +!!s,u=s5(i),d=[],f=o.setContext(this.getContext()),p=f.display?f.width:0,m=p/2,h=function(e){return q3(n,e,p)},g,_,v,y,b,x,S,C,w,T,E,D;if(a===`top`)g=h(this.bottom),x=this.bottom-u,C=g-m,T=h(e.top)+m,D=e.bottom;else if(a===`bottom`)g=h(this.top),T=e.top,D=h(e.bottom)-m,x=g+m,C=this.top+u;else if(a===`left`)g=h(this.right),b=this.right-u,S=g-m,w=h(e.left)+m,E=e.right;else if(a===`right`)g=h(this.left),w=e.left,E=h(e.right)-m,b=g+m,S=this.left+u;else if(t===`x`){if(a===`center`)g=h((e.top+e.bottom)/2+.5);else if(f3(a)){let e=Object.keys(a)[0],t=a[e];g=h(this.chart.scales[e].getPixelForValue(t))}T=e.top,D=e.bottom,x=g+m,C=x+u}else if(t===`y`){if(a===`center`)g=h((e.left+e.right)/2);else if(f3(a)){let e=Object.keys(a)[0],t=a[e];g=h(this.chart.scales[e].getPixelForValue(t))}b=g-m,S=b-u,w=e.left,E=e.right}let ee=h3(r.ticks.maxTicksLimit,l),te=Math.max(1,Math.ceil(l/ee));for(_=0;_<l;_+=te){let e=this.getContext(_),t=i.setContext(e),r=o.setContext(e),a=t.lineWidth,l=t.color,u=r.dash||[],f=r.dashOffset,p=t.tickWidth,m=t.tickColor,h=t.tickBorderDash||[],g=t.tickBorderDashOffset;v=yde(this,_,s),v!==void 0&&(y=q3(n,v,a),c?b=S=w=E=y:x=C=T=D=y,d.push({tx1:b,ty1:x,tx2:S,ty2:C,x1:w,y1:T,x2:E,y2:D,width:a,color:l,borderDash:u,borderDashOffset:f,tickWidth:p,tickColor:m,tickBorderDash:h,tickBorderDashOffset:g}))}return this._ticksLength=l,this._borderValue=g,d}_computeLabelItems(e){let t=this.axis,n=this.options,{position:r,ticks:i}=n,a=this.isHorizontal(),o=this.ticks,{align:s,crossAlign:c,padding:l,mirror:u}=i,d=s5(n.grid),f=d+l,p=u?-l:f,m=-k3(this.labelRotation),h=[],g,_,v,y,b,x,S,C,w,T,E,D,ee=`middle`;if(r===`top`)x=this.bottom-p,S=this._getXAxisLabelAlignment();else if(r===`bottom`)x=this.top+p,S=this._getXAxisLabelAlignment();else if(r===`left`){let e=this._getYAxisLabelAlignment(d);S=e.textAlign,b=e.x}else if(r===`right`){let e=this._getYAxisLabelAlignment(d);S=e.textAlign,b=e.x}else if(t===`x`){if(r===`center`)x=(e.top+e.bottom)/2+f;else if(f3(r)){let e=Object.keys(r)[0],t=r[e];x=this.chart.scales[e].getPixelForValue(t)+f}S=this._getXAxisLabelAlignment()}else if(t===`y`){if(r===`center`)b=(e.left+e.right)/2-f;else if(f3(r)){let e=Object.keys(r)[0],t=r[e];b=this.chart.scales[e].getPixelForValue(t)}S=this._getYAxisLabelAlignment(d).textAlign}t===`y`&&(s===`start`?ee=`top`:s===`end`&&(ee=`bottom`));let te=this._getLabelSizes();for(g=0,_=o.length;g<_;++g){v=o[g],y=v.label;let e=i.setContext(this.getContext(g));C=this.getPixelForTick(g)+i.labelOffset,w=this._resolveTickFontOptions(g),T=w.lineHeight,E=d3(y)?y.length:1;let t=E/2,n=e.color,s=e.textStrokeColor,l=e.textStrokeWidth,d=S;a?(b=C,S===`inner`&&(d=g===_-1?this.options.reverse?`left`:`right`:g===0?this.options.reverse?`right`:`left`:`center`),D=r===`top`?c===`near`||m!==0?-E*T+T/2:c===`center`?-te.highest.height/2-t*T+T:-te.highest.height+T/2:c===`near`||m!==0?T/2:c===`center`?te.highest.height/2-t*T:te.highest.height-E*T,u&&(D*=-1),m!==0&&!e.showLabelBackdrop&&(b+=T/2*Math.sin(m))):(x=C,D=(1-E)*T/2);let f;if(e.showLabelBackdrop){let t=i6(e.backdropPadding),n=te.heights[g],r=te.widths[g],i=D-t.top,a=0-t.left;switch(ee){case`middle`:i-=n/2;break;case`bottom`:i-=n;break}switch(S){case`center`:a-=r/2;break;case`right`:a-=r;break;case`inner`:g===_-1?a-=r:g>0&&(a-=r/2);break}f={left:a,top:i,width:r+t.width,height:n+t.height,color:e.backdropColor}}h.push({label:y,font:w,textOffset:D,options:{rotation:m,color:n,strokeColor:s,strokeWidth:l,textAlign:d,textBaseline:ee,translation:[b,x],backdrop:f}})}return h}_getXAxisLabelAlignment(){let{position:e,ticks:t}=this.options;if(-k3(this.labelRotation))return e===`top`?`left`:`right`;let n=`center`;return t.align===`start`?n=`left`:t.align===`end`?n=`right`:t.align===`inner`&&(n=`inner`),n}_getYAxisLabelAlignment(e){let{position:t,ticks:{crossAlign:n,mirror:r,padding:i}}=this.options,a=this._getLabelSizes(),o=e+i,s=a.widest.width,c,l;return t===`left`?r?(l=this.right+i,n===`near`?c=`left`:n===`center`?(c=`center`,l+=s/2):(c=`right`,l+=s)):(l=this.right-o,n===`near`?c=`right`:n===`center`?(c=`center`,l-=s/2):(c=`left`,l=this.left)):t===`right`?r?(l=this.left+i,n===`near`?c=`right`:n===`center`?(c=`center`,l-=s/2):(c=`left`,l-=s)):(l=this.left+o,n===`near`?c=`left`:n===`center`?(c=`center`,l+=s/2):(c=`right`,l=this.right)):c=`right`,{textAlign:c,x:l}}_computeLabelArea(){if(this.options.ticks.mirror)return;let e=this.chart,t=this.options.position;if(t===`left`||t===`right`)return{top:0,left:this.left,bottom:e.height,right:this.right};if(t===`top`||t===`bottom`)return{top:this.top,left:0,bottom:this.bottom,right:e.width}}drawBackground(){let{ctx:e,options:{backgroundColor:t},left:n,top:r,width:i,height:a}=this;t&&(e.save(),e.fillStyle=t,e.fillRect(n,r,i,a),e.restore())}getLineWidthForValue(e){let t=this.options.grid;if(!this._isVisible()||!t.display)return 0;let n=this.ticks.findIndex(t=>t.value===e);return n>=0?t.setContext(this.getContext(n)).lineWidth:0}drawGrid(e){let t=this.options.grid,n=this.ctx,r=this._gridLineItems||=this._computeGridLineItems(e),i,a,o=(e,t,r)=>{!r.width||!r.color||(n.save(),n.lineWidth=r.width,n.strokeStyle=r.color,n.setLineDash(r.borderDash||[]),n.lineDashOffset=r.borderDashOffset,n.beginPath(),n.moveTo(e.x,e.y),n.lineTo(t.x,t.y),n.stroke(),n.restore())};if(t.display)for(i=0,a=r.length;i<a;++i){let e=r[i];t.drawOnChartArea&&o({x:e.x1,y:e.y1},{x:e.x2,y:e.y2},e),t.drawTicks&&o({x:e.tx1,y:e.ty1},{x:e.tx2,y:e.ty2},{color:e.tickColor,width:e.tickWidth,borderDash:e.tickBorderDash,borderDashOffset:e.tickBorderDashOffset})}}drawBorder(){let{chart:e,ctx:t,options:{border:n,grid:r}}=this,i=n.setContext(this.getContext()),a=n.display?i.width:0;if(!a)return;let o=r.setContext(this.getContext(0)).lineWidth,s=this._borderValue,c,l,u,d;this.isHorizontal()?(c=q3(e,this.left,a)-a/2,l=q3(e,this.right,o)+o/2,u=d=s):(u=q3(e,this.top,a)-a/2,d=q3(e,this.bottom,o)+o/2,c=l=s),t.save(),t.lineWidth=i.width,t.strokeStyle=i.color,t.beginPath(),t.moveTo(c,u),t.lineTo(l,d),t.stroke(),t.restore()}drawLabels(e){if(!this.options.ticks.display)return;let t=this.ctx,n=this._computeLabelArea();n&&Q3(t,n);let r=this.getLabelItems(e);for(let e of r){let n=e.options,r=e.font,i=e.label,a=e.textOffset;e6(t,i,0,a,r,n)}n&&$3(t)}drawTitle(){let{ctx:e,options:{position:t,title:n,reverse:r}}=this;if(!n.display)return;let i=a6(n.font),a=i6(n.padding),o=n.align,s=i.lineHeight/2;t===`bottom`||t===`center`||f3(t)?(s+=a.bottom,d3(n.text)&&(s+=i.lineHeight*(n.text.length-1))):s+=a.top;let{titleX:c,titleY:l,maxWidth:u,rotation:d}=wde(this,s,t,o);e6(e,n.text,0,0,i,{color:n.color,maxWidth:u,rotation:d,textAlign:Cde(o,t,r),textBaseline:`middle`,translation:[c,l]})}draw(e){this._isVisible()&&(this.drawBackground(),this.drawGrid(e),this.drawBorder(),this.drawTitle(),this.drawLabels(e))}_layers(){let t=this.options,n=t.ticks&&t.ticks.z||0,r=h3(t.grid&&t.grid.z,-1),i=h3(t.border&&t.border.z,0);return!this._isVisible()||this.draw!==e.prototype.draw?[{z:n,draw:e=>{this.draw(e)}}]:[{z:r,draw:e=>{this.drawBackground(),this.drawGrid(e),this.drawTitle()}},{z:i,draw:()=>{this.drawBorder()}},{z:n,draw:e=>{this.drawLabels(e)}}]}getMatchingVisibleMetas(e){let t=this.chart.getSortedVisibleDatasetMetas(),n=this.axis+`AxisID`,r=[],i,a;for(i=0,a=t.length;i<a;++i){let a=t[i];a[n]===this.id&&(!e||a.type===e)&&r.push(a)}return r}_resolveTickFontOptions(e){return a6(this.options.ticks.setContext(this.getContext(e)).font)}_maxDigits(){let e=this._resolveTickFontOptions(0).lineHeight;return(this.isHorizontal()?this.width:this.height)/e}},F7=class{constructor(e,t,n){this.type=e,this.scope=t,this.override=n,this.items=Object.create(null)}isForType(e){return Object.prototype.isPrototypeOf.call(this.type.prototype,e.prototype)}register(e){let t=Object.getPrototypeOf(e),n;Dde(t)&&(n=this.register(t));let r=this.items,i=e.id,a=this.scope+`.`+i;if(!i)throw Error(`class does not have id: `+e);return i in r?a:(r[i]=e,Tde(e,a,n),this.override&&v8.override(e.id,e.overrides),a)}get(e){return this.items[e]}unregister(e){let t=this.items,n=e.id,r=this.scope;n in t&&delete t[n],r&&n in v8[r]&&(delete v8[r][n],this.override&&delete h8[n])}},I7=class{constructor(){this.controllers=new F7(m7,`datasets`,!0),this.elements=new F7(A7,`elements`),this.plugins=new F7(Object,`plugins`),this.scales=new F7(P7,`scales`),this._typedRegistries=[this.controllers,this.scales,this.elements]}add(...e){this._each(`register`,e)}remove(...e){this._each(`unregister`,e)}addControllers(...e){this._each(`register`,e,this.controllers)}addElements(...e){this._each(`register`,e,this.elements)}addPlugins(...e){this._each(`register`,e,this.plugins)}addScales(...e){this._each(`register`,e,this.scales)}getController(e){return this._get(e,this.controllers,`controller`)}getElement(e){return this._get(e,this.elements,`element`)}getPlugin(e){return this._get(e,this.plugins,`plugin`)}getScale(e){return this._get(e,this.scales,`scale`)}removeControllers(...e){this._each(`unregister`,e,this.controllers)}removeElements(...e){this._each(`unregister`,e,this.elements)}removePlugins(...e){this._each(`unregister`,e,this.plugins)}removeScales(...e){this._each(`unregister`,e,this.scales)}_each(e,t,n){[...t].forEach(t=>{let r=n||this._getRegistryForType(t);n||r.isForType(t)||r===this.plugins&&t.id?this._exec(e,r,t):_3(t,t=>{let r=n||this._getRegistryForType(t);this._exec(e,r,t)})})}_exec(e,t,n){let r=w3(e);g3(n[`before`+r],[],n),t[e](n),g3(n[`after`+r],[],n)}_getRegistryForType(e){for(let t=0;t<this._typedRegistries.length;t++){let n=this._typedRegistries[t];if(n.isForType(e))return n}return this.plugins}_get(e,t,n){let r=t.get(e);if(r===void 0)throw Error(`"`+e+`" is not a registered `+n+`.`);return r}},L7=new I7,R7=class{constructor(){this._init=void 0}notify(e,t,n,r){if(t===`beforeInit`&&(this._init=this._createDescriptors(e,!0),this._notify(this._init,e,`install`)),this._init===void 0)return;let i=r?this._descriptors(e).filter(r):this._descriptors(e),a=this._notify(i,e,t,n);return t===`afterDestroy`&&(this._notify(i,e,`stop`),this._notify(this._init,e,`uninstall`),this._init=void 0),a}_notify(e,t,n,r){r||={};for(let i of e){let e=i.plugin,a=e[n];if(g3(a,[t,r,i.options],e)===!1&&r.cancelable)return!1}return!0}invalidate(){u3(this._cache)||(this._oldCache=this._cache,this._cache=void 0)}_descriptors(e){if(this._cache)return this._cache;let t=this._cache=this._createDescriptors(e);return this._notifyStateChanges(e),t}_createDescriptors(e,t){let n=e&&e.config,r=h3(n.options&&n.options.plugins,{}),i=Ode(n);return r===!1&&!t?[]:Ade(e,i,r,t)}_notifyStateChanges(e){let t=this._oldCache||[],n=this._cache,r=(e,t)=>e.filter(e=>!t.some(t=>e.plugin.id===t.plugin.id));this._notify(r(t,n),e,`stop`),this._notify(r(n,t),e,`start`)}},z7=new Map,B7=new Set,V7=(e,t,n)=>{let r=C3(t,n);r!==void 0&&e.add(r)},H7=class{constructor(e){this._config=Lde(e),this._scopeCache=new Map,this._resolverCache=new Map}get platform(){return this._config.platform}get type(){return this._config.type}set type(e){this._config.type=e}get data(){return this._config.data}set data(e){this._config.data=m5(e)}get options(){return this._config.options}set options(e){this._config.options=e}get plugins(){return this._config.plugins}update(){let e=this._config;this.clearCache(),p5(e)}clearCache(){this._scopeCache.clear(),this._resolverCache.clear()}datasetScopeKeys(e){return h5(e,()=>[[`datasets.${e}`,``]])}datasetAnimationScopeKeys(e,t){return h5(`${e}.transition.${t}`,()=>[[`datasets.${e}.transitions.${t}`,`transitions.${t}`],[`datasets.${e}`,``]])}datasetElementScopeKeys(e,t){return h5(`${e}-${t}`,()=>[[`datasets.${e}.elements.${t}`,`datasets.${e}`,`elements.${t}`,``]])}pluginScopeKeys(e){let t=e.id,n=this.type;return h5(`${n}-plugin-${t}`,()=>[[`plugins.${t}`,...e.additionalOptionScopes||[]]])}_cachedScopes(e,t){let n=this._scopeCache,r=n.get(e);return(!r||t)&&(r=new Map,n.set(e,r)),r}getOptionScopes(e,t,n){let{options:r,type:i}=this,a=this._cachedScopes(e,n),o=a.get(t);if(o)return o;let s=new Set;t.forEach(t=>{e&&(s.add(e),t.forEach(t=>V7(s,e,t))),t.forEach(e=>V7(s,r,e)),t.forEach(e=>V7(s,h8[i]||{},e)),t.forEach(e=>V7(s,v8,e)),t.forEach(e=>V7(s,g8,e))});let c=Array.from(s);return c.length===0&&c.push(Object.create(null)),B7.has(t)&&a.set(t,c),c}chartOptionScopes(){let{options:e,type:t}=this;return[e,h8[t]||{},v8.datasets[t]||{},{type:t},v8,g8]}resolveNamedOptions(e,t,n,r=[``]){let i={$shared:!0},{resolver:a,subPrefixes:o}=g5(this._resolverCache,e,r),s=a;if(Rde(a,t)){i.$shared=!1,n=V6(n)?n():n;let t=this.createResolver(e,n,o);s=l6(a,n,t)}for(let e of t)i[e]=s[e];return i}createResolver(e,t,n=[``],r){let{resolver:i}=g5(this._resolverCache,e,n);return f3(t)?l6(i,t,void 0,r):i}},U7=e=>f3(e)&&Object.getOwnPropertyNames(e).some(t=>V6(e[t])),W7=`4.5.1`,G7=[`top`,`bottom`,`left`,`right`,`chartArea`],K7={},q7=e=>{let t=b5(e);return Object.values(K7).filter(e=>e.canvas===t).pop()},J7=class{static defaults=v8;static instances=K7;static overrides=h8;static registry=L7;static version=W7;static getChart=q7;static register(...e){L7.add(...e),x5()}static unregister(...e){L7.remove(...e),x5()}constructor(e,t){let n=this.config=new H7(t),r=b5(e),i=q7(r);if(i)throw Error(`Canvas is already in use. Chart with ID '`+i.id+`' must be destroyed before the canvas with ID '`+i.canvas.id+`' can be reused.`);let a=n.createResolver(n.chartOptionScopes(),this.getContext());this.platform=new(n.platform||(fde(r))),this.platform.updateConfig(n);let o=this.platform.acquireContext(r,a.aspectRatio),s=o&&o.canvas,c=s&&s.height,l=s&&s.width;if(this.id=L6(),this.ctx=o,this.canvas=s,this.width=l,this.height=c,this._options=a,this._aspectRatio=this.aspectRatio,this._layers=[],this._metasets=[],this._stacks=void 0,this.boxes=[],this.currentDevicePixelRatio=void 0,this.chartArea=void 0,this._active=[],this._lastEvent=void 0,this._listeners={},this._responsiveListeners=void 0,this._sortedMetasets=[],this.scales={},this._plugins=new R7,this.$proxies={},this._hiddenIndices={},this.attached=!1,this._animationsDisabled=void 0,this.$context=void 0,this._doResize=Wle(e=>this.update(e),a.resizeDelay||0),this._dataChanges=[],K7[this.id]=this,!o||!s){console.error(`Failed to create chart: can't acquire context from the given item`);return}o7.listen(this,`complete`,y5),o7.listen(this,`progress`,zde),this._initialize(),this.attached&&this.update()}get aspectRatio(){let{options:{aspectRatio:e,maintainAspectRatio:t},width:n,height:r,_aspectRatio:i}=this;return u3(e)?t&&i?i:r?n/r:null:e}get data(){return this.config.data}set data(e){this.config.data=e}get options(){return this._options}set options(e){this.config.options=e}get registry(){return L7}_initialize(){return this.notifyPlugins(`beforeInit`),this.options.responsive?this.resize():C6(this,this.options.devicePixelRatio),this.bindEvents(),this.notifyPlugins(`afterInit`),this}clear(){return J3(this.canvas,this.ctx),this}stop(){return o7.stop(this),this}resize(e,t){o7.running(this)?this._resizeBeforeDraw={width:e,height:t}:this._resize(e,t)}_resize(e,t){let n=this.options,r=this.canvas,i=n.maintainAspectRatio&&this.aspectRatio,a=this.platform.getMaximumSize(r,e,t,i),o=n.devicePixelRatio||this.platform.getDevicePixelRatio(),s=this.width?`resize`:`attach`;this.width=a.width,this.height=a.height,this._aspectRatio=this.aspectRatio,C6(this,o,!0)&&(this.notifyPlugins(`resize`,{size:a}),g3(n.onResize,[this,a],this),this.attached&&this._doResize(s)&&this.render())}ensureScalesHaveIDs(){_3(this.options.scales||{},(e,t)=>{e.id=t})}buildOrUpdateScales(){let e=this.options,t=e.scales,n=this.scales,r=Object.keys(n).reduce((e,t)=>(e[t]=!1,e),{}),i=[];t&&(i=i.concat(Object.keys(t).map(e=>{let n=t[e],r=d5(e,n),i=r===`r`,a=r===`x`;return{options:n,dposition:i?`chartArea`:a?`bottom`:`left`,dtype:i?`radialLinear`:a?`category`:`linear`}}))),_3(i,t=>{let i=t.options,a=i.id,o=d5(a,i),s=h3(i.type,t.dtype);(i.position===void 0||_5(i.position,o)!==_5(t.dposition))&&(i.position=t.dposition),r[a]=!0;let c=null;a in n&&n[a].type===s?c=n[a]:(c=new(L7.getScale(s))({id:a,type:s,ctx:this.ctx,chart:this}),n[c.id]=c),c.init(i,e)}),_3(r,(e,t)=>{e||delete n[t]}),_3(n,e=>{b7.configure(this,e,e.options),b7.addBox(this,e)})}_updateMetasets(){let e=this._metasets,t=this.data.datasets.length,n=e.length;if(e.sort((e,t)=>e.index-t.index),n>t){for(let e=t;e<n;++e)this._destroyDatasetMeta(e);e.splice(t,n-t)}this._sortedMetasets=e.slice(0).sort(v5(`order`,`index`))}_removeUnreferencedMetasets(){let{_metasets:e,data:{datasets:t}}=this;e.length>t.length&&delete this._stacks,e.forEach((e,n)=>{t.filter(t=>t===e._dataset).length===0&&this._destroyDatasetMeta(n)})}buildOrUpdateControllers(){let e=[],t=this.data.datasets,n,r;for(this._removeUnreferencedMetasets(),n=0,r=t.length;n<r;n++){let r=t[n],i=this.getDatasetMeta(n),a=r.type||this.config.type;if(i.type&&i.type!==a&&(this._destroyDatasetMeta(n),i=this.getDatasetMeta(n)),i.type=a,i.indexAxis=r.indexAxis||l5(a,this.options),i.order=r.order||0,i.index=n,i.label=``+r.label,i.visible=this.isDatasetVisible(n),i.controller)i.controller.updateIndex(n),i.controller.linkScales();else{let t=L7.getController(a),{datasetElementType:r,dataElementType:o}=v8.datasets[a];Object.assign(t,{dataElementType:L7.getElement(o),datasetElementType:r&&L7.getElement(r)}),i.controller=new t(this,n),e.push(i.controller)}}return this._updateMetasets(),e}_resetElements(){_3(this.data.datasets,(e,t)=>{this.getDatasetMeta(t).controller.reset()},this)}reset(){this._resetElements(),this.notifyPlugins(`reset`)}update(e){let t=this.config;t.update();let n=this._options=t.createResolver(t.chartOptionScopes(),this.getContext()),r=this._animationsDisabled=!n.animation;if(this._updateScales(),this._checkEventBindings(),this._updateHiddenIndices(),this._plugins.invalidate(),this.notifyPlugins(`beforeUpdate`,{mode:e,cancelable:!0})===!1)return;let i=this.buildOrUpdateControllers();this.notifyPlugins(`beforeElementsUpdate`);let a=0;for(let e=0,t=this.data.datasets.length;e<t;e++){let{controller:t}=this.getDatasetMeta(e),n=!r&&i.indexOf(t)===-1;t.buildOrUpdateElements(n),a=Math.max(+t.getMaxOverflow(),a)}a=this._minPadding=n.layout.autoPadding?a:0,this._updateLayout(a),r||_3(i,e=>{e.reset()}),this._updateDatasets(e),this.notifyPlugins(`afterUpdate`,{mode:e}),this._layers.sort(v5(`z`,`_idx`));let{_active:o,_lastEvent:s}=this;s?this._eventHandler(s,!0):o.length&&this._updateHoverStyles(o,o,!0),this.render()}_updateScales(){_3(this.scales,e=>{b7.removeBox(this,e)}),this.ensureScalesHaveIDs(),this.buildOrUpdateScales()}_checkEventBindings(){let e=this.options;(!H6(new Set(Object.keys(this._listeners)),new Set(e.events))||!!this._responsiveListeners!==e.responsive)&&(this.unbindEvents(),this.bindEvents())}_updateHiddenIndices(){let{_hiddenIndices:e}=this,t=this._getUniformDataChanges()||[];for(let{method:n,start:r,count:i}of t)Bde(e,r,n===`_removeElements`?-i:i)}_getUniformDataChanges(){let e=this._dataChanges;if(!e||!e.length)return;this._dataChanges=[];let t=this.data.datasets.length,n=t=>new Set(e.filter(e=>e[0]===t).map((e,t)=>t+`,`+e.splice(1).join(`,`))),r=n(0);for(let e=1;e<t;e++)if(!H6(r,n(e)))return;return Array.from(r).map(e=>e.split(`,`)).map(e=>({method:e[1],start:+e[2],count:+e[3]}))}_updateLayout(e){if(this.notifyPlugins(`beforeLayout`,{cancelable:!0})===!1)return;b7.update(this,this.width,this.height,e);let t=this.chartArea,n=t.width<=0||t.height<=0;this._layers=[],_3(this.boxes,e=>{n&&e.position===`chartArea`||(e.configure&&e.configure(),this._layers.push(...e._layers()))},this),this._layers.forEach((e,t)=>{e._idx=t}),this.notifyPlugins(`afterLayout`)}_updateDatasets(e){if(this.notifyPlugins(`beforeDatasetsUpdate`,{mode:e,cancelable:!0})!==!1){for(let e=0,t=this.data.datasets.length;e<t;++e)this.getDatasetMeta(e).controller.configure();for(let t=0,n=this.data.datasets.length;t<n;++t)this._updateDataset(t,V6(e)?e({datasetIndex:t}):e);this.notifyPlugins(`afterDatasetsUpdate`,{mode:e})}}_updateDataset(e,t){let n=this.getDatasetMeta(e),r={meta:n,index:e,mode:t,cancelable:!0};this.notifyPlugins(`beforeDatasetUpdate`,r)!==!1&&(n.controller._update(t),r.cancelable=!1,this.notifyPlugins(`afterDatasetUpdate`,r))}render(){this.notifyPlugins(`beforeRender`,{cancelable:!0})!==!1&&(o7.has(this)?this.attached&&!o7.running(this)&&o7.start(this):(this.draw(),y5({chart:this})))}draw(){let e;if(this._resizeBeforeDraw){let{width:e,height:t}=this._resizeBeforeDraw;this._resizeBeforeDraw=null,this._resize(e,t)}if(this.clear(),this.width<=0||this.height<=0||this.notifyPlugins(`beforeDraw`,{cancelable:!0})===!1)return;let t=this._layers;for(e=0;e<t.length&&t[e].z<=0;++e)t[e].draw(this.chartArea);for(this._drawDatasets();e<t.length;++e)t[e].draw(this.chartArea);this.notifyPlugins(`afterDraw`)}_getSortedDatasetMetas(e){let t=this._sortedMetasets,n=[],r,i;for(r=0,i=t.length;r<i;++r){let i=t[r];(!e||i.visible)&&n.push(i)}return n}getSortedVisibleDatasetMetas(){return this._getSortedDatasetMetas(!0)}_drawDatasets(){if(this.notifyPlugins(`beforeDatasetsDraw`,{cancelable:!0})===!1)return;let e=this.getSortedVisibleDatasetMetas();for(let t=e.length-1;t>=0;--t)this._drawDataset(e[t]);this.notifyPlugins(`afterDatasetsDraw`)}_drawDataset(e){let t=this.ctx,n={meta:e,index:e.index,cancelable:!0},r=I6(this,e);this.notifyPlugins(`beforeDatasetDraw`,n)!==!1&&(r&&Q3(t,r),e.controller.draw(),r&&$3(t),n.cancelable=!1,this.notifyPlugins(`afterDatasetDraw`,n))}isPointInArea(e){return Z3(e,this.chartArea,this._minPadding)}getElementsAtEventForMode(e,t,n,r){let i=v7.modes[t];return typeof i==`function`?i(this,e,n,r):[]}getDatasetMeta(e){let t=this.data.datasets[e],n=this._metasets,r=n.filter(e=>e&&e._dataset===t).pop();return r||(r={type:null,data:[],dataset:null,controller:null,hidden:null,xAxisID:null,yAxisID:null,order:t&&t.order||0,index:e,_dataset:t,_parsed:[],_sorted:!1},n.push(r)),r}getContext(){return this.$context||=s6(null,{chart:this,type:`chart`})}getVisibleDatasetCount(){return this.getSortedVisibleDatasetMetas().length}isDatasetVisible(e){let t=this.data.datasets[e];if(!t)return!1;let n=this.getDatasetMeta(e);return typeof n.hidden==`boolean`?!n.hidden:!t.hidden}setDatasetVisibility(e,t){let n=this.getDatasetMeta(e);n.hidden=!t}toggleDataVisibility(e){this._hiddenIndices[e]=!this._hiddenIndices[e]}getDataVisibility(e){return!this._hiddenIndices[e]}_updateVisibility(e,t,n){let r=n?`show`:`hide`,i=this.getDatasetMeta(e),a=i.controller._resolveAnimations(void 0,r);B6(t)?(i.data[t].hidden=!n,this.update()):(this.setDatasetVisibility(e,n),a.update(i,{visible:n}),this.update(t=>t.datasetIndex===e?r:void 0))}hide(e,t){this._updateVisibility(e,t,!1)}show(e,t){this._updateVisibility(e,t,!0)}_destroyDatasetMeta(e){let t=this._metasets[e];t&&t.controller&&t.controller._destroy(),delete this._metasets[e]}_stop(){let e,t;for(this.stop(),o7.remove(this),e=0,t=this.data.datasets.length;e<t;++e)this._destroyDatasetMeta(e)}destroy(){this.notifyPlugins(`beforeDestroy`);let{canvas:e,ctx:t}=this;this._stop(),this.config.clearCache(),e&&(this.unbindEvents(),J3(e,t),this.platform.releaseContext(t),this.canvas=null,this.ctx=null),delete K7[this.id],this.notifyPlugins(`afterDestroy`)}toBase64Image(...e){return this.canvas.toDataURL(...e)}bindEvents(){this.bindUserEvents(),this.options.responsive?this.bindResponsiveEvents():this.attached=!0}bindUserEvents(){let e=this._listeners,t=this.platform,n=(n,r)=>{t.addEventListener(this,n,r),e[n]=r},r=(e,t,n)=>{e.offsetX=t,e.offsetY=n,this._eventHandler(e)};_3(this.options.events,e=>n(e,r))}bindResponsiveEvents(){this._responsiveListeners||={};let e=this._responsiveListeners,t=this.platform,n=(n,r)=>{t.addEventListener(this,n,r),e[n]=r},r=(n,r)=>{e[n]&&(t.removeEventListener(this,n,r),delete e[n])},i=(e,t)=>{this.canvas&&this.resize(e,t)},a,o=()=>{r(`attach`,o),this.attached=!0,this.resize(),n(`resize`,i),n(`detach`,a)};a=()=>{this.attached=!1,r(`resize`,i),this._stop(),this._resize(0,0),n(`attach`,o)},t.isAttached(this.canvas)?o():a()}unbindEvents(){_3(this._listeners,(e,t)=>{this.platform.removeEventListener(this,t,e)}),this._listeners={},_3(this._responsiveListeners,(e,t)=>{this.platform.removeEventListener(this,t,e)}),this._responsiveListeners=void 0}updateHoverStyle(e,t,n){let r=n?`set`:`remove`,i,a,o,s;for(t===`dataset`&&(i=this.getDatasetMeta(e[0].datasetIndex),i.controller[`_`+r+`DatasetHoverStyle`]()),o=0,s=e.length;o<s;++o){a=e[o];let t=a&&this.getDatasetMeta(a.datasetIndex).controller;t&&t[r+`HoverStyle`](a.element,a.datasetIndex,a.index)}}getActiveElements(){return this._active||[]}setActiveElements(e){let t=this._active||[],n=e.map(({datasetIndex:e,index:t})=>{let n=this.getDatasetMeta(e);if(!n)throw Error(`No dataset found at index `+e);return{datasetIndex:e,element:n.data[t],index:t}});v3(n,t)||(this._active=n,this._lastEvent=null,this._updateHoverStyles(n,t))}notifyPlugins(e,t,n){return this._plugins.notify(this,e,t,n)}isPluginEnabled(e){return this._plugins._cache.filter(t=>t.plugin.id===e).length===1}_updateHoverStyles(e,t,n){let r=this.options.hover,i=(e,t)=>e.filter(e=>!t.some(t=>e.datasetIndex===t.datasetIndex&&e.index===t.index)),a=i(t,e),o=n?e:i(e,t);a.length&&this.updateHoverStyle(a,r.mode,!1),o.length&&r.mode&&this.updateHoverStyle(o,r.mode,!0)}_eventHandler(e,t){let n={event:e,replay:t,cancelable:!0,inChartArea:this.isPointInArea(e)},r=t=>(t.options.events||this.options.events).includes(e.native.type);if(this.notifyPlugins(`beforeEvent`,n,r)===!1)return;let i=this._handleEvent(e,t,n.inChartArea);return n.cancelable=!1,this.notifyPlugins(`afterEvent`,n,r),(i||n.changed)&&this.render(),this}_handleEvent(e,t,n){let{_active:r=[],options:i}=this,a=t,o=this._getActiveElements(e,r,n,a),s=Ple(e),c=Vde(e,this._lastEvent,n,s);n&&(this._lastEvent=null,g3(i.onHover,[e,o,this],this),s&&g3(i.onClick,[e,o,this],this));let l=!v3(o,r);return(l||t)&&(this._active=o,this._updateHoverStyles(o,r,t)),this._lastEvent=c,l}_getActiveElements(e,t,n,r){if(e.type===`mouseout`)return[];if(!n)return t;let i=this.options.hover;return this.getElementsAtEventForMode(e,i.mode,i,r)}},Y7=typeof Path2D==`function`,X7=class extends A7{static id=`line`;static defaults={borderCapStyle:`butt`,borderDash:[],borderDashOffset:0,borderJoinStyle:`miter`,borderWidth:3,capBezierPoints:!0,cubicInterpolationMode:`default`,fill:!1,spanGaps:!1,stepped:!1,tension:0};static defaultRoutes={backgroundColor:`backgroundColor`,borderColor:`borderColor`};static descriptors={_scriptable:!0,_indexable:e=>e!==`borderDash`&&e!==`fill`};constructor(e){super(),this.animated=!0,this.options=void 0,this._chart=void 0,this._loop=void 0,this._fullLoop=void 0,this._path=void 0,this._points=void 0,this._segments=void 0,this._decimated=!1,this._pointsUpdated=!1,this._datasetIndex=void 0,e&&Object.assign(this,e)}updateControlPoints(e,t){let n=this.options;if((n.tension||n.cubicInterpolationMode===`monotone`)&&!n.stepped&&!this._pointsUpdated){let r=n.spanGaps?this._loop:this._fullLoop;bue(this._points,n,e,r,t),this._pointsUpdated=!0}}set points(e){this._points=e,delete this._segments,delete this._path,this._pointsUpdated=!1}get points(){return this._points}get segments(){return this._segments||=Aue(this,this.options.segment)}first(){let e=this.segments,t=this.points;return e.length&&t[e[0].start]}last(){let e=this.segments,t=this.points,n=e.length;return n&&t[e[n-1].end]}interpolate(e,t){let n=this.options,r=e[t],i=this.points,a=M6(this,{property:t,start:r,end:r});if(!a.length)return;let o=[],s=Kde(n),c,l;for(c=0,l=a.length;c<l;++c){let{start:l,end:u}=a[c],d=i[l],f=i[u];if(d===f){o.push(d);continue}let p=s(d,f,Math.abs((r-d[t])/(f[t]-d[t])),n.stepped);p[t]=e[t],o.push(p)}return o.length===1?o[0]:o}pathSegment(e,t,n){return w5(this)(e,this,t,n)}path(e,t,n){let r=this.segments,i=w5(this),a=this._loop;t||=0,n||=this.points.length-t;for(let o of r)a&=i(e,this,o,{start:t,end:t+n-1});return!!a}draw(e,t,n,r){let i=this.options||{};(this.points||[]).length&&i.borderWidth&&(e.save(),Yde(e,this,n,r),e.restore()),this.animated&&(this._pointsUpdated=!1,this._path=void 0)}},Z7=class extends A7{static id=`point`;parsed;skip;stop;static defaults={borderWidth:1,hitRadius:1,hoverBorderWidth:1,hoverRadius:4,pointStyle:`circle`,radius:3,rotation:0};static defaultRoutes={backgroundColor:`backgroundColor`,borderColor:`borderColor`};constructor(e){super(),this.options=void 0,this.parsed=void 0,this.skip=void 0,this.stop=void 0,e&&Object.assign(this,e)}inRange(e,t,n){let r=this.options,{x:i,y:a}=this.getProps([`x`,`y`],n);return(e-i)**2+(t-a)**2<(r.hitRadius+r.radius)**2}inXRange(e,t){return T5(this,e,`x`,t)}inYRange(e,t){return T5(this,e,`y`,t)}getCenterPoint(e){let{x:t,y:n}=this.getProps([`x`,`y`],e);return{x:t,y:n}}size(e){e=e||this.options||{};let t=e.radius||0;t=Math.max(t,t&&e.hoverRadius||0);let n=t&&e.borderWidth||0;return(t+n)*2}draw(e,t){let n=this.options;this.skip||n.radius<.1||!Z3(this,t,this.size(n)/2)||(e.strokeStyle=n.borderColor,e.lineWidth=n.borderWidth,e.fillStyle=n.backgroundColor,Y3(e,n,this.x,this.y))}getRange(){let e=this.options||{};return e.radius+e.hitRadius}},Q7=class{constructor(e){this.x=e.x,this.y=e.y,this.radius=e.radius}pathSegment(e,t,n){let{x:r,y:i,radius:a}=this;return t||={start:0,end:W6},e.arc(r,i,a,t.end,t.start,!0),!n.bounds}interpolate(e){let{x:t,y:n,radius:r}=this,i=e.angle;return{x:t+Math.cos(i)*r,y:n+Math.sin(i)*r,angle:i}}},$7={id:`filler`,afterDatasetsUpdate(e,t,n){let r=(e.data.datasets||[]).length,i=[],a,o,s,c;for(o=0;o<r;++o)a=e.getDatasetMeta(o),s=a.dataset,c=null,s&&s.options&&s instanceof X7&&(c={visible:e.isDatasetVisible(o),index:o,fill:$de(s,o,r),chart:e,axis:a.controller.options.indexAxis,scale:a.vScale,line:s}),a.$filler=c,i.push(c);for(o=0;o<r;++o)c=i[o],!(!c||c.fill===!1)&&(c.fill=Qde(i,o,n.propagate))},beforeDraw(e,t,n){let r=n.drawTime===`beforeDraw`,i=e.getSortedVisibleDatasetMetas(),a=e.chartArea;for(let t=i.length-1;t>=0;--t){let n=i[t].$filler;n&&(n.line.updateControlPoints(a,n.axis),r&&n.fill&&j5(e.ctx,n,a))}},beforeDatasetsDraw(e,t,n){if(n.drawTime!==`beforeDatasetsDraw`)return;let r=e.getSortedVisibleDatasetMetas();for(let t=r.length-1;t>=0;--t){let n=r[t].$filler;A5(n)&&j5(e.ctx,n,e.chartArea)}},beforeDatasetDraw(e,t,n){let r=t.meta.$filler;!A5(r)||n.drawTime!==`beforeDatasetDraw`||j5(e.ctx,r,e.chartArea)},defaults:{propagate:!0,drawTime:`beforeDatasetDraw`}},e9=(e,t)=>{let{boxHeight:n=t,boxWidth:r=t}=e;return e.usePointStyle&&(n=Math.min(n,t),r=e.pointStyleWidth||Math.min(r,t)),{boxWidth:r,boxHeight:n,itemHeight:Math.max(t,n)}},t9=(e,t)=>e!==null&&t!==null&&e.datasetIndex===t.datasetIndex&&e.index===t.index,n9=class extends A7{constructor(e){super(),this._added=!1,this.legendHitBoxes=[],this._hoveredItem=null,this.doughnutMode=!1,this.chart=e.chart,this.options=e.options,this.ctx=e.ctx,this.legendItems=void 0,this.columnSizes=void 0,this.lineWidths=void 0,this.maxHeight=void 0,this.maxWidth=void 0,this.top=void 0,this.bottom=void 0,this.left=void 0,this.right=void 0,this.height=void 0,this.width=void 0,this._margins=void 0,this.position=void 0,this.weight=void 0,this.fullSize=void 0}update(e,t,n){this.maxWidth=e,this.maxHeight=t,this._margins=n,this.setDimensions(),this.buildLabels(),this.fit()}setDimensions(){this.isHorizontal()?(this.width=this.maxWidth,this.left=this._margins.left,this.right=this.width):(this.height=this.maxHeight,this.top=this._margins.top,this.bottom=this.height)}buildLabels(){let e=this.options.labels||{},t=g3(e.generateLabels,[this.chart],this)||[];e.filter&&(t=t.filter(t=>e.filter(t,this.chart.data))),e.sort&&(t=t.sort((t,n)=>e.sort(t,n,this.chart.data))),this.options.reverse&&t.reverse(),this.legendItems=t}fit(){let{options:e,ctx:t}=this;if(!e.display){this.width=this.height=0;return}let n=e.labels,r=a6(n.font),i=r.size,a=this._computeTitleHeight(),{boxWidth:o,itemHeight:s}=e9(n,i),c,l;t.font=r.string,this.isHorizontal()?(c=this.maxWidth,l=this._fitRows(a,i,o,s)+10):(l=this.maxHeight,c=this._fitCols(a,r,o,s)+10),this.width=Math.min(c,e.maxWidth||this.maxWidth),this.height=Math.min(l,e.maxHeight||this.maxHeight)}_fitRows(e,t,n,r){let{ctx:i,maxWidth:a,options:{labels:{padding:o}}}=this,s=this.legendHitBoxes=[],c=this.lineWidths=[0],l=r+o,u=e;i.textAlign=`left`,i.textBaseline=`middle`;let d=-1,f=-l;return this.legendItems.forEach((e,p)=>{let m=n+t/2+i.measureText(e.text).width;(p===0||c[c.length-1]+m+2*o>a)&&(u+=l,c[c.length-(p>0?0:1)]=0,f+=l,d++),s[p]={left:0,top:f,row:d,width:m,height:r},c[c.length-1]+=m+o}),u}_fitCols(e,t,n,r){let{ctx:i,maxHeight:a,options:{labels:{padding:o}}}=this,s=this.legendHitBoxes=[],c=this.columnSizes=[],l=a-e,u=o,d=0,f=0,p=0,m=0;return this.legendItems.forEach((e,a)=>{let{itemWidth:h,itemHeight:g}=hfe(n,t,i,e,r);a>0&&f+g+2*o>l&&(u+=d+o,c.push({width:d,height:f}),p+=d+o,m++,d=f=0),s[a]={left:p,top:f,col:m,width:h,height:g},d=Math.max(d,h),f+=g+o}),u+=d,c.push({width:d,height:f}),u}adjustHitBoxes(){if(!this.options.display)return;let e=this._computeTitleHeight(),{legendHitBoxes:t,options:{align:n,labels:{padding:r},rtl:i}}=this,a=E6(i,this.left,this.width);if(this.isHorizontal()){let i=0,o=i8(n,this.left+r,this.right-this.lineWidths[i]);for(let s of t)i!==s.row&&(i=s.row,o=i8(n,this.left+r,this.right-this.lineWidths[i])),s.top+=this.top+e+r,s.left=a.leftForLtr(a.x(o),s.width),o+=s.width+r}else{let i=0,o=i8(n,this.top+e+r,this.bottom-this.columnSizes[i].height);for(let s of t)s.col!==i&&(i=s.col,o=i8(n,this.top+e+r,this.bottom-this.columnSizes[i].height)),s.top=o,s.left+=this.left+r,s.left=a.leftForLtr(a.x(s.left),s.width),o+=s.height+r}}isHorizontal(){return this.options.position===`top`||this.options.position===`bottom`}draw(){if(this.options.display){let e=this.ctx;Q3(e,this),this._draw(),$3(e)}}_draw(){let{options:e,columnSizes:t,lineWidths:n,ctx:r}=this,{align:i,labels:a}=e,o=v8.color,s=E6(e.rtl,this.left,this.width),c=a6(a.font),{padding:l}=a,u=c.size,d=u/2,f;this.drawTitle(),r.textAlign=s.textAlign(`left`),r.textBaseline=`middle`,r.lineWidth=.5,r.font=c.string;let{boxWidth:p,boxHeight:m,itemHeight:h}=e9(a,u),g=function(e,t,n){if(isNaN(p)||p<=0||isNaN(m)||m<0)return;r.save();let i=h3(n.lineWidth,1);if(r.fillStyle=h3(n.fillStyle,o),r.lineCap=h3(n.lineCap,`butt`),r.lineDashOffset=h3(n.lineDashOffset,0),r.lineJoin=h3(n.lineJoin,`miter`),r.lineWidth=i,r.strokeStyle=h3(n.strokeStyle,o),r.setLineDash(h3(n.lineDash,[])),a.usePointStyle){let o={radius:m*Math.SQRT2/2,pointStyle:n.pointStyle,rotation:n.rotation,borderWidth:i},c=s.xPlus(e,p/2),l=t+d;X3(r,o,c,l,a.pointStyleWidth&&p)}else{let a=t+Math.max((u-m)/2,0),o=s.leftForLtr(e,p),c=r6(n.borderRadius);r.beginPath(),Object.values(c).some(e=>e!==0)?t6(r,{x:o,y:a,w:p,h:m,radius:c}):r.rect(o,a,p,m),r.fill(),i!==0&&r.stroke()}r.restore()},_=function(e,t,n){e6(r,n.text,e,t+h/2,c,{strikethrough:n.hidden,textAlign:s.textAlign(n.textAlign)})},v=this.isHorizontal(),y=this._computeTitleHeight();f=v?{x:i8(i,this.left+l,this.right-n[0]),y:this.top+l+y,line:0}:{x:this.left+l,y:i8(i,this.top+y+l,this.bottom-t[0].height),line:0},D6(this.ctx,e.textDirection);let b=h+l;this.legendItems.forEach((o,u)=>{r.strokeStyle=o.fontColor,r.fillStyle=o.fontColor;let m=r.measureText(o.text).width,h=s.textAlign(o.textAlign||=a.textAlign),x=p+d+m,S=f.x,C=f.y;s.setWidth(this.width),v?u>0&&S+x+l>this.right&&(C=f.y+=b,f.line++,S=f.x=i8(i,this.left+l,this.right-n[f.line])):u>0&&C+b>this.bottom&&(S=f.x=S+t[f.line].width+l,f.line++,C=f.y=i8(i,this.top+y+l,this.bottom-t[f.line].height));let w=s.x(S);if(g(w,C,o),S=a8(h,S+p+d,v?S+x:this.right,e.rtl),_(s.x(S),C,o),v)f.x+=x+l;else if(typeof o.text!=`string`){let e=c.lineHeight;f.y+=I5(o,e)+l}else f.y+=b}),O6(this.ctx,e.textDirection)}drawTitle(){let e=this.options,t=e.title,n=a6(t.font),r=i6(t.padding);if(!t.display)return;let i=E6(e.rtl,this.left,this.width),a=this.ctx,o=t.position,s=n.size/2,c=r.top+s,l,u=this.left,d=this.width;if(this.isHorizontal())d=Math.max(...this.lineWidths),l=this.top+c,u=i8(e.align,u,this.right-d);else{let t=this.columnSizes.reduce((e,t)=>Math.max(e,t.height),0);l=c+i8(e.align,this.top,this.bottom-t-e.labels.padding-this._computeTitleHeight())}let f=i8(o,u,u+d);a.textAlign=i.textAlign(r8(o)),a.textBaseline=`middle`,a.strokeStyle=t.color,a.fillStyle=t.color,a.font=n.string,e6(a,t.text,f,l,n)}_computeTitleHeight(){let e=this.options.title,t=a6(e.font),n=i6(e.padding);return e.display?t.lineHeight+n.height:0}_getLegendItemAt(e,t){let n,r,i;if(I3(e,this.left,this.right)&&I3(t,this.top,this.bottom)){for(i=this.legendHitBoxes,n=0;n<i.length;++n)if(r=i[n],I3(e,r.left,r.left+r.width)&&I3(t,r.top,r.top+r.height))return this.legendItems[n]}return null}handleEvent(e){let t=this.options;if(!vfe(e.type,t))return;let n=this._getLegendItemAt(e.x,e.y);if(e.type===`mousemove`||e.type===`mouseout`){let r=this._hoveredItem,i=t9(r,n);r&&!i&&g3(t.onLeave,[e,r,this],this),this._hoveredItem=n,n&&!i&&g3(t.onHover,[e,n,this],this)}else n&&g3(t.onClick,[e,n,this],this)}},r9={id:`legend`,_element:n9,start(e,t,n){let r=e.legend=new n9({ctx:e.ctx,options:n,chart:e});b7.configure(e,r,n),b7.addBox(e,r)},stop(e){b7.removeBox(e,e.legend),delete e.legend},beforeUpdate(e,t,n){let r=e.legend;b7.configure(e,r,n),r.options=n},afterUpdate(e){let t=e.legend;t.buildLabels(),t.adjustHitBoxes()},afterEvent(e,t){t.replay||e.legend.handleEvent(t.event)},defaults:{display:!0,position:`top`,align:`center`,fullSize:!0,reverse:!1,weight:1e3,onClick(e,t,n){let r=t.datasetIndex,i=n.chart;i.isDatasetVisible(r)?(i.hide(r),t.hidden=!0):(i.show(r),t.hidden=!1)},onHover:null,onLeave:null,labels:{color:e=>e.chart.options.color,boxWidth:40,padding:10,generateLabels(e){let t=e.data.datasets,{labels:{usePointStyle:n,pointStyle:r,textAlign:i,color:a,useBorderRadius:o,borderRadius:s}}=e.legend.options;return e._getSortedDatasetMetas().map(e=>{let c=e.controller.getStyle(n?0:void 0),l=i6(c.borderWidth);return{text:t[e.index].label,fillStyle:c.backgroundColor,fontColor:a,hidden:!e.visible,lineCap:c.borderCapStyle,lineDash:c.borderDash,lineDashOffset:c.borderDashOffset,lineJoin:c.borderJoinStyle,lineWidth:(l.width+l.height)/4,strokeStyle:c.borderColor,pointStyle:r||c.pointStyle,rotation:c.rotation,textAlign:i||c.textAlign,borderRadius:o&&(s||c.borderRadius),datasetIndex:e.index}},this)}},title:{color:e=>e.chart.options.color,display:!1,position:`center`,text:``}},descriptors:{_scriptable:e=>!e.startsWith(`on`),labels:{_scriptable:e=>![`generateLabels`,`filter`,`sort`].includes(e)}}},i9=class extends A7{constructor(e){super(),this.chart=e.chart,this.options=e.options,this.ctx=e.ctx,this._padding=void 0,this.top=void 0,this.bottom=void 0,this.left=void 0,this.right=void 0,this.width=void 0,this.height=void 0,this.position=void 0,this.weight=void 0,this.fullSize=void 0}update(e,t){let n=this.options;if(this.left=0,this.top=0,!n.display){this.width=this.height=this.right=this.bottom=0;return}this.width=this.right=e,this.height=this.bottom=t;let r=d3(n.text)?n.text.length:1;this._padding=i6(n.padding);let i=r*a6(n.font).lineHeight+this._padding.height;this.isHorizontal()?this.height=i:this.width=i}isHorizontal(){let e=this.options.position;return e===`top`||e===`bottom`}_drawArgs(e){let{top:t,left:n,bottom:r,right:i,options:a}=this,o=a.align,s=0,c,l,u;return this.isHorizontal()?(l=i8(o,n,i),u=t+e,c=i-n):(a.position===`left`?(l=n+e,u=i8(o,r,t),s=U6*-.5):(l=i-e,u=i8(o,t,r),s=U6*.5),c=r-t),{titleX:l,titleY:u,maxWidth:c,rotation:s}}draw(){let e=this.ctx,t=this.options;if(!t.display)return;let n=a6(t.font),r=n.lineHeight/2+this._padding.top,{titleX:i,titleY:a,maxWidth:o,rotation:s}=this._drawArgs(r);e6(e,t.text,0,0,n,{color:t.color,maxWidth:o,rotation:s,textAlign:r8(t.align),textBaseline:`middle`,translation:[i,a]})}},a9={id:`title`,_element:i9,start(e,t,n){yfe(e,n)},stop(e){let t=e.titleBlock;b7.removeBox(e,t),delete e.titleBlock},beforeUpdate(e,t,n){let r=e.titleBlock;b7.configure(e,r,n),r.options=n},defaults:{align:`center`,display:!1,font:{weight:`bold`},fullSize:!0,padding:10,position:`top`,text:``,weight:2e3},defaultRoutes:{color:`color`},descriptors:{_scriptable:!0,_indexable:!1}},o9={average(e){if(!e.length)return!1;let t,n,r=new Set,i=0,a=0;for(t=0,n=e.length;t<n;++t){let n=e[t].element;if(n&&n.hasValue()){let e=n.tooltipPosition();r.add(e.x),i+=e.y,++a}}return a===0||r.size===0?!1:{x:[...r].reduce((e,t)=>e+t)/r.size,y:i/a}},nearest(e,t){if(!e.length)return!1;let n=t.x,r=t.y,i=1/0,a,o,s;for(a=0,o=e.length;a<o;++a){let n=e[a].element;if(n&&n.hasValue()){let e=M3(t,n.getCenterPoint());e<i&&(i=e,s=n)}}if(s){let e=s.tooltipPosition();n=e.x,r=e.y}return{x:n,y:r}}},s9={beforeTitle:l3,title(e){if(e.length>0){let t=e[0],n=t.chart.data.labels,r=n?n.length:0;if(this&&this.options&&this.options.mode===`dataset`)return t.dataset.label||``;if(t.label)return t.label;if(r>0&&t.dataIndex<r)return n[t.dataIndex]}return``},afterTitle:l3,beforeBody:l3,beforeLabel:l3,label(e){if(this&&this.options&&this.options.mode===`dataset`)return e.label+`: `+e.formattedValue||e.formattedValue;let t=e.dataset.label||``;t&&(t+=`: `);let n=e.formattedValue;return u3(n)||(t+=n),t},labelColor(e){let t=e.chart.getDatasetMeta(e.datasetIndex).controller.getStyle(e.dataIndex);return{borderColor:t.borderColor,backgroundColor:t.backgroundColor,borderWidth:t.borderWidth,borderDash:t.borderDash,borderDashOffset:t.borderDashOffset,borderRadius:0}},labelTextColor(){return this.options.bodyColor},labelPointStyle(e){let t=e.chart.getDatasetMeta(e.datasetIndex).controller.getStyle(e.dataIndex);return{pointStyle:t.pointStyle,rotation:t.rotation}},afterLabel:l3,afterBody:l3,beforeFooter:l3,footer:l3,afterFooter:l3},c9=class extends A7{static positioners=o9;constructor(e){super(),this.opacity=0,this._active=[],this._eventPosition=void 0,this._size=void 0,this._cachedAnimations=void 0,this._tooltipItems=[],this.$animations=void 0,this.$context=void 0,this.chart=e.chart,this.options=e.options,this.dataPoints=void 0,this.title=void 0,this.beforeBody=void 0,this.body=void 0,this.afterBody=void 0,this.footer=void 0,this.xAlign=void 0,this.yAlign=void 0,this.x=void 0,this.y=void 0,this.height=void 0,this.width=void 0,this.caretX=void 0,this.caretY=void 0,this.labelColors=void 0,this.labelPointStyles=void 0,this.labelTextColors=void 0}initialize(e){this.options=e,this._cachedAnimations=void 0,this.$context=void 0}_resolveAnimations(){let e=this._cachedAnimations;if(e)return e;let t=this.chart,n=this.options.setContext(this.getContext()),r=n.enabled&&t.options.animation&&n.animations,i=new u7(this.chart,r);return r._cacheable&&(this._cachedAnimations=Object.freeze(i)),i}getContext(){return this.$context||=Efe(this.chart.getContext(),this,this._tooltipItems)}getTitle(e,t){let{callbacks:n}=t,r=G5(n,`beforeTitle`,this,e),i=G5(n,`title`,this,e),a=G5(n,`afterTitle`,this,e),o=[];return o=L5(o,R5(r)),o=L5(o,R5(i)),o=L5(o,R5(a)),o}getBeforeBody(e,t){return U5(G5(t.callbacks,`beforeBody`,this,e))}getBody(e,t){let{callbacks:n}=t,r=[];return _3(e,e=>{let t={before:[],lines:[],after:[]},i=W5(n,e);L5(t.before,R5(G5(i,`beforeLabel`,this,e))),L5(t.lines,G5(i,`label`,this,e)),L5(t.after,R5(G5(i,`afterLabel`,this,e))),r.push(t)}),r}getAfterBody(e,t){return U5(G5(t.callbacks,`afterBody`,this,e))}getFooter(e,t){let{callbacks:n}=t,r=G5(n,`beforeFooter`,this,e),i=G5(n,`footer`,this,e),a=G5(n,`afterFooter`,this,e),o=[];return o=L5(o,R5(r)),o=L5(o,R5(i)),o=L5(o,R5(a)),o}_createItems(e){let t=this._active,n=this.chart.data,r=[],i=[],a=[],o=[],s,c;for(s=0,c=t.length;s<c;++s)o.push(bfe(this.chart,t[s]));return e.filter&&(o=o.filter((t,r,i)=>e.filter(t,r,i,n))),e.itemSort&&(o=o.sort((t,r)=>e.itemSort(t,r,n))),_3(o,t=>{let n=W5(e.callbacks,t);r.push(G5(n,`labelColor`,this,t)),i.push(G5(n,`labelPointStyle`,this,t)),a.push(G5(n,`labelTextColor`,this,t))}),this.labelColors=r,this.labelPointStyles=i,this.labelTextColors=a,this.dataPoints=o,o}update(e,t){let n=this.options.setContext(this.getContext()),r=this._active,i,a=[];if(!r.length)this.opacity!==0&&(i={opacity:0});else{let e=o9[n.position].call(this,r,this._eventPosition);a=this._createItems(n),this.title=this.getTitle(a,n),this.beforeBody=this.getBeforeBody(a,n),this.body=this.getBody(a,n),this.afterBody=this.getAfterBody(a,n),this.footer=this.getFooter(a,n);let t=this._size=z5(this,n),o=Object.assign({},e,t),s=B5(this.chart,n,o),c=V5(n,o,s,this.chart);this.xAlign=s.xAlign,this.yAlign=s.yAlign,i={opacity:1,x:c.x,y:c.y,width:t.width,height:t.height,caretX:e.x,caretY:e.y}}this._tooltipItems=a,this.$context=void 0,i&&this._resolveAnimations().update(this,i),e&&n.external&&n.external.call(this,{chart:this.chart,tooltip:this,replay:t})}drawCaret(e,t,n,r){let i=this.getCaretPosition(e,n,r);t.lineTo(i.x1,i.y1),t.lineTo(i.x2,i.y2),t.lineTo(i.x3,i.y3)}getCaretPosition(e,t,n){let{xAlign:r,yAlign:i}=this,{caretSize:a,cornerRadius:o}=n,{topLeft:s,topRight:c,bottomLeft:l,bottomRight:u}=r6(o),{x:d,y:f}=e,{width:p,height:m}=t,h,g,_,v,y,b;return i===`center`?(y=f+m/2,r===`left`?(h=d,g=h-a,v=y+a,b=y-a):(h=d+p,g=h+a,v=y-a,b=y+a),_=h):(g=r===`left`?d+Math.max(s,l)+a:r===`right`?d+p-Math.max(c,u)-a:this.caretX,i===`top`?(v=f,y=v-a,h=g-a,_=g+a):(v=f+m,y=v+a,h=g+a,_=g-a),b=v),{x1:h,x2:g,x3:_,y1:v,y2:y,y3:b}}drawTitle(e,t,n){let r=this.title,i=r.length,a,o,s;if(i){let c=E6(n.rtl,this.x,this.width);for(e.x=H5(this,n.titleAlign,n),t.textAlign=c.textAlign(n.titleAlign),t.textBaseline=`middle`,a=a6(n.titleFont),o=n.titleSpacing,t.fillStyle=n.titleColor,t.font=a.string,s=0;s<i;++s)t.fillText(r[s],c.x(e.x),e.y+a.lineHeight/2),e.y+=a.lineHeight+o,s+1===i&&(e.y+=n.titleMarginBottom-o)}}_drawColorBox(e,t,n,r,i){let a=this.labelColors[n],o=this.labelPointStyles[n],{boxHeight:s,boxWidth:c}=i,l=a6(i.bodyFont),u=H5(this,`left`,i),d=r.x(u),f=s<l.lineHeight?(l.lineHeight-s)/2:0,p=t.y+f;if(i.usePointStyle){let t={radius:Math.min(c,s)/2,pointStyle:o.pointStyle,rotation:o.rotation,borderWidth:1},n=r.leftForLtr(d,c)+c/2,l=p+s/2;e.strokeStyle=i.multiKeyBackground,e.fillStyle=i.multiKeyBackground,Y3(e,t,n,l),e.strokeStyle=a.borderColor,e.fillStyle=a.backgroundColor,Y3(e,t,n,l)}else{e.lineWidth=f3(a.borderWidth)?Math.max(...Object.values(a.borderWidth)):a.borderWidth||1,e.strokeStyle=a.borderColor,e.setLineDash(a.borderDash||[]),e.lineDashOffset=a.borderDashOffset||0;let t=r.leftForLtr(d,c),n=r.leftForLtr(r.xPlus(d,1),c-2),o=r6(a.borderRadius);Object.values(o).some(e=>e!==0)?(e.beginPath(),e.fillStyle=i.multiKeyBackground,t6(e,{x:t,y:p,w:c,h:s,radius:o}),e.fill(),e.stroke(),e.fillStyle=a.backgroundColor,e.beginPath(),t6(e,{x:n,y:p+1,w:c-2,h:s-2,radius:o}),e.fill()):(e.fillStyle=i.multiKeyBackground,e.fillRect(t,p,c,s),e.strokeRect(t,p,c,s),e.fillStyle=a.backgroundColor,e.fillRect(n,p+1,c-2,s-2))}e.fillStyle=this.labelTextColors[n]}drawBody(e,t,n){let{body:r}=this,{bodySpacing:i,bodyAlign:a,displayColors:o,boxHeight:s,boxWidth:c,boxPadding:l}=n,u=a6(n.bodyFont),d=u.lineHeight,f=0,p=E6(n.rtl,this.x,this.width),m=function(n){t.fillText(n,p.x(e.x+f),e.y+d/2),e.y+=d+i},h=p.textAlign(a),g,_,v,y,b,x,S;for(t.textAlign=a,t.textBaseline=`middle`,t.font=u.string,e.x=H5(this,h,n),t.fillStyle=n.bodyColor,_3(this.beforeBody,m),f=o&&h!==`right`?a===`center`?c/2+l:c+2+l:0,y=0,x=r.length;y<x;++y){for(g=r[y],_=this.labelTextColors[y],t.fillStyle=_,_3(g.before,m),v=g.lines,o&&v.length&&(this._drawColorBox(t,e,y,p,n),d=Math.max(u.lineHeight,s)),b=0,S=v.length;b<S;++b)m(v[b]),d=u.lineHeight;_3(g.after,m)}f=0,d=u.lineHeight,_3(this.afterBody,m),e.y-=i}drawFooter(e,t,n){let r=this.footer,i=r.length,a,o;if(i){let s=E6(n.rtl,this.x,this.width);for(e.x=H5(this,n.footerAlign,n),e.y+=n.footerMarginTop,t.textAlign=s.textAlign(n.footerAlign),t.textBaseline=`middle`,a=a6(n.footerFont),t.fillStyle=n.footerColor,t.font=a.string,o=0;o<i;++o)t.fillText(r[o],s.x(e.x),e.y+a.lineHeight/2),e.y+=a.lineHeight+n.footerSpacing}}drawBackground(e,t,n,r){let{xAlign:i,yAlign:a}=this,{x:o,y:s}=e,{width:c,height:l}=n,{topLeft:u,topRight:d,bottomLeft:f,bottomRight:p}=r6(r.cornerRadius);t.fillStyle=r.backgroundColor,t.strokeStyle=r.borderColor,t.lineWidth=r.borderWidth,t.beginPath(),t.moveTo(o+u,s),a===`top`&&this.drawCaret(e,t,n,r),t.lineTo(o+c-d,s),t.quadraticCurveTo(o+c,s,o+c,s+d),a===`center`&&i===`right`&&this.drawCaret(e,t,n,r),t.lineTo(o+c,s+l-p),t.quadraticCurveTo(o+c,s+l,o+c-p,s+l),a===`bottom`&&this.drawCaret(e,t,n,r),t.lineTo(o+f,s+l),t.quadraticCurveTo(o,s+l,o,s+l-f),a===`center`&&i===`left`&&this.drawCaret(e,t,n,r),t.lineTo(o,s+u),t.quadraticCurveTo(o,s,o+u,s),t.closePath(),t.fill(),r.borderWidth>0&&t.stroke()}_updateAnimationTarget(e){let t=this.chart,n=this.$animations,r=n&&n.x,i=n&&n.y;if(r||i){let n=o9[e.position].call(this,this._active,this._eventPosition);if(!n)return;let a=this._size=z5(this,e),o=Object.assign({},n,this._size),s=B5(t,e,o),c=V5(e,o,s,t);(r._to!==c.x||i._to!==c.y)&&(this.xAlign=s.xAlign,this.yAlign=s.yAlign,this.width=a.width,this.height=a.height,this.caretX=n.x,this.caretY=n.y,this._resolveAnimations().update(this,c))}}_willRender(){return!!this.opacity}draw(e){let t=this.options.setContext(this.getContext()),n=this.opacity;if(!n)return;this._updateAnimationTarget(t);let r={width:this.width,height:this.height},i={x:this.x,y:this.y};n=Math.abs(n)<.001?0:n;let a=i6(t.padding),o=this.title.length||this.beforeBody.length||this.body.length||this.afterBody.length||this.footer.length;t.enabled&&o&&(e.save(),e.globalAlpha=n,this.drawBackground(i,e,r,t),D6(e,t.textDirection),i.y+=a.top,this.drawTitle(i,e,t),this.drawBody(i,e,t),this.drawFooter(i,e,t),O6(e,t.textDirection),e.restore())}getActiveElements(){return this._active||[]}setActiveElements(e,t){let n=this._active,r=e.map(({datasetIndex:e,index:t})=>{let n=this.chart.getDatasetMeta(e);if(!n)throw Error(`Cannot find a dataset at index `+e);return{datasetIndex:e,element:n.data[t],index:t}}),i=!v3(n,r),a=this._positionChanged(r,t);(i||a)&&(this._active=r,this._eventPosition=t,this._ignoreReplayEvents=!0,this.update(!0))}handleEvent(e,t,n=!0){if(t&&this._ignoreReplayEvents)return!1;this._ignoreReplayEvents=!1;let r=this.options,i=this._active||[],a=this._getActiveElements(e,i,t,n),o=this._positionChanged(a,e),s=t||!v3(a,i)||o;return s&&(this._active=a,(r.enabled||r.external)&&(this._eventPosition={x:e.x,y:e.y},this.update(!0,t))),s}_getActiveElements(e,t,n,r){let i=this.options;if(e.type===`mouseout`)return[];if(!r)return t.filter(e=>this.chart.data.datasets[e.datasetIndex]&&this.chart.getDatasetMeta(e.datasetIndex).controller.getParsed(e.index)!==void 0);let a=this.chart.getElementsAtEventForMode(e,i.mode,i,n);return i.reverse&&a.reverse(),a}_positionChanged(e,t){let{caretX:n,caretY:r,options:i}=this,a=o9[i.position].call(this,e,t);return a!==!1&&(n!==a.x||r!==a.y)}},l9={id:`tooltip`,_element:c9,positioners:o9,afterInit(e,t,n){n&&(e.tooltip=new c9({chart:e,options:n}))},beforeUpdate(e,t,n){e.tooltip&&e.tooltip.initialize(n)},reset(e,t,n){e.tooltip&&e.tooltip.initialize(n)},afterDraw(e){let t=e.tooltip;if(t&&t._willRender()){let n={tooltip:t};if(e.notifyPlugins(`beforeTooltipDraw`,{...n,cancelable:!0})===!1)return;t.draw(e.ctx),e.notifyPlugins(`afterTooltipDraw`,n)}},afterEvent(e,t){if(e.tooltip){let n=t.replay;e.tooltip.handleEvent(t.event,n,t.inChartArea)&&(t.changed=!0)}},defaults:{enabled:!0,external:null,position:`average`,backgroundColor:`rgba(0,0,0,0.8)`,titleColor:`#fff`,titleFont:{weight:`bold`},titleSpacing:2,titleMarginBottom:6,titleAlign:`left`,bodyColor:`#fff`,bodySpacing:2,bodyFont:{},bodyAlign:`left`,footerColor:`#fff`,footerSpacing:2,footerMarginTop:6,footerFont:{weight:`bold`},footerAlign:`left`,padding:6,caretPadding:2,caretSize:5,cornerRadius:6,boxHeight:(e,t)=>t.bodyFont.size,boxWidth:(e,t)=>t.bodyFont.size,multiKeyBackground:`#fff`,displayColors:!0,boxPadding:0,borderColor:`rgba(0,0,0,0)`,borderWidth:0,animation:{duration:400,easing:`easeOutQuart`},animations:{numbers:{type:`number`,properties:[`x`,`y`,`width`,`height`,`caretX`,`caretY`]},opacity:{easing:`linear`,duration:200}},callbacks:s9},defaultRoutes:{bodyFont:`font`,footerFont:`font`,titleFont:`font`},descriptors:{_scriptable:e=>e!==`filter`&&e!==`itemSort`&&e!==`external`,_indexable:!1,callbacks:{_scriptable:!1,_indexable:!1},animation:{_fallback:!1},animations:{_fallback:`animation`}},additionalOptionScopes:[`interaction`]},u9=(e,t,n,r)=>(typeof t==`string`?(n=e.push(t)-1,r.unshift({index:n,label:t})):isNaN(t)&&(n=null),n),d9=(e,t)=>e===null?null:F3(Math.round(e),0,t),f9=class extends P7{static id=`category`;static defaults={ticks:{callback:K5}};constructor(e){super(e),this._startValue=void 0,this._valueRange=0,this._addedLabels=[]}init(e){let t=this._addedLabels;if(t.length){let e=this.getLabels();for(let{index:n,label:r}of t)e[n]===r&&e.splice(n,1);this._addedLabels=[]}super.init(e)}parse(e,t){if(u3(e))return null;let n=this.getLabels();return t=isFinite(t)&&n[t]===e?t:Dfe(n,e,h3(t,e),this._addedLabels),d9(t,n.length-1)}determineDataLimits(){let{minDefined:e,maxDefined:t}=this.getUserBounds(),{min:n,max:r}=this.getMinMax(!0);this.options.bounds===`ticks`&&(e||(n=0),t||(r=this.getLabels().length-1)),this.min=n,this.max=r}buildTicks(){let e=this.min,t=this.max,n=this.options.offset,r=[],i=this.getLabels();i=e===0&&t===i.length-1?i:i.slice(e,t+1),this._valueRange=Math.max(i.length-+!n,1),this._startValue=this.min-(n?.5:0);for(let n=e;n<=t;n++)r.push({value:n});return r}getLabelForValue(e){return K5.call(this,e)}configure(){super.configure(),this.isHorizontal()||(this._reversePixels=!this._reversePixels)}getPixelForValue(e){return typeof e!=`number`&&(e=this.parse(e)),e===null?NaN:this.getPixelForDecimal((e-this._startValue)/this._valueRange)}getPixelForTick(e){let t=this.ticks;return e<0||e>t.length-1?null:this.getPixelForValue(t[e].value)}getValueForPixel(e){return Math.round(this._startValue+this.getDecimalForPixel(e)*this._valueRange)}getBasePixel(){return this.bottom}},p9=class extends P7{constructor(e){super(e),this.start=void 0,this.end=void 0,this._startValue=void 0,this._endValue=void 0,this._valueRange=0}parse(e,t){return u3(e)||(typeof e==`number`||e instanceof Number)&&!isFinite(+e)?null:+e}handleTickRangeOptions(){let{beginAtZero:e}=this.options,{minDefined:t,maxDefined:n}=this.getUserBounds(),{min:r,max:i}=this,a=e=>r=t?r:e,o=e=>i=n?i:e;if(e){let e=Q6(r),t=Q6(i);e<0&&t<0?o(0):e>0&&t>0&&a(0)}if(r===i){let t=i===0?1:Math.abs(i*.05);o(i+t),e||a(r-t)}this.min=r,this.max=i}getTickLimit(){let{maxTicksLimit:e,stepSize:t}=this.options.ticks,n;return t?(n=Math.ceil(this.max/t)-Math.floor(this.min/t)+1,n>1e3&&(console.warn(`scales.${this.id}.ticks.stepSize: ${t} would result generating up to ${n} ticks. Limiting to 1000.`),n=1e3)):(n=this.computeTickLimit(),e||=11),e&&(n=Math.min(e,n)),n}computeTickLimit(){return 1/0}buildTicks(){let e=this.options,t=e.ticks,n=this.getTickLimit();n=Math.max(2,n);let r=Ofe({maxTicks:n,bounds:e.bounds,min:e.min,max:e.max,precision:t.precision,step:t.stepSize,count:t.count,maxDigits:this._maxDigits(),horizontal:this.isHorizontal(),minRotation:t.minRotation||0,includeBounds:t.includeBounds!==!1},this._range||this);return e.bounds===`ticks`&&O3(r,this,`value`),e.reverse?(r.reverse(),this.start=this.max,this.end=this.min):(this.start=this.min,this.end=this.max),r}configure(){let e=this.ticks,t=this.min,n=this.max;if(super.configure(),this.options.offset&&e.length){let r=(n-t)/Math.max(e.length-1,1)/2;t-=r,n+=r}this._startValue=t,this._endValue=n,this._valueRange=n-t}getLabelForValue(e){return U3(e,this.chart.options.locale,this.options.ticks.format)}},m9=class extends p9{static id=`linear`;static defaults={ticks:{callback:m8.formatters.numeric}};determineDataLimits(){let{min:e,max:t}=this.getMinMax(!0);this.min=p3(e)?e:0,this.max=p3(t)?t:1,this.handleTickRangeOptions()}computeTickLimit(){let e=this.isHorizontal(),t=e?this.width:this.height,n=k3(this.options.ticks.minRotation),r=(e?Math.sin(n):Math.cos(n))||.001,i=this._resolveTickFontOptions(0);return Math.ceil(t/Math.min(40,i.lineHeight/r))}getPixelForValue(e){return e===null?NaN:this.getPixelForDecimal((e-this._startValue)/this._valueRange)}getValueForPixel(e){return this._startValue+this.getDecimalForPixel(e)*this._valueRange}},h9=e=>Math.floor(Z6(e)),g9=(e,t)=>10**(h9(e)+t),class extends P7{static id=`logarithmic`;static defaults={ticks:{callback:m8.formatters.logarithmic,major:{enabled:!0}}};constructor(e){super(e),this.start=void 0,this.end=void 0,this._startValue=void 0,this._valueRange=0}parse(e,t){let n=p9.prototype.parse.apply(this,[e,t]);if(n===0){this._zero=!0;return}return p3(n)&&n>0?n:null}determineDataLimits(){let{min:e,max:t}=this.getMinMax(!0);this.min=p3(e)?Math.max(0,e):null,this.max=p3(t)?Math.max(0,t):null,this.options.beginAtZero&&(this._zero=!0),this._zero&&this.min!==this._suggestedMin&&!p3(this._userMin)&&(this.min=e===g9(this.min,0)?g9(this.min,-1):g9(this.min,0)),this.handleTickRangeOptions()}handleTickRangeOptions(){let{minDefined:e,maxDefined:t}=this.getUserBounds(),n=this.min,r=this.max,i=t=>n=e?n:t,a=e=>r=t?r:e;n===r&&(n<=0?(i(1),a(10)):(i(g9(n,-1)),a(g9(r,1)))),n<=0&&i(g9(r,-1)),r<=0&&a(g9(n,1)),this.min=n,this.max=r}buildTicks(){let e=this.options,t=Afe({min:this._userMin,max:this._userMax},this);return e.bounds===`ticks`&&O3(t,this,`value`),e.reverse?(t.reverse(),this.start=this.max,this.end=this.min):(this.start=this.min,this.end=this.max),t}getLabelForValue(e){return e===void 0?`0`:U3(e,this.chart.options.locale,this.options.ticks.format)}configure(){let e=this.min;super.configure(),this._startValue=Z6(e),this._valueRange=Z6(this.max)-Z6(e)}getPixelForValue(e){return(e===void 0||e===0)&&(e=this.min),e===null||isNaN(e)?NaN:this.getPixelForDecimal(e===this.min?0:(Z6(e)-this._startValue)/this._valueRange)}getValueForPixel(e){let t=this.getDecimalForPixel(e);return 10**(this._startValue+t*this._valueRange)}},class extends p9{static id=`radialLinear`;static defaults={display:!0,animate:!0,position:`chartArea`,angleLines:{display:!0,lineWidth:1,borderDash:[],borderDashOffset:0},grid:{circular:!1},startAngle:0,ticks:{showLabelBackdrop:!0,callback:m8.formatters.numeric},pointLabels:{backdropColor:void 0,backdropPadding:2,display:!0,font:{size:10},callback(e){return e},padding:5,centerPointLabels:!1}};static defaultRoutes={"angleLines.color":`borderColor`,"pointLabels.color":`color`,"ticks.color":`color`};static descriptors={angleLines:{_fallback:`grid`}};constructor(e){super(e),this.xCenter=void 0,this.yCenter=void 0,this.drawingArea=void 0,this._pointLabels=[],this._pointLabelItems=[]}setDimensions(){let e=this._padding=i6(X5(this.options)/2),t=this.width=this.maxWidth-e.width,n=this.height=this.maxHeight-e.height;this.xCenter=Math.floor(this.left+t/2+e.left),this.yCenter=Math.floor(this.top+n/2+e.top),this.drawingArea=Math.floor(Math.min(t,n)/2)}determineDataLimits(){let{min:e,max:t}=this.getMinMax(!1);this.min=p3(e)&&!isNaN(e)?e:0,this.max=p3(t)&&!isNaN(t)?t:0,this.handleTickRangeOptions()}computeTickLimit(){return Math.ceil(this.drawingArea/X5(this.options))}generateTickLabels(e){p9.prototype.generateTickLabels.call(this,e),this._pointLabels=this.getLabels().map((e,t)=>{let n=g3(this.options.pointLabels.callback,[e,t],this);return n||n===0?n:``}).filter((e,t)=>this.chart.getDataVisibility(t))}fit(){let e=this.options;e.display&&e.pointLabels.display?Mfe(this):this.setCenterPoint(0,0,0,0)}setCenterPoint(e,t,n,r){this.xCenter+=Math.floor((e-t)/2),this.yCenter+=Math.floor((n-r)/2),this.drawingArea-=Math.min(this.drawingArea/2,Math.max(e,t,n,r))}getIndexAngle(e){let t=W6/(this._pointLabels.length||1),n=this.options.startAngle||0;return N3(e*t+k3(n))}getDistanceFromCenterForValue(e){if(u3(e))return NaN;let t=this.drawingArea/(this.max-this.min);return this.options.reverse?(this.max-e)*t:(e-this.min)*t}getValueForDistanceFromCenter(e){if(u3(e))return NaN;let t=e/(this.drawingArea/(this.max-this.min));return this.options.reverse?this.max-t:this.min+t}getPointLabelContext(e){let t=this._pointLabels||[];if(e>=0&&e<t.length){let n=t[e];return Ufe(this.getContext(),e,n)}}getPointPosition(e,t,n=0){let r=this.getIndexAngle(e)-J6+n;return{x:Math.cos(r)*t+this.xCenter,y:Math.sin(r)*t+this.yCenter,angle:r}}getPointPositionForValue(e,t){return this.getPointPosition(e,this.getDistanceFromCenterForValue(t))}getBasePosition(e){return this.getPointPositionForValue(e||0,this.getBaseValue())}getPointLabelPosition(e){let{left:t,top:n,right:r,bottom:i}=this._pointLabelItems[e];return{left:t,top:n,right:r,bottom:i}}drawBackground(){let{backgroundColor:e,grid:{circular:t}}=this.options;if(e){let n=this.ctx;n.save(),n.beginPath(),Q5(this,this.getDistanceFromCenterForValue(this._endValue),t,this._pointLabels.length),n.closePath(),n.fillStyle=e,n.fill(),n.restore()}}drawGrid(){let e=this.ctx,t=this.options,{angleLines:n,grid:r,border:i}=t,a=this._pointLabels.length,o,s,c;if(t.pointLabels.display&&Vfe(this,a),r.display&&this.ticks.forEach((e,t)=>{if(t!==0||t===0&&this.min<0){s=this.getDistanceFromCenterForValue(e.value);let n=this.getContext(t),o=r.setContext(n),c=i.setContext(n);Hfe(this,o,s,a,c)}}),n.display){for(e.save(),o=a-1;o>=0;o--){let r=n.setContext(this.getPointLabelContext(o)),{color:i,lineWidth:a}=r;!a||!i||(e.lineWidth=a,e.strokeStyle=i,e.setLineDash(r.borderDash),e.lineDashOffset=r.borderDashOffset,s=this.getDistanceFromCenterForValue(t.reverse?this.min:this.max),c=this.getPointPosition(o,s),e.beginPath(),e.moveTo(this.xCenter,this.yCenter),e.lineTo(c.x,c.y),e.stroke())}e.restore()}}drawBorder(){}drawLabels(){let e=this.ctx,t=this.options,n=t.ticks;if(!n.display)return;let r=this.getIndexAngle(0),i,a;e.save(),e.translate(this.xCenter,this.yCenter),e.rotate(r),e.textAlign=`center`,e.textBaseline=`middle`,this.ticks.forEach((r,o)=>{if(o===0&&this.min>=0&&!t.reverse)return;let s=n.setContext(this.getContext(o)),c=a6(s.font);if(i=this.getDistanceFromCenterForValue(this.ticks[o].value),s.showLabelBackdrop){e.font=c.string,a=e.measureText(r.label).width,e.fillStyle=s.backdropColor;let t=i6(s.backdropPadding);e.fillRect(-a/2-t.left,-i-c.size/2-t.top,a+t.width,c.size+t.height)}e6(e,r.label,0,-i,c,{color:s.color,strokeColor:s.textStrokeColor,strokeWidth:s.textStrokeWidth})}),e.restore()}drawTitle(){}},_9={millisecond:{common:!0,size:1,steps:1e3},second:{common:!0,size:1e3,steps:60},minute:{common:!0,size:6e4,steps:60},hour:{common:!0,size:36e5,steps:24},day:{common:!0,size:864e5,steps:30},week:{common:!1,size:6048e5,steps:4},month:{common:!0,size:2628e6,steps:12},quarter:{common:!1,size:7884e6,steps:4},year:{common:!0,size:3154e7}},v9=Object.keys(_9),y9=class extends P7{static id=`time`;static defaults={bounds:`data`,adapters:{},time:{parser:!1,unit:!1,round:!1,isoWeekday:!1,minUnit:`millisecond`,displayFormats:{}},ticks:{source:`auto`,callback:!1,major:{enabled:!1}}};constructor(e){super(e),this._cache={data:[],labels:[],all:[]},this._unit=`day`,this._majorUnit=void 0,this._offsets={},this._normalized=!1,this._parseOpts=void 0}init(e,t={}){let n=e.time||={},r=this._adapter=new _7._date(e.adapters.date);r.init(t),S3(n.displayFormats,r.formats()),this._parseOpts={parser:n.parser,round:n.round,isoWeekday:n.isoWeekday},super.init(e),this._normalized=t.normalized}parse(e,t){return e===void 0?null:e7(this,e)}beforeLayout(){super.beforeLayout(),this._cache={data:[],labels:[],all:[]}}determineDataLimits(){let e=this.options,t=this._adapter,n=e.time.unit||`day`,{min:r,max:i,minDefined:a,maxDefined:o}=this.getUserBounds();function s(e){!a&&!isNaN(e.min)&&(r=Math.min(r,e.min)),!o&&!isNaN(e.max)&&(i=Math.max(i,e.max))}(!a||!o)&&(s(this._getLabelBounds()),(e.bounds!==`ticks`||e.ticks.source!==`labels`)&&s(this.getMinMax(!1))),r=p3(r)&&!isNaN(r)?r:+t.startOf(Date.now(),n),i=p3(i)&&!isNaN(i)?i:+t.endOf(Date.now(),n)+1,this.min=Math.min(r,i-1),this.max=Math.max(r+1,i)}_getLabelBounds(){let e=this.getLabelTimestamps(),t=1/0,n=-1/0;return e.length&&(t=e[0],n=e[e.length-1]),{min:t,max:n}}buildTicks(){let e=this.options,t=e.time,n=e.ticks,r=n.source===`labels`?this.getLabelTimestamps():this._generate();e.bounds===`ticks`&&r.length&&(this.min=this._userMin||r[0],this.max=this._userMax||r[r.length-1]);let i=this.min,a=this.max,o=Vle(r,i,a);return this._unit=t.unit||(n.autoSkip?t7(t.minUnit,this.min,this.max,this._getLabelCapacity(i)):Wfe(this,o.length,t.minUnit,this.min,this.max)),this._majorUnit=!n.major.enabled||this._unit===`year`?void 0:Gfe(this._unit),this.initOffsets(r),e.reverse&&o.reverse(),r7(this,o,this._majorUnit)}afterAutoSkip(){this.options.offsetAfterAutoskip&&this.initOffsets(this.ticks.map(e=>+e.value))}initOffsets(e=[]){let t=0,n=0,r,i;this.options.offset&&e.length&&(r=this.getDecimalForValue(e[0]),t=e.length===1?1-r:(this.getDecimalForValue(e[1])-r)/2,i=this.getDecimalForValue(e[e.length-1]),n=e.length===1?i:(i-this.getDecimalForValue(e[e.length-2]))/2);let a=e.length<3?.5:.25;t=F3(t,0,a),n=F3(n,0,a),this._offsets={start:t,end:n,factor:1/(t+1+n)}}_generate(){let e=this._adapter,t=this.min,n=this.max,r=this.options,i=r.time,a=i.unit||t7(i.minUnit,t,n,this._getLabelCapacity(t)),o=h3(r.ticks.stepSize,1),s=a===`week`&&i.isoWeekday,c=D3(s)||s===!0,l={},u=t,d,f;if(c&&(u=+e.startOf(u,`isoWeek`,s)),u=+e.startOf(u,c?`day`:a),e.diff(n,t,a)>1e5*o)throw Error(t+` and `+n+` are too far apart with stepSize of `+o+` `+a);let p=r.ticks.source===`data`&&this.getDataTimestamps();for(d=u,f=0;d<n;d=+e.add(d,o,a),f++)n7(l,d,p);return(d===n||r.bounds===`ticks`||f===1)&&n7(l,d,p),Object.keys(l).sort($5).map(e=>+e)}getLabelForValue(e){let t=this._adapter,n=this.options.time;return n.tooltipFormat?t.format(e,n.tooltipFormat):t.format(e,n.displayFormats.datetime)}format(e,t){let n=this.options.time.displayFormats,r=this._unit,i=t||n[r];return this._adapter.format(e,i)}_tickFormatFunction(e,t,n,r){let i=this.options,a=i.ticks.callback;if(a)return g3(a,[e,t,n],this);let o=i.time.displayFormats,s=this._unit,c=this._majorUnit,l=s&&o[s],u=c&&o[c],d=n[t],f=c&&u&&d&&d.major;return this._adapter.format(e,r||(f?u:l))}generateTickLabels(e){let t,n,r;for(t=0,n=e.length;t<n;++t)r=e[t],r.label=this._tickFormatFunction(r.value,t,e)}getDecimalForValue(e){return e===null?NaN:(e-this.min)/(this.max-this.min)}getPixelForValue(e){let t=this._offsets,n=this.getDecimalForValue(e);return this.getPixelForDecimal((t.start+n)*t.factor)}getValueForPixel(e){let t=this._offsets,n=this.getDecimalForPixel(e)/t.factor-t.end;return this.min+n*(this.max-this.min)}_getLabelSize(e){let t=this.options.ticks,n=this.ctx.measureText(e).width,r=k3(this.isHorizontal()?t.maxRotation:t.minRotation),i=Math.cos(r),a=Math.sin(r),o=this._resolveTickFontOptions(0).size;return{w:n*i+o*a,h:n*a+o*i}}_getLabelCapacity(e){let t=this.options.time,n=t.displayFormats,r=n[t.unit]||n.millisecond,i=this._tickFormatFunction(e,0,r7(this,[e],this._majorUnit),r),a=this._getLabelSize(i),o=Math.floor(this.isHorizontal()?this.width/a.w:this.height/a.h)-1;return o>0?o:1}getDataTimestamps(){let e=this._cache.data||[],t,n;if(e.length)return e;let r=this.getMatchingVisibleMetas();if(this._normalized&&r.length)return this._cache.data=r[0].controller.getAllParsedValues(this);for(t=0,n=r.length;t<n;++t)e=e.concat(r[t].controller.getAllParsedValues(this));return this._cache.data=this.normalize(e)}getLabelTimestamps(){let e=this._cache.labels||[],t,n;if(e.length)return e;let r=this.getLabels();for(t=0,n=r.length;t<n;++t)e.push(e7(this,r[t]));return this._cache.labels=this._normalized?e:this.normalize(e)}normalize(e){return Ule(e.sort($5))}},class extends y9{static id=`timeseries`;static defaults=y9.defaults;constructor(e){super(e),this._table=[],this._minPos=void 0,this._tableRange=void 0}initOffsets(){let e=this._getTimestampsForTable(),t=this._table=this.buildLookupTable(e);this._minPos=i7(t,this.min),this._tableRange=i7(t,this.max)-this._minPos,super.initOffsets(e)}buildLookupTable(e){let{min:t,max:n}=this,r=[],i=[],a,o,s,c,l;for(a=0,o=e.length;a<o;++a)c=e[a],c>=t&&c<=n&&r.push(c);if(r.length<2)return[{time:t,pos:0},{time:n,pos:1}];for(a=0,o=r.length;a<o;++a)l=r[a+1],s=r[a-1],c=r[a],Math.round((l+s)/2)!==c&&i.push({time:c,pos:a/(o-1)});return i}_generate(){let e=this.min,t=this.max,n=super.getDataTimestamps();return(!n.includes(e)||!n.length)&&n.splice(0,0,e),(!n.includes(t)||n.length===1)&&n.push(t),n.sort((e,t)=>e-t)}_getTimestampsForTable(){let e=this._cache.all||[];if(e.length)return e;let t=this.getDataTimestamps(),n=this.getLabelTimestamps();return e=t.length&&n.length?this.normalize(t.concat(n)):t.length?t:n,e=this._cache.all=e,e}getDecimalForValue(e){return(i7(this._table,e)-this._minPos)/this._tableRange}getValueForPixel(e){let t=this._offsets,n=this.getDecimalForPixel(e)/t.factor-t.end;return i7(this._table,n*this._tableRange+this._minPos,!0)}}})),x9,S9=t((()=>{b9(),g4(),x9={datetime:h4.DATETIME_MED_WITH_SECONDS,millisecond:`h:mm:ss.SSS a`,second:h4.TIME_WITH_SECONDS,minute:h4.TIME_SIMPLE,hour:{hour:`numeric`},day:{day:`numeric`,month:`short`},week:`DD`,month:{month:`short`,year:`numeric`},quarter:`'Q'q - yyyy`,year:{year:`numeric`}},_7._date.override({_id:`luxon`,_create:function(e){return h4.fromMillis(e,this.options)},init(e){this.options.locale||(this.options.locale=e.locale)},formats:function(){return x9},parse:function(e,t){let n=this.options,r=typeof e;return e===null||r===`undefined`?null:(r===`number`?e=this._create(e):r===`string`?e=typeof t==`string`?h4.fromFormat(e,t,n):h4.fromISO(e,n):e instanceof Date?e=h4.fromJSDate(e,n):r===`object`&&!(e instanceof h4)&&(e=h4.fromObject(e,n)),e.isValid?e.valueOf():null)},format:function(e,t){let n=this._create(e);return typeof t==`string`?n.toFormat(t):n.toLocaleString(t)},add:function(e,t,n){let r={};return r[n]=t,this._create(e).plus(r).valueOf()},diff:function(e,t,n){return this._create(e).diff(this._create(t)).as(n).valueOf()},startOf:function(e,t,n){if(t===`isoWeek`){n=Math.trunc(Math.min(Math.max(0,n),6));let t=this._create(e);return t.minus({days:(t.weekday-n+7)%7}).startOf(`day`).valueOf()}return t?this._create(e).startOf(t).valueOf():e},endOf:function(e,t){return this._create(e).endOf(t).valueOf()}})}));function C9(e){return _t(e)?vt(e):e}function qfe(e){return _t(arguments.length>1&&arguments[1]!==void 0?arguments[1]:e)?new Proxy(e,{}):e}function Jfe(e,t){let n=e.options;n&&t&&Object.assign(n,t)}function w9(e,t){e.labels=t}function T9(e,t,n){let r=[];e.datasets=t.map(t=>{let i=e.datasets.find(e=>e[n]===t[n]);return!i||!t.data||r.includes(i)?{...t}:(r.push(i),Object.assign(i,t),i)})}function Yfe(e,t){let n={labels:[],datasets:[]};return w9(n,e.labels),T9(n,e.datasets,t),n}function Xfe(e,t){return J7.register(t),j({props:E9,setup(t,n){let{expose:r}=n,i=xt(null),a=xt(null);Vn(()=>a.value?.chart??null,e=>{i.value=e},{flush:`sync`}),r({chart:i});let o=e=>{a.value=e};return()=>N(A9,k9({ref:o},{type:e,...t}))}})}var E9,D9,O9,k9,A9,j9,M9=t((()=>{b9(),I(),E9={data:{type:Object,required:!0},options:{type:Object,default:()=>({})},plugins:{type:Array,default:()=>[]},datasetIdKey:{type:String,default:`label`},updateMode:{type:String,default:void 0}},D9={ariaLabel:{type:String},ariaDescribedby:{type:String}},O9={type:{type:String,required:!0},destroyDelay:{type:Number,default:0},...E9,...D9},k9=(e,t)=>Object.assign(e,t),A9=j({props:O9,setup(e,t){let{expose:n,slots:r}=t,i=O(null),a=xt(null);n({chart:a});let o=()=>{if(!i.value)return;let{type:t,data:n,options:r,plugins:o,datasetIdKey:s}=e,c=qfe(Yfe(n,s),n);a.value=new J7(i.value,{type:t,data:c,options:{...r},plugins:o})},s=()=>{let t=vt(a.value);t&&(e.destroyDelay>0?setTimeout(()=>{t.destroy(),a.value=null},e.destroyDelay):(t.destroy(),a.value=null))},c=t=>{t.update(e.updateMode)};return aa(o),la(s),Vn([()=>e.options,()=>e.data],(t,n)=>{let[r,i]=t,[o,s]=n,l=vt(a.value);if(!l)return;let u=!1;if(r){let e=C9(r),t=C9(o);e&&e!==t&&(Jfe(l,e),u=!0)}if(i){let t=C9(i.labels),n=C9(s.labels),r=C9(i.datasets),a=C9(s.datasets);t!==n&&(w9(l.config.data,t),u=!0),r&&r!==a&&(T9(l.config.data,r,e.datasetIdKey),u=!0)}u&&kn(()=>{c(l)})},{deep:!0}),()=>N(`canvas`,{role:`img`,"aria-label":e.ariaLabel,"aria-describedby":e.ariaDescribedby,ref:i},[N(`p`,{},[r.default?r.default():``])])}}),j9=Xfe(`line`,h7)})),Zfe=n({default:()=>N9}),N9,Qfe=t((()=>{I(),eQ(),Bl(),b4(),b9(),S9(),M9(),g4(),N4(),N9={__name:`PricesGraph`,setup(e){J7.register(f9,m9,Z7,X7,a9,l9,r9,$7,y9);let{prices:t}=wl(y4()),{tz:n,now:r}=M4(),i=O(r()),a=F(()=>h4.fromFormat(t.value.update_ts,`yyyy-MM-dd'T'HH:mm:ssZZZ`).setZone(n.value)),o=F(()=>({responsive:!0,aspectRatio:4,interaction:{intersect:!1,mode:`index`},elements:{point:{radius:1}},plugins:{legend:{position:`bottom`},tooltip:{enabled:!0,callbacks:{title:e=>h4.fromMillis(e[0].parsed.x).setZone(n.value).toFormat(`ccc dd MMM HH:mm`),label:e=>`€ ${e.parsed.y.toFixed(6)} / kWh`}}},scales:{x:{type:`time`,adapters:{date:{zone:n.value}},time:{unit:`hour`,displayFormats:{hour:`HH:mm`}},grid:{color:`#303030`,borderColor:`grey`,tickColor:`grey`}},y:{title:{text:`Prices (€ / kWh)`},ticks:{callback:(e,t,n)=>`€ ${e.toFixed(3)}`}}}})),s=F(()=>{let e=[],r=Object.entries(t.value.prices);r.sort((e,t)=>e[0]-t[0]);let a=0;for(let e=0;e<r.length&&h4.fromFormat(r[e][0],`yyyy-MM-dd'T'HH:mm:ssZZZ`).setZone(n.value)<=i.value;e++)a=e;let o=null,s=null,c=null;for(let t=a;t<r.length;t++){let[i,a]=r[t],l=h4.fromFormat(i,`yyyy-MM-dd'T'HH:mm:ssZZZ`).setZone(n.value);o!==null&&e.push({x:l.minus({milliseconds:1}),y:o}),e.push({x:l,y:a}),s!==null&&(c=l.diff(s,`minutes`)),o=a,s=l}return c!==null&&e.push({x:s.plus(c),y:o}),e}),c=F(()=>{let e=Object.values(t.value.prices);return e.length===0?0:e.reduce((e,t)=>e+t,0)/e.length}),l=F(()=>{let e=Math.min(s.value.reduce((e,t)=>Math.min(e,t.y),1/0)),t=Math.min(s.value.reduce((e,t)=>Math.max(e,t.y),-1/0)),n=c.value;return{datasets:[{label:`Prices (€ / kWh)`,data:s.value,fill:{target:`origin`},tension:0,segment:{borderColor:e=>e.p1.parsed.y>=n?`rgb(255, 160, 50)`:`rgb(75, 192, 75)`,backgroundColor:e=>{let{ctx:t,chartArea:r}=e.chart;if(!r)return`transparent`;let[i,a,o]=e.p1.parsed.y>=n?[255,160,50]:[75,192,75],s=t.createLinearGradient(0,r.top,0,r.bottom);return s.addColorStop(0,`rgba(${i}, ${a}, ${o}, 0.4)`),s.addColorStop(1,`rgba(${i}, ${a}, ${o}, 0.0)`),s}}},{label:`Now`,data:[{x:i.value.minus({milliseconds:1}),y:e},{x:i.value,y:t}],borderColor:`rgb(226, 99, 183)`,tension:0}]}}),u=O(null);return aa(()=>{u.value=setInterval(()=>{i.value=r()},10*1e3)}),ca(()=>{clearInterval(u.value),u.value=null}),(e,n)=>(Zr(),ni(k(bR),{"arrow-placement":`right`},{default:A(()=>[P(k(wR),null,{header:A(()=>[P(k(AZ),{prefix:`bar`},{default:A(()=>[...n[0]||=[oi(` Exchange Prices `,-1)]]),_:1})]),default:A(()=>[n[1]||=oi(` Current price: `,-1),P(k(FZ),{type:`success`},{default:A(()=>[oi(`€ `+De(k(t).current_price.toFixed(3))+` per kWh`,1)]),_:1}),oi(`. Prices updated at `+De(a.value.toLocaleString(k(h4).DATETIME_MED))+` `,1),P(k(j9),{data:l.value,options:o.value},null,8,[`data`,`options`])]),_:1})]),_:1}))}}})),$fe=n({default:()=>P9}),P9,epe=t((()=>{I(),eQ(),Bl(),b4(),b9(),S9(),M9(),g4(),N4(),P9={__name:`ScheduleGraph`,setup(e){J7.register(f9,m9,Z7,X7,a9,l9,r9,y9);let t=[`rgb(99, 179, 237)`,`rgb(251, 146, 60)`,`rgb(251, 182, 206)`,`rgb(251, 211, 141)`,`rgb(183, 148, 244)`],n=y4(),{schedule:r}=wl(n),{tz:i,now:a}=M4(),o=O(a()),s=F(()=>n.schedule_ts?h4.fromISO(n.schedule_ts).setZone(i.value):null),c=F(()=>({responsive:!0,aspectRatio:4,interaction:{intersect:!1,mode:`index`},elements:{point:{radius:1}},plugins:{legend:{position:`bottom`},tooltip:{enabled:!0,callbacks:{title:e=>h4.fromMillis(e[0].parsed.x).setZone(i.value).toFormat(`ccc dd MMM HH:mm`),label:e=>{if(e.dataset.label===`Now`)return null;if(e.dataset.yAxisID===`y_cost`)return`Cumulative cost: € ${e.parsed.y.toFixed(4)}`;let t=e.parsed.y;return`${e.dataset.label}: ${(t/1e3).toFixed(3)} kWh`}}}},scales:{x:{type:`time`,adapters:{date:{zone:i.value}},time:{unit:`hour`,displayFormats:{hour:`HH:mm`}},grid:{color:`#303030`,borderColor:`grey`,tickColor:`grey`}},y:{position:`left`,title:{display:!0,text:`State of Charge (Wh)`},ticks:{callback:e=>`${(e/1e3).toFixed(1)} kWh`}},y_cost:{position:`right`,title:{display:!0,text:`Cumulative Cost (€)`},ticks:{callback:e=>`€ ${e.toFixed(2)}`},grid:{color:e=>e.tick.value===0?`#606060`:`transparent`}}}})),l=F(()=>{if(!r.value||r.value.length===0)return{datasets:[]};let e=r.value,n=Object.keys(e[0].start_charge),a=n.map((n,r)=>{let a=e.map(e=>({x:h4.fromISO(e.start_ts).setZone(i.value),y:e.start_charge[n]})),o=e[e.length-1];return a.push({x:h4.fromISO(o.end_ts).setZone(i.value),y:o.end_charge[n]}),{label:n,data:a,yAxisID:`y`,borderColor:t[r%t.length],tension:0}}),s=[],c=0;for(let t of e)s.push({x:h4.fromISO(t.start_ts).setZone(i.value),y:c}),c+=t.cost;let l=e[e.length-1];s.push({x:h4.fromISO(l.end_ts).setZone(i.value),y:c});let u={label:`Cumulative cost`,data:s,yAxisID:`y_cost`,borderColor:`rgb(99, 226, 183)`,tension:0,pointRadius:0},d=e.flatMap(e=>n.flatMap(t=>[e.start_charge[t],e.end_charge[t]])),f=Math.min(...d),p=Math.max(...d),m={label:`Now`,data:[{x:o.value.minus({milliseconds:1}),y:f},{x:o.value,y:p}],yAxisID:`y`,borderColor:`rgb(226, 99, 183)`,tension:0,pointRadius:0};return{datasets:[...a,u,m]}}),u=O(null);return aa(()=>{u.value=setInterval(()=>{o.value=a()},10*1e3)}),ca(()=>{clearInterval(u.value),u.value=null}),(e,t)=>(Zr(),ni(k(bR),{"arrow-placement":`right`},{default:A(()=>[P(k(wR),null,{header:A(()=>[P(k(AZ),{prefix:`bar`},{default:A(()=>[...t[0]||=[oi(` Optimal schedule `,-1)]]),_:1})]),default:A(()=>[s.value?(Zr(),ti(Va,{key:0},[oi(`Schedule computed at `+De(s.value.toLocaleString(k(h4).DATETIME_MED)),1)],64)):ci(``,!0),P(k(j9),{data:l.value,options:c.value},null,8,[`data`,`options`])]),_:1})]),_:1}))}}})),tpe=n({default:()=>F9}),F9,npe=t((()=>{I(),Bl(),b4(),D4(),fle(),g4(),N4(),T4(),F9={__name:`Main`,setup(e){let t=sr(()=>w4(()=>Promise.resolve().then(()=>(Qfe(),Zfe)),void 0)),n=sr(()=>w4(()=>Promise.resolve().then(()=>(epe(),$fe)),void 0)),r=y4(),i=E4(),{tz:a}=M4(),{general:o}=wl(i),s=O();return aa(async()=>{await r.fetch_status(),await i.fetch_config(),await i.fetch_subsystem_types();let e=o.value.loop_delay;e===void 0&&(e=8),console.log(`status refresh loop at ${e} seconds`),s.value=setInterval(async()=>{console.log(`periodic status fetch (every ${e} seconds)`),await r.fetch_status()},e*1e3)}),ca(()=>{clearInterval(s.value),s.value=null}),(e,i)=>(Zr(),ti(Va,null,[i[0]||=M(`h2`,null,`Main Page`,-1),M(`p`,null,[k(r).running?(Zr(),ti(Va,{key:0},[oi(`Currently running in mode `+De(k(r).mode)+` (`+De(k(r).mode_name)+`)`,1)],64)):(Zr(),ti(Va,{key:1},[oi(`Not running`)],64)),oi(` as of `+De(k(r).update_time.setZone(k(a)).toLocaleString(k(h4).TIME_WITH_SECONDS))+`. `,1)]),k(r).schedule?.length?(Zr(),ni(k(n),{key:0})):ci(``,!0),k(r).prices?.prices?(Zr(),ni(k(t),{key:1})):ci(``,!0),P(j4)],64))}}})),rpe=n({default:()=>I9}),I9,ipe=t((()=>{I(),eQ(),D4(),Bl(),I9={__name:`EnergyMeterConfig`,setup(e){let t=E4(),{energy_meter:n}=wl(t),r=async()=>{await t.sync_energy_meter_config(n.value)},i=F(()=>{let e=t.subsystem_types?.energy_meters;return e?Object.entries(e).map(([e,t])=>({value:e,label:t})):[]});return aa(async()=>{await t.fetch_config()}),(e,t)=>(Zr(),ti(Va,null,[t[7]||=M(`h2`,null,`Energy Meter Config`,-1),P(k(ZH)),t[8]||=M(`p`,null,` Configuration for the grid connection energy meter. `,-1),P(k($K),null,{default:A(()=>[P(k(PJ),{cols:`4 s:4 m:8 l:16 xl:16`,"x-gap":`10`,responsive:`screen`},{default:A(()=>[P(k(SJ),{span:`4`,label:`Type`,path:`type`},{default:A(()=>[P(k(KR),{value:k(n).type,"onUpdate:value":t[0]||=e=>k(n).type=e,placeholder:`Select type`,options:i.value},null,8,[`value`,`options`])]),_:1}),P(k(SJ),{span:`3`,label:`Host`,path:`host`},{default:A(()=>[P(k(Cj),{value:k(n).host,"onUpdate:value":t[1]||=e=>k(n).host=e,placeholder:`192.168...`},null,8,[`value`])]),_:1}),P(k(SJ),{span:`1`,label:`Port`,path:`port`},{default:A(()=>[P(k(fY),{value:k(n).port,"onUpdate:value":t[2]||=e=>k(n).port=e,min:`1`,max:`65535`,"show-button":!1},null,8,[`value`])]),_:1}),P(k(SJ),{span:`2`,label:`Fuse max current`,path:`max_fuse_current`},{default:A(()=>[P(k(fY),{value:k(n).max_fuse_current,"onUpdate:value":t[3]||=e=>k(n).max_fuse_current=e,min:`1`,max:`150`,"show-button":!1},{suffix:A(()=>[...t[4]||=[oi(`A`,-1)]]),_:1},8,[`value`])]),_:1})]),_:1}),P(k(IU),{justify:`space-between`},{default:A(()=>[t[6]||=M(`div`,null,`\xA0`,-1),P(k(jM),{onClick:r,type:`primary`},{default:A(()=>[...t[5]||=[oi(`Save`,-1)]]),_:1})]),_:1})]),_:1})],64))}}})),L9,ape=t((()=>{I(),eQ(),Cu(),D4(),L9={__name:`SolarInverterConfigItem`,props:vr([`idx`],{name:{},nameModifiers:{},type:{},typeModifiers:{},enable:{},enableModifiers:{},host:{},hostModifiers:{},port:{},portModifiers:{},modbus_device_id:{},modbus_device_idModifiers:{},connected_phase:{},connected_phaseModifiers:{}}),emits:vr([`removed`],[`update:name`,`update:type`,`update:enable`,`update:host`,`update:port`,`update:modbus_device_id`,`update:connected_phase`]),setup(e,{emit:t}){let n=t,r=E4(),i=e,a=Pr(e,`name`),o=Pr(e,`type`),s=Pr(e,`enable`),c=Pr(e,`host`),l=Pr(e,`port`),u=Pr(e,`modbus_device_id`),d=Pr(e,`connected_phase`),f=F(()=>{let e=r.subsystem_types?.solar_inverters;return e?Object.entries(e).map(([e,t])=>({value:e,label:t})):[]}),p=[{label:`L1`,value:`L1`},{label:`L2`,value:`L2`},{label:`L3`,value:`L3`},{label:`All`,value:`ALL`}];return(e,t)=>(Zr(),ni(k($K),{inline:``,size:`medium`,"label-placement":`top`},{default:A(()=>[P(k(PJ),{cols:`4 s:4 m:8 l:20 xl:20`,"x-gap":`10`,responsive:`screen`},{default:A(()=>[P(k(SJ),{span:`4`,label:`Name`,path:`name`},{default:A(()=>[P(k(Cj),{value:a.value,"onUpdate:value":t[0]||=e=>a.value=e,placeholder:`inverter name`},null,8,[`value`])]),_:1}),P(k(SJ),{span:`4`,label:`Type`,path:`type`},{default:A(()=>[P(k(KR),{value:o.value,"onUpdate:value":t[1]||=e=>o.value=e,placeholder:`Select type`,options:f.value},null,8,[`value`,`options`])]),_:1}),P(k(SJ),{span:`3`,label:`Host`,path:`host`},{default:A(()=>[P(k(Cj),{value:c.value,"onUpdate:value":t[2]||=e=>c.value=e,placeholder:`192.168...`},null,8,[`value`])]),_:1}),P(k(SJ),{span:`1`,label:`Port`,path:`port`},{default:A(()=>[P(k(fY),{value:l.value,"onUpdate:value":t[3]||=e=>l.value=e,min:`1`,max:`65535`,"show-button":!1},null,8,[`value`])]),_:1}),P(k(SJ),{span:`3`,label:`Modbus Device ID`,path:`device_id`},{default:A(()=>[P(k(fY),{value:u.value,"onUpdate:value":t[4]||=e=>u.value=e,min:`1`,max:`65535`,"show-button":!1},null,8,[`value`])]),_:1}),P(k(SJ),{span:`3`,label:`Phase`,path:`connected_phase`},{default:A(()=>[P(k(KR),{value:d.value,"onUpdate:value":t[5]||=e=>d.value=e,placeholder:`Select phase`,options:p},null,8,[`value`])]),_:1}),P(k(SJ),{label:s.value?`Enabled`:`Disabled`,path:`enable`},{default:A(()=>[P(k(lZ),{value:s.value,"onUpdate:value":t[6]||=e=>s.value=e},null,8,[`value`])]),_:1},8,[`label`]),P(k(SJ),null,{default:A(()=>[P(k(jM),{onClick:t[7]||=e=>n(`removed`,i.idx),type:`error`,secondary:``,strong:``,circle:``},{icon:A(()=>[P(k(Bz),{size:`28`},{default:A(()=>[P(k(tu))]),_:1})]),_:1})]),_:1}),P(k(SJ),{span:`4 s:4 m:0 l:0 xl:0`},{default:A(()=>[P(k(ZH))]),_:1})]),_:1})]),_:1}))}}})),ope=n({default:()=>R9}),R9,spe=t((()=>{I(),eQ(),D4(),Bl(),Cu(),ape(),R9={__name:`SolarInverterConfig`,setup(e){let t=E4(),{solar_inverters:n}=wl(t),r=async e=>{console.log(`removing config ${e}`),n.value.splice(e,1)},i=async()=>{console.log(`appending a new config`),n.value.push({name:``,host:``,port:502,modbus_device_id:3,connected_phase:`ALL`,enable:!0})},a=async()=>{await t.sync_solar_inverters_config(n.value)};return aa(async()=>{await t.fetch_config(),await t.fetch_subsystem_types()}),(e,t)=>(Zr(),ti(Va,null,[t[1]||=M(`h2`,null,`Solar Inverter Config`,-1),P(k(ZH)),(Zr(!0),ti(Va,null,mr(k(n),(e,t)=>(Zr(),ni(L9,{key:t,idx:t,name:e.name,"onUpdate:name":t=>e.name=t,type:e.type,"onUpdate:type":t=>e.type=t,enable:e.enable,"onUpdate:enable":t=>e.enable=t,host:e.host,"onUpdate:host":t=>e.host=t,port:e.port,"onUpdate:port":t=>e.port=t,modbus_device_id:e.modbus_device_id,"onUpdate:modbus_device_id":t=>e.modbus_device_id=t,connected_phase:e.connected_phase,"onUpdate:connected_phase":t=>e.connected_phase=t,onRemoved:r},null,8,[`idx`,`name`,`onUpdate:name`,`type`,`onUpdate:type`,`enable`,`onUpdate:enable`,`host`,`onUpdate:host`,`port`,`onUpdate:port`,`modbus_device_id`,`onUpdate:modbus_device_id`,`connected_phase`,`onUpdate:connected_phase`]))),128)),P(k(IU),{justify:`space-between`},{default:A(()=>[P(k(jM),{onClick:i,type:`primary`,secondary:``,strong:``,circle:``},{icon:A(()=>[P(k(Bz),{size:`28`},{default:A(()=>[P(k(Hl))]),_:1})]),_:1}),P(k(jM),{onClick:a,type:`primary`},{default:A(()=>[...t[0]||=[oi(`Save`,-1)]]),_:1})]),_:1})],64))}}})),z9,cpe=t((()=>{I(),eQ(),Cu(),D4(),z9={__name:`BatteryInverterConfigItem`,props:vr([`idx`],{name:{},nameModifiers:{},type:{},typeModifiers:{},enable:{},enableModifiers:{},host:{},hostModifiers:{},port:{},portModifiers:{},battery_capacity:{},battery_capacityModifiers:{},battery_charge_limit:{},battery_charge_limitModifiers:{},battery_discharge_limit:{},battery_discharge_limitModifiers:{},battery_charge_max_pct:{},battery_charge_max_pctModifiers:{},battery_charge_min_pct:{},battery_charge_min_pctModifiers:{},connected_phase:{},connected_phaseModifiers:{}}),emits:vr([`removed`],[`update:name`,`update:type`,`update:enable`,`update:host`,`update:port`,`update:battery_capacity`,`update:battery_charge_limit`,`update:battery_discharge_limit`,`update:battery_charge_max_pct`,`update:battery_charge_min_pct`,`update:connected_phase`]),setup(e,{emit:t}){let n=t,r=E4(),i=e,a=Pr(e,`name`),o=Pr(e,`type`),s=Pr(e,`enable`),c=Pr(e,`host`),l=Pr(e,`port`),u=Pr(e,`battery_capacity`),d=Pr(e,`battery_charge_limit`),f=Pr(e,`battery_discharge_limit`),p=Pr(e,`battery_charge_max_pct`),m=Pr(e,`battery_charge_min_pct`),h=Pr(e,`connected_phase`),g=F(()=>{let e=r.subsystem_types?.battery_inverters;return e?Object.entries(e).map(([e,t])=>({value:e,label:t})):[]}),_=[{label:`L1`,value:`L1`},{label:`L2`,value:`L2`},{label:`L3`,value:`L3`},{label:`All`,value:`ALL`}];return(e,t)=>(Zr(),ni(k($K),{inline:``,size:`medium`,"label-placement":`top`},{default:A(()=>[P(k(PJ),{cols:`4 s:4 m:8 l:26 xl:26`,"x-gap":`10`,responsive:`screen`},{default:A(()=>[P(k(SJ),{span:`5`,label:`Name`,path:`name`},{default:A(()=>[P(k(Cj),{value:a.value,"onUpdate:value":t[0]||=e=>a.value=e,placeholder:`inverter name`},null,8,[`value`])]),_:1}),P(k(SJ),{span:`4`,label:`Type`,path:`type`},{default:A(()=>[P(k(KR),{value:o.value,"onUpdate:value":t[1]||=e=>o.value=e,placeholder:`Select type`,options:g.value},null,8,[`value`,`options`])]),_:1}),P(k(SJ),{span:`2`,label:`Host`,path:`host`},{default:A(()=>[P(k(Cj),{value:c.value,"onUpdate:value":t[2]||=e=>c.value=e,placeholder:`192.168...`},null,8,[`value`])]),_:1}),P(k(SJ),{span:`1`,label:`Port`,path:`port`},{default:A(()=>[P(k(fY),{value:l.value,"onUpdate:value":t[3]||=e=>l.value=e,min:`1`,max:`65535`,"show-button":!1},null,8,[`value`])]),_:1}),P(k(SJ),{span:`2`,label:`Capacity`,path:`battery_capacity`},{default:A(()=>[P(k(fY),{value:u.value,"onUpdate:value":t[4]||=e=>u.value=e,min:`0`,max:`100000`,"show-button":!1},{suffix:A(()=>[...t[12]||=[oi(`Wh`,-1)]]),_:1},8,[`value`])]),_:1}),P(k(SJ),{span:`2`,label:`Charge limit`,path:`battery_charge_limit`},{default:A(()=>[P(k(fY),{value:d.value,"onUpdate:value":t[5]||=e=>d.value=e,min:`0`,max:`100000`,"show-button":!1},{suffix:A(()=>[...t[13]||=[oi(`W`,-1)]]),_:1},8,[`value`])]),_:1}),P(k(SJ),{span:`2`,label:`Discharge limit`,path:`battery_discharge_limit`},{default:A(()=>[P(k(fY),{value:f.value,"onUpdate:value":t[6]||=e=>f.value=e,min:`0`,max:`100000`,"show-button":!1},{suffix:A(()=>[...t[14]||=[oi(`W`,-1)]]),_:1},8,[`value`])]),_:1}),P(k(SJ),{span:`2`,label:`Max charge`,path:`battery_charge_max_pct`},{default:A(()=>[P(k(fY),{value:p.value,"onUpdate:value":t[7]||=e=>p.value=e,min:`0`,max:`100`,"show-button":!1},{suffix:A(()=>[...t[15]||=[oi(`%`,-1)]]),_:1},8,[`value`])]),_:1}),P(k(SJ),{span:`2`,label:`Min charge`,path:`battery_charge_min_pct`},{default:A(()=>[P(k(fY),{value:m.value,"onUpdate:value":t[8]||=e=>m.value=e,min:`0`,max:`100`,"show-button":!1},{suffix:A(()=>[...t[16]||=[oi(`%`,-1)]]),_:1},8,[`value`])]),_:1}),P(k(SJ),{span:`2`,label:`Phase`,path:`connected_phase`},{default:A(()=>[P(k(KR),{value:h.value,"onUpdate:value":t[9]||=e=>h.value=e,placeholder:`Select phase`,options:_},null,8,[`value`])]),_:1}),P(k(SJ),{label:s.value?`Enabled`:`Disabled`,path:`enable`},{default:A(()=>[P(k(lZ),{value:s.value,"onUpdate:value":t[10]||=e=>s.value=e},null,8,[`value`])]),_:1},8,[`label`]),P(k(SJ),null,{default:A(()=>[P(k(jM),{onClick:t[11]||=e=>n(`removed`,i.idx),type:`error`,secondary:``,strong:``,circle:``},{icon:A(()=>[P(k(Bz),{size:`28`},{default:A(()=>[P(k(tu))]),_:1})]),_:1})]),_:1}),P(k(SJ),{span:`4 s:4 m:0 l:0 xl:0`},{default:A(()=>[P(k(ZH))]),_:1})]),_:1})]),_:1}))}}})),lpe=n({default:()=>B9}),B9,upe=t((()=>{I(),eQ(),D4(),Bl(),Cu(),cpe(),B9={__name:`BatteryInverterConfig`,setup(e){let t=E4(),{battery_inverters:n}=wl(t),r=async e=>{console.log(`removing config ${e}`),n.value.splice(e,1)},i=async()=>{console.log(`appending a new config`),n.value.push({name:``,host:``,port:502,battery_capacity:0,battery_charge_limit:0,battery_discharge_limit:0,battery_charge_max_pct:95,battery_charge_min_pct:10,connected_phase:`ALL`,enable:!0})},a=async()=>{await t.sync_battery_inverters_config(n.value)};return aa(async()=>{await t.fetch_config(),await t.fetch_subsystem_types()}),(e,t)=>(Zr(),ti(Va,null,[t[1]||=M(`h2`,null,`Battery Inverter Config`,-1),P(k(ZH)),(Zr(!0),ti(Va,null,mr(k(n),(e,t)=>(Zr(),ni(z9,{key:t,idx:t,name:e.name,"onUpdate:name":t=>e.name=t,type:e.type,"onUpdate:type":t=>e.type=t,enable:e.enable,"onUpdate:enable":t=>e.enable=t,host:e.host,"onUpdate:host":t=>e.host=t,port:e.port,"onUpdate:port":t=>e.port=t,battery_capacity:e.battery_capacity,"onUpdate:battery_capacity":t=>e.battery_capacity=t,battery_charge_limit:e.battery_charge_limit,"onUpdate:battery_charge_limit":t=>e.battery_charge_limit=t,battery_discharge_limit:e.battery_discharge_limit,"onUpdate:battery_discharge_limit":t=>e.battery_discharge_limit=t,battery_charge_max_pct:e.battery_charge_max_pct,"onUpdate:battery_charge_max_pct":t=>e.battery_charge_max_pct=t,battery_charge_min_pct:e.battery_charge_min_pct,"onUpdate:battery_charge_min_pct":t=>e.battery_charge_min_pct=t,connected_phase:e.connected_phase,"onUpdate:connected_phase":t=>e.connected_phase=t,onRemoved:r},null,8,[`idx`,`name`,`onUpdate:name`,`type`,`onUpdate:type`,`enable`,`onUpdate:enable`,`host`,`onUpdate:host`,`port`,`onUpdate:port`,`battery_capacity`,`onUpdate:battery_capacity`,`battery_charge_limit`,`onUpdate:battery_charge_limit`,`battery_discharge_limit`,`onUpdate:battery_discharge_limit`,`battery_charge_max_pct`,`onUpdate:battery_charge_max_pct`,`battery_charge_min_pct`,`onUpdate:battery_charge_min_pct`,`connected_phase`,`onUpdate:connected_phase`]))),128)),P(k(IU),{justify:`space-between`},{default:A(()=>[P(k(jM),{onClick:i,type:`primary`,secondary:``,strong:``,circle:``},{icon:A(()=>[P(k(Bz),{size:`28`},{default:A(()=>[P(k(Hl))]),_:1})]),_:1}),P(k(jM),{onClick:a,type:`primary`},{default:A(()=>[...t[0]||=[oi(`Save`,-1)]]),_:1})]),_:1})],64))}}})),dpe=n({default:()=>V9}),V9,fpe=t((()=>{I(),eQ(),D4(),b4(),Bl(),V9={__name:`StartupMode`,setup(e){let t=E4(),n=y4(),{general:r}=wl(t),{running:i}=wl(n),a=[{label:`Europe/Amsterdam`,value:`Europe/Amsterdam`},...Intl.supportedValuesOf(`timeZone`).filter(e=>e!==`Europe/Amsterdam`).map(e=>({label:e,value:e}))],o=[{label:`idle`,value:1},{label:`manual`,value:2},{label:`static`,value:3},{label:`dynamic`,value:4}],s=async()=>{await t.sync_general_config(r.value),await n.fetch_status()},c=async()=>{await t.apply_bart_home_setup(),await t.fetch_config()};return aa(async()=>{await t.fetch_config()}),(e,t)=>(Zr(),ti(Va,null,[t[16]||=M(`h2`,null,`General Configuration`,-1),P(k(ZH)),P(k($K),{inline:``,size:`medium`,"label-placement":`left`},{default:A(()=>[P(k(PJ),{cols:`4 s:4 m:8 l:8 xl:8`,"x-gap":`10`,responsive:`screen`},{default:A(()=>[P(k(SJ),{span:`4`,label:`Startup mode:`,path:`general.mode`},{default:A(()=>[P(k(KR),{value:k(r).mode,"onUpdate:value":t[0]||=e=>k(r).mode=e,placeholder:`Select startup mode`,options:o},null,8,[`value`])]),_:1}),P(k(yJ),{span:`0 m:4`},{default:A(()=>[...t[5]||=[M(`p`,null,` Please select the startup mode of DoeMaarWatt. DoeMaarWatt operates in various modes, those being: `,-1),M(`ol`,null,[M(`li`,null,[M(`em`,null,`idle`),oi(`: No active control, just read device output`)]),M(`li`,null,[M(`em`,null,`manual`),oi(`: Actively control with a continuous charge or discharge power`)]),M(`li`,null,[M(`em`,null,`static`),oi(`: Actively control based on a fixed static schedule`)]),M(`li`,null,[M(`em`,null,`dynamic`),oi(`: Actively control based on dynamic prices`)])],-1)]]),_:1}),P(k(SJ),{span:`4`,label:`Debug output:`,path:`debug`},{default:A(()=>[P(k(lZ),{value:k(r).debug,"onUpdate:value":t[1]||=e=>k(r).debug=e},null,8,[`value`])]),_:1}),P(k(yJ),{span:`0 m:4`},{default:A(()=>[...t[6]||=[M(`p`,null,` Whether to send additional debugging output, such as Modbus messages, to the addon log. `,-1)]]),_:1}),P(k(SJ),{span:`0 m:4`,label:`Control loop delay:`,path:`loop_delay`},{default:A(()=>[P(k(fY),{value:k(r).loop_delay,"onUpdate:value":t[2]||=e=>k(r).loop_delay=e,min:`1`,max:`100`,"show-button":!1},{suffix:A(()=>[...t[7]||=[oi(`sec`,-1)]]),_:1},8,[`value`])]),_:1}),P(k(yJ),{span:`0 m:4`},{default:A(()=>[...t[8]||=[M(`p`,null,`DoeMaarWatt operates in a loop. The loop_delay sets the delay in seconds between control actions.`,-1)]]),_:1}),P(k(SJ),{span:`0 m:4`,label:`Timezone:`,path:`timezone`},{default:A(()=>[P(k(KR),{value:k(r).timezone,"onUpdate:value":t[3]||=e=>k(r).timezone=e,options:a,filterable:``},null,8,[`value`])]),_:1}),P(k(yJ),{span:`0 m:4`},{default:A(()=>[...t[9]||=[M(`p`,null,`Your local IANA timezone name. DST is handled automatically.`,-1)]]),_:1}),P(k(SJ),{span:`0 m:4`,label:`Long-lived access token:`,path:`supervisor_token`},{default:A(()=>[P(k(Cj),{value:k(r).supervisor_token,"onUpdate:value":t[4]||=e=>k(r).supervisor_token=e,type:`text`,placeholder:`Long-lived access token...`},null,8,[`value`])]),_:1}),P(k(yJ),{span:`0 m:4`},{default:A(()=>[...t[10]||=[M(`p`,null,`Long-lived access token, used for Home Assistant push notifications. Can be set from your profile (lower left) -> Security -> Long-lived access tokens.`,-1)]]),_:1})]),_:1})]),_:1}),k(i)?(Zr(),ni(k(HA),{key:0,type:`warning`,style:{"margin-bottom":`12px`}},{default:A(()=>[...t[11]||=[oi(` The controller is currently running. Saving will stop it. `,-1)]]),_:1})):ci(``,!0),P(k(IU),{justify:`space-between`},{default:A(()=>[t[14]||=M(`div`,null,`\xA0`,-1),P(k(jM),{onClick:c,type:`warning`},{default:A(()=>[...t[12]||=[oi(`Apply Bart Home Setup`,-1)]]),_:1}),t[15]||=M(`div`,null,`\xA0`,-1),P(k(jM),{onClick:s,type:`primary`},{default:A(()=>[...t[13]||=[oi(`Save`,-1)]]),_:1})]),_:1})],64))}}})),ppe=n({default:()=>H9}),H9,mpe=t((()=>{I(),eQ(),D4(),Bl(),H9={__name:`ModeManualConfig`,setup(e){let t=E4(),{mode_manual:n}=wl(t),r=[{label:`standby`,value:`standby`},{label:`charge`,value:`charge`},{label:`discharge`,value:`discharge`}],i=async()=>{await t.sync_mode_manual_config(n.value)};return aa(async()=>{await t.fetch_config()}),(e,t)=>(Zr(),ti(Va,null,[t[7]||=M(`h2`,null,`Manual Mode Config`,-1),P(k(ZH)),P(k($K),{inline:``,size:`medium`,"label-placement":`top`},{default:A(()=>[P(k(PJ),{cols:`4 s:4 m:8 l:12 xl:12`,"x-gap":`10`,responsive:`screen`},{default:A(()=>[P(k(SJ),{span:`4`,label:`Direction`,path:`direction`},{default:A(()=>[P(k(KR),{value:k(n).direction,"onUpdate:value":t[0]||=e=>k(n).direction=e,placeholder:`Select direction`,options:r},null,8,[`value`])]),_:1}),P(k(SJ),{span:`4`,label:`Battery charge/discharge amount (per phase)`,path:`battery_amount`},{default:A(()=>[P(k(fY),{value:k(n).battery_amount,"onUpdate:value":t[1]||=e=>k(n).battery_amount=e,min:`0`,max:`10000`,"show-button":!1},{suffix:A(()=>[...t[3]||=[oi(`W`,-1)]]),_:1},8,[`value`])]),_:1}),P(k(SJ),{span:`4`,label:`Solar max power (per pahse)`,path:`solar_amount`},{default:A(()=>[P(k(fY),{value:k(n).solar_amount,"onUpdate:value":t[2]||=e=>k(n).solar_amount=e,min:`0`,max:`10000`,"show-button":!1},{suffix:A(()=>[...t[4]||=[oi(`W`,-1)]]),_:1},8,[`value`])]),_:1})]),_:1}),P(k(IU),{justify:`space-between`},{default:A(()=>[t[6]||=M(`div`,null,`\xA0`,-1),P(k(jM),{onClick:i,type:`primary`},{default:A(()=>[...t[5]||=[oi(`Save`,-1)]]),_:1})]),_:1})]),_:1}),t[8]||=M(`p`,null,[oi(` Define the direction (charge or discharge) and the amount of power while operating in `),M(`em`,null,`manual mode`),oi(`. The charge/discharge power is commanded to each individual battery inverter, while a maximum setpoint power limit is commanded to each solar inverter. Note that the setpoint power limit is per phase. `)],-1)],64))}}})),U9,hpe=t((()=>{I(),eQ(),Cu(),U9={__name:`ScheduleConfigItem`,props:vr([`idx`],{time:{},timeModifiers:{},battery_amount:{},battery_amountModifiers:{},direction:{},directionModifiers:{},solar_amount:{},solar_amountModifiers:{}}),emits:vr([`removed`],[`update:time`,`update:battery_amount`,`update:direction`,`update:solar_amount`]),setup(e,{emit:t}){let n=t,r=e,i=Pr(e,`time`),a=Pr(e,`battery_amount`),o=Pr(e,`direction`),s=Pr(e,`solar_amount`),c=[...Array(24).keys()],l=[0,15,30,45],u=[{label:`standby`,value:`standby`},{label:`charge`,value:`charge`},{label:`discharge`,value:`discharge`}];return(e,t)=>(Zr(),ni(k($K),{inline:``,size:`medium`,"label-placement":`left`},{default:A(()=>[P(k(PJ),{cols:`4 s:4 m:8 l:16 xl:16`,"x-gap":`10`,responsive:`screen`},{default:A(()=>[P(k(SJ),{span:`2`,label:`Time:`,path:`time`},{default:A(()=>[P(k(YV),{"formatted-value":i.value,"onUpdate:formattedValue":t[0]||=e=>i.value=e,format:`HH:mm`,"value-format":`HH:mm`,hours:c,minutes:l},null,8,[`formatted-value`])]),_:1}),P(k(SJ),{span:`4`,label:`Battery Amount:`,path:`battery_amount`},{default:A(()=>[P(k(fY),{value:a.value,"onUpdate:value":t[1]||=e=>a.value=e,min:`0`,max:`10000`,"show-button":!1},{suffix:A(()=>[...t[5]||=[oi(`W`,-1)]]),_:1},8,[`value`])]),_:1}),P(k(SJ),{span:`3`,label:`Direction:`,path:`direction`},{default:A(()=>[P(k(KR),{value:o.value,"onUpdate:value":t[2]||=e=>o.value=e,placeholder:`Select direction`,options:u},null,8,[`value`])]),_:1}),P(k(SJ),{span:`4`,label:`Solar max power:`,path:`solar_amount`},{default:A(()=>[P(k(fY),{value:s.value,"onUpdate:value":t[3]||=e=>s.value=e,min:`0`,max:`10000`,"show-button":!1},{suffix:A(()=>[...t[6]||=[oi(`W`,-1)]]),_:1},8,[`value`])]),_:1}),P(k(SJ),null,{default:A(()=>[P(k(jM),{onClick:t[4]||=e=>n(`removed`,r.idx),type:`error`,secondary:``,strong:``,circle:``},{icon:A(()=>[P(k(Bz),{size:`28`},{default:A(()=>[P(k(tu))]),_:1})]),_:1})]),_:1})]),_:1})]),_:1}))}}})),gpe=n({default:()=>W9}),W9,_pe=t((()=>{I(),eQ(),D4(),Bl(),N4(),Cu(),b9(),S9(),M9(),hpe(),W9={__name:`ModeStaticConfig`,setup(e){J7.register(f9,m9,Z7,X7,a9,l9,r9,$7,y9);let t=E4(),{tz:n,now:r}=M4(),{mode_static:i}=wl(t),a=F(()=>{let e=`00:00`;for(let t of i.value.schedule)t.time>e&&(e=t.time);return e}),o=(e,t)=>t===`standby`||t===`idle`?0:t===`charge`?Math.abs(e)/1e3:Math.abs(e)/-1e3,s=O(!1),c=F(()=>({responsive:!0,aspectRatio:4,scales:{x:{type:`time`,adapters:{date:{zone:n.value}},time:{unit:`hour`,displayFormats:{hour:`HH:mm`}},grid:{color:`#303030`,borderColor:`grey`,tickColor:`grey`}},y:{title:{text:`Battery charge (kW)`},ticks:{callback:(e,t,n)=>`${Math.round(e*10)/10} kW`}}}})),l=F(()=>{let e=r().startOf(`day`);if(i.value.schedule.length===0)return[{x:e,y:0},{x:e.plus({days:1}),y:0}];if(i.value.schedule.length===1){let t=o(i.value.schedule[0].battery_amount,i.value.schedule[0].direction);return[{x:e,y:t},{x:e.plus({days:1}),y:t}]}else{let t=[];if(i.value.schedule[0].time!==`00:00`){let n=i.value.schedule[i.value.schedule.length-1];t.push({x:e,y:o(n.battery_amount,n.direction)})}for(let n of i.value.schedule){let[r,i]=n.time.split(`:`).map(Number),a=e.plus({hours:r,minutes:i});t.length>0&&t.push({x:a.minus({seconds:1}),y:t[t.length-1].y}),t.push({x:a,y:o(n.battery_amount,n.direction)})}return t.push({x:e.plus({days:1}),y:t[t.length-1].y}),t}}),u=F(()=>{let e=r().startOf(`day`);if(i.value.schedule.length===0)return[{x:e,y:0},{x:e.plus({days:1}),y:0}];if(i.value.schedule.length===1){let t=(i.value.schedule[0].solar_amount||0)/1e3;return[{x:e,y:t},{x:e.plus({days:1}),y:t}]}else{let t=[];if(i.value.schedule[0].time!==`00:00`){let n=i.value.schedule[i.value.schedule.length-1];t.push({x:e,y:(n.solar_amount||0)/1e3})}for(let n of i.value.schedule){let[r,i]=n.time.split(`:`).map(Number),a=e.plus({hours:r,minutes:i});t.length>0&&t.push({x:a.minus({seconds:1}),y:t[t.length-1].y}),t.push({x:a,y:(n.solar_amount||0)/1e3})}return t.push({x:e.plus({days:1}),y:t[t.length-1].y}),t}}),d=F(()=>({datasets:[{label:`Battery charge amount (kW)`,data:l.value,fill:{target:`origin`,above:`rgba(75, 192, 75, 0.2)`,below:`rgba(192, 75, 75, 0.2)`},borderColor:`rgb(99, 226, 183)`,tension:0},{label:`Solar amount (kW)`,data:u.value,fill:{target:`origin`,above:`rgba(255, 193, 7, 0.2)`},borderColor:`rgb(255, 193, 7)`,tension:0}]})),f=async e=>{s.value=!1,console.log(`removing config ${e}`),i.value.schedule.splice(e,1),s.value=!0},p=async()=>{s.value=!1,console.log(`appending a new schedule item`),i.value.schedule.push({time:a.value,battery_amount:0,direction:`standby`,solar_amount:0}),s.value=!0},m=async()=>{s.value=!1,i.value.schedule.sort((e,t)=>e.time<t.time?-1:+(e.time>t.time)),await t.sync_mode_static_config(i.value),s.value=!0};return aa(async()=>{s.value=!1,await t.fetch_config(),s.value=!0}),(e,t)=>(Zr(),ti(Va,null,[t[7]||=M(`h2`,null,`Static Mode Configuration`,-1),P(k(ZH)),(Zr(!0),ti(Va,null,mr(k(i).schedule,(e,t)=>(Zr(),ni(U9,{key:t,idx:t,time:e.time,"onUpdate:time":t=>e.time=t,battery_amount:e.battery_amount,"onUpdate:battery_amount":t=>e.battery_amount=t,direction:e.direction,"onUpdate:direction":t=>e.direction=t,solar_amount:e.solar_amount,"onUpdate:solar_amount":t=>e.solar_amount=t,onRemoved:f},null,8,[`idx`,`time`,`onUpdate:time`,`battery_amount`,`onUpdate:battery_amount`,`direction`,`onUpdate:direction`,`solar_amount`,`onUpdate:solar_amount`]))),128)),P(k(IU),{justify:`space-between`},{default:A(()=>[P(k(jM),{onClick:p,type:`primary`,secondary:``,strong:``,circle:``},{icon:A(()=>[P(k(Bz),{size:`28`},{default:A(()=>[P(k(Hl))]),_:1})]),_:1}),P(k(jM),{onClick:m,type:`primary`},{default:A(()=>[...t[0]||=[oi(`Save`,-1)]]),_:1})]),_:1}),M(`p`,null,[t[1]||=oi(` Define a static charge / discharge schedule that is used in the `,-1),t[2]||=M(`em`,null,`static schedule`,-1),t[3]||=oi(` mode. By clicking the `,-1),P(k(jM),{type:`primary`,secondary:``,strong:``,circle:``,size:`tiny`},{default:A(()=>[P(k(Bz),{size:`16`},{default:A(()=>[P(k(Hl))]),_:1})]),_:1}),t[4]||=oi(` button, you can add moments in the schedule on which it changes. Each moment is defined by a time, a `,-1),t[5]||=M(`em`,null,`direction`,-1),t[6]||=oi(` (being idle, charging or discharging), and an amount in Watts for both the battery inverters as well as the solar inverters. All amounts are interpreted as being per phase. `,-1)]),M(`div`,null,[s.value?(Zr(),ni(k(j9),{key:0,data:d.value,options:c.value},null,8,[`data`,`options`])):ci(``,!0)])],64))}}})),vpe=n({default:()=>G9}),G9,ype=t((()=>{I(),eQ(),D4(),Bl(),G9={__name:`ModeDynamicConfig`,setup(e){let t=E4(),{mode_dynamic:n}=wl(t),r=[{label:`idle`,value:1},{label:`manual`,value:2},{label:`static`,value:3},{label:`dynamic`,value:4}],i=[...Array(24).keys()],a=[0,15,30,45],o=async()=>{await t.sync_mode_dynamic_config(n.value)},s=e=>{let t=e.replace(`%`,``).trim();return Math.round(Number(t)*10)/1e3},c=e=>e===null?``:``+Math.round(e*1e3)/10;return aa(async()=>{await t.fetch_config()}),(e,t)=>(Zr(),ti(Va,null,[t[11]||=M(`h2`,null,`Dynamic Schedule Mode Config`,-1),P(k(ZH)),P(k($K),{inline:``,size:`medium`,"label-placement":`top`},{default:A(()=>[P(k(PJ),{cols:`4 s:4 m:8 l:16 xl:16`,"x-gap":`10`,responsive:`screen`},{default:A(()=>[P(k(SJ),{span:`2`,label:`Price Update Time:`,path:`time`},{default:A(()=>[P(k(YV),{"formatted-value":k(n).price_update_time,"onUpdate:formattedValue":t[0]||=e=>k(n).price_update_time=e,format:`HH:mm`,"value-format":`HH:mm`,hours:i,minutes:a},null,8,[`formatted-value`])]),_:1}),P(k(SJ),{span:`4`,label:`Schedule Update Interval`,path:`interval`},{default:A(()=>[P(k(fY),{value:k(n).update_interval,"onUpdate:value":t[1]||=e=>k(n).update_interval=e,"default-value":3600,precision:0,min:60,max:86400,"show-button":!1},{suffix:A(()=>[...t[6]||=[oi(`seconds`,-1)]]),_:1},8,[`value`])]),_:1}),P(k(SJ),{span:`4`,label:`Schedule Resolution`,path:`resolution`},{default:A(()=>[P(k(fY),{value:k(n).resolution,"onUpdate:value":t[2]||=e=>k(n).resolution=e,"default-value":15,precision:0,min:15,max:60,"show-button":!1},{suffix:A(()=>[...t[7]||=[oi(`minutes`,-1)]]),_:1},8,[`value`])]),_:1}),P(k(SJ),{span:`2`,label:`Fallback Mode`,path:`fallback_mode`},{default:A(()=>[P(k(KR),{value:k(n).fallback_mode,"onUpdate:value":t[3]||=e=>k(n).fallback_mode=e,placeholder:`Select fallback mode`,options:r},null,8,[`value`])]),_:1}),P(k(SJ),{span:`2`,label:`(Dis)charge efficiency`,path:`efficiency`},{default:A(()=>[P(k(fY),{value:k(n).efficiency,"onUpdate:value":t[4]||=e=>k(n).efficiency=e,"default-value":.95,parse:s,format:c,precision:3,min:0,max:1,"show-button":!1},{suffix:A(()=>[...t[8]||=[oi(`%`,-1)]]),_:1},8,[`value`])]),_:1}),P(k(SJ),{span:`4`,label:`Enever API token`,path:`api_token`},{default:A(()=>[P(k(Cj),{value:k(n).api_token,"onUpdate:value":t[5]||=e=>k(n).api_token=e,type:`text`,placeholder:`API token...`},null,8,[`value`])]),_:1})]),_:1}),P(k(IU),{justify:`space-between`},{default:A(()=>[t[10]||=M(`div`,null,`\xA0`,-1),P(k(jM),{onClick:o,type:`primary`},{default:A(()=>[...t[9]||=[oi(`Save`,-1)]]),_:1})]),_:1})]),_:1}),P(k(ZH)),t[12]||=si(`<dl><dt><strong>Price Update Time</strong></dt><dd>The time of day at which tomorrow&#39;s energy prices are fetched from the Enever API. Tomorrow&#39;s prices typically become available around 15:00–16:00 CET. The fetched prices are cached locally and used to compute the next optimal schedule.</dd><dt><strong>Schedule Update Interval</strong></dt><dd>How often (in seconds) the optimal charge/discharge schedule is recomputed using the latest prices and the current battery state-of-charge. A shorter interval keeps the schedule more accurate at the cost of more frequent recalculations.</dd><dt><strong>Schedule Resolution</strong></dt><dd>The time slot length (in minutes) used when building the schedule. Prices are aggregated to this resolution and the algorithm optimises one charge/discharge decision per slot. Smaller values give finer control but require more price data points to be available.</dd><dt><strong>Fallback Mode</strong></dt><dd>The control mode to fall back to when no valid schedule can be computed — for example when price data is unavailable. Choose a mode that results in a safe default behaviour for your installation.</dd><dt><strong>Charge/discharge efficiency</strong></dt><dd>The efficiency factor when charging or discharging the battery systemem (0–100 %). This is used by the scheduler to account for energy losses: charging costs more and discharging yields less than the nominal energy stored. A typical lithium battery system has an efficiency of 90–95 %.</dd></dl>`,1)],64))}}})),bpe=t((()=>{})),K9,xpe=t((()=>{K9=(e,t)=>{let n=e.__vccOpts||e;for(let[e,r]of t)n[e]=r;return n}})),Spe=n({default:()=>Q9}),q9,J9,Y9,X9,Z9,Q9,Cpe=t((()=>{I(),g4(),eQ(),b4(),N4(),bpe(),xpe(),q9={style:{"min-height":`40px`,margin:`48px 0 16px 0`}},J9={key:0},Y9={style:{float:`right`}},X9={class:`log-content`},Z9={__name:`LogViewer`,setup(e){let t=y4(),{now:n}=M4(),r=F(()=>n().startOf(`day`)),i=O(n().startOf(`day`)),a=O(``),o=O(null),s=nr(`scrollbarRef`),c=O(!0),l=F(()=>i.value.equals(r.value)),u=()=>{s.value&&setTimeout(()=>{s.value&&s.value.scrollTo({top:999999,behavior:`auto`})},50)},d=e=>{let{scrollTop:t,scrollHeight:n,offsetHeight:r}=e.target,i=n-t-r<10;c.value=i},f=async()=>{a.value=await t.fetch_log({date:i.value.toFormat(`yyyy-MM-dd`)}),c.value&&(await kn(),u())},p=async()=>{i.value=i.value.plus({days:1}),await f()},m=async()=>{i.value=i.value.minus({days:1}),await f()},h=async()=>{i.value=r.value,await f()};return aa(async()=>{console.log(`log file refresh loop at 5 seconds`),await f(),o.value=setInterval(async()=>{console.log(`periodic log refresh (every 5 seconds)`),await f()},5*1e3)}),ca(()=>{clearInterval(o.value),o.value=null}),(e,t)=>(Zr(),ti(Va,null,[M(`div`,q9,[P(k(AZ),{prefix:`bar`,style:{float:`left`}},{default:A(()=>[oi(` Log file for `+De(i.value.toLocaleString(k(h4).DATE_MED_WITH_WEEKDAY))+` `,1),l.value?(Zr(),ti(`em`,J9,`(today)`)):ci(``,!0)]),_:1}),M(`div`,Y9,[P(k(jM),{style:{"margin-left":`16px`},onClick:m},{default:A(()=>[...t[0]||=[oi(`Previous Day`,-1)]]),_:1}),P(k(jM),{style:{"margin-left":`16px`},onClick:h,disabled:l.value},{default:A(()=>[...t[1]||=[oi(`Today`,-1)]]),_:1},8,[`disabled`]),P(k(jM),{style:{"margin-left":`16px`},onClick:p,disabled:l.value},{default:A(()=>[...t[2]||=[oi(`Next Day`,-1)]]),_:1},8,[`disabled`])])]),P(k(WX),{ref_key:`scrollbarRef`,ref:s,onScroll:d,style:{"margin-top":`12px`,"max-height":`80vh`,"background-color":`#111827`,color:`#f3f4f6`,border:`1px solid #374151`,"border-radius":`4px`}},{default:A(()=>[M(`div`,X9,De(a.value),1)]),_:1},512)],64))}},Q9=K9(Z9,[[`__scopeId`,`data-v-31016e12`]])}));I(),Bl(),T4();var wpe=_l(),$9=js(dle),Tpe=Xee({history:Aee(),routes:[{name:`home`,path:`/`,component:()=>w4(()=>Promise.resolve().then(()=>(npe(),tpe)),void 0)},{name:`energy_meter_config`,path:`/config/energy_meter`,component:()=>w4(()=>Promise.resolve().then(()=>(ipe(),rpe)),void 0)},{name:`solar_inverters_config`,path:`/config/solar_inverters`,component:()=>w4(()=>Promise.resolve().then(()=>(spe(),ope)),void 0)},{name:`battery_inverters_config`,path:`/config/battery_inverters`,component:()=>w4(()=>Promise.resolve().then(()=>(upe(),lpe)),void 0)},{name:`general_config`,path:`/config/general`,component:()=>w4(()=>Promise.resolve().then(()=>(fpe(),dpe)),void 0)},{name:`manual_config`,path:`/config/manual`,component:()=>w4(()=>Promise.resolve().then(()=>(mpe(),ppe)),void 0)},{name:`static_schedule_config`,path:`/config/static`,component:()=>w4(()=>Promise.resolve().then(()=>(_pe(),gpe)),void 0)},{name:`dynamic_schedule_config`,path:`/config/dynamic`,component:()=>w4(()=>Promise.resolve().then(()=>(ype(),vpe)),void 0)},{name:`logfiles`,path:`/logfiles`,component:()=>w4(()=>Promise.resolve().then(()=>(Cpe(),Spe)),void 0)}]});$9.use(wpe),$9.use(Tpe),$9.mount(`#app`);
\ No newline at end of file
+`):e}function bfe(e,t){let{element:n,datasetIndex:r,index:i}=t,a=e.getDatasetMeta(r).controller,{label:o,value:s}=a.getLabelAndValue(i);return{chart:e,label:o,parsed:a.getParsed(i),raw:e.data.datasets[r].data[i],formattedValue:s,dataset:a.getDataset(),dataIndex:i,datasetIndex:r,element:n}}function z5(e,t){let n=e.chart.ctx,{body:r,footer:i,title:a}=e,{boxWidth:o,boxHeight:s}=t,c=a6(t.bodyFont),l=a6(t.titleFont),u=a6(t.footerFont),d=a.length,f=i.length,p=r.length,m=i6(t.padding),h=m.height,g=0,_=r.reduce((e,t)=>e+t.before.length+t.lines.length+t.after.length,0);if(_+=e.beforeBody.length+e.afterBody.length,d&&(h+=d*l.lineHeight+(d-1)*t.titleSpacing+t.titleMarginBottom),_){let e=t.displayColors?Math.max(s,c.lineHeight):c.lineHeight;h+=p*e+(_-p)*c.lineHeight+(_-1)*t.bodySpacing}f&&(h+=t.footerMarginTop+f*u.lineHeight+(f-1)*t.footerSpacing);let v=0,y=function(e){g=Math.max(g,n.measureText(e).width+v)};return n.save(),n.font=l.string,_3(e.title,y),n.font=c.string,_3(e.beforeBody.concat(e.afterBody),y),v=t.displayColors?o+2+t.boxPadding:0,_3(r,e=>{_3(e.before,y),_3(e.lines,y),_3(e.after,y)}),v=0,n.font=u.string,_3(e.footer,y),n.restore(),g+=m.width,{width:g,height:h}}function xfe(e,t){let{y:n,height:r}=t;return n<r/2?`top`:n>e.height-r/2?`bottom`:`center`}function Sfe(e,t,n,r){let{x:i,width:a}=r,o=n.caretSize+n.caretPadding;if(e===`left`&&i+a+o>t.width||e===`right`&&i-a-o<0)return!0}function Cfe(e,t,n,r){let{x:i,width:a}=n,{width:o,chartArea:{left:s,right:c}}=e,l=`center`;return r===`center`?l=i<=(s+c)/2?`left`:`right`:i<=a/2?l=`left`:i>=o-a/2&&(l=`right`),Sfe(l,e,t,n)&&(l=`center`),l}function B5(e,t,n){let r=n.yAlign||t.yAlign||xfe(e,n);return{xAlign:n.xAlign||t.xAlign||Cfe(e,t,n,r),yAlign:r}}function wfe(e,t){let{x:n,width:r}=e;return t===`right`?n-=r:t===`center`&&(n-=r/2),n}function Tfe(e,t,n){let{y:r,height:i}=e;return t===`top`?r+=n:t===`bottom`?r-=i+n:r-=i/2,r}function V5(e,t,n,r){let{caretSize:i,caretPadding:a,cornerRadius:o}=e,{xAlign:s,yAlign:c}=n,l=i+a,{topLeft:u,topRight:d,bottomLeft:f,bottomRight:p}=r6(o),m=wfe(t,s),h=Tfe(t,c,l);return c===`center`?s===`left`?m+=l:s===`right`&&(m-=l):s===`left`?m-=Math.max(u,f)+i:s===`right`&&(m+=Math.max(d,p)+i),{x:F3(m,0,r.width-t.width),y:F3(h,0,r.height-t.height)}}function H5(e,t,n){let r=i6(n.padding);return t===`center`?e.x+e.width/2:t===`right`?e.x+e.width-r.right:e.x+r.left}function U5(e){return L5([],R5(e))}function Efe(e,t,n){return s6(e,{tooltip:t,tooltipItems:n,type:`tooltip`})}function W5(e,t){let n=t&&t.dataset&&t.dataset.tooltip&&t.dataset.tooltip.callbacks;return n?e.override(n):e}function G5(e,t,n,r){let i=e[t].call(n,r);return i===void 0?s9[t].call(n,r):i}function Dfe(e,t,n,r){let i=e.indexOf(t);return i===-1?u9(e,t,n,r):i===e.lastIndexOf(t)?i:n}function K5(e){let t=this.getLabels();return e>=0&&e<t.length?t[e]:e}function Ofe(e,t){let n=[],{bounds:r,step:i,min:a,max:o,precision:s,count:c,maxTicks:l,maxDigits:u,includeBounds:d}=e,f=i||1,p=l-1,{min:m,max:h}=t,g=!u3(a),_=!u3(o),v=!u3(c),y=(h-m)/(u+1),b=E3((h-m)/p/f)*f,x,S,C,w;if(b<1e-14&&!g&&!_)return[{value:m},{value:h}];w=Math.ceil(h/b)-Math.floor(m/b),w>p&&(b=E3(w*b/p/f)*f),u3(s)||(x=10**s,b=Math.ceil(b*x)/x),r===`ticks`?(S=Math.floor(m/b)*b,C=Math.ceil(h/b)*b):(S=m,C=h),g&&_&&i&&Lle((o-a)/i,b/1e3)?(w=Math.round(Math.min((o-a)/b,l)),b=(o-a)/w,S=a,C=o):v?(S=g?a:S,C=_?o:C,w=c-1,b=(C-S)/w):(w=(C-S)/b,w=T3(w,Math.round(w),b/1e3)?Math.round(w):Math.ceil(w));let T=Math.max(j3(b),j3(S));x=10**(u3(s)?T:s),S=Math.round(S*x)/x,C=Math.round(C*x)/x;let E=0;for(g&&(d&&S!==a?(n.push({value:a}),S<a&&E++,T3(Math.round((S+E*b)*x)/x,a,q5(a,y,e))&&E++):S<a&&E++);E<w;++E){let e=Math.round((S+E*b)*x)/x;if(_&&e>o)break;n.push({value:e})}return _&&d&&C!==o?n.length&&T3(n[n.length-1].value,o,q5(o,y,e))?n[n.length-1].value=o:n.push({value:o}):(!_||C===o)&&n.push({value:C}),n}function q5(e,t,{horizontal:n,minRotation:r}){let i=k3(r),a=(n?Math.sin(i):Math.cos(i))||.001,o=.75*t*(``+e).length;return Math.min(t/a,o)}function J5(e){return e/10**h9(e)==1}function Y5(e,t,n){let r=10**n,i=Math.floor(e/r);return Math.ceil(t/r)-i}function kfe(e,t){let n=t-e,r=h9(n);for(;Y5(e,t,r)>10;)r++;for(;Y5(e,t,r)<10;)r--;return Math.min(r,h9(e))}function Afe(e,{min:t,max:n}){t=m3(e.min,t);let r=[],i=h9(t),a=kfe(t,n),o=a<0?10**Math.abs(a):1,s=10**a,c=i>a?10**i:0,l=Math.round((t-c)*o)/o,u=Math.floor((t-c)/s/10)*s*10,d=Math.floor((l-u)/10**a),f=m3(e.min,Math.round((c+u+d*10**a)*o)/o);for(;f<n;)r.push({value:f,major:J5(f),significand:d}),d>=10?d=d<15?15:20:d++,d>=20&&(a++,d=2,o=a>=0?1:o),f=Math.round((c+u+d*10**a)*o)/o;let p=m3(e.max,f);return r.push({value:p,major:J5(p),significand:d}),r}function X5(e){let t=e.ticks;if(t.display&&e.display){let e=i6(t.backdropPadding);return h3(t.font&&t.font.size,v8.font.size)+e.height}return 0}function jfe(e,t,n){return n=d3(n)?n:[n],{w:$le(e,t.string,n),h:n.length*t.lineHeight}}function Z5(e,t,n,r,i){return e===r||e===i?{start:t-n/2,end:t+n/2}:e<r||e>i?{start:t-n,end:t}:{start:t,end:t+n}}function Mfe(e){let t={l:e.left+e._padding.left,r:e.right-e._padding.right,t:e.top+e._padding.top,b:e.bottom-e._padding.bottom},n=Object.assign({},t),r=[],i=[],a=e._pointLabels.length,o=e.options.pointLabels,s=o.centerPointLabels?U6/a:0;for(let c=0;c<a;c++){let a=o.setContext(e.getPointLabelContext(c));i[c]=a.padding;let l=e.getPointPosition(c,e.drawingArea+i[c],s),u=a6(a.font),d=jfe(e.ctx,u,e._pointLabels[c]);r[c]=d;let f=N3(e.getIndexAngle(c)+s),p=Math.round(A3(f));Nfe(n,t,f,Z5(p,l.x,d.w,0,180),Z5(p,l.y,d.h,90,270))}e.setCenterPoint(t.l-n.l,n.r-t.r,t.t-n.t,n.b-t.b),e._pointLabelItems=Ife(e,r,i)}function Nfe(e,t,n,r,i){let a=Math.abs(Math.sin(n)),o=Math.abs(Math.cos(n)),s=0,c=0;r.start<t.l?(s=(t.l-r.start)/a,e.l=Math.min(e.l,t.l-s)):r.end>t.r&&(s=(r.end-t.r)/a,e.r=Math.max(e.r,t.r+s)),i.start<t.t?(c=(t.t-i.start)/o,e.t=Math.min(e.t,t.t-c)):i.end>t.b&&(c=(i.end-t.b)/o,e.b=Math.max(e.b,t.b+c))}function Pfe(e,t,n){let r=e.drawingArea,{extra:i,additionalAngle:a,padding:o,size:s}=n,c=e.getPointPosition(t,r+i+o,a),l=Math.round(A3(N3(c.angle+J6))),u=zfe(c.y,s.h,l),d=Lfe(l),f=Rfe(c.x,s.w,d);return{visible:!0,x:c.x,y:u,textAlign:d,left:f,top:u,right:f+s.w,bottom:u+s.h}}function Ffe(e,t){if(!t)return!0;let{left:n,top:r,right:i,bottom:a}=e;return!(Z3({x:n,y:r},t)||Z3({x:n,y:a},t)||Z3({x:i,y:r},t)||Z3({x:i,y:a},t))}function Ife(e,t,n){let r=[],i=e._pointLabels.length,a=e.options,{centerPointLabels:o,display:s}=a.pointLabels,c={extra:X5(a)/2,additionalAngle:o?U6/i:0},l;for(let a=0;a<i;a++){c.padding=n[a],c.size=t[a];let i=Pfe(e,a,c);r.push(i),s===`auto`&&(i.visible=Ffe(i,l),i.visible&&(l=i))}return r}function Lfe(e){return e===0||e===180?`center`:e<180?`left`:`right`}function Rfe(e,t,n){return n===`right`?e-=t:n===`center`&&(e-=t/2),e}function zfe(e,t,n){return n===90||n===270?e-=t/2:(n>270||n<90)&&(e-=t),e}function Bfe(e,t,n){let{left:r,top:i,right:a,bottom:o}=n,{backdropColor:s}=t;if(!u3(s)){let n=r6(t.borderRadius),c=i6(t.backdropPadding);e.fillStyle=s;let l=r-c.left,u=i-c.top,d=a-r+c.width,f=o-i+c.height;Object.values(n).some(e=>e!==0)?(e.beginPath(),t6(e,{x:l,y:u,w:d,h:f,radius:n}),e.fill()):e.fillRect(l,u,d,f)}}function Vfe(e,t){let{ctx:n,options:{pointLabels:r}}=e;for(let i=t-1;i>=0;i--){let t=e._pointLabelItems[i];if(!t.visible)continue;let a=r.setContext(e.getPointLabelContext(i));Bfe(n,a,t);let o=a6(a.font),{x:s,y:c,textAlign:l}=t;e6(n,e._pointLabels[i],s,c+o.lineHeight/2,o,{color:a.color,textAlign:l,textBaseline:`middle`})}}function Q5(e,t,n,r){let{ctx:i}=e;if(n)i.arc(e.xCenter,e.yCenter,t,0,W6);else{let n=e.getPointPosition(0,t);i.moveTo(n.x,n.y);for(let a=1;a<r;a++)n=e.getPointPosition(a,t),i.lineTo(n.x,n.y)}}function Hfe(e,t,n,r,i){let a=e.ctx,o=t.circular,{color:s,lineWidth:c}=t;!o&&!r||!s||!c||n<0||(a.save(),a.strokeStyle=s,a.lineWidth=c,a.setLineDash(i.dash||[]),a.lineDashOffset=i.dashOffset,a.beginPath(),Q5(e,n,o,r),a.closePath(),a.stroke(),a.restore())}function Ufe(e,t,n){return s6(e,{label:n,index:t,type:`pointLabel`})}function $5(e,t){return e-t}function e7(e,t){if(u3(t))return null;let n=e._adapter,{parser:r,round:i,isoWeekday:a}=e._parseOpts,o=t;return typeof r==`function`&&(o=r(o)),p3(o)||(o=typeof r==`string`?n.parse(o,r):n.parse(o)),o===null?null:(i&&(o=i===`week`&&(D3(a)||a===!0)?n.startOf(o,`isoWeek`,a):n.startOf(o,i)),+o)}function t7(e,t,n,r){let i=v9.length;for(let a=v9.indexOf(e);a<i-1;++a){let e=_9[v9[a]],i=e.steps?e.steps:2**53-1;if(e.common&&Math.ceil((n-t)/(i*e.size))<=r)return v9[a]}return v9[i-1]}function Wfe(e,t,n,r,i){for(let a=v9.length-1;a>=v9.indexOf(n);a--){let n=v9[a];if(_9[n].common&&e._adapter.diff(i,r,n)>=t-1)return n}return v9[n?v9.indexOf(n):0]}function Gfe(e){for(let t=v9.indexOf(e)+1,n=v9.length;t<n;++t)if(_9[v9[t]].common)return v9[t]}function n7(e,t,n){if(!n)e[t]=!0;else if(n.length){let{lo:r,hi:i}=L3(n,t),a=n[r]>=t?n[r]:n[i];e[a]=!0}}function Kfe(e,t,n,r){let i=e._adapter,a=+i.startOf(t[0].value,r),o=t[t.length-1].value,s,c;for(s=a;s<=o;s=+i.add(s,1,r))c=n[s],c>=0&&(t[c].major=!0);return t}function r7(e,t,n){let r=[],i={},a=t.length,o,s;for(o=0;o<a;++o)s=t[o],i[s]=o,r.push({value:s,major:!1});return a===0||!n?r:Kfe(e,r,i,n)}function i7(e,t,n){let r=0,i=e.length-1,a,o,s,c;n?(t>=e[r].pos&&t<=e[i].pos&&({lo:r,hi:i}=$6(e,`pos`,t)),{pos:a,time:s}=e[r],{pos:o,time:c}=e[i]):(t>=e[r].time&&t<=e[i].time&&({lo:r,hi:i}=$6(e,`time`,t)),{time:a,pos:s}=e[r],{time:o,pos:c}=e[i]);let l=o-a;return l?s+(c-s)*(t-a)/l:s}var a7,o7,s7,c7,l7,u7,d7,f7,p7,m7,h7,g7,_7,v7,y7,b7,x7,S7,C7,w7,T7,E7,D7,O7,k7,A7,j7,M7,N7,P7,F7,I7,L7,R7,z7,B7,V7,H7,U7,W7,G7,K7,q7,J7,Y7,X7,Z7,Q7,$7,e9,t9,n9,r9,i9,a9,o9,s9,c9,l9,u9,d9,f9,p9,m9,h9,g9,_9,v9,y9,b9=t((()=>{Pue(),a7=class{constructor(){this._request=null,this._charts=new Map,this._running=!1,this._lastDate=void 0}_notify(e,t,n,r){let i=t.listeners[r],a=t.duration;i.forEach(r=>r({chart:e,initial:t.initial,numSteps:a,currentStep:Math.min(n-t.start,a)}))}_refresh(){this._request||=(this._running=!0,n8.call(window,()=>{this._update(),this._request=null,this._running&&this._refresh()}))}_update(e=Date.now()){let t=0;this._charts.forEach((n,r)=>{if(!n.running||!n.items.length)return;let i=n.items,a=i.length-1,o=!1,s;for(;a>=0;--a)s=i[a],s._active?(s._total>n.duration&&(n.duration=s._total),s.tick(e),o=!0):(i[a]=i[i.length-1],i.pop());o&&(r.draw(),this._notify(r,n,e,`progress`)),i.length||(n.running=!1,this._notify(r,n,e,`complete`),n.initial=!1),t+=i.length}),this._lastDate=e,t===0&&(this._running=!1)}_getAnims(e){let t=this._charts,n=t.get(e);return n||(n={running:!1,initial:!0,items:[],listeners:{complete:[],progress:[]}},t.set(e,n)),n}listen(e,t,n){this._getAnims(e).listeners[t].push(n)}add(e,t){!t||!t.length||this._getAnims(e).items.push(...t)}has(e){return this._getAnims(e).items.length>0}start(e){let t=this._charts.get(e);t&&(t.running=!0,t.start=Date.now(),t.duration=t.items.reduce((e,t)=>Math.max(e,t._duration),0),this._refresh())}running(e){if(!this._running)return!1;let t=this._charts.get(e);return!(!t||!t.running||!t.items.length)}stop(e){let t=this._charts.get(e);if(!t||!t.items.length)return;let n=t.items,r=n.length-1;for(;r>=0;--r)n[r].cancel();t.items=[],this._notify(e,t,Date.now(),`complete`)}remove(e){return this._charts.delete(e)}},o7=new a7,s7=`transparent`,c7={boolean(e,t,n){return n>.5?t:e},color(e,t,n){let r=V3(e||s7),i=r.valid&&V3(t||s7);return i&&i.valid?i.mix(r,n).hexString():t},number(e,t,n){return e+(t-e)*n}},l7=class{constructor(e,t,n,r){let i=t[n];r=o6([e.to,r,i,e.from]);let a=o6([e.from,i,r]);this._active=!0,this._fn=e.fn||c7[e.type||typeof a],this._easing=l8[e.easing]||l8.linear,this._start=Math.floor(Date.now()+(e.delay||0)),this._duration=this._total=Math.floor(e.duration),this._loop=!!e.loop,this._target=t,this._prop=n,this._from=a,this._to=r,this._promises=void 0}active(){return this._active}update(e,t,n){if(this._active){this._notify(!1);let r=this._target[this._prop],i=n-this._start,a=this._duration-i;this._start=n,this._duration=Math.floor(Math.max(a,e.duration)),this._total+=i,this._loop=!!e.loop,this._to=o6([e.to,t,r,e.from]),this._from=o6([e.from,r,t])}}cancel(){this._active&&(this.tick(Date.now()),this._active=!1,this._notify(!1))}tick(e){let t=e-this._start,n=this._duration,r=this._prop,i=this._from,a=this._loop,o=this._to,s;if(this._active=i!==o&&(a||t<n),!this._active){this._target[r]=o,this._notify(!0);return}if(t<0){this._target[r]=i;return}s=t/n%2,s=a&&s>1?2-s:s,s=this._easing(Math.min(1,Math.max(0,s))),this._target[r]=this._fn(i,o,s)}wait(){let e=this._promises||=[];return new Promise((t,n)=>{e.push({res:t,rej:n})})}_notify(e){let t=e?`res`:`rej`,n=this._promises||[];for(let e=0;e<n.length;e++)n[e][t]()}},u7=class{constructor(e,t){this._chart=e,this._properties=new Map,this.configure(t)}configure(e){if(!f3(e))return;let t=Object.keys(v8.animation),n=this._properties;Object.getOwnPropertyNames(e).forEach(r=>{let i=e[r];if(!f3(i))return;let a={};for(let e of t)a[e]=i[e];(d3(i.properties)&&i.properties||[r]).forEach(e=>{(e===r||!n.has(e))&&n.set(e,a)})})}_animateOptions(e,t){let n=t.options,r=Iue(e,n);if(!r)return[];let i=this._createAnimations(r,n);return n.$shared&&Fue(e.options.$animations,n).then(()=>{e.options=n},()=>{}),i}_createAnimations(e,t){let n=this._properties,r=[],i=e.$animations||={},a=Object.keys(t),o=Date.now(),s;for(s=a.length-1;s>=0;--s){let c=a[s];if(c.charAt(0)===`$`)continue;if(c===`options`){r.push(...this._animateOptions(e,t));continue}let l=t[c],u=i[c],d=n.get(c);if(u)if(d&&u.active()){u.update(d,l,o);continue}else u.cancel();if(!d||!d.duration){e[c]=l;continue}i[c]=u=new l7(d,e,c,l),r.push(u)}return r}update(e,t){if(this._properties.size===0){Object.assign(e,t);return}let n=this._createAnimations(e,t);if(n.length)return o7.add(this._chart,n),!0}},d7=e=>e===`reset`||e===`none`,f7=(e,t)=>t?e:Object.assign({},e),p7=(e,t,n)=>e&&!t.hidden&&t._stacked&&{keys:I8(n,!0),values:null},m7=class{static defaults={};static datasetElementType=null;static dataElementType=null;constructor(e,t){this.chart=e,this._ctx=e.ctx,this.index=t,this._cachedDataOpts={},this._cachedMeta=this.getMeta(),this._type=this._cachedMeta.type,this.options=void 0,this._parsing=!1,this._data=void 0,this._objectData=void 0,this._sharedOptions=void 0,this._drawStart=void 0,this._drawCount=void 0,this.enableOptionSharing=!1,this.supportsDecimation=!1,this.$context=void 0,this._syncList=[],this.datasetElementType=new.target.datasetElementType,this.dataElementType=new.target.dataElementType,this.initialize()}initialize(){let e=this._cachedMeta;this.configure(),this.linkScales(),e._stacked=R8(e.vScale,e),this.addElements(),this.options.fill&&!this.chart.isPluginEnabled(`filler`)&&console.warn(`Tried to use the 'fill' option without the 'Filler' plugin enabled. Please import and register the 'Filler' plugin and make sure it is not disabled in the options`)}updateIndex(e){this.index!==e&&H8(this._cachedMeta),this.index=e}linkScales(){let e=this.chart,t=this._cachedMeta,n=this.getDataset(),r=(e,t,n,r)=>e===`x`?t:e===`r`?r:n,i=t.xAxisID=h3(n.xAxisID,V8(e,`x`)),a=t.yAxisID=h3(n.yAxisID,V8(e,`y`)),o=t.rAxisID=h3(n.rAxisID,V8(e,`r`)),s=t.indexAxis,c=t.iAxisID=r(s,i,a,o),l=t.vAxisID=r(s,a,i,o);t.xScale=this.getScaleForId(i),t.yScale=this.getScaleForId(a),t.rScale=this.getScaleForId(o),t.iScale=this.getScaleForId(c),t.vScale=this.getScaleForId(l)}getDataset(){return this.chart.data.datasets[this.index]}getMeta(){return this.chart.getDatasetMeta(this.index)}getScaleForId(e){return this.chart.scales[e]}_getOtherScale(e){let t=this._cachedMeta;return e===t.iScale?t.vScale:t.iScale}reset(){this._update(`reset`)}_destroy(){let e=this._cachedMeta;this._data&&R3(this._data,this),e._stacked&&H8(e)}_dataCheck(){let e=this.getDataset(),t=e.data||=[],n=this._data;if(f3(t)){let e=this._cachedMeta;this._data=zue(t,e)}else if(n!==t){if(n){R3(n,this);let e=this._cachedMeta;H8(e),e._parsed=[]}t&&Object.isExtensible(t)&&Hle(t,this),this._syncList=[],this._data=t}}addElements(){let e=this._cachedMeta;this._dataCheck(),this.datasetElementType&&(e.dataset=new this.datasetElementType)}buildOrUpdateElements(e){let t=this._cachedMeta,n=this.getDataset(),r=!1;this._dataCheck();let i=t._stacked;t._stacked=R8(t.vScale,t),t.stack!==n.stack&&(r=!0,H8(t),t.stack=n.stack),this._resyncElements(e),(r||i!==t._stacked)&&(B8(this,t._parsed),t._stacked=R8(t.vScale,t))}configure(){let e=this.chart.config,t=e.datasetScopeKeys(this._type),n=e.getOptionScopes(this.getDataset(),t,!0);this.options=e.createResolver(n,this.getContext()),this._parsing=this.options.parsing,this._cachedDataOpts={}}parse(e,t){let{_cachedMeta:n,_data:r}=this,{iScale:i,_stacked:a}=n,o=i.axis,s=e===0&&t===r.length||n._sorted,c=e>0&&n._parsed[e-1],l,u,d;if(this._parsing===!1)n._parsed=r,n._sorted=!0,d=r;else{d=d3(r[e])?this.parseArrayData(n,r,e,t):f3(r[e])?this.parseObjectData(n,r,e,t):this.parsePrimitiveData(n,r,e,t);let i=()=>u[o]===null||c&&u[o]<c[o];for(l=0;l<t;++l)n._parsed[l+e]=u=d[l],s&&(i()&&(s=!1),c=u);n._sorted=s}a&&B8(this,d)}parsePrimitiveData(e,t,n,r){let{iScale:i,vScale:a}=e,o=i.axis,s=a.axis,c=i.getLabels(),l=i===a,u=Array(r),d,f,p;for(d=0,f=r;d<f;++d)p=d+n,u[d]={[o]:l||i.parse(c[p],p),[s]:a.parse(t[p],p)};return u}parseArrayData(e,t,n,r){let{xScale:i,yScale:a}=e,o=Array(r),s,c,l,u;for(s=0,c=r;s<c;++s)l=s+n,u=t[l],o[s]={x:i.parse(u[0],l),y:a.parse(u[1],l)};return o}parseObjectData(e,t,n,r){let{xScale:i,yScale:a}=e,{xAxisKey:o=`x`,yAxisKey:s=`y`}=this._parsing,c=Array(r),l,u,d,f;for(l=0,u=r;l<u;++l)d=l+n,f=t[d],c[l]={x:i.parse(C3(f,o),d),y:a.parse(C3(f,s),d)};return c}getParsed(e){return this._cachedMeta._parsed[e]}getDataElement(e){return this._cachedMeta.data[e]}applyStack(e,t,n){let r=this.chart,i=this._cachedMeta,a=t[e.axis];return L8({keys:I8(r,!0),values:t._stacks[e.axis]._visualValues},a,i.index,{mode:n})}updateRangeFromParsed(e,t,n,r){let i=n[t.axis],a=i===null?NaN:i,o=r&&n._stacks[t.axis];r&&o&&(r.values=o,a=L8(r,i,this._cachedMeta.index)),e.min=Math.min(e.min,a),e.max=Math.max(e.max,a)}getMinMax(e,t){let n=this._cachedMeta,r=n._parsed,i=n._sorted&&e===n.iScale,a=r.length,o=this._getOtherScale(e),s=p7(t,n,this.chart),c={min:1/0,max:-1/0},{min:l,max:u}=Vue(o),d,f;function p(){f=r[d];let t=f[o.axis];return!p3(f[e.axis])||l>t||u<t}for(d=0;d<a&&!(!p()&&(this.updateRangeFromParsed(c,e,f,s),i));++d);if(i){for(d=a-1;d>=0;--d)if(!p()){this.updateRangeFromParsed(c,e,f,s);break}}return c}getAllParsedValues(e){let t=this._cachedMeta._parsed,n=[],r,i,a;for(r=0,i=t.length;r<i;++r)a=t[r][e.axis],p3(a)&&n.push(a);return n}getMaxOverflow(){return!1}getLabelAndValue(e){let t=this._cachedMeta,n=t.iScale,r=t.vScale,i=this.getParsed(e);return{label:n?``+n.getLabelForValue(i[n.axis]):``,value:r?``+r.getLabelForValue(i[r.axis]):``}}_update(e){let t=this._cachedMeta;this.update(e||`default`),t._clip=Rue(h3(this.options.clip,Lue(t.xScale,t.yScale,this.getMaxOverflow())))}update(e){}draw(){let e=this._ctx,t=this.chart,n=this._cachedMeta,r=n.data||[],i=t.chartArea,a=[],o=this._drawStart||0,s=this._drawCount||r.length-o,c=this.options.drawActiveElementsOnTop,l;for(n.dataset&&n.dataset.draw(e,i,o,s),l=o;l<o+s;++l){let t=r[l];t.hidden||(t.active&&c?a.push(t):t.draw(e,i))}for(l=0;l<a.length;++l)a[l].draw(e,i)}getStyle(e,t){let n=t?`active`:`default`;return e===void 0&&this._cachedMeta.dataset?this.resolveDatasetElementOptions(n):this.resolveDataElementOptions(e||0,n)}getContext(e,t,n){let r=this.getDataset(),i;if(e>=0&&e<this._cachedMeta.data.length){let t=this._cachedMeta.data[e];i=t.$context||=Wue(this.getContext(),e,t),i.parsed=this.getParsed(e),i.raw=r.data[e],i.index=i.dataIndex=e}else i=this.$context||=Uue(this.chart.getContext(),this.index),i.dataset=r,i.index=i.datasetIndex=this.index;return i.active=!!t,i.mode=n,i}resolveDatasetElementOptions(e){return this._resolveElementOptions(this.datasetElementType.id,e)}resolveDataElementOptions(e,t){return this._resolveElementOptions(this.dataElementType.id,t,e)}_resolveElementOptions(e,t=`default`,n){let r=t===`active`,i=this._cachedDataOpts,a=e+`-`+t,o=i[a],s=this.enableOptionSharing&&B6(n);if(o)return f7(o,s);let c=this.chart.config,l=c.datasetElementScopeKeys(this._type,e),u=r?[`${e}Hover`,`hover`,e,``]:[e,``],d=c.getOptionScopes(this.getDataset(),l),f=Object.keys(v8.elements[e]),p=c.resolveNamedOptions(d,f,()=>this.getContext(n,r,t),u);return p.$shared&&(p.$shared=s,i[a]=Object.freeze(f7(p,s))),p}_resolveAnimations(e,t,n){let r=this.chart,i=this._cachedDataOpts,a=`animation-${t}`,o=i[a];if(o)return o;let s;if(r.options.animation!==!1){let r=this.chart.config,i=r.datasetAnimationScopeKeys(this._type,t),a=r.getOptionScopes(this.getDataset(),i);s=r.createResolver(a,this.getContext(e,n,t))}let c=new u7(r,s&&s.animations);return s&&s._cacheable&&(i[a]=Object.freeze(c)),c}getSharedOptions(e){if(e.$shared)return this._sharedOptions||=Object.assign({},e)}includeOptions(e,t){return!t||d7(e)||this.chart._animationsDisabled}_getSharedOptions(e,t){let n=this.resolveDataElementOptions(e,t),r=this._sharedOptions,i=this.getSharedOptions(n),a=this.includeOptions(t,i)||i!==r;return this.updateSharedOptions(i,t,n),{sharedOptions:i,includeOptions:a}}updateElement(e,t,n,r){d7(r)?Object.assign(e,n):this._resolveAnimations(t,r).update(e,n)}updateSharedOptions(e,t,n){e&&!d7(t)&&this._resolveAnimations(void 0,t).update(e,n)}_setStyle(e,t,n,r){e.active=r;let i=this.getStyle(t,r);this._resolveAnimations(t,n,r).update(e,{options:!r&&this.getSharedOptions(i)||i})}removeHoverStyle(e,t,n){this._setStyle(e,n,`active`,!1)}setHoverStyle(e,t,n){this._setStyle(e,n,`active`,!0)}_removeDatasetHoverStyle(){let e=this._cachedMeta.dataset;e&&this._setStyle(e,void 0,`active`,!1)}_setDatasetHoverStyle(){let e=this._cachedMeta.dataset;e&&this._setStyle(e,void 0,`active`,!0)}_resyncElements(e){let t=this._data,n=this._cachedMeta.data;for(let[e,t,n]of this._syncList)this[e](t,n);this._syncList=[];let r=n.length,i=t.length,a=Math.min(i,r);a&&this.parse(0,a),i>r?this._insertElements(r,i-r,e):i<r&&this._removeElements(i,r-i)}_insertElements(e,t,n=!0){let r=this._cachedMeta,i=r.data,a=e+t,o,s=e=>{for(e.length+=t,o=e.length-1;o>=a;o--)e[o]=e[o-t]};for(s(i),o=e;o<a;++o)i[o]=new this.dataElementType;this._parsing&&s(r._parsed),this.parse(e,t),n&&this.updateElements(i,e,t,`reset`)}updateElements(e,t,n,r){}_removeElements(e,t){let n=this._cachedMeta;if(this._parsing){let r=n._parsed.splice(e,t);n._stacked&&H8(n,r)}n.data.splice(e,t)}_sync(e){if(this._parsing)this._syncList.push(e);else{let[t,n,r]=e;this[t](n,r)}this.chart._dataChanges.push([this.index,...e])}_onDataPush(){let e=arguments.length;this._sync([`_insertElements`,this.getDataset().data.length-e,e])}_onDataPop(){this._sync([`_removeElements`,this._cachedMeta.data.length-1,1])}_onDataShift(){this._sync([`_removeElements`,0,1])}_onDataSplice(e,t){t&&this._sync([`_removeElements`,e,t]);let n=arguments.length-2;n&&this._sync([`_insertElements`,e,n])}_onDataUnshift(){this._sync([`_insertElements`,0,arguments.length])}},h7=class extends m7{static id=`line`;static defaults={datasetElementType:`line`,dataElementType:`point`,showLine:!0,spanGaps:!1};static overrides={scales:{_index_:{type:`category`},_value_:{type:`linear`}}};initialize(){this.enableOptionSharing=!0,this.supportsDecimation=!0,super.initialize()}update(e){let t=this._cachedMeta,{dataset:n,data:r=[],_dataset:i}=t,a=this.chart._animationsDisabled,{start:o,count:s}=Gle(t,r,a);this._drawStart=o,this._drawCount=s,Kle(t)&&(o=0,s=r.length),n._chart=this.chart,n._datasetIndex=this.index,n._decimated=!!i._decimated,n.points=r;let c=this.resolveDatasetElementOptions(e);this.options.showLine||(c.borderWidth=0),c.segment=this.options.segment,this.updateElement(n,void 0,{animated:!a,options:c},e),this.updateElements(r,o,s,e)}updateElements(e,t,n,r){let i=r===`reset`,{iScale:a,vScale:o,_stacked:s,_dataset:c}=this._cachedMeta,{sharedOptions:l,includeOptions:u}=this._getSharedOptions(t,r),d=a.axis,f=o.axis,{spanGaps:p,segment:m}=this.options,h=D3(p)?p:1/0,g=this.chart._animationsDisabled||i||r===`none`,_=t+n,v=e.length,y=t>0&&this.getParsed(t-1);for(let n=0;n<v;++n){let p=e[n],v=g?p:{};if(n<t||n>=_){v.skip=!0;continue}let b=this.getParsed(n),x=u3(b[f]),S=v[d]=a.getPixelForValue(b[d],n),C=v[f]=i||x?o.getBasePixel():o.getPixelForValue(s?this.applyStack(o,b,s):b[f],n);v.skip=isNaN(S)||isNaN(C)||x,v.stop=n>0&&Math.abs(b[d]-y[d])>h,m&&(v.parsed=b,v.raw=c.data[n]),u&&(v.options=l||this.resolveDataElementOptions(n,p.active?`active`:r)),g||this.updateElement(p,n,v,r),y=b}}getMaxOverflow(){let e=this._cachedMeta,t=e.dataset,n=t.options&&t.options.borderWidth||0,r=e.data||[];if(!r.length)return n;let i=r[0].size(this.resolveDataElementOptions(0)),a=r[r.length-1].size(this.resolveDataElementOptions(r.length-1));return Math.max(n,i,a)/2}draw(){let e=this._cachedMeta;e.dataset.updateControlPoints(this.chart.chartArea,e.iScale.axis),super.draw()}},g7=class e{static override(t){Object.assign(e.prototype,t)}options;constructor(e){this.options=e||{}}init(){}formats(){return U8()}parse(){return U8()}format(){return U8()}add(){return U8()}diff(){return U8()}startOf(){return U8()}endOf(){return U8()}},_7={_date:g7},v7={evaluateInteractionItems:W8,modes:{index(e,t,n,r){let i=S6(t,e),a=n.axis||`x`,o=n.includeInvisible||!1,s=n.intersect?G8(e,i,a,r,o):K8(e,i,a,!1,r,o),c=[];return s.length?(e.getSortedVisibleDatasetMetas().forEach(e=>{let t=s[0].index,n=e.data[t];n&&!n.skip&&c.push({element:n,datasetIndex:e.index,index:t})}),c):[]},dataset(e,t,n,r){let i=S6(t,e),a=n.axis||`xy`,o=n.includeInvisible||!1,s=n.intersect?G8(e,i,a,r,o):K8(e,i,a,!1,r,o);if(s.length>0){let t=s[0].datasetIndex,n=e.getDatasetMeta(t).data;s=[];for(let e=0;e<n.length;++e)s.push({element:n[e],datasetIndex:t,index:e})}return s},point(e,t,n,r){return G8(e,S6(t,e),n.axis||`xy`,r,n.includeInvisible||!1)},nearest(e,t,n,r){let i=S6(t,e),a=n.axis||`xy`,o=n.includeInvisible||!1;return K8(e,i,a,n.intersect,r,o)},x(e,t,n,r){return q8(e,S6(t,e),`x`,n.intersect,r)},y(e,t,n,r){return q8(e,S6(t,e),`y`,n.intersect,r)}}},y7=[`left`,`top`,`right`,`bottom`],b7={addBox(e,t){e.boxes||=[],t.fullSize=t.fullSize||!1,t.position=t.position||`top`,t.weight=t.weight||0,t._layers=t._layers||function(){return[{z:0,draw(e){t.draw(e)}}]},e.boxes.push(t)},removeBox(e,t){let n=e.boxes?e.boxes.indexOf(t):-1;n!==-1&&e.boxes.splice(n,1)},configure(e,t,n){t.fullSize=n.fullSize,t.position=n.position,t.weight=n.weight},update(e,t,n,r){if(!e)return;let i=i6(e.options.layout.padding),a=Math.max(t-i.width,0),o=Math.max(n-i.height,0),s=Que(e.boxes),c=s.vertical,l=s.horizontal;_3(e.boxes,e=>{typeof e.beforeLayout==`function`&&e.beforeLayout()});let u=c.reduce((e,t)=>t.box.options&&t.box.options.display===!1?e:e+1,0)||1,d=Object.freeze({outerWidth:t,outerHeight:n,padding:i,availableWidth:a,availableHeight:o,vBoxMaxWidth:a/2/u,hBoxMaxHeight:o/2}),f=Object.assign({},i);Q8(f,i6(r));let p=Object.assign({maxPadding:f,w:a,h:o,x:i.left,y:i.top},i),m=Zue(c.concat(l),d);$8(s.fullSize,p,d,m),$8(c,p,d,m),$8(l,p,d,m)&&$8(c,p,d,m),ede(p),t5(s.leftAndTop,p,d,m),p.x+=p.w,p.y+=p.h,t5(s.rightAndBottom,p,d,m),e.chartArea={left:p.left,top:p.top,right:p.left+p.w,bottom:p.top+p.h,height:p.h,width:p.w},_3(s.chartArea,t=>{let n=t.box;Object.assign(n,e.chartArea),n.update(p.w,p.h,{left:0,top:0,right:0,bottom:0})})}},x7=class{acquireContext(e,t){}releaseContext(e){return!1}addEventListener(e,t,n){}removeEventListener(e,t,n){}getDevicePixelRatio(){return 1}getMaximumSize(e,t,n,r){return t=Math.max(0,t||e.width),n||=e.height,{width:t,height:Math.max(0,r?Math.floor(t/r):n)}}isAttached(e){return!0}updateConfig(e){}},S7=class extends x7{acquireContext(e){return e&&e.getContext&&e.getContext(`2d`)||null}updateConfig(e){e.options.animation=!1}},C7=`$chartjs`,w7={touchstart:`mousedown`,touchmove:`mousemove`,touchend:`mouseup`,pointerenter:`mouseenter`,pointerdown:`mousedown`,pointermove:`mousemove`,pointerup:`mouseup`,pointerleave:`mouseout`,pointerout:`mouseout`},T7=e=>e===null||e===``,E7=M8?{passive:!0}:!1,D7=new Map,O7=0,k7=class extends x7{acquireContext(e,t){let n=e&&e.getContext&&e.getContext(`2d`);return n&&n.canvas===e?(nde(e,t),n):null}releaseContext(e){let t=e.canvas;if(!t[C7])return!1;let n=t[C7].initial;[`height`,`width`].forEach(e=>{let r=n[e];u3(r)?t.removeAttribute(e):t.setAttribute(e,r)});let r=n.style||{};return Object.keys(r).forEach(e=>{t.style[e]=r[e]}),t.width=t.width,delete t[C7],!0}addEventListener(e,t,n){this.removeEventListener(e,t);let r=e.$proxies||={};r[t]=({attach:ode,detach:sde,resize:ude}[t]||dde)(e,t,n)}removeEventListener(e,t){let n=e.$proxies||={},r=n[t];r&&(({attach:i5,detach:i5,resize:i5}[t]||ide)(e,t,r),n[t]=void 0)}getDevicePixelRatio(){return window.devicePixelRatio}getMaximumSize(e,t,n,r){return wue(e,t,n,r)}isAttached(e){let t=e&&y6(e);return!!(t&&t.isConnected)}},A7=class{static defaults={};static defaultRoutes=void 0;x;y;active=!1;options;$animations;tooltipPosition(e){let{x:t,y:n}=this.getProps([`x`,`y`],e);return{x:t,y:n}}hasValue(){return D3(this.x)&&D3(this.y)}getProps(e,t){let n=this.$animations;if(!t||!n)return this;let r={};return e.forEach(e=>{r[e]=n[e]&&n[e].active()?n[e]._to:this[e]}),r}},j7=e=>e===`left`?`right`:e===`right`?`left`:e,M7=(e,t,n)=>t===`top`||t===`left`?e[t]+n:e[t]-n,N7=(e,t)=>Math.min(t||e,e),P7=class e extends A7{constructor(e){super(),this.id=e.id,this.type=e.type,this.options=void 0,this.ctx=e.ctx,this.chart=e.chart,this.top=void 0,this.bottom=void 0,this.left=void 0,this.right=void 0,this.width=void 0,this.height=void 0,this._margins={left:0,right:0,top:0,bottom:0},this.maxWidth=void 0,this.maxHeight=void 0,this.paddingTop=void 0,this.paddingBottom=void 0,this.paddingLeft=void 0,this.paddingRight=void 0,this.axis=void 0,this.labelRotation=void 0,this.min=void 0,this.max=void 0,this._range=void 0,this.ticks=[],this._gridLineItems=null,this._labelItems=null,this._labelSizes=null,this._length=0,this._maxLength=0,this._longestTextCache={},this._startPixel=void 0,this._endPixel=void 0,this._reversePixels=!1,this._userMax=void 0,this._userMin=void 0,this._suggestedMax=void 0,this._suggestedMin=void 0,this._ticksLength=0,this._borderValue=0,this._cache={},this._dataLimitsCached=!1,this.$context=void 0}init(e){this.options=e.setContext(this.getContext()),this.axis=e.axis,this._userMin=this.parse(e.min),this._userMax=this.parse(e.max),this._suggestedMin=this.parse(e.suggestedMin),this._suggestedMax=this.parse(e.suggestedMax)}parse(e,t){return e}getUserBounds(){let{_userMin:e,_userMax:t,_suggestedMin:n,_suggestedMax:r}=this;return e=m3(e,1/0),t=m3(t,-1/0),n=m3(n,1/0),r=m3(r,-1/0),{min:m3(e,n),max:m3(t,r),minDefined:p3(e),maxDefined:p3(t)}}getMinMax(e){let{min:t,max:n,minDefined:r,maxDefined:i}=this.getUserBounds(),a;if(r&&i)return{min:t,max:n};let o=this.getMatchingVisibleMetas();for(let s=0,c=o.length;s<c;++s)a=o[s].controller.getMinMax(this,e),r||(t=Math.min(t,a.min)),i||(n=Math.max(n,a.max));return t=i&&t>n?n:t,n=r&&t>n?t:n,{min:m3(t,m3(n,t)),max:m3(n,m3(t,n))}}getPadding(){return{left:this.paddingLeft||0,top:this.paddingTop||0,right:this.paddingRight||0,bottom:this.paddingBottom||0}}getTicks(){return this.ticks}getLabels(){let e=this.chart.data;return this.options.labels||(this.isHorizontal()?e.xLabels:e.yLabels)||e.labels||[]}getLabelItems(e=this.chart.chartArea){return this._labelItems||=this._computeLabelItems(e)}beforeLayout(){this._cache={},this._dataLimitsCached=!1}beforeUpdate(){g3(this.options.beforeUpdate,[this])}update(e,t,n){let{beginAtZero:r,grace:i,ticks:a}=this.options,o=a.sampleSize;this.beforeUpdate(),this.maxWidth=e,this.maxHeight=t,this._margins=n=Object.assign({left:0,right:0,top:0,bottom:0},n),this.ticks=null,this._labelSizes=null,this._gridLineItems=null,this._labelItems=null,this.beforeSetDimensions(),this.setDimensions(),this.afterSetDimensions(),this._maxLength=this.isHorizontal()?this.width+n.left+n.right:this.height+n.top+n.bottom,this._dataLimitsCached||=(this.beforeDataLimits(),this.determineDataLimits(),this.afterDataLimits(),this._range=sue(this,i,r),!0),this.beforeBuildTicks(),this.ticks=this.buildTicks()||[],this.afterBuildTicks();let s=o<this.ticks.length;this._convertTicksToLabels(s?o5(this.ticks,o):this.ticks),this.configure(),this.beforeCalculateLabelRotation(),this.calculateLabelRotation(),this.afterCalculateLabelRotation(),a.display&&(a.autoSkip||a.source===`auto`)&&(this.ticks=pde(this,this.ticks),this._labelSizes=null,this.afterAutoSkip()),s&&this._convertTicksToLabels(this.ticks),this.beforeFit(),this.fit(),this.afterFit(),this.afterUpdate()}configure(){let e=this.options.reverse,t,n;this.isHorizontal()?(t=this.left,n=this.right):(t=this.top,n=this.bottom,e=!e),this._startPixel=t,this._endPixel=n,this._reversePixels=e,this._length=n-t,this._alignToPixels=this.options.alignToPixels}afterUpdate(){g3(this.options.afterUpdate,[this])}beforeSetDimensions(){g3(this.options.beforeSetDimensions,[this])}setDimensions(){this.isHorizontal()?(this.width=this.maxWidth,this.left=0,this.right=this.width):(this.height=this.maxHeight,this.top=0,this.bottom=this.height),this.paddingLeft=0,this.paddingTop=0,this.paddingRight=0,this.paddingBottom=0}afterSetDimensions(){g3(this.options.afterSetDimensions,[this])}_callHooks(e){this.chart.notifyPlugins(e,this.getContext()),g3(this.options[e],[this])}beforeDataLimits(){this._callHooks(`beforeDataLimits`)}determineDataLimits(){}afterDataLimits(){this._callHooks(`afterDataLimits`)}beforeBuildTicks(){this._callHooks(`beforeBuildTicks`)}buildTicks(){return[]}afterBuildTicks(){this._callHooks(`afterBuildTicks`)}beforeTickToLabelConversion(){g3(this.options.beforeTickToLabelConversion,[this])}generateTickLabels(e){let t=this.options.ticks,n,r,i;for(n=0,r=e.length;n<r;n++)i=e[n],i.label=g3(t.callback,[i.value,n,e],this)}afterTickToLabelConversion(){g3(this.options.afterTickToLabelConversion,[this])}beforeCalculateLabelRotation(){g3(this.options.beforeCalculateLabelRotation,[this])}calculateLabelRotation(){let e=this.options,t=e.ticks,n=N7(this.ticks.length,e.ticks.maxTicksLimit),r=t.minRotation||0,i=t.maxRotation,a=r,o,s,c;if(!this._isVisible()||!t.display||r>=i||n<=1||!this.isHorizontal()){this.labelRotation=r;return}let l=this._getLabelSizes(),u=l.widest.width,d=l.highest.height,f=F3(this.chart.width-u,0,this.maxWidth);o=e.offset?this.maxWidth/n:f/(n-1),u+6>o&&(o=f/(n-(e.offset?.5:1)),s=this.maxHeight-s5(e.grid)-t.padding-c5(e.title,this.chart.options.font),c=Math.sqrt(u*u+d*d),a=A3(Math.min(Math.asin(F3((l.highest.height+6)/o,-1,1)),Math.asin(F3(s/c,-1,1))-Math.asin(F3(d/c,-1,1)))),a=Math.max(r,Math.min(i,a))),this.labelRotation=a}afterCalculateLabelRotation(){g3(this.options.afterCalculateLabelRotation,[this])}afterAutoSkip(){}beforeFit(){g3(this.options.beforeFit,[this])}fit(){let e={width:0,height:0},{chart:t,options:{ticks:n,title:r,grid:i}}=this,a=this._isVisible(),o=this.isHorizontal();if(a){let a=c5(r,t.options.font);if(o?(e.width=this.maxWidth,e.height=s5(i)+a):(e.height=this.maxHeight,e.width=s5(i)+a),n.display&&this.ticks.length){let{first:t,last:r,widest:i,highest:a}=this._getLabelSizes(),s=n.padding*2,c=k3(this.labelRotation),l=Math.cos(c),u=Math.sin(c);if(o){let t=n.mirror?0:u*i.width+l*a.height;e.height=Math.min(this.maxHeight,e.height+t+s)}else{let t=n.mirror?0:l*i.width+u*a.height;e.width=Math.min(this.maxWidth,e.width+t+s)}this._calculatePadding(t,r,u,l)}}this._handleMargins(),o?(this.width=this._length=t.width-this._margins.left-this._margins.right,this.height=e.height):(this.width=e.width,this.height=this._length=t.height-this._margins.top-this._margins.bottom)}_calculatePadding(e,t,n,r){let{ticks:{align:i,padding:a},position:o}=this.options,s=this.labelRotation!==0,c=o!==`top`&&this.axis===`x`;if(this.isHorizontal()){let o=this.getPixelForTick(0)-this.left,l=this.right-this.getPixelForTick(this.ticks.length-1),u=0,d=0;s?c?(u=r*e.width,d=n*t.height):(u=n*e.height,d=r*t.width):i===`start`?d=t.width:i===`end`?u=e.width:i!==`inner`&&(u=e.width/2,d=t.width/2),this.paddingLeft=Math.max((u-o+a)*this.width/(this.width-o),0),this.paddingRight=Math.max((d-l+a)*this.width/(this.width-l),0)}else{let n=t.height/2,r=e.height/2;i===`start`?(n=0,r=e.height):i===`end`&&(n=t.height,r=0),this.paddingTop=n+a,this.paddingBottom=r+a}}_handleMargins(){this._margins&&(this._margins.left=Math.max(this.paddingLeft,this._margins.left),this._margins.top=Math.max(this.paddingTop,this._margins.top),this._margins.right=Math.max(this.paddingRight,this._margins.right),this._margins.bottom=Math.max(this.paddingBottom,this._margins.bottom))}afterFit(){g3(this.options.afterFit,[this])}isHorizontal(){let{axis:e,position:t}=this.options;return t===`top`||t===`bottom`||e===`x`}isFullSize(){return this.options.fullSize}_convertTicksToLabels(e){this.beforeTickToLabelConversion(),this.generateTickLabels(e);let t,n;for(t=0,n=e.length;t<n;t++)u3(e[t].label)&&(e.splice(t,1),n--,t--);this.afterTickToLabelConversion()}_getLabelSizes(){let e=this._labelSizes;if(!e){let t=this.options.ticks.sampleSize,n=this.ticks;t<n.length&&(n=o5(n,t)),this._labelSizes=e=this._computeLabelSizes(n,n.length,this.options.ticks.maxTicksLimit)}return e}_computeLabelSizes(e,t,n){let{ctx:r,_longestTextCache:i}=this,a=[],o=[],s=Math.floor(t/N7(t,n)),c=0,l=0,u,d,f,p,m,h,g,_,v,y,b;for(u=0;u<t;u+=s){if(p=e[u].label,m=this._resolveTickFontOptions(u),r.font=h=m.string,g=i[h]=i[h]||{data:{},gc:[]},_=m.lineHeight,v=y=0,!u3(p)&&!d3(p))v=K3(r,g.data,g.gc,v,p),y=_;else if(d3(p))for(d=0,f=p.length;d<f;++d)b=p[d],!u3(b)&&!d3(b)&&(v=K3(r,g.data,g.gc,v,b),y+=_);a.push(v),o.push(y),c=Math.max(v,c),l=Math.max(y,l)}bde(i,t);let x=a.indexOf(c),S=o.indexOf(l),C=e=>({width:a[e]||0,height:o[e]||0});return{first:C(0),last:C(t-1),widest:C(x),highest:C(S),widths:a,heights:o}}getLabelForValue(e){return e}getPixelForValue(e,t){return NaN}getValueForPixel(e){}getPixelForTick(e){let t=this.ticks;return e<0||e>t.length-1?null:this.getPixelForValue(t[e].value)}getPixelForDecimal(e){this._reversePixels&&(e=1-e);let t=this._startPixel+e*this._length;return Ble(this._alignToPixels?q3(this.chart,t,0):t)}getDecimalForPixel(e){let t=(e-this._startPixel)/this._length;return this._reversePixels?1-t:t}getBasePixel(){return this.getPixelForValue(this.getBaseValue())}getBaseValue(){let{min:e,max:t}=this;return e<0&&t<0?t:e>0&&t>0?e:0}getContext(e){let t=this.ticks||[];if(e>=0&&e<t.length){let n=t[e];return n.$context||=Sde(this.getContext(),e,n)}return this.$context||=xde(this.chart.getContext(),this)}_tickSize(){let e=this.options.ticks,t=k3(this.labelRotation),n=Math.abs(Math.cos(t)),r=Math.abs(Math.sin(t)),i=this._getLabelSizes(),a=e.autoSkipPadding||0,o=i?i.widest.width+a:0,s=i?i.highest.height+a:0;return this.isHorizontal()?s*n>o*r?o/n:s/r:s*r<o*n?s/n:o/r}_isVisible(){let e=this.options.display;return e===`auto`?this.getMatchingVisibleMetas().length>0:!!e}_computeGridLineItems(e){let t=this.axis,n=this.chart,r=this.options,{grid:i,position:a,border:o}=r,s=i.offset,c=this.isHorizontal(),l=this.ticks.length+ +!!s,u=s5(i),d=[],f=o.setContext(this.getContext()),p=f.display?f.width:0,m=p/2,h=function(e){return q3(n,e,p)},g,_,v,y,b,x,S,C,w,T,E,D;if(a===`top`)g=h(this.bottom),x=this.bottom-u,C=g-m,T=h(e.top)+m,D=e.bottom;else if(a===`bottom`)g=h(this.top),T=e.top,D=h(e.bottom)-m,x=g+m,C=this.top+u;else if(a===`left`)g=h(this.right),b=this.right-u,S=g-m,w=h(e.left)+m,E=e.right;else if(a===`right`)g=h(this.left),w=e.left,E=h(e.right)-m,b=g+m,S=this.left+u;else if(t===`x`){if(a===`center`)g=h((e.top+e.bottom)/2+.5);else if(f3(a)){let e=Object.keys(a)[0],t=a[e];g=h(this.chart.scales[e].getPixelForValue(t))}T=e.top,D=e.bottom,x=g+m,C=x+u}else if(t===`y`){if(a===`center`)g=h((e.left+e.right)/2);else if(f3(a)){let e=Object.keys(a)[0],t=a[e];g=h(this.chart.scales[e].getPixelForValue(t))}b=g-m,S=b-u,w=e.left,E=e.right}let ee=h3(r.ticks.maxTicksLimit,l),te=Math.max(1,Math.ceil(l/ee));for(_=0;_<l;_+=te){let e=this.getContext(_),t=i.setContext(e),r=o.setContext(e),a=t.lineWidth,l=t.color,u=r.dash||[],f=r.dashOffset,p=t.tickWidth,m=t.tickColor,h=t.tickBorderDash||[],g=t.tickBorderDashOffset;v=yde(this,_,s),v!==void 0&&(y=q3(n,v,a),c?b=S=w=E=y:x=C=T=D=y,d.push({tx1:b,ty1:x,tx2:S,ty2:C,x1:w,y1:T,x2:E,y2:D,width:a,color:l,borderDash:u,borderDashOffset:f,tickWidth:p,tickColor:m,tickBorderDash:h,tickBorderDashOffset:g}))}return this._ticksLength=l,this._borderValue=g,d}_computeLabelItems(e){let t=this.axis,n=this.options,{position:r,ticks:i}=n,a=this.isHorizontal(),o=this.ticks,{align:s,crossAlign:c,padding:l,mirror:u}=i,d=s5(n.grid),f=d+l,p=u?-l:f,m=-k3(this.labelRotation),h=[],g,_,v,y,b,x,S,C,w,T,E,D,ee=`middle`;if(r===`top`)x=this.bottom-p,S=this._getXAxisLabelAlignment();else if(r===`bottom`)x=this.top+p,S=this._getXAxisLabelAlignment();else if(r===`left`){let e=this._getYAxisLabelAlignment(d);S=e.textAlign,b=e.x}else if(r===`right`){let e=this._getYAxisLabelAlignment(d);S=e.textAlign,b=e.x}else if(t===`x`){if(r===`center`)x=(e.top+e.bottom)/2+f;else if(f3(r)){let e=Object.keys(r)[0],t=r[e];x=this.chart.scales[e].getPixelForValue(t)+f}S=this._getXAxisLabelAlignment()}else if(t===`y`){if(r===`center`)b=(e.left+e.right)/2-f;else if(f3(r)){let e=Object.keys(r)[0],t=r[e];b=this.chart.scales[e].getPixelForValue(t)}S=this._getYAxisLabelAlignment(d).textAlign}t===`y`&&(s===`start`?ee=`top`:s===`end`&&(ee=`bottom`));let te=this._getLabelSizes();for(g=0,_=o.length;g<_;++g){v=o[g],y=v.label;let e=i.setContext(this.getContext(g));C=this.getPixelForTick(g)+i.labelOffset,w=this._resolveTickFontOptions(g),T=w.lineHeight,E=d3(y)?y.length:1;let t=E/2,n=e.color,s=e.textStrokeColor,l=e.textStrokeWidth,d=S;a?(b=C,S===`inner`&&(d=g===_-1?this.options.reverse?`left`:`right`:g===0?this.options.reverse?`right`:`left`:`center`),D=r===`top`?c===`near`||m!==0?-E*T+T/2:c===`center`?-te.highest.height/2-t*T+T:-te.highest.height+T/2:c===`near`||m!==0?T/2:c===`center`?te.highest.height/2-t*T:te.highest.height-E*T,u&&(D*=-1),m!==0&&!e.showLabelBackdrop&&(b+=T/2*Math.sin(m))):(x=C,D=(1-E)*T/2);let f;if(e.showLabelBackdrop){let t=i6(e.backdropPadding),n=te.heights[g],r=te.widths[g],i=D-t.top,a=0-t.left;switch(ee){case`middle`:i-=n/2;break;case`bottom`:i-=n;break}switch(S){case`center`:a-=r/2;break;case`right`:a-=r;break;case`inner`:g===_-1?a-=r:g>0&&(a-=r/2);break}f={left:a,top:i,width:r+t.width,height:n+t.height,color:e.backdropColor}}h.push({label:y,font:w,textOffset:D,options:{rotation:m,color:n,strokeColor:s,strokeWidth:l,textAlign:d,textBaseline:ee,translation:[b,x],backdrop:f}})}return h}_getXAxisLabelAlignment(){let{position:e,ticks:t}=this.options;if(-k3(this.labelRotation))return e===`top`?`left`:`right`;let n=`center`;return t.align===`start`?n=`left`:t.align===`end`?n=`right`:t.align===`inner`&&(n=`inner`),n}_getYAxisLabelAlignment(e){let{position:t,ticks:{crossAlign:n,mirror:r,padding:i}}=this.options,a=this._getLabelSizes(),o=e+i,s=a.widest.width,c,l;return t===`left`?r?(l=this.right+i,n===`near`?c=`left`:n===`center`?(c=`center`,l+=s/2):(c=`right`,l+=s)):(l=this.right-o,n===`near`?c=`right`:n===`center`?(c=`center`,l-=s/2):(c=`left`,l=this.left)):t===`right`?r?(l=this.left+i,n===`near`?c=`right`:n===`center`?(c=`center`,l-=s/2):(c=`left`,l-=s)):(l=this.left+o,n===`near`?c=`left`:n===`center`?(c=`center`,l+=s/2):(c=`right`,l=this.right)):c=`right`,{textAlign:c,x:l}}_computeLabelArea(){if(this.options.ticks.mirror)return;let e=this.chart,t=this.options.position;if(t===`left`||t===`right`)return{top:0,left:this.left,bottom:e.height,right:this.right};if(t===`top`||t===`bottom`)return{top:this.top,left:0,bottom:this.bottom,right:e.width}}drawBackground(){let{ctx:e,options:{backgroundColor:t},left:n,top:r,width:i,height:a}=this;t&&(e.save(),e.fillStyle=t,e.fillRect(n,r,i,a),e.restore())}getLineWidthForValue(e){let t=this.options.grid;if(!this._isVisible()||!t.display)return 0;let n=this.ticks.findIndex(t=>t.value===e);return n>=0?t.setContext(this.getContext(n)).lineWidth:0}drawGrid(e){let t=this.options.grid,n=this.ctx,r=this._gridLineItems||=this._computeGridLineItems(e),i,a,o=(e,t,r)=>{!r.width||!r.color||(n.save(),n.lineWidth=r.width,n.strokeStyle=r.color,n.setLineDash(r.borderDash||[]),n.lineDashOffset=r.borderDashOffset,n.beginPath(),n.moveTo(e.x,e.y),n.lineTo(t.x,t.y),n.stroke(),n.restore())};if(t.display)for(i=0,a=r.length;i<a;++i){let e=r[i];t.drawOnChartArea&&o({x:e.x1,y:e.y1},{x:e.x2,y:e.y2},e),t.drawTicks&&o({x:e.tx1,y:e.ty1},{x:e.tx2,y:e.ty2},{color:e.tickColor,width:e.tickWidth,borderDash:e.tickBorderDash,borderDashOffset:e.tickBorderDashOffset})}}drawBorder(){let{chart:e,ctx:t,options:{border:n,grid:r}}=this,i=n.setContext(this.getContext()),a=n.display?i.width:0;if(!a)return;let o=r.setContext(this.getContext(0)).lineWidth,s=this._borderValue,c,l,u,d;this.isHorizontal()?(c=q3(e,this.left,a)-a/2,l=q3(e,this.right,o)+o/2,u=d=s):(u=q3(e,this.top,a)-a/2,d=q3(e,this.bottom,o)+o/2,c=l=s),t.save(),t.lineWidth=i.width,t.strokeStyle=i.color,t.beginPath(),t.moveTo(c,u),t.lineTo(l,d),t.stroke(),t.restore()}drawLabels(e){if(!this.options.ticks.display)return;let t=this.ctx,n=this._computeLabelArea();n&&Q3(t,n);let r=this.getLabelItems(e);for(let e of r){let n=e.options,r=e.font,i=e.label,a=e.textOffset;e6(t,i,0,a,r,n)}n&&$3(t)}drawTitle(){let{ctx:e,options:{position:t,title:n,reverse:r}}=this;if(!n.display)return;let i=a6(n.font),a=i6(n.padding),o=n.align,s=i.lineHeight/2;t===`bottom`||t===`center`||f3(t)?(s+=a.bottom,d3(n.text)&&(s+=i.lineHeight*(n.text.length-1))):s+=a.top;let{titleX:c,titleY:l,maxWidth:u,rotation:d}=wde(this,s,t,o);e6(e,n.text,0,0,i,{color:n.color,maxWidth:u,rotation:d,textAlign:Cde(o,t,r),textBaseline:`middle`,translation:[c,l]})}draw(e){this._isVisible()&&(this.drawBackground(),this.drawGrid(e),this.drawBorder(),this.drawTitle(),this.drawLabels(e))}_layers(){let t=this.options,n=t.ticks&&t.ticks.z||0,r=h3(t.grid&&t.grid.z,-1),i=h3(t.border&&t.border.z,0);return!this._isVisible()||this.draw!==e.prototype.draw?[{z:n,draw:e=>{this.draw(e)}}]:[{z:r,draw:e=>{this.drawBackground(),this.drawGrid(e),this.drawTitle()}},{z:i,draw:()=>{this.drawBorder()}},{z:n,draw:e=>{this.drawLabels(e)}}]}getMatchingVisibleMetas(e){let t=this.chart.getSortedVisibleDatasetMetas(),n=this.axis+`AxisID`,r=[],i,a;for(i=0,a=t.length;i<a;++i){let a=t[i];a[n]===this.id&&(!e||a.type===e)&&r.push(a)}return r}_resolveTickFontOptions(e){return a6(this.options.ticks.setContext(this.getContext(e)).font)}_maxDigits(){let e=this._resolveTickFontOptions(0).lineHeight;return(this.isHorizontal()?this.width:this.height)/e}},F7=class{constructor(e,t,n){this.type=e,this.scope=t,this.override=n,this.items=Object.create(null)}isForType(e){return Object.prototype.isPrototypeOf.call(this.type.prototype,e.prototype)}register(e){let t=Object.getPrototypeOf(e),n;Dde(t)&&(n=this.register(t));let r=this.items,i=e.id,a=this.scope+`.`+i;if(!i)throw Error(`class does not have id: `+e);return i in r?a:(r[i]=e,Tde(e,a,n),this.override&&v8.override(e.id,e.overrides),a)}get(e){return this.items[e]}unregister(e){let t=this.items,n=e.id,r=this.scope;n in t&&delete t[n],r&&n in v8[r]&&(delete v8[r][n],this.override&&delete h8[n])}},I7=class{constructor(){this.controllers=new F7(m7,`datasets`,!0),this.elements=new F7(A7,`elements`),this.plugins=new F7(Object,`plugins`),this.scales=new F7(P7,`scales`),this._typedRegistries=[this.controllers,this.scales,this.elements]}add(...e){this._each(`register`,e)}remove(...e){this._each(`unregister`,e)}addControllers(...e){this._each(`register`,e,this.controllers)}addElements(...e){this._each(`register`,e,this.elements)}addPlugins(...e){this._each(`register`,e,this.plugins)}addScales(...e){this._each(`register`,e,this.scales)}getController(e){return this._get(e,this.controllers,`controller`)}getElement(e){return this._get(e,this.elements,`element`)}getPlugin(e){return this._get(e,this.plugins,`plugin`)}getScale(e){return this._get(e,this.scales,`scale`)}removeControllers(...e){this._each(`unregister`,e,this.controllers)}removeElements(...e){this._each(`unregister`,e,this.elements)}removePlugins(...e){this._each(`unregister`,e,this.plugins)}removeScales(...e){this._each(`unregister`,e,this.scales)}_each(e,t,n){[...t].forEach(t=>{let r=n||this._getRegistryForType(t);n||r.isForType(t)||r===this.plugins&&t.id?this._exec(e,r,t):_3(t,t=>{let r=n||this._getRegistryForType(t);this._exec(e,r,t)})})}_exec(e,t,n){let r=w3(e);g3(n[`before`+r],[],n),t[e](n),g3(n[`after`+r],[],n)}_getRegistryForType(e){for(let t=0;t<this._typedRegistries.length;t++){let n=this._typedRegistries[t];if(n.isForType(e))return n}return this.plugins}_get(e,t,n){let r=t.get(e);if(r===void 0)throw Error(`"`+e+`" is not a registered `+n+`.`);return r}},L7=new I7,R7=class{constructor(){this._init=void 0}notify(e,t,n,r){if(t===`beforeInit`&&(this._init=this._createDescriptors(e,!0),this._notify(this._init,e,`install`)),this._init===void 0)return;let i=r?this._descriptors(e).filter(r):this._descriptors(e),a=this._notify(i,e,t,n);return t===`afterDestroy`&&(this._notify(i,e,`stop`),this._notify(this._init,e,`uninstall`),this._init=void 0),a}_notify(e,t,n,r){r||={};for(let i of e){let e=i.plugin,a=e[n];if(g3(a,[t,r,i.options],e)===!1&&r.cancelable)return!1}return!0}invalidate(){u3(this._cache)||(this._oldCache=this._cache,this._cache=void 0)}_descriptors(e){if(this._cache)return this._cache;let t=this._cache=this._createDescriptors(e);return this._notifyStateChanges(e),t}_createDescriptors(e,t){let n=e&&e.config,r=h3(n.options&&n.options.plugins,{}),i=Ode(n);return r===!1&&!t?[]:Ade(e,i,r,t)}_notifyStateChanges(e){let t=this._oldCache||[],n=this._cache,r=(e,t)=>e.filter(e=>!t.some(t=>e.plugin.id===t.plugin.id));this._notify(r(t,n),e,`stop`),this._notify(r(n,t),e,`start`)}},z7=new Map,B7=new Set,V7=(e,t,n)=>{let r=C3(t,n);r!==void 0&&e.add(r)},H7=class{constructor(e){this._config=Lde(e),this._scopeCache=new Map,this._resolverCache=new Map}get platform(){return this._config.platform}get type(){return this._config.type}set type(e){this._config.type=e}get data(){return this._config.data}set data(e){this._config.data=m5(e)}get options(){return this._config.options}set options(e){this._config.options=e}get plugins(){return this._config.plugins}update(){let e=this._config;this.clearCache(),p5(e)}clearCache(){this._scopeCache.clear(),this._resolverCache.clear()}datasetScopeKeys(e){return h5(e,()=>[[`datasets.${e}`,``]])}datasetAnimationScopeKeys(e,t){return h5(`${e}.transition.${t}`,()=>[[`datasets.${e}.transitions.${t}`,`transitions.${t}`],[`datasets.${e}`,``]])}datasetElementScopeKeys(e,t){return h5(`${e}-${t}`,()=>[[`datasets.${e}.elements.${t}`,`datasets.${e}`,`elements.${t}`,``]])}pluginScopeKeys(e){let t=e.id,n=this.type;return h5(`${n}-plugin-${t}`,()=>[[`plugins.${t}`,...e.additionalOptionScopes||[]]])}_cachedScopes(e,t){let n=this._scopeCache,r=n.get(e);return(!r||t)&&(r=new Map,n.set(e,r)),r}getOptionScopes(e,t,n){let{options:r,type:i}=this,a=this._cachedScopes(e,n),o=a.get(t);if(o)return o;let s=new Set;t.forEach(t=>{e&&(s.add(e),t.forEach(t=>V7(s,e,t))),t.forEach(e=>V7(s,r,e)),t.forEach(e=>V7(s,h8[i]||{},e)),t.forEach(e=>V7(s,v8,e)),t.forEach(e=>V7(s,g8,e))});let c=Array.from(s);return c.length===0&&c.push(Object.create(null)),B7.has(t)&&a.set(t,c),c}chartOptionScopes(){let{options:e,type:t}=this;return[e,h8[t]||{},v8.datasets[t]||{},{type:t},v8,g8]}resolveNamedOptions(e,t,n,r=[``]){let i={$shared:!0},{resolver:a,subPrefixes:o}=g5(this._resolverCache,e,r),s=a;if(Rde(a,t)){i.$shared=!1,n=V6(n)?n():n;let t=this.createResolver(e,n,o);s=l6(a,n,t)}for(let e of t)i[e]=s[e];return i}createResolver(e,t,n=[``],r){let{resolver:i}=g5(this._resolverCache,e,n);return f3(t)?l6(i,t,void 0,r):i}},U7=e=>f3(e)&&Object.getOwnPropertyNames(e).some(t=>V6(e[t])),W7=`4.5.1`,G7=[`top`,`bottom`,`left`,`right`,`chartArea`],K7={},q7=e=>{let t=b5(e);return Object.values(K7).filter(e=>e.canvas===t).pop()},J7=class{static defaults=v8;static instances=K7;static overrides=h8;static registry=L7;static version=W7;static getChart=q7;static register(...e){L7.add(...e),x5()}static unregister(...e){L7.remove(...e),x5()}constructor(e,t){let n=this.config=new H7(t),r=b5(e),i=q7(r);if(i)throw Error(`Canvas is already in use. Chart with ID '`+i.id+`' must be destroyed before the canvas with ID '`+i.canvas.id+`' can be reused.`);let a=n.createResolver(n.chartOptionScopes(),this.getContext());this.platform=new(n.platform||(fde(r))),this.platform.updateConfig(n);let o=this.platform.acquireContext(r,a.aspectRatio),s=o&&o.canvas,c=s&&s.height,l=s&&s.width;if(this.id=L6(),this.ctx=o,this.canvas=s,this.width=l,this.height=c,this._options=a,this._aspectRatio=this.aspectRatio,this._layers=[],this._metasets=[],this._stacks=void 0,this.boxes=[],this.currentDevicePixelRatio=void 0,this.chartArea=void 0,this._active=[],this._lastEvent=void 0,this._listeners={},this._responsiveListeners=void 0,this._sortedMetasets=[],this.scales={},this._plugins=new R7,this.$proxies={},this._hiddenIndices={},this.attached=!1,this._animationsDisabled=void 0,this.$context=void 0,this._doResize=Wle(e=>this.update(e),a.resizeDelay||0),this._dataChanges=[],K7[this.id]=this,!o||!s){console.error(`Failed to create chart: can't acquire context from the given item`);return}o7.listen(this,`complete`,y5),o7.listen(this,`progress`,zde),this._initialize(),this.attached&&this.update()}get aspectRatio(){let{options:{aspectRatio:e,maintainAspectRatio:t},width:n,height:r,_aspectRatio:i}=this;return u3(e)?t&&i?i:r?n/r:null:e}get data(){return this.config.data}set data(e){this.config.data=e}get options(){return this._options}set options(e){this.config.options=e}get registry(){return L7}_initialize(){return this.notifyPlugins(`beforeInit`),this.options.responsive?this.resize():C6(this,this.options.devicePixelRatio),this.bindEvents(),this.notifyPlugins(`afterInit`),this}clear(){return J3(this.canvas,this.ctx),this}stop(){return o7.stop(this),this}resize(e,t){o7.running(this)?this._resizeBeforeDraw={width:e,height:t}:this._resize(e,t)}_resize(e,t){let n=this.options,r=this.canvas,i=n.maintainAspectRatio&&this.aspectRatio,a=this.platform.getMaximumSize(r,e,t,i),o=n.devicePixelRatio||this.platform.getDevicePixelRatio(),s=this.width?`resize`:`attach`;this.width=a.width,this.height=a.height,this._aspectRatio=this.aspectRatio,C6(this,o,!0)&&(this.notifyPlugins(`resize`,{size:a}),g3(n.onResize,[this,a],this),this.attached&&this._doResize(s)&&this.render())}ensureScalesHaveIDs(){_3(this.options.scales||{},(e,t)=>{e.id=t})}buildOrUpdateScales(){let e=this.options,t=e.scales,n=this.scales,r=Object.keys(n).reduce((e,t)=>(e[t]=!1,e),{}),i=[];t&&(i=i.concat(Object.keys(t).map(e=>{let n=t[e],r=d5(e,n),i=r===`r`,a=r===`x`;return{options:n,dposition:i?`chartArea`:a?`bottom`:`left`,dtype:i?`radialLinear`:a?`category`:`linear`}}))),_3(i,t=>{let i=t.options,a=i.id,o=d5(a,i),s=h3(i.type,t.dtype);(i.position===void 0||_5(i.position,o)!==_5(t.dposition))&&(i.position=t.dposition),r[a]=!0;let c=null;a in n&&n[a].type===s?c=n[a]:(c=new(L7.getScale(s))({id:a,type:s,ctx:this.ctx,chart:this}),n[c.id]=c),c.init(i,e)}),_3(r,(e,t)=>{e||delete n[t]}),_3(n,e=>{b7.configure(this,e,e.options),b7.addBox(this,e)})}_updateMetasets(){let e=this._metasets,t=this.data.datasets.length,n=e.length;if(e.sort((e,t)=>e.index-t.index),n>t){for(let e=t;e<n;++e)this._destroyDatasetMeta(e);e.splice(t,n-t)}this._sortedMetasets=e.slice(0).sort(v5(`order`,`index`))}_removeUnreferencedMetasets(){let{_metasets:e,data:{datasets:t}}=this;e.length>t.length&&delete this._stacks,e.forEach((e,n)=>{t.filter(t=>t===e._dataset).length===0&&this._destroyDatasetMeta(n)})}buildOrUpdateControllers(){let e=[],t=this.data.datasets,n,r;for(this._removeUnreferencedMetasets(),n=0,r=t.length;n<r;n++){let r=t[n],i=this.getDatasetMeta(n),a=r.type||this.config.type;if(i.type&&i.type!==a&&(this._destroyDatasetMeta(n),i=this.getDatasetMeta(n)),i.type=a,i.indexAxis=r.indexAxis||l5(a,this.options),i.order=r.order||0,i.index=n,i.label=``+r.label,i.visible=this.isDatasetVisible(n),i.controller)i.controller.updateIndex(n),i.controller.linkScales();else{let t=L7.getController(a),{datasetElementType:r,dataElementType:o}=v8.datasets[a];Object.assign(t,{dataElementType:L7.getElement(o),datasetElementType:r&&L7.getElement(r)}),i.controller=new t(this,n),e.push(i.controller)}}return this._updateMetasets(),e}_resetElements(){_3(this.data.datasets,(e,t)=>{this.getDatasetMeta(t).controller.reset()},this)}reset(){this._resetElements(),this.notifyPlugins(`reset`)}update(e){let t=this.config;t.update();let n=this._options=t.createResolver(t.chartOptionScopes(),this.getContext()),r=this._animationsDisabled=!n.animation;if(this._updateScales(),this._checkEventBindings(),this._updateHiddenIndices(),this._plugins.invalidate(),this.notifyPlugins(`beforeUpdate`,{mode:e,cancelable:!0})===!1)return;let i=this.buildOrUpdateControllers();this.notifyPlugins(`beforeElementsUpdate`);let a=0;for(let e=0,t=this.data.datasets.length;e<t;e++){let{controller:t}=this.getDatasetMeta(e),n=!r&&i.indexOf(t)===-1;t.buildOrUpdateElements(n),a=Math.max(+t.getMaxOverflow(),a)}a=this._minPadding=n.layout.autoPadding?a:0,this._updateLayout(a),r||_3(i,e=>{e.reset()}),this._updateDatasets(e),this.notifyPlugins(`afterUpdate`,{mode:e}),this._layers.sort(v5(`z`,`_idx`));let{_active:o,_lastEvent:s}=this;s?this._eventHandler(s,!0):o.length&&this._updateHoverStyles(o,o,!0),this.render()}_updateScales(){_3(this.scales,e=>{b7.removeBox(this,e)}),this.ensureScalesHaveIDs(),this.buildOrUpdateScales()}_checkEventBindings(){let e=this.options;(!H6(new Set(Object.keys(this._listeners)),new Set(e.events))||!!this._responsiveListeners!==e.responsive)&&(this.unbindEvents(),this.bindEvents())}_updateHiddenIndices(){let{_hiddenIndices:e}=this,t=this._getUniformDataChanges()||[];for(let{method:n,start:r,count:i}of t)Bde(e,r,n===`_removeElements`?-i:i)}_getUniformDataChanges(){let e=this._dataChanges;if(!e||!e.length)return;this._dataChanges=[];let t=this.data.datasets.length,n=t=>new Set(e.filter(e=>e[0]===t).map((e,t)=>t+`,`+e.splice(1).join(`,`))),r=n(0);for(let e=1;e<t;e++)if(!H6(r,n(e)))return;return Array.from(r).map(e=>e.split(`,`)).map(e=>({method:e[1],start:+e[2],count:+e[3]}))}_updateLayout(e){if(this.notifyPlugins(`beforeLayout`,{cancelable:!0})===!1)return;b7.update(this,this.width,this.height,e);let t=this.chartArea,n=t.width<=0||t.height<=0;this._layers=[],_3(this.boxes,e=>{n&&e.position===`chartArea`||(e.configure&&e.configure(),this._layers.push(...e._layers()))},this),this._layers.forEach((e,t)=>{e._idx=t}),this.notifyPlugins(`afterLayout`)}_updateDatasets(e){if(this.notifyPlugins(`beforeDatasetsUpdate`,{mode:e,cancelable:!0})!==!1){for(let e=0,t=this.data.datasets.length;e<t;++e)this.getDatasetMeta(e).controller.configure();for(let t=0,n=this.data.datasets.length;t<n;++t)this._updateDataset(t,V6(e)?e({datasetIndex:t}):e);this.notifyPlugins(`afterDatasetsUpdate`,{mode:e})}}_updateDataset(e,t){let n=this.getDatasetMeta(e),r={meta:n,index:e,mode:t,cancelable:!0};this.notifyPlugins(`beforeDatasetUpdate`,r)!==!1&&(n.controller._update(t),r.cancelable=!1,this.notifyPlugins(`afterDatasetUpdate`,r))}render(){this.notifyPlugins(`beforeRender`,{cancelable:!0})!==!1&&(o7.has(this)?this.attached&&!o7.running(this)&&o7.start(this):(this.draw(),y5({chart:this})))}draw(){let e;if(this._resizeBeforeDraw){let{width:e,height:t}=this._resizeBeforeDraw;this._resizeBeforeDraw=null,this._resize(e,t)}if(this.clear(),this.width<=0||this.height<=0||this.notifyPlugins(`beforeDraw`,{cancelable:!0})===!1)return;let t=this._layers;for(e=0;e<t.length&&t[e].z<=0;++e)t[e].draw(this.chartArea);for(this._drawDatasets();e<t.length;++e)t[e].draw(this.chartArea);this.notifyPlugins(`afterDraw`)}_getSortedDatasetMetas(e){let t=this._sortedMetasets,n=[],r,i;for(r=0,i=t.length;r<i;++r){let i=t[r];(!e||i.visible)&&n.push(i)}return n}getSortedVisibleDatasetMetas(){return this._getSortedDatasetMetas(!0)}_drawDatasets(){if(this.notifyPlugins(`beforeDatasetsDraw`,{cancelable:!0})===!1)return;let e=this.getSortedVisibleDatasetMetas();for(let t=e.length-1;t>=0;--t)this._drawDataset(e[t]);this.notifyPlugins(`afterDatasetsDraw`)}_drawDataset(e){let t=this.ctx,n={meta:e,index:e.index,cancelable:!0},r=I6(this,e);this.notifyPlugins(`beforeDatasetDraw`,n)!==!1&&(r&&Q3(t,r),e.controller.draw(),r&&$3(t),n.cancelable=!1,this.notifyPlugins(`afterDatasetDraw`,n))}isPointInArea(e){return Z3(e,this.chartArea,this._minPadding)}getElementsAtEventForMode(e,t,n,r){let i=v7.modes[t];return typeof i==`function`?i(this,e,n,r):[]}getDatasetMeta(e){let t=this.data.datasets[e],n=this._metasets,r=n.filter(e=>e&&e._dataset===t).pop();return r||(r={type:null,data:[],dataset:null,controller:null,hidden:null,xAxisID:null,yAxisID:null,order:t&&t.order||0,index:e,_dataset:t,_parsed:[],_sorted:!1},n.push(r)),r}getContext(){return this.$context||=s6(null,{chart:this,type:`chart`})}getVisibleDatasetCount(){return this.getSortedVisibleDatasetMetas().length}isDatasetVisible(e){let t=this.data.datasets[e];if(!t)return!1;let n=this.getDatasetMeta(e);return typeof n.hidden==`boolean`?!n.hidden:!t.hidden}setDatasetVisibility(e,t){let n=this.getDatasetMeta(e);n.hidden=!t}toggleDataVisibility(e){this._hiddenIndices[e]=!this._hiddenIndices[e]}getDataVisibility(e){return!this._hiddenIndices[e]}_updateVisibility(e,t,n){let r=n?`show`:`hide`,i=this.getDatasetMeta(e),a=i.controller._resolveAnimations(void 0,r);B6(t)?(i.data[t].hidden=!n,this.update()):(this.setDatasetVisibility(e,n),a.update(i,{visible:n}),this.update(t=>t.datasetIndex===e?r:void 0))}hide(e,t){this._updateVisibility(e,t,!1)}show(e,t){this._updateVisibility(e,t,!0)}_destroyDatasetMeta(e){let t=this._metasets[e];t&&t.controller&&t.controller._destroy(),delete this._metasets[e]}_stop(){let e,t;for(this.stop(),o7.remove(this),e=0,t=this.data.datasets.length;e<t;++e)this._destroyDatasetMeta(e)}destroy(){this.notifyPlugins(`beforeDestroy`);let{canvas:e,ctx:t}=this;this._stop(),this.config.clearCache(),e&&(this.unbindEvents(),J3(e,t),this.platform.releaseContext(t),this.canvas=null,this.ctx=null),delete K7[this.id],this.notifyPlugins(`afterDestroy`)}toBase64Image(...e){return this.canvas.toDataURL(...e)}bindEvents(){this.bindUserEvents(),this.options.responsive?this.bindResponsiveEvents():this.attached=!0}bindUserEvents(){let e=this._listeners,t=this.platform,n=(n,r)=>{t.addEventListener(this,n,r),e[n]=r},r=(e,t,n)=>{e.offsetX=t,e.offsetY=n,this._eventHandler(e)};_3(this.options.events,e=>n(e,r))}bindResponsiveEvents(){this._responsiveListeners||={};let e=this._responsiveListeners,t=this.platform,n=(n,r)=>{t.addEventListener(this,n,r),e[n]=r},r=(n,r)=>{e[n]&&(t.removeEventListener(this,n,r),delete e[n])},i=(e,t)=>{this.canvas&&this.resize(e,t)},a,o=()=>{r(`attach`,o),this.attached=!0,this.resize(),n(`resize`,i),n(`detach`,a)};a=()=>{this.attached=!1,r(`resize`,i),this._stop(),this._resize(0,0),n(`attach`,o)},t.isAttached(this.canvas)?o():a()}unbindEvents(){_3(this._listeners,(e,t)=>{this.platform.removeEventListener(this,t,e)}),this._listeners={},_3(this._responsiveListeners,(e,t)=>{this.platform.removeEventListener(this,t,e)}),this._responsiveListeners=void 0}updateHoverStyle(e,t,n){let r=n?`set`:`remove`,i,a,o,s;for(t===`dataset`&&(i=this.getDatasetMeta(e[0].datasetIndex),i.controller[`_`+r+`DatasetHoverStyle`]()),o=0,s=e.length;o<s;++o){a=e[o];let t=a&&this.getDatasetMeta(a.datasetIndex).controller;t&&t[r+`HoverStyle`](a.element,a.datasetIndex,a.index)}}getActiveElements(){return this._active||[]}setActiveElements(e){let t=this._active||[],n=e.map(({datasetIndex:e,index:t})=>{let n=this.getDatasetMeta(e);if(!n)throw Error(`No dataset found at index `+e);return{datasetIndex:e,element:n.data[t],index:t}});v3(n,t)||(this._active=n,this._lastEvent=null,this._updateHoverStyles(n,t))}notifyPlugins(e,t,n){return this._plugins.notify(this,e,t,n)}isPluginEnabled(e){return this._plugins._cache.filter(t=>t.plugin.id===e).length===1}_updateHoverStyles(e,t,n){let r=this.options.hover,i=(e,t)=>e.filter(e=>!t.some(t=>e.datasetIndex===t.datasetIndex&&e.index===t.index)),a=i(t,e),o=n?e:i(e,t);a.length&&this.updateHoverStyle(a,r.mode,!1),o.length&&r.mode&&this.updateHoverStyle(o,r.mode,!0)}_eventHandler(e,t){let n={event:e,replay:t,cancelable:!0,inChartArea:this.isPointInArea(e)},r=t=>(t.options.events||this.options.events).includes(e.native.type);if(this.notifyPlugins(`beforeEvent`,n,r)===!1)return;let i=this._handleEvent(e,t,n.inChartArea);return n.cancelable=!1,this.notifyPlugins(`afterEvent`,n,r),(i||n.changed)&&this.render(),this}_handleEvent(e,t,n){let{_active:r=[],options:i}=this,a=t,o=this._getActiveElements(e,r,n,a),s=Ple(e),c=Vde(e,this._lastEvent,n,s);n&&(this._lastEvent=null,g3(i.onHover,[e,o,this],this),s&&g3(i.onClick,[e,o,this],this));let l=!v3(o,r);return(l||t)&&(this._active=o,this._updateHoverStyles(o,r,t)),this._lastEvent=c,l}_getActiveElements(e,t,n,r){if(e.type===`mouseout`)return[];if(!n)return t;let i=this.options.hover;return this.getElementsAtEventForMode(e,i.mode,i,r)}},Y7=typeof Path2D==`function`,X7=class extends A7{static id=`line`;static defaults={borderCapStyle:`butt`,borderDash:[],borderDashOffset:0,borderJoinStyle:`miter`,borderWidth:3,capBezierPoints:!0,cubicInterpolationMode:`default`,fill:!1,spanGaps:!1,stepped:!1,tension:0};static defaultRoutes={backgroundColor:`backgroundColor`,borderColor:`borderColor`};static descriptors={_scriptable:!0,_indexable:e=>e!==`borderDash`&&e!==`fill`};constructor(e){super(),this.animated=!0,this.options=void 0,this._chart=void 0,this._loop=void 0,this._fullLoop=void 0,this._path=void 0,this._points=void 0,this._segments=void 0,this._decimated=!1,this._pointsUpdated=!1,this._datasetIndex=void 0,e&&Object.assign(this,e)}updateControlPoints(e,t){let n=this.options;if((n.tension||n.cubicInterpolationMode===`monotone`)&&!n.stepped&&!this._pointsUpdated){let r=n.spanGaps?this._loop:this._fullLoop;bue(this._points,n,e,r,t),this._pointsUpdated=!0}}set points(e){this._points=e,delete this._segments,delete this._path,this._pointsUpdated=!1}get points(){return this._points}get segments(){return this._segments||=Aue(this,this.options.segment)}first(){let e=this.segments,t=this.points;return e.length&&t[e[0].start]}last(){let e=this.segments,t=this.points,n=e.length;return n&&t[e[n-1].end]}interpolate(e,t){let n=this.options,r=e[t],i=this.points,a=M6(this,{property:t,start:r,end:r});if(!a.length)return;let o=[],s=Kde(n),c,l;for(c=0,l=a.length;c<l;++c){let{start:l,end:u}=a[c],d=i[l],f=i[u];if(d===f){o.push(d);continue}let p=s(d,f,Math.abs((r-d[t])/(f[t]-d[t])),n.stepped);p[t]=e[t],o.push(p)}return o.length===1?o[0]:o}pathSegment(e,t,n){return w5(this)(e,this,t,n)}path(e,t,n){let r=this.segments,i=w5(this),a=this._loop;t||=0,n||=this.points.length-t;for(let o of r)a&=i(e,this,o,{start:t,end:t+n-1});return!!a}draw(e,t,n,r){let i=this.options||{};(this.points||[]).length&&i.borderWidth&&(e.save(),Yde(e,this,n,r),e.restore()),this.animated&&(this._pointsUpdated=!1,this._path=void 0)}},Z7=class extends A7{static id=`point`;parsed;skip;stop;static defaults={borderWidth:1,hitRadius:1,hoverBorderWidth:1,hoverRadius:4,pointStyle:`circle`,radius:3,rotation:0};static defaultRoutes={backgroundColor:`backgroundColor`,borderColor:`borderColor`};constructor(e){super(),this.options=void 0,this.parsed=void 0,this.skip=void 0,this.stop=void 0,e&&Object.assign(this,e)}inRange(e,t,n){let r=this.options,{x:i,y:a}=this.getProps([`x`,`y`],n);return(e-i)**2+(t-a)**2<(r.hitRadius+r.radius)**2}inXRange(e,t){return T5(this,e,`x`,t)}inYRange(e,t){return T5(this,e,`y`,t)}getCenterPoint(e){let{x:t,y:n}=this.getProps([`x`,`y`],e);return{x:t,y:n}}size(e){e=e||this.options||{};let t=e.radius||0;t=Math.max(t,t&&e.hoverRadius||0);let n=t&&e.borderWidth||0;return(t+n)*2}draw(e,t){let n=this.options;this.skip||n.radius<.1||!Z3(this,t,this.size(n)/2)||(e.strokeStyle=n.borderColor,e.lineWidth=n.borderWidth,e.fillStyle=n.backgroundColor,Y3(e,n,this.x,this.y))}getRange(){let e=this.options||{};return e.radius+e.hitRadius}},Q7=class{constructor(e){this.x=e.x,this.y=e.y,this.radius=e.radius}pathSegment(e,t,n){let{x:r,y:i,radius:a}=this;return t||={start:0,end:W6},e.arc(r,i,a,t.end,t.start,!0),!n.bounds}interpolate(e){let{x:t,y:n,radius:r}=this,i=e.angle;return{x:t+Math.cos(i)*r,y:n+Math.sin(i)*r,angle:i}}},$7={id:`filler`,afterDatasetsUpdate(e,t,n){let r=(e.data.datasets||[]).length,i=[],a,o,s,c;for(o=0;o<r;++o)a=e.getDatasetMeta(o),s=a.dataset,c=null,s&&s.options&&s instanceof X7&&(c={visible:e.isDatasetVisible(o),index:o,fill:$de(s,o,r),chart:e,axis:a.controller.options.indexAxis,scale:a.vScale,line:s}),a.$filler=c,i.push(c);for(o=0;o<r;++o)c=i[o],!(!c||c.fill===!1)&&(c.fill=Qde(i,o,n.propagate))},beforeDraw(e,t,n){let r=n.drawTime===`beforeDraw`,i=e.getSortedVisibleDatasetMetas(),a=e.chartArea;for(let t=i.length-1;t>=0;--t){let n=i[t].$filler;n&&(n.line.updateControlPoints(a,n.axis),r&&n.fill&&j5(e.ctx,n,a))}},beforeDatasetsDraw(e,t,n){if(n.drawTime!==`beforeDatasetsDraw`)return;let r=e.getSortedVisibleDatasetMetas();for(let t=r.length-1;t>=0;--t){let n=r[t].$filler;A5(n)&&j5(e.ctx,n,e.chartArea)}},beforeDatasetDraw(e,t,n){let r=t.meta.$filler;!A5(r)||n.drawTime!==`beforeDatasetDraw`||j5(e.ctx,r,e.chartArea)},defaults:{propagate:!0,drawTime:`beforeDatasetDraw`}},e9=(e,t)=>{let{boxHeight:n=t,boxWidth:r=t}=e;return e.usePointStyle&&(n=Math.min(n,t),r=e.pointStyleWidth||Math.min(r,t)),{boxWidth:r,boxHeight:n,itemHeight:Math.max(t,n)}},t9=(e,t)=>e!==null&&t!==null&&e.datasetIndex===t.datasetIndex&&e.index===t.index,n9=class extends A7{constructor(e){super(),this._added=!1,this.legendHitBoxes=[],this._hoveredItem=null,this.doughnutMode=!1,this.chart=e.chart,this.options=e.options,this.ctx=e.ctx,this.legendItems=void 0,this.columnSizes=void 0,this.lineWidths=void 0,this.maxHeight=void 0,this.maxWidth=void 0,this.top=void 0,this.bottom=void 0,this.left=void 0,this.right=void 0,this.height=void 0,this.width=void 0,this._margins=void 0,this.position=void 0,this.weight=void 0,this.fullSize=void 0}update(e,t,n){this.maxWidth=e,this.maxHeight=t,this._margins=n,this.setDimensions(),this.buildLabels(),this.fit()}setDimensions(){this.isHorizontal()?(this.width=this.maxWidth,this.left=this._margins.left,this.right=this.width):(this.height=this.maxHeight,this.top=this._margins.top,this.bottom=this.height)}buildLabels(){let e=this.options.labels||{},t=g3(e.generateLabels,[this.chart],this)||[];e.filter&&(t=t.filter(t=>e.filter(t,this.chart.data))),e.sort&&(t=t.sort((t,n)=>e.sort(t,n,this.chart.data))),this.options.reverse&&t.reverse(),this.legendItems=t}fit(){let{options:e,ctx:t}=this;if(!e.display){this.width=this.height=0;return}let n=e.labels,r=a6(n.font),i=r.size,a=this._computeTitleHeight(),{boxWidth:o,itemHeight:s}=e9(n,i),c,l;t.font=r.string,this.isHorizontal()?(c=this.maxWidth,l=this._fitRows(a,i,o,s)+10):(l=this.maxHeight,c=this._fitCols(a,r,o,s)+10),this.width=Math.min(c,e.maxWidth||this.maxWidth),this.height=Math.min(l,e.maxHeight||this.maxHeight)}_fitRows(e,t,n,r){let{ctx:i,maxWidth:a,options:{labels:{padding:o}}}=this,s=this.legendHitBoxes=[],c=this.lineWidths=[0],l=r+o,u=e;i.textAlign=`left`,i.textBaseline=`middle`;let d=-1,f=-l;return this.legendItems.forEach((e,p)=>{let m=n+t/2+i.measureText(e.text).width;(p===0||c[c.length-1]+m+2*o>a)&&(u+=l,c[c.length-(p>0?0:1)]=0,f+=l,d++),s[p]={left:0,top:f,row:d,width:m,height:r},c[c.length-1]+=m+o}),u}_fitCols(e,t,n,r){let{ctx:i,maxHeight:a,options:{labels:{padding:o}}}=this,s=this.legendHitBoxes=[],c=this.columnSizes=[],l=a-e,u=o,d=0,f=0,p=0,m=0;return this.legendItems.forEach((e,a)=>{let{itemWidth:h,itemHeight:g}=hfe(n,t,i,e,r);a>0&&f+g+2*o>l&&(u+=d+o,c.push({width:d,height:f}),p+=d+o,m++,d=f=0),s[a]={left:p,top:f,col:m,width:h,height:g},d=Math.max(d,h),f+=g+o}),u+=d,c.push({width:d,height:f}),u}adjustHitBoxes(){if(!this.options.display)return;let e=this._computeTitleHeight(),{legendHitBoxes:t,options:{align:n,labels:{padding:r},rtl:i}}=this,a=E6(i,this.left,this.width);if(this.isHorizontal()){let i=0,o=i8(n,this.left+r,this.right-this.lineWidths[i]);for(let s of t)i!==s.row&&(i=s.row,o=i8(n,this.left+r,this.right-this.lineWidths[i])),s.top+=this.top+e+r,s.left=a.leftForLtr(a.x(o),s.width),o+=s.width+r}else{let i=0,o=i8(n,this.top+e+r,this.bottom-this.columnSizes[i].height);for(let s of t)s.col!==i&&(i=s.col,o=i8(n,this.top+e+r,this.bottom-this.columnSizes[i].height)),s.top=o,s.left+=this.left+r,s.left=a.leftForLtr(a.x(s.left),s.width),o+=s.height+r}}isHorizontal(){return this.options.position===`top`||this.options.position===`bottom`}draw(){if(this.options.display){let e=this.ctx;Q3(e,this),this._draw(),$3(e)}}_draw(){let{options:e,columnSizes:t,lineWidths:n,ctx:r}=this,{align:i,labels:a}=e,o=v8.color,s=E6(e.rtl,this.left,this.width),c=a6(a.font),{padding:l}=a,u=c.size,d=u/2,f;this.drawTitle(),r.textAlign=s.textAlign(`left`),r.textBaseline=`middle`,r.lineWidth=.5,r.font=c.string;let{boxWidth:p,boxHeight:m,itemHeight:h}=e9(a,u),g=function(e,t,n){if(isNaN(p)||p<=0||isNaN(m)||m<0)return;r.save();let i=h3(n.lineWidth,1);if(r.fillStyle=h3(n.fillStyle,o),r.lineCap=h3(n.lineCap,`butt`),r.lineDashOffset=h3(n.lineDashOffset,0),r.lineJoin=h3(n.lineJoin,`miter`),r.lineWidth=i,r.strokeStyle=h3(n.strokeStyle,o),r.setLineDash(h3(n.lineDash,[])),a.usePointStyle){let o={radius:m*Math.SQRT2/2,pointStyle:n.pointStyle,rotation:n.rotation,borderWidth:i},c=s.xPlus(e,p/2),l=t+d;X3(r,o,c,l,a.pointStyleWidth&&p)}else{let a=t+Math.max((u-m)/2,0),o=s.leftForLtr(e,p),c=r6(n.borderRadius);r.beginPath(),Object.values(c).some(e=>e!==0)?t6(r,{x:o,y:a,w:p,h:m,radius:c}):r.rect(o,a,p,m),r.fill(),i!==0&&r.stroke()}r.restore()},_=function(e,t,n){e6(r,n.text,e,t+h/2,c,{strikethrough:n.hidden,textAlign:s.textAlign(n.textAlign)})},v=this.isHorizontal(),y=this._computeTitleHeight();f=v?{x:i8(i,this.left+l,this.right-n[0]),y:this.top+l+y,line:0}:{x:this.left+l,y:i8(i,this.top+y+l,this.bottom-t[0].height),line:0},D6(this.ctx,e.textDirection);let b=h+l;this.legendItems.forEach((o,u)=>{r.strokeStyle=o.fontColor,r.fillStyle=o.fontColor;let m=r.measureText(o.text).width,h=s.textAlign(o.textAlign||=a.textAlign),x=p+d+m,S=f.x,C=f.y;s.setWidth(this.width),v?u>0&&S+x+l>this.right&&(C=f.y+=b,f.line++,S=f.x=i8(i,this.left+l,this.right-n[f.line])):u>0&&C+b>this.bottom&&(S=f.x=S+t[f.line].width+l,f.line++,C=f.y=i8(i,this.top+y+l,this.bottom-t[f.line].height));let w=s.x(S);if(g(w,C,o),S=a8(h,S+p+d,v?S+x:this.right,e.rtl),_(s.x(S),C,o),v)f.x+=x+l;else if(typeof o.text!=`string`){let e=c.lineHeight;f.y+=I5(o,e)+l}else f.y+=b}),O6(this.ctx,e.textDirection)}drawTitle(){let e=this.options,t=e.title,n=a6(t.font),r=i6(t.padding);if(!t.display)return;let i=E6(e.rtl,this.left,this.width),a=this.ctx,o=t.position,s=n.size/2,c=r.top+s,l,u=this.left,d=this.width;if(this.isHorizontal())d=Math.max(...this.lineWidths),l=this.top+c,u=i8(e.align,u,this.right-d);else{let t=this.columnSizes.reduce((e,t)=>Math.max(e,t.height),0);l=c+i8(e.align,this.top,this.bottom-t-e.labels.padding-this._computeTitleHeight())}let f=i8(o,u,u+d);a.textAlign=i.textAlign(r8(o)),a.textBaseline=`middle`,a.strokeStyle=t.color,a.fillStyle=t.color,a.font=n.string,e6(a,t.text,f,l,n)}_computeTitleHeight(){let e=this.options.title,t=a6(e.font),n=i6(e.padding);return e.display?t.lineHeight+n.height:0}_getLegendItemAt(e,t){let n,r,i;if(I3(e,this.left,this.right)&&I3(t,this.top,this.bottom)){for(i=this.legendHitBoxes,n=0;n<i.length;++n)if(r=i[n],I3(e,r.left,r.left+r.width)&&I3(t,r.top,r.top+r.height))return this.legendItems[n]}return null}handleEvent(e){let t=this.options;if(!vfe(e.type,t))return;let n=this._getLegendItemAt(e.x,e.y);if(e.type===`mousemove`||e.type===`mouseout`){let r=this._hoveredItem,i=t9(r,n);r&&!i&&g3(t.onLeave,[e,r,this],this),this._hoveredItem=n,n&&!i&&g3(t.onHover,[e,n,this],this)}else n&&g3(t.onClick,[e,n,this],this)}},r9={id:`legend`,_element:n9,start(e,t,n){let r=e.legend=new n9({ctx:e.ctx,options:n,chart:e});b7.configure(e,r,n),b7.addBox(e,r)},stop(e){b7.removeBox(e,e.legend),delete e.legend},beforeUpdate(e,t,n){let r=e.legend;b7.configure(e,r,n),r.options=n},afterUpdate(e){let t=e.legend;t.buildLabels(),t.adjustHitBoxes()},afterEvent(e,t){t.replay||e.legend.handleEvent(t.event)},defaults:{display:!0,position:`top`,align:`center`,fullSize:!0,reverse:!1,weight:1e3,onClick(e,t,n){let r=t.datasetIndex,i=n.chart;i.isDatasetVisible(r)?(i.hide(r),t.hidden=!0):(i.show(r),t.hidden=!1)},onHover:null,onLeave:null,labels:{color:e=>e.chart.options.color,boxWidth:40,padding:10,generateLabels(e){let t=e.data.datasets,{labels:{usePointStyle:n,pointStyle:r,textAlign:i,color:a,useBorderRadius:o,borderRadius:s}}=e.legend.options;return e._getSortedDatasetMetas().map(e=>{let c=e.controller.getStyle(n?0:void 0),l=i6(c.borderWidth);return{text:t[e.index].label,fillStyle:c.backgroundColor,fontColor:a,hidden:!e.visible,lineCap:c.borderCapStyle,lineDash:c.borderDash,lineDashOffset:c.borderDashOffset,lineJoin:c.borderJoinStyle,lineWidth:(l.width+l.height)/4,strokeStyle:c.borderColor,pointStyle:r||c.pointStyle,rotation:c.rotation,textAlign:i||c.textAlign,borderRadius:o&&(s||c.borderRadius),datasetIndex:e.index}},this)}},title:{color:e=>e.chart.options.color,display:!1,position:`center`,text:``}},descriptors:{_scriptable:e=>!e.startsWith(`on`),labels:{_scriptable:e=>![`generateLabels`,`filter`,`sort`].includes(e)}}},i9=class extends A7{constructor(e){super(),this.chart=e.chart,this.options=e.options,this.ctx=e.ctx,this._padding=void 0,this.top=void 0,this.bottom=void 0,this.left=void 0,this.right=void 0,this.width=void 0,this.height=void 0,this.position=void 0,this.weight=void 0,this.fullSize=void 0}update(e,t){let n=this.options;if(this.left=0,this.top=0,!n.display){this.width=this.height=this.right=this.bottom=0;return}this.width=this.right=e,this.height=this.bottom=t;let r=d3(n.text)?n.text.length:1;this._padding=i6(n.padding);let i=r*a6(n.font).lineHeight+this._padding.height;this.isHorizontal()?this.height=i:this.width=i}isHorizontal(){let e=this.options.position;return e===`top`||e===`bottom`}_drawArgs(e){let{top:t,left:n,bottom:r,right:i,options:a}=this,o=a.align,s=0,c,l,u;return this.isHorizontal()?(l=i8(o,n,i),u=t+e,c=i-n):(a.position===`left`?(l=n+e,u=i8(o,r,t),s=U6*-.5):(l=i-e,u=i8(o,t,r),s=U6*.5),c=r-t),{titleX:l,titleY:u,maxWidth:c,rotation:s}}draw(){let e=this.ctx,t=this.options;if(!t.display)return;let n=a6(t.font),r=n.lineHeight/2+this._padding.top,{titleX:i,titleY:a,maxWidth:o,rotation:s}=this._drawArgs(r);e6(e,t.text,0,0,n,{color:t.color,maxWidth:o,rotation:s,textAlign:r8(t.align),textBaseline:`middle`,translation:[i,a]})}},a9={id:`title`,_element:i9,start(e,t,n){yfe(e,n)},stop(e){let t=e.titleBlock;b7.removeBox(e,t),delete e.titleBlock},beforeUpdate(e,t,n){let r=e.titleBlock;b7.configure(e,r,n),r.options=n},defaults:{align:`center`,display:!1,font:{weight:`bold`},fullSize:!0,padding:10,position:`top`,text:``,weight:2e3},defaultRoutes:{color:`color`},descriptors:{_scriptable:!0,_indexable:!1}},o9={average(e){if(!e.length)return!1;let t,n,r=new Set,i=0,a=0;for(t=0,n=e.length;t<n;++t){let n=e[t].element;if(n&&n.hasValue()){let e=n.tooltipPosition();r.add(e.x),i+=e.y,++a}}return a===0||r.size===0?!1:{x:[...r].reduce((e,t)=>e+t)/r.size,y:i/a}},nearest(e,t){if(!e.length)return!1;let n=t.x,r=t.y,i=1/0,a,o,s;for(a=0,o=e.length;a<o;++a){let n=e[a].element;if(n&&n.hasValue()){let e=M3(t,n.getCenterPoint());e<i&&(i=e,s=n)}}if(s){let e=s.tooltipPosition();n=e.x,r=e.y}return{x:n,y:r}}},s9={beforeTitle:l3,title(e){if(e.length>0){let t=e[0],n=t.chart.data.labels,r=n?n.length:0;if(this&&this.options&&this.options.mode===`dataset`)return t.dataset.label||``;if(t.label)return t.label;if(r>0&&t.dataIndex<r)return n[t.dataIndex]}return``},afterTitle:l3,beforeBody:l3,beforeLabel:l3,label(e){if(this&&this.options&&this.options.mode===`dataset`)return e.label+`: `+e.formattedValue||e.formattedValue;let t=e.dataset.label||``;t&&(t+=`: `);let n=e.formattedValue;return u3(n)||(t+=n),t},labelColor(e){let t=e.chart.getDatasetMeta(e.datasetIndex).controller.getStyle(e.dataIndex);return{borderColor:t.borderColor,backgroundColor:t.backgroundColor,borderWidth:t.borderWidth,borderDash:t.borderDash,borderDashOffset:t.borderDashOffset,borderRadius:0}},labelTextColor(){return this.options.bodyColor},labelPointStyle(e){let t=e.chart.getDatasetMeta(e.datasetIndex).controller.getStyle(e.dataIndex);return{pointStyle:t.pointStyle,rotation:t.rotation}},afterLabel:l3,afterBody:l3,beforeFooter:l3,footer:l3,afterFooter:l3},c9=class extends A7{static positioners=o9;constructor(e){super(),this.opacity=0,this._active=[],this._eventPosition=void 0,this._size=void 0,this._cachedAnimations=void 0,this._tooltipItems=[],this.$animations=void 0,this.$context=void 0,this.chart=e.chart,this.options=e.options,this.dataPoints=void 0,this.title=void 0,this.beforeBody=void 0,this.body=void 0,this.afterBody=void 0,this.footer=void 0,this.xAlign=void 0,this.yAlign=void 0,this.x=void 0,this.y=void 0,this.height=void 0,this.width=void 0,this.caretX=void 0,this.caretY=void 0,this.labelColors=void 0,this.labelPointStyles=void 0,this.labelTextColors=void 0}initialize(e){this.options=e,this._cachedAnimations=void 0,this.$context=void 0}_resolveAnimations(){let e=this._cachedAnimations;if(e)return e;let t=this.chart,n=this.options.setContext(this.getContext()),r=n.enabled&&t.options.animation&&n.animations,i=new u7(this.chart,r);return r._cacheable&&(this._cachedAnimations=Object.freeze(i)),i}getContext(){return this.$context||=Efe(this.chart.getContext(),this,this._tooltipItems)}getTitle(e,t){let{callbacks:n}=t,r=G5(n,`beforeTitle`,this,e),i=G5(n,`title`,this,e),a=G5(n,`afterTitle`,this,e),o=[];return o=L5(o,R5(r)),o=L5(o,R5(i)),o=L5(o,R5(a)),o}getBeforeBody(e,t){return U5(G5(t.callbacks,`beforeBody`,this,e))}getBody(e,t){let{callbacks:n}=t,r=[];return _3(e,e=>{let t={before:[],lines:[],after:[]},i=W5(n,e);L5(t.before,R5(G5(i,`beforeLabel`,this,e))),L5(t.lines,G5(i,`label`,this,e)),L5(t.after,R5(G5(i,`afterLabel`,this,e))),r.push(t)}),r}getAfterBody(e,t){return U5(G5(t.callbacks,`afterBody`,this,e))}getFooter(e,t){let{callbacks:n}=t,r=G5(n,`beforeFooter`,this,e),i=G5(n,`footer`,this,e),a=G5(n,`afterFooter`,this,e),o=[];return o=L5(o,R5(r)),o=L5(o,R5(i)),o=L5(o,R5(a)),o}_createItems(e){let t=this._active,n=this.chart.data,r=[],i=[],a=[],o=[],s,c;for(s=0,c=t.length;s<c;++s)o.push(bfe(this.chart,t[s]));return e.filter&&(o=o.filter((t,r,i)=>e.filter(t,r,i,n))),e.itemSort&&(o=o.sort((t,r)=>e.itemSort(t,r,n))),_3(o,t=>{let n=W5(e.callbacks,t);r.push(G5(n,`labelColor`,this,t)),i.push(G5(n,`labelPointStyle`,this,t)),a.push(G5(n,`labelTextColor`,this,t))}),this.labelColors=r,this.labelPointStyles=i,this.labelTextColors=a,this.dataPoints=o,o}update(e,t){let n=this.options.setContext(this.getContext()),r=this._active,i,a=[];if(!r.length)this.opacity!==0&&(i={opacity:0});else{let e=o9[n.position].call(this,r,this._eventPosition);a=this._createItems(n),this.title=this.getTitle(a,n),this.beforeBody=this.getBeforeBody(a,n),this.body=this.getBody(a,n),this.afterBody=this.getAfterBody(a,n),this.footer=this.getFooter(a,n);let t=this._size=z5(this,n),o=Object.assign({},e,t),s=B5(this.chart,n,o),c=V5(n,o,s,this.chart);this.xAlign=s.xAlign,this.yAlign=s.yAlign,i={opacity:1,x:c.x,y:c.y,width:t.width,height:t.height,caretX:e.x,caretY:e.y}}this._tooltipItems=a,this.$context=void 0,i&&this._resolveAnimations().update(this,i),e&&n.external&&n.external.call(this,{chart:this.chart,tooltip:this,replay:t})}drawCaret(e,t,n,r){let i=this.getCaretPosition(e,n,r);t.lineTo(i.x1,i.y1),t.lineTo(i.x2,i.y2),t.lineTo(i.x3,i.y3)}getCaretPosition(e,t,n){let{xAlign:r,yAlign:i}=this,{caretSize:a,cornerRadius:o}=n,{topLeft:s,topRight:c,bottomLeft:l,bottomRight:u}=r6(o),{x:d,y:f}=e,{width:p,height:m}=t,h,g,_,v,y,b;return i===`center`?(y=f+m/2,r===`left`?(h=d,g=h-a,v=y+a,b=y-a):(h=d+p,g=h+a,v=y-a,b=y+a),_=h):(g=r===`left`?d+Math.max(s,l)+a:r===`right`?d+p-Math.max(c,u)-a:this.caretX,i===`top`?(v=f,y=v-a,h=g-a,_=g+a):(v=f+m,y=v+a,h=g+a,_=g-a),b=v),{x1:h,x2:g,x3:_,y1:v,y2:y,y3:b}}drawTitle(e,t,n){let r=this.title,i=r.length,a,o,s;if(i){let c=E6(n.rtl,this.x,this.width);for(e.x=H5(this,n.titleAlign,n),t.textAlign=c.textAlign(n.titleAlign),t.textBaseline=`middle`,a=a6(n.titleFont),o=n.titleSpacing,t.fillStyle=n.titleColor,t.font=a.string,s=0;s<i;++s)t.fillText(r[s],c.x(e.x),e.y+a.lineHeight/2),e.y+=a.lineHeight+o,s+1===i&&(e.y+=n.titleMarginBottom-o)}}_drawColorBox(e,t,n,r,i){let a=this.labelColors[n],o=this.labelPointStyles[n],{boxHeight:s,boxWidth:c}=i,l=a6(i.bodyFont),u=H5(this,`left`,i),d=r.x(u),f=s<l.lineHeight?(l.lineHeight-s)/2:0,p=t.y+f;if(i.usePointStyle){let t={radius:Math.min(c,s)/2,pointStyle:o.pointStyle,rotation:o.rotation,borderWidth:1},n=r.leftForLtr(d,c)+c/2,l=p+s/2;e.strokeStyle=i.multiKeyBackground,e.fillStyle=i.multiKeyBackground,Y3(e,t,n,l),e.strokeStyle=a.borderColor,e.fillStyle=a.backgroundColor,Y3(e,t,n,l)}else{e.lineWidth=f3(a.borderWidth)?Math.max(...Object.values(a.borderWidth)):a.borderWidth||1,e.strokeStyle=a.borderColor,e.setLineDash(a.borderDash||[]),e.lineDashOffset=a.borderDashOffset||0;let t=r.leftForLtr(d,c),n=r.leftForLtr(r.xPlus(d,1),c-2),o=r6(a.borderRadius);Object.values(o).some(e=>e!==0)?(e.beginPath(),e.fillStyle=i.multiKeyBackground,t6(e,{x:t,y:p,w:c,h:s,radius:o}),e.fill(),e.stroke(),e.fillStyle=a.backgroundColor,e.beginPath(),t6(e,{x:n,y:p+1,w:c-2,h:s-2,radius:o}),e.fill()):(e.fillStyle=i.multiKeyBackground,e.fillRect(t,p,c,s),e.strokeRect(t,p,c,s),e.fillStyle=a.backgroundColor,e.fillRect(n,p+1,c-2,s-2))}e.fillStyle=this.labelTextColors[n]}drawBody(e,t,n){let{body:r}=this,{bodySpacing:i,bodyAlign:a,displayColors:o,boxHeight:s,boxWidth:c,boxPadding:l}=n,u=a6(n.bodyFont),d=u.lineHeight,f=0,p=E6(n.rtl,this.x,this.width),m=function(n){t.fillText(n,p.x(e.x+f),e.y+d/2),e.y+=d+i},h=p.textAlign(a),g,_,v,y,b,x,S;for(t.textAlign=a,t.textBaseline=`middle`,t.font=u.string,e.x=H5(this,h,n),t.fillStyle=n.bodyColor,_3(this.beforeBody,m),f=o&&h!==`right`?a===`center`?c/2+l:c+2+l:0,y=0,x=r.length;y<x;++y){for(g=r[y],_=this.labelTextColors[y],t.fillStyle=_,_3(g.before,m),v=g.lines,o&&v.length&&(this._drawColorBox(t,e,y,p,n),d=Math.max(u.lineHeight,s)),b=0,S=v.length;b<S;++b)m(v[b]),d=u.lineHeight;_3(g.after,m)}f=0,d=u.lineHeight,_3(this.afterBody,m),e.y-=i}drawFooter(e,t,n){let r=this.footer,i=r.length,a,o;if(i){let s=E6(n.rtl,this.x,this.width);for(e.x=H5(this,n.footerAlign,n),e.y+=n.footerMarginTop,t.textAlign=s.textAlign(n.footerAlign),t.textBaseline=`middle`,a=a6(n.footerFont),t.fillStyle=n.footerColor,t.font=a.string,o=0;o<i;++o)t.fillText(r[o],s.x(e.x),e.y+a.lineHeight/2),e.y+=a.lineHeight+n.footerSpacing}}drawBackground(e,t,n,r){let{xAlign:i,yAlign:a}=this,{x:o,y:s}=e,{width:c,height:l}=n,{topLeft:u,topRight:d,bottomLeft:f,bottomRight:p}=r6(r.cornerRadius);t.fillStyle=r.backgroundColor,t.strokeStyle=r.borderColor,t.lineWidth=r.borderWidth,t.beginPath(),t.moveTo(o+u,s),a===`top`&&this.drawCaret(e,t,n,r),t.lineTo(o+c-d,s),t.quadraticCurveTo(o+c,s,o+c,s+d),a===`center`&&i===`right`&&this.drawCaret(e,t,n,r),t.lineTo(o+c,s+l-p),t.quadraticCurveTo(o+c,s+l,o+c-p,s+l),a===`bottom`&&this.drawCaret(e,t,n,r),t.lineTo(o+f,s+l),t.quadraticCurveTo(o,s+l,o,s+l-f),a===`center`&&i===`left`&&this.drawCaret(e,t,n,r),t.lineTo(o,s+u),t.quadraticCurveTo(o,s,o+u,s),t.closePath(),t.fill(),r.borderWidth>0&&t.stroke()}_updateAnimationTarget(e){let t=this.chart,n=this.$animations,r=n&&n.x,i=n&&n.y;if(r||i){let n=o9[e.position].call(this,this._active,this._eventPosition);if(!n)return;let a=this._size=z5(this,e),o=Object.assign({},n,this._size),s=B5(t,e,o),c=V5(e,o,s,t);(r._to!==c.x||i._to!==c.y)&&(this.xAlign=s.xAlign,this.yAlign=s.yAlign,this.width=a.width,this.height=a.height,this.caretX=n.x,this.caretY=n.y,this._resolveAnimations().update(this,c))}}_willRender(){return!!this.opacity}draw(e){let t=this.options.setContext(this.getContext()),n=this.opacity;if(!n)return;this._updateAnimationTarget(t);let r={width:this.width,height:this.height},i={x:this.x,y:this.y};n=Math.abs(n)<.001?0:n;let a=i6(t.padding),o=this.title.length||this.beforeBody.length||this.body.length||this.afterBody.length||this.footer.length;t.enabled&&o&&(e.save(),e.globalAlpha=n,this.drawBackground(i,e,r,t),D6(e,t.textDirection),i.y+=a.top,this.drawTitle(i,e,t),this.drawBody(i,e,t),this.drawFooter(i,e,t),O6(e,t.textDirection),e.restore())}getActiveElements(){return this._active||[]}setActiveElements(e,t){let n=this._active,r=e.map(({datasetIndex:e,index:t})=>{let n=this.chart.getDatasetMeta(e);if(!n)throw Error(`Cannot find a dataset at index `+e);return{datasetIndex:e,element:n.data[t],index:t}}),i=!v3(n,r),a=this._positionChanged(r,t);(i||a)&&(this._active=r,this._eventPosition=t,this._ignoreReplayEvents=!0,this.update(!0))}handleEvent(e,t,n=!0){if(t&&this._ignoreReplayEvents)return!1;this._ignoreReplayEvents=!1;let r=this.options,i=this._active||[],a=this._getActiveElements(e,i,t,n),o=this._positionChanged(a,e),s=t||!v3(a,i)||o;return s&&(this._active=a,(r.enabled||r.external)&&(this._eventPosition={x:e.x,y:e.y},this.update(!0,t))),s}_getActiveElements(e,t,n,r){let i=this.options;if(e.type===`mouseout`)return[];if(!r)return t.filter(e=>this.chart.data.datasets[e.datasetIndex]&&this.chart.getDatasetMeta(e.datasetIndex).controller.getParsed(e.index)!==void 0);let a=this.chart.getElementsAtEventForMode(e,i.mode,i,n);return i.reverse&&a.reverse(),a}_positionChanged(e,t){let{caretX:n,caretY:r,options:i}=this,a=o9[i.position].call(this,e,t);return a!==!1&&(n!==a.x||r!==a.y)}},l9={id:`tooltip`,_element:c9,positioners:o9,afterInit(e,t,n){n&&(e.tooltip=new c9({chart:e,options:n}))},beforeUpdate(e,t,n){e.tooltip&&e.tooltip.initialize(n)},reset(e,t,n){e.tooltip&&e.tooltip.initialize(n)},afterDraw(e){let t=e.tooltip;if(t&&t._willRender()){let n={tooltip:t};if(e.notifyPlugins(`beforeTooltipDraw`,{...n,cancelable:!0})===!1)return;t.draw(e.ctx),e.notifyPlugins(`afterTooltipDraw`,n)}},afterEvent(e,t){if(e.tooltip){let n=t.replay;e.tooltip.handleEvent(t.event,n,t.inChartArea)&&(t.changed=!0)}},defaults:{enabled:!0,external:null,position:`average`,backgroundColor:`rgba(0,0,0,0.8)`,titleColor:`#fff`,titleFont:{weight:`bold`},titleSpacing:2,titleMarginBottom:6,titleAlign:`left`,bodyColor:`#fff`,bodySpacing:2,bodyFont:{},bodyAlign:`left`,footerColor:`#fff`,footerSpacing:2,footerMarginTop:6,footerFont:{weight:`bold`},footerAlign:`left`,padding:6,caretPadding:2,caretSize:5,cornerRadius:6,boxHeight:(e,t)=>t.bodyFont.size,boxWidth:(e,t)=>t.bodyFont.size,multiKeyBackground:`#fff`,displayColors:!0,boxPadding:0,borderColor:`rgba(0,0,0,0)`,borderWidth:0,animation:{duration:400,easing:`easeOutQuart`},animations:{numbers:{type:`number`,properties:[`x`,`y`,`width`,`height`,`caretX`,`caretY`]},opacity:{easing:`linear`,duration:200}},callbacks:s9},defaultRoutes:{bodyFont:`font`,footerFont:`font`,titleFont:`font`},descriptors:{_scriptable:e=>e!==`filter`&&e!==`itemSort`&&e!==`external`,_indexable:!1,callbacks:{_scriptable:!1,_indexable:!1},animation:{_fallback:!1},animations:{_fallback:`animation`}},additionalOptionScopes:[`interaction`]},u9=(e,t,n,r)=>(typeof t==`string`?(n=e.push(t)-1,r.unshift({index:n,label:t})):isNaN(t)&&(n=null),n),d9=(e,t)=>e===null?null:F3(Math.round(e),0,t),f9=class extends P7{static id=`category`;static defaults={ticks:{callback:K5}};constructor(e){super(e),this._startValue=void 0,this._valueRange=0,this._addedLabels=[]}init(e){let t=this._addedLabels;if(t.length){let e=this.getLabels();for(let{index:n,label:r}of t)e[n]===r&&e.splice(n,1);this._addedLabels=[]}super.init(e)}parse(e,t){if(u3(e))return null;let n=this.getLabels();return t=isFinite(t)&&n[t]===e?t:Dfe(n,e,h3(t,e),this._addedLabels),d9(t,n.length-1)}determineDataLimits(){let{minDefined:e,maxDefined:t}=this.getUserBounds(),{min:n,max:r}=this.getMinMax(!0);this.options.bounds===`ticks`&&(e||(n=0),t||(r=this.getLabels().length-1)),this.min=n,this.max=r}buildTicks(){let e=this.min,t=this.max,n=this.options.offset,r=[],i=this.getLabels();i=e===0&&t===i.length-1?i:i.slice(e,t+1),this._valueRange=Math.max(i.length-+!n,1),this._startValue=this.min-(n?.5:0);for(let n=e;n<=t;n++)r.push({value:n});return r}getLabelForValue(e){return K5.call(this,e)}configure(){super.configure(),this.isHorizontal()||(this._reversePixels=!this._reversePixels)}getPixelForValue(e){return typeof e!=`number`&&(e=this.parse(e)),e===null?NaN:this.getPixelForDecimal((e-this._startValue)/this._valueRange)}getPixelForTick(e){let t=this.ticks;return e<0||e>t.length-1?null:this.getPixelForValue(t[e].value)}getValueForPixel(e){return Math.round(this._startValue+this.getDecimalForPixel(e)*this._valueRange)}getBasePixel(){return this.bottom}},p9=class extends P7{constructor(e){super(e),this.start=void 0,this.end=void 0,this._startValue=void 0,this._endValue=void 0,this._valueRange=0}parse(e,t){return u3(e)||(typeof e==`number`||e instanceof Number)&&!isFinite(+e)?null:+e}handleTickRangeOptions(){let{beginAtZero:e}=this.options,{minDefined:t,maxDefined:n}=this.getUserBounds(),{min:r,max:i}=this,a=e=>r=t?r:e,o=e=>i=n?i:e;if(e){let e=Q6(r),t=Q6(i);e<0&&t<0?o(0):e>0&&t>0&&a(0)}if(r===i){let t=i===0?1:Math.abs(i*.05);o(i+t),e||a(r-t)}this.min=r,this.max=i}getTickLimit(){let{maxTicksLimit:e,stepSize:t}=this.options.ticks,n;return t?(n=Math.ceil(this.max/t)-Math.floor(this.min/t)+1,n>1e3&&(console.warn(`scales.${this.id}.ticks.stepSize: ${t} would result generating up to ${n} ticks. Limiting to 1000.`),n=1e3)):(n=this.computeTickLimit(),e||=11),e&&(n=Math.min(e,n)),n}computeTickLimit(){return 1/0}buildTicks(){let e=this.options,t=e.ticks,n=this.getTickLimit();n=Math.max(2,n);let r=Ofe({maxTicks:n,bounds:e.bounds,min:e.min,max:e.max,precision:t.precision,step:t.stepSize,count:t.count,maxDigits:this._maxDigits(),horizontal:this.isHorizontal(),minRotation:t.minRotation||0,includeBounds:t.includeBounds!==!1},this._range||this);return e.bounds===`ticks`&&O3(r,this,`value`),e.reverse?(r.reverse(),this.start=this.max,this.end=this.min):(this.start=this.min,this.end=this.max),r}configure(){let e=this.ticks,t=this.min,n=this.max;if(super.configure(),this.options.offset&&e.length){let r=(n-t)/Math.max(e.length-1,1)/2;t-=r,n+=r}this._startValue=t,this._endValue=n,this._valueRange=n-t}getLabelForValue(e){return U3(e,this.chart.options.locale,this.options.ticks.format)}},m9=class extends p9{static id=`linear`;static defaults={ticks:{callback:m8.formatters.numeric}};determineDataLimits(){let{min:e,max:t}=this.getMinMax(!0);this.min=p3(e)?e:0,this.max=p3(t)?t:1,this.handleTickRangeOptions()}computeTickLimit(){let e=this.isHorizontal(),t=e?this.width:this.height,n=k3(this.options.ticks.minRotation),r=(e?Math.sin(n):Math.cos(n))||.001,i=this._resolveTickFontOptions(0);return Math.ceil(t/Math.min(40,i.lineHeight/r))}getPixelForValue(e){return e===null?NaN:this.getPixelForDecimal((e-this._startValue)/this._valueRange)}getValueForPixel(e){return this._startValue+this.getDecimalForPixel(e)*this._valueRange}},h9=e=>Math.floor(Z6(e)),g9=(e,t)=>10**(h9(e)+t),class extends P7{static id=`logarithmic`;static defaults={ticks:{callback:m8.formatters.logarithmic,major:{enabled:!0}}};constructor(e){super(e),this.start=void 0,this.end=void 0,this._startValue=void 0,this._valueRange=0}parse(e,t){let n=p9.prototype.parse.apply(this,[e,t]);if(n===0){this._zero=!0;return}return p3(n)&&n>0?n:null}determineDataLimits(){let{min:e,max:t}=this.getMinMax(!0);this.min=p3(e)?Math.max(0,e):null,this.max=p3(t)?Math.max(0,t):null,this.options.beginAtZero&&(this._zero=!0),this._zero&&this.min!==this._suggestedMin&&!p3(this._userMin)&&(this.min=e===g9(this.min,0)?g9(this.min,-1):g9(this.min,0)),this.handleTickRangeOptions()}handleTickRangeOptions(){let{minDefined:e,maxDefined:t}=this.getUserBounds(),n=this.min,r=this.max,i=t=>n=e?n:t,a=e=>r=t?r:e;n===r&&(n<=0?(i(1),a(10)):(i(g9(n,-1)),a(g9(r,1)))),n<=0&&i(g9(r,-1)),r<=0&&a(g9(n,1)),this.min=n,this.max=r}buildTicks(){let e=this.options,t=Afe({min:this._userMin,max:this._userMax},this);return e.bounds===`ticks`&&O3(t,this,`value`),e.reverse?(t.reverse(),this.start=this.max,this.end=this.min):(this.start=this.min,this.end=this.max),t}getLabelForValue(e){return e===void 0?`0`:U3(e,this.chart.options.locale,this.options.ticks.format)}configure(){let e=this.min;super.configure(),this._startValue=Z6(e),this._valueRange=Z6(this.max)-Z6(e)}getPixelForValue(e){return(e===void 0||e===0)&&(e=this.min),e===null||isNaN(e)?NaN:this.getPixelForDecimal(e===this.min?0:(Z6(e)-this._startValue)/this._valueRange)}getValueForPixel(e){let t=this.getDecimalForPixel(e);return 10**(this._startValue+t*this._valueRange)}},class extends p9{static id=`radialLinear`;static defaults={display:!0,animate:!0,position:`chartArea`,angleLines:{display:!0,lineWidth:1,borderDash:[],borderDashOffset:0},grid:{circular:!1},startAngle:0,ticks:{showLabelBackdrop:!0,callback:m8.formatters.numeric},pointLabels:{backdropColor:void 0,backdropPadding:2,display:!0,font:{size:10},callback(e){return e},padding:5,centerPointLabels:!1}};static defaultRoutes={"angleLines.color":`borderColor`,"pointLabels.color":`color`,"ticks.color":`color`};static descriptors={angleLines:{_fallback:`grid`}};constructor(e){super(e),this.xCenter=void 0,this.yCenter=void 0,this.drawingArea=void 0,this._pointLabels=[],this._pointLabelItems=[]}setDimensions(){let e=this._padding=i6(X5(this.options)/2),t=this.width=this.maxWidth-e.width,n=this.height=this.maxHeight-e.height;this.xCenter=Math.floor(this.left+t/2+e.left),this.yCenter=Math.floor(this.top+n/2+e.top),this.drawingArea=Math.floor(Math.min(t,n)/2)}determineDataLimits(){let{min:e,max:t}=this.getMinMax(!1);this.min=p3(e)&&!isNaN(e)?e:0,this.max=p3(t)&&!isNaN(t)?t:0,this.handleTickRangeOptions()}computeTickLimit(){return Math.ceil(this.drawingArea/X5(this.options))}generateTickLabels(e){p9.prototype.generateTickLabels.call(this,e),this._pointLabels=this.getLabels().map((e,t)=>{let n=g3(this.options.pointLabels.callback,[e,t],this);return n||n===0?n:``}).filter((e,t)=>this.chart.getDataVisibility(t))}fit(){let e=this.options;e.display&&e.pointLabels.display?Mfe(this):this.setCenterPoint(0,0,0,0)}setCenterPoint(e,t,n,r){this.xCenter+=Math.floor((e-t)/2),this.yCenter+=Math.floor((n-r)/2),this.drawingArea-=Math.min(this.drawingArea/2,Math.max(e,t,n,r))}getIndexAngle(e){let t=W6/(this._pointLabels.length||1),n=this.options.startAngle||0;return N3(e*t+k3(n))}getDistanceFromCenterForValue(e){if(u3(e))return NaN;let t=this.drawingArea/(this.max-this.min);return this.options.reverse?(this.max-e)*t:(e-this.min)*t}getValueForDistanceFromCenter(e){if(u3(e))return NaN;let t=e/(this.drawingArea/(this.max-this.min));return this.options.reverse?this.max-t:this.min+t}getPointLabelContext(e){let t=this._pointLabels||[];if(e>=0&&e<t.length){let n=t[e];return Ufe(this.getContext(),e,n)}}getPointPosition(e,t,n=0){let r=this.getIndexAngle(e)-J6+n;return{x:Math.cos(r)*t+this.xCenter,y:Math.sin(r)*t+this.yCenter,angle:r}}getPointPositionForValue(e,t){return this.getPointPosition(e,this.getDistanceFromCenterForValue(t))}getBasePosition(e){return this.getPointPositionForValue(e||0,this.getBaseValue())}getPointLabelPosition(e){let{left:t,top:n,right:r,bottom:i}=this._pointLabelItems[e];return{left:t,top:n,right:r,bottom:i}}drawBackground(){let{backgroundColor:e,grid:{circular:t}}=this.options;if(e){let n=this.ctx;n.save(),n.beginPath(),Q5(this,this.getDistanceFromCenterForValue(this._endValue),t,this._pointLabels.length),n.closePath(),n.fillStyle=e,n.fill(),n.restore()}}drawGrid(){let e=this.ctx,t=this.options,{angleLines:n,grid:r,border:i}=t,a=this._pointLabels.length,o,s,c;if(t.pointLabels.display&&Vfe(this,a),r.display&&this.ticks.forEach((e,t)=>{if(t!==0||t===0&&this.min<0){s=this.getDistanceFromCenterForValue(e.value);let n=this.getContext(t),o=r.setContext(n),c=i.setContext(n);Hfe(this,o,s,a,c)}}),n.display){for(e.save(),o=a-1;o>=0;o--){let r=n.setContext(this.getPointLabelContext(o)),{color:i,lineWidth:a}=r;!a||!i||(e.lineWidth=a,e.strokeStyle=i,e.setLineDash(r.borderDash),e.lineDashOffset=r.borderDashOffset,s=this.getDistanceFromCenterForValue(t.reverse?this.min:this.max),c=this.getPointPosition(o,s),e.beginPath(),e.moveTo(this.xCenter,this.yCenter),e.lineTo(c.x,c.y),e.stroke())}e.restore()}}drawBorder(){}drawLabels(){let e=this.ctx,t=this.options,n=t.ticks;if(!n.display)return;let r=this.getIndexAngle(0),i,a;e.save(),e.translate(this.xCenter,this.yCenter),e.rotate(r),e.textAlign=`center`,e.textBaseline=`middle`,this.ticks.forEach((r,o)=>{if(o===0&&this.min>=0&&!t.reverse)return;let s=n.setContext(this.getContext(o)),c=a6(s.font);if(i=this.getDistanceFromCenterForValue(this.ticks[o].value),s.showLabelBackdrop){e.font=c.string,a=e.measureText(r.label).width,e.fillStyle=s.backdropColor;let t=i6(s.backdropPadding);e.fillRect(-a/2-t.left,-i-c.size/2-t.top,a+t.width,c.size+t.height)}e6(e,r.label,0,-i,c,{color:s.color,strokeColor:s.textStrokeColor,strokeWidth:s.textStrokeWidth})}),e.restore()}drawTitle(){}},_9={millisecond:{common:!0,size:1,steps:1e3},second:{common:!0,size:1e3,steps:60},minute:{common:!0,size:6e4,steps:60},hour:{common:!0,size:36e5,steps:24},day:{common:!0,size:864e5,steps:30},week:{common:!1,size:6048e5,steps:4},month:{common:!0,size:2628e6,steps:12},quarter:{common:!1,size:7884e6,steps:4},year:{common:!0,size:3154e7}},v9=Object.keys(_9),y9=class extends P7{static id=`time`;static defaults={bounds:`data`,adapters:{},time:{parser:!1,unit:!1,round:!1,isoWeekday:!1,minUnit:`millisecond`,displayFormats:{}},ticks:{source:`auto`,callback:!1,major:{enabled:!1}}};constructor(e){super(e),this._cache={data:[],labels:[],all:[]},this._unit=`day`,this._majorUnit=void 0,this._offsets={},this._normalized=!1,this._parseOpts=void 0}init(e,t={}){let n=e.time||={},r=this._adapter=new _7._date(e.adapters.date);r.init(t),S3(n.displayFormats,r.formats()),this._parseOpts={parser:n.parser,round:n.round,isoWeekday:n.isoWeekday},super.init(e),this._normalized=t.normalized}parse(e,t){return e===void 0?null:e7(this,e)}beforeLayout(){super.beforeLayout(),this._cache={data:[],labels:[],all:[]}}determineDataLimits(){let e=this.options,t=this._adapter,n=e.time.unit||`day`,{min:r,max:i,minDefined:a,maxDefined:o}=this.getUserBounds();function s(e){!a&&!isNaN(e.min)&&(r=Math.min(r,e.min)),!o&&!isNaN(e.max)&&(i=Math.max(i,e.max))}(!a||!o)&&(s(this._getLabelBounds()),(e.bounds!==`ticks`||e.ticks.source!==`labels`)&&s(this.getMinMax(!1))),r=p3(r)&&!isNaN(r)?r:+t.startOf(Date.now(),n),i=p3(i)&&!isNaN(i)?i:+t.endOf(Date.now(),n)+1,this.min=Math.min(r,i-1),this.max=Math.max(r+1,i)}_getLabelBounds(){let e=this.getLabelTimestamps(),t=1/0,n=-1/0;return e.length&&(t=e[0],n=e[e.length-1]),{min:t,max:n}}buildTicks(){let e=this.options,t=e.time,n=e.ticks,r=n.source===`labels`?this.getLabelTimestamps():this._generate();e.bounds===`ticks`&&r.length&&(this.min=this._userMin||r[0],this.max=this._userMax||r[r.length-1]);let i=this.min,a=this.max,o=Vle(r,i,a);return this._unit=t.unit||(n.autoSkip?t7(t.minUnit,this.min,this.max,this._getLabelCapacity(i)):Wfe(this,o.length,t.minUnit,this.min,this.max)),this._majorUnit=!n.major.enabled||this._unit===`year`?void 0:Gfe(this._unit),this.initOffsets(r),e.reverse&&o.reverse(),r7(this,o,this._majorUnit)}afterAutoSkip(){this.options.offsetAfterAutoskip&&this.initOffsets(this.ticks.map(e=>+e.value))}initOffsets(e=[]){let t=0,n=0,r,i;this.options.offset&&e.length&&(r=this.getDecimalForValue(e[0]),t=e.length===1?1-r:(this.getDecimalForValue(e[1])-r)/2,i=this.getDecimalForValue(e[e.length-1]),n=e.length===1?i:(i-this.getDecimalForValue(e[e.length-2]))/2);let a=e.length<3?.5:.25;t=F3(t,0,a),n=F3(n,0,a),this._offsets={start:t,end:n,factor:1/(t+1+n)}}_generate(){let e=this._adapter,t=this.min,n=this.max,r=this.options,i=r.time,a=i.unit||t7(i.minUnit,t,n,this._getLabelCapacity(t)),o=h3(r.ticks.stepSize,1),s=a===`week`&&i.isoWeekday,c=D3(s)||s===!0,l={},u=t,d,f;if(c&&(u=+e.startOf(u,`isoWeek`,s)),u=+e.startOf(u,c?`day`:a),e.diff(n,t,a)>1e5*o)throw Error(t+` and `+n+` are too far apart with stepSize of `+o+` `+a);let p=r.ticks.source===`data`&&this.getDataTimestamps();for(d=u,f=0;d<n;d=+e.add(d,o,a),f++)n7(l,d,p);return(d===n||r.bounds===`ticks`||f===1)&&n7(l,d,p),Object.keys(l).sort($5).map(e=>+e)}getLabelForValue(e){let t=this._adapter,n=this.options.time;return n.tooltipFormat?t.format(e,n.tooltipFormat):t.format(e,n.displayFormats.datetime)}format(e,t){let n=this.options.time.displayFormats,r=this._unit,i=t||n[r];return this._adapter.format(e,i)}_tickFormatFunction(e,t,n,r){let i=this.options,a=i.ticks.callback;if(a)return g3(a,[e,t,n],this);let o=i.time.displayFormats,s=this._unit,c=this._majorUnit,l=s&&o[s],u=c&&o[c],d=n[t],f=c&&u&&d&&d.major;return this._adapter.format(e,r||(f?u:l))}generateTickLabels(e){let t,n,r;for(t=0,n=e.length;t<n;++t)r=e[t],r.label=this._tickFormatFunction(r.value,t,e)}getDecimalForValue(e){return e===null?NaN:(e-this.min)/(this.max-this.min)}getPixelForValue(e){let t=this._offsets,n=this.getDecimalForValue(e);return this.getPixelForDecimal((t.start+n)*t.factor)}getValueForPixel(e){let t=this._offsets,n=this.getDecimalForPixel(e)/t.factor-t.end;return this.min+n*(this.max-this.min)}_getLabelSize(e){let t=this.options.ticks,n=this.ctx.measureText(e).width,r=k3(this.isHorizontal()?t.maxRotation:t.minRotation),i=Math.cos(r),a=Math.sin(r),o=this._resolveTickFontOptions(0).size;return{w:n*i+o*a,h:n*a+o*i}}_getLabelCapacity(e){let t=this.options.time,n=t.displayFormats,r=n[t.unit]||n.millisecond,i=this._tickFormatFunction(e,0,r7(this,[e],this._majorUnit),r),a=this._getLabelSize(i),o=Math.floor(this.isHorizontal()?this.width/a.w:this.height/a.h)-1;return o>0?o:1}getDataTimestamps(){let e=this._cache.data||[],t,n;if(e.length)return e;let r=this.getMatchingVisibleMetas();if(this._normalized&&r.length)return this._cache.data=r[0].controller.getAllParsedValues(this);for(t=0,n=r.length;t<n;++t)e=e.concat(r[t].controller.getAllParsedValues(this));return this._cache.data=this.normalize(e)}getLabelTimestamps(){let e=this._cache.labels||[],t,n;if(e.length)return e;let r=this.getLabels();for(t=0,n=r.length;t<n;++t)e.push(e7(this,r[t]));return this._cache.labels=this._normalized?e:this.normalize(e)}normalize(e){return Ule(e.sort($5))}},class extends y9{static id=`timeseries`;static defaults=y9.defaults;constructor(e){super(e),this._table=[],this._minPos=void 0,this._tableRange=void 0}initOffsets(){let e=this._getTimestampsForTable(),t=this._table=this.buildLookupTable(e);this._minPos=i7(t,this.min),this._tableRange=i7(t,this.max)-this._minPos,super.initOffsets(e)}buildLookupTable(e){let{min:t,max:n}=this,r=[],i=[],a,o,s,c,l;for(a=0,o=e.length;a<o;++a)c=e[a],c>=t&&c<=n&&r.push(c);if(r.length<2)return[{time:t,pos:0},{time:n,pos:1}];for(a=0,o=r.length;a<o;++a)l=r[a+1],s=r[a-1],c=r[a],Math.round((l+s)/2)!==c&&i.push({time:c,pos:a/(o-1)});return i}_generate(){let e=this.min,t=this.max,n=super.getDataTimestamps();return(!n.includes(e)||!n.length)&&n.splice(0,0,e),(!n.includes(t)||n.length===1)&&n.push(t),n.sort((e,t)=>e-t)}_getTimestampsForTable(){let e=this._cache.all||[];if(e.length)return e;let t=this.getDataTimestamps(),n=this.getLabelTimestamps();return e=t.length&&n.length?this.normalize(t.concat(n)):t.length?t:n,e=this._cache.all=e,e}getDecimalForValue(e){return(i7(this._table,e)-this._minPos)/this._tableRange}getValueForPixel(e){let t=this._offsets,n=this.getDecimalForPixel(e)/t.factor-t.end;return i7(this._table,n*this._tableRange+this._minPos,!0)}}})),x9,S9=t((()=>{b9(),g4(),x9={datetime:h4.DATETIME_MED_WITH_SECONDS,millisecond:`h:mm:ss.SSS a`,second:h4.TIME_WITH_SECONDS,minute:h4.TIME_SIMPLE,hour:{hour:`numeric`},day:{day:`numeric`,month:`short`},week:`DD`,month:{month:`short`,year:`numeric`},quarter:`'Q'q - yyyy`,year:{year:`numeric`}},_7._date.override({_id:`luxon`,_create:function(e){return h4.fromMillis(e,this.options)},init(e){this.options.locale||(this.options.locale=e.locale)},formats:function(){return x9},parse:function(e,t){let n=this.options,r=typeof e;return e===null||r===`undefined`?null:(r===`number`?e=this._create(e):r===`string`?e=typeof t==`string`?h4.fromFormat(e,t,n):h4.fromISO(e,n):e instanceof Date?e=h4.fromJSDate(e,n):r===`object`&&!(e instanceof h4)&&(e=h4.fromObject(e,n)),e.isValid?e.valueOf():null)},format:function(e,t){let n=this._create(e);return typeof t==`string`?n.toFormat(t):n.toLocaleString(t)},add:function(e,t,n){let r={};return r[n]=t,this._create(e).plus(r).valueOf()},diff:function(e,t,n){return this._create(e).diff(this._create(t)).as(n).valueOf()},startOf:function(e,t,n){if(t===`isoWeek`){n=Math.trunc(Math.min(Math.max(0,n),6));let t=this._create(e);return t.minus({days:(t.weekday-n+7)%7}).startOf(`day`).valueOf()}return t?this._create(e).startOf(t).valueOf():e},endOf:function(e,t){return this._create(e).endOf(t).valueOf()}})}));function C9(e){return _t(e)?vt(e):e}function qfe(e){return _t(arguments.length>1&&arguments[1]!==void 0?arguments[1]:e)?new Proxy(e,{}):e}function Jfe(e,t){let n=e.options;n&&t&&Object.assign(n,t)}function w9(e,t){e.labels=t}function T9(e,t,n){let r=[];e.datasets=t.map(t=>{let i=e.datasets.find(e=>e[n]===t[n]);return!i||!t.data||r.includes(i)?{...t}:(r.push(i),Object.assign(i,t),i)})}function Yfe(e,t){let n={labels:[],datasets:[]};return w9(n,e.labels),T9(n,e.datasets,t),n}function Xfe(e,t){return J7.register(t),j({props:E9,setup(t,n){let{expose:r}=n,i=xt(null),a=xt(null);Vn(()=>a.value?.chart??null,e=>{i.value=e},{flush:`sync`}),r({chart:i});let o=e=>{a.value=e};return()=>N(A9,k9({ref:o},{type:e,...t}))}})}var E9,D9,O9,k9,A9,j9,M9=t((()=>{b9(),I(),E9={data:{type:Object,required:!0},options:{type:Object,default:()=>({})},plugins:{type:Array,default:()=>[]},datasetIdKey:{type:String,default:`label`},updateMode:{type:String,default:void 0}},D9={ariaLabel:{type:String},ariaDescribedby:{type:String}},O9={type:{type:String,required:!0},destroyDelay:{type:Number,default:0},...E9,...D9},k9=(e,t)=>Object.assign(e,t),A9=j({props:O9,setup(e,t){let{expose:n,slots:r}=t,i=O(null),a=xt(null);n({chart:a});let o=()=>{if(!i.value)return;let{type:t,data:n,options:r,plugins:o,datasetIdKey:s}=e,c=qfe(Yfe(n,s),n);a.value=new J7(i.value,{type:t,data:c,options:{...r},plugins:o})},s=()=>{let t=vt(a.value);t&&(e.destroyDelay>0?setTimeout(()=>{t.destroy(),a.value=null},e.destroyDelay):(t.destroy(),a.value=null))},c=t=>{t.update(e.updateMode)};return aa(o),la(s),Vn([()=>e.options,()=>e.data],(t,n)=>{let[r,i]=t,[o,s]=n,l=vt(a.value);if(!l)return;let u=!1;if(r){let e=C9(r),t=C9(o);e&&e!==t&&(Jfe(l,e),u=!0)}if(i){let t=C9(i.labels),n=C9(s.labels),r=C9(i.datasets),a=C9(s.datasets);t!==n&&(w9(l.config.data,t),u=!0),r&&r!==a&&(T9(l.config.data,r,e.datasetIdKey),u=!0)}u&&kn(()=>{c(l)})},{deep:!0}),()=>N(`canvas`,{role:`img`,"aria-label":e.ariaLabel,"aria-describedby":e.ariaDescribedby,ref:i},[N(`p`,{},[r.default?r.default():``])])}}),j9=Xfe(`line`,h7)})),Zfe=n({default:()=>N9}),N9,Qfe=t((()=>{I(),eQ(),Bl(),b4(),b9(),S9(),M9(),g4(),N4(),N9={__name:`PricesGraph`,setup(e){J7.register(f9,m9,Z7,X7,a9,l9,r9,$7,y9);let{prices:t}=wl(y4()),{tz:n,now:r}=M4(),i=O(r()),a=F(()=>h4.fromFormat(t.value.update_ts,`yyyy-MM-dd'T'HH:mm:ssZZZ`).setZone(n.value)),o=F(()=>({responsive:!0,aspectRatio:4,interaction:{intersect:!1,mode:`index`},elements:{point:{radius:1}},plugins:{legend:{position:`bottom`},tooltip:{enabled:!0,callbacks:{title:e=>h4.fromMillis(e[0].parsed.x).setZone(n.value).toFormat(`ccc dd MMM HH:mm`),label:e=>`€ ${e.parsed.y.toFixed(6)} / kWh`}}},scales:{x:{type:`time`,adapters:{date:{zone:n.value}},time:{unit:`hour`,displayFormats:{hour:`HH:mm`}},grid:{color:`#303030`,borderColor:`grey`,tickColor:`grey`}},y:{title:{text:`Prices (€ / kWh)`},ticks:{callback:(e,t,n)=>`€ ${e.toFixed(3)}`}}}})),s=F(()=>{let e=[],r=Object.entries(t.value.prices);r.sort((e,t)=>e[0]-t[0]);let a=0;for(let e=0;e<r.length&&h4.fromFormat(r[e][0],`yyyy-MM-dd'T'HH:mm:ssZZZ`).setZone(n.value)<=i.value;e++)a=e;let o=null,s=null,c=null;for(let t=a;t<r.length;t++){let[i,a]=r[t],l=h4.fromFormat(i,`yyyy-MM-dd'T'HH:mm:ssZZZ`).setZone(n.value);o!==null&&e.push({x:l.minus({milliseconds:1}),y:o}),e.push({x:l,y:a}),s!==null&&(c=l.diff(s,`minutes`)),o=a,s=l}return c!==null&&e.push({x:s.plus(c),y:o}),e}),c=F(()=>{let e=Object.values(t.value.prices);return e.length===0?0:e.reduce((e,t)=>e+t,0)/e.length}),l=F(()=>{let e=Math.min(s.value.reduce((e,t)=>Math.min(e,t.y),1/0)),t=Math.min(s.value.reduce((e,t)=>Math.max(e,t.y),-1/0)),n=c.value;return{datasets:[{label:`Prices (€ / kWh)`,data:s.value,fill:{target:`origin`},tension:0,segment:{borderColor:e=>e.p1.parsed.y>=n?`rgb(255, 160, 50)`:`rgb(75, 192, 75)`,backgroundColor:e=>{let{ctx:t,chartArea:r}=e.chart;if(!r)return`transparent`;let[i,a,o]=e.p1.parsed.y>=n?[255,160,50]:[75,192,75],s=t.createLinearGradient(0,r.top,0,r.bottom);return s.addColorStop(0,`rgba(${i}, ${a}, ${o}, 0.4)`),s.addColorStop(1,`rgba(${i}, ${a}, ${o}, 0.0)`),s}}},{label:`Now`,data:[{x:i.value.minus({milliseconds:1}),y:e},{x:i.value,y:t}],borderColor:`rgb(226, 99, 183)`,tension:0}]}}),u=O(null);return aa(()=>{u.value=setInterval(()=>{i.value=r()},10*1e3)}),ca(()=>{clearInterval(u.value),u.value=null}),(e,n)=>(Zr(),ni(k(bR),{"arrow-placement":`right`},{default:A(()=>[P(k(wR),null,{header:A(()=>[P(k(AZ),{prefix:`bar`},{default:A(()=>[...n[0]||=[oi(` Exchange Prices `,-1)]]),_:1})]),default:A(()=>[n[1]||=oi(` Current price: `,-1),P(k(FZ),{type:`success`},{default:A(()=>[oi(`€ `+De(k(t).current_price.toFixed(3))+` per kWh`,1)]),_:1}),oi(`. Prices updated at `+De(a.value.toLocaleString(k(h4).DATETIME_MED))+` `,1),P(k(j9),{data:l.value,options:o.value},null,8,[`data`,`options`])]),_:1})]),_:1}))}}})),$fe=n({default:()=>P9}),P9,epe=t((()=>{I(),eQ(),Bl(),b4(),b9(),S9(),M9(),g4(),N4(),P9={__name:`ScheduleGraph`,setup(e){J7.register(f9,m9,Z7,X7,a9,l9,r9,y9);let t=[`rgb(99, 179, 237)`,`rgb(251, 146, 60)`,`rgb(251, 182, 206)`,`rgb(251, 211, 141)`,`rgb(183, 148, 244)`],n=y4(),{schedule:r}=wl(n),{tz:i,now:a}=M4(),o=O(a()),s=F(()=>n.schedule_ts?h4.fromISO(n.schedule_ts).setZone(i.value):null),c=F(()=>({responsive:!0,aspectRatio:4,interaction:{intersect:!1,mode:`index`},elements:{point:{radius:1}},plugins:{legend:{position:`bottom`},tooltip:{enabled:!0,callbacks:{title:e=>h4.fromMillis(e[0].parsed.x).setZone(i.value).toFormat(`ccc dd MMM HH:mm`),label:e=>{if(e.dataset.label===`Now`)return null;if(e.dataset.yAxisID===`y_cost`)return`Cumulative cost: € ${e.parsed.y.toFixed(4)}`;let t=e.parsed.y;return`${e.dataset.label}: ${(t/1e3).toFixed(3)} kWh`}}}},scales:{x:{type:`time`,adapters:{date:{zone:i.value}},time:{unit:`hour`,displayFormats:{hour:`HH:mm`}},grid:{color:`#303030`,borderColor:`grey`,tickColor:`grey`}},y:{position:`left`,title:{display:!0,text:`State of Charge (Wh)`},ticks:{callback:e=>`${(e/1e3).toFixed(1)} kWh`}},y_cost:{position:`right`,title:{display:!0,text:`Cumulative Cost (€)`},ticks:{callback:e=>`€ ${e.toFixed(2)}`},grid:{color:e=>e.tick.value===0?`#606060`:`transparent`}}}})),l=F(()=>{if(!r.value||r.value.length===0)return{datasets:[]};let e=r.value,n=Object.keys(e[0].start_charge),a=n.map((n,r)=>{let a=e.map(e=>({x:h4.fromISO(e.start_ts).setZone(i.value),y:e.start_charge[n]})),o=e[e.length-1];return a.push({x:h4.fromISO(o.end_ts).setZone(i.value),y:o.end_charge[n]}),{label:n,data:a,yAxisID:`y`,borderColor:t[r%t.length],tension:0}}),s=[],c=0;for(let t of e)s.push({x:h4.fromISO(t.start_ts).setZone(i.value),y:c}),c+=t.cost;let l=e[e.length-1];s.push({x:h4.fromISO(l.end_ts).setZone(i.value),y:c});let u={label:`Cumulative cost`,data:s,yAxisID:`y_cost`,borderColor:`rgb(99, 226, 183)`,tension:0,pointRadius:0},d=e.flatMap(e=>n.flatMap(t=>[e.start_charge[t],e.end_charge[t]])),f=Math.min(...d),p=Math.max(...d),m={label:`Now`,data:[{x:o.value.minus({milliseconds:1}),y:f},{x:o.value,y:p}],yAxisID:`y`,borderColor:`rgb(226, 99, 183)`,tension:0,pointRadius:0};return{datasets:[...a,u,m]}}),u=O(null);return aa(()=>{u.value=setInterval(()=>{o.value=a()},10*1e3)}),ca(()=>{clearInterval(u.value),u.value=null}),(e,t)=>(Zr(),ni(k(bR),{"arrow-placement":`right`},{default:A(()=>[P(k(wR),null,{header:A(()=>[P(k(AZ),{prefix:`bar`},{default:A(()=>[...t[0]||=[oi(` Optimal schedule `,-1)]]),_:1})]),default:A(()=>[s.value?(Zr(),ti(Va,{key:0},[oi(`Schedule computed at `+De(s.value.toLocaleString(k(h4).DATETIME_MED)),1)],64)):ci(``,!0),P(k(j9),{data:l.value,options:c.value},null,8,[`data`,`options`])]),_:1})]),_:1}))}}})),tpe=n({default:()=>F9}),F9,npe=t((()=>{I(),Bl(),b4(),D4(),fle(),g4(),N4(),T4(),F9={__name:`Main`,setup(e){let t=sr(()=>w4(()=>Promise.resolve().then(()=>(Qfe(),Zfe)),void 0)),n=sr(()=>w4(()=>Promise.resolve().then(()=>(epe(),$fe)),void 0)),r=y4(),i=E4(),{tz:a}=M4(),{general:o}=wl(i),s=O();return aa(async()=>{await r.fetch_status(),await i.fetch_config(),await i.fetch_subsystem_types();if(r.subscribe())return;let e=o.value.loop_delay;e===void 0&&(e=8),console.log(`status refresh loop at ${e} seconds`),s.value=setInterval(async()=>{console.log(`periodic status fetch (every ${e} seconds)`),await r.fetch_status()},e*1e3)}),ca(()=>{r.unsubscribe(),clearInterval(s.value),s.value=null}),(e,i)=>(Zr(),ti(Va,null,[i[0]||=M(`h2`,null,`Main Page`,-1),M(`p`,null,[k(r).running?(Zr(),ti(Va,{key:0},[oi(`Currently running in mode `+De(k(r).mode)+` (`+De(k(r).mode_name)+`)`,1)],64)):(Zr(),ti(Va,{key:1},[oi(`Not running`)],64)),oi(` as of `+De(k(r).update_time.setZone(k(a)).toLocaleString(k(h4).TIME_WITH_SECONDS))+`. `,1)]),k(r).schedule?.length?(Zr(),ni(k(n),{key:0})):ci(``,!0),k(r).prices?.prices?(Zr(),ni(k(t),{key:1})):ci(``,!0),P(j4)],64))}}})),rpe=n({default:()=>I9}),I9,ipe=t((()=>{I(),eQ(),D4(),Bl(),I9={__name:`EnergyMeterConfig`,setup(e){let t=E4(),{energy_meter:n}=wl(t),r=async()=>{await t.sync_energy_meter_config(n.value)},i=F(()=>{let e=t.subsystem_types?.energy_meters;return e?Object.entries(e).map(([e,t])=>({value:e,label:t})):[]});return aa(async()=>{await t.fetch_config()}),(e,t)=>(Zr(),ti(Va,null,[t[7]||=M(`h2`,null,`Energy Meter Config`,-1),P(k(ZH)),t[8]||=M(`p`,null,` Configuration for the grid connection energy meter. `,-1),P(k($K),null,{default:A(()=>[P(k(PJ),{cols:`4 s:4 m:8 l:16 xl:16`,"x-gap":`10`,responsive:`screen`},{default:A(()=>[P(k(SJ),{span:`4`,label:`Type`,path:`type`},{default:A(()=>[P(k(KR),{value:k(n).type,"onUpdate:value":t[0]||=e=>k(n).type=e,placeholder:`Select type`,options:i.value},null,8,[`value`,`options`])]),_:1}),P(k(SJ),{span:`3`,label:`Host`,path:`host`},{default:A(()=>[P(k(Cj),{value:k(n).host,"onUpdate:value":t[1]||=e=>k(n).host=e,placeholder:`192.168...`},null,8,[`value`])]),_:1}),P(k(SJ),{span:`1`,label:`Port`,path:`port`},{default:A(()=>[P(k(fY),{value:k(n).port,"onUpdate:value":t[2]||=e=>k(n).port=e,min:`1`,max:`65535`,"show-button":!1},null,8,[`value`])]),_:1}),P(k(SJ),{span:`2`,label:`Fuse max current`,path:`max_fuse_current`},{default:A(()=>[P(k(fY),{value:k(n).max_fuse_current,"onUpdate:value":t[3]||=e=>k(n).max_fuse_current=e,min:`1`,max:`150`,"show-button":!1},{suffix:A(()=>[...t[4]||=[oi(`A`,-1)]]),_:1},8,[`value`])]),_:1})]),_:1}),P(k(IU),{justify:`space-between`},{default:A(()=>[t[6]||=M(`div`,null,`\xA0`,-1),P(k(jM),{onClick:r,type:`primary`},{default:A(()=>[...t[5]||=[oi(`Save`,-1)]]),_:1})]),_:1})]),_:1})],64))}}})),L9,ape=t((()=>{I(),eQ(),Cu(),D4(),L9={__name:`SolarInverterConfigItem`,props:vr([`idx`],{name:{},nameModifiers:{},type:{},typeModifiers:{},enable:{},enableModifiers:{},host:{},hostModifiers:{},port:{},portModifiers:{},modbus_device_id:{},modbus_device_idModifiers:{},connected_phase:{},connected_phaseModifiers:{}}),emits:vr([`removed`],[`update:name`,`update:type`,`update:enable`,`update:host`,`update:port`,`update:modbus_device_id`,`update:connected_phase`]),setup(e,{emit:t}){let n=t,r=E4(),i=e,a=Pr(e,`name`),o=Pr(e,`type`),s=Pr(e,`enable`),c=Pr(e,`host`),l=Pr(e,`port`),u=Pr(e,`modbus_device_id`),d=Pr(e,`connected_phase`),f=F(()=>{let e=r.subsystem_types?.solar_inverters;return e?Object.entries(e).map(([e,t])=>({value:e,label:t})):[]}),p=[{label:`L1`,value:`L1`},{label:`L2`,value:`L2`},{label:`L3`,value:`L3`},{label:`All`,value:`ALL`}];return(e,t)=>(Zr(),ni(k($K),{inline:``,size:`medium`,"label-placement":`top`},{default:A(()=>[P(k(PJ),{cols:`4 s:4 m:8 l:20 xl:20`,"x-gap":`10`,responsive:`screen`},{default:A(()=>[P(k(SJ),{span:`4`,label:`Name`,path:`name`},{default:A(()=>[P(k(Cj),{value:a.value,"onUpdate:value":t[0]||=e=>a.value=e,placeholder:`inverter name`},null,8,[`value`])]),_:1}),P(k(SJ),{span:`4`,label:`Type`,path:`type`},{default:A(()=>[P(k(KR),{value:o.value,"onUpdate:value":t[1]||=e=>o.value=e,placeholder:`Select type`,options:f.value},null,8,[`value`,`options`])]),_:1}),P(k(SJ),{span:`3`,label:`Host`,path:`host`},{default:A(()=>[P(k(Cj),{value:c.value,"onUpdate:value":t[2]||=e=>c.value=e,placeholder:`192.168...`},null,8,[`value`])]),_:1}),P(k(SJ),{span:`1`,label:`Port`,path:`port`},{default:A(()=>[P(k(fY),{value:l.value,"onUpdate:value":t[3]||=e=>l.value=e,min:`1`,max:`65535`,"show-button":!1},null,8,[`value`])]),_:1}),P(k(SJ),{span:`3`,label:`Modbus Device ID`,path:`device_id`},{default:A(()=>[P(k(fY),{value:u.value,"onUpdate:value":t[4]||=e=>u.value=e,min:`1`,max:`65535`,"show-button":!1},null,8,[`value`])]),_:1}),P(k(SJ),{span:`3`,label:`Phase`,path:`connected_phase`},{default:A(()=>[P(k(KR),{value:d.value,"onUpdate:value":t[5]||=e=>d.value=e,placeholder:`Select phase`,options:p},null,8,[`value`])]),_:1}),P(k(SJ),{label:s.value?`Enabled`:`Disabled`,path:`enable`},{default:A(()=>[P(k(lZ),{value:s.value,"onUpdate:value":t[6]||=e=>s.value=e},null,8,[`value`])]),_:1},8,[`label`]),P(k(SJ),null,{default:A(()=>[P(k(jM),{onClick:t[7]||=e=>n(`removed`,i.idx),type:`error`,secondary:``,strong:``,circle:``},{icon:A(()=>[P(k(Bz),{size:`28`},{default:A(()=>[P(k(tu))]),_:1})]),_:1})]),_:1}),P(k(SJ),{span:`4 s:4 m:0 l:0 xl:0`},{default:A(()=>[P(k(ZH))]),_:1})]),_:1})]),_:1}))}}})),ope=n({default:()=>R9}),R9,spe=t((()=>{I(),eQ(),D4(),Bl(),Cu(),ape(),R9={__name:`SolarInverterConfig`,setup(e){let t=E4(),{solar_inverters:n}=wl(t),r=async e=>{console.log(`removing config ${e}`),n.value.splice(e,1)},i=async()=>{console.log(`appending a new config`),n.value.push({name:``,host:``,port:502,modbus_device_id:3,connected_phase:`ALL`,enable:!0})},a=async()=>{await t.sync_solar_inverters_config(n.value)};return aa(async()=>{await t.fetch_config(),await t.fetch_subsystem_types()}),(e,t)=>(Zr(),ti(Va,null,[t[1]||=M(`h2`,null,`Solar Inverter Config`,-1),P(k(ZH)),(Zr(!0),ti(Va,null,mr(k(n),(e,t)=>(Zr(),ni(L9,{key:t,idx:t,name:e.name,"onUpdate:name":t=>e.name=t,type:e.type,"onUpdate:type":t=>e.type=t,enable:e.enable,"onUpdate:enable":t=>e.enable=t,host:e.host,"onUpdate:host":t=>e.host=t,port:e.port,"onUpdate:port":t=>e.port=t,modbus_device_id:e.modbus_device_id,"onUpdate:modbus_device_id":t=>e.modbus_device_id=t,connected_phase:e.connected_phase,"onUpdate:connected_phase":t=>e.connected_phase=t,onRemoved:r},null,8,[`idx`,`name`,`onUpdate:name`,`type`,`onUpdate:type`,`enable`,`onUpdate:enable`,`host`,`onUpdate:host`,`port`,`onUpdate:port`,`modbus_device_id`,`onUpdate:modbus_device_id`,`connected_phase`,`onUpdate:connected_phase`]))),128)),P(k(IU),{justify:`space-between`},{default:A(()=>[P(k(jM),{onClick:i,type:`primary`,secondary:``,strong:``,circle:``},{icon:A(()=>[P(k(Bz),{size:`28`},{default:A(()=>[P(k(Hl))]),_:1})]),_:1}),P(k(jM),{onClick:a,type:`primary`},{default:A(()=>[...t[0]||=[oi(`Save`,-1)]]),_:1})]),_:1})],64))}}})),z9,cpe=t((()=>{I(),eQ(),Cu(),D4(),z9={__name:`BatteryInverterConfigItem`,props:vr([`idx`],{name:{},nameModifiers:{},type:{},typeModifiers:{},enable:{},enableModifiers:{},host:{},hostModifiers:{},port:{},portModifiers:{},battery_capacity:{},battery_capacityModifiers:{},battery_charge_limit:{},battery_charge_limitModifiers:{},battery_discharge_limit:{},battery_discharge_limitModifiers:{},battery_charge_max_pct:{},battery_charge_max_pctModifiers:{},battery_charge_min_pct:{},battery_charge_min_pctModifiers:{},connected_phase:{},connected_phaseModifiers:{}}),emits:vr([`removed`],[`update:name`,`update:type`,`update:enable`,`update:host`,`update:port`,`update:battery_capacity`,`update:battery_charge_limit`,`update:battery_discharge_limit`,`update:battery_charge_max_pct`,`update:battery_charge_min_pct`,`update:connected_phase`]),setup(e,{emit:t}){let n=t,r=E4(),i=e,a=Pr(e,`name`),o=Pr(e,`type`),s=Pr(e,`enable`),c=Pr(e,`host`),l=Pr(e,`port`),u=Pr(e,`battery_capacity`),d=Pr(e,`battery_charge_limit`),f=Pr(e,`battery_discharge_limit`),p=Pr(e,`battery_charge_max_pct`),m=Pr(e,`battery_charge_min_pct`),h=Pr(e,`connected_phase`),g=F(()=>{let e=r.subsystem_types?.battery_inverters;return e?Object.entries(e).map(([e,t])=>({value:e,label:t})):[]}),_=[{label:`L1`,value:`L1`},{label:`L2`,value:`L2`},{label:`L3`,value:`L3`},{label:`All`,value:`ALL`}];return(e,t)=>(Zr(),ni(k($K),{inline:``,size:`medium`,"label-placement":`top`},{default:A(()=>[P(k(PJ),{cols:`4 s:4 m:8 l:26 xl:26`,"x-gap":`10`,responsive:`screen`},{default:A(()=>[P(k(SJ),{span:`5`,label:`Name`,path:`name`},{default:A(()=>[P(k(Cj),{value:a.value,"onUpdate:value":t[0]||=e=>a.value=e,placeholder:`inverter name`},null,8,[`value`])]),_:1}),P(k(SJ),{span:`4`,label:`Type`,path:`type`},{default:A(()=>[P(k(KR),{value:o.value,"onUpdate:value":t[1]||=e=>o.value=e,placeholder:`Select type`,options:g.value},null,8,[`value`,`options`])]),_:1}),P(k(SJ),{span:`2`,label:`Host`,path:`host`},{default:A(()=>[P(k(Cj),{value:c.value,"onUpdate:value":t[2]||=e=>c.value=e,placeholder:`192.168...`},null,8,[`value`])]),_:1}),P(k(SJ),{span:`1`,label:`Port`,path:`port`},{default:A(()=>[P(k(fY),{value:l.value,"onUpdate:value":t[3]||=e=>l.value=e,min:`1`,max:`65535`,"show-button":!1},null,8,[`value`])]),_:1}),P(k(SJ),{span:`2`,label:`Capacity`,path:`battery_capacity`},{default:A(()=>[P(k(fY),{value:u.value,"onUpdate:value":t[4]||=e=>u.value=e,min:`0`,max:`100000`,"show-button":!1},{suffix:A(()=>[...t[12]||=[oi(`Wh`,-1)]]),_:1},8,[`value`])]),_:1}),P(k(SJ),{span:`2`,label:`Charge limit`,path:`battery_charge_limit`},{default:A(()=>[P(k(fY),{value:d.value,"onUpdate:value":t[5]||=e=>d.value=e,min:`0`,max:`100000`,"show-button":!1},{suffix:A(()=>[...t[13]||=[oi(`W`,-1)]]),_:1},8,[`value`])]),_:1}),P(k(SJ),{span:`2`,label:`Discharge limit`,path:`battery_discharge_limit`},{default:A(()=>[P(k(fY),{value:f.value,"onUpdate:value":t[6]||=e=>f.value=e,min:`0`,max:`100000`,"show-button":!1},{suffix:A(()=>[...t[14]||=[oi(`W`,-1)]]),_:1},8,[`value`])]),_:1}),P(k(SJ),{span:`2`,label:`Max charge`,path:`battery_charge_max_pct`},{default:A(()=>[P(k(fY),{value:p.value,"onUpdate:value":t[7]||=e=>p.value=e,min:`0`,max:`100`,"show-button":!1},{suffix:A(()=>[...t[15]||=[oi(`%`,-1)]]),_:1},8,[`value`])]),_:1}),P(k(SJ),{span:`2`,label:`Min charge`,path:`battery_charge_min_pct`},{default:A(()=>[P(k(fY),{value:m.value,"onUpdate:value":t[8]||=e=>m.value=e,min:`0`,max:`100`,"show-button":!1},{suffix:A(()=>[...t[16]||=[oi(`%`,-1)]]),_:1},8,[`value`])]),_:1}),P(k(SJ),{span:`2`,label:`Phase`,path:`connected_phase`},{default:A(()=>[P(k(KR),{value:h.value,"onUpdate:value":t[9]||=e=>h.value=e,placeholder:`Select phase`,options:_},null,8,[`value`])]),_:1}),P(k(SJ),{label:s.value?`Enabled`:`Disabled`,path:`enable`},{default:A(()=>[P(k(lZ),{value:s.value,"onUpdate:value":t[10]||=e=>s.value=e},null,8,[`value`])]),_:1},8,[`label`]),P(k(SJ),null,{default:A(()=>[P(k(jM),{onClick:t[11]||=e=>n(`removed`,i.idx),type:`error`,secondary:``,strong:``,circle:``},{icon:A(()=>[P(k(Bz),{size:`28`},{default:A(()=>[P(k(tu))]),_:1})]),_:1})]),_:1}),P(k(SJ),{span:`4 s:4 m:0 l:0 xl:0`},{default:A(()=>[P(k(ZH))]),_:1})]),_:1})]),_:1}))}}})),lpe=n({default:()=>B9}),B9,upe=t((()=>{I(),eQ(),D4(),Bl(),Cu(),cpe(),B9={__name:`BatteryInverterConfig`,setup(e){let t=E4(),{battery_inverters:n}=wl(t),r=async e=>{console.log(`removing config ${e}`),n.value.splice(e,1)},i=async()=>{console.log(`appending a new config`),n.value.push({name:``,host:``,port:502,battery_capacity:0,battery_charge_limit:0,battery_discharge_limit:0,battery_charge_max_pct:95,battery_charge_min_pct:10,connected_phase:`ALL`,enable:!0})},a=async()=>{await t.sync_battery_inverters_config(n.value)};return aa(async()=>{await t.fetch_config(),await t.fetch_subsystem_types()}),(e,t)=>(Zr(),ti(Va,null,[t[1]||=M(`h2`,null,`Battery Inverter Config`,-1),P(k(ZH)),(Zr(!0),ti(Va,null,mr(k(n),(e,t)=>(Zr(),ni(z9,{key:t,idx:t,name:e.name,"onUpdate:name":t=>e.name=t,type:e.type,"onUpdate:type":t=>e.type=t,enable:e.enable,"onUpdate:enable":t=>e.enable=t,host:e.host,"onUpdate:host":t=>e.host=t,port:e.port,"onUpdate:port":t=>e.port=t,battery_capacity:e.battery_capacity,"onUpdate:battery_capacity":t=>e.battery_capacity=t,battery_charge_limit:e.battery_charge_limit,"onUpdate:battery_charge_limit":t=>e.battery_charge_limit=t,battery_discharge_limit:e.battery_discharge_limit,"onUpdate:battery_discharge_limit":t=>e.battery_discharge_limit=t,battery_charge_max_pct:e.battery_charge_max_pct,"onUpdate:battery_charge_max_pct":t=>e.battery_charge_max_pct=t,battery_charge_min_pct:e.battery_charge_min_pct,"onUpdate:battery_charge_min_pct":t=>e.battery_charge_min_pct=t,connected_phase:e.connected_phase,"onUpdate:connected_phase":t=>e.connected_phase=t,onRemoved:r},null,8,[`idx`,`name`,`onUpdate:name`,`type`,`onUpdate:type`,`enable`,`onUpdate:enable`,`host`,`onUpdate:host`,`port`,`onUpdate:port`,`battery_capacity`,`onUpdate:battery_capacity`,`battery_charge_limit`,`onUpdate:battery_charge_limit`,`battery_discharge_limit`,`onUpdate:battery_discharge_limit`,`battery_charge_max_pct`,`onUpdate:battery_charge_max_pct`,`battery_charge_min_pct`,`onUpdate:battery_charge_min_pct`,`connected_phase`,`onUpdate:connected_phase`]))),128)),P(k(IU),{justify:`space-between`},{default:A(()=>[P(k(jM),{onClick:i,type:`primary`,secondary:``,strong:``,circle:``},{icon:A(()=>[P(k(Bz),{size:`28`},{default:A(()=>[P(k(Hl))]),_:1})]),_:1}),P(k(jM),{onClick:a,type:`primary`},{default:A(()=>[...t[0]||=[oi(`Save`,-1)]]),_:1})]),_:1})],64))}}})),dpe=n({default:()=>V9}),V9,fpe=t((()=>{I(),eQ(),D4(),b4(),Bl(),V9={__name:`StartupMode`,setup(e){let t=E4(),n=y4(),{general:r}=wl(t),{running:i}=wl(n),a=[{label:`Europe/Amsterdam`,value:`Europe/Amsterdam`},...Intl.supportedValuesOf(`timeZone`).filter(e=>e!==`Europe/Amsterdam`).map(e=>({label:e,value:e}))],o=[{label:`idle`,value:1},{label:`manual`,value:2},{label:`static`,value:3},{label:`dynamic`,value:4}],s=async()=>{await t.sync_general_config(r.value),await n.fetch_status()},c=async()=>{await t.apply_bart_home_setup(),await t.fetch_config()};return aa(async()=>{await t.fetch_config()}),(e,t)=>(Zr(),ti(Va,null,[t[16]||=M(`h2`,null,`General Configuration`,-1),P(k(ZH)),P(k($K),{inline:``,size:`medium`,"label-placement":`left`},{default:A(()=>[P(k(PJ),{cols:`4 s:4 m:8 l:8 xl:8`,"x-gap":`10`,responsive:`screen`},{default:A(()=>[P(k(SJ),{span:`4`,label:`Startup mode:`,path:`general.mode`},{default:A(()=>[P(k(KR),{value:k(r).mode,"onUpdate:value":t[0]||=e=>k(r).mode=e,placeholder:`Select startup mode`,options:o},null,8,[`value`])]),_:1}),P(k(yJ),{span:`0 m:4`},{default:A(()=>[...t[5]||=[M(`p`,null,` Please select the startup mode of DoeMaarWatt. DoeMaarWatt operates in various modes, those being: `,-1),M(`ol`,null,[M(`li`,null,[M(`em`,null,`idle`),oi(`: No active control, just read device output`)]),M(`li`,null,[M(`em`,null,`manual`),oi(`: Actively control with a continuous charge or discharge power`)]),M(`li`,null,[M(`em`,null,`static`),oi(`: Actively control based on a fixed static schedule`)]),M(`li`,null,[M(`em`,null,`dynamic`),oi(`: Actively control based on dynamic prices`)])],-1)]]),_:1}),P(k(SJ),{span:`4`,label:`Debug output:`,path:`debug`},{default:A(()=>[P(k(lZ),{value:k(r).debug,"onUpdate:value":t[1]||=e=>k(r).debug=e},null,8,[`value`])]),_:1}),P(k(yJ),{span:`0 m:4`},{default:A(()=>[...t[6]||=[M(`p`,null,` Whether to send additional debugging output, such as Modbus messages, to the addon log. `,-1)]]),_:1}),P(k(SJ),{span:`0 m:4`,label:`Control loop delay:`,path:`loop_delay`},{default:A(()=>[P(k(fY),{value:k(r).loop_delay,"onUpdate:value":t[2]||=e=>k(r).loop_delay=e,min:`1`,max:`100`,"show-button":!1},{suffix:A(()=>[...t[7]||=[oi(`sec`,-1)]]),_:1},8,[`value`])]),_:1}),P(k(yJ),{span:`0 m:4`},{default:A(()=>[...t[8]||=[M(`p`,null,`DoeMaarWatt operates in a loop. The loop_delay sets the delay in seconds between control actions.`,-1)]]),_:1}),P(k(SJ),{span:`0 m:4`,label:`Timezone:`,path:`timezone`},{default:A(()=>[P(k(KR),{value:k(r).timezone,"onUpdate:value":t[3]||=e=>k(r).timezone=e,options:a,filterable:``},null,8,[`value`])]),_:1}),P(k(yJ),{span:`0 m:4`},{default:A(()=>[...t[9]||=[M(`p`,null,`Your local IANA timezone name. DST is handled automatically.`,-1)]]),_:1}),P(k(SJ),{span:`0 m:4`,label:`Long-lived access token:`,path:`supervisor_token`},{default:A(()=>[P(k(Cj),{value:k(r).supervisor_token,"onUpdate:value":t[4]||=e=>k(r).supervisor_token=e,type:`text`,placeholder:`Long-lived access token...`},null,8,[`value`])]),_:1}),P(k(yJ),{span:`0 m:4`},{default:A(()=>[...t[10]||=[M(`p`,null,`Long-lived access token, used for Home Assistant push notifications. Can be set from your profile (lower left) -> Security -> Long-lived access tokens.`,-1)]]),_:1})]),_:1})]),_:1}),k(i)?(Zr(),ni(k(HA),{key:0,type:`warning`,style:{"margin-bottom":`12px`}},{default:A(()=>[...t[11]||=[oi(` The controller is currently running. Saving will stop it. `,-1)]]),_:1})):ci(``,!0),P(k(IU),{justify:`space-between`},{default:A(()=>[t[14]||=M(`div`,null,`\xA0`,-1),P(k(jM),{onClick:c,type:`warning`},{default:A(()=>[...t[12]||=[oi(`Apply Bart Home Setup`,-1)]]),_:1}),t[15]||=M(`div`,null,`\xA0`,-1),P(k(jM),{onClick:s,type:`primary`},{default:A(()=>[...t[13]||=[oi(`Save`,-1)]]),_:1})]),_:1})],64))}}})),ppe=n({default:()=>H9}),H9,mpe=t((()=>{I(),eQ(),D4(),Bl(),H9={__name:`ModeManualConfig`,setup(e){let t=E4(),{mode_manual:n}=wl(t),r=[{label:`standby`,value:`standby`},{label:`charge`,value:`charge`},{label:`discharge`,value:`discharge`}],i=async()=>{await t.sync_mode_manual_config(n.value)};return aa(async()=>{await t.fetch_config()}),(e,t)=>(Zr(),ti(Va,null,[t[7]||=M(`h2`,null,`Manual Mode Config`,-1),P(k(ZH)),P(k($K),{inline:``,size:`medium`,"label-placement":`top`},{default:A(()=>[P(k(PJ),{cols:`4 s:4 m:8 l:12 xl:12`,"x-gap":`10`,responsive:`screen`},{default:A(()=>[P(k(SJ),{span:`4`,label:`Direction`,path:`direction`},{default:A(()=>[P(k(KR),{value:k(n).direction,"onUpdate:value":t[0]||=e=>k(n).direction=e,placeholder:`Select direction`,options:r},null,8,[`value`])]),_:1}),P(k(SJ),{span:`4`,label:`Battery charge/discharge amount (per phase)`,path:`battery_amount`},{default:A(()=>[P(k(fY),{value:k(n).battery_amount,"onUpdate:value":t[1]||=e=>k(n).battery_amount=e,min:`0`,max:`10000`,"show-button":!1},{suffix:A(()=>[...t[3]||=[oi(`W`,-1)]]),_:1},8,[`value`])]),_:1}),P(k(SJ),{span:`4`,label:`Solar max power (per pahse)`,path:`solar_amount`},{default:A(()=>[P(k(fY),{value:k(n).solar_amount,"onUpdate:value":t[2]||=e=>k(n).solar_amount=e,min:`0`,max:`10000`,"show-button":!1},{suffix:A(()=>[...t[4]||=[oi(`W`,-1)]]),_:1},8,[`value`])]),_:1})]),_:1}),P(k(IU),{justify:`space-between`},{default:A(()=>[t[6]||=M(`div`,null,`\xA0`,-1),P(k(jM),{onClick:i,type:`primary`},{default:A(()=>[...t[5]||=[oi(`Save`,-1)]]),_:1})]),_:1})]),_:1}),t[8]||=M(`p`,null,[oi(` Define the direction (charge or discharge) and the amount of power while operating in `),M(`em`,null,`manual mode`),oi(`. The charge/discharge power is commanded to each individual battery inverter, while a maximum setpoint power limit is commanded to each solar inverter. Note that the setpoint power limit is per phase. `)],-1)],64))}}})),U9,hpe=t((()=>{I(),eQ(),Cu(),U9={__name:`ScheduleConfigItem`,props:vr([`idx`],{time:{},timeModifiers:{},battery_amount:{},battery_amountModifiers:{},direction:{},directionModifiers:{},solar_amount:{},solar_amountModifiers:{}}),emits:vr([`removed`],[`update:time`,`update:battery_amount`,`update:direction`,`update:solar_amount`]),setup(e,{emit:t}){let n=t,r=e,i=Pr(e,`time`),a=Pr(e,`battery_amount`),o=Pr(e,`direction`),s=Pr(e,`solar_amount`),c=[...Array(24).keys()],l=[0,15,30,45],u=[{label:`standby`,value:`standby`},{label:`charge`,value:`charge`},{label:`discharge`,value:`discharge`}];return(e,t)=>(Zr(),ni(k($K),{inline:``,size:`medium`,"label-placement":`left`},{default:A(()=>[P(k(PJ),{cols:`4 s:4 m:8 l:16 xl:16`,"x-gap":`10`,responsive:`screen`},{default:A(()=>[P(k(SJ),{span:`2`,label:`Time:`,path:`time`},{default:A(()=>[P(k(YV),{"formatted-value":i.value,"onUpdate:formattedValue":t[0]||=e=>i.value=e,format:`HH:mm`,"value-format":`HH:mm`,hours:c,minutes:l},null,8,[`formatted-value`])]),_:1}),P(k(SJ),{span:`4`,label:`Battery Amount:`,path:`battery_amount`},{default:A(()=>[P(k(fY),{value:a.value,"onUpdate:value":t[1]||=e=>a.value=e,min:`0`,max:`10000`,"show-button":!1},{suffix:A(()=>[...t[5]||=[oi(`W`,-1)]]),_:1},8,[`value`])]),_:1}),P(k(SJ),{span:`3`,label:`Direction:`,path:`direction`},{default:A(()=>[P(k(KR),{value:o.value,"onUpdate:value":t[2]||=e=>o.value=e,placeholder:`Select direction`,options:u},null,8,[`value`])]),_:1}),P(k(SJ),{span:`4`,label:`Solar max power:`,path:`solar_amount`},{default:A(()=>[P(k(fY),{value:s.value,"onUpdate:value":t[3]||=e=>s.value=e,min:`0`,max:`10000`,"show-button":!1},{suffix:A(()=>[...t[6]||=[oi(`W`,-1)]]),_:1},8,[`value`])]),_:1}),P(k(SJ),null,{default:A(()=>[P(k(jM),{onClick:t[4]||=e=>n(`removed`,r.idx),type:`error`,secondary:``,strong:``,circle:``},{icon:A(()=>[P(k(Bz),{size:`28`},{default:A(()=>[P(k(tu))]),_:1})]),_:1})]),_:1})]),_:1})]),_:1}))}}})),gpe=n({default:()=>W9}),W9,_pe=t((()=>{I(),eQ(),D4(),Bl(),N4(),Cu(),b9(),S9(),M9(),hpe(),W9={__name:`ModeStaticConfig`,setup(e){J7.register(f9,m9,Z7,X7,a9,l9,r9,$7,y9);let t=E4(),{tz:n,now:r}=M4(),{mode_static:i}=wl(t),a=F(()=>{let e=`00:00`;for(let t of i.value.schedule)t.time>e&&(e=t.time);return e}),o=(e,t)=>t===`standby`||t===`idle`?0:t===`charge`?Math.abs(e)/1e3:Math.abs(e)/-1e3,s=O(!1),c=F(()=>({responsive:!0,aspectRatio:4,scales:{x:{type:`time`,adapters:{date:{zone:n.value}},time:{unit:`hour`,displayFormats:{hour:`HH:mm`}},grid:{color:`#303030`,borderColor:`grey`,tickColor:`grey`}},y:{title:{text:`Battery charge (kW)`},ticks:{callback:(e,t,n)=>`${Math.round(e*10)/10} kW`}}}})),l=F(()=>{let e=r().startOf(`day`);if(i.value.schedule.length===0)return[{x:e,y:0},{x:e.plus({days:1}),y:0}];if(i.value.schedule.length===1){let t=o(i.value.schedule[0].battery_amount,i.value.schedule[0].direction);return[{x:e,y:t},{x:e.plus({days:1}),y:t}]}else{let t=[];if(i.value.schedule[0].time!==`00:00`){let n=i.value.schedule[i.value.schedule.length-1];t.push({x:e,y:o(n.battery_amount,n.direction)})}for(let n of i.value.schedule){let[r,i]=n.time.split(`:`).map(Number),a=e.plus({hours:r,minutes:i});t.length>0&&t.push({x:a.minus({seconds:1}),y:t[t.length-1].y}),t.push({x:a,y:o(n.battery_amount,n.direction)})}return t.push({x:e.plus({days:1}),y:t[t.length-1].y}),t}}),u=F(()=>{let e=r().startOf(`day`);if(i.value.schedule.length===0)return[{x:e,y:0},{x:e.plus({days:1}),y:0}];if(i.value.schedule.length===1){let t=(i.value.schedule[0].solar_amount||0)/1e3;return[{x:e,y:t},{x:e.plus({days:1}),y:t}]}else{let t=[];if(i.value.schedule[0].time!==`00:00`){let n=i.value.schedule[i.value.schedule.length-1];t.push({x:e,y:(n.solar_amount||0)/1e3})}for(let n of i.value.schedule){let[r,i]=n.time.split(`:`).map(Number),a=e.plus({hours:r,minutes:i});t.length>0&&t.push({x:a.minus({seconds:1}),y:t[t.length-1].y}),t.push({x:a,y:(n.solar_amount||0)/1e3})}return t.push({x:e.plus({days:1}),y:t[t.length-1].y}),t}}),d=F(()=>({datasets:[{label:`Battery charge amount (kW)`,data:l.value,fill:{target:`origin`,above:`rgba(75, 192, 75, 0.2)`,below:`rgba(192, 75, 75, 0.2)`},borderColor:`rgb(99, 226, 183)`,tension:0},{label:`Solar amount (kW)`,data:u.value,fill:{target:`origin`,above:`rgba(255, 193, 7, 0.2)`},borderColor:`rgb(255, 193, 7)`,tension:0}]})),f=async e=>{s.value=!1,console.log(`removing config ${e}`),i.value.schedule.splice(e,1),s.value=!0},p=async()=>{s.value=!1,console.log(`appending a new schedule item`),i.value.schedule.push({time:a.value,battery_amount:0,direction:`standby`,solar_amount:0}),s.value=!0},m=async()=>{s.value=!1,i.value.schedule.sort((e,t)=>e.time<t.time?-1:+(e.time>t.time)),await t.sync_mode_static_config(i.value),s.value=!0};return aa(async()=>{s.value=!1,await t.fetch_config(),s.value=!0}),(e,t)=>(Zr(),ti(Va,null,[t[7]||=M(`h2`,null,`Static Mode Configuration`,-1),P(k(ZH)),(Zr(!0),ti(Va,null,mr(k(i).schedule,(e,t)=>(Zr(),ni(U9,{key:t,idx:t,time:e.time,"onUpdate:time":t=>e.time=t,battery_amount:e.battery_amount,"onUpdate:battery_amount":t=>e.battery_amount=t,direction:e.direction,"onUpdate:direction":t=>e.direction=t,solar_amount:e.solar_amount,"onUpdate:solar_amount":t=>e.solar_amount=t,onRemoved:f},null,8,[`idx`,`time`,`onUpdate:time`,`battery_amount`,`onUpdate:battery_amount`,`direction`,`onUpdate:direction`,`solar_amount`,`onUpdate:solar_amount`]))),128)),P(k(IU),{justify:`space-between`},{default:A(()=>[P(k(jM),{onClick:p,type:`primary`,secondary:``,strong:``,circle:``},{icon:A(()=>[P(k(Bz),{size:`28`},{default:A(()=>[P(k(Hl))]),_:1})]),_:1}),P(k(jM),{onClick:m,type:`primary`},{default:A(()=>[...t[0]||=[oi(`Save`,-1)]]),_:1})]),_:1}),M(`p`,null,[t[1]||=oi(` Define a static charge / discharge schedule that is used in the `,-1),t[2]||=M(`em`,null,`static schedule`,-1),t[3]||=oi(` mode. By clicking the `,-1),P(k(jM),{type:`primary`,secondary:``,strong:``,circle:``,size:`tiny`},{default:A(()=>[P(k(Bz),{size:`16`},{default:A(()=>[P(k(Hl))]),_:1})]),_:1}),t[4]||=oi(` button, you can add moments in the schedule on which it changes. Each moment is defined by a time, a `,-1),t[5]||=M(`em`,null,`direction`,-1),t[6]||=oi(` (being idle, charging or discharging), and an amount in Watts for both the battery inverters as well as the solar inverters. All amounts are interpreted as being per phase. `,-1)]),M(`div`,null,[s.value?(Zr(),ni(k(j9),{key:0,data:d.value,options:c.value},null,8,[`data`,`options`])):ci(``,!0)])],64))}}})),vpe=n({default:()=>G9}),G9,ype=t((()=>{I(),eQ(),D4(),Bl(),G9={__name:`ModeDynamicConfig`,setup(e){let t=E4(),{mode_dynamic:n}=wl(t),r=[{label:`idle`,value:1},{label:`manual`,value:2},{label:`static`,value:3},{label:`dynamic`,value:4}],i=[...Array(24).keys()],a=[0,15,30,45],o=async()=>{await t.sync_mode_dynamic_config(n.value)},s=e=>{let t=e.replace(`%`,``).trim();return Math.round(Number(t)*10)/1e3},c=e=>e===null?``:``+Math.round(e*1e3)/10;return aa(async()=>{await t.fetch_config()}),(e,t)=>(Zr(),ti(Va,null,[t[11]||=M(`h2`,null,`Dynamic Schedule Mode Config`,-1),P(k(ZH)),P(k($K),{inline:``,size:`medium`,"label-placement":`top`},{default:A(()=>[P(k(PJ),{cols:`4 s:4 m:8 l:16 xl:16`,"x-gap":`10`,responsive:`screen`},{default:A(()=>[P(k(SJ),{span:`2`,label:`Price Update Time:`,path:`time`},{default:A(()=>[P(k(YV),{"formatted-value":k(n).price_update_time,"onUpdate:formattedValue":t[0]||=e=>k(n).price_update_time=e,format:`HH:mm`,"value-format":`HH:mm`,hours:i,minutes:a},null,8,[`formatted-value`])]),_:1}),P(k(SJ),{span:`4`,label:`Schedule Update Interval`,path:`interval`},{default:A(()=>[P(k(fY),{value:k(n).update_interval,"onUpdate:value":t[1]||=e=>k(n).update_interval=e,"default-value":3600,precision:0,min:60,max:86400,"show-button":!1},{suffix:A(()=>[...t[6]||=[oi(`seconds`,-1)]]),_:1},8,[`value`])]),_:1}),P(k(SJ),{span:`4`,label:`Schedule Resolution`,path:`resolution`},{default:A(()=>[P(k(fY),{value:k(n).resolution,"onUpdate:value":t[2]||=e=>k(n).resolution=e,"default-value":15,precision:0,min:15,max:60,"show-button":!1},{suffix:A(()=>[...t[7]||=[oi(`minutes`,-1)]]),_:1},8,[`value`])]),_:1}),P(k(SJ),{span:`2`,label:`Fallback Mode`,path:`fallback_mode`},{default:A(()=>[P(k(KR),{value:k(n).fallback_mode,"onUpdate:value":t[3]||=e=>k(n).fallback_mode=e,placeholder:`Select fallback mode`,options:r},null,8,[`value`])]),_:1}),P(k(SJ),{span:`2`,label:`(Dis)charge efficiency`,path:`efficiency`},{default:A(()=>[P(k(fY),{value:k(n).efficiency,"onUpdate:value":t[4]||=e=>k(n).efficiency=e,"default-value":.95,parse:s,format:c,precision:3,min:0,max:1,"show-button":!1},{suffix:A(()=>[...t[8]||=[oi(`%`,-1)]]),_:1},8,[`value`])]),_:1}),P(k(SJ),{span:`4`,label:`Enever API token`,path:`api_token`},{default:A(()=>[P(k(Cj),{value:k(n).api_token,"onUpdate:value":t[5]||=e=>k(n).api_token=e,type:`text`,placeholder:`API token...`},null,8,[`value`])]),_:1})]),_:1}),P(k(IU),{justify:`space-between`},{default:A(()=>[t[10]||=M(`div`,null,`\xA0`,-1),P(k(jM),{onClick:o,type:`primary`},{default:A(()=>[...t[9]||=[oi(`Save`,-1)]]),_:1})]),_:1})]),_:1}),P(k(ZH)),t[12]||=si(`<dl><dt><strong>Price Update Time</strong></dt><dd>The time of day at which tomorrow&#39;s energy prices are fetched from the Enever API. Tomorrow&#39;s prices typically become available around 15:00–16:00 CET. The fetched prices are cached locally and used to compute the next optimal schedule.</dd><dt><strong>Schedule Update Interval</strong></dt><dd>How often (in seconds) the optimal charge/discharge schedule is recomputed using the latest prices and the current battery state-of-charge. A shorter interval keeps the schedule more accurate at the cost of more frequent recalculations.</dd><dt><strong>Schedule Resolution</strong></dt><dd>The time slot length (in minutes) used when building the schedule. Prices are aggregated to this resolution and the algorithm optimises one charge/discharge decision per slot. Smaller values give finer control but require more price data points to be available.</dd><dt><strong>Fallback Mode</strong></dt><dd>The control mode to fall back to when no valid schedule can be computed — for example when price data is unavailable. Choose a mode that results in a safe default behaviour for your installation.</dd><dt><strong>Charge/discharge efficiency</strong></dt><dd>The efficiency factor when charging or discharging the battery systemem (0–100 %). This is used by the scheduler to account for energy losses: charging costs more and discharging yields less than the nominal energy stored. A typical lithium battery system has an efficiency of 90–95 %.</dd></dl>`,1)],64))}}})),bpe=t((()=>{})),K9,xpe=t((()=>{K9=(e,t)=>{let n=e.__vccOpts||e;for(let[e,r]of t)n[e]=r;return n}})),Spe=n({default:()=>Q9}),q9,J9,Y9,X9,Z9,Q9,Cpe=t((()=>{I(),g4(),eQ(),b4(),N4(),bpe(),xpe(),q9={style:{"min-height":`40px`,margin:`48px 0 16px 0`}},J9={key:0},Y9={style:{float:`right`}},X9={class:`log-content`},Z9={__name:`LogViewer`,setup(e){let t=y4(),{now:n}=M4(),r=F(()=>n().startOf(`day`)),i=O(n().startOf(`day`)),a=O(``),qL4=O(null),o=O(null),s=nr(`scrollbarRef`),c=O(!0),l=F(()=>i.value.equals(r.value)),u=()=>{s.value&&setTimeout(()=>{s.value&&s.value.scrollTo({top:999999,behavior:`auto`})},50)},d=e=>{let{scrollTop:t,scrollHeight:n,offsetHeight:r}=e.target,i=n-t-r<10;c.value=i},f=async()=>{let e=i.value.toFormat(`yyyy-MM-dd`),n=qL4.value!==null;if(n&&!l.value)return;let r=await t.query_log(n?{date:e,offset:qL4.value}:{date:e});r!==null&&(a.value=n?a.value+r.text:r.text,qL4.value=r.offset,c.value&&(await kn(),u()))},p=async()=>{qL4.value=null,i.value=i.value.plus({days:1}),await f()},m=async()=>{qL4.value=null,i.value=i.value.minus({days:1}),await f()},h=async()=>{qL4.value=null,i.value=r.value,await f()};return aa(async()=>{console.log(`log file refresh loop at 5 seconds`),await f(),o.value=setInterval(async()=>{console.log(`periodic log refresh (every 5 seconds)`),await f()},5*1e3)}),ca(()=>{clearInterval(o.value),o.value=null}),(e,t)=>(Zr(),ti(Va,null,[M(`div`,q9,[P(k(AZ),{prefix:`bar`,style:{float:`left`}},{default:A(()=>[oi(` Log file for `+De(i.value.toLocaleString(k(h4).DATE_MED_WITH_WEEKDAY))+` `,1),l.value?(Zr(),ti(`em`,J9,`(today)`)):ci(``,!0)]),_:1}),M(`div`,Y9,[P(k(jM),{style:{"margin-left":`16px`},onClick:m},{default:A(()=>[...t[0]||=[oi(`Previous Day`,-1)]]),_:1}),P(k(jM),{style:{"margin-left":`16px`},onClick:h,disabled:l.value},{default:A(()=>[...t[1]||=[oi(`Today`,-1)]]),_:1},8,[`disabled`]),P(k(jM),{style:{"margin-left":`16px`},onClick:p,disabled:l.value},{default:A(()=>[...t[2]||=[oi(`Next Day`,-1)]]),_:1},8,[`disabled`])])]),P(k(WX),{ref_key:`scrollbarRef`,ref:s,onScroll:d,style:{"margin-top":`12px`,"max-height":`80vh`,"background-color":`#111827`,color:`#f3f4f6`,border:`1px solid #374151`,"border-radius":`4px`}},{default:A(()=>[M(`div`,X9,De(a.value),1)]),_:1},512)],64))}},Q9=K9(Z9,[[`__scopeId`,`data-v-31016e12`]])}));I(),Bl(),T4();var wpe=_l(),$9=js(dle),Tpe=Xee({history:Aee(),routes:[{name:`home`,path:`/`,component:()=>w4(()=>Promise.resolve().then(()=>(npe(),tpe)),void 0)},{name:`energy_meter_config`,path:`/config/energy_meter`,component:()=>w4(()=>Promise.resolve().then(()=>(ipe(),rpe)),void 0)},{name:`solar_inverters_config`,path:`/config/solar_inverters`,component:()=>w4(()=>Promise.resolve().then(()=>(spe(),ope)),void 0)},{name:`battery_inverters_config`,path:`/config/battery_inverters`,component:()=>w4(()=>Promise.resolve().then(()=>(upe(),lpe)),void 0)},{name:`general_config`,path:`/config/general`,component:()=>w4(()=>Promise.resolve().then(()=>(fpe(),dpe)),void 0)},{name:`manual_config`,path:`/config/manual`,component:()=>w4(()=>Promise.resolve().then(()=>(mpe(),ppe)),void 0)},{name:`static_schedule_config`,path:`/config/static`,component:()=>w4(()=>Promise.resolve().then(()=>(_pe(),gpe)),void 0)},{name:`dynamic_schedule_config`,path:`/config/dynamic`,component:()=>w4(()=>Promise.resolve().then(()=>(ype(),vpe)),void 0)},{name:`logfiles`,path:`/logfiles`,component:()=>w4(()=>Promise.resolve().then(()=>(Cpe(),Spe)),void 0)}]});$9.use(wpe),$9.use(Tpe),$9.mount(`#app`);
\ No newline at end of file
@@ -2,6 +2,17 @@ import { defineStore } from 'pinia'
 import { DateTime } from 'luxon'
 import { API_BASE } from './api'
 
+// RFC 7386 JSON merge patch, as sent by the backend on each control loop tick (see stream.py)
+function merge_patch(target, patch) {
+    if (patch === null || typeof patch !== 'object' || Array.isArray(patch)) { return patch }
+    const ret = (target !== null && typeof target === 'object' && !Array.isArray(target)) ? { ...target } : {}
+    for (const [k, v] of Object.entries(patch)) {
+        if (v === null) { delete ret[k] }
+        else { ret[k] = merge_patch(ret[k], v) }
+    }
+    return ret
+}
+
 export const useControlStore = defineStore('control', {
     state: () => ({
         running: false,
@@ -13,6 +24,7 @@ export const useControlStore = defineStore('control', {
         schedule: null,
         schedule_ts: null,
         update_time: DateTime.now(),
+        stream: null,  // EventSource of the live status stream, while subscribed
     }),
 
     getters: {
@@ -74,18 +86,32 @@ export const useControlStore = defineStore('control', {
                 return ''
             }
         },
+        // Query the log (see Logger.handle_log_query), eg. { date: '2026-10-17', offset: 1234 }. Returns the
+        // lines and the offset to continue reading from, or null on error.
+        async query_log(params) {
+            this.error_status = ''
+            try {
+                const resp = await fetch(`${API_BASE}/log/query?${new URLSearchParams(params)}`)
+                if (!resp.ok) { throw new Error(`response status: ${resp.status}`) }
+                return { text: await resp.text(), offset: Number(resp.headers.get('X-Log-Offset') ?? 0) }
+            } catch (err) {
+                this.error_status = `control store: error while querying log: ${err.msg}`
+                return null
+            }
+        },
+        _set_status(status) {
+            this.running = status.running
+            this.running_start = status.running_start
+            this.mode = status.mode
+            this.stats = status.stats
+            this.prices = status.prices
+            this.schedule = status.schedule ?? null
+            this.schedule_ts = status.schedule_ts ?? null
+            this.update_time = DateTime.now()
+        },
         async fetch_status() {
             try {
-                const status = await this._make_fetch(`/`)
-
-                this.running = status.running
-                this.running_start = status.running_start
-                this.mode = status.mode
-                this.stats = status.stats
-                this.prices = status.prices
-                this.schedule = status.schedule ?? null
-                this.schedule_ts = status.schedule_ts ?? null
-                this.update_time = DateTime.now()
+                this._set_status(await this._make_fetch(`/`))
             } catch (err) {
                 this.running = false
                 this.running_start = null
@@ -97,6 +123,45 @@ export const useControlStore = defineStore('control', {
                 this.error_status = `control store: error while fetching status: ${err.msg}`
             }
         },
+        // Subscribe to the live status stream: the full status on connect, then only the changes per tick.
+        // Returns false when the browser has no EventSource, in which case the caller should poll instead.
+        subscribe() {
+            if (typeof EventSource === 'undefined') { return false }
+            if (this.stream !== null) { return true }
+
+            const stream = new EventSource(`${API_BASE}/stream`)
+            stream.addEventListener('status', (e) => this._set_status(JSON.parse(e.data)))
+            stream.addEventListener('patch', (e) => {
+                const patch = JSON.parse(e.data)
+                const status = merge_patch({
+                    running: this.running,
+                    running_start: this.running_start,
+                    mode: this.mode,
+                    stats: this.stats,
+                    schedule_ts: this.schedule_ts,
+                }, patch)
+                this.running = status.running ?? false
+                this.running_start = status.running_start ?? null
+                this.mode = status.mode ?? 1
+                this.stats = status.stats ?? null
+                this.schedule_ts = status.schedule_ts ?? null
+                this.update_time = DateTime.now()
+            })
+            stream.addEventListener('prices', (e) => { this.prices = JSON.parse(e.data) })
+            stream.addEventListener('schedule', (e) => { this.schedule = JSON.parse(e.data) })
+            stream.onerror = () => {  // the browser reconnects by itself, and is then sent the full status again
+                this.error_status = 'control store: live status stream interrupted, reconnecting'
+            }
+            stream.onopen = () => { this.error_status = '' }
+            this.stream = stream
+            return true
+        },
+        unsubscribe() {
+            if (this.stream !== null) {
+                this.stream.close()
+                this.stream = null
+            }
+        },
         async set_running(r) {
             try {
                 const resp = await this._make_fetch(`/run`, 'POST', { running: r })